@@ -23,15 +23,16 @@ __svnDate__ = ""
 __svnId__ = ""
 
 # Standard library modules.
-import operator
 from collections import MutableSet
 
 # Third party modules.
+import numpy as np
 
 # Local modules.
 from ebsdtools.crystallography.atomsite import AtomSite
 
 # Globals and constants variables.
+MAX_ATOMICNUMBER = 118
 
 def create_fcc_atomsites(atomicnumber):
     return AtomSites([AtomSite(atomicnumber, 0.5, 0.5, 0.0),
@@ -50,45 +51,206 @@ def create_hcp_atomsites(atomicnumber):
 def create_single_atomsites(atomicnumber):
     return AtomSites([AtomSite(atomicnumber, 0.0, 0.0, 0.0)])
 
+def _readonly(array):
+    array.flags.writeable = False
+    return array
+
 class AtomSites(MutableSet):
 
-    def __init__(self, precision=1e-4, sites=None):
+    def __init__(self, sites=None, precision=1e-4):
         """
-        Store the *atomsite* in a :class:`list`.
+        Store unique *atomsite*.
+        
+        The atomic numbers and the fractional positions are kept in two
+        arrays, :attr:`atomicnumbers` of shape (N,) and :attr:`positions` of
+        shape (N, 3). Positions are wrapped in [0, 1) and two sites with the
+        same atomic number whose positions fall on the same point of a grid
+        of spacing *precision* are considered identical.
+        
+        :arg sites: atom sites to add (``default=None``)
+        :type sites: iterable of :class:`atomsite.AtomSite`
+        
+        :arg precision: tolerance on the fractional positions
+                        (``default=1e-4``). The atomic number and the grid
+                        coordinates of a site are encoded in a 64-bit
+                        integer, which limits the precision to about 2.4e-6.
+        :type precision: :class:`float`
         
         """
-        self._sites = set()
+        if precision <= 0:
+            raise ValueError("Precision (%s) must be greater than 0" % precision)
+
+        gridsize = int(round(1.0 / precision))
+        if (MAX_ATOMICNUMBER + 1) * gridsize ** 3 > np.iinfo(np.int64).max:
+            raise ValueError("Precision (%s) is too small" % precision)
+
         self._precision = precision
+        self._gridsize = gridsize
+
+        self._atomicnumbers = _readonly(np.zeros(0, dtype=int))
+        self._positions = _readonly(np.zeros((0, 3), dtype=float))
+        self._keys = np.zeros(0, dtype=np.int64)
 
         if sites is not None:
             self.extend(sites)
 
-    def _create_precise_atomsite(self, site):
-        x, y, z, = map(int, map(operator.truediv,
-                                site.position,
-                                [self._precision] * 3))
-        return (site.atomicnumber, (x, y, z))
+    @classmethod
+    def from_arrays(cls, atomicnumbers, positions, precision=1e-4):
+        """
+        Creates the atom sites from an array of atomic numbers (N,) and an
+        array of fractional positions (N, 3).
+        
+        """
+        atoms = cls(precision=precision)
+        atoms._extend_arrays(atomicnumbers, positions)
+        return atoms
+
+    def _wrap(self, positions):
+        """
+        Returns the *positions* wrapped in [0, 1) and their grid coordinates.
+        Positions within half a grid spacing of 1.0 are brought back to 0.0.
+        
+        """
+        positions = np.mod(positions, 1.0)
+
+        grid = np.rint(positions * self._gridsize).astype(np.int64)
+        positions[grid == self._gridsize] = 0.0
+        grid %= self._gridsize
+
+        return positions, grid
+
+    def _get_keys(self, atomicnumbers, grid):
+        """
+        Encodes the atomic numbers and grid coordinates in one integer per
+        site.
+        
+        """
+        size = self._gridsize
+        keys = atomicnumbers.astype(np.int64)
+        for i in range(3):
+            keys = keys * size + grid[:, i]
+        return keys
+
+    def _extend_arrays(self, atomicnumbers, positions):
+        atomicnumbers = np.asarray(atomicnumbers, dtype=int).reshape(-1)
+        positions = np.array(positions, dtype=float).reshape(-1, 3)
+        if len(atomicnumbers) != len(positions):
+            raise ValueError("Number of atomic numbers (%i) and positions (%i) differ" % \
+                             (len(atomicnumbers), len(positions)))
 
-    def _create_orginal_atomsite(self, atomicnumber, position):
-        x, y, z, = map(operator.mul, position, [self._precision] * 3)
-        return AtomSite(atomicnumber, (x, y, z))
+        if len(atomicnumbers) > 0 and \
+                (atomicnumbers.min() < 0 or atomicnumbers.max() > MAX_ATOMICNUMBER):
+            raise ValueError("Atomic numbers must be between 0 and %i" % MAX_ATOMICNUMBER)
+
+        positions, grid = self._wrap(positions)
+        keys = self._get_keys(atomicnumbers, grid)
+
+        atomicnumbers = np.concatenate((self._atomicnumbers, atomicnumbers))
+        positions = np.concatenate((self._positions, positions))
+        keys = np.concatenate((self._keys, keys))
+
+        # Keep the first occurrence of each key, in order of insertion
+        _, indices = np.unique(keys, return_index=True)
+        indices.sort()
+
+        self._atomicnumbers = _readonly(atomicnumbers[indices])
+        self._positions = _readonly(positions[indices])
+        self._keys = keys[indices]
+
+    def _get_key(self, site):
+        position, grid = self._wrap(np.array([site.position], dtype=float))
+        return self._get_keys(np.array([site.atomicnumber]), grid)[0]
 
     def __repr__(self):
         return '<%s(%i sites)>' % (self.__class__.__name__, len(self))
 
     def __contains__(self, site):
-        return self._create_precise_atomsite(site) in self._sites
+        return bool(np.any(self._keys == self._get_key(site)))
 
     def __iter__(self):
-        for atomicnumber, position in self._sites:
-            yield self._create_orginal_atomsite(atomicnumber, position)
+        for atomicnumber, position in zip(self._atomicnumbers, self._positions):
+            yield AtomSite(atomicnumber, position)
 
     def __len__(self):
-        return len(self._sites)
+        return len(self._keys)
 
     def add(self, site):
-        self._sites.add(self._create_precise_atomsite(site))
+        self._extend_arrays([site.atomicnumber], [site.position])
+
+    append = add
+
+    def extend(self, sites):
+        """
+        Adds several atom sites at once.
+        
+        :arg sites: atom sites
+        :type sites: iterable of :class:`atomsite.AtomSite`
+        
+        """
+        sites = list(sites)
+        self._extend_arrays([site.atomicnumber for site in sites],
+                            [site.position for site in sites])
 
     def discard(self, site):
-        self._sites.discard(self._create_precise_atomsite(site))
+        mask = self._keys != self._get_key(site)
+        self._atomicnumbers = _readonly(self._atomicnumbers[mask])
+        self._positions = _readonly(self._positions[mask])
+        self._keys = self._keys[mask]
+
+    def expand(self, spacegroup):
+        """
+        Returns a new :class:`AtomSites` with all the positions generated by
+        the symmetry operations of the *spacegroup*.
+        All the operations are applied at once as a stacked matrix product.
+        
+        :arg spacegroup: space group
+        :type spacegroup: :class:`spacegroup.SpaceGroup`
+        
+        :rtype: :class:`AtomSites`
+        
+        """
+        return self.transform(*spacegroup.get_symop_arrays())
+
+    def transform(self, rotations, translations):
+        """
+        Returns a new :class:`AtomSites` with the positions obtained by
+        applying each pair of rotation and translation to all the sites.
+        
+        :arg rotations: rotation matrices of shape (S, 3, 3)
+        :arg translations: translation vectors of shape (S, 3)
+        
+        :rtype: :class:`AtomSites`
+        
+        """
+        rotations = np.asarray(rotations, dtype=float).reshape(-1, 3, 3)
+        translations = np.asarray(translations, dtype=float).reshape(-1, 3)
+
+        # (S, N, 3): r . position + t for every operation and every site
+        positions = np.einsum('sij,nj->sni', rotations, self._positions)
+        positions += translations[:, np.newaxis, :]
+
+        atomicnumbers = np.tile(self._atomicnumbers, len(rotations))
+
+        return self.from_arrays(atomicnumbers, positions, self._precision)
+
+    @property
+    def atomicnumbers(self):
+        """
+        Atomic numbers of the sites (:class:`numpy.ndarray` of shape (N,)).
+        
+        """
+        return self._atomicnumbers
+
+    @property
+    def positions(self):
+        """
+        Fractional positions of the sites in [0, 1)
+        (:class:`numpy.ndarray` of shape (N, 3)).
+        
+        """
+        return self._positions
+
+    @property
+    def precision(self):
+        return self._precision
 
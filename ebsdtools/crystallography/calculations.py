@@ -26,6 +26,7 @@ from math import sqrt, asin, atan2, pi, cos
 from cmath import exp
 
 # Third party modules.
+import numpy as np
 
 # Local modules.
 import mathtools.rotation.matrices as matrices
@@ -35,6 +36,8 @@ from mathtools.rotation.trigo import acos
 # Globals and constants variables.
 from mathtools.constants import m_e, c, h, e
 
+BLOCK_SIZE = 1048576 # Maximum number of (plane, atom) pairs evaluated at once
+
 def bonddistance(atom1, atom2, unitcell):
     """
     Calculate the distance between *atom1* and *atom2* of a given *unitcell*.
@@ -136,6 +139,60 @@ def planespacing(plane, unitcell):
 
     return d
 
+def _asindices(planes):
+    """
+    Return the indices of *planes* as an array of shape (N, 3).
+    
+    :arg planes: array of shape (N, 3) or sequence of :class:`plane.Plane`
+    
+    """
+    if isinstance(planes, np.ndarray):
+        return np.asarray(planes, dtype=float).reshape(-1, 3)
+
+    indices = np.array([tuple(p) for p in planes] if len(planes) else [],
+                       dtype=float)
+    return indices.reshape(-1, 3)
+
+def _asatoms(atomsites):
+    """
+    Return the atomic numbers (N,) and fractional positions (N, 3) of
+    *atomsites*.
+    
+    :arg atomsites: :class:`atomsites.AtomSites` or sequence of
+                    :class:`atomsite.AtomSite`
+    
+    """
+    if hasattr(atomsites, 'positions'):
+        return atomsites.atomicnumbers, atomsites.positions
+
+    atoms = list(atomsites)
+    positions = np.array([atom.position for atom in atoms], dtype=float)
+    atomicnumbers = np.array([atom.atomicnumber for atom in atoms], dtype=int)
+    return atomicnumbers, positions.reshape(-1, 3)
+
+def planespacings(planes, unitcell):
+    """
+    Calculate the plane spacing of several planes of a unit cell at once.
+    
+    :arg planes: array of shape (N, 3) or sequence of :class:`plane.Plane`
+    
+    :type unitcell: :class:`unitcell.UnitCell`
+    
+    :rtype: :class:`numpy.ndarray` of shape (N,)
+    
+    .. seealso:: :func:`planespacing`
+    
+    """
+    indices = _asindices(planes)
+
+    metricalmatrix = np.array(unitcell.metricalmatrix.to_list(), dtype=float)
+    matrix = np.linalg.inv(metricalmatrix)
+
+    # s square (d = 1/s^2)
+    s_sq = np.sum(np.dot(indices, matrix) * indices, axis=1)
+
+    return 1.0 / np.sqrt(s_sq)
+
 def electronwavelength(energy):
     """
     Return the relativistic electron wavelength.
@@ -351,6 +408,45 @@ def formfactor(plane, unitcell, atomsites, scatteringfactors):
 
     return F
 
+def formfactors(planes, unitcell, atomsites, scatteringfactors):
+    """
+    Calculate the form factor (F) of several planes at once for a given set of 
+    atoms and scattering factors.
+    The phases of every plane with every atom are evaluated as one matrix
+    (by blocks of :const:`BLOCK_SIZE` pairs to limit the memory).
+    
+    :arg planes: array of shape (N, 3) or sequence of :class:`plane.Plane`
+    
+    :type unitcell: :class:`unitcell.UnitCell`
+    
+    :type atomsites: :class:`atomsites.AtomSites`
+    
+    :type scatteringfactors: derivative of
+                              :class:`scatteringfactors.ScatteringFactors`
+    
+    :rtype: :class:`numpy.ndarray` of shape (N,) and complex type
+    
+    .. seealso:: :func:`formfactor`
+    
+    """
+    indices = _asindices(planes)
+    spacings = planespacings(indices, unitcell)
+
+    atomicnumbers, positions = _asatoms(atomsites)
+
+    F = np.zeros(len(indices), dtype=complex)
+    step = max(BLOCK_SIZE // max(len(atomicnumbers), 1), 1)
+
+    for start in range(0, len(indices), step):
+        stop = start + step
+
+        factors = scatteringfactors.get_many(atomicnumbers[np.newaxis, :],
+                                             spacings[start:stop, np.newaxis])
+        x = 2 * pi * np.dot(indices[start:stop], positions.T)
+        F[start:stop] = np.sum(factors * np.exp(1j * x), axis=1)
+
+    return F
+
 def maximum_formfactor(unitcell, atomsites, scatteringfactors):
     """
     Return the maximum value of the form factor for a given unit cell,
@@ -404,6 +500,28 @@ def diffraction_intensity(plane, unitcell, atomsites, scatteringfactors):
 
     return intensity
 
+def diffraction_intensities(planes, unitcell, atomsites, scatteringfactors):
+    """
+    Calculate the diffraction intensity (I) of several planes at once.
+    
+    :arg planes: array of shape (N, 3) or sequence of :class:`plane.Plane`
+    
+    :type unitcell: :class:`unitcell.UnitCell`
+    
+    :type atomsites: :class:`atomsites.AtomSites`
+    
+    :type scatteringfactors: derivative of
+                              :class:`scatteringfactors.ScatteringFactors`
+    
+    :rtype: :class:`numpy.ndarray` of shape (N,)
+    
+    .. seealso:: :func:`diffraction_intensity`
+    
+    """
+    F = formfactors(planes, unitcell, atomsites, scatteringfactors)
+
+    return (F * F.conjugate()).real
+
 def diffraction_maxintensity(unitcell, atomsites, scatteringfactors):
     """
     Return the maximum diffraction intensity for a given unit cell,
@@ -24,14 +24,19 @@ __svnDate__ = ""
 __svnId__ = ""
 
 # Standard library modules.
+import os
+import re
+import hashlib
+import tempfile
 from math import pi
+from collections import OrderedDict
 import warnings
 
 # Third party modules.
+import numpy as np
 
 # Local modules.
 import ebsdtools.crystallography.unitcell as unitcell
-import ebsdtools.crystallography.atomsite as atomsite
 import ebsdtools.crystallography.atomsites as atomsites
 
 import DatabasesTools.ElementProperties as ElementProperties
@@ -60,6 +65,22 @@ PUBL_AUTHOR_NAME = '_publ_author_name'
 PUBL_SECTION_TITLE = '_publ_section_title'
 SYMMETRY_EQUIV_POS_AS_XYZ = '_symmetry_equiv_pos_as_xyz'
 SYMMETRY_SPACE_GROUP_NAME_HM = '_symmetry_space_group_name_H-M'
+SYMMETRY_INT_TABLES_NUMBER = '_symmetry_Int_Tables_number'
+SPACE_GROUP_IT_NUMBER = '_space_group_IT_number'
+SPACE_GROUP_NAME_HM_ALT = '_space_group_name_H-M_alt'
+SPACE_GROUP_SYMOP_OPERATION_XYZ = '_space_group_symop_operation_xyz'
+
+CACHE_SIZE = 1024 # Maximum number of structures kept in memory
+CACHE_VERSION = 1 # Version of the content of the structure cache
+
+_TOKEN_PATTERN = re.compile(r"""
+    (?P<comment>\#[^\n]*)                        # comment until end of line
+  | ^;(?P<text>.*?)^;                             # semicolon text field
+  | (?P<quoted>'[^\n]*?'(?=\s|$)|"[^\n]*?"(?=\s|$)) # quoted string
+  | (?P<word>\S+)                                 # tag, keyword or value
+  """, re.VERBOSE | re.MULTILINE | re.DOTALL)
+
+_SYMOP_TERM_PATTERN = re.compile(r'([+-]?)([^+-]+)')
 
 def _numb(number):
     """
@@ -77,6 +98,16 @@ def _numb(number):
     else:
         return (float(number), 0.0)
 
+def _integer(number):
+    """
+    Convert a string number into an integer or ``None`` for an unknown
+    (``?``) or inapplicable (``.``) value.
+    
+    """
+    if number in ('?', '.'):
+        return None
+    return int(number)
+
 # Formatting dictionary.
 coredict = {CELL_VOLUME: _numb,
             CELL_LENGTH_A: _numb,
@@ -99,20 +130,153 @@ coredict = {CELL_VOLUME: _numb,
             JOURNAL_YEAR: int,
             PUBL_AUTHOR_NAME: lambda value: value.strip("'").strip('"'),
             PUBL_SECTION_TITLE: str,
-            SYMMETRY_EQUIV_POS_AS_XYZ: lambda value: tuple(value.strip("'").strip('"').split(',', 2)),
-            SYMMETRY_SPACE_GROUP_NAME_HM: lambda value: value.strip("'").strip('"')
+            SYMMETRY_EQUIV_POS_AS_XYZ: lambda value: tuple(part.strip() for part in value.strip("'").strip('"').split(',', 2)),
+            SYMMETRY_SPACE_GROUP_NAME_HM: lambda value: value.strip("'").strip('"'),
+            SYMMETRY_INT_TABLES_NUMBER: _integer,
+            SPACE_GROUP_IT_NUMBER: _integer,
+            SPACE_GROUP_NAME_HM_ALT: lambda value: value.strip("'").strip('"'),
+            SPACE_GROUP_SYMOP_OPERATION_XYZ: lambda value: tuple(part.strip() for part in value.strip("'").strip('"').split(',', 2))
             }
 
+def _get_formatter(dataname):
+    """
+    Return the function formatting the values of a data name.
+    
+    """
+    try:
+        return coredict[dataname]
+    except KeyError:
+        warnings.warn('No format for %s' % dataname, RuntimeWarning)
+        return str
+
+def _format_textfield(text):
+    """
+    Return the content of a semicolon text field with the lines stripped and
+    the empty lines removed.
+    
+    """
+    return ''.join(line.strip() + '\n'
+                   for line in text.splitlines() if line.strip())
+
+def _tokenize(text):
+    """
+    Split the content of a cif file into tokens in a single pass.
+    Yield ``(quoted, value)`` tuples where *quoted* is ``True`` for
+    quoted strings and text fields, which can never be a tag or a keyword.
+    Comments are skipped.
+    
+    """
+    for match in _TOKEN_PATTERN.finditer(text):
+        kind = match.lastgroup
+
+        if kind == 'word':
+            yield False, match.group('word')
+        elif kind == 'quoted':
+            yield True, match.group('quoted')
+        elif kind == 'text':
+            yield True, _format_textfield(match.group('text'))
+
+def _loopdump(dataitems, loopdatanames, loopvalues):
+    count = len(loopdatanames)
+    stop = len(loopvalues) // count * count # Ignore incomplete last row
+
+    for i, dataname in enumerate(loopdatanames):
+        formatter = _get_formatter(dataname)
+        dataitems[dataname].extend(map(formatter, loopvalues[i:stop:count]))
+
+def parse(text):
+    """
+    Parse the content of a cif file.
+    Return a :class:`list` of ``(name, dataitems)`` tuples, one for each data
+    block in the order of the file. The data items of a loop are stored as
+    a :class:`list` of values.
+    Values found before the first data block are stored in a block without
+    name (``None``).
+    
+    :arg text: content of a cif file
+    :type text: :class:`str`
+    
+    """
+    blocks = []
+    dataitems = None
+    dataname = None
+    inloop_header = False
+    loopdatanames = []
+    loopvalues = []
+
+    for quoted, token in _tokenize(text):
+        istag = isreserved = False
+        if not quoted:
+            first = token[0]
+            if first == '_':
+                istag = True
+            elif first in 'lLdDgGsS':
+                keyword = token.lower()
+                isreserved = keyword == 'loop_' or \
+                    keyword.startswith(('data_', 'global_', 'save_'))
+
+        if inloop_header:
+            if istag: # Store loop data names
+                dataitems.setdefault(token, [])
+                loopdatanames.append(token)
+                continue
+            inloop_header = False
+
+        if not istag and not isreserved:
+            if loopdatanames: # Store loop information
+                loopvalues.append(token)
+            elif dataname is not None: # Save values
+                dataitems.setdefault(dataname, _get_formatter(dataname)(token))
+                dataname = None
+            continue
+
+        if loopdatanames: # Leave loop
+            _loopdump(dataitems, loopdatanames, loopvalues)
+            loopdatanames = []
+            loopvalues = []
+
+        dataname = None
+
+        if isreserved and keyword.startswith('data_'):
+            dataitems = {}
+            blocks.append((token[5:], dataitems))
+            continue
+
+        if dataitems is None:
+            dataitems = {}
+            blocks.append((None, dataitems))
+
+        if istag:
+            dataname = token
+        elif keyword == 'loop_':
+            inloop_header = True
+
+    # Last entry
+    if loopdatanames:
+        _loopdump(dataitems, loopdatanames, loopvalues)
+
+    return blocks
+
 class Reader(dict):
-    def __init__(self, filepath):
+    def __init__(self, filepath, block=None):
         """
         Read cif file in accordance with the International Tables
         for Crystallography: Volume G Definition and Exchange of
         Crystallographic data
         
+        The file is split into tokens in a single pass and the loops, quoted
+        strings and semicolon text fields are parsed from these tokens
+        (see :func:`parse`).
+        
         :arg filepath: path of the cif file
         :type filepath: :class:`str`
         
+        :arg block: name of the data block to read (without ``data_``).
+            If ``None``, the data blocks are merged and the first value of
+            each data name is kept. Use :func:`read_blocks` to read the data
+            blocks separately.
+        :type block: :class:`str`
+        
         **Examples**::
         
           >>> ciffile = cif.Reader('test.cif')
@@ -161,138 +325,22 @@ class Reader(dict):
           * :const:`SYMMETRY_SPACE_GROUP_NAME_HM`
         
         """
-        file = open(filepath, 'r')
-
-        self.lines = []
-        for line in file.readlines():
-            if line[-1] == '\n' or line[-1] == '\r':
-                line = line[:-1]
-            elif line[-2:] == '\r\n':
-                line = line[:-2]
-
-            line = line.strip()
+        with open(filepath, 'r') as file:
+            blocks = parse(file.read())
 
-            if len(line) > 0:
-                if line[0] != '#': #Ignore comments
-                    self.lines.append(line)
+        name, dataitems = _select_block(blocks, block, filepath)
 
-        dataitems = self._parse()
         dict.__init__(self, dataitems)
+        self.filepath = filepath
+        self.name = name
 
-    def _parse(self):
-        dataitems = {}
-        inloop_header = False
-        inloop_data = False
-        loopdatanames = []
-        loopdata = ''
-        inquoteblock = False
-        quotestring = ''
-        dataname = None
-
-        for line in self.lines:
-            if inloop_data and (line[0] == '_' or line == 'loop_'):
-                inloop_data = False # Leave loop
-                self.__loopdump(dataitems, dataname, loopdata, loopdatanames)
-                loopdata = '' # Clear loopdata
-                dataname = None
-
-            if line[0] == '_':
-                dataitem = line.split(None, 1)
-
-                assert len(dataitem) > 0 and len(dataitem) <= 2, \
-                        "No empty line and should not be more than two items"
-
-                if len(dataitem) == 2:
-                    dataname, datavalue = dataitem
-
-                    # Save values
-                    dataitems.setdefault(dataname, self._format_datavalue(dataname, datavalue))
-
-                    dataname = None
-                else:
-                    dataname = dataitem[0]
-
-                    if inloop_header: # Store loop data names
-                        dataitems.setdefault(dataname, [])
-                        loopdatanames.append(dataname)
-
-            elif line[0] == ';':
-                inquoteblock = not inquoteblock # Enter or leave quotation
-
-                if inquoteblock == False: # After leaving
-                    dataitems.setdefault(dataname, self._format_datavalue(dataname, quotestring))
-                    quotestring = ''
-                    dataname = None
-
-            elif line == 'loop_':
-                inloop_header = True
-                inloop_data = False
-                loopdatanames = []
-                loopdata = ''
-
-            else:
-                if inloop_header:
-                    inloop_header = False
-                    inloop_data = True
-                if inloop_data: # Store loop information
-                    loopdata += ' ' + line
-                elif inquoteblock: # Store quotation string
-                    quotestring += line + '\n'
-                elif dataname != None:
-                    # Save values
-                    dataitems.setdefault(dataname, self._format_datavalue(dataname, line))
-                    dataname = None
-
-        # Last entry
-        if inloop_data:
-            self.__loopdump(dataitems, dataname, loopdata, loopdatanames)
-
-        return dataitems
-
-    def _format_datavalue(self, dataname, datavalue):
-        if dataname in coredict:
-            return coredict[dataname](datavalue)
-        else:
-            warnings.warn('No format for %s' % dataname, RuntimeWarning)
-            return datavalue
-
-    def __split_data(self, loopdata):
-        charnum = 0
-        inquotation1 = False
-        inquotation2 = False
-        data = []
-        dataitem = ''
-
-        while charnum < len(loopdata):
-            char = loopdata[charnum]
-
-            if char == "'":
-                inquotation1 = not inquotation1
-            if char == '"':
-                inquotation2 = not inquotation2
-
-            if char == ' ' and inquotation1 == False and inquotation2 == False:
-                if len(dataitem) > 0:
-                    data.append(dataitem)
-                dataitem = ''
-            else:
-                dataitem += char
-
-            charnum += 1
-
-        #Last entry
-        if len(dataitem) > 0:
-            data.append(dataitem)
-
-        return data
-
-    def __loopdump(self, dataitems, dataname, loopdata, loopdatanames):
-        data = self.__split_data(loopdata)
-
-        for i in range(len(data) / len(loopdatanames)):
-            for j, dataname in enumerate(loopdatanames):
-                dataId = i * len(loopdatanames) + j
-                dataitems[dataname].append(self._format_datavalue(dataname, data[dataId]))
+    @classmethod
+    def _from_dataitems(cls, filepath, name, dataitems):
+        reader = cls.__new__(cls)
+        dict.__init__(reader, dataitems)
+        reader.filepath = filepath
+        reader.name = name
+        return reader
 
     def get(self, dataname):
         """
@@ -332,21 +380,45 @@ class Reader(dict):
 
         return unitcell.UnitCell(a, b, c, alpha, beta, gamma)
 
-    def get_atomsites(self):
+    def get_symop_arrays(self):
         """
-        Return a :class:`list` of :class:`atomsite.AtomSite` from the cif.
+        Return the rotations (S, 3, 3) and translations (S, 3) of the
+        symmetry equivalent positions of the cif.
+        If no positions are defined, only the identity is returned.
         
-        :rtype: : keyword:`list`
+        :rtype: :class:`tuple` of :class:`numpy.ndarray`
         
         """
-        atoms = atomsites.AtomSites()
+        symops = self.get(SYMMETRY_EQUIV_POS_AS_XYZ) or \
+                    self.get(SPACE_GROUP_SYMOP_OPERATION_XYZ) or \
+                    [('x', 'y', 'z')]
+
+        rotations = np.zeros((len(symops), 3, 3))
+        translations = np.zeros((len(symops), 3))
 
-        symmetry_equiv_pos_as_xyz = self.get(SYMMETRY_EQUIV_POS_AS_XYZ)
-        atom_site_labels = self.get(ATOM_SITE_LABEL)
+        for i, symop in enumerate(symops):
+            for j, expression in enumerate(symop):
+                rotations[i, j], translations[i, j] = _parse_symop(expression)
+
+        return rotations, translations
+
+    def get_atomsites(self):
+        """
+        Return the :class:`atomsites.AtomSites` of the cif.
+        All the symmetry equivalent positions are applied at once on the
+        atom sites (see :meth:`atomsites.AtomSites.transform`).
+        
+        :rtype: :class:`atomsites.AtomSites`
+        
+        """
+        atom_site_labels = self.get(ATOM_SITE_LABEL) or []
         atom_site_fract_xs = self.get(ATOM_SITE_FRACT_X)
         atom_site_fract_ys = self.get(ATOM_SITE_FRACT_Y)
         atom_site_fract_zs = self.get(ATOM_SITE_FRACT_Z)
 
+        atomicnumbers = []
+        positions = []
+
         for i, atom_site_label in enumerate(atom_site_labels):
             # Remove digits after the chemical symbol
             if len(atom_site_label) > 1 and atom_site_label[1].isdigit():
@@ -354,38 +426,311 @@ class Reader(dict):
             else:
                 symbol = atom_site_label[:2]
 
-            atomicnumber = ElementProperties.getAtomicNumberBySymbol(symbol)
+            atomicnumbers.append(ElementProperties.getAtomicNumberBySymbol(symbol))
+            positions.append((atom_site_fract_xs[i][0],
+                              atom_site_fract_ys[i][0],
+                              atom_site_fract_zs[i][0]))
 
-            atom = atomsite.AtomSite(atomicnumber,
-                                     atom_site_fract_xs[i][0],
-                                     atom_site_fract_ys[i][0],
-                                     atom_site_fract_zs[i][0])
-            atoms.append(atom)
+        atoms = atomsites.AtomSites.from_arrays(atomicnumbers, positions)
 
         # Apply symmetry equivalent positions
-        for atom in atoms:
-            x, y, z = tuple(atom.position)
-            atomicnumber = atom.atomicnumber
+        return atoms.transform(*self.get_symop_arrays())
+
+def _parse_symop(expression):
+    """
+    Return the row of the rotation matrix and the translation of one
+    coordinate of a symmetry equivalent position (e.g. ``'1/2-x+y'``).
+    
+    """
+    row = [0.0, 0.0, 0.0]
+    translation = 0.0
+
+    expression = ''.join(expression.split()).lower()
+    for sign, term in _SYMOP_TERM_PATTERN.findall(expression):
+        factor = -1.0 if sign == '-' else 1.0
+
+        if term[-1] in 'xyz':
+            coefficient = term[:-1].rstrip('*')
+            if coefficient:
+                factor *= _fraction(coefficient)
+            row['xyz'.index(term[-1])] += factor
+        else:
+            translation += factor * _fraction(term)
 
-            for equiv_pos in symmetry_equiv_pos_as_xyz:
-                equiv_x, equiv_y, equiv_z = equiv_pos
+    return row, translation
 
-                # Allow float division
-                equiv_x = equiv_x.replace('1/', '1.0/').replace('2/', '2.0/').replace('3/', '3.0/').replace('4/', '4.0/').replace('6/', '6.0/')
-                equiv_y = equiv_y.replace('1/', '1.0/').replace('2/', '2.0/').replace('3/', '3.0/').replace('4/', '4.0/').replace('6/', '6.0/')
-                equiv_z = equiv_z.replace('1/', '1.0/').replace('2/', '2.0/').replace('3/', '3.0/').replace('4/', '4.0/').replace('6/', '6.0/')
+def _fraction(value):
+    if '/' in value:
+        numerator, denominator = value.split('/', 1)
+        return float(numerator) / float(denominator)
+    else:
+        return float(value)
 
-                # Replace x, y, z by the value
-                newx = eval(equiv_x.replace('x', str(x)).replace('y', str(y)).replace('z', str(z)))
-                newy = eval(equiv_y.replace('x', str(x)).replace('y', str(y)).replace('z', str(z)))
-                newz = eval(equiv_z.replace('x', str(x)).replace('y', str(y)).replace('z', str(z)))
+def _select_block(blocks, block, filepath):
+    """
+    Return the name and the data items of the data *block*.
+    If *block* is ``None``, the data items of all the blocks are merged:
+    the first value of each data name is kept and the values of loops are
+    concatenated.
+    
+    """
+    if block is None:
+        dataitems = {}
+        for _name, items in blocks:
+            for dataname, value in items.iteritems():
+                if isinstance(value, list) and \
+                        isinstance(dataitems.get(dataname), list):
+                    dataitems[dataname].extend(value)
+                else:
+                    dataitems.setdefault(dataname,
+                                         list(value) if isinstance(value, list) else value)
 
-                # Add if new position
-                newatom = atomsite.AtomSite(atomicnumber, newx, newy, newz)
-                try:
-                    atoms.append(newatom)
-                except atomsites.AtomSitePositionError:
-                    pass
+        name = blocks[0][0] if len(blocks) == 1 else None
+        return name, dataitems
+
+    for name, items in blocks:
+        if name is not None and name.lower() == block.lower():
+            return name, items
+
+    raise ValueError("No data block '%s' in %s" % (block, filepath))
+
+def read_blocks(filepath):
+    """
+    Return one :class:`Reader` for each data block of a cif file, in the
+    order of the file.
+    
+    :arg filepath: path of the cif file
+    :type filepath: :class:`str`
+    
+    :rtype: :class:`list` of :class:`Reader`
+    
+    """
+    with open(filepath, 'r') as file:
+        blocks = parse(file.read())
+
+    return [Reader._from_dataitems(filepath, name, dataitems)
+            for name, dataitems in blocks]
+
+def read_structures(filepath, cache=None):
+    """
+    Return the unit cell and atom sites of each data block of a cif file
+    defining a structure (i.e. the lattice parameters and atom sites).
+    If a *cache* is given, the structures are only parsed when the content
+    of the file is not already in the cache.
+    
+    :arg filepath: path of the cif file
+    :type filepath: :class:`str`
+    
+    :arg cache: cache of parsed structures (``default=None``)
+    :type cache: :class:`StructureCache`
+    
+    :rtype: :class:`list` of ``(name, unitcell, atomsites)`` tuples
+    
+    """
+    with open(filepath, 'r') as file:
+        content = file.read()
+
+    if cache is not None:
+        key = cache.get_key(content)
+        structures = cache.load(key)
+        if structures is not None:
+            return structures
+
+    structures = []
+    for name, dataitems in parse(content):
+        if CELL_LENGTH_A not in dataitems or ATOM_SITE_LABEL not in dataitems:
+            continue
 
-        return atoms
+        reader = Reader._from_dataitems(filepath, name, dataitems)
+        structures.append((name, reader.get_unitcell(), reader.get_atomsites()))
 
+    if cache is not None:
+        cache.save(key, structures)
+
+    return structures
+
+def _copy_structures(structures):
+    """
+    Return the *structures* with copies of their atom sites, which are
+    mutable.
+    
+    """
+    return [(name, cell, atomsites.AtomSites.from_arrays(atoms.atomicnumbers,
+                                                         atoms.positions,
+                                                         atoms.precision))
+            for name, cell, atoms in structures]
+
+class StructureCache(object):
+    def __init__(self, dirpath=None, maxsize=CACHE_SIZE):
+        """
+        Cache of the structures (unit cell and atom sites) parsed from cif
+        files by :func:`read_structures`.
+        An entry is identified by the hash of the content of the file (see
+        :meth:`get_key`), so a modified file is parsed again and identical
+        files are only parsed once.
+        
+        The *maxsize* most recently used entries are kept in memory.
+        If a *dirpath* is given, the entries are also saved in this
+        directory (``.npz``) and reused by the next sessions.
+        An entry is written under a temporary name and renamed once complete,
+        so that the directory can be shared by several processes.
+        
+        :arg dirpath: directory of the cache (``default=None``, memory only)
+        :type dirpath: :class:`str`
+        
+        :arg maxsize: maximum number of entries in memory
+                      (``default=CACHE_SIZE``)
+        :type maxsize: :class:`int`
+        
+        """
+        self._dirpath = dirpath
+        self._maxsize = maxsize
+        self._entries = OrderedDict()
+
+        if dirpath is not None and not os.path.isdir(dirpath):
+            try:
+                os.makedirs(dirpath)
+            except OSError: # Created by another process
+                if not os.path.isdir(dirpath):
+                    raise
+
+    @property
+    def dirpath(self):
+        return self._dirpath
+
+    @property
+    def maxsize(self):
+        return self._maxsize
+
+    def get_key(self, content):
+        """
+        Return the hash identifying the *content* of a cif file.
+        
+        :rtype: :class:`str`
+        
+        """
+        sha = hashlib.sha1(repr(CACHE_VERSION))
+        sha.update(content)
+        return sha.hexdigest()
+
+    def _get_filepath(self, key):
+        return os.path.join(self._dirpath, key + '.npz')
+
+    def _remember(self, key, structures):
+        self._entries[key] = structures
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    def load(self, key):
+        """
+        Return the structures of a *key* or ``None`` if the key is not in the
+        cache.
+        The atom sites are copies, so modifying them does not change the
+        cache.
+        
+        :rtype: :class:`list` of ``(name, unitcell, atomsites)`` tuples
+        
+        """
+        try:
+            structures = self._entries.pop(key)
+        except KeyError:
+            structures = self._load_file(key)
+            if structures is None:
+                return None
+
+        self._remember(key, structures)
+        return _copy_structures(structures)
+
+    def _load_file(self, key):
+        if self._dirpath is None:
+            return None
+
+        try:
+            data = np.load(self._get_filepath(key))
+            try:
+                names = list(data['names'])
+                lattices = data['lattices']
+                indices = np.cumsum(data['counts'])[:-1]
+                atomicnumbers = np.split(data['atomicnumbers'], indices)
+                positions = np.split(data['positions'], indices)
+                precision = float(data['precision'])
+            finally:
+                data.close()
+        except (IOError, ValueError, KeyError): # Missing or invalid entry
+            return None
+
+        structures = []
+        for i, name in enumerate(names):
+            cell = unitcell.UnitCell(*lattices[i])
+            atoms = atomsites.AtomSites.from_arrays(atomicnumbers[i],
+                                                    positions[i], precision)
+            structures.append((name or None, cell, atoms))
+
+        return structures
+
+    def save(self, key, structures):
+        """
+        Save the structures of a *key*.
+        
+        :type structures: :class:`list` of ``(name, unitcell, atomsites)``
+                          tuples
+        
+        """
+        self._remember(key, _copy_structures(structures))
+
+        if self._dirpath is None:
+            return
+
+        names = []
+        lattices = []
+        atomicnumbers = [np.zeros(0, dtype=int)]
+        positions = [np.zeros((0, 3))]
+        precision = 1e-4
+        for name, cell, atoms in structures:
+            names.append(name or '')
+            lattices.append((cell.a, cell.b, cell.c,
+                             cell.alpha, cell.beta, cell.gamma))
+            atomicnumbers.append(atoms.atomicnumbers)
+            positions.append(atoms.positions)
+            precision = atoms.precision
+
+        arrays = {'names': np.array(names),
+                  'lattices': np.array(lattices, dtype=float).reshape(-1, 6),
+                  'counts': np.array(map(len, atomicnumbers[1:]), dtype=int),
+                  'atomicnumbers': np.concatenate(atomicnumbers),
+                  'positions': np.concatenate(positions),
+                  'precision': precision}
+
+        fd, temppath = tempfile.mkstemp('.tmp', key, self._dirpath)
+        try:
+            f = os.fdopen(fd, 'wb')
+            try:
+                np.savez(f, **arrays)
+            finally:
+                f.close()
+
+            filepath = self._get_filepath(key)
+            if os.name == 'nt' and os.path.exists(filepath): # No atomic replace
+                os.remove(filepath)
+            os.rename(temppath, filepath)
+        except:
+            if os.path.exists(temppath):
+                os.remove(temppath)
+            raise
+
+    def clear(self):
+        """
+        Delete all the entries of the cache.
+        
+        """
+        self._entries.clear()
+
+        if self._dirpath is None:
+            return
+
+        for filename in os.listdir(self._dirpath):
+            if filename.endswith('.npz'):
+                try:
+                    os.remove(os.path.join(self._dirpath, filename))
+                except OSError:
+                    pass
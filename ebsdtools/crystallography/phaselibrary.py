@@ -0,0 +1,456 @@
+#!/usr/bin/env python
+"""
+================================================================================
+:mod:`phaselibrary` -- Library of phases imported from cif files
+================================================================================
+
+.. module:: phaselibrary
+   :synopsis: Library of phases imported from cif files
+
+.. inheritance-diagram:: ebsdtools.crystallography.phaselibrary
+
+"""
+
+# Script information for the file.
+__author__ = "Philippe T. Pinard"
+__email__ = "philippe.pinard@gmail.com"
+__version__ = "0.1"
+__copyright__ = "Copyright (c) 2009 Philippe T. Pinard"
+__license__ = "GPL v3"
+
+# Subversion informations for the file.
+__svnRevision__ = ""
+__svnDate__ = ""
+__svnId__ = ""
+
+# Standard library modules.
+import os
+import json
+import struct
+import itertools
+import traceback
+import multiprocessing
+
+# Third party modules.
+import numpy as np
+
+# Local modules.
+import ebsdtools.crystallography.cif as cif
+import ebsdtools.crystallography.unitcell as unitcell
+import ebsdtools.crystallography.atomsites as atomsites
+import ebsdtools.crystallography.spacegroup as spacegroup
+import ebsdtools.crystallography.spacegroups as spacegroups
+import ebsdtools.crystallography.reflectors as reflectors
+
+# Globals and constants variables.
+LIBRARY_MAGIC = 'PHASELIB\x02'
+LIBRARY_ALIGNMENT = 64
+
+ATOMS_DTYPE = np.dtype([('atomicnumber', '<i2'),
+                        ('x', '<f8'), ('y', '<f8'), ('z', '<f8')])
+
+CIF_EXTENSION = '.cif'
+TASKS_PER_PROCESS = 16 # Number of chunks of files given to each process
+
+_settings = {}
+
+def _align(offset):
+    return (offset + LIBRARY_ALIGNMENT - 1) // LIBRARY_ALIGNMENT * LIBRARY_ALIGNMENT
+
+def _decode_json(value):
+    """
+    Convert back the unicode strings of a decoded JSON value to byte
+    strings, as they are read from the cif files.
+
+    """
+    if isinstance(value, unicode):
+        return value.encode('latin-1')
+    elif isinstance(value, list):
+        return [_decode_json(item) for item in value]
+    elif isinstance(value, dict):
+        return dict((_decode_json(key), _decode_json(item))
+                    for key, item in value.iteritems())
+    else:
+        return value
+
+def _find_files(dirpath, extension):
+    """
+    Return the paths, relative to *dirpath*, of all the files with the
+    *extension* in the directory and its subdirectories, sorted by name.
+
+    """
+    relpaths = []
+
+    for root, _dirnames, filenames in os.walk(dirpath):
+        for filename in filenames:
+            if filename.lower().endswith(extension):
+                filepath = os.path.join(root, filename)
+                relpaths.append(os.path.relpath(filepath, dirpath))
+
+    return sorted(relpaths)
+
+def _has_symops(reader):
+    return bool(reader.get(cif.SYMMETRY_EQUIV_POS_AS_XYZ) or
+                reader.get(cif.SPACE_GROUP_SYMOP_OPERATION_XYZ))
+
+def _resolve_spacegroup(reader):
+    """
+    Return the space group of a data block of a cif.
+    The symmetry equivalent positions are compared with the ones of each
+    space group. If they match none (e.g. non-standard setting such as
+    P 21/n), a space group without number is created from the positions of
+    the cif, since the tabulated group of the same name or number would
+    have other systematic absences.
+    Without symmetry equivalent positions, the space group is found from its
+    name or its number. Return ``None`` if the space group cannot be
+    resolved.
+
+    :rtype: :class:`spacegroup.SpaceGroup`
+
+    """
+    if _has_symops(reader):
+        rotations, translations = reader.get_symop_arrays()
+
+        sg = spacegroups.findspacegroup(rotations, translations)
+        if sg is not None:
+            return sg
+
+        specs = [(tuple(map(tuple, rotation)), tuple(translation))
+                 for rotation, translation in zip(rotations, translations)]
+        return spacegroup.SpaceGroup(num_sym_equiv=len(specs), symop_specs=specs)
+
+    for dataname in (cif.SYMMETRY_SPACE_GROUP_NAME_HM,
+                     cif.SPACE_GROUP_NAME_HM_ALT,
+                     cif.SYMMETRY_INT_TABLES_NUMBER,
+                     cif.SPACE_GROUP_IT_NUMBER):
+        name = reader.get(dataname)
+        if name is not None and name != '?':
+            sg = spacegroups.getspacegroup(name)
+            if sg is not None:
+                return sg
+
+    return None
+
+def _import_structure(reader):
+    """
+    Return the record and the arrays of the phase of a data block.
+
+    """
+    cell = reader.get_unitcell()
+    atoms = reader.get_atomsites()
+    sg = _resolve_spacegroup(reader)
+
+    if sg is not None and not _has_symops(reader):
+        atoms = atoms.expand(sg)
+
+    table = reflectors.compute_table(cell, atoms, _settings['scatteringfactors'],
+                                     _settings['maxindice'], sg, expand=True)
+
+    sites = np.empty(len(atoms), dtype=ATOMS_DTYPE)
+    sites['atomicnumber'] = atoms.atomicnumbers
+    sites['x'], sites['y'], sites['z'] = atoms.positions.T
+
+    record = {'block': reader.name,
+              'formula': reader.get(cif.CHEMICAL_FORMULA_SUM),
+              'spacegroup': None if sg is None else sg.number,
+              'lattice': (cell.a, cell.b, cell.c,
+                          cell.alpha, cell.beta, cell.gamma),
+              'precision': atoms.precision}
+
+    return record, sites, table
+
+def _error(relpath, block):
+    """
+    Return the report of the exception being handled.
+
+    """
+    message = traceback.format_exc()
+    return {'filepath': relpath,
+            'block': block,
+            'error': message.strip().splitlines()[-1],
+            'traceback': message}
+
+def _init_worker(scatteringfactors, maxindice):
+    _settings['scatteringfactors'] = scatteringfactors
+    _settings['maxindice'] = maxindice
+
+def _import_file(args):
+    """
+    Import all the structures of a cif file.
+    Errors are caught and reported, so that a bad file never stops the
+    import of the others.
+
+    :return: list of ``(name, record, sites, table)`` and list of errors
+    """
+    dirpath, relpath = args
+
+    phases = []
+    errors = []
+
+    try:
+        readers = cif.read_blocks(os.path.join(dirpath, relpath))
+    except Exception:
+        return phases, [_error(relpath, None)]
+
+    readers = [reader for reader in readers
+               if cif.CELL_LENGTH_A in reader and cif.ATOM_SITE_LABEL in reader]
+    if not readers:
+        return phases, [{'filepath': relpath, 'block': None,
+                         'error': 'No structure found', 'traceback': None}]
+
+    basename = os.path.splitext(relpath)[0].replace(os.sep, '/')
+
+    for reader in readers:
+        if len(readers) == 1:
+            name = basename
+        else:
+            name = '%s:%s' % (basename, reader.name)
+
+        try:
+            record, sites, table = _import_structure(reader)
+        except Exception:
+            errors.append(_error(relpath, reader.name))
+            continue
+
+        record['filepath'] = relpath
+        phases.append((name, record, sites, table))
+
+    return phases, errors
+
+def _write_array(file, array):
+    """
+    Write an *array* at the next aligned offset of the *file* and return its
+    offset and number of elements.
+
+    """
+    file.write('\0' * (_align(file.tell()) - file.tell()))
+    offset = file.tell()
+    file.write(np.ascontiguousarray(array).tostring())
+    return offset, len(array)
+
+def import_directory(dirpath, filepath, scatteringfactors, maxindice=4,
+                     processes=None, progress=None, extension=CIF_EXTENSION):
+    """
+    Import all the cif files of a directory (and its subdirectories) in a
+    phase library file.
+
+    For each data block defining a structure, the space group is resolved,
+    the atom sites are expanded and the reflectors up to *maxindice* are
+    computed. The files are parsed by a pool of processes and the results
+    are written to the library as they arrive. Files and data blocks which
+    cannot be imported are reported in :attr:`PhaseLibrary.errors`.
+
+    The library is first written under a temporary name and then renamed.
+
+    :arg dirpath: directory of the cif files
+    :arg filepath: path of the library file
+    :arg scatteringfactors: scattering factors used for the reflectors
+    :arg maxindice: maximum indice of the reflectors (``default=4``)
+    :arg processes: number of processes (default: number of CPUs).
+        With 1, the files are imported in the current process.
+    :arg progress: function called with the number of imported files and
+        the total number of files
+    :arg extension: extension of the cif files (``default=.cif``)
+
+    :rtype: :class:`PhaseLibrary`
+    """
+    relpaths = _find_files(dirpath, extension.lower())
+    tasks = [(dirpath, relpath) for relpath in relpaths]
+
+    if processes == 1:
+        _init_worker(scatteringfactors, maxindice)
+        results = itertools.imap(_import_file, tasks)
+        pool = None
+    else:
+        pool = multiprocessing.Pool(processes, _init_worker,
+                                    (scatteringfactors, maxindice))
+        count = processes or multiprocessing.cpu_count()
+        chunksize = max(1, len(tasks) // (count * TASKS_PER_PROCESS))
+        results = pool.imap_unordered(_import_file, tasks, chunksize)
+
+    phases = {}
+    errors = []
+
+    temppath = '%s.%i.tmp' % (filepath, os.getpid())
+    file = open(temppath, 'wb')
+    try:
+        file.write(LIBRARY_MAGIC)
+        file.write(struct.pack('>Q', 0)) # Offset of the index
+
+        for done, (fileresults, fileerrors) in enumerate(results):
+            for name, record, sites, table in fileresults:
+                record['atoms'] = _write_array(file, sites)
+                record['reflectors'] = _write_array(file, table)
+                phases[name] = record
+
+            errors.extend(fileerrors)
+
+            if progress is not None:
+                progress(done + 1, len(tasks))
+
+        index = {'maxindice': maxindice,
+                 'phases': phases,
+                 'errors': sorted(errors, key=lambda error: error['filepath'])}
+        offset = file.tell()
+        json.dump(index, file, encoding='latin-1')
+
+        file.seek(len(LIBRARY_MAGIC))
+        file.write(struct.pack('>Q', offset))
+    except:
+        file.close()
+        os.remove(temppath)
+        raise
+    finally:
+        if pool is not None:
+            pool.terminate()
+            pool.join()
+
+    file.close()
+
+    if os.path.exists(filepath): # os.rename does not overwrite on Windows
+        os.remove(filepath)
+    os.rename(temppath, filepath)
+
+    return PhaseLibrary(filepath)
+
+class PhaseLibrary(object):
+    def __init__(self, filepath):
+        """
+        Read a phase library created by :func:`import_directory`.
+        Only the index is read; the atom sites and reflectors of a phase are
+        memory-mapped when requested.
+
+        :arg filepath: path of the library file
+        :type filepath: :class:`str`
+
+        **Examples**::
+
+          >>> library = phaselibrary.PhaseLibrary('phases.lib')
+          >>> print library.names
+          >>> ['aluminum', 'iron']
+          >>> table = library.get_reflectors_table('iron')
+
+        """
+        self._filepath = filepath
+
+        file = open(filepath, 'rb')
+        try:
+            if file.read(len(LIBRARY_MAGIC)) != LIBRARY_MAGIC:
+                raise IOError("Not a phase library: %s" % filepath)
+
+            offset, = struct.unpack('>Q', file.read(8))
+            file.seek(offset)
+            index = _decode_json(json.load(file))
+        finally:
+            file.close()
+
+        for record in index['phases'].itervalues():
+            for key in ('lattice', 'atoms', 'reflectors'):
+                record[key] = tuple(record[key])
+
+        self._maxindice = index['maxindice']
+        self._phases = index['phases']
+        self._errors = index['errors']
+
+    def __repr__(self):
+        return '<%s(%i phases, %i errors)>' % \
+            (self.__class__.__name__, len(self), len(self._errors))
+
+    def __len__(self):
+        return len(self._phases)
+
+    def __iter__(self):
+        return iter(self.names)
+
+    def __contains__(self, name):
+        return name in self._phases
+
+    @property
+    def filepath(self):
+        return self._filepath
+
+    @property
+    def maxindice(self):
+        return self._maxindice
+
+    @property
+    def names(self):
+        """
+        Sorted list of the names of the phases.
+        A phase is named after the path of its cif file, relative to the
+        imported directory and without extension, followed by ``:`` and
+        the name of the data block if the file contains several structures.
+
+        """
+        return sorted(self._phases)
+
+    @property
+    def errors(self):
+        """
+        List of the files and data blocks which could not be imported.
+        Each error is a :class:`dict` with the keys ``filepath``, ``block``,
+        ``error`` (message) and ``traceback``.
+
+        """
+        return list(self._errors)
+
+    def get_record(self, name):
+        """
+        Return the information of a phase: ``filepath``, ``block``,
+        ``formula``, ``spacegroup`` (number or ``None``) and ``lattice``
+        (a, b, c, alpha, beta, gamma).
+
+        :rtype: :class:`dict`
+
+        """
+        return dict(self._phases[name])
+
+    def _read_array(self, location, dtype):
+        offset, count = location
+        if count == 0:
+            return np.empty(0, dtype)
+        return np.memmap(self._filepath, dtype, 'r', offset, (count,))
+
+    def get_unitcell(self, name):
+        """
+        :rtype: :class:`unitcell.UnitCell`
+
+        """
+        return unitcell.UnitCell(*self._phases[name]['lattice'])
+
+    def get_atomsites(self, name):
+        """
+        Return the atom sites of a phase, expanded by the symmetry operations.
+
+        :rtype: :class:`atomsites.AtomSites`
+
+        """
+        record = self._phases[name]
+        sites = self._read_array(record['atoms'], ATOMS_DTYPE)
+        positions = np.column_stack((sites['x'], sites['y'], sites['z']))
+
+        return atomsites.AtomSites.from_arrays(sites['atomicnumber'], positions,
+                                               record['precision'])
+
+    def get_spacegroup(self, name):
+        """
+        Return the space group of a phase or ``None`` if it was not resolved
+        or if it is not one of the tabulated settings.
+
+        :rtype: :class:`spacegroup.SpaceGroup`
+
+        """
+        number = self._phases[name]['spacegroup']
+        if number is None:
+            return None
+        return spacegroups.getspacegroup(number)
+
+    def get_reflectors_table(self, name):
+        """
+        Return the reflectors of a phase (memory-mapped).
+
+        :rtype: :class:`numpy.ndarray` of type :const:`reflectors.TABLE_DTYPE`
+
+        """
+        record = self._phases[name]
+        return self._read_array(record['reflectors'], reflectors.TABLE_DTYPE)
@@ -71,6 +71,18 @@ class Plane(object):
         """
         return hash(self._indices)
 
+    def __eq__(self, other):
+        if isinstance(other, Plane):
+            return self._indices == other._indices
+
+        try:
+            return self._indices == tuple(other)
+        except TypeError: # e.g. None
+            return NotImplemented
+
+    def __ne__(self, other):
+        return not self == other
+
     def __repr__(self):
         args = (self.__class__.__name__,) + self.indices
         return '<%s(%s, %s, %s)>' % args
@@ -24,20 +24,204 @@ __svnDate__ = ""
 __svnId__ = ""
 
 # Standard library modules.
+import os
+import hashlib
+import tempfile
 from operator import attrgetter
 
 # Third party modules.
+import numpy as np
 
 # Local modules.
 import ebsdtools.crystallography.plane as plane
 import ebsdtools.crystallography.calculations as calculations
 
 # Globals and constants variables.
+TABLE_DTYPE = np.dtype([('h', '<i2'), ('k', '<i2'), ('l', '<i2'),
+                        ('planespacing', '<f8'), ('intensity', '<f8')])
+
+CACHE_VERSION = 1 # Version of the content of the reflectors cache
+
+def _positive_indices(maxindice):
+    """
+    Return the indices of all the planes with indices between -*maxindice* and
+    *maxindice*, without the null plane, in their positive form 
+    (first non-zero index positive).
+    Each plane appears only once.
+    
+    :rtype: :class:`numpy.ndarray` of shape (N, 3)
+    
+    """
+    values = np.arange(-maxindice, maxindice + 1)
+    indices = np.array(np.meshgrid(values, values, values, indexing='ij'))
+    indices = indices.reshape(3, -1).T
+
+    # Only keep the planes whose first non-zero index is positive
+    h, k, l = indices.T
+    positive = (h > 0) | ((h == 0) & (k > 0)) | ((h == 0) & (k == 0) & (l > 0))
+
+    return indices[positive]
+
+def _encode_indices(indices, maxindice):
+    """
+    Return an integer key for each plane of *indices* (array of shape (..., 3)),
+    increasing with the lexicographic order of the indices.
+    The planes outside the cube [-*maxindice*, *maxindice*] get the key -1.
+    
+    """
+    base = 2 * maxindice + 1
+    shifted = indices + maxindice
+
+    keys = (shifted[..., 0] * base + shifted[..., 1]) * base + shifted[..., 2]
+    inside = np.all(np.abs(indices) <= maxindice, axis=-1)
+
+    return np.where(inside, keys, -1)
+
+def _symmetry_operations(spacegroup):
+    """
+    Return the rotations (array of shape (N, 3, 3)) and translations 
+    (array of shape (N, 3)) of the symmetry operations of a space group.
+    
+    """
+    rotations, translations = spacegroup.get_symop_arrays()
+
+    return np.rint(rotations).astype(int), translations
+
+def _laue_rotations(rotations):
+    """
+    Return the distinct rotations of the Laue group of a point group: its
+    rotations and their product with the inversion (Friedel's law).
+    
+    """
+    rotations = np.concatenate((rotations, -rotations))
+    rotations = np.unique(rotations.reshape(-1, 9), axis=0)
+
+    return rotations.reshape(-1, 3, 3)
+
+def _equivalent_indices(indices, rotations):
+    """
+    Return the indices of the planes equivalent to each plane of *indices* by
+    the *rotations* (array of shape (N, number of rotations, 3)).
+    The planes are transformed as row vectors: :math:`(hkl)' = (hkl) R`.
+    
+    """
+    return np.einsum('ni,rij->nrj', indices, rotations)
+
+def _asymmetric_indices(maxindice, rotations):
+    """
+    Return the indices of one plane of each family of planes between 
+    -*maxindice* and *maxindice*.
+    The plane kept is the largest plane (in lexicographic order) of the
+    family inside the cube of indices, which is always a positive plane.
+    
+    :arg rotations: rotations of the Laue group
+    
+    """
+    indices = _positive_indices(maxindice)
+    keys = _encode_indices(_equivalent_indices(indices, rotations), maxindice)
+
+    return indices[_encode_indices(indices, maxindice) == keys.max(axis=1)]
+
+def _systematic_absences(indices, rotations, translations, tolerance=1e-6):
+    """
+    Return a mask of the planes which are systematically absent.
+    A plane is absent if it is invariant under the rotation of a symmetry 
+    operation whose translation gives a non-integer phase, i.e. from the 
+    lattice centering (pure translations), glide planes and screw axes.
+    
+    """
+    absent = np.zeros(len(indices), dtype=bool)
+
+    for rotation, translation in zip(rotations, translations):
+        if not np.any(translation):
+            continue
+
+        invariant = np.all(np.dot(indices, rotation) == indices, axis=1)
+        phase = np.dot(indices, translation)
+        absent |= invariant & (np.abs(phase - np.rint(phase)) > tolerance)
+
+    return absent
+
+def _expand_families(table, rotations, maxindice):
+    """
+    Return a table where each plane is replaced by all the positive planes of
+    its family inside the cube of indices.
+    The equivalent planes have the same plane spacing and intensity.
+    
+    """
+    indices = np.array([table['h'], table['k'], table['l']]).T
+    equivalents = _equivalent_indices(indices, rotations)
+
+    # Distinct positive planes inside the cube
+    keys = _encode_indices(equivalents, maxindice)
+    h, k, l = equivalents[..., 0], equivalents[..., 1], equivalents[..., 2]
+    positive = (h > 0) | ((h == 0) & (k > 0)) | ((h == 0) & (k == 0) & (l > 0))
+    keys = np.where(positive, keys, -1)
+
+    rows = np.repeat(np.arange(len(table))[:, np.newaxis], keys.shape[1], axis=1)
+    valid = keys >= 0
+    pairs = np.unique(np.array([rows[valid], keys[valid]]).T, axis=0)
+
+    base = 2 * maxindice + 1
+    expanded = np.empty(len(pairs), dtype=TABLE_DTYPE)
+    expanded['h'] = pairs[:, 1] // (base * base) - maxindice
+    expanded['k'] = pairs[:, 1] // base % base - maxindice
+    expanded['l'] = pairs[:, 1] % base - maxindice
+    expanded['planespacing'] = table['planespacing'][pairs[:, 0]]
+    expanded['intensity'] = table['intensity'][pairs[:, 0]]
+
+    return expanded
+
+def compute_table(unitcell, atoms, scatteringfactors, maxindice=4,
+                  spacegroup=None, expand=False, fraction=1e-14):
+    """
+    Compute the reflectors of all the planes up to the maximum indice at
+    once and return the table of the diffracting planes.
+    The arguments are the same as for :class:`Reflectors`.
+    
+    The plane spacings and intensities are calculated for the whole grid of
+    indices at once (see :func:`calculations.diffraction_intensities`).
+    With a space group, the grid is restricted to one plane per family 
+    and the systematic absences are removed before the calculations.
+    
+    :rtype: :class:`numpy.ndarray` of type :const:`TABLE_DTYPE`
+    
+    """
+    if spacegroup is None:
+        indices = _positive_indices(maxindice)
+    else:
+        rotations, translations = _symmetry_operations(spacegroup)
+        laue = _laue_rotations(rotations)
+
+        indices = _asymmetric_indices(maxindice, laue)
+        absent = _systematic_absences(indices, rotations, translations)
+        indices = indices[~absent]
+
+    planespacings = calculations.planespacings(indices, unitcell)
+    intensities = \
+        calculations.diffraction_intensities(indices, unitcell,
+                                             atoms, scatteringfactors)
+
+    # Diffracting planes
+    maxintensity = \
+        calculations.diffraction_maxintensity(unitcell, atoms,
+                                              scatteringfactors)
+    survivors = intensities > fraction * maxintensity
+
+    table = np.empty(np.count_nonzero(survivors), dtype=TABLE_DTYPE)
+    table['h'], table['k'], table['l'] = indices[survivors].T
+    table['planespacing'] = planespacings[survivors]
+    table['intensity'] = intensities[survivors]
+
+    if spacegroup is not None and expand:
+        table = _expand_families(table, laue, maxindice)
+
+    return table
 
 class Reflector(object):
 
-    def __init__(self, plane, plane_spacing, intensity,
-                 normalized_intensity=None):
+    def __init__(self, plane, planespacing, intensity,
+                 normalizedintensity=None):
         """
         Store the plane, plane spacing and intensity of a reflector.
         
@@ -45,21 +229,24 @@ class Reflector(object):
         
         :type planespacing: :class:`float`
         
-        :type intensity: :class:`intensity`
+        :type intensity: :class:`float`
+        
+        :type normalizedintensity: :class:`float`
         
         """
         self._plane = plane
-        self._plane_spacing = plane_spacing
+        self._planespacing = planespacing
         self._intensity = intensity
-        self._normalized_intensity = normalized_intensity
+        self._normalizedintensity = normalizedintensity
 
     def __repr__(self):
         classname = self.__class__.__name__
-        if self.normalized_intensity is None:
+        if self.normalizedintensity is None:
             return '<%s(%s d=%f I=%f)>' % (classname, self.plane.indices,
-                                           self.
-        return '<%s(%s d=%f I=%f In=%f)>' % (self.plane, self.plane_spacing,
-                                         self.intensity, self.normalized_intensity)
+                                           self.planespacing, self.intensity)
+        return '<%s(%s d=%f I=%f In=%f)>' % (classname, self.plane.indices,
+                                             self.planespacing, self.intensity,
+                                             self.normalizedintensity)
 
     def __hash__(self):
         """
@@ -76,19 +263,20 @@ class Reflector(object):
         return self._plane
 
     @property
-    def plane_spacing(self):
-        return self._plane_spacing
+    def planespacing(self):
+        return self._planespacing
 
     @property
     def intensity(self):
         return self._intensity
 
     @property
-    def normalized_intensity(self):
-        return self._normalized_intensity
+    def normalizedintensity(self):
+        return self._normalizedintensity
 
 class Reflectors(list):
-    def __init__(self, unitcell, atoms, scatteringfactors, maxindice=4):
+    def __init__(self, unitcell, atoms, scatteringfactors, maxindice=4,
+                 cache=None, spacegroup=None, expand=False):
         """
         Find and store reflectors for a set of atoms, unit cell and scattering
         factors.
@@ -103,58 +291,70 @@ class Reflectors(list):
         :arg maxindice: maxium indice in the reflectors (``default=4``)
         :type maxindice: :class:`int`
         
+        :arg cache: cache where the reflectors are loaded from or saved to
+            (``default=None``)
+        :type cache: :class:`ReflectorsCache`
+        
+        :arg spacegroup: space group of the atoms (``default=None``).
+            If given, only one plane of each family of equivalent planes (by
+            the Laue group of the space group) is evaluated and the 
+            systematically absent planes are skipped.
+        :type spacegroup: :class:`spacegroup.SpaceGroup`
+        
+        :arg expand: whether to add the other planes of each family when a 
+            space group is given (``default=False``)
+        :type expand: :class:`bool`
+        
         """
         self._unitcell = unitcell
         self._atoms = atoms
         self._scatter = scatteringfactors
         self._maxindice = maxindice
+        self._spacegroup = spacegroup
+        self._expand = expand
 
-        data = self._compute_reflectors()
-        list.__init__(self, data)
+        if cache is None:
+            table = self._compute_table()
+        else:
+            key = cache.get_key(unitcell, atoms, scatteringfactors, maxindice,
+                                spacegroup, expand)
+            table = cache.load(key)
+
+            if table is None:
+                table = self._compute_table()
+                cache.save(key, table)
+
+        list.__init__(self, self._create_reflectors(table))
 
         self._calculate_normalized_intensity()
 
-    def _compute_reflectors(self):
-        reflectors = set()
-
-        indices_range = range(-self._maxindice, self._maxindice + 1)
-
-        for h in indices_range:
-            for k in indices_range:
-                for l in indices_range:
-                    if h == 0 and k == 0 and l == 0: continue # Skip null plane
-
-                    # Create plane
-                    # Only look at positive planes since negative plane are equivalent
-                    p = plane.Plane(h, k, l)
-                    p.positive()
-
-                    # Calculate the intensities
-                    intensity = \
-                        calculations.diffraction_intensity(p, self._unitcell,
-                                                           self._atoms,
-                                                           self._scatter)
-                    maxintensity = \
-                        calculations.diffraction_maxintensity(self._unitcell,
-                                                              self._atoms,
-                                                              self._scatter)
-
-                    # Check if the plane diffracts
-                    if calculations._is_diffracting(intensity, maxintensity):
-                        planespacing = calculations.planespacing(p, self._unitcell)
-                        reflector = Reflector(p, planespacing, intensity)
-                        reflectors.add(reflector)
+    def _compute_table(self):
+        return compute_table(self._unitcell, self._atoms, self._scatter,
+                             self._maxindice, self._spacegroup, self._expand)
+
+    def _create_reflectors(self, table):
+        """
+        Create the :class:`Reflector` of each row of a *table*.
+        
+        """
+        reflectors = []
+
+        for h, k, l, planespacing, intensity in table.tolist():
+            p = plane.Plane(h, k, l)
+            reflectors.append(Reflector(p, planespacing, intensity))
 
         return reflectors
 
     def _calculate_normalized_intensity(self):
+        if not self:
+            return
+
         self.sort_by_intensity(reverse=True)
 
         maxintensity = self[0].intensity
 
         for refl in self:
-            normalizedintensity = refl.intensity / maxintensity
-            refl.setdefault(Reflector.NORMALIZEDINTENSITY, normalizedintensity)
+            refl._normalizedintensity = refl.intensity / maxintensity
 
     def sort_by_intensity(self, reverse=False):
         """
@@ -164,7 +364,7 @@ class Reflectors(list):
         :type reverse: :class:`bool`
         
         """
-        self.sort(key=attrgetter('intensity)'), reverse=reverse)
+        self.sort(key=attrgetter('intensity'), reverse=reverse)
 
     def sort_by_planespacing(self, reverse=False):
         """
@@ -174,7 +374,7 @@ class Reflectors(list):
         :type reverse: :class:`bool`
         
         """
-        self.sort(key=attrgetter('planespacing)'), reverse=reverse)
+        self.sort(key=attrgetter('planespacing'), reverse=reverse)
 
     def get(self, plane):
         """
@@ -191,3 +391,179 @@ class Reflectors(list):
 
         return None
 
+
+class ReflectorsCache(object):
+    def __init__(self, dirpath, maxsize=67108864):
+        """
+        Cache of computed reflectors on disk.
+        
+        Each entry is identified by a hash of the lattice parameters, the atom
+        sites, the scattering factors tables and the maximum indice 
+        (see :meth:`get_key`).
+        The reflectors are saved as a binary table (``.npy``) of the indices,
+        plane spacings and intensities.
+        
+        The cache can be shared by several processes: an entry is written
+        under a temporary name and renamed once complete, so that it is never
+        read partially.
+        When the total size of the entries exceeds *maxsize*, the least 
+        recently used entries are deleted.
+        
+        :arg dirpath: directory of the cache (created if needed)
+        :type dirpath: :class:`str`
+        
+        :arg maxsize: maximum size of the cache in bytes (``default=64 MB``)
+        :type maxsize: :class:`int`
+        
+        """
+        self._dirpath = dirpath
+        self._maxsize = maxsize
+
+        if not os.path.isdir(dirpath):
+            try:
+                os.makedirs(dirpath)
+            except OSError: # Created by another process
+                if not os.path.isdir(dirpath):
+                    raise
+
+    @property
+    def dirpath(self):
+        return self._dirpath
+
+    @property
+    def maxsize(self):
+        return self._maxsize
+
+    def get_key(self, unitcell, atoms, scatteringfactors, maxindice,
+                spacegroup=None, expand=False):
+        """
+        Return the hash identifying the reflectors of a unit cell, atom sites,
+        scattering factors, maximum indice and space group (see 
+        :class:`Reflectors`).
+        
+        :rtype: :class:`str`
+        
+        """
+        lattice = tuple('%.10g' % value for value in
+                        (unitcell.a, unitcell.b, unitcell.c,
+                         unitcell.alpha, unitcell.beta, unitcell.gamma))
+
+        sites = sorted((atom.atomicnumber,) +
+                       tuple('%.6f' % value for value in atom.position)
+                       for atom in atoms)
+
+        if spacegroup is None:
+            symmetry = None
+        elif spacegroup.number is not None:
+            symmetry = (spacegroup.number, bool(expand))
+        else: # e.g. non-standard setting, identified by its operations
+            rotations, translations = spacegroup.get_symop_arrays()
+            rotations = np.rint(rotations).astype(int).reshape(-1, 9)
+            translations = np.rint(np.mod(translations, 1.0) * 24).astype(int) % 24
+            operations = sorted(set(map(tuple, np.concatenate((rotations, translations),
+                                                              axis=1).tolist())))
+            symmetry = (operations, bool(expand))
+
+        content = repr((CACHE_VERSION, lattice, sites,
+                        scatteringfactors.get_identity(), int(maxindice),
+                        symmetry))
+
+        return hashlib.sha1(content).hexdigest()
+
+    def _get_filepath(self, key):
+        return os.path.join(self._dirpath, key + '.npy')
+
+    def load(self, key):
+        """
+        Return the table of reflectors of a *key* or ``None`` if the key is
+        not in the cache.
+        
+        :rtype: :class:`numpy.ndarray` of type :const:`TABLE_DTYPE`
+        
+        """
+        filepath = self._get_filepath(key)
+
+        try:
+            table = np.load(filepath)
+        except (IOError, ValueError): # Missing, evicted or invalid entry
+            return None
+
+        if table.dtype != TABLE_DTYPE:
+            return None
+
+        try:
+            os.utime(filepath, None) # Mark as recently used
+        except OSError:
+            pass
+
+        return table
+
+    def save(self, key, table):
+        """
+        Save the table of reflectors of a *key* and evict the least recently
+        used entries if the cache is too large.
+        
+        :type table: :class:`numpy.ndarray` of type :const:`TABLE_DTYPE`
+        
+        """
+        fd, temppath = tempfile.mkstemp('.tmp', key, self._dirpath)
+        try:
+            f = os.fdopen(fd, 'wb')
+            try:
+                np.save(f, np.asarray(table, dtype=TABLE_DTYPE))
+            finally:
+                f.close()
+
+            filepath = self._get_filepath(key)
+            if os.name == 'nt' and os.path.exists(filepath): # No atomic replace
+                os.remove(filepath)
+            os.rename(temppath, filepath)
+        except:
+            if os.path.exists(temppath):
+                os.remove(temppath)
+            raise
+
+        self._evict()
+
+    def _evict(self):
+        """
+        Delete the least recently used entries until the size of the cache is
+        below the maximum size.
+        Entries deleted by another process at the same time are ignored.
+        
+        """
+        entries = []
+        for filename in os.listdir(self._dirpath):
+            if not filename.endswith('.npy'):
+                continue
+
+            filepath = os.path.join(self._dirpath, filename)
+            try:
+                stat = os.stat(filepath)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, filepath))
+
+        size = sum(entry[1] for entry in entries)
+
+        for mtime, filesize, filepath in sorted(entries):
+            if size <= self._maxsize:
+                break
+
+            try:
+                os.remove(filepath)
+            except OSError:
+                pass
+            size -= filesize
+
+    def clear(self):
+        """
+        Delete all the entries of the cache.
+        
+        """
+        for filename in os.listdir(self._dirpath):
+            if filename.endswith('.npy'):
+                try:
+                    os.remove(os.path.join(self._dirpath, filename))
+                except OSError:
+                    pass
@@ -28,14 +28,19 @@ import os.path
 import configparser
 import csv
 import warnings
-from math import pi, exp
+from math import pi
+from collections import OrderedDict
 
 # Third party modules.
+import numpy as np
 
 # Local modules.
 import DatabasesTools.ElementProperties as ElementProperties
 
 # Globals and constants variables.
+CACHE_SIZE = 4096 # Number of scattering factors kept for the scalar calls
+
+CACHE_DECIMALS = 8 # Decimals of s in the keys of the cache
 
 class ScatteringFactors:
     SECTION_NAME = None
@@ -82,6 +87,105 @@ class ScatteringFactors:
     def _read(self):
         raise NotImplementedError
 
+    def get_identity(self):
+        """
+        Return a value identifying the scattering factors: the name of the 
+        class and the path, size and modification time of the data files.
+        
+        :rtype: :class:`tuple`
+        
+        """
+        identity = [self.__class__.__name__]
+
+        for filepath in (self._filepath_0_2, self._filepath_2_6):
+            stat = os.stat(filepath)
+            identity.append((os.path.abspath(filepath), stat.st_size,
+                             int(stat.st_mtime)))
+
+        return tuple(identity)
+
+    def _cached(self, key, function, *args):
+        """
+        Return the value of *function* for *args* from a least recently used
+        cache of :const:`CACHE_SIZE` values.
+        
+        """
+        try:
+            cache = self._cache
+        except AttributeError:
+            cache = self._cache = OrderedDict()
+
+        try:
+            value = cache.pop(key)
+        except KeyError:
+            value = function(*args)
+            if len(cache) >= CACHE_SIZE:
+                cache.popitem(last=False)
+
+        cache[key] = value
+        return value
+
+    def _lookup_rows(self, index, atomicnumbers, charge=None):
+        """
+        Return the rows of the coefficient arrays for an array of atomic
+        numbers (and a *charge* for tables indexed by atomic number and 
+        charge).
+        
+        """
+        values, inverse = np.unique(atomicnumbers, return_inverse=True)
+        rows = np.empty(len(values), dtype=int)
+
+        for i, atomicnumber in enumerate(values):
+            key = int(atomicnumber)
+            if charge is not None:
+                key = (key, charge)
+
+            try:
+                rows[i] = index[key]
+            except KeyError:
+                raise KeyError("Atomic number (%s) not in table" % (key,))
+
+        return rows[inverse]
+
+    def _create_arrays(self, coefficients, *columns):
+        """
+        Create the index of the row of each key of *coefficients* (e.g. atomic
+        number) and, for each list of column names of *columns*, the array of
+        these coefficients (one row per key).
+        
+        :return: index followed by one array of shape (number of keys,
+            number of columns) per list of column names
+        
+        """
+        index = {}
+        arrays = [np.empty((len(coefficients), len(names))) for names in columns]
+
+        for row, key in enumerate(sorted(coefficients)):
+            coeffs = coefficients[key]
+            index[key] = row
+            for array, names in zip(arrays, columns):
+                array[row] = [coeffs[name] for name in names]
+
+        return [index] + arrays
+
+    def _split_ranges(self, s):
+        """
+        Return the masks of the values of *s* evaluated with the table from 0 
+        to 2 and with the table from 2 to 6.
+        The values outside the range of the tables are evaluated with the
+        table from 2 to 6 and one warning is issued for all of them.
+        
+        """
+        low = (s >= 0) & (s < 2)
+
+        outside = (s < 0) | (s >= 6)
+        if np.any(outside):
+            warnings.warn("Outside table range of s for %i value(s) (%e to %e) < 6\AA" % \
+                          (np.count_nonzero(outside), s[outside].min(), s[outside].max()),
+                          ScatteringFactorWarning)
+
+        return low, ~low
+
 class ElasticAtomicScatteringFactors(ScatteringFactors):
     SECTION_NAME = 'ElasticAtomicScatteringFactors'
     OPTION_FILEPATH_0_2 = 'filepath_0_2'
@@ -143,6 +247,14 @@ class ElasticAtomicScatteringFactors(ScatteringFactors):
 
             self.coefficients_2_6.setdefault(atomicnumber, self._formatrow(row))
 
+        # Coefficient arrays
+        a = ['a%i' % i for i in range(1, 6)]
+        b = ['b%i' % i for i in range(1, 6)]
+        self._index_0_2, self._a_0_2, self._b_0_2 = \
+            self._create_arrays(self.coefficients_0_2, a, b)
+        self._index_2_6, self._a_2_6, self._b_2_6 = \
+            self._create_arrays(self.coefficients_2_6, a, b)
+
     def _formatrow(self, row):
         """
         Format the values in the row to be :class:`float`.
@@ -182,64 +294,80 @@ class ElasticAtomicScatteringFactors(ScatteringFactors):
         s = 2 * pi / planespacing
         return self._get(atomicnumber, s)
 
+    def get_many(self, atomicnumbers, planespacings):
+        """
+        Return the scattering factors for arrays of *atomicnumbers* and 
+        *planespacings*.
+        The arrays are broadcast against each other, e.g. a row of atomic 
+        numbers and a column of plane spacings give the scattering factor
+        of every atom for every plane spacing.
+        Only one warning is issued for all the values outside the range of
+        the tables.
+        
+        :arg atomicnumbers: atomic numbers of the atoms
+        :type atomicnumbers: array of :class:`int`
+        
+        :arg planespacings: spacings of planes in angstroms
+        :type planespacings: array of :class:`float`
+        
+        :rtype: :class:`numpy.ndarray`
+        
+        .. seealso:: :meth:`get`
+        
+        """
+        atomicnumbers, planespacings = \
+            np.broadcast_arrays(np.asarray(atomicnumbers, dtype=int),
+                                np.asarray(planespacings, dtype=float))
+        s = 2 * pi / planespacings
+        return self._get_many(atomicnumbers, s)
+
     def _get(self, atomicnumber, s):
         """
         Return scattering factor.
+        The values are cached on the atomic number and the rounded *s*.
         
         """
-        # For s between 0 and 2.
-        if s >= 0 and s < 2:
-            return self._calculate_scatteringfactor_0_2(s, atomicnumber)
-
-        # For s between 2 and 6.
-        elif s >= 2 and s < 6:
-            return self._calculate_scatteringfactor_2_6(s, atomicnumber)
+        key = (atomicnumber, round(s, CACHE_DECIMALS))
+        return self._cached(key, self._calculate_scatteringfactor,
+                            atomicnumber, s)
 
-        # For s greater than 6.
-        else:
-            warnings.warn("Outside table range of s (%e) < 6\AA" % s,
-                          ScatteringFactorWarning)
-            return self._calculate_scatteringfactor_2_6(s, atomicnumber)
-
-    def _calculate_scatteringfactor_0_2(self, s, atomicnumber):
+    def _calculate_scatteringfactor(self, atomicnumber, s):
         """
-        Calculate the scattering factor between 0 and 2.
+        Calculate the scattering factor of one atom.
         
         """
-        coeffs = self.coefficients_0_2.get(atomicnumber)
-        if coeffs is None:
-            raise KeyError("Atomic number not in table")
-
-        a = [coeffs['a1'], coeffs['a2'], coeffs['a3'], coeffs['a4'], coeffs['a5']]
-        b = [coeffs['b1'], coeffs['b2'], coeffs['b3'], coeffs['b4'], coeffs['b5']]
-
-        return self._calculate_scatteringfactor(s, a, b)
+        return float(self._get_many(np.array([atomicnumber]), np.array([s]))[0])
 
-    def _calculate_scatteringfactor_2_6(self, s, atomicnumber):
+    def _get_many(self, atomicnumbers, s):
         """
-        Calculate the scattering factor between 2 and 6.
+        Return scattering factors for arrays of atomic numbers and *s*.
         
         """
-        coeffs = self.coefficients_2_6.get(atomicnumber)
-        if coeffs is None:
-            raise KeyError("Atomic number not in table")
+        factors = np.empty(s.shape)
+        low, high = self._split_ranges(s)
 
-        a = [coeffs['a1'], coeffs['a2'], coeffs['a3'], coeffs['a4'], coeffs['a5']]
-        b = [coeffs['b1'], coeffs['b2'], coeffs['b3'], coeffs['b4'], coeffs['b5']]
+        factors[low] = self._calculate_scatteringfactors(self._index_0_2,
+                                                         self._a_0_2, self._b_0_2,
+                                                         atomicnumbers[low], s[low])
+        factors[high] = self._calculate_scatteringfactors(self._index_2_6,
+                                                          self._a_2_6, self._b_2_6,
+                                                          atomicnumbers[high], s[high])
 
-        return self._calculate_scatteringfactor(s, a, b)
+        return factors
 
-    def _calculate_scatteringfactor(self, s, a, b):
+    def _calculate_scatteringfactors(self, index, a, b, atomicnumbers, s):
         """
-        Calculate factor.
+        Calculate the sum of the five exponentials for arrays of atomic numbers
+        and *s*.
         
         """
-        f = 0.0
+        if len(s) == 0:
+            return np.empty(0)
 
-        for i in range(5):
-            f += a[i] * exp(-b[i] * s ** 2)
+        rows = self._lookup_rows(index, atomicnumbers)
+        s_sq = (s ** 2)[:, np.newaxis]
 
-        return f
+        return np.sum(a[rows] * np.exp(-b[rows] * s_sq), axis=1)
 
 class XrayScatteringFactors(ScatteringFactors):
     SECTION_NAME = 'XrayScatteringFactors'
@@ -321,6 +449,19 @@ class XrayScatteringFactors(ScatteringFactors):
 
             self.coefficients_2_6.setdefault(key, self._formatrow(row))
 
+        # Coefficient arrays
+        self._index_0_2, self._a_0_2, self._b_0_2, c = \
+            self._create_arrays(self.coefficients_0_2,
+                                ['a%i' % i for i in range(1, 5)],
+                                ['b%i' % i for i in range(1, 5)], ['c'])
+        self._c_0_2 = c[:, 0]
+
+        self._index_2_6, self._a_2_6 = \
+            self._create_arrays(self.coefficients_2_6,
+                                ['a%i' % i for i in range(4)])
+        self._a_2_6[:, 2] /= 10.0
+        self._a_2_6[:, 3] /= 100.0
+
     def _readatomicnumber(self, row):
         symbol = row[self.SYMBOL].strip()
         atomicnumber = ElementProperties.getAtomicNumberBySymbol(symbol)
@@ -378,70 +519,96 @@ class XrayScatteringFactors(ScatteringFactors):
         s = 1 / (2.0 * planespacing)
         return self._get(atomicnumber, s, charge)
 
+    def get_many(self, atomicnumbers, planespacings, charge=0):
+        """
+        Return the scattering factors for arrays of *atomicnumbers* and 
+        *planespacings*.
+        The arrays are broadcast against each other, e.g. a row of atomic 
+        numbers and a column of plane spacings give the scattering factor
+        of every atom for every plane spacing.
+        Only one warning is issued for all the values outside the range of
+        the tables.
+        
+        :arg atomicnumbers: atomic numbers of the atoms
+        :type atomicnumbers: array of :class:`int`
+        
+        :arg planespacings: spacings of planes in angstroms
+        :type planespacings: array of :class:`float`
+        
+        :arg charge: charge of the atoms for ionized element
+        :type charge: :class:`int`
+        
+        :rtype: :class:`numpy.ndarray`
+        
+        .. seealso:: :meth:`get`
+        
+        """
+        atomicnumbers, planespacings = \
+            np.broadcast_arrays(np.asarray(atomicnumbers, dtype=int),
+                                np.asarray(planespacings, dtype=float))
+        s = 1 / (2.0 * planespacings)
+        return self._get_many(atomicnumbers, s, charge)
+
     def _get(self, atomicnumber, s, charge=0):
         """
         Return scattering factor.
+        The values are cached on the atomic number, the charge and the 
+        rounded *s*.
         
         """
-        # For s between 0 and 2.
-        if s >= 0 and s < 2:
-            return self._calculate_scatteringfactor_0_2(s, atomicnumber, charge)
-
-        # For s between 2 and 6.
-        elif s >= 2 and s < 6:
-            return self._calculate_scatteringfactor_2_6(s, atomicnumber, charge)
-
-        # For s greater than 6.
-        else:
-            warnings.warn("Outside table range of s (%e) < 6\AA" % s,
-                          ScatteringFactorWarning)
-            return self._calculate_scatteringfactor_2_6(s, atomicnumber, charge)
+        key = (atomicnumber, charge, round(s, CACHE_DECIMALS))
+        return self._cached(key, self._calculate_scatteringfactor,
+                            atomicnumber, s, charge)
 
-    def _calculate_scatteringfactor_0_2(self, s, atomicnumber, charge):
+    def _calculate_scatteringfactor(self, atomicnumber, s, charge):
         """
-        Calculate the scattering factor between 0 and 2.
+        Calculate the scattering factor of one atom.
         
         """
-        # Coefficients
-        coeffs = self.coefficients_0_2.get((atomicnumber, charge))
-        if coeffs is None:
-            raise KeyError("Atomic number with specified charge not in table")
-
-        a = [coeffs['a1'], coeffs['a2'], coeffs['a3'], coeffs['a4']]
-        b = [coeffs['b1'], coeffs['b2'], coeffs['b3'], coeffs['b4']]
-        c = coeffs['c']
-
-        # Calculate factor
-        f = 0.0
+        factors = self._get_many(np.array([atomicnumber]), np.array([s]), charge)
+        return float(factors[0])
 
-        for i in range(4):
-            f += a[i] * exp(-b[i] * s ** 2)
+    def _get_many(self, atomicnumbers, s, charge=0):
+        """
+        Return scattering factors for arrays of atomic numbers and *s*.
+        
+        """
+        factors = np.empty(s.shape)
+        low, high = self._split_ranges(s)
 
-        f += c
+        factors[low] = self._calculate_scatteringfactors_0_2(atomicnumbers[low],
+                                                             s[low], charge)
+        factors[high] = self._calculate_scatteringfactors_2_6(atomicnumbers[high],
+                                                              s[high], charge)
 
-        return f
+        return factors
 
-    def _calculate_scatteringfactor_2_6(self, s, atomicnumber, charge):
+    def _calculate_scatteringfactors_0_2(self, atomicnumbers, s, charge):
         """
-        Calculate the scattering factor between 2 and 6.
+        Calculate the scattering factors between 0 and 2.
         
         """
-        # Coefficients
-        coeffs = self.coefficients_2_6.get((atomicnumber, charge))
-        if coeffs is None:
-            raise KeyError("Atomic number with specified charge not in table")
+        if len(s) == 0:
+            return np.empty(0)
 
-        a = [coeffs['a0'], coeffs['a1'], coeffs['a2'] / 10.0, coeffs['a3'] / 100.0]
+        rows = self._lookup_rows(self._index_0_2, atomicnumbers, charge)
+        s_sq = (s ** 2)[:, np.newaxis]
 
-        # Calculate factor
-        f = 0.0
+        return np.sum(self._a_0_2[rows] * np.exp(-self._b_0_2[rows] * s_sq), axis=1) + \
+            self._c_0_2[rows]
 
-        for i in range(4):
-            f += a[i] * s ** i
+    def _calculate_scatteringfactors_2_6(self, atomicnumbers, s, charge):
+        """
+        Calculate the scattering factors between 2 and 6.
+        
+        """
+        if len(s) == 0:
+            return np.empty(0)
 
-        f = exp(f)
+        rows = self._lookup_rows(self._index_2_6, atomicnumbers, charge)
+        powers = s[:, np.newaxis] ** np.arange(4)
 
-        return f
+        return np.exp(np.sum(self._a_2_6[rows] * powers, axis=1))
 
 class ScatteringFactorWarning(Warning):
     """
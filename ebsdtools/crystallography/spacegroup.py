@@ -29,6 +29,7 @@ __svnId__ = ""
 # Standard library modules.
 
 # Third party modules.
+import numpy as np
 
 # Local modules.
 import mathtools.algebra.vectors as vectors
@@ -38,6 +39,32 @@ import ebsdtools.crystallography.atomsites as atomsites
 import ebsdtools.crystallography.atomsite as atomsite
 
 # Globals and constants variables.
+_ROTATIONS = {}
+_TRANSLATIONS = {}
+
+def _get_rotation(rows):
+    """
+    Returns the shared :class:`matrices.Matrix3D` of a rotation given as a
+    tuple of rows.
+    
+    """
+    try:
+        return _ROTATIONS[rows]
+    except KeyError:
+        m = _ROTATIONS[rows] = matrices.Matrix3D([list(row) for row in rows])
+        return m
+
+def _get_translation(values):
+    """
+    Returns the shared :class:`vectors.Vector3D` of a translation given as a
+    tuple.
+    
+    """
+    try:
+        return _TRANSLATIONS[values]
+    except KeyError:
+        v = _TRANSLATIONS[values] = vectors.Vector3D(list(values))
+        return v
 
 class SymOp(object):
     def __init__(self, r, t):
@@ -120,7 +147,8 @@ class SpaceGroup(object):
                  point_group_name=None,
                  crystal_system=None,
                  pdb_name=None,
-                 symop_list=None):
+                 symop_list=None,
+                 symop_specs=None):
         """
         Contains the various names and symmetry operations for one space group.
         
@@ -136,6 +164,11 @@ class SpaceGroup(object):
           * :attr:`symop_list`: :class:`list` of :class:`SymOp`
                                 , symmetry operations
         
+        The symmetry operations can also be given as *symop_specs*, a
+        sequence of ``(rotation rows, translation)`` tuples. They are then
+        only converted into :class:`SymOp` the first time :attr:`symop_list`
+        is accessed.
+        
         """
         self.number = number
         self.num_sym_equiv = num_sym_equiv
@@ -144,7 +177,47 @@ class SpaceGroup(object):
         self.point_group_name = point_group_name
         self.crystal_system = crystal_system
         self.pdb_name = pdb_name
-        self.symop_list = symop_list
+        self._symop_list = symop_list
+        self._symop_specs = symop_specs
+        self._symop_arrays = None
+
+    def _get_symop_list(self):
+        if self._symop_list is None and self._symop_specs is not None:
+            self._symop_list = [SymOp(_get_rotation(r), _get_translation(t))
+                                for r, t in self._symop_specs]
+        return self._symop_list
+
+    def _set_symop_list(self, symop_list):
+        self._symop_list = symop_list
+        self._symop_specs = None
+        self._symop_arrays = None
+
+    symop_list = property(_get_symop_list, _set_symop_list,
+                          doc="List of symmetry operations (:class:`SymOp`)")
+
+    def get_symop_arrays(self):
+        """
+        Returns the rotations and translations of all the symmetry operations
+        as two arrays of shape (S, 3, 3) and (S, 3).
+        
+        :rtype: :class:`tuple` of :class:`numpy.ndarray`
+        
+        """
+        if self._symop_arrays is None:
+            if self._symop_specs is not None:
+                rotations = [r for r, _t in self._symop_specs]
+                translations = [t for _r, t in self._symop_specs]
+            else:
+                rotations = [[[symop.r[i][j] for j in range(3)] for i in range(3)]
+                             for symop in self.symop_list]
+                translations = [[symop.t[i] for i in range(3)]
+                                for symop in self.symop_list]
+
+            self._symop_arrays = \
+                (np.array(rotations, dtype=float).reshape(-1, 3, 3),
+                 np.array(translations, dtype=float).reshape(-1, 3))
+
+        return self._symop_arrays
 
     def iter_symops(self):
         """
@@ -197,13 +270,4 @@ class SpaceGroup(object):
         :rtype: :class:`atomsites.Atomsites`
         
         """
-        atoms = atomsites.AtomSites()
-
-        for symop in self.symop_list:
-            newatom = symop(atom)
-            try:
-                atoms.append(newatom)
-            except atomsites.AtomSitePositionError:
-                pass
-
-        return atoms
+        return atomsites.AtomSites([atom]).expand(self)
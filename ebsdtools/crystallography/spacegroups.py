@@ -27,12 +27,10 @@ __svnId__ = ""
 # Standard library modules.
 
 # Third party modules.
+import numpy as np
 
 # Local modules.
-from ebsdtools.crystallography.spacegroup import SpaceGroup, SymOp
-
-import mathtools.algebra.vectors as vectors
-import mathtools.rotation.matrices as matrices
+from ebsdtools.crystallography.spacegroup import SpaceGroup
 
 # Globals and constants variables.
 
@@ -46,104 +44,104 @@ HEXAGONAL = "hexagonal"
 CUBIC = "cubic"
 
 ## 64 unique rotation matrices
-ROT_Z_mY_X = matrices.Matrix3D([[ 0.0, 0.0, 1.0], [ 0.0, -1.0, 0.0], [ 1.0, 0.0, 0.0]])
-ROT_Y_mX_mZ = matrices.Matrix3D([[ 0.0, 1.0, 0.0], [-1.0, 0.0, 0.0], [ 0.0, 0.0, -1.0]])
-ROT_XmY_X_mZ = matrices.Matrix3D([[ 1.0, -1.0, 0.0], [ 1.0, 0.0, 0.0], [ 0.0, 0.0, -1.0]])
-ROT_mX_Y_mZ = matrices.Matrix3D([[-1.0, 0.0, 0.0], [ 0.0, 1.0, 0.0], [ 0.0, 0.0, -1.0]])
-ROT_X_mZ_Y = matrices.Matrix3D([[ 1.0, 0.0, 0.0], [ 0.0, 0.0, -1.0], [ 0.0, 1.0, 0.0]])
-ROT_Y_mXY_Z = matrices.Matrix3D([[ 0.0, 1.0, 0.0], [-1.0, 1.0, 0.0], [ 0.0, 0.0, 1.0]])
-ROT_Y_mX_Z = matrices.Matrix3D([[ 0.0, 1.0, 0.0], [-1.0, 0.0, 0.0], [ 0.0, 0.0, 1.0]])
-ROT_XmY_X_Z = matrices.Matrix3D([[ 1.0, -1.0, 0.0], [ 1.0, 0.0, 0.0], [ 0.0, 0.0, 1.0]])
-ROT_mX_mXY_mZ = matrices.Matrix3D([[-1.0, 0.0, 0.0], [-1.0, 1.0, 0.0], [ 0.0, 0.0, -1.0]])
-ROT_Y_Z_X = matrices.Matrix3D([[ 0.0, 1.0, 0.0], [ 0.0, 0.0, 1.0], [ 1.0, 0.0, 0.0]])
-ROT_mY_mZ_X = matrices.Matrix3D([[ 0.0, -1.0, 0.0], [ 0.0, 0.0, -1.0], [ 1.0, 0.0, 0.0]])
-ROT_X_Z_mY = matrices.Matrix3D([[ 1.0, 0.0, 0.0], [ 0.0, 0.0, 1.0], [ 0.0, -1.0, 0.0]])
-ROT_XmY_mY_Z = matrices.Matrix3D([[ 1.0, -1.0, 0.0], [ 0.0, -1.0, 0.0], [ 0.0, 0.0, 1.0]])
-ROT_Y_X_mZ = matrices.Matrix3D([[ 0.0, 1.0, 0.0], [ 1.0, 0.0, 0.0], [ 0.0, 0.0, -1.0]])
-ROT_Y_mZ_X = matrices.Matrix3D([[ 0.0, 1.0, 0.0], [ 0.0, 0.0, -1.0], [ 1.0, 0.0, 0.0]])
-ROT_mXY_Y_Z = matrices.Matrix3D([[-1.0, 1.0, 0.0], [ 0.0, 1.0, 0.0], [ 0.0, 0.0, 1.0]])
-ROT_mX_mY_mZ = matrices.Matrix3D([[-1.0, 0.0, 0.0], [ 0.0, -1.0, 0.0], [ 0.0, 0.0, -1.0]])
-ROT_X_Y_mZ = matrices.Matrix3D([[ 1.0, 0.0, 0.0], [ 0.0, 1.0, 0.0], [ 0.0, 0.0, -1.0]])
-ROT_mXY_mX_Z = matrices.Matrix3D([[-1.0, 1.0, 0.0], [-1.0, 0.0, 0.0], [ 0.0, 0.0, 1.0]])
-ROT_mZ_mY_mX = matrices.Matrix3D([[ 0.0, 0.0, -1.0], [ 0.0, -1.0, 0.0], [-1.0, 0.0, 0.0]])
-ROT_X_mZ_mY = matrices.Matrix3D([[ 1.0, 0.0, 0.0], [ 0.0, 0.0, -1.0], [ 0.0, -1.0, 0.0]])
-ROT_X_Y_Z = matrices.Matrix3D([[ 1.0, 0.0, 0.0], [ 0.0, 1.0, 0.0], [ 0.0, 0.0, 1.0]])
-ROT_mY_mX_mZ = matrices.Matrix3D([[ 0.0, -1.0, 0.0], [-1.0, 0.0, 0.0], [ 0.0, 0.0, -1.0]])
-ROT_mY_X_Z = matrices.Matrix3D([[ 0.0, -1.0, 0.0], [ 1.0, 0.0, 0.0], [ 0.0, 0.0, 1.0]])
-ROT_Z_X_Y = matrices.Matrix3D([[ 0.0, 0.0, 1.0], [ 1.0, 0.0, 0.0], [ 0.0, 1.0, 0.0]])
-ROT_X_XmY_Z = matrices.Matrix3D([[ 1.0, 0.0, 0.0], [ 1.0, -1.0, 0.0], [ 0.0, 0.0, 1.0]])
-ROT_mY_X_mZ = matrices.Matrix3D([[ 0.0, -1.0, 0.0], [ 1.0, 0.0, 0.0], [ 0.0, 0.0, -1.0]])
-ROT_mY_Z_mX = matrices.Matrix3D([[ 0.0, -1.0, 0.0], [ 0.0, 0.0, 1.0], [-1.0, 0.0, 0.0]])
-ROT_mY_Z_X = matrices.Matrix3D([[ 0.0, -1.0, 0.0], [ 0.0, 0.0, 1.0], [ 1.0, 0.0, 0.0]])
-ROT_mX_mZ_mY = matrices.Matrix3D([[-1.0, 0.0, 0.0], [ 0.0, 0.0, -1.0], [ 0.0, -1.0, 0.0]])
-ROT_mX_Z_Y = matrices.Matrix3D([[-1.0, 0.0, 0.0], [ 0.0, 0.0, 1.0], [ 0.0, 1.0, 0.0]])
-ROT_mZ_mX_mY = matrices.Matrix3D([[ 0.0, 0.0, -1.0], [-1.0, 0.0, 0.0], [ 0.0, -1.0, 0.0]])
-ROT_X_XmY_mZ = matrices.Matrix3D([[ 1.0, 0.0, 0.0], [ 1.0, -1.0, 0.0], [ 0.0, 0.0, -1.0]])
-ROT_mY_XmY_mZ = matrices.Matrix3D([[ 0.0, -1.0, 0.0], [ 1.0, -1.0, 0.0], [ 0.0, 0.0, -1.0]])
-ROT_Z_X_mY = matrices.Matrix3D([[ 0.0, 0.0, 1.0], [ 1.0, 0.0, 0.0], [ 0.0, -1.0, 0.0]])
-ROT_mZ_mY_X = matrices.Matrix3D([[ 0.0, 0.0, -1.0], [ 0.0, -1.0, 0.0], [ 1.0, 0.0, 0.0]])
-ROT_X_Z_Y = matrices.Matrix3D([[ 1.0, 0.0, 0.0], [ 0.0, 0.0, 1.0], [ 0.0, 1.0, 0.0]])
-ROT_Z_mX_mY = matrices.Matrix3D([[ 0.0, 0.0, 1.0], [-1.0, 0.0, 0.0], [ 0.0, -1.0, 0.0]])
-ROT_mX_Z_mY = matrices.Matrix3D([[-1.0, 0.0, 0.0], [ 0.0, 0.0, 1.0], [ 0.0, -1.0, 0.0]])
-ROT_X_mY_Z = matrices.Matrix3D([[ 1.0, 0.0, 0.0], [ 0.0, -1.0, 0.0], [ 0.0, 0.0, 1.0]])
-ROT_mY_mX_Z = matrices.Matrix3D([[ 0.0, -1.0, 0.0], [-1.0, 0.0, 0.0], [ 0.0, 0.0, 1.0]])
-ROT_Z_mY_mX = matrices.Matrix3D([[ 0.0, 0.0, 1.0], [ 0.0, -1.0, 0.0], [-1.0, 0.0, 0.0]])
-ROT_mX_mY_Z = matrices.Matrix3D([[-1.0, 0.0, 0.0], [ 0.0, -1.0, 0.0], [ 0.0, 0.0, 1.0]])
-ROT_Z_Y_X = matrices.Matrix3D([[ 0.0, 0.0, 1.0], [ 0.0, 1.0, 0.0], [ 1.0, 0.0, 0.0]])
-ROT_mZ_Y_mX = matrices.Matrix3D([[ 0.0, 0.0, -1.0], [ 0.0, 1.0, 0.0], [-1.0, 0.0, 0.0]])
-ROT_Y_Z_mX = matrices.Matrix3D([[ 0.0, 1.0, 0.0], [ 0.0, 0.0, 1.0], [-1.0, 0.0, 0.0]])
-ROT_mY_XmY_Z = matrices.Matrix3D([[ 0.0, -1.0, 0.0], [ 1.0, -1.0, 0.0], [ 0.0, 0.0, 1.0]])
-ROT_mXY_Y_mZ = matrices.Matrix3D([[-1.0, 1.0, 0.0], [ 0.0, 1.0, 0.0], [ 0.0, 0.0, -1.0]])
-ROT_mZ_mX_Y = matrices.Matrix3D([[ 0.0, 0.0, -1.0], [-1.0, 0.0, 0.0], [ 0.0, 1.0, 0.0]])
-ROT_mX_mZ_Y = matrices.Matrix3D([[-1.0, 0.0, 0.0], [ 0.0, 0.0, -1.0], [ 0.0, 1.0, 0.0]])
-ROT_mX_Y_Z = matrices.Matrix3D([[-1.0, 0.0, 0.0], [ 0.0, 1.0, 0.0], [ 0.0, 0.0, 1.0]])
-ROT_X_mY_mZ = matrices.Matrix3D([[ 1.0, 0.0, 0.0], [ 0.0, -1.0, 0.0], [ 0.0, 0.0, -1.0]])
-ROT_mZ_X_Y = matrices.Matrix3D([[ 0.0, 0.0, -1.0], [ 1.0, 0.0, 0.0], [ 0.0, 1.0, 0.0]])
-ROT_Y_mZ_mX = matrices.Matrix3D([[ 0.0, 1.0, 0.0], [ 0.0, 0.0, -1.0], [-1.0, 0.0, 0.0]])
-ROT_mY_mZ_mX = matrices.Matrix3D([[ 0.0, -1.0, 0.0], [ 0.0, 0.0, -1.0], [-1.0, 0.0, 0.0]])
-ROT_mZ_Y_X = matrices.Matrix3D([[ 0.0, 0.0, -1.0], [ 0.0, 1.0, 0.0], [ 1.0, 0.0, 0.0]])
-ROT_Z_Y_mX = matrices.Matrix3D([[ 0.0, 0.0, 1.0], [ 0.0, 1.0, 0.0], [-1.0, 0.0, 0.0]])
-ROT_mXY_mX_mZ = matrices.Matrix3D([[-1.0, 1.0, 0.0], [-1.0, 0.0, 0.0], [ 0.0, 0.0, -1.0]])
-ROT_XmY_mY_mZ = matrices.Matrix3D([[ 1.0, -1.0, 0.0], [ 0.0, -1.0, 0.0], [ 0.0, 0.0, -1.0]])
-ROT_Z_mX_Y = matrices.Matrix3D([[ 0.0, 0.0, 1.0], [-1.0, 0.0, 0.0], [ 0.0, 1.0, 0.0]])
-ROT_mX_mXY_Z = matrices.Matrix3D([[-1.0, 0.0, 0.0], [-1.0, 1.0, 0.0], [ 0.0, 0.0, 1.0]])
-ROT_Y_mXY_mZ = matrices.Matrix3D([[ 0.0, 1.0, 0.0], [-1.0, 1.0, 0.0], [ 0.0, 0.0, -1.0]])
-ROT_mZ_X_mY = matrices.Matrix3D([[ 0.0, 0.0, -1.0], [ 1.0, 0.0, 0.0], [ 0.0, -1.0, 0.0]])
-ROT_Y_X_Z = matrices.Matrix3D([[ 0.0, 1.0, 0.0], [ 1.0, 0.0, 0.0], [ 0.0, 0.0, 1.0]])
+ROT_Z_mY_X = (( 0.0, 0.0, 1.0), ( 0.0, -1.0, 0.0), ( 1.0, 0.0, 0.0))
+ROT_Y_mX_mZ = (( 0.0, 1.0, 0.0), (-1.0, 0.0, 0.0), ( 0.0, 0.0, -1.0))
+ROT_XmY_X_mZ = (( 1.0, -1.0, 0.0), ( 1.0, 0.0, 0.0), ( 0.0, 0.0, -1.0))
+ROT_mX_Y_mZ = ((-1.0, 0.0, 0.0), ( 0.0, 1.0, 0.0), ( 0.0, 0.0, -1.0))
+ROT_X_mZ_Y = (( 1.0, 0.0, 0.0), ( 0.0, 0.0, -1.0), ( 0.0, 1.0, 0.0))
+ROT_Y_mXY_Z = (( 0.0, 1.0, 0.0), (-1.0, 1.0, 0.0), ( 0.0, 0.0, 1.0))
+ROT_Y_mX_Z = (( 0.0, 1.0, 0.0), (-1.0, 0.0, 0.0), ( 0.0, 0.0, 1.0))
+ROT_XmY_X_Z = (( 1.0, -1.0, 0.0), ( 1.0, 0.0, 0.0), ( 0.0, 0.0, 1.0))
+ROT_mX_mXY_mZ = ((-1.0, 0.0, 0.0), (-1.0, 1.0, 0.0), ( 0.0, 0.0, -1.0))
+ROT_Y_Z_X = (( 0.0, 1.0, 0.0), ( 0.0, 0.0, 1.0), ( 1.0, 0.0, 0.0))
+ROT_mY_mZ_X = (( 0.0, -1.0, 0.0), ( 0.0, 0.0, -1.0), ( 1.0, 0.0, 0.0))
+ROT_X_Z_mY = (( 1.0, 0.0, 0.0), ( 0.0, 0.0, 1.0), ( 0.0, -1.0, 0.0))
+ROT_XmY_mY_Z = (( 1.0, -1.0, 0.0), ( 0.0, -1.0, 0.0), ( 0.0, 0.0, 1.0))
+ROT_Y_X_mZ = (( 0.0, 1.0, 0.0), ( 1.0, 0.0, 0.0), ( 0.0, 0.0, -1.0))
+ROT_Y_mZ_X = (( 0.0, 1.0, 0.0), ( 0.0, 0.0, -1.0), ( 1.0, 0.0, 0.0))
+ROT_mXY_Y_Z = ((-1.0, 1.0, 0.0), ( 0.0, 1.0, 0.0), ( 0.0, 0.0, 1.0))
+ROT_mX_mY_mZ = ((-1.0, 0.0, 0.0), ( 0.0, -1.0, 0.0), ( 0.0, 0.0, -1.0))
+ROT_X_Y_mZ = (( 1.0, 0.0, 0.0), ( 0.0, 1.0, 0.0), ( 0.0, 0.0, -1.0))
+ROT_mXY_mX_Z = ((-1.0, 1.0, 0.0), (-1.0, 0.0, 0.0), ( 0.0, 0.0, 1.0))
+ROT_mZ_mY_mX = (( 0.0, 0.0, -1.0), ( 0.0, -1.0, 0.0), (-1.0, 0.0, 0.0))
+ROT_X_mZ_mY = (( 1.0, 0.0, 0.0), ( 0.0, 0.0, -1.0), ( 0.0, -1.0, 0.0))
+ROT_X_Y_Z = (( 1.0, 0.0, 0.0), ( 0.0, 1.0, 0.0), ( 0.0, 0.0, 1.0))
+ROT_mY_mX_mZ = (( 0.0, -1.0, 0.0), (-1.0, 0.0, 0.0), ( 0.0, 0.0, -1.0))
+ROT_mY_X_Z = (( 0.0, -1.0, 0.0), ( 1.0, 0.0, 0.0), ( 0.0, 0.0, 1.0))
+ROT_Z_X_Y = (( 0.0, 0.0, 1.0), ( 1.0, 0.0, 0.0), ( 0.0, 1.0, 0.0))
+ROT_X_XmY_Z = (( 1.0, 0.0, 0.0), ( 1.0, -1.0, 0.0), ( 0.0, 0.0, 1.0))
+ROT_mY_X_mZ = (( 0.0, -1.0, 0.0), ( 1.0, 0.0, 0.0), ( 0.0, 0.0, -1.0))
+ROT_mY_Z_mX = (( 0.0, -1.0, 0.0), ( 0.0, 0.0, 1.0), (-1.0, 0.0, 0.0))
+ROT_mY_Z_X = (( 0.0, -1.0, 0.0), ( 0.0, 0.0, 1.0), ( 1.0, 0.0, 0.0))
+ROT_mX_mZ_mY = ((-1.0, 0.0, 0.0), ( 0.0, 0.0, -1.0), ( 0.0, -1.0, 0.0))
+ROT_mX_Z_Y = ((-1.0, 0.0, 0.0), ( 0.0, 0.0, 1.0), ( 0.0, 1.0, 0.0))
+ROT_mZ_mX_mY = (( 0.0, 0.0, -1.0), (-1.0, 0.0, 0.0), ( 0.0, -1.0, 0.0))
+ROT_X_XmY_mZ = (( 1.0, 0.0, 0.0), ( 1.0, -1.0, 0.0), ( 0.0, 0.0, -1.0))
+ROT_mY_XmY_mZ = (( 0.0, -1.0, 0.0), ( 1.0, -1.0, 0.0), ( 0.0, 0.0, -1.0))
+ROT_Z_X_mY = (( 0.0, 0.0, 1.0), ( 1.0, 0.0, 0.0), ( 0.0, -1.0, 0.0))
+ROT_mZ_mY_X = (( 0.0, 0.0, -1.0), ( 0.0, -1.0, 0.0), ( 1.0, 0.0, 0.0))
+ROT_X_Z_Y = (( 1.0, 0.0, 0.0), ( 0.0, 0.0, 1.0), ( 0.0, 1.0, 0.0))
+ROT_Z_mX_mY = (( 0.0, 0.0, 1.0), (-1.0, 0.0, 0.0), ( 0.0, -1.0, 0.0))
+ROT_mX_Z_mY = ((-1.0, 0.0, 0.0), ( 0.0, 0.0, 1.0), ( 0.0, -1.0, 0.0))
+ROT_X_mY_Z = (( 1.0, 0.0, 0.0), ( 0.0, -1.0, 0.0), ( 0.0, 0.0, 1.0))
+ROT_mY_mX_Z = (( 0.0, -1.0, 0.0), (-1.0, 0.0, 0.0), ( 0.0, 0.0, 1.0))
+ROT_Z_mY_mX = (( 0.0, 0.0, 1.0), ( 0.0, -1.0, 0.0), (-1.0, 0.0, 0.0))
+ROT_mX_mY_Z = ((-1.0, 0.0, 0.0), ( 0.0, -1.0, 0.0), ( 0.0, 0.0, 1.0))
+ROT_Z_Y_X = (( 0.0, 0.0, 1.0), ( 0.0, 1.0, 0.0), ( 1.0, 0.0, 0.0))
+ROT_mZ_Y_mX = (( 0.0, 0.0, -1.0), ( 0.0, 1.0, 0.0), (-1.0, 0.0, 0.0))
+ROT_Y_Z_mX = (( 0.0, 1.0, 0.0), ( 0.0, 0.0, 1.0), (-1.0, 0.0, 0.0))
+ROT_mY_XmY_Z = (( 0.0, -1.0, 0.0), ( 1.0, -1.0, 0.0), ( 0.0, 0.0, 1.0))
+ROT_mXY_Y_mZ = ((-1.0, 1.0, 0.0), ( 0.0, 1.0, 0.0), ( 0.0, 0.0, -1.0))
+ROT_mZ_mX_Y = (( 0.0, 0.0, -1.0), (-1.0, 0.0, 0.0), ( 0.0, 1.0, 0.0))
+ROT_mX_mZ_Y = ((-1.0, 0.0, 0.0), ( 0.0, 0.0, -1.0), ( 0.0, 1.0, 0.0))
+ROT_mX_Y_Z = ((-1.0, 0.0, 0.0), ( 0.0, 1.0, 0.0), ( 0.0, 0.0, 1.0))
+ROT_X_mY_mZ = (( 1.0, 0.0, 0.0), ( 0.0, -1.0, 0.0), ( 0.0, 0.0, -1.0))
+ROT_mZ_X_Y = (( 0.0, 0.0, -1.0), ( 1.0, 0.0, 0.0), ( 0.0, 1.0, 0.0))
+ROT_Y_mZ_mX = (( 0.0, 1.0, 0.0), ( 0.0, 0.0, -1.0), (-1.0, 0.0, 0.0))
+ROT_mY_mZ_mX = (( 0.0, -1.0, 0.0), ( 0.0, 0.0, -1.0), (-1.0, 0.0, 0.0))
+ROT_mZ_Y_X = (( 0.0, 0.0, -1.0), ( 0.0, 1.0, 0.0), ( 1.0, 0.0, 0.0))
+ROT_Z_Y_mX = (( 0.0, 0.0, 1.0), ( 0.0, 1.0, 0.0), (-1.0, 0.0, 0.0))
+ROT_mXY_mX_mZ = ((-1.0, 1.0, 0.0), (-1.0, 0.0, 0.0), ( 0.0, 0.0, -1.0))
+ROT_XmY_mY_mZ = (( 1.0, -1.0, 0.0), ( 0.0, -1.0, 0.0), ( 0.0, 0.0, -1.0))
+ROT_Z_mX_Y = (( 0.0, 0.0, 1.0), (-1.0, 0.0, 0.0), ( 0.0, 1.0, 0.0))
+ROT_mX_mXY_Z = ((-1.0, 0.0, 0.0), (-1.0, 1.0, 0.0), ( 0.0, 0.0, 1.0))
+ROT_Y_mXY_mZ = (( 0.0, 1.0, 0.0), (-1.0, 1.0, 0.0), ( 0.0, 0.0, -1.0))
+ROT_mZ_X_mY = (( 0.0, 0.0, -1.0), ( 1.0, 0.0, 0.0), ( 0.0, -1.0, 0.0))
+ROT_Y_X_Z = (( 0.0, 1.0, 0.0), ( 1.0, 0.0, 0.0), ( 0.0, 0.0, 1.0))
 
 ## 32 unique translation vectors
-TR_0_0_34 = vectors.Vector3D([     0.0, 0.0, 3.0 / 4.0 ])
-TR_12_0_34 = vectors.Vector3D([ 1.0 / 2.0, 0.0, 3.0 / 4.0 ])
-TR_0_0_56 = vectors.Vector3D([     0.0, 0.0, 5.0 / 6.0 ])
-TR_12_0_12 = vectors.Vector3D([ 1.0 / 2.0, 0.0, 1.0 / 2.0 ])
-TR_0_12_12 = vectors.Vector3D([     0.0, 1.0 / 2.0, 1.0 / 2.0 ])
-TR_12_0_14 = vectors.Vector3D([ 1.0 / 2.0, 0.0, 1.0 / 4.0 ])
-TR_0_12_14 = vectors.Vector3D([     0.0, 1.0 / 2.0, 1.0 / 4.0 ])
-TR_14_14_14 = vectors.Vector3D([ 1.0 / 4.0, 1.0 / 4.0, 1.0 / 4.0 ])
-TR_0_12_34 = vectors.Vector3D([     0.0, 1.0 / 2.0, 3.0 / 4.0 ])
-TR_34_14_14 = vectors.Vector3D([ 3.0 / 4.0, 1.0 / 4.0, 1.0 / 4.0 ])
-TR_0_0_0 = vectors.Vector3D([     0.0, 0.0, 0.0 ])
-TR_23_13_56 = vectors.Vector3D([ 2.0 / 3.0, 1.0 / 3.0, 5.0 / 6.0 ])
-TR_14_14_34 = vectors.Vector3D([ 1.0 / 4.0, 1.0 / 4.0, 3.0 / 4.0 ])
-TR_12_12_0 = vectors.Vector3D([ 1.0 / 2.0, 1.0 / 2.0, 0.0 ])
-TR_23_13_13 = vectors.Vector3D([ 2.0 / 3.0, 1.0 / 3.0, 1.0 / 3.0 ])
-TR_13_23_23 = vectors.Vector3D([ 1.0 / 3.0, 2.0 / 3.0, 2.0 / 3.0 ])
-TR_12_12_12 = vectors.Vector3D([ 1.0 / 2.0, 1.0 / 2.0, 1.0 / 2.0 ])
-TR_12_12_14 = vectors.Vector3D([ 1.0 / 2.0, 1.0 / 2.0, 1.0 / 4.0 ])
-TR_14_34_14 = vectors.Vector3D([ 1.0 / 4.0, 3.0 / 4.0, 1.0 / 4.0 ])
-TR_12_12_34 = vectors.Vector3D([ 1.0 / 2.0, 1.0 / 2.0, 3.0 / 4.0 ])
-TR_0_0_23 = vectors.Vector3D([     0.0, 0.0, 2.0 / 3.0 ])
-TR_0_12_0 = vectors.Vector3D([     0.0, 1.0 / 2.0, 0.0 ])
-TR_14_34_34 = vectors.Vector3D([ 1.0 / 4.0, 3.0 / 4.0, 3.0 / 4.0 ])
-TR_34_34_14 = vectors.Vector3D([ 3.0 / 4.0, 3.0 / 4.0, 1.0 / 4.0 ])
-TR_12_0_0 = vectors.Vector3D([ 1.0 / 2.0, 0.0, 0.0 ])
-TR_34_34_34 = vectors.Vector3D([ 3.0 / 4.0, 3.0 / 4.0, 3.0 / 4.0 ])
-TR_0_0_13 = vectors.Vector3D([     0.0, 0.0, 1.0 / 3.0 ])
-TR_0_0_12 = vectors.Vector3D([     0.0, 0.0, 1.0 / 2.0 ])
-TR_13_23_16 = vectors.Vector3D([ 1.0 / 3.0, 2.0 / 3.0, 1.0 / 6.0 ])
-TR_0_0_14 = vectors.Vector3D([     0.0, 0.0, 1.0 / 4.0 ])
-TR_0_0_16 = vectors.Vector3D([     0.0, 0.0, 1.0 / 6.0 ])
-TR_34_14_34 = vectors.Vector3D([ 3.0 / 4.0, 1.0 / 4.0, 3.0 / 4.0 ])
+TR_0_0_34 = (     0.0, 0.0, 3.0 / 4.0 )
+TR_12_0_34 = ( 1.0 / 2.0, 0.0, 3.0 / 4.0 )
+TR_0_0_56 = (     0.0, 0.0, 5.0 / 6.0 )
+TR_12_0_12 = ( 1.0 / 2.0, 0.0, 1.0 / 2.0 )
+TR_0_12_12 = (     0.0, 1.0 / 2.0, 1.0 / 2.0 )
+TR_12_0_14 = ( 1.0 / 2.0, 0.0, 1.0 / 4.0 )
+TR_0_12_14 = (     0.0, 1.0 / 2.0, 1.0 / 4.0 )
+TR_14_14_14 = ( 1.0 / 4.0, 1.0 / 4.0, 1.0 / 4.0 )
+TR_0_12_34 = (     0.0, 1.0 / 2.0, 3.0 / 4.0 )
+TR_34_14_14 = ( 3.0 / 4.0, 1.0 / 4.0, 1.0 / 4.0 )
+TR_0_0_0 = (     0.0, 0.0, 0.0 )
+TR_23_13_56 = ( 2.0 / 3.0, 1.0 / 3.0, 5.0 / 6.0 )
+TR_14_14_34 = ( 1.0 / 4.0, 1.0 / 4.0, 3.0 / 4.0 )
+TR_12_12_0 = ( 1.0 / 2.0, 1.0 / 2.0, 0.0 )
+TR_23_13_13 = ( 2.0 / 3.0, 1.0 / 3.0, 1.0 / 3.0 )
+TR_13_23_23 = ( 1.0 / 3.0, 2.0 / 3.0, 2.0 / 3.0 )
+TR_12_12_12 = ( 1.0 / 2.0, 1.0 / 2.0, 1.0 / 2.0 )
+TR_12_12_14 = ( 1.0 / 2.0, 1.0 / 2.0, 1.0 / 4.0 )
+TR_14_34_14 = ( 1.0 / 4.0, 3.0 / 4.0, 1.0 / 4.0 )
+TR_12_12_34 = ( 1.0 / 2.0, 1.0 / 2.0, 3.0 / 4.0 )
+TR_0_0_23 = (     0.0, 0.0, 2.0 / 3.0 )
+TR_0_12_0 = (     0.0, 1.0 / 2.0, 0.0 )
+TR_14_34_34 = ( 1.0 / 4.0, 3.0 / 4.0, 3.0 / 4.0 )
+TR_34_34_14 = ( 3.0 / 4.0, 3.0 / 4.0, 1.0 / 4.0 )
+TR_12_0_0 = ( 1.0 / 2.0, 0.0, 0.0 )
+TR_34_34_34 = ( 3.0 / 4.0, 3.0 / 4.0, 3.0 / 4.0 )
+TR_0_0_13 = (     0.0, 0.0, 1.0 / 3.0 )
+TR_0_0_12 = (     0.0, 0.0, 1.0 / 2.0 )
+TR_13_23_16 = ( 1.0 / 3.0, 2.0 / 3.0, 1.0 / 6.0 )
+TR_0_0_14 = (     0.0, 0.0, 1.0 / 4.0 )
+TR_0_0_16 = (     0.0, 0.0, 1.0 / 6.0 )
+TR_34_14_34 = ( 3.0 / 4.0, 1.0 / 4.0, 3.0 / 4.0 )
 
 ## spacegroup definitions
 sg1 = SpaceGroup(
@@ -154,8 +152,8 @@ sg1 = SpaceGroup(
     point_group_name="PG1",
     crystal_system=TRICLINIC,
     pdb_name="P 1",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0)])
 
 sg2 = SpaceGroup(
     number=2,
@@ -165,9 +163,9 @@ sg2 = SpaceGroup(
     point_group_name="PG1bar",
     crystal_system=TRICLINIC,
     pdb_name="P -1",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_mZ, TR_0_0_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_mZ, TR_0_0_0)])
 
 sg3 = SpaceGroup(
     number=3,
@@ -177,9 +175,9 @@ sg3 = SpaceGroup(
     point_group_name="PG2",
     crystal_system=MONOCLINIC,
     pdb_name="P 1 2 1",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_Y_mZ, TR_0_0_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_Y_mZ, TR_0_0_0)])
 
 sg4 = SpaceGroup(
     number=4,
@@ -189,9 +187,9 @@ sg4 = SpaceGroup(
     point_group_name="PG2",
     crystal_system=MONOCLINIC,
     pdb_name="P 1 21 1",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_Y_mZ, TR_0_12_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_Y_mZ, TR_0_12_0)])
 
 sg5 = SpaceGroup(
     number=5,
@@ -201,11 +199,11 @@ sg5 = SpaceGroup(
     point_group_name="PG2",
     crystal_system=MONOCLINIC,
     pdb_name="C 1 2 1",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_Y_mZ, TR_0_0_0),
-        SymOp(ROT_X_Y_Z, TR_12_12_0),
-        SymOp(ROT_mX_Y_mZ, TR_12_12_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_Y_mZ, TR_0_0_0),
+        (ROT_X_Y_Z, TR_12_12_0),
+        (ROT_mX_Y_mZ, TR_12_12_0)])
 
 sg6 = SpaceGroup(
     number=6,
@@ -215,9 +213,9 @@ sg6 = SpaceGroup(
     point_group_name="PGm",
     crystal_system=MONOCLINIC,
     pdb_name="P 1 m 1",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_X_mY_Z, TR_0_0_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_X_mY_Z, TR_0_0_0)])
 
 sg7 = SpaceGroup(
     number=7,
@@ -227,9 +225,9 @@ sg7 = SpaceGroup(
     point_group_name="PGm",
     crystal_system=MONOCLINIC,
     pdb_name="P 1 c 1",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_X_mY_Z, TR_0_0_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_X_mY_Z, TR_0_0_12)])
 
 sg8 = SpaceGroup(
     number=8,
@@ -239,11 +237,11 @@ sg8 = SpaceGroup(
     point_group_name="PGm",
     crystal_system=MONOCLINIC,
     pdb_name="C 1 m 1",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_X_mY_Z, TR_0_0_0),
-        SymOp(ROT_X_Y_Z, TR_12_12_0),
-        SymOp(ROT_X_mY_Z, TR_12_12_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_X_mY_Z, TR_0_0_0),
+        (ROT_X_Y_Z, TR_12_12_0),
+        (ROT_X_mY_Z, TR_12_12_0)])
 
 sg9 = SpaceGroup(
     number=9,
@@ -253,11 +251,11 @@ sg9 = SpaceGroup(
     point_group_name="PGm",
     crystal_system=MONOCLINIC,
     pdb_name="C 1 c 1",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_X_mY_Z, TR_0_0_12),
-        SymOp(ROT_X_Y_Z, TR_12_12_0),
-        SymOp(ROT_X_mY_Z, TR_12_12_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_X_mY_Z, TR_0_0_12),
+        (ROT_X_Y_Z, TR_12_12_0),
+        (ROT_X_mY_Z, TR_12_12_12)])
 
 sg10 = SpaceGroup(
     number=10,
@@ -267,11 +265,11 @@ sg10 = SpaceGroup(
     point_group_name="PG2/m",
     crystal_system=MONOCLINIC,
     pdb_name="P 1 2/m 1",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_X_mY_Z, TR_0_0_0),
-        SymOp(ROT_mX_Y_mZ, TR_0_0_0),
-        SymOp(ROT_mX_mY_mZ, TR_0_0_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_X_mY_Z, TR_0_0_0),
+        (ROT_mX_Y_mZ, TR_0_0_0),
+        (ROT_mX_mY_mZ, TR_0_0_0)])
 
 sg11 = SpaceGroup(
     number=11,
@@ -281,11 +279,11 @@ sg11 = SpaceGroup(
     point_group_name="PG2/m",
     crystal_system=MONOCLINIC,
     pdb_name="P 1 21/m 1",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_Y_mZ, TR_0_12_0),
-        SymOp(ROT_mX_mY_mZ, TR_0_0_0),
-        SymOp(ROT_X_mY_Z, TR_0_12_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_Y_mZ, TR_0_12_0),
+        (ROT_mX_mY_mZ, TR_0_0_0),
+        (ROT_X_mY_Z, TR_0_12_0)])
 
 sg12 = SpaceGroup(
     number=12,
@@ -295,15 +293,15 @@ sg12 = SpaceGroup(
     point_group_name="PG2/m",
     crystal_system=MONOCLINIC,
     pdb_name="C 1 2/m 1",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_X_mY_Z, TR_0_0_0),
-        SymOp(ROT_mX_Y_mZ, TR_0_0_0),
-        SymOp(ROT_mX_mY_mZ, TR_0_0_0),
-        SymOp(ROT_X_Y_Z, TR_12_12_0),
-        SymOp(ROT_X_mY_Z, TR_12_12_0),
-        SymOp(ROT_mX_Y_mZ, TR_12_12_0),
-        SymOp(ROT_mX_mY_mZ, TR_12_12_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_X_mY_Z, TR_0_0_0),
+        (ROT_mX_Y_mZ, TR_0_0_0),
+        (ROT_mX_mY_mZ, TR_0_0_0),
+        (ROT_X_Y_Z, TR_12_12_0),
+        (ROT_X_mY_Z, TR_12_12_0),
+        (ROT_mX_Y_mZ, TR_12_12_0),
+        (ROT_mX_mY_mZ, TR_12_12_0)])
 
 sg13 = SpaceGroup(
     number=13,
@@ -313,11 +311,11 @@ sg13 = SpaceGroup(
     point_group_name="PG2/m",
     crystal_system=MONOCLINIC,
     pdb_name="P 1 2/c 1",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_Y_mZ, TR_0_0_12),
-        SymOp(ROT_mX_mY_mZ, TR_0_0_0),
-        SymOp(ROT_X_mY_Z, TR_0_0_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_Y_mZ, TR_0_0_12),
+        (ROT_mX_mY_mZ, TR_0_0_0),
+        (ROT_X_mY_Z, TR_0_0_12)])
 
 sg14 = SpaceGroup(
     number=14,
@@ -327,11 +325,11 @@ sg14 = SpaceGroup(
     point_group_name="PG2/m",
     crystal_system=MONOCLINIC,
     pdb_name="P 1 21/c 1",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_mZ, TR_0_0_0),
-        SymOp(ROT_mX_Y_mZ, TR_0_12_12),
-        SymOp(ROT_X_mY_Z, TR_0_12_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_mZ, TR_0_0_0),
+        (ROT_mX_Y_mZ, TR_0_12_12),
+        (ROT_X_mY_Z, TR_0_12_12)])
 
 sg15 = SpaceGroup(
     number=15,
@@ -341,15 +339,15 @@ sg15 = SpaceGroup(
     point_group_name="PG2/m",
     crystal_system=MONOCLINIC,
     pdb_name="C 1 2/c 1",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_Y_mZ, TR_0_0_12),
-        SymOp(ROT_mX_mY_mZ, TR_0_0_0),
-        SymOp(ROT_X_mY_Z, TR_0_0_12),
-        SymOp(ROT_X_Y_Z, TR_12_12_0),
-        SymOp(ROT_mX_Y_mZ, TR_12_12_12),
-        SymOp(ROT_mX_mY_mZ, TR_12_12_0),
-        SymOp(ROT_X_mY_Z, TR_12_12_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_Y_mZ, TR_0_0_12),
+        (ROT_mX_mY_mZ, TR_0_0_0),
+        (ROT_X_mY_Z, TR_0_0_12),
+        (ROT_X_Y_Z, TR_12_12_0),
+        (ROT_mX_Y_mZ, TR_12_12_12),
+        (ROT_mX_mY_mZ, TR_12_12_0),
+        (ROT_X_mY_Z, TR_12_12_12)])
 
 sg16 = SpaceGroup(
     number=16,
@@ -359,11 +357,11 @@ sg16 = SpaceGroup(
     point_group_name="PG222",
     crystal_system=ORTHORHOMBIC,
     pdb_name="P 2 2 2",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mX_Y_mZ, TR_0_0_0),
-        SymOp(ROT_X_mY_mZ, TR_0_0_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mX_Y_mZ, TR_0_0_0),
+        (ROT_X_mY_mZ, TR_0_0_0)])
 
 sg17 = SpaceGroup(
     number=17,
@@ -373,11 +371,11 @@ sg17 = SpaceGroup(
     point_group_name="PG222",
     crystal_system=ORTHORHOMBIC,
     pdb_name="P 2 2 21",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_12),
-        SymOp(ROT_mX_Y_mZ, TR_0_0_12),
-        SymOp(ROT_X_mY_mZ, TR_0_0_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_12),
+        (ROT_mX_Y_mZ, TR_0_0_12),
+        (ROT_X_mY_mZ, TR_0_0_0)])
 
 sg18 = SpaceGroup(
     number=18,
@@ -387,11 +385,11 @@ sg18 = SpaceGroup(
     point_group_name="PG222",
     crystal_system=ORTHORHOMBIC,
     pdb_name="P 21 21 2",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mX_Y_mZ, TR_12_12_0),
-        SymOp(ROT_X_mY_mZ, TR_12_12_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mX_Y_mZ, TR_12_12_0),
+        (ROT_X_mY_mZ, TR_12_12_0)])
 
 sg19 = SpaceGroup(
     number=19,
@@ -401,11 +399,11 @@ sg19 = SpaceGroup(
     point_group_name="PG222",
     crystal_system=ORTHORHOMBIC,
     pdb_name="P 21 21 21",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_12_0_12),
-        SymOp(ROT_mX_Y_mZ, TR_0_12_12),
-        SymOp(ROT_X_mY_mZ, TR_12_12_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_12_0_12),
+        (ROT_mX_Y_mZ, TR_0_12_12),
+        (ROT_X_mY_mZ, TR_12_12_0)])
 
 sg20 = SpaceGroup(
     number=20,
@@ -415,15 +413,15 @@ sg20 = SpaceGroup(
     point_group_name="PG222",
     crystal_system=ORTHORHOMBIC,
     pdb_name="C 2 2 21",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_12),
-        SymOp(ROT_mX_Y_mZ, TR_0_0_12),
-        SymOp(ROT_X_mY_mZ, TR_0_0_0),
-        SymOp(ROT_X_Y_Z, TR_12_12_0),
-        SymOp(ROT_mX_mY_Z, TR_12_12_12),
-        SymOp(ROT_mX_Y_mZ, TR_12_12_12),
-        SymOp(ROT_X_mY_mZ, TR_12_12_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_12),
+        (ROT_mX_Y_mZ, TR_0_0_12),
+        (ROT_X_mY_mZ, TR_0_0_0),
+        (ROT_X_Y_Z, TR_12_12_0),
+        (ROT_mX_mY_Z, TR_12_12_12),
+        (ROT_mX_Y_mZ, TR_12_12_12),
+        (ROT_X_mY_mZ, TR_12_12_0)])
 
 sg21 = SpaceGroup(
     number=21,
@@ -433,15 +431,15 @@ sg21 = SpaceGroup(
     point_group_name="PG222",
     crystal_system=ORTHORHOMBIC,
     pdb_name="C 2 2 2",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mX_Y_mZ, TR_0_0_0),
-        SymOp(ROT_X_mY_mZ, TR_0_0_0),
-        SymOp(ROT_X_Y_Z, TR_12_12_0),
-        SymOp(ROT_mX_mY_Z, TR_12_12_0),
-        SymOp(ROT_mX_Y_mZ, TR_12_12_0),
-        SymOp(ROT_X_mY_mZ, TR_12_12_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mX_Y_mZ, TR_0_0_0),
+        (ROT_X_mY_mZ, TR_0_0_0),
+        (ROT_X_Y_Z, TR_12_12_0),
+        (ROT_mX_mY_Z, TR_12_12_0),
+        (ROT_mX_Y_mZ, TR_12_12_0),
+        (ROT_X_mY_mZ, TR_12_12_0)])
 
 sg22 = SpaceGroup(
     number=22,
@@ -451,23 +449,23 @@ sg22 = SpaceGroup(
     point_group_name="PG222",
     crystal_system=ORTHORHOMBIC,
     pdb_name="F 2 2 2",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mX_Y_mZ, TR_0_0_0),
-        SymOp(ROT_X_mY_mZ, TR_0_0_0),
-        SymOp(ROT_X_Y_Z, TR_0_12_12),
-        SymOp(ROT_mX_mY_Z, TR_0_12_12),
-        SymOp(ROT_mX_Y_mZ, TR_0_12_12),
-        SymOp(ROT_X_mY_mZ, TR_0_12_12),
-        SymOp(ROT_X_Y_Z, TR_12_0_12),
-        SymOp(ROT_mX_mY_Z, TR_12_0_12),
-        SymOp(ROT_mX_Y_mZ, TR_12_0_12),
-        SymOp(ROT_X_mY_mZ, TR_12_0_12),
-        SymOp(ROT_X_Y_Z, TR_12_12_0),
-        SymOp(ROT_mX_mY_Z, TR_12_12_0),
-        SymOp(ROT_mX_Y_mZ, TR_12_12_0),
-        SymOp(ROT_X_mY_mZ, TR_12_12_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mX_Y_mZ, TR_0_0_0),
+        (ROT_X_mY_mZ, TR_0_0_0),
+        (ROT_X_Y_Z, TR_0_12_12),
+        (ROT_mX_mY_Z, TR_0_12_12),
+        (ROT_mX_Y_mZ, TR_0_12_12),
+        (ROT_X_mY_mZ, TR_0_12_12),
+        (ROT_X_Y_Z, TR_12_0_12),
+        (ROT_mX_mY_Z, TR_12_0_12),
+        (ROT_mX_Y_mZ, TR_12_0_12),
+        (ROT_X_mY_mZ, TR_12_0_12),
+        (ROT_X_Y_Z, TR_12_12_0),
+        (ROT_mX_mY_Z, TR_12_12_0),
+        (ROT_mX_Y_mZ, TR_12_12_0),
+        (ROT_X_mY_mZ, TR_12_12_0)])
 
 sg23 = SpaceGroup(
     number=23,
@@ -477,15 +475,15 @@ sg23 = SpaceGroup(
     point_group_name="PG222",
     crystal_system=ORTHORHOMBIC,
     pdb_name="I 2 2 2",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_X_mY_mZ, TR_0_0_0),
-        SymOp(ROT_mX_Y_mZ, TR_0_0_0),
-        SymOp(ROT_X_Y_Z, TR_12_12_12),
-        SymOp(ROT_mX_mY_Z, TR_12_12_12),
-        SymOp(ROT_X_mY_mZ, TR_12_12_12),
-        SymOp(ROT_mX_Y_mZ, TR_12_12_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_X_mY_mZ, TR_0_0_0),
+        (ROT_mX_Y_mZ, TR_0_0_0),
+        (ROT_X_Y_Z, TR_12_12_12),
+        (ROT_mX_mY_Z, TR_12_12_12),
+        (ROT_X_mY_mZ, TR_12_12_12),
+        (ROT_mX_Y_mZ, TR_12_12_12)])
 
 sg24 = SpaceGroup(
     number=24,
@@ -495,15 +493,15 @@ sg24 = SpaceGroup(
     point_group_name="PG222",
     crystal_system=ORTHORHOMBIC,
     pdb_name="I 21 21 21",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_12_0_12),
-        SymOp(ROT_mX_Y_mZ, TR_0_12_12),
-        SymOp(ROT_X_mY_mZ, TR_12_12_0),
-        SymOp(ROT_X_Y_Z, TR_12_12_12),
-        SymOp(ROT_mX_mY_Z, TR_0_12_0),
-        SymOp(ROT_mX_Y_mZ, TR_12_0_0),
-        SymOp(ROT_X_mY_mZ, TR_0_0_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_12_0_12),
+        (ROT_mX_Y_mZ, TR_0_12_12),
+        (ROT_X_mY_mZ, TR_12_12_0),
+        (ROT_X_Y_Z, TR_12_12_12),
+        (ROT_mX_mY_Z, TR_0_12_0),
+        (ROT_mX_Y_mZ, TR_12_0_0),
+        (ROT_X_mY_mZ, TR_0_0_12)])
 
 sg25 = SpaceGroup(
     number=25,
@@ -513,11 +511,11 @@ sg25 = SpaceGroup(
     point_group_name="PGmm2",
     crystal_system=ORTHORHOMBIC,
     pdb_name="P m m 2",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_X_mY_Z, TR_0_0_0),
-        SymOp(ROT_mX_Y_Z, TR_0_0_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_X_mY_Z, TR_0_0_0),
+        (ROT_mX_Y_Z, TR_0_0_0)])
 
 sg26 = SpaceGroup(
     number=26,
@@ -527,11 +525,11 @@ sg26 = SpaceGroup(
     point_group_name="PGmm2",
     crystal_system=ORTHORHOMBIC,
     pdb_name="P m c 21",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_12),
-        SymOp(ROT_X_mY_Z, TR_0_0_12),
-        SymOp(ROT_mX_Y_Z, TR_0_0_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_12),
+        (ROT_X_mY_Z, TR_0_0_12),
+        (ROT_mX_Y_Z, TR_0_0_0)])
 
 sg27 = SpaceGroup(
     number=27,
@@ -541,11 +539,11 @@ sg27 = SpaceGroup(
     point_group_name="PGmm2",
     crystal_system=ORTHORHOMBIC,
     pdb_name="P c c 2",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_X_mY_Z, TR_0_0_12),
-        SymOp(ROT_mX_Y_Z, TR_0_0_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_X_mY_Z, TR_0_0_12),
+        (ROT_mX_Y_Z, TR_0_0_12)])
 
 sg28 = SpaceGroup(
     number=28,
@@ -555,11 +553,11 @@ sg28 = SpaceGroup(
     point_group_name="PGmm2",
     crystal_system=ORTHORHOMBIC,
     pdb_name="P m a 2",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_X_mY_Z, TR_12_0_0),
-        SymOp(ROT_mX_Y_Z, TR_12_0_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_X_mY_Z, TR_12_0_0),
+        (ROT_mX_Y_Z, TR_12_0_0)])
 
 sg29 = SpaceGroup(
     number=29,
@@ -569,11 +567,11 @@ sg29 = SpaceGroup(
     point_group_name="PGmm2",
     crystal_system=ORTHORHOMBIC,
     pdb_name="P c a 21",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_12),
-        SymOp(ROT_X_mY_Z, TR_12_0_0),
-        SymOp(ROT_mX_Y_Z, TR_12_0_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_12),
+        (ROT_X_mY_Z, TR_12_0_0),
+        (ROT_mX_Y_Z, TR_12_0_12)])
 
 sg30 = SpaceGroup(
     number=30,
@@ -583,11 +581,11 @@ sg30 = SpaceGroup(
     point_group_name="PGmm2",
     crystal_system=ORTHORHOMBIC,
     pdb_name="P n c 2",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_X_mY_Z, TR_0_12_12),
-        SymOp(ROT_mX_Y_Z, TR_0_12_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_X_mY_Z, TR_0_12_12),
+        (ROT_mX_Y_Z, TR_0_12_12)])
 
 sg31 = SpaceGroup(
     number=31,
@@ -597,11 +595,11 @@ sg31 = SpaceGroup(
     point_group_name="PGmm2",
     crystal_system=ORTHORHOMBIC,
     pdb_name="P m n 21",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_12_0_12),
-        SymOp(ROT_X_mY_Z, TR_12_0_12),
-        SymOp(ROT_mX_Y_Z, TR_0_0_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_12_0_12),
+        (ROT_X_mY_Z, TR_12_0_12),
+        (ROT_mX_Y_Z, TR_0_0_0)])
 
 sg32 = SpaceGroup(
     number=32,
@@ -611,11 +609,11 @@ sg32 = SpaceGroup(
     point_group_name="PGmm2",
     crystal_system=ORTHORHOMBIC,
     pdb_name="P b a 2",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_X_mY_Z, TR_12_12_0),
-        SymOp(ROT_mX_Y_Z, TR_12_12_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_X_mY_Z, TR_12_12_0),
+        (ROT_mX_Y_Z, TR_12_12_0)])
 
 sg33 = SpaceGroup(
     number=33,
@@ -625,11 +623,11 @@ sg33 = SpaceGroup(
     point_group_name="PGmm2",
     crystal_system=ORTHORHOMBIC,
     pdb_name="P n a 21",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_12),
-        SymOp(ROT_X_mY_Z, TR_12_12_0),
-        SymOp(ROT_mX_Y_Z, TR_12_12_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_12),
+        (ROT_X_mY_Z, TR_12_12_0),
+        (ROT_mX_Y_Z, TR_12_12_12)])
 
 sg34 = SpaceGroup(
     number=34,
@@ -639,11 +637,11 @@ sg34 = SpaceGroup(
     point_group_name="PGmm2",
     crystal_system=ORTHORHOMBIC,
     pdb_name="P n n 2",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_X_mY_Z, TR_12_12_12),
-        SymOp(ROT_mX_Y_Z, TR_12_12_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_X_mY_Z, TR_12_12_12),
+        (ROT_mX_Y_Z, TR_12_12_12)])
 
 sg35 = SpaceGroup(
     number=35,
@@ -653,15 +651,15 @@ sg35 = SpaceGroup(
     point_group_name="PGmm2",
     crystal_system=ORTHORHOMBIC,
     pdb_name="C m m 2",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_X_mY_Z, TR_0_0_0),
-        SymOp(ROT_mX_Y_Z, TR_0_0_0),
-        SymOp(ROT_X_Y_Z, TR_12_12_0),
-        SymOp(ROT_mX_mY_Z, TR_12_12_0),
-        SymOp(ROT_X_mY_Z, TR_12_12_0),
-        SymOp(ROT_mX_Y_Z, TR_12_12_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_X_mY_Z, TR_0_0_0),
+        (ROT_mX_Y_Z, TR_0_0_0),
+        (ROT_X_Y_Z, TR_12_12_0),
+        (ROT_mX_mY_Z, TR_12_12_0),
+        (ROT_X_mY_Z, TR_12_12_0),
+        (ROT_mX_Y_Z, TR_12_12_0)])
 
 sg36 = SpaceGroup(
     number=36,
@@ -671,15 +669,15 @@ sg36 = SpaceGroup(
     point_group_name="PGmm2",
     crystal_system=ORTHORHOMBIC,
     pdb_name="C m c 21",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_12),
-        SymOp(ROT_X_mY_Z, TR_0_0_12),
-        SymOp(ROT_mX_Y_Z, TR_0_0_0),
-        SymOp(ROT_X_Y_Z, TR_12_12_0),
-        SymOp(ROT_mX_mY_Z, TR_12_12_12),
-        SymOp(ROT_X_mY_Z, TR_12_12_12),
-        SymOp(ROT_mX_Y_Z, TR_12_12_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_12),
+        (ROT_X_mY_Z, TR_0_0_12),
+        (ROT_mX_Y_Z, TR_0_0_0),
+        (ROT_X_Y_Z, TR_12_12_0),
+        (ROT_mX_mY_Z, TR_12_12_12),
+        (ROT_X_mY_Z, TR_12_12_12),
+        (ROT_mX_Y_Z, TR_12_12_0)])
 
 sg37 = SpaceGroup(
     number=37,
@@ -689,15 +687,15 @@ sg37 = SpaceGroup(
     point_group_name="PGmm2",
     crystal_system=ORTHORHOMBIC,
     pdb_name="C c c 2",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_X_mY_Z, TR_0_0_12),
-        SymOp(ROT_mX_Y_Z, TR_0_0_12),
-        SymOp(ROT_X_Y_Z, TR_12_12_0),
-        SymOp(ROT_mX_mY_Z, TR_12_12_0),
-        SymOp(ROT_X_mY_Z, TR_12_12_12),
-        SymOp(ROT_mX_Y_Z, TR_12_12_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_X_mY_Z, TR_0_0_12),
+        (ROT_mX_Y_Z, TR_0_0_12),
+        (ROT_X_Y_Z, TR_12_12_0),
+        (ROT_mX_mY_Z, TR_12_12_0),
+        (ROT_X_mY_Z, TR_12_12_12),
+        (ROT_mX_Y_Z, TR_12_12_12)])
 
 sg38 = SpaceGroup(
     number=38,
@@ -707,15 +705,15 @@ sg38 = SpaceGroup(
     point_group_name="PGmm2",
     crystal_system=ORTHORHOMBIC,
     pdb_name="A m m 2",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_X_mY_Z, TR_0_0_0),
-        SymOp(ROT_mX_Y_Z, TR_0_0_0),
-        SymOp(ROT_X_Y_Z, TR_0_12_12),
-        SymOp(ROT_mX_mY_Z, TR_0_12_12),
-        SymOp(ROT_X_mY_Z, TR_0_12_12),
-        SymOp(ROT_mX_Y_Z, TR_0_12_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_X_mY_Z, TR_0_0_0),
+        (ROT_mX_Y_Z, TR_0_0_0),
+        (ROT_X_Y_Z, TR_0_12_12),
+        (ROT_mX_mY_Z, TR_0_12_12),
+        (ROT_X_mY_Z, TR_0_12_12),
+        (ROT_mX_Y_Z, TR_0_12_12)])
 
 sg39 = SpaceGroup(
     number=39,
@@ -725,15 +723,15 @@ sg39 = SpaceGroup(
     point_group_name="PGmm2",
     crystal_system=ORTHORHOMBIC,
     pdb_name="A b m 2",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_X_mY_Z, TR_0_12_0),
-        SymOp(ROT_mX_Y_Z, TR_0_12_0),
-        SymOp(ROT_X_Y_Z, TR_0_12_12),
-        SymOp(ROT_mX_mY_Z, TR_0_12_12),
-        SymOp(ROT_X_mY_Z, TR_0_0_12),
-        SymOp(ROT_mX_Y_Z, TR_0_0_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_X_mY_Z, TR_0_12_0),
+        (ROT_mX_Y_Z, TR_0_12_0),
+        (ROT_X_Y_Z, TR_0_12_12),
+        (ROT_mX_mY_Z, TR_0_12_12),
+        (ROT_X_mY_Z, TR_0_0_12),
+        (ROT_mX_Y_Z, TR_0_0_12)])
 
 sg40 = SpaceGroup(
     number=40,
@@ -743,15 +741,15 @@ sg40 = SpaceGroup(
     point_group_name="PGmm2",
     crystal_system=ORTHORHOMBIC,
     pdb_name="A m a 2",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_X_mY_Z, TR_12_0_0),
-        SymOp(ROT_mX_Y_Z, TR_12_0_0),
-        SymOp(ROT_X_Y_Z, TR_0_12_12),
-        SymOp(ROT_mX_mY_Z, TR_0_12_12),
-        SymOp(ROT_X_mY_Z, TR_12_12_12),
-        SymOp(ROT_mX_Y_Z, TR_12_12_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_X_mY_Z, TR_12_0_0),
+        (ROT_mX_Y_Z, TR_12_0_0),
+        (ROT_X_Y_Z, TR_0_12_12),
+        (ROT_mX_mY_Z, TR_0_12_12),
+        (ROT_X_mY_Z, TR_12_12_12),
+        (ROT_mX_Y_Z, TR_12_12_12)])
 
 sg41 = SpaceGroup(
     number=41,
@@ -761,15 +759,15 @@ sg41 = SpaceGroup(
     point_group_name="PGmm2",
     crystal_system=ORTHORHOMBIC,
     pdb_name="A b a 2",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_X_mY_Z, TR_12_12_0),
-        SymOp(ROT_mX_Y_Z, TR_12_12_0),
-        SymOp(ROT_X_Y_Z, TR_0_12_12),
-        SymOp(ROT_mX_mY_Z, TR_0_12_12),
-        SymOp(ROT_X_mY_Z, TR_12_0_12),
-        SymOp(ROT_mX_Y_Z, TR_12_0_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_X_mY_Z, TR_12_12_0),
+        (ROT_mX_Y_Z, TR_12_12_0),
+        (ROT_X_Y_Z, TR_0_12_12),
+        (ROT_mX_mY_Z, TR_0_12_12),
+        (ROT_X_mY_Z, TR_12_0_12),
+        (ROT_mX_Y_Z, TR_12_0_12)])
 
 sg42 = SpaceGroup(
     number=42,
@@ -779,23 +777,23 @@ sg42 = SpaceGroup(
     point_group_name="PGmm2",
     crystal_system=ORTHORHOMBIC,
     pdb_name="F m m 2",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_X_mY_Z, TR_0_0_0),
-        SymOp(ROT_mX_Y_Z, TR_0_0_0),
-        SymOp(ROT_X_Y_Z, TR_0_12_12),
-        SymOp(ROT_mX_mY_Z, TR_0_12_12),
-        SymOp(ROT_X_mY_Z, TR_0_12_12),
-        SymOp(ROT_mX_Y_Z, TR_0_12_12),
-        SymOp(ROT_X_Y_Z, TR_12_0_12),
-        SymOp(ROT_mX_mY_Z, TR_12_0_12),
-        SymOp(ROT_X_mY_Z, TR_12_0_12),
-        SymOp(ROT_mX_Y_Z, TR_12_0_12),
-        SymOp(ROT_X_Y_Z, TR_12_12_0),
-        SymOp(ROT_mX_mY_Z, TR_12_12_0),
-        SymOp(ROT_X_mY_Z, TR_12_12_0),
-        SymOp(ROT_mX_Y_Z, TR_12_12_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_X_mY_Z, TR_0_0_0),
+        (ROT_mX_Y_Z, TR_0_0_0),
+        (ROT_X_Y_Z, TR_0_12_12),
+        (ROT_mX_mY_Z, TR_0_12_12),
+        (ROT_X_mY_Z, TR_0_12_12),
+        (ROT_mX_Y_Z, TR_0_12_12),
+        (ROT_X_Y_Z, TR_12_0_12),
+        (ROT_mX_mY_Z, TR_12_0_12),
+        (ROT_X_mY_Z, TR_12_0_12),
+        (ROT_mX_Y_Z, TR_12_0_12),
+        (ROT_X_Y_Z, TR_12_12_0),
+        (ROT_mX_mY_Z, TR_12_12_0),
+        (ROT_X_mY_Z, TR_12_12_0),
+        (ROT_mX_Y_Z, TR_12_12_0)])
 
 sg43 = SpaceGroup(
     number=43,
@@ -805,23 +803,23 @@ sg43 = SpaceGroup(
     point_group_name="PGmm2",
     crystal_system=ORTHORHOMBIC,
     pdb_name="F d d 2",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_X_mY_Z, TR_14_14_14),
-        SymOp(ROT_mX_Y_Z, TR_14_14_14),
-        SymOp(ROT_X_Y_Z, TR_0_12_12),
-        SymOp(ROT_mX_mY_Z, TR_0_12_12),
-        SymOp(ROT_X_mY_Z, TR_14_34_34),
-        SymOp(ROT_mX_Y_Z, TR_14_34_34),
-        SymOp(ROT_X_Y_Z, TR_12_0_12),
-        SymOp(ROT_mX_mY_Z, TR_12_0_12),
-        SymOp(ROT_X_mY_Z, TR_34_14_34),
-        SymOp(ROT_mX_Y_Z, TR_34_14_34),
-        SymOp(ROT_X_Y_Z, TR_12_12_0),
-        SymOp(ROT_mX_mY_Z, TR_12_12_0),
-        SymOp(ROT_X_mY_Z, TR_34_34_14),
-        SymOp(ROT_mX_Y_Z, TR_34_34_14)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_X_mY_Z, TR_14_14_14),
+        (ROT_mX_Y_Z, TR_14_14_14),
+        (ROT_X_Y_Z, TR_0_12_12),
+        (ROT_mX_mY_Z, TR_0_12_12),
+        (ROT_X_mY_Z, TR_14_34_34),
+        (ROT_mX_Y_Z, TR_14_34_34),
+        (ROT_X_Y_Z, TR_12_0_12),
+        (ROT_mX_mY_Z, TR_12_0_12),
+        (ROT_X_mY_Z, TR_34_14_34),
+        (ROT_mX_Y_Z, TR_34_14_34),
+        (ROT_X_Y_Z, TR_12_12_0),
+        (ROT_mX_mY_Z, TR_12_12_0),
+        (ROT_X_mY_Z, TR_34_34_14),
+        (ROT_mX_Y_Z, TR_34_34_14)])
 
 sg44 = SpaceGroup(
     number=44,
@@ -831,15 +829,15 @@ sg44 = SpaceGroup(
     point_group_name="PGmm2",
     crystal_system=ORTHORHOMBIC,
     pdb_name="I m m 2",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_X_mY_Z, TR_0_0_0),
-        SymOp(ROT_mX_Y_Z, TR_0_0_0),
-        SymOp(ROT_X_Y_Z, TR_12_12_12),
-        SymOp(ROT_mX_mY_Z, TR_12_12_12),
-        SymOp(ROT_X_mY_Z, TR_12_12_12),
-        SymOp(ROT_mX_Y_Z, TR_12_12_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_X_mY_Z, TR_0_0_0),
+        (ROT_mX_Y_Z, TR_0_0_0),
+        (ROT_X_Y_Z, TR_12_12_12),
+        (ROT_mX_mY_Z, TR_12_12_12),
+        (ROT_X_mY_Z, TR_12_12_12),
+        (ROT_mX_Y_Z, TR_12_12_12)])
 
 sg45 = SpaceGroup(
     number=45,
@@ -849,15 +847,15 @@ sg45 = SpaceGroup(
     point_group_name="PGmm2",
     crystal_system=ORTHORHOMBIC,
     pdb_name="I b a 2",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_X_mY_Z, TR_12_12_0),
-        SymOp(ROT_mX_Y_Z, TR_12_12_0),
-        SymOp(ROT_X_Y_Z, TR_12_12_12),
-        SymOp(ROT_mX_mY_Z, TR_12_12_12),
-        SymOp(ROT_X_mY_Z, TR_0_0_12),
-        SymOp(ROT_mX_Y_Z, TR_0_0_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_X_mY_Z, TR_12_12_0),
+        (ROT_mX_Y_Z, TR_12_12_0),
+        (ROT_X_Y_Z, TR_12_12_12),
+        (ROT_mX_mY_Z, TR_12_12_12),
+        (ROT_X_mY_Z, TR_0_0_12),
+        (ROT_mX_Y_Z, TR_0_0_12)])
 
 sg46 = SpaceGroup(
     number=46,
@@ -867,15 +865,15 @@ sg46 = SpaceGroup(
     point_group_name="PGmm2",
     crystal_system=ORTHORHOMBIC,
     pdb_name="I m a 2",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_X_mY_Z, TR_12_0_0),
-        SymOp(ROT_mX_Y_Z, TR_12_0_0),
-        SymOp(ROT_X_Y_Z, TR_12_12_12),
-        SymOp(ROT_mX_mY_Z, TR_12_12_12),
-        SymOp(ROT_X_mY_Z, TR_0_12_12),
-        SymOp(ROT_mX_Y_Z, TR_0_12_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_X_mY_Z, TR_12_0_0),
+        (ROT_mX_Y_Z, TR_12_0_0),
+        (ROT_X_Y_Z, TR_12_12_12),
+        (ROT_mX_mY_Z, TR_12_12_12),
+        (ROT_X_mY_Z, TR_0_12_12),
+        (ROT_mX_Y_Z, TR_0_12_12)])
 
 sg47 = SpaceGroup(
     number=47,
@@ -885,15 +883,15 @@ sg47 = SpaceGroup(
     point_group_name="PGmmm",
     crystal_system=ORTHORHOMBIC,
     pdb_name="P 2/m 2/m 2/m",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mX_Y_mZ, TR_0_0_0),
-        SymOp(ROT_X_mY_mZ, TR_0_0_0),
-        SymOp(ROT_mX_mY_mZ, TR_0_0_0),
-        SymOp(ROT_X_Y_mZ, TR_0_0_0),
-        SymOp(ROT_X_mY_Z, TR_0_0_0),
-        SymOp(ROT_mX_Y_Z, TR_0_0_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mX_Y_mZ, TR_0_0_0),
+        (ROT_X_mY_mZ, TR_0_0_0),
+        (ROT_mX_mY_mZ, TR_0_0_0),
+        (ROT_X_Y_mZ, TR_0_0_0),
+        (ROT_X_mY_Z, TR_0_0_0),
+        (ROT_mX_Y_Z, TR_0_0_0)])
 
 sg48 = SpaceGroup(
     number=48,
@@ -903,15 +901,15 @@ sg48 = SpaceGroup(
     point_group_name="PGmmm",
     crystal_system=ORTHORHOMBIC,
     pdb_name="P 2/n 2/n 2/n",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mX_Y_mZ, TR_0_0_0),
-        SymOp(ROT_X_mY_mZ, TR_0_0_0),
-        SymOp(ROT_mX_mY_mZ, TR_12_12_12),
-        SymOp(ROT_X_Y_mZ, TR_12_12_12),
-        SymOp(ROT_X_mY_Z, TR_12_12_12),
-        SymOp(ROT_mX_Y_Z, TR_12_12_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mX_Y_mZ, TR_0_0_0),
+        (ROT_X_mY_mZ, TR_0_0_0),
+        (ROT_mX_mY_mZ, TR_12_12_12),
+        (ROT_X_Y_mZ, TR_12_12_12),
+        (ROT_X_mY_Z, TR_12_12_12),
+        (ROT_mX_Y_Z, TR_12_12_12)])
 
 sg49 = SpaceGroup(
     number=49,
@@ -921,15 +919,15 @@ sg49 = SpaceGroup(
     point_group_name="PGmmm",
     crystal_system=ORTHORHOMBIC,
     pdb_name="P 2/c 2/c 2/m",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mX_Y_mZ, TR_0_0_12),
-        SymOp(ROT_X_mY_mZ, TR_0_0_12),
-        SymOp(ROT_mX_mY_mZ, TR_0_0_0),
-        SymOp(ROT_X_Y_mZ, TR_0_0_0),
-        SymOp(ROT_X_mY_Z, TR_0_0_12),
-        SymOp(ROT_mX_Y_Z, TR_0_0_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mX_Y_mZ, TR_0_0_12),
+        (ROT_X_mY_mZ, TR_0_0_12),
+        (ROT_mX_mY_mZ, TR_0_0_0),
+        (ROT_X_Y_mZ, TR_0_0_0),
+        (ROT_X_mY_Z, TR_0_0_12),
+        (ROT_mX_Y_Z, TR_0_0_12)])
 
 sg50 = SpaceGroup(
     number=50,
@@ -939,15 +937,15 @@ sg50 = SpaceGroup(
     point_group_name="PGmmm",
     crystal_system=ORTHORHOMBIC,
     pdb_name="P 2/b 2/a 2/n",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mX_Y_mZ, TR_0_0_0),
-        SymOp(ROT_X_mY_mZ, TR_0_0_0),
-        SymOp(ROT_mX_mY_mZ, TR_12_12_0),
-        SymOp(ROT_X_Y_mZ, TR_12_12_0),
-        SymOp(ROT_X_mY_Z, TR_12_12_0),
-        SymOp(ROT_mX_Y_Z, TR_12_12_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mX_Y_mZ, TR_0_0_0),
+        (ROT_X_mY_mZ, TR_0_0_0),
+        (ROT_mX_mY_mZ, TR_12_12_0),
+        (ROT_X_Y_mZ, TR_12_12_0),
+        (ROT_X_mY_Z, TR_12_12_0),
+        (ROT_mX_Y_Z, TR_12_12_0)])
 
 sg51 = SpaceGroup(
     number=51,
@@ -957,15 +955,15 @@ sg51 = SpaceGroup(
     point_group_name="PGmmm",
     crystal_system=ORTHORHOMBIC,
     pdb_name="P 21/m 2/m 2/a",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_12_0_0),
-        SymOp(ROT_mX_Y_mZ, TR_0_0_0),
-        SymOp(ROT_X_mY_mZ, TR_12_0_0),
-        SymOp(ROT_mX_mY_mZ, TR_0_0_0),
-        SymOp(ROT_X_Y_mZ, TR_12_0_0),
-        SymOp(ROT_X_mY_Z, TR_0_0_0),
-        SymOp(ROT_mX_Y_Z, TR_12_0_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_12_0_0),
+        (ROT_mX_Y_mZ, TR_0_0_0),
+        (ROT_X_mY_mZ, TR_12_0_0),
+        (ROT_mX_mY_mZ, TR_0_0_0),
+        (ROT_X_Y_mZ, TR_12_0_0),
+        (ROT_X_mY_Z, TR_0_0_0),
+        (ROT_mX_Y_Z, TR_12_0_0)])
 
 sg52 = SpaceGroup(
     number=52,
@@ -975,15 +973,15 @@ sg52 = SpaceGroup(
     point_group_name="PGmmm",
     crystal_system=ORTHORHOMBIC,
     pdb_name="P 2/n 21/n 2/a",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_12_0_0),
-        SymOp(ROT_mX_Y_mZ, TR_12_12_12),
-        SymOp(ROT_X_mY_mZ, TR_0_12_12),
-        SymOp(ROT_mX_mY_mZ, TR_0_0_0),
-        SymOp(ROT_X_Y_mZ, TR_12_0_0),
-        SymOp(ROT_X_mY_Z, TR_12_12_12),
-        SymOp(ROT_mX_Y_Z, TR_0_12_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_12_0_0),
+        (ROT_mX_Y_mZ, TR_12_12_12),
+        (ROT_X_mY_mZ, TR_0_12_12),
+        (ROT_mX_mY_mZ, TR_0_0_0),
+        (ROT_X_Y_mZ, TR_12_0_0),
+        (ROT_X_mY_Z, TR_12_12_12),
+        (ROT_mX_Y_Z, TR_0_12_12)])
 
 sg53 = SpaceGroup(
     number=53,
@@ -993,15 +991,15 @@ sg53 = SpaceGroup(
     point_group_name="PGmmm",
     crystal_system=ORTHORHOMBIC,
     pdb_name="P 2/m 2/n 21/a",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_12_0_12),
-        SymOp(ROT_mX_Y_mZ, TR_12_0_12),
-        SymOp(ROT_X_mY_mZ, TR_0_0_0),
-        SymOp(ROT_mX_mY_mZ, TR_0_0_0),
-        SymOp(ROT_X_Y_mZ, TR_12_0_12),
-        SymOp(ROT_X_mY_Z, TR_12_0_12),
-        SymOp(ROT_mX_Y_Z, TR_0_0_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_12_0_12),
+        (ROT_mX_Y_mZ, TR_12_0_12),
+        (ROT_X_mY_mZ, TR_0_0_0),
+        (ROT_mX_mY_mZ, TR_0_0_0),
+        (ROT_X_Y_mZ, TR_12_0_12),
+        (ROT_X_mY_Z, TR_12_0_12),
+        (ROT_mX_Y_Z, TR_0_0_0)])
 
 sg54 = SpaceGroup(
     number=54,
@@ -1011,15 +1009,15 @@ sg54 = SpaceGroup(
     point_group_name="PGmmm",
     crystal_system=ORTHORHOMBIC,
     pdb_name="P 21/c 2/c 2/a",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_12_0_0),
-        SymOp(ROT_mX_Y_mZ, TR_0_0_12),
-        SymOp(ROT_X_mY_mZ, TR_12_0_12),
-        SymOp(ROT_mX_mY_mZ, TR_0_0_0),
-        SymOp(ROT_X_Y_mZ, TR_12_0_0),
-        SymOp(ROT_X_mY_Z, TR_0_0_12),
-        SymOp(ROT_mX_Y_Z, TR_12_0_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_12_0_0),
+        (ROT_mX_Y_mZ, TR_0_0_12),
+        (ROT_X_mY_mZ, TR_12_0_12),
+        (ROT_mX_mY_mZ, TR_0_0_0),
+        (ROT_X_Y_mZ, TR_12_0_0),
+        (ROT_X_mY_Z, TR_0_0_12),
+        (ROT_mX_Y_Z, TR_12_0_12)])
 
 sg55 = SpaceGroup(
     number=55,
@@ -1029,15 +1027,15 @@ sg55 = SpaceGroup(
     point_group_name="PGmmm",
     crystal_system=ORTHORHOMBIC,
     pdb_name="P 21/b 21/a 2/m",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mX_Y_mZ, TR_12_12_0),
-        SymOp(ROT_X_mY_mZ, TR_12_12_0),
-        SymOp(ROT_mX_mY_mZ, TR_0_0_0),
-        SymOp(ROT_X_Y_mZ, TR_0_0_0),
-        SymOp(ROT_X_mY_Z, TR_12_12_0),
-        SymOp(ROT_mX_Y_Z, TR_12_12_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mX_Y_mZ, TR_12_12_0),
+        (ROT_X_mY_mZ, TR_12_12_0),
+        (ROT_mX_mY_mZ, TR_0_0_0),
+        (ROT_X_Y_mZ, TR_0_0_0),
+        (ROT_X_mY_Z, TR_12_12_0),
+        (ROT_mX_Y_Z, TR_12_12_0)])
 
 sg56 = SpaceGroup(
     number=56,
@@ -1047,15 +1045,15 @@ sg56 = SpaceGroup(
     point_group_name="PGmmm",
     crystal_system=ORTHORHOMBIC,
     pdb_name="P 21/c 21/c 2/n",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_12_12_0),
-        SymOp(ROT_mX_Y_mZ, TR_0_12_12),
-        SymOp(ROT_X_mY_mZ, TR_12_0_12),
-        SymOp(ROT_mX_mY_mZ, TR_0_0_0),
-        SymOp(ROT_X_Y_mZ, TR_12_12_0),
-        SymOp(ROT_X_mY_Z, TR_0_12_12),
-        SymOp(ROT_mX_Y_Z, TR_12_0_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_12_12_0),
+        (ROT_mX_Y_mZ, TR_0_12_12),
+        (ROT_X_mY_mZ, TR_12_0_12),
+        (ROT_mX_mY_mZ, TR_0_0_0),
+        (ROT_X_Y_mZ, TR_12_12_0),
+        (ROT_X_mY_Z, TR_0_12_12),
+        (ROT_mX_Y_Z, TR_12_0_12)])
 
 sg57 = SpaceGroup(
     number=57,
@@ -1065,15 +1063,15 @@ sg57 = SpaceGroup(
     point_group_name="PGmmm",
     crystal_system=ORTHORHOMBIC,
     pdb_name="P 2/b 21/c 21/m",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_12),
-        SymOp(ROT_mX_Y_mZ, TR_0_12_12),
-        SymOp(ROT_X_mY_mZ, TR_0_12_0),
-        SymOp(ROT_mX_mY_mZ, TR_0_0_0),
-        SymOp(ROT_X_Y_mZ, TR_0_0_12),
-        SymOp(ROT_X_mY_Z, TR_0_12_12),
-        SymOp(ROT_mX_Y_Z, TR_0_12_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_12),
+        (ROT_mX_Y_mZ, TR_0_12_12),
+        (ROT_X_mY_mZ, TR_0_12_0),
+        (ROT_mX_mY_mZ, TR_0_0_0),
+        (ROT_X_Y_mZ, TR_0_0_12),
+        (ROT_X_mY_Z, TR_0_12_12),
+        (ROT_mX_Y_Z, TR_0_12_0)])
 
 sg58 = SpaceGroup(
     number=58,
@@ -1083,15 +1081,15 @@ sg58 = SpaceGroup(
     point_group_name="PGmmm",
     crystal_system=ORTHORHOMBIC,
     pdb_name="P 21/n 21/n 2/m",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mX_Y_mZ, TR_12_12_12),
-        SymOp(ROT_X_mY_mZ, TR_12_12_12),
-        SymOp(ROT_mX_mY_mZ, TR_0_0_0),
-        SymOp(ROT_X_Y_mZ, TR_0_0_0),
-        SymOp(ROT_X_mY_Z, TR_12_12_12),
-        SymOp(ROT_mX_Y_Z, TR_12_12_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mX_Y_mZ, TR_12_12_12),
+        (ROT_X_mY_mZ, TR_12_12_12),
+        (ROT_mX_mY_mZ, TR_0_0_0),
+        (ROT_X_Y_mZ, TR_0_0_0),
+        (ROT_X_mY_Z, TR_12_12_12),
+        (ROT_mX_Y_Z, TR_12_12_12)])
 
 sg59 = SpaceGroup(
     number=59,
@@ -1101,15 +1099,15 @@ sg59 = SpaceGroup(
     point_group_name="PGmmm",
     crystal_system=ORTHORHOMBIC,
     pdb_name="P 21/m 21/m 2/n",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mX_Y_mZ, TR_12_12_0),
-        SymOp(ROT_X_mY_mZ, TR_12_12_0),
-        SymOp(ROT_mX_mY_mZ, TR_12_12_0),
-        SymOp(ROT_X_Y_mZ, TR_12_12_0),
-        SymOp(ROT_X_mY_Z, TR_0_0_0),
-        SymOp(ROT_mX_Y_Z, TR_0_0_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mX_Y_mZ, TR_12_12_0),
+        (ROT_X_mY_mZ, TR_12_12_0),
+        (ROT_mX_mY_mZ, TR_12_12_0),
+        (ROT_X_Y_mZ, TR_12_12_0),
+        (ROT_X_mY_Z, TR_0_0_0),
+        (ROT_mX_Y_Z, TR_0_0_0)])
 
 sg60 = SpaceGroup(
     number=60,
@@ -1119,15 +1117,15 @@ sg60 = SpaceGroup(
     point_group_name="PGmmm",
     crystal_system=ORTHORHOMBIC,
     pdb_name="P 21/b 2/c 21/n",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_12_12_12),
-        SymOp(ROT_mX_Y_mZ, TR_0_0_12),
-        SymOp(ROT_X_mY_mZ, TR_12_12_0),
-        SymOp(ROT_mX_mY_mZ, TR_0_0_0),
-        SymOp(ROT_X_Y_mZ, TR_12_12_12),
-        SymOp(ROT_X_mY_Z, TR_0_0_12),
-        SymOp(ROT_mX_Y_Z, TR_12_12_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_12_12_12),
+        (ROT_mX_Y_mZ, TR_0_0_12),
+        (ROT_X_mY_mZ, TR_12_12_0),
+        (ROT_mX_mY_mZ, TR_0_0_0),
+        (ROT_X_Y_mZ, TR_12_12_12),
+        (ROT_X_mY_Z, TR_0_0_12),
+        (ROT_mX_Y_Z, TR_12_12_0)])
 
 sg61 = SpaceGroup(
     number=61,
@@ -1137,15 +1135,15 @@ sg61 = SpaceGroup(
     point_group_name="PGmmm",
     crystal_system=ORTHORHOMBIC,
     pdb_name="P 21/b 21/c 21/a",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_12_0_12),
-        SymOp(ROT_mX_Y_mZ, TR_0_12_12),
-        SymOp(ROT_X_mY_mZ, TR_12_12_0),
-        SymOp(ROT_mX_mY_mZ, TR_0_0_0),
-        SymOp(ROT_X_Y_mZ, TR_12_0_12),
-        SymOp(ROT_X_mY_Z, TR_0_12_12),
-        SymOp(ROT_mX_Y_Z, TR_12_12_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_12_0_12),
+        (ROT_mX_Y_mZ, TR_0_12_12),
+        (ROT_X_mY_mZ, TR_12_12_0),
+        (ROT_mX_mY_mZ, TR_0_0_0),
+        (ROT_X_Y_mZ, TR_12_0_12),
+        (ROT_X_mY_Z, TR_0_12_12),
+        (ROT_mX_Y_Z, TR_12_12_0)])
 
 sg62 = SpaceGroup(
     number=62,
@@ -1155,15 +1153,15 @@ sg62 = SpaceGroup(
     point_group_name="PGmmm",
     crystal_system=ORTHORHOMBIC,
     pdb_name="P 21/n 21/m 21/a",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_12_0_12),
-        SymOp(ROT_mX_Y_mZ, TR_0_12_0),
-        SymOp(ROT_X_mY_mZ, TR_12_12_12),
-        SymOp(ROT_mX_mY_mZ, TR_0_0_0),
-        SymOp(ROT_X_Y_mZ, TR_12_0_12),
-        SymOp(ROT_X_mY_Z, TR_0_12_0),
-        SymOp(ROT_mX_Y_Z, TR_12_12_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_12_0_12),
+        (ROT_mX_Y_mZ, TR_0_12_0),
+        (ROT_X_mY_mZ, TR_12_12_12),
+        (ROT_mX_mY_mZ, TR_0_0_0),
+        (ROT_X_Y_mZ, TR_12_0_12),
+        (ROT_X_mY_Z, TR_0_12_0),
+        (ROT_mX_Y_Z, TR_12_12_12)])
 
 sg63 = SpaceGroup(
     number=63,
@@ -1173,23 +1171,23 @@ sg63 = SpaceGroup(
     point_group_name="PGmmm",
     crystal_system=ORTHORHOMBIC,
     pdb_name="C 2/m 2/c 21/m",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_12),
-        SymOp(ROT_mX_Y_mZ, TR_0_0_12),
-        SymOp(ROT_X_mY_mZ, TR_0_0_0),
-        SymOp(ROT_mX_mY_mZ, TR_0_0_0),
-        SymOp(ROT_X_Y_mZ, TR_0_0_12),
-        SymOp(ROT_X_mY_Z, TR_0_0_12),
-        SymOp(ROT_mX_Y_Z, TR_0_0_0),
-        SymOp(ROT_X_Y_Z, TR_12_12_0),
-        SymOp(ROT_mX_mY_Z, TR_12_12_12),
-        SymOp(ROT_mX_Y_mZ, TR_12_12_12),
-        SymOp(ROT_X_mY_mZ, TR_12_12_0),
-        SymOp(ROT_mX_mY_mZ, TR_12_12_0),
-        SymOp(ROT_X_Y_mZ, TR_12_12_12),
-        SymOp(ROT_X_mY_Z, TR_12_12_12),
-        SymOp(ROT_mX_Y_Z, TR_12_12_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_12),
+        (ROT_mX_Y_mZ, TR_0_0_12),
+        (ROT_X_mY_mZ, TR_0_0_0),
+        (ROT_mX_mY_mZ, TR_0_0_0),
+        (ROT_X_Y_mZ, TR_0_0_12),
+        (ROT_X_mY_Z, TR_0_0_12),
+        (ROT_mX_Y_Z, TR_0_0_0),
+        (ROT_X_Y_Z, TR_12_12_0),
+        (ROT_mX_mY_Z, TR_12_12_12),
+        (ROT_mX_Y_mZ, TR_12_12_12),
+        (ROT_X_mY_mZ, TR_12_12_0),
+        (ROT_mX_mY_mZ, TR_12_12_0),
+        (ROT_X_Y_mZ, TR_12_12_12),
+        (ROT_X_mY_Z, TR_12_12_12),
+        (ROT_mX_Y_Z, TR_12_12_0)])
 
 sg64 = SpaceGroup(
     number=64,
@@ -1199,23 +1197,23 @@ sg64 = SpaceGroup(
     point_group_name="PGmmm",
     crystal_system=ORTHORHOMBIC,
     pdb_name="C 2/m 2/c 21/a",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_12_12),
-        SymOp(ROT_mX_Y_mZ, TR_0_12_12),
-        SymOp(ROT_X_mY_mZ, TR_0_0_0),
-        SymOp(ROT_mX_mY_mZ, TR_0_0_0),
-        SymOp(ROT_X_Y_mZ, TR_0_12_12),
-        SymOp(ROT_X_mY_Z, TR_0_12_12),
-        SymOp(ROT_mX_Y_Z, TR_0_0_0),
-        SymOp(ROT_X_Y_Z, TR_12_12_0),
-        SymOp(ROT_mX_mY_Z, TR_12_0_12),
-        SymOp(ROT_mX_Y_mZ, TR_12_0_12),
-        SymOp(ROT_X_mY_mZ, TR_12_12_0),
-        SymOp(ROT_mX_mY_mZ, TR_12_12_0),
-        SymOp(ROT_X_Y_mZ, TR_12_0_12),
-        SymOp(ROT_X_mY_Z, TR_12_0_12),
-        SymOp(ROT_mX_Y_Z, TR_12_12_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_12_12),
+        (ROT_mX_Y_mZ, TR_0_12_12),
+        (ROT_X_mY_mZ, TR_0_0_0),
+        (ROT_mX_mY_mZ, TR_0_0_0),
+        (ROT_X_Y_mZ, TR_0_12_12),
+        (ROT_X_mY_Z, TR_0_12_12),
+        (ROT_mX_Y_Z, TR_0_0_0),
+        (ROT_X_Y_Z, TR_12_12_0),
+        (ROT_mX_mY_Z, TR_12_0_12),
+        (ROT_mX_Y_mZ, TR_12_0_12),
+        (ROT_X_mY_mZ, TR_12_12_0),
+        (ROT_mX_mY_mZ, TR_12_12_0),
+        (ROT_X_Y_mZ, TR_12_0_12),
+        (ROT_X_mY_Z, TR_12_0_12),
+        (ROT_mX_Y_Z, TR_12_12_0)])
 
 sg65 = SpaceGroup(
     number=65,
@@ -1225,23 +1223,23 @@ sg65 = SpaceGroup(
     point_group_name="PGmmm",
     crystal_system=ORTHORHOMBIC,
     pdb_name="C 2/m 2/m 2/m",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mX_Y_mZ, TR_0_0_0),
-        SymOp(ROT_X_mY_mZ, TR_0_0_0),
-        SymOp(ROT_mX_mY_mZ, TR_0_0_0),
-        SymOp(ROT_X_Y_mZ, TR_0_0_0),
-        SymOp(ROT_X_mY_Z, TR_0_0_0),
-        SymOp(ROT_mX_Y_Z, TR_0_0_0),
-        SymOp(ROT_X_Y_Z, TR_12_12_0),
-        SymOp(ROT_mX_mY_Z, TR_12_12_0),
-        SymOp(ROT_mX_Y_mZ, TR_12_12_0),
-        SymOp(ROT_X_mY_mZ, TR_12_12_0),
-        SymOp(ROT_mX_mY_mZ, TR_12_12_0),
-        SymOp(ROT_X_Y_mZ, TR_12_12_0),
-        SymOp(ROT_X_mY_Z, TR_12_12_0),
-        SymOp(ROT_mX_Y_Z, TR_12_12_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mX_Y_mZ, TR_0_0_0),
+        (ROT_X_mY_mZ, TR_0_0_0),
+        (ROT_mX_mY_mZ, TR_0_0_0),
+        (ROT_X_Y_mZ, TR_0_0_0),
+        (ROT_X_mY_Z, TR_0_0_0),
+        (ROT_mX_Y_Z, TR_0_0_0),
+        (ROT_X_Y_Z, TR_12_12_0),
+        (ROT_mX_mY_Z, TR_12_12_0),
+        (ROT_mX_Y_mZ, TR_12_12_0),
+        (ROT_X_mY_mZ, TR_12_12_0),
+        (ROT_mX_mY_mZ, TR_12_12_0),
+        (ROT_X_Y_mZ, TR_12_12_0),
+        (ROT_X_mY_Z, TR_12_12_0),
+        (ROT_mX_Y_Z, TR_12_12_0)])
 
 sg66 = SpaceGroup(
     number=66,
@@ -1251,23 +1249,23 @@ sg66 = SpaceGroup(
     point_group_name="PGmmm",
     crystal_system=ORTHORHOMBIC,
     pdb_name="C 2/c 2/c 2/m",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mX_Y_mZ, TR_0_0_12),
-        SymOp(ROT_X_mY_mZ, TR_0_0_12),
-        SymOp(ROT_mX_mY_mZ, TR_0_0_0),
-        SymOp(ROT_X_Y_mZ, TR_0_0_0),
-        SymOp(ROT_X_mY_Z, TR_0_0_12),
-        SymOp(ROT_mX_Y_Z, TR_0_0_12),
-        SymOp(ROT_X_Y_Z, TR_12_12_0),
-        SymOp(ROT_mX_mY_Z, TR_12_12_0),
-        SymOp(ROT_mX_Y_mZ, TR_12_12_12),
-        SymOp(ROT_X_mY_mZ, TR_12_12_12),
-        SymOp(ROT_mX_mY_mZ, TR_12_12_0),
-        SymOp(ROT_X_Y_mZ, TR_12_12_0),
-        SymOp(ROT_X_mY_Z, TR_12_12_12),
-        SymOp(ROT_mX_Y_Z, TR_12_12_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mX_Y_mZ, TR_0_0_12),
+        (ROT_X_mY_mZ, TR_0_0_12),
+        (ROT_mX_mY_mZ, TR_0_0_0),
+        (ROT_X_Y_mZ, TR_0_0_0),
+        (ROT_X_mY_Z, TR_0_0_12),
+        (ROT_mX_Y_Z, TR_0_0_12),
+        (ROT_X_Y_Z, TR_12_12_0),
+        (ROT_mX_mY_Z, TR_12_12_0),
+        (ROT_mX_Y_mZ, TR_12_12_12),
+        (ROT_X_mY_mZ, TR_12_12_12),
+        (ROT_mX_mY_mZ, TR_12_12_0),
+        (ROT_X_Y_mZ, TR_12_12_0),
+        (ROT_X_mY_Z, TR_12_12_12),
+        (ROT_mX_Y_Z, TR_12_12_12)])
 
 sg67 = SpaceGroup(
     number=67,
@@ -1277,23 +1275,23 @@ sg67 = SpaceGroup(
     point_group_name="PGmmm",
     crystal_system=ORTHORHOMBIC,
     pdb_name="C 2/m 2/m 2/a",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_12_0),
-        SymOp(ROT_mX_Y_mZ, TR_0_12_0),
-        SymOp(ROT_X_mY_mZ, TR_0_0_0),
-        SymOp(ROT_mX_mY_mZ, TR_0_0_0),
-        SymOp(ROT_X_Y_mZ, TR_0_12_0),
-        SymOp(ROT_X_mY_Z, TR_0_12_0),
-        SymOp(ROT_mX_Y_Z, TR_0_0_0),
-        SymOp(ROT_X_Y_Z, TR_12_12_0),
-        SymOp(ROT_mX_mY_Z, TR_12_0_0),
-        SymOp(ROT_mX_Y_mZ, TR_12_0_0),
-        SymOp(ROT_X_mY_mZ, TR_12_12_0),
-        SymOp(ROT_mX_mY_mZ, TR_12_12_0),
-        SymOp(ROT_X_Y_mZ, TR_12_0_0),
-        SymOp(ROT_X_mY_Z, TR_12_0_0),
-        SymOp(ROT_mX_Y_Z, TR_12_12_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_12_0),
+        (ROT_mX_Y_mZ, TR_0_12_0),
+        (ROT_X_mY_mZ, TR_0_0_0),
+        (ROT_mX_mY_mZ, TR_0_0_0),
+        (ROT_X_Y_mZ, TR_0_12_0),
+        (ROT_X_mY_Z, TR_0_12_0),
+        (ROT_mX_Y_Z, TR_0_0_0),
+        (ROT_X_Y_Z, TR_12_12_0),
+        (ROT_mX_mY_Z, TR_12_0_0),
+        (ROT_mX_Y_mZ, TR_12_0_0),
+        (ROT_X_mY_mZ, TR_12_12_0),
+        (ROT_mX_mY_mZ, TR_12_12_0),
+        (ROT_X_Y_mZ, TR_12_0_0),
+        (ROT_X_mY_Z, TR_12_0_0),
+        (ROT_mX_Y_Z, TR_12_12_0)])
 
 sg68 = SpaceGroup(
     number=68,
@@ -1303,23 +1301,23 @@ sg68 = SpaceGroup(
     point_group_name="PGmmm",
     crystal_system=ORTHORHOMBIC,
     pdb_name="C 2/c 2/c 2/a",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_12_12_0),
-        SymOp(ROT_mX_Y_mZ, TR_0_0_0),
-        SymOp(ROT_X_mY_mZ, TR_12_12_0),
-        SymOp(ROT_mX_mY_mZ, TR_0_12_12),
-        SymOp(ROT_X_Y_mZ, TR_12_0_12),
-        SymOp(ROT_X_mY_Z, TR_0_12_12),
-        SymOp(ROT_mX_Y_Z, TR_12_0_12),
-        SymOp(ROT_X_Y_Z, TR_12_12_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mX_Y_mZ, TR_12_12_0),
-        SymOp(ROT_X_mY_mZ, TR_0_0_0),
-        SymOp(ROT_mX_mY_mZ, TR_12_0_12),
-        SymOp(ROT_X_Y_mZ, TR_0_12_12),
-        SymOp(ROT_X_mY_Z, TR_12_0_12),
-        SymOp(ROT_mX_Y_Z, TR_0_12_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_12_12_0),
+        (ROT_mX_Y_mZ, TR_0_0_0),
+        (ROT_X_mY_mZ, TR_12_12_0),
+        (ROT_mX_mY_mZ, TR_0_12_12),
+        (ROT_X_Y_mZ, TR_12_0_12),
+        (ROT_X_mY_Z, TR_0_12_12),
+        (ROT_mX_Y_Z, TR_12_0_12),
+        (ROT_X_Y_Z, TR_12_12_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mX_Y_mZ, TR_12_12_0),
+        (ROT_X_mY_mZ, TR_0_0_0),
+        (ROT_mX_mY_mZ, TR_12_0_12),
+        (ROT_X_Y_mZ, TR_0_12_12),
+        (ROT_X_mY_Z, TR_12_0_12),
+        (ROT_mX_Y_Z, TR_0_12_12)])
 
 sg69 = SpaceGroup(
     number=69,
@@ -1329,39 +1327,39 @@ sg69 = SpaceGroup(
     point_group_name="PGmmm",
     crystal_system=ORTHORHOMBIC,
     pdb_name="F 2/m 2/m 2/m",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mX_Y_mZ, TR_0_0_0),
-        SymOp(ROT_X_mY_mZ, TR_0_0_0),
-        SymOp(ROT_mX_mY_mZ, TR_0_0_0),
-        SymOp(ROT_X_Y_mZ, TR_0_0_0),
-        SymOp(ROT_X_mY_Z, TR_0_0_0),
-        SymOp(ROT_mX_Y_Z, TR_0_0_0),
-        SymOp(ROT_X_Y_Z, TR_0_12_12),
-        SymOp(ROT_mX_mY_Z, TR_0_12_12),
-        SymOp(ROT_mX_Y_mZ, TR_0_12_12),
-        SymOp(ROT_X_mY_mZ, TR_0_12_12),
-        SymOp(ROT_mX_mY_mZ, TR_0_12_12),
-        SymOp(ROT_X_Y_mZ, TR_0_12_12),
-        SymOp(ROT_X_mY_Z, TR_0_12_12),
-        SymOp(ROT_mX_Y_Z, TR_0_12_12),
-        SymOp(ROT_X_Y_Z, TR_12_0_12),
-        SymOp(ROT_mX_mY_Z, TR_12_0_12),
-        SymOp(ROT_mX_Y_mZ, TR_12_0_12),
-        SymOp(ROT_X_mY_mZ, TR_12_0_12),
-        SymOp(ROT_mX_mY_mZ, TR_12_0_12),
-        SymOp(ROT_X_Y_mZ, TR_12_0_12),
-        SymOp(ROT_X_mY_Z, TR_12_0_12),
-        SymOp(ROT_mX_Y_Z, TR_12_0_12),
-        SymOp(ROT_X_Y_Z, TR_12_12_0),
-        SymOp(ROT_mX_mY_Z, TR_12_12_0),
-        SymOp(ROT_mX_Y_mZ, TR_12_12_0),
-        SymOp(ROT_X_mY_mZ, TR_12_12_0),
-        SymOp(ROT_mX_mY_mZ, TR_12_12_0),
-        SymOp(ROT_X_Y_mZ, TR_12_12_0),
-        SymOp(ROT_X_mY_Z, TR_12_12_0),
-        SymOp(ROT_mX_Y_Z, TR_12_12_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mX_Y_mZ, TR_0_0_0),
+        (ROT_X_mY_mZ, TR_0_0_0),
+        (ROT_mX_mY_mZ, TR_0_0_0),
+        (ROT_X_Y_mZ, TR_0_0_0),
+        (ROT_X_mY_Z, TR_0_0_0),
+        (ROT_mX_Y_Z, TR_0_0_0),
+        (ROT_X_Y_Z, TR_0_12_12),
+        (ROT_mX_mY_Z, TR_0_12_12),
+        (ROT_mX_Y_mZ, TR_0_12_12),
+        (ROT_X_mY_mZ, TR_0_12_12),
+        (ROT_mX_mY_mZ, TR_0_12_12),
+        (ROT_X_Y_mZ, TR_0_12_12),
+        (ROT_X_mY_Z, TR_0_12_12),
+        (ROT_mX_Y_Z, TR_0_12_12),
+        (ROT_X_Y_Z, TR_12_0_12),
+        (ROT_mX_mY_Z, TR_12_0_12),
+        (ROT_mX_Y_mZ, TR_12_0_12),
+        (ROT_X_mY_mZ, TR_12_0_12),
+        (ROT_mX_mY_mZ, TR_12_0_12),
+        (ROT_X_Y_mZ, TR_12_0_12),
+        (ROT_X_mY_Z, TR_12_0_12),
+        (ROT_mX_Y_Z, TR_12_0_12),
+        (ROT_X_Y_Z, TR_12_12_0),
+        (ROT_mX_mY_Z, TR_12_12_0),
+        (ROT_mX_Y_mZ, TR_12_12_0),
+        (ROT_X_mY_mZ, TR_12_12_0),
+        (ROT_mX_mY_mZ, TR_12_12_0),
+        (ROT_X_Y_mZ, TR_12_12_0),
+        (ROT_X_mY_Z, TR_12_12_0),
+        (ROT_mX_Y_Z, TR_12_12_0)])
 
 sg70 = SpaceGroup(
     number=70,
@@ -1371,39 +1369,39 @@ sg70 = SpaceGroup(
     point_group_name="PGmmm",
     crystal_system=ORTHORHOMBIC,
     pdb_name="F 2/d 2/d 2/d",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mX_Y_mZ, TR_0_0_0),
-        SymOp(ROT_X_mY_mZ, TR_0_0_0),
-        SymOp(ROT_mX_mY_mZ, TR_14_14_14),
-        SymOp(ROT_X_Y_mZ, TR_14_14_14),
-        SymOp(ROT_X_mY_Z, TR_14_14_14),
-        SymOp(ROT_mX_Y_Z, TR_14_14_14),
-        SymOp(ROT_X_Y_Z, TR_0_12_12),
-        SymOp(ROT_mX_mY_Z, TR_0_12_12),
-        SymOp(ROT_mX_Y_mZ, TR_0_12_12),
-        SymOp(ROT_X_mY_mZ, TR_0_12_12),
-        SymOp(ROT_mX_mY_mZ, TR_14_34_34),
-        SymOp(ROT_X_Y_mZ, TR_14_34_34),
-        SymOp(ROT_X_mY_Z, TR_14_34_34),
-        SymOp(ROT_mX_Y_Z, TR_14_34_34),
-        SymOp(ROT_X_Y_Z, TR_12_0_12),
-        SymOp(ROT_mX_mY_Z, TR_12_0_12),
-        SymOp(ROT_mX_Y_mZ, TR_12_0_12),
-        SymOp(ROT_X_mY_mZ, TR_12_0_12),
-        SymOp(ROT_mX_mY_mZ, TR_34_14_34),
-        SymOp(ROT_X_Y_mZ, TR_34_14_34),
-        SymOp(ROT_X_mY_Z, TR_34_14_34),
-        SymOp(ROT_mX_Y_Z, TR_34_14_34),
-        SymOp(ROT_X_Y_Z, TR_12_12_0),
-        SymOp(ROT_mX_mY_Z, TR_12_12_0),
-        SymOp(ROT_mX_Y_mZ, TR_12_12_0),
-        SymOp(ROT_X_mY_mZ, TR_12_12_0),
-        SymOp(ROT_mX_mY_mZ, TR_34_34_14),
-        SymOp(ROT_X_Y_mZ, TR_34_34_14),
-        SymOp(ROT_X_mY_Z, TR_34_34_14),
-        SymOp(ROT_mX_Y_Z, TR_34_34_14)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mX_Y_mZ, TR_0_0_0),
+        (ROT_X_mY_mZ, TR_0_0_0),
+        (ROT_mX_mY_mZ, TR_14_14_14),
+        (ROT_X_Y_mZ, TR_14_14_14),
+        (ROT_X_mY_Z, TR_14_14_14),
+        (ROT_mX_Y_Z, TR_14_14_14),
+        (ROT_X_Y_Z, TR_0_12_12),
+        (ROT_mX_mY_Z, TR_0_12_12),
+        (ROT_mX_Y_mZ, TR_0_12_12),
+        (ROT_X_mY_mZ, TR_0_12_12),
+        (ROT_mX_mY_mZ, TR_14_34_34),
+        (ROT_X_Y_mZ, TR_14_34_34),
+        (ROT_X_mY_Z, TR_14_34_34),
+        (ROT_mX_Y_Z, TR_14_34_34),
+        (ROT_X_Y_Z, TR_12_0_12),
+        (ROT_mX_mY_Z, TR_12_0_12),
+        (ROT_mX_Y_mZ, TR_12_0_12),
+        (ROT_X_mY_mZ, TR_12_0_12),
+        (ROT_mX_mY_mZ, TR_34_14_34),
+        (ROT_X_Y_mZ, TR_34_14_34),
+        (ROT_X_mY_Z, TR_34_14_34),
+        (ROT_mX_Y_Z, TR_34_14_34),
+        (ROT_X_Y_Z, TR_12_12_0),
+        (ROT_mX_mY_Z, TR_12_12_0),
+        (ROT_mX_Y_mZ, TR_12_12_0),
+        (ROT_X_mY_mZ, TR_12_12_0),
+        (ROT_mX_mY_mZ, TR_34_34_14),
+        (ROT_X_Y_mZ, TR_34_34_14),
+        (ROT_X_mY_Z, TR_34_34_14),
+        (ROT_mX_Y_Z, TR_34_34_14)])
 
 sg71 = SpaceGroup(
     number=71,
@@ -1413,23 +1411,23 @@ sg71 = SpaceGroup(
     point_group_name="PGmmm",
     crystal_system=ORTHORHOMBIC,
     pdb_name="I 2/m 2/m 2/m",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mX_Y_mZ, TR_0_0_0),
-        SymOp(ROT_X_mY_mZ, TR_0_0_0),
-        SymOp(ROT_mX_mY_mZ, TR_0_0_0),
-        SymOp(ROT_X_Y_mZ, TR_0_0_0),
-        SymOp(ROT_X_mY_Z, TR_0_0_0),
-        SymOp(ROT_mX_Y_Z, TR_0_0_0),
-        SymOp(ROT_X_Y_Z, TR_12_12_12),
-        SymOp(ROT_mX_mY_Z, TR_12_12_12),
-        SymOp(ROT_mX_Y_mZ, TR_12_12_12),
-        SymOp(ROT_X_mY_mZ, TR_12_12_12),
-        SymOp(ROT_mX_mY_mZ, TR_12_12_12),
-        SymOp(ROT_X_Y_mZ, TR_12_12_12),
-        SymOp(ROT_X_mY_Z, TR_12_12_12),
-        SymOp(ROT_mX_Y_Z, TR_12_12_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mX_Y_mZ, TR_0_0_0),
+        (ROT_X_mY_mZ, TR_0_0_0),
+        (ROT_mX_mY_mZ, TR_0_0_0),
+        (ROT_X_Y_mZ, TR_0_0_0),
+        (ROT_X_mY_Z, TR_0_0_0),
+        (ROT_mX_Y_Z, TR_0_0_0),
+        (ROT_X_Y_Z, TR_12_12_12),
+        (ROT_mX_mY_Z, TR_12_12_12),
+        (ROT_mX_Y_mZ, TR_12_12_12),
+        (ROT_X_mY_mZ, TR_12_12_12),
+        (ROT_mX_mY_mZ, TR_12_12_12),
+        (ROT_X_Y_mZ, TR_12_12_12),
+        (ROT_X_mY_Z, TR_12_12_12),
+        (ROT_mX_Y_Z, TR_12_12_12)])
 
 sg72 = SpaceGroup(
     number=72,
@@ -1439,23 +1437,23 @@ sg72 = SpaceGroup(
     point_group_name="PGmmm",
     crystal_system=ORTHORHOMBIC,
     pdb_name="I 2/b 2/a 2/m",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mX_Y_mZ, TR_12_12_0),
-        SymOp(ROT_X_mY_mZ, TR_12_12_0),
-        SymOp(ROT_mX_mY_mZ, TR_0_0_0),
-        SymOp(ROT_X_Y_mZ, TR_0_0_0),
-        SymOp(ROT_X_mY_Z, TR_12_12_0),
-        SymOp(ROT_mX_Y_Z, TR_12_12_0),
-        SymOp(ROT_X_Y_Z, TR_12_12_12),
-        SymOp(ROT_mX_mY_Z, TR_12_12_12),
-        SymOp(ROT_mX_Y_mZ, TR_0_0_12),
-        SymOp(ROT_X_mY_mZ, TR_0_0_12),
-        SymOp(ROT_mX_mY_mZ, TR_12_12_12),
-        SymOp(ROT_X_Y_mZ, TR_12_12_12),
-        SymOp(ROT_X_mY_Z, TR_0_0_12),
-        SymOp(ROT_mX_Y_Z, TR_0_0_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mX_Y_mZ, TR_12_12_0),
+        (ROT_X_mY_mZ, TR_12_12_0),
+        (ROT_mX_mY_mZ, TR_0_0_0),
+        (ROT_X_Y_mZ, TR_0_0_0),
+        (ROT_X_mY_Z, TR_12_12_0),
+        (ROT_mX_Y_Z, TR_12_12_0),
+        (ROT_X_Y_Z, TR_12_12_12),
+        (ROT_mX_mY_Z, TR_12_12_12),
+        (ROT_mX_Y_mZ, TR_0_0_12),
+        (ROT_X_mY_mZ, TR_0_0_12),
+        (ROT_mX_mY_mZ, TR_12_12_12),
+        (ROT_X_Y_mZ, TR_12_12_12),
+        (ROT_X_mY_Z, TR_0_0_12),
+        (ROT_mX_Y_Z, TR_0_0_12)])
 
 sg73 = SpaceGroup(
     number=73,
@@ -1465,23 +1463,23 @@ sg73 = SpaceGroup(
     point_group_name="PGmmm",
     crystal_system=ORTHORHOMBIC,
     pdb_name="I 21/b 21/c 21/a",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_12_0_12),
-        SymOp(ROT_mX_Y_mZ, TR_0_12_12),
-        SymOp(ROT_X_mY_mZ, TR_12_12_0),
-        SymOp(ROT_mX_mY_mZ, TR_0_0_0),
-        SymOp(ROT_X_Y_mZ, TR_12_0_12),
-        SymOp(ROT_X_mY_Z, TR_0_12_12),
-        SymOp(ROT_mX_Y_Z, TR_12_12_0),
-        SymOp(ROT_X_Y_Z, TR_12_12_12),
-        SymOp(ROT_mX_mY_Z, TR_0_12_0),
-        SymOp(ROT_mX_Y_mZ, TR_12_0_0),
-        SymOp(ROT_X_mY_mZ, TR_0_0_12),
-        SymOp(ROT_mX_mY_mZ, TR_12_12_12),
-        SymOp(ROT_X_Y_mZ, TR_0_12_0),
-        SymOp(ROT_X_mY_Z, TR_12_0_0),
-        SymOp(ROT_mX_Y_Z, TR_0_0_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_12_0_12),
+        (ROT_mX_Y_mZ, TR_0_12_12),
+        (ROT_X_mY_mZ, TR_12_12_0),
+        (ROT_mX_mY_mZ, TR_0_0_0),
+        (ROT_X_Y_mZ, TR_12_0_12),
+        (ROT_X_mY_Z, TR_0_12_12),
+        (ROT_mX_Y_Z, TR_12_12_0),
+        (ROT_X_Y_Z, TR_12_12_12),
+        (ROT_mX_mY_Z, TR_0_12_0),
+        (ROT_mX_Y_mZ, TR_12_0_0),
+        (ROT_X_mY_mZ, TR_0_0_12),
+        (ROT_mX_mY_mZ, TR_12_12_12),
+        (ROT_X_Y_mZ, TR_0_12_0),
+        (ROT_X_mY_Z, TR_12_0_0),
+        (ROT_mX_Y_Z, TR_0_0_12)])
 
 sg74 = SpaceGroup(
     number=74,
@@ -1491,23 +1489,23 @@ sg74 = SpaceGroup(
     point_group_name="PGmmm",
     crystal_system=ORTHORHOMBIC,
     pdb_name="I 21/m 21/m 21/a",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_12_0),
-        SymOp(ROT_mX_Y_mZ, TR_0_12_0),
-        SymOp(ROT_X_mY_mZ, TR_0_0_0),
-        SymOp(ROT_mX_mY_mZ, TR_0_0_0),
-        SymOp(ROT_X_Y_mZ, TR_0_12_0),
-        SymOp(ROT_X_mY_Z, TR_0_12_0),
-        SymOp(ROT_mX_Y_Z, TR_0_0_0),
-        SymOp(ROT_X_Y_Z, TR_12_12_12),
-        SymOp(ROT_mX_mY_Z, TR_12_0_12),
-        SymOp(ROT_mX_Y_mZ, TR_12_0_12),
-        SymOp(ROT_X_mY_mZ, TR_12_12_12),
-        SymOp(ROT_mX_mY_mZ, TR_12_12_12),
-        SymOp(ROT_X_Y_mZ, TR_12_0_12),
-        SymOp(ROT_X_mY_Z, TR_12_0_12),
-        SymOp(ROT_mX_Y_Z, TR_12_12_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_12_0),
+        (ROT_mX_Y_mZ, TR_0_12_0),
+        (ROT_X_mY_mZ, TR_0_0_0),
+        (ROT_mX_mY_mZ, TR_0_0_0),
+        (ROT_X_Y_mZ, TR_0_12_0),
+        (ROT_X_mY_Z, TR_0_12_0),
+        (ROT_mX_Y_Z, TR_0_0_0),
+        (ROT_X_Y_Z, TR_12_12_12),
+        (ROT_mX_mY_Z, TR_12_0_12),
+        (ROT_mX_Y_mZ, TR_12_0_12),
+        (ROT_X_mY_mZ, TR_12_12_12),
+        (ROT_mX_mY_mZ, TR_12_12_12),
+        (ROT_X_Y_mZ, TR_12_0_12),
+        (ROT_X_mY_Z, TR_12_0_12),
+        (ROT_mX_Y_Z, TR_12_12_12)])
 
 sg75 = SpaceGroup(
     number=75,
@@ -1517,11 +1515,11 @@ sg75 = SpaceGroup(
     point_group_name="PG4",
     crystal_system=TETRAGONAL,
     pdb_name="P 4",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mY_X_Z, TR_0_0_0),
-        SymOp(ROT_Y_mX_Z, TR_0_0_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mY_X_Z, TR_0_0_0),
+        (ROT_Y_mX_Z, TR_0_0_0)])
 
 sg76 = SpaceGroup(
     number=76,
@@ -1531,11 +1529,11 @@ sg76 = SpaceGroup(
     point_group_name="PG4",
     crystal_system=TETRAGONAL,
     pdb_name="P 41",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_12),
-        SymOp(ROT_mY_X_Z, TR_0_0_14),
-        SymOp(ROT_Y_mX_Z, TR_0_0_34)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_12),
+        (ROT_mY_X_Z, TR_0_0_14),
+        (ROT_Y_mX_Z, TR_0_0_34)])
 
 sg77 = SpaceGroup(
     number=77,
@@ -1545,11 +1543,11 @@ sg77 = SpaceGroup(
     point_group_name="PG4",
     crystal_system=TETRAGONAL,
     pdb_name="P 42",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mY_X_Z, TR_0_0_12),
-        SymOp(ROT_Y_mX_Z, TR_0_0_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mY_X_Z, TR_0_0_12),
+        (ROT_Y_mX_Z, TR_0_0_12)])
 
 sg78 = SpaceGroup(
     number=78,
@@ -1559,11 +1557,11 @@ sg78 = SpaceGroup(
     point_group_name="PG4",
     crystal_system=TETRAGONAL,
     pdb_name="P 43",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_12),
-        SymOp(ROT_mY_X_Z, TR_0_0_34),
-        SymOp(ROT_Y_mX_Z, TR_0_0_14)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_12),
+        (ROT_mY_X_Z, TR_0_0_34),
+        (ROT_Y_mX_Z, TR_0_0_14)])
 
 sg79 = SpaceGroup(
     number=79,
@@ -1573,15 +1571,15 @@ sg79 = SpaceGroup(
     point_group_name="PG4",
     crystal_system=TETRAGONAL,
     pdb_name="I 4",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mY_X_Z, TR_0_0_0),
-        SymOp(ROT_Y_mX_Z, TR_0_0_0),
-        SymOp(ROT_X_Y_Z, TR_12_12_12),
-        SymOp(ROT_mX_mY_Z, TR_12_12_12),
-        SymOp(ROT_mY_X_Z, TR_12_12_12),
-        SymOp(ROT_Y_mX_Z, TR_12_12_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mY_X_Z, TR_0_0_0),
+        (ROT_Y_mX_Z, TR_0_0_0),
+        (ROT_X_Y_Z, TR_12_12_12),
+        (ROT_mX_mY_Z, TR_12_12_12),
+        (ROT_mY_X_Z, TR_12_12_12),
+        (ROT_Y_mX_Z, TR_12_12_12)])
 
 sg80 = SpaceGroup(
     number=80,
@@ -1591,15 +1589,15 @@ sg80 = SpaceGroup(
     point_group_name="PG4",
     crystal_system=TETRAGONAL,
     pdb_name="I 41",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_12_12_12),
-        SymOp(ROT_mY_X_Z, TR_0_12_14),
-        SymOp(ROT_Y_mX_Z, TR_12_0_34),
-        SymOp(ROT_X_Y_Z, TR_12_12_12),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mY_X_Z, TR_12_0_34),
-        SymOp(ROT_Y_mX_Z, TR_0_12_14)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_12_12_12),
+        (ROT_mY_X_Z, TR_0_12_14),
+        (ROT_Y_mX_Z, TR_12_0_34),
+        (ROT_X_Y_Z, TR_12_12_12),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mY_X_Z, TR_12_0_34),
+        (ROT_Y_mX_Z, TR_0_12_14)])
 
 sg81 = SpaceGroup(
     number=81,
@@ -1609,11 +1607,11 @@ sg81 = SpaceGroup(
     point_group_name="PG4bar",
     crystal_system=TETRAGONAL,
     pdb_name="P -4",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_Y_mX_mZ, TR_0_0_0),
-        SymOp(ROT_mY_X_mZ, TR_0_0_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_Y_mX_mZ, TR_0_0_0),
+        (ROT_mY_X_mZ, TR_0_0_0)])
 
 sg82 = SpaceGroup(
     number=82,
@@ -1623,15 +1621,15 @@ sg82 = SpaceGroup(
     point_group_name="PG4bar",
     crystal_system=TETRAGONAL,
     pdb_name="I -4",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_Y_mX_mZ, TR_0_0_0),
-        SymOp(ROT_mY_X_mZ, TR_0_0_0),
-        SymOp(ROT_X_Y_Z, TR_12_12_12),
-        SymOp(ROT_mX_mY_Z, TR_12_12_12),
-        SymOp(ROT_Y_mX_mZ, TR_12_12_12),
-        SymOp(ROT_mY_X_mZ, TR_12_12_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_Y_mX_mZ, TR_0_0_0),
+        (ROT_mY_X_mZ, TR_0_0_0),
+        (ROT_X_Y_Z, TR_12_12_12),
+        (ROT_mX_mY_Z, TR_12_12_12),
+        (ROT_Y_mX_mZ, TR_12_12_12),
+        (ROT_mY_X_mZ, TR_12_12_12)])
 
 sg83 = SpaceGroup(
     number=83,
@@ -1641,15 +1639,15 @@ sg83 = SpaceGroup(
     point_group_name="PG4/m",
     crystal_system=TETRAGONAL,
     pdb_name="P 4/m",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mY_X_Z, TR_0_0_0),
-        SymOp(ROT_Y_mX_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_mZ, TR_0_0_0),
-        SymOp(ROT_X_Y_mZ, TR_0_0_0),
-        SymOp(ROT_Y_mX_mZ, TR_0_0_0),
-        SymOp(ROT_mY_X_mZ, TR_0_0_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mY_X_Z, TR_0_0_0),
+        (ROT_Y_mX_Z, TR_0_0_0),
+        (ROT_mX_mY_mZ, TR_0_0_0),
+        (ROT_X_Y_mZ, TR_0_0_0),
+        (ROT_Y_mX_mZ, TR_0_0_0),
+        (ROT_mY_X_mZ, TR_0_0_0)])
 
 sg84 = SpaceGroup(
     number=84,
@@ -1659,15 +1657,15 @@ sg84 = SpaceGroup(
     point_group_name="PG4/m",
     crystal_system=TETRAGONAL,
     pdb_name="P 42/m",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mY_X_Z, TR_0_0_12),
-        SymOp(ROT_Y_mX_Z, TR_0_0_12),
-        SymOp(ROT_mX_mY_mZ, TR_0_0_0),
-        SymOp(ROT_X_Y_mZ, TR_0_0_0),
-        SymOp(ROT_Y_mX_mZ, TR_0_0_12),
-        SymOp(ROT_mY_X_mZ, TR_0_0_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mY_X_Z, TR_0_0_12),
+        (ROT_Y_mX_Z, TR_0_0_12),
+        (ROT_mX_mY_mZ, TR_0_0_0),
+        (ROT_X_Y_mZ, TR_0_0_0),
+        (ROT_Y_mX_mZ, TR_0_0_12),
+        (ROT_mY_X_mZ, TR_0_0_12)])
 
 sg85 = SpaceGroup(
     number=85,
@@ -1677,15 +1675,15 @@ sg85 = SpaceGroup(
     point_group_name="PG4/m",
     crystal_system=TETRAGONAL,
     pdb_name="P 4/n",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mY_X_Z, TR_12_12_0),
-        SymOp(ROT_Y_mX_Z, TR_12_12_0),
-        SymOp(ROT_mX_mY_mZ, TR_12_12_0),
-        SymOp(ROT_X_Y_mZ, TR_12_12_0),
-        SymOp(ROT_Y_mX_mZ, TR_0_0_0),
-        SymOp(ROT_mY_X_mZ, TR_0_0_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mY_X_Z, TR_12_12_0),
+        (ROT_Y_mX_Z, TR_12_12_0),
+        (ROT_mX_mY_mZ, TR_12_12_0),
+        (ROT_X_Y_mZ, TR_12_12_0),
+        (ROT_Y_mX_mZ, TR_0_0_0),
+        (ROT_mY_X_mZ, TR_0_0_0)])
 
 sg86 = SpaceGroup(
     number=86,
@@ -1695,15 +1693,15 @@ sg86 = SpaceGroup(
     point_group_name="PG4/m",
     crystal_system=TETRAGONAL,
     pdb_name="P 42/n",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mY_X_Z, TR_12_12_12),
-        SymOp(ROT_Y_mX_Z, TR_12_12_12),
-        SymOp(ROT_mX_mY_mZ, TR_12_12_12),
-        SymOp(ROT_X_Y_mZ, TR_12_12_12),
-        SymOp(ROT_Y_mX_mZ, TR_0_0_0),
-        SymOp(ROT_mY_X_mZ, TR_0_0_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mY_X_Z, TR_12_12_12),
+        (ROT_Y_mX_Z, TR_12_12_12),
+        (ROT_mX_mY_mZ, TR_12_12_12),
+        (ROT_X_Y_mZ, TR_12_12_12),
+        (ROT_Y_mX_mZ, TR_0_0_0),
+        (ROT_mY_X_mZ, TR_0_0_0)])
 
 sg87 = SpaceGroup(
     number=87,
@@ -1713,23 +1711,23 @@ sg87 = SpaceGroup(
     point_group_name="PG4/m",
     crystal_system=TETRAGONAL,
     pdb_name="I 4/m",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mY_X_Z, TR_0_0_0),
-        SymOp(ROT_Y_mX_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_mZ, TR_0_0_0),
-        SymOp(ROT_X_Y_mZ, TR_0_0_0),
-        SymOp(ROT_Y_mX_mZ, TR_0_0_0),
-        SymOp(ROT_mY_X_mZ, TR_0_0_0),
-        SymOp(ROT_X_Y_Z, TR_12_12_12),
-        SymOp(ROT_mX_mY_Z, TR_12_12_12),
-        SymOp(ROT_mY_X_Z, TR_12_12_12),
-        SymOp(ROT_Y_mX_Z, TR_12_12_12),
-        SymOp(ROT_mX_mY_mZ, TR_12_12_12),
-        SymOp(ROT_X_Y_mZ, TR_12_12_12),
-        SymOp(ROT_Y_mX_mZ, TR_12_12_12),
-        SymOp(ROT_mY_X_mZ, TR_12_12_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mY_X_Z, TR_0_0_0),
+        (ROT_Y_mX_Z, TR_0_0_0),
+        (ROT_mX_mY_mZ, TR_0_0_0),
+        (ROT_X_Y_mZ, TR_0_0_0),
+        (ROT_Y_mX_mZ, TR_0_0_0),
+        (ROT_mY_X_mZ, TR_0_0_0),
+        (ROT_X_Y_Z, TR_12_12_12),
+        (ROT_mX_mY_Z, TR_12_12_12),
+        (ROT_mY_X_Z, TR_12_12_12),
+        (ROT_Y_mX_Z, TR_12_12_12),
+        (ROT_mX_mY_mZ, TR_12_12_12),
+        (ROT_X_Y_mZ, TR_12_12_12),
+        (ROT_Y_mX_mZ, TR_12_12_12),
+        (ROT_mY_X_mZ, TR_12_12_12)])
 
 sg88 = SpaceGroup(
     number=88,
@@ -1739,23 +1737,23 @@ sg88 = SpaceGroup(
     point_group_name="PG4/m",
     crystal_system=TETRAGONAL,
     pdb_name="I 41/a",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_12_12_12),
-        SymOp(ROT_mY_X_Z, TR_0_12_14),
-        SymOp(ROT_Y_mX_Z, TR_12_0_34),
-        SymOp(ROT_mX_mY_mZ, TR_0_12_14),
-        SymOp(ROT_X_Y_mZ, TR_12_0_34),
-        SymOp(ROT_Y_mX_mZ, TR_0_0_0),
-        SymOp(ROT_mY_X_mZ, TR_12_12_12),
-        SymOp(ROT_X_Y_Z, TR_12_12_12),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mY_X_Z, TR_12_0_34),
-        SymOp(ROT_Y_mX_Z, TR_0_12_14),
-        SymOp(ROT_mX_mY_mZ, TR_12_0_34),
-        SymOp(ROT_X_Y_mZ, TR_0_12_14),
-        SymOp(ROT_Y_mX_mZ, TR_12_12_12),
-        SymOp(ROT_mY_X_mZ, TR_0_0_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_12_12_12),
+        (ROT_mY_X_Z, TR_0_12_14),
+        (ROT_Y_mX_Z, TR_12_0_34),
+        (ROT_mX_mY_mZ, TR_0_12_14),
+        (ROT_X_Y_mZ, TR_12_0_34),
+        (ROT_Y_mX_mZ, TR_0_0_0),
+        (ROT_mY_X_mZ, TR_12_12_12),
+        (ROT_X_Y_Z, TR_12_12_12),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mY_X_Z, TR_12_0_34),
+        (ROT_Y_mX_Z, TR_0_12_14),
+        (ROT_mX_mY_mZ, TR_12_0_34),
+        (ROT_X_Y_mZ, TR_0_12_14),
+        (ROT_Y_mX_mZ, TR_12_12_12),
+        (ROT_mY_X_mZ, TR_0_0_0)])
 
 sg89 = SpaceGroup(
     number=89,
@@ -1765,15 +1763,15 @@ sg89 = SpaceGroup(
     point_group_name="PG422",
     crystal_system=TETRAGONAL,
     pdb_name="P 4 2 2",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mY_X_Z, TR_0_0_0),
-        SymOp(ROT_Y_mX_Z, TR_0_0_0),
-        SymOp(ROT_mX_Y_mZ, TR_0_0_0),
-        SymOp(ROT_X_mY_mZ, TR_0_0_0),
-        SymOp(ROT_Y_X_mZ, TR_0_0_0),
-        SymOp(ROT_mY_mX_mZ, TR_0_0_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mY_X_Z, TR_0_0_0),
+        (ROT_Y_mX_Z, TR_0_0_0),
+        (ROT_mX_Y_mZ, TR_0_0_0),
+        (ROT_X_mY_mZ, TR_0_0_0),
+        (ROT_Y_X_mZ, TR_0_0_0),
+        (ROT_mY_mX_mZ, TR_0_0_0)])
 
 sg90 = SpaceGroup(
     number=90,
@@ -1783,15 +1781,15 @@ sg90 = SpaceGroup(
     point_group_name="PG422",
     crystal_system=TETRAGONAL,
     pdb_name="P 4 21 2",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mY_X_Z, TR_12_12_0),
-        SymOp(ROT_Y_mX_Z, TR_12_12_0),
-        SymOp(ROT_mX_Y_mZ, TR_12_12_0),
-        SymOp(ROT_X_mY_mZ, TR_12_12_0),
-        SymOp(ROT_Y_X_mZ, TR_0_0_0),
-        SymOp(ROT_mY_mX_mZ, TR_0_0_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mY_X_Z, TR_12_12_0),
+        (ROT_Y_mX_Z, TR_12_12_0),
+        (ROT_mX_Y_mZ, TR_12_12_0),
+        (ROT_X_mY_mZ, TR_12_12_0),
+        (ROT_Y_X_mZ, TR_0_0_0),
+        (ROT_mY_mX_mZ, TR_0_0_0)])
 
 sg91 = SpaceGroup(
     number=91,
@@ -1801,15 +1799,15 @@ sg91 = SpaceGroup(
     point_group_name="PG422",
     crystal_system=TETRAGONAL,
     pdb_name="P 41 2 2",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_12),
-        SymOp(ROT_mY_X_Z, TR_0_0_14),
-        SymOp(ROT_Y_mX_Z, TR_0_0_34),
-        SymOp(ROT_mX_Y_mZ, TR_0_0_0),
-        SymOp(ROT_X_mY_mZ, TR_0_0_12),
-        SymOp(ROT_Y_X_mZ, TR_0_0_34),
-        SymOp(ROT_mY_mX_mZ, TR_0_0_14)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_12),
+        (ROT_mY_X_Z, TR_0_0_14),
+        (ROT_Y_mX_Z, TR_0_0_34),
+        (ROT_mX_Y_mZ, TR_0_0_0),
+        (ROT_X_mY_mZ, TR_0_0_12),
+        (ROT_Y_X_mZ, TR_0_0_34),
+        (ROT_mY_mX_mZ, TR_0_0_14)])
 
 sg92 = SpaceGroup(
     number=92,
@@ -1819,15 +1817,15 @@ sg92 = SpaceGroup(
     point_group_name="PG422",
     crystal_system=TETRAGONAL,
     pdb_name="P 41 21 2",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_12),
-        SymOp(ROT_mY_X_Z, TR_12_12_14),
-        SymOp(ROT_Y_mX_Z, TR_12_12_34),
-        SymOp(ROT_mX_Y_mZ, TR_12_12_14),
-        SymOp(ROT_X_mY_mZ, TR_12_12_34),
-        SymOp(ROT_Y_X_mZ, TR_0_0_0),
-        SymOp(ROT_mY_mX_mZ, TR_0_0_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_12),
+        (ROT_mY_X_Z, TR_12_12_14),
+        (ROT_Y_mX_Z, TR_12_12_34),
+        (ROT_mX_Y_mZ, TR_12_12_14),
+        (ROT_X_mY_mZ, TR_12_12_34),
+        (ROT_Y_X_mZ, TR_0_0_0),
+        (ROT_mY_mX_mZ, TR_0_0_12)])
 
 sg93 = SpaceGroup(
     number=93,
@@ -1837,15 +1835,15 @@ sg93 = SpaceGroup(
     point_group_name="PG422",
     crystal_system=TETRAGONAL,
     pdb_name="P 42 2 2",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mY_X_Z, TR_0_0_12),
-        SymOp(ROT_Y_mX_Z, TR_0_0_12),
-        SymOp(ROT_mX_Y_mZ, TR_0_0_0),
-        SymOp(ROT_X_mY_mZ, TR_0_0_0),
-        SymOp(ROT_Y_X_mZ, TR_0_0_12),
-        SymOp(ROT_mY_mX_mZ, TR_0_0_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mY_X_Z, TR_0_0_12),
+        (ROT_Y_mX_Z, TR_0_0_12),
+        (ROT_mX_Y_mZ, TR_0_0_0),
+        (ROT_X_mY_mZ, TR_0_0_0),
+        (ROT_Y_X_mZ, TR_0_0_12),
+        (ROT_mY_mX_mZ, TR_0_0_12)])
 
 sg94 = SpaceGroup(
     number=94,
@@ -1855,15 +1853,15 @@ sg94 = SpaceGroup(
     point_group_name="PG422",
     crystal_system=TETRAGONAL,
     pdb_name="P 42 21 2",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mY_X_Z, TR_12_12_12),
-        SymOp(ROT_Y_mX_Z, TR_12_12_12),
-        SymOp(ROT_mX_Y_mZ, TR_12_12_12),
-        SymOp(ROT_X_mY_mZ, TR_12_12_12),
-        SymOp(ROT_Y_X_mZ, TR_0_0_0),
-        SymOp(ROT_mY_mX_mZ, TR_0_0_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mY_X_Z, TR_12_12_12),
+        (ROT_Y_mX_Z, TR_12_12_12),
+        (ROT_mX_Y_mZ, TR_12_12_12),
+        (ROT_X_mY_mZ, TR_12_12_12),
+        (ROT_Y_X_mZ, TR_0_0_0),
+        (ROT_mY_mX_mZ, TR_0_0_0)])
 
 sg95 = SpaceGroup(
     number=95,
@@ -1873,15 +1871,15 @@ sg95 = SpaceGroup(
     point_group_name="PG422",
     crystal_system=TETRAGONAL,
     pdb_name="P 43 2 2",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_12),
-        SymOp(ROT_mY_X_Z, TR_0_0_34),
-        SymOp(ROT_Y_mX_Z, TR_0_0_14),
-        SymOp(ROT_mX_Y_mZ, TR_0_0_0),
-        SymOp(ROT_X_mY_mZ, TR_0_0_12),
-        SymOp(ROT_Y_X_mZ, TR_0_0_14),
-        SymOp(ROT_mY_mX_mZ, TR_0_0_34)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_12),
+        (ROT_mY_X_Z, TR_0_0_34),
+        (ROT_Y_mX_Z, TR_0_0_14),
+        (ROT_mX_Y_mZ, TR_0_0_0),
+        (ROT_X_mY_mZ, TR_0_0_12),
+        (ROT_Y_X_mZ, TR_0_0_14),
+        (ROT_mY_mX_mZ, TR_0_0_34)])
 
 sg96 = SpaceGroup(
     number=96,
@@ -1891,15 +1889,15 @@ sg96 = SpaceGroup(
     point_group_name="PG422",
     crystal_system=TETRAGONAL,
     pdb_name="P 43 21 2",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_12),
-        SymOp(ROT_mY_X_Z, TR_12_12_34),
-        SymOp(ROT_Y_mX_Z, TR_12_12_14),
-        SymOp(ROT_mX_Y_mZ, TR_12_12_34),
-        SymOp(ROT_X_mY_mZ, TR_12_12_14),
-        SymOp(ROT_Y_X_mZ, TR_0_0_0),
-        SymOp(ROT_mY_mX_mZ, TR_0_0_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_12),
+        (ROT_mY_X_Z, TR_12_12_34),
+        (ROT_Y_mX_Z, TR_12_12_14),
+        (ROT_mX_Y_mZ, TR_12_12_34),
+        (ROT_X_mY_mZ, TR_12_12_14),
+        (ROT_Y_X_mZ, TR_0_0_0),
+        (ROT_mY_mX_mZ, TR_0_0_12)])
 
 sg97 = SpaceGroup(
     number=97,
@@ -1909,23 +1907,23 @@ sg97 = SpaceGroup(
     point_group_name="PG422",
     crystal_system=TETRAGONAL,
     pdb_name="I 4 2 2",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mY_X_Z, TR_0_0_0),
-        SymOp(ROT_Y_mX_Z, TR_0_0_0),
-        SymOp(ROT_mX_Y_mZ, TR_0_0_0),
-        SymOp(ROT_X_mY_mZ, TR_0_0_0),
-        SymOp(ROT_Y_X_mZ, TR_0_0_0),
-        SymOp(ROT_mY_mX_mZ, TR_0_0_0),
-        SymOp(ROT_X_Y_Z, TR_12_12_12),
-        SymOp(ROT_mX_mY_Z, TR_12_12_12),
-        SymOp(ROT_mY_X_Z, TR_12_12_12),
-        SymOp(ROT_Y_mX_Z, TR_12_12_12),
-        SymOp(ROT_mX_Y_mZ, TR_12_12_12),
-        SymOp(ROT_X_mY_mZ, TR_12_12_12),
-        SymOp(ROT_Y_X_mZ, TR_12_12_12),
-        SymOp(ROT_mY_mX_mZ, TR_12_12_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mY_X_Z, TR_0_0_0),
+        (ROT_Y_mX_Z, TR_0_0_0),
+        (ROT_mX_Y_mZ, TR_0_0_0),
+        (ROT_X_mY_mZ, TR_0_0_0),
+        (ROT_Y_X_mZ, TR_0_0_0),
+        (ROT_mY_mX_mZ, TR_0_0_0),
+        (ROT_X_Y_Z, TR_12_12_12),
+        (ROT_mX_mY_Z, TR_12_12_12),
+        (ROT_mY_X_Z, TR_12_12_12),
+        (ROT_Y_mX_Z, TR_12_12_12),
+        (ROT_mX_Y_mZ, TR_12_12_12),
+        (ROT_X_mY_mZ, TR_12_12_12),
+        (ROT_Y_X_mZ, TR_12_12_12),
+        (ROT_mY_mX_mZ, TR_12_12_12)])
 
 sg98 = SpaceGroup(
     number=98,
@@ -1935,23 +1933,23 @@ sg98 = SpaceGroup(
     point_group_name="PG422",
     crystal_system=TETRAGONAL,
     pdb_name="I 41 2 2",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_12_12_12),
-        SymOp(ROT_mY_X_Z, TR_0_12_14),
-        SymOp(ROT_Y_mX_Z, TR_12_0_34),
-        SymOp(ROT_mX_Y_mZ, TR_12_0_34),
-        SymOp(ROT_X_mY_mZ, TR_0_12_14),
-        SymOp(ROT_Y_X_mZ, TR_12_12_12),
-        SymOp(ROT_mY_mX_mZ, TR_0_0_0),
-        SymOp(ROT_X_Y_Z, TR_12_12_12),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mY_X_Z, TR_12_0_34),
-        SymOp(ROT_Y_mX_Z, TR_0_12_14),
-        SymOp(ROT_mX_Y_mZ, TR_0_12_14),
-        SymOp(ROT_X_mY_mZ, TR_12_0_34),
-        SymOp(ROT_Y_X_mZ, TR_0_0_0),
-        SymOp(ROT_mY_mX_mZ, TR_12_12_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_12_12_12),
+        (ROT_mY_X_Z, TR_0_12_14),
+        (ROT_Y_mX_Z, TR_12_0_34),
+        (ROT_mX_Y_mZ, TR_12_0_34),
+        (ROT_X_mY_mZ, TR_0_12_14),
+        (ROT_Y_X_mZ, TR_12_12_12),
+        (ROT_mY_mX_mZ, TR_0_0_0),
+        (ROT_X_Y_Z, TR_12_12_12),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mY_X_Z, TR_12_0_34),
+        (ROT_Y_mX_Z, TR_0_12_14),
+        (ROT_mX_Y_mZ, TR_0_12_14),
+        (ROT_X_mY_mZ, TR_12_0_34),
+        (ROT_Y_X_mZ, TR_0_0_0),
+        (ROT_mY_mX_mZ, TR_12_12_12)])
 
 sg99 = SpaceGroup(
     number=99,
@@ -1961,15 +1959,15 @@ sg99 = SpaceGroup(
     point_group_name="PG4mm",
     crystal_system=TETRAGONAL,
     pdb_name="P 4 m m",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mY_X_Z, TR_0_0_0),
-        SymOp(ROT_Y_mX_Z, TR_0_0_0),
-        SymOp(ROT_X_mY_Z, TR_0_0_0),
-        SymOp(ROT_mX_Y_Z, TR_0_0_0),
-        SymOp(ROT_mY_mX_Z, TR_0_0_0),
-        SymOp(ROT_Y_X_Z, TR_0_0_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mY_X_Z, TR_0_0_0),
+        (ROT_Y_mX_Z, TR_0_0_0),
+        (ROT_X_mY_Z, TR_0_0_0),
+        (ROT_mX_Y_Z, TR_0_0_0),
+        (ROT_mY_mX_Z, TR_0_0_0),
+        (ROT_Y_X_Z, TR_0_0_0)])
 
 sg100 = SpaceGroup(
     number=100,
@@ -1979,15 +1977,15 @@ sg100 = SpaceGroup(
     point_group_name="PG4mm",
     crystal_system=TETRAGONAL,
     pdb_name="P 4 b m",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mY_X_Z, TR_0_0_0),
-        SymOp(ROT_Y_mX_Z, TR_0_0_0),
-        SymOp(ROT_X_mY_Z, TR_12_12_0),
-        SymOp(ROT_mX_Y_Z, TR_12_12_0),
-        SymOp(ROT_mY_mX_Z, TR_12_12_0),
-        SymOp(ROT_Y_X_Z, TR_12_12_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mY_X_Z, TR_0_0_0),
+        (ROT_Y_mX_Z, TR_0_0_0),
+        (ROT_X_mY_Z, TR_12_12_0),
+        (ROT_mX_Y_Z, TR_12_12_0),
+        (ROT_mY_mX_Z, TR_12_12_0),
+        (ROT_Y_X_Z, TR_12_12_0)])
 
 sg101 = SpaceGroup(
     number=101,
@@ -1997,15 +1995,15 @@ sg101 = SpaceGroup(
     point_group_name="PG4mm",
     crystal_system=TETRAGONAL,
     pdb_name="P 42 c m",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mY_X_Z, TR_0_0_12),
-        SymOp(ROT_Y_mX_Z, TR_0_0_12),
-        SymOp(ROT_X_mY_Z, TR_0_0_12),
-        SymOp(ROT_mX_Y_Z, TR_0_0_12),
-        SymOp(ROT_mY_mX_Z, TR_0_0_0),
-        SymOp(ROT_Y_X_Z, TR_0_0_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mY_X_Z, TR_0_0_12),
+        (ROT_Y_mX_Z, TR_0_0_12),
+        (ROT_X_mY_Z, TR_0_0_12),
+        (ROT_mX_Y_Z, TR_0_0_12),
+        (ROT_mY_mX_Z, TR_0_0_0),
+        (ROT_Y_X_Z, TR_0_0_0)])
 
 sg102 = SpaceGroup(
     number=102,
@@ -2015,15 +2013,15 @@ sg102 = SpaceGroup(
     point_group_name="PG4mm",
     crystal_system=TETRAGONAL,
     pdb_name="P 42 n m",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mY_X_Z, TR_12_12_12),
-        SymOp(ROT_Y_mX_Z, TR_12_12_12),
-        SymOp(ROT_X_mY_Z, TR_12_12_12),
-        SymOp(ROT_mX_Y_Z, TR_12_12_12),
-        SymOp(ROT_mY_mX_Z, TR_0_0_0),
-        SymOp(ROT_Y_X_Z, TR_0_0_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mY_X_Z, TR_12_12_12),
+        (ROT_Y_mX_Z, TR_12_12_12),
+        (ROT_X_mY_Z, TR_12_12_12),
+        (ROT_mX_Y_Z, TR_12_12_12),
+        (ROT_mY_mX_Z, TR_0_0_0),
+        (ROT_Y_X_Z, TR_0_0_0)])
 
 sg103 = SpaceGroup(
     number=103,
@@ -2033,15 +2031,15 @@ sg103 = SpaceGroup(
     point_group_name="PG4mm",
     crystal_system=TETRAGONAL,
     pdb_name="P 4 c c",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mY_X_Z, TR_0_0_0),
-        SymOp(ROT_Y_mX_Z, TR_0_0_0),
-        SymOp(ROT_X_mY_Z, TR_0_0_12),
-        SymOp(ROT_mX_Y_Z, TR_0_0_12),
-        SymOp(ROT_mY_mX_Z, TR_0_0_12),
-        SymOp(ROT_Y_X_Z, TR_0_0_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mY_X_Z, TR_0_0_0),
+        (ROT_Y_mX_Z, TR_0_0_0),
+        (ROT_X_mY_Z, TR_0_0_12),
+        (ROT_mX_Y_Z, TR_0_0_12),
+        (ROT_mY_mX_Z, TR_0_0_12),
+        (ROT_Y_X_Z, TR_0_0_12)])
 
 sg104 = SpaceGroup(
     number=104,
@@ -2051,15 +2049,15 @@ sg104 = SpaceGroup(
     point_group_name="PG4mm",
     crystal_system=TETRAGONAL,
     pdb_name="P 4 n c",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mY_X_Z, TR_0_0_0),
-        SymOp(ROT_Y_mX_Z, TR_0_0_0),
-        SymOp(ROT_X_mY_Z, TR_12_12_12),
-        SymOp(ROT_mX_Y_Z, TR_12_12_12),
-        SymOp(ROT_mY_mX_Z, TR_12_12_12),
-        SymOp(ROT_Y_X_Z, TR_12_12_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mY_X_Z, TR_0_0_0),
+        (ROT_Y_mX_Z, TR_0_0_0),
+        (ROT_X_mY_Z, TR_12_12_12),
+        (ROT_mX_Y_Z, TR_12_12_12),
+        (ROT_mY_mX_Z, TR_12_12_12),
+        (ROT_Y_X_Z, TR_12_12_12)])
 
 sg105 = SpaceGroup(
     number=105,
@@ -2069,15 +2067,15 @@ sg105 = SpaceGroup(
     point_group_name="PG4mm",
     crystal_system=TETRAGONAL,
     pdb_name="P 42 m c",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mY_X_Z, TR_0_0_12),
-        SymOp(ROT_Y_mX_Z, TR_0_0_12),
-        SymOp(ROT_X_mY_Z, TR_0_0_0),
-        SymOp(ROT_mX_Y_Z, TR_0_0_0),
-        SymOp(ROT_mY_mX_Z, TR_0_0_12),
-        SymOp(ROT_Y_X_Z, TR_0_0_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mY_X_Z, TR_0_0_12),
+        (ROT_Y_mX_Z, TR_0_0_12),
+        (ROT_X_mY_Z, TR_0_0_0),
+        (ROT_mX_Y_Z, TR_0_0_0),
+        (ROT_mY_mX_Z, TR_0_0_12),
+        (ROT_Y_X_Z, TR_0_0_12)])
 
 sg106 = SpaceGroup(
     number=106,
@@ -2087,15 +2085,15 @@ sg106 = SpaceGroup(
     point_group_name="PG4mm",
     crystal_system=TETRAGONAL,
     pdb_name="P 42 b c",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mY_X_Z, TR_0_0_12),
-        SymOp(ROT_Y_mX_Z, TR_0_0_12),
-        SymOp(ROT_X_mY_Z, TR_12_12_0),
-        SymOp(ROT_mX_Y_Z, TR_12_12_0),
-        SymOp(ROT_mY_mX_Z, TR_12_12_12),
-        SymOp(ROT_Y_X_Z, TR_12_12_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mY_X_Z, TR_0_0_12),
+        (ROT_Y_mX_Z, TR_0_0_12),
+        (ROT_X_mY_Z, TR_12_12_0),
+        (ROT_mX_Y_Z, TR_12_12_0),
+        (ROT_mY_mX_Z, TR_12_12_12),
+        (ROT_Y_X_Z, TR_12_12_12)])
 
 sg107 = SpaceGroup(
     number=107,
@@ -2105,23 +2103,23 @@ sg107 = SpaceGroup(
     point_group_name="PG4mm",
     crystal_system=TETRAGONAL,
     pdb_name="I 4 m m",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mY_X_Z, TR_0_0_0),
-        SymOp(ROT_Y_mX_Z, TR_0_0_0),
-        SymOp(ROT_X_mY_Z, TR_0_0_0),
-        SymOp(ROT_mX_Y_Z, TR_0_0_0),
-        SymOp(ROT_mY_mX_Z, TR_0_0_0),
-        SymOp(ROT_Y_X_Z, TR_0_0_0),
-        SymOp(ROT_X_Y_Z, TR_12_12_12),
-        SymOp(ROT_mX_mY_Z, TR_12_12_12),
-        SymOp(ROT_mY_X_Z, TR_12_12_12),
-        SymOp(ROT_Y_mX_Z, TR_12_12_12),
-        SymOp(ROT_X_mY_Z, TR_12_12_12),
-        SymOp(ROT_mX_Y_Z, TR_12_12_12),
-        SymOp(ROT_mY_mX_Z, TR_12_12_12),
-        SymOp(ROT_Y_X_Z, TR_12_12_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mY_X_Z, TR_0_0_0),
+        (ROT_Y_mX_Z, TR_0_0_0),
+        (ROT_X_mY_Z, TR_0_0_0),
+        (ROT_mX_Y_Z, TR_0_0_0),
+        (ROT_mY_mX_Z, TR_0_0_0),
+        (ROT_Y_X_Z, TR_0_0_0),
+        (ROT_X_Y_Z, TR_12_12_12),
+        (ROT_mX_mY_Z, TR_12_12_12),
+        (ROT_mY_X_Z, TR_12_12_12),
+        (ROT_Y_mX_Z, TR_12_12_12),
+        (ROT_X_mY_Z, TR_12_12_12),
+        (ROT_mX_Y_Z, TR_12_12_12),
+        (ROT_mY_mX_Z, TR_12_12_12),
+        (ROT_Y_X_Z, TR_12_12_12)])
 
 sg108 = SpaceGroup(
     number=108,
@@ -2131,23 +2129,23 @@ sg108 = SpaceGroup(
     point_group_name="PG4mm",
     crystal_system=TETRAGONAL,
     pdb_name="I 4 c m",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mY_X_Z, TR_0_0_0),
-        SymOp(ROT_Y_mX_Z, TR_0_0_0),
-        SymOp(ROT_X_mY_Z, TR_0_0_12),
-        SymOp(ROT_mX_Y_Z, TR_0_0_12),
-        SymOp(ROT_mY_mX_Z, TR_0_0_12),
-        SymOp(ROT_Y_X_Z, TR_0_0_12),
-        SymOp(ROT_X_Y_Z, TR_12_12_12),
-        SymOp(ROT_mX_mY_Z, TR_12_12_12),
-        SymOp(ROT_mY_X_Z, TR_12_12_12),
-        SymOp(ROT_Y_mX_Z, TR_12_12_12),
-        SymOp(ROT_X_mY_Z, TR_12_12_0),
-        SymOp(ROT_mX_Y_Z, TR_12_12_0),
-        SymOp(ROT_mY_mX_Z, TR_12_12_0),
-        SymOp(ROT_Y_X_Z, TR_12_12_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mY_X_Z, TR_0_0_0),
+        (ROT_Y_mX_Z, TR_0_0_0),
+        (ROT_X_mY_Z, TR_0_0_12),
+        (ROT_mX_Y_Z, TR_0_0_12),
+        (ROT_mY_mX_Z, TR_0_0_12),
+        (ROT_Y_X_Z, TR_0_0_12),
+        (ROT_X_Y_Z, TR_12_12_12),
+        (ROT_mX_mY_Z, TR_12_12_12),
+        (ROT_mY_X_Z, TR_12_12_12),
+        (ROT_Y_mX_Z, TR_12_12_12),
+        (ROT_X_mY_Z, TR_12_12_0),
+        (ROT_mX_Y_Z, TR_12_12_0),
+        (ROT_mY_mX_Z, TR_12_12_0),
+        (ROT_Y_X_Z, TR_12_12_0)])
 
 sg109 = SpaceGroup(
     number=109,
@@ -2157,23 +2155,23 @@ sg109 = SpaceGroup(
     point_group_name="PG4mm",
     crystal_system=TETRAGONAL,
     pdb_name="I 41 m d",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_12_12_12),
-        SymOp(ROT_mY_X_Z, TR_0_12_14),
-        SymOp(ROT_Y_mX_Z, TR_12_0_34),
-        SymOp(ROT_X_mY_Z, TR_0_0_0),
-        SymOp(ROT_mX_Y_Z, TR_12_12_12),
-        SymOp(ROT_mY_mX_Z, TR_0_12_14),
-        SymOp(ROT_Y_X_Z, TR_12_0_34),
-        SymOp(ROT_X_Y_Z, TR_12_12_12),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mY_X_Z, TR_12_0_34),
-        SymOp(ROT_Y_mX_Z, TR_0_12_14),
-        SymOp(ROT_X_mY_Z, TR_12_12_12),
-        SymOp(ROT_mX_Y_Z, TR_0_0_0),
-        SymOp(ROT_mY_mX_Z, TR_12_0_34),
-        SymOp(ROT_Y_X_Z, TR_0_12_14)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_12_12_12),
+        (ROT_mY_X_Z, TR_0_12_14),
+        (ROT_Y_mX_Z, TR_12_0_34),
+        (ROT_X_mY_Z, TR_0_0_0),
+        (ROT_mX_Y_Z, TR_12_12_12),
+        (ROT_mY_mX_Z, TR_0_12_14),
+        (ROT_Y_X_Z, TR_12_0_34),
+        (ROT_X_Y_Z, TR_12_12_12),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mY_X_Z, TR_12_0_34),
+        (ROT_Y_mX_Z, TR_0_12_14),
+        (ROT_X_mY_Z, TR_12_12_12),
+        (ROT_mX_Y_Z, TR_0_0_0),
+        (ROT_mY_mX_Z, TR_12_0_34),
+        (ROT_Y_X_Z, TR_0_12_14)])
 
 sg110 = SpaceGroup(
     number=110,
@@ -2183,23 +2181,23 @@ sg110 = SpaceGroup(
     point_group_name="PG4mm",
     crystal_system=TETRAGONAL,
     pdb_name="I 41 c d",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_12_12_12),
-        SymOp(ROT_mY_X_Z, TR_0_12_14),
-        SymOp(ROT_Y_mX_Z, TR_12_0_34),
-        SymOp(ROT_X_mY_Z, TR_0_0_12),
-        SymOp(ROT_mX_Y_Z, TR_12_12_0),
-        SymOp(ROT_mY_mX_Z, TR_0_12_34),
-        SymOp(ROT_Y_X_Z, TR_12_0_14),
-        SymOp(ROT_X_Y_Z, TR_12_12_12),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mY_X_Z, TR_12_0_34),
-        SymOp(ROT_Y_mX_Z, TR_0_12_14),
-        SymOp(ROT_X_mY_Z, TR_12_12_0),
-        SymOp(ROT_mX_Y_Z, TR_0_0_12),
-        SymOp(ROT_mY_mX_Z, TR_12_0_14),
-        SymOp(ROT_Y_X_Z, TR_0_12_34)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_12_12_12),
+        (ROT_mY_X_Z, TR_0_12_14),
+        (ROT_Y_mX_Z, TR_12_0_34),
+        (ROT_X_mY_Z, TR_0_0_12),
+        (ROT_mX_Y_Z, TR_12_12_0),
+        (ROT_mY_mX_Z, TR_0_12_34),
+        (ROT_Y_X_Z, TR_12_0_14),
+        (ROT_X_Y_Z, TR_12_12_12),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mY_X_Z, TR_12_0_34),
+        (ROT_Y_mX_Z, TR_0_12_14),
+        (ROT_X_mY_Z, TR_12_12_0),
+        (ROT_mX_Y_Z, TR_0_0_12),
+        (ROT_mY_mX_Z, TR_12_0_14),
+        (ROT_Y_X_Z, TR_0_12_34)])
 
 sg111 = SpaceGroup(
     number=111,
@@ -2209,15 +2207,15 @@ sg111 = SpaceGroup(
     point_group_name="PG4bar2m",
     crystal_system=TETRAGONAL,
     pdb_name="P -4 2 m",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mY_X_mZ, TR_0_0_0),
-        SymOp(ROT_Y_mX_mZ, TR_0_0_0),
-        SymOp(ROT_mX_Y_mZ, TR_0_0_0),
-        SymOp(ROT_X_mY_mZ, TR_0_0_0),
-        SymOp(ROT_mY_mX_Z, TR_0_0_0),
-        SymOp(ROT_Y_X_Z, TR_0_0_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mY_X_mZ, TR_0_0_0),
+        (ROT_Y_mX_mZ, TR_0_0_0),
+        (ROT_mX_Y_mZ, TR_0_0_0),
+        (ROT_X_mY_mZ, TR_0_0_0),
+        (ROT_mY_mX_Z, TR_0_0_0),
+        (ROT_Y_X_Z, TR_0_0_0)])
 
 sg112 = SpaceGroup(
     number=112,
@@ -2227,15 +2225,15 @@ sg112 = SpaceGroup(
     point_group_name="PG4bar2m",
     crystal_system=TETRAGONAL,
     pdb_name="P -4 2 c",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mY_X_mZ, TR_0_0_0),
-        SymOp(ROT_Y_mX_mZ, TR_0_0_0),
-        SymOp(ROT_mX_Y_mZ, TR_0_0_12),
-        SymOp(ROT_X_mY_mZ, TR_0_0_12),
-        SymOp(ROT_mY_mX_Z, TR_0_0_12),
-        SymOp(ROT_Y_X_Z, TR_0_0_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mY_X_mZ, TR_0_0_0),
+        (ROT_Y_mX_mZ, TR_0_0_0),
+        (ROT_mX_Y_mZ, TR_0_0_12),
+        (ROT_X_mY_mZ, TR_0_0_12),
+        (ROT_mY_mX_Z, TR_0_0_12),
+        (ROT_Y_X_Z, TR_0_0_12)])
 
 sg113 = SpaceGroup(
     number=113,
@@ -2245,15 +2243,15 @@ sg113 = SpaceGroup(
     point_group_name="PG4bar2m",
     crystal_system=TETRAGONAL,
     pdb_name="P -4 21 m",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mY_X_mZ, TR_0_0_0),
-        SymOp(ROT_Y_mX_mZ, TR_0_0_0),
-        SymOp(ROT_mX_Y_mZ, TR_12_12_0),
-        SymOp(ROT_X_mY_mZ, TR_12_12_0),
-        SymOp(ROT_mY_mX_Z, TR_12_12_0),
-        SymOp(ROT_Y_X_Z, TR_12_12_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mY_X_mZ, TR_0_0_0),
+        (ROT_Y_mX_mZ, TR_0_0_0),
+        (ROT_mX_Y_mZ, TR_12_12_0),
+        (ROT_X_mY_mZ, TR_12_12_0),
+        (ROT_mY_mX_Z, TR_12_12_0),
+        (ROT_Y_X_Z, TR_12_12_0)])
 
 sg114 = SpaceGroup(
     number=114,
@@ -2263,15 +2261,15 @@ sg114 = SpaceGroup(
     point_group_name="PG4bar2m",
     crystal_system=TETRAGONAL,
     pdb_name="P -4 21 c",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mY_X_mZ, TR_0_0_0),
-        SymOp(ROT_Y_mX_mZ, TR_0_0_0),
-        SymOp(ROT_mX_Y_mZ, TR_12_12_12),
-        SymOp(ROT_X_mY_mZ, TR_12_12_12),
-        SymOp(ROT_mY_mX_Z, TR_12_12_12),
-        SymOp(ROT_Y_X_Z, TR_12_12_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mY_X_mZ, TR_0_0_0),
+        (ROT_Y_mX_mZ, TR_0_0_0),
+        (ROT_mX_Y_mZ, TR_12_12_12),
+        (ROT_X_mY_mZ, TR_12_12_12),
+        (ROT_mY_mX_Z, TR_12_12_12),
+        (ROT_Y_X_Z, TR_12_12_12)])
 
 sg115 = SpaceGroup(
     number=115,
@@ -2281,15 +2279,15 @@ sg115 = SpaceGroup(
     point_group_name="PG4barm2",
     crystal_system=TETRAGONAL,
     pdb_name="P -4 m 2",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_Y_mX_mZ, TR_0_0_0),
-        SymOp(ROT_mY_X_mZ, TR_0_0_0),
-        SymOp(ROT_X_mY_Z, TR_0_0_0),
-        SymOp(ROT_mX_Y_Z, TR_0_0_0),
-        SymOp(ROT_Y_X_mZ, TR_0_0_0),
-        SymOp(ROT_mY_mX_mZ, TR_0_0_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_Y_mX_mZ, TR_0_0_0),
+        (ROT_mY_X_mZ, TR_0_0_0),
+        (ROT_X_mY_Z, TR_0_0_0),
+        (ROT_mX_Y_Z, TR_0_0_0),
+        (ROT_Y_X_mZ, TR_0_0_0),
+        (ROT_mY_mX_mZ, TR_0_0_0)])
 
 sg116 = SpaceGroup(
     number=116,
@@ -2299,15 +2297,15 @@ sg116 = SpaceGroup(
     point_group_name="PG4barm2",
     crystal_system=TETRAGONAL,
     pdb_name="P -4 c 2",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mY_X_mZ, TR_0_0_0),
-        SymOp(ROT_Y_mX_mZ, TR_0_0_0),
-        SymOp(ROT_X_mY_Z, TR_0_0_12),
-        SymOp(ROT_mX_Y_Z, TR_0_0_12),
-        SymOp(ROT_Y_X_mZ, TR_0_0_12),
-        SymOp(ROT_mY_mX_mZ, TR_0_0_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mY_X_mZ, TR_0_0_0),
+        (ROT_Y_mX_mZ, TR_0_0_0),
+        (ROT_X_mY_Z, TR_0_0_12),
+        (ROT_mX_Y_Z, TR_0_0_12),
+        (ROT_Y_X_mZ, TR_0_0_12),
+        (ROT_mY_mX_mZ, TR_0_0_12)])
 
 sg117 = SpaceGroup(
     number=117,
@@ -2317,15 +2315,15 @@ sg117 = SpaceGroup(
     point_group_name="PG4barm2",
     crystal_system=TETRAGONAL,
     pdb_name="P -4 b 2",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mY_X_mZ, TR_0_0_0),
-        SymOp(ROT_Y_mX_mZ, TR_0_0_0),
-        SymOp(ROT_X_mY_Z, TR_12_12_0),
-        SymOp(ROT_mX_Y_Z, TR_12_12_0),
-        SymOp(ROT_Y_X_mZ, TR_12_12_0),
-        SymOp(ROT_mY_mX_mZ, TR_12_12_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mY_X_mZ, TR_0_0_0),
+        (ROT_Y_mX_mZ, TR_0_0_0),
+        (ROT_X_mY_Z, TR_12_12_0),
+        (ROT_mX_Y_Z, TR_12_12_0),
+        (ROT_Y_X_mZ, TR_12_12_0),
+        (ROT_mY_mX_mZ, TR_12_12_0)])
 
 sg118 = SpaceGroup(
     number=118,
@@ -2335,15 +2333,15 @@ sg118 = SpaceGroup(
     point_group_name="PG4barm2",
     crystal_system=TETRAGONAL,
     pdb_name="P -4 n 2",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mY_X_mZ, TR_0_0_0),
-        SymOp(ROT_Y_mX_mZ, TR_0_0_0),
-        SymOp(ROT_X_mY_Z, TR_12_12_12),
-        SymOp(ROT_mX_Y_Z, TR_12_12_12),
-        SymOp(ROT_Y_X_mZ, TR_12_12_12),
-        SymOp(ROT_mY_mX_mZ, TR_12_12_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mY_X_mZ, TR_0_0_0),
+        (ROT_Y_mX_mZ, TR_0_0_0),
+        (ROT_X_mY_Z, TR_12_12_12),
+        (ROT_mX_Y_Z, TR_12_12_12),
+        (ROT_Y_X_mZ, TR_12_12_12),
+        (ROT_mY_mX_mZ, TR_12_12_12)])
 
 sg119 = SpaceGroup(
     number=119,
@@ -2353,23 +2351,23 @@ sg119 = SpaceGroup(
     point_group_name="PG4barm2",
     crystal_system=TETRAGONAL,
     pdb_name="I -4 m 2",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mY_X_mZ, TR_0_0_0),
-        SymOp(ROT_Y_mX_mZ, TR_0_0_0),
-        SymOp(ROT_X_mY_Z, TR_0_0_0),
-        SymOp(ROT_mX_Y_Z, TR_0_0_0),
-        SymOp(ROT_Y_X_mZ, TR_0_0_0),
-        SymOp(ROT_mY_mX_mZ, TR_0_0_0),
-        SymOp(ROT_X_Y_Z, TR_12_12_12),
-        SymOp(ROT_mX_mY_Z, TR_12_12_12),
-        SymOp(ROT_mY_X_mZ, TR_12_12_12),
-        SymOp(ROT_Y_mX_mZ, TR_12_12_12),
-        SymOp(ROT_X_mY_Z, TR_12_12_12),
-        SymOp(ROT_mX_Y_Z, TR_12_12_12),
-        SymOp(ROT_Y_X_mZ, TR_12_12_12),
-        SymOp(ROT_mY_mX_mZ, TR_12_12_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mY_X_mZ, TR_0_0_0),
+        (ROT_Y_mX_mZ, TR_0_0_0),
+        (ROT_X_mY_Z, TR_0_0_0),
+        (ROT_mX_Y_Z, TR_0_0_0),
+        (ROT_Y_X_mZ, TR_0_0_0),
+        (ROT_mY_mX_mZ, TR_0_0_0),
+        (ROT_X_Y_Z, TR_12_12_12),
+        (ROT_mX_mY_Z, TR_12_12_12),
+        (ROT_mY_X_mZ, TR_12_12_12),
+        (ROT_Y_mX_mZ, TR_12_12_12),
+        (ROT_X_mY_Z, TR_12_12_12),
+        (ROT_mX_Y_Z, TR_12_12_12),
+        (ROT_Y_X_mZ, TR_12_12_12),
+        (ROT_mY_mX_mZ, TR_12_12_12)])
 
 sg120 = SpaceGroup(
     number=120,
@@ -2379,23 +2377,23 @@ sg120 = SpaceGroup(
     point_group_name="PG4barm2",
     crystal_system=TETRAGONAL,
     pdb_name="I -4 c 2",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mY_X_mZ, TR_0_0_0),
-        SymOp(ROT_Y_mX_mZ, TR_0_0_0),
-        SymOp(ROT_X_mY_Z, TR_0_0_12),
-        SymOp(ROT_mX_Y_Z, TR_0_0_12),
-        SymOp(ROT_Y_X_mZ, TR_0_0_12),
-        SymOp(ROT_mY_mX_mZ, TR_0_0_12),
-        SymOp(ROT_X_Y_Z, TR_12_12_12),
-        SymOp(ROT_mX_mY_Z, TR_12_12_12),
-        SymOp(ROT_mY_X_mZ, TR_12_12_12),
-        SymOp(ROT_Y_mX_mZ, TR_12_12_12),
-        SymOp(ROT_X_mY_Z, TR_12_12_0),
-        SymOp(ROT_mX_Y_Z, TR_12_12_0),
-        SymOp(ROT_Y_X_mZ, TR_12_12_0),
-        SymOp(ROT_mY_mX_mZ, TR_12_12_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mY_X_mZ, TR_0_0_0),
+        (ROT_Y_mX_mZ, TR_0_0_0),
+        (ROT_X_mY_Z, TR_0_0_12),
+        (ROT_mX_Y_Z, TR_0_0_12),
+        (ROT_Y_X_mZ, TR_0_0_12),
+        (ROT_mY_mX_mZ, TR_0_0_12),
+        (ROT_X_Y_Z, TR_12_12_12),
+        (ROT_mX_mY_Z, TR_12_12_12),
+        (ROT_mY_X_mZ, TR_12_12_12),
+        (ROT_Y_mX_mZ, TR_12_12_12),
+        (ROT_X_mY_Z, TR_12_12_0),
+        (ROT_mX_Y_Z, TR_12_12_0),
+        (ROT_Y_X_mZ, TR_12_12_0),
+        (ROT_mY_mX_mZ, TR_12_12_0)])
 
 sg121 = SpaceGroup(
     number=121,
@@ -2405,23 +2403,23 @@ sg121 = SpaceGroup(
     point_group_name="PG4bar2m",
     crystal_system=TETRAGONAL,
     pdb_name="I -4 2 m",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mY_X_mZ, TR_0_0_0),
-        SymOp(ROT_Y_mX_mZ, TR_0_0_0),
-        SymOp(ROT_mX_Y_mZ, TR_0_0_0),
-        SymOp(ROT_X_mY_mZ, TR_0_0_0),
-        SymOp(ROT_mY_mX_Z, TR_0_0_0),
-        SymOp(ROT_Y_X_Z, TR_0_0_0),
-        SymOp(ROT_X_Y_Z, TR_12_12_12),
-        SymOp(ROT_mX_mY_Z, TR_12_12_12),
-        SymOp(ROT_mY_X_mZ, TR_12_12_12),
-        SymOp(ROT_Y_mX_mZ, TR_12_12_12),
-        SymOp(ROT_mX_Y_mZ, TR_12_12_12),
-        SymOp(ROT_X_mY_mZ, TR_12_12_12),
-        SymOp(ROT_mY_mX_Z, TR_12_12_12),
-        SymOp(ROT_Y_X_Z, TR_12_12_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mY_X_mZ, TR_0_0_0),
+        (ROT_Y_mX_mZ, TR_0_0_0),
+        (ROT_mX_Y_mZ, TR_0_0_0),
+        (ROT_X_mY_mZ, TR_0_0_0),
+        (ROT_mY_mX_Z, TR_0_0_0),
+        (ROT_Y_X_Z, TR_0_0_0),
+        (ROT_X_Y_Z, TR_12_12_12),
+        (ROT_mX_mY_Z, TR_12_12_12),
+        (ROT_mY_X_mZ, TR_12_12_12),
+        (ROT_Y_mX_mZ, TR_12_12_12),
+        (ROT_mX_Y_mZ, TR_12_12_12),
+        (ROT_X_mY_mZ, TR_12_12_12),
+        (ROT_mY_mX_Z, TR_12_12_12),
+        (ROT_Y_X_Z, TR_12_12_12)])
 
 sg122 = SpaceGroup(
     number=122,
@@ -2431,23 +2429,23 @@ sg122 = SpaceGroup(
     point_group_name="PG4bar2m",
     crystal_system=TETRAGONAL,
     pdb_name="I -4 2 d",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mY_X_mZ, TR_0_0_0),
-        SymOp(ROT_Y_mX_mZ, TR_0_0_0),
-        SymOp(ROT_mX_Y_mZ, TR_12_0_34),
-        SymOp(ROT_X_mY_mZ, TR_12_0_34),
-        SymOp(ROT_mY_mX_Z, TR_12_0_34),
-        SymOp(ROT_Y_X_Z, TR_12_0_34),
-        SymOp(ROT_X_Y_Z, TR_12_12_12),
-        SymOp(ROT_mX_mY_Z, TR_12_12_12),
-        SymOp(ROT_mY_X_mZ, TR_12_12_12),
-        SymOp(ROT_Y_mX_mZ, TR_12_12_12),
-        SymOp(ROT_mX_Y_mZ, TR_0_12_14),
-        SymOp(ROT_X_mY_mZ, TR_0_12_14),
-        SymOp(ROT_mY_mX_Z, TR_0_12_14),
-        SymOp(ROT_Y_X_Z, TR_0_12_14)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mY_X_mZ, TR_0_0_0),
+        (ROT_Y_mX_mZ, TR_0_0_0),
+        (ROT_mX_Y_mZ, TR_12_0_34),
+        (ROT_X_mY_mZ, TR_12_0_34),
+        (ROT_mY_mX_Z, TR_12_0_34),
+        (ROT_Y_X_Z, TR_12_0_34),
+        (ROT_X_Y_Z, TR_12_12_12),
+        (ROT_mX_mY_Z, TR_12_12_12),
+        (ROT_mY_X_mZ, TR_12_12_12),
+        (ROT_Y_mX_mZ, TR_12_12_12),
+        (ROT_mX_Y_mZ, TR_0_12_14),
+        (ROT_X_mY_mZ, TR_0_12_14),
+        (ROT_mY_mX_Z, TR_0_12_14),
+        (ROT_Y_X_Z, TR_0_12_14)])
 
 sg123 = SpaceGroup(
     number=123,
@@ -2457,23 +2455,23 @@ sg123 = SpaceGroup(
     point_group_name="PG4/mmm",
     crystal_system=TETRAGONAL,
     pdb_name="P 4/m 2/m 2/m",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mY_X_Z, TR_0_0_0),
-        SymOp(ROT_Y_mX_Z, TR_0_0_0),
-        SymOp(ROT_mX_Y_mZ, TR_0_0_0),
-        SymOp(ROT_X_mY_mZ, TR_0_0_0),
-        SymOp(ROT_Y_X_mZ, TR_0_0_0),
-        SymOp(ROT_mY_mX_mZ, TR_0_0_0),
-        SymOp(ROT_mX_mY_mZ, TR_0_0_0),
-        SymOp(ROT_X_Y_mZ, TR_0_0_0),
-        SymOp(ROT_Y_mX_mZ, TR_0_0_0),
-        SymOp(ROT_mY_X_mZ, TR_0_0_0),
-        SymOp(ROT_X_mY_Z, TR_0_0_0),
-        SymOp(ROT_mX_Y_Z, TR_0_0_0),
-        SymOp(ROT_mY_mX_Z, TR_0_0_0),
-        SymOp(ROT_Y_X_Z, TR_0_0_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mY_X_Z, TR_0_0_0),
+        (ROT_Y_mX_Z, TR_0_0_0),
+        (ROT_mX_Y_mZ, TR_0_0_0),
+        (ROT_X_mY_mZ, TR_0_0_0),
+        (ROT_Y_X_mZ, TR_0_0_0),
+        (ROT_mY_mX_mZ, TR_0_0_0),
+        (ROT_mX_mY_mZ, TR_0_0_0),
+        (ROT_X_Y_mZ, TR_0_0_0),
+        (ROT_Y_mX_mZ, TR_0_0_0),
+        (ROT_mY_X_mZ, TR_0_0_0),
+        (ROT_X_mY_Z, TR_0_0_0),
+        (ROT_mX_Y_Z, TR_0_0_0),
+        (ROT_mY_mX_Z, TR_0_0_0),
+        (ROT_Y_X_Z, TR_0_0_0)])
 
 sg124 = SpaceGroup(
     number=124,
@@ -2483,23 +2481,23 @@ sg124 = SpaceGroup(
     point_group_name="PG4/mmm",
     crystal_system=TETRAGONAL,
     pdb_name="P 4/m 2/c 2/c",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mY_X_Z, TR_0_0_0),
-        SymOp(ROT_Y_mX_Z, TR_0_0_0),
-        SymOp(ROT_mX_Y_mZ, TR_0_0_12),
-        SymOp(ROT_X_mY_mZ, TR_0_0_12),
-        SymOp(ROT_Y_X_mZ, TR_0_0_12),
-        SymOp(ROT_mY_mX_mZ, TR_0_0_12),
-        SymOp(ROT_mX_mY_mZ, TR_0_0_0),
-        SymOp(ROT_X_Y_mZ, TR_0_0_0),
-        SymOp(ROT_Y_mX_mZ, TR_0_0_0),
-        SymOp(ROT_mY_X_mZ, TR_0_0_0),
-        SymOp(ROT_X_mY_Z, TR_0_0_12),
-        SymOp(ROT_mX_Y_Z, TR_0_0_12),
-        SymOp(ROT_mY_mX_Z, TR_0_0_12),
-        SymOp(ROT_Y_X_Z, TR_0_0_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mY_X_Z, TR_0_0_0),
+        (ROT_Y_mX_Z, TR_0_0_0),
+        (ROT_mX_Y_mZ, TR_0_0_12),
+        (ROT_X_mY_mZ, TR_0_0_12),
+        (ROT_Y_X_mZ, TR_0_0_12),
+        (ROT_mY_mX_mZ, TR_0_0_12),
+        (ROT_mX_mY_mZ, TR_0_0_0),
+        (ROT_X_Y_mZ, TR_0_0_0),
+        (ROT_Y_mX_mZ, TR_0_0_0),
+        (ROT_mY_X_mZ, TR_0_0_0),
+        (ROT_X_mY_Z, TR_0_0_12),
+        (ROT_mX_Y_Z, TR_0_0_12),
+        (ROT_mY_mX_Z, TR_0_0_12),
+        (ROT_Y_X_Z, TR_0_0_12)])
 
 sg125 = SpaceGroup(
     number=125,
@@ -2509,23 +2507,23 @@ sg125 = SpaceGroup(
     point_group_name="PG4/mmm",
     crystal_system=TETRAGONAL,
     pdb_name="P 4/n 2/b 2/m",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mY_X_Z, TR_0_0_0),
-        SymOp(ROT_Y_mX_Z, TR_0_0_0),
-        SymOp(ROT_mX_Y_mZ, TR_0_0_0),
-        SymOp(ROT_X_mY_mZ, TR_0_0_0),
-        SymOp(ROT_Y_X_mZ, TR_0_0_0),
-        SymOp(ROT_mY_mX_mZ, TR_0_0_0),
-        SymOp(ROT_mX_mY_mZ, TR_12_12_0),
-        SymOp(ROT_X_Y_mZ, TR_12_12_0),
-        SymOp(ROT_Y_mX_mZ, TR_12_12_0),
-        SymOp(ROT_mY_X_mZ, TR_12_12_0),
-        SymOp(ROT_X_mY_Z, TR_12_12_0),
-        SymOp(ROT_mX_Y_Z, TR_12_12_0),
-        SymOp(ROT_mY_mX_Z, TR_12_12_0),
-        SymOp(ROT_Y_X_Z, TR_12_12_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mY_X_Z, TR_0_0_0),
+        (ROT_Y_mX_Z, TR_0_0_0),
+        (ROT_mX_Y_mZ, TR_0_0_0),
+        (ROT_X_mY_mZ, TR_0_0_0),
+        (ROT_Y_X_mZ, TR_0_0_0),
+        (ROT_mY_mX_mZ, TR_0_0_0),
+        (ROT_mX_mY_mZ, TR_12_12_0),
+        (ROT_X_Y_mZ, TR_12_12_0),
+        (ROT_Y_mX_mZ, TR_12_12_0),
+        (ROT_mY_X_mZ, TR_12_12_0),
+        (ROT_X_mY_Z, TR_12_12_0),
+        (ROT_mX_Y_Z, TR_12_12_0),
+        (ROT_mY_mX_Z, TR_12_12_0),
+        (ROT_Y_X_Z, TR_12_12_0)])
 
 sg126 = SpaceGroup(
     number=126,
@@ -2535,23 +2533,23 @@ sg126 = SpaceGroup(
     point_group_name="PG4/mmm",
     crystal_system=TETRAGONAL,
     pdb_name="P 4/n 2/n 2/c",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mY_X_Z, TR_0_0_0),
-        SymOp(ROT_Y_mX_Z, TR_0_0_0),
-        SymOp(ROT_mX_Y_mZ, TR_0_0_0),
-        SymOp(ROT_X_mY_mZ, TR_0_0_0),
-        SymOp(ROT_Y_X_mZ, TR_0_0_0),
-        SymOp(ROT_mY_mX_mZ, TR_0_0_0),
-        SymOp(ROT_mX_mY_mZ, TR_12_12_12),
-        SymOp(ROT_X_Y_mZ, TR_12_12_12),
-        SymOp(ROT_Y_mX_mZ, TR_12_12_12),
-        SymOp(ROT_mY_X_mZ, TR_12_12_12),
-        SymOp(ROT_X_mY_Z, TR_12_12_12),
-        SymOp(ROT_mX_Y_Z, TR_12_12_12),
-        SymOp(ROT_mY_mX_Z, TR_12_12_12),
-        SymOp(ROT_Y_X_Z, TR_12_12_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mY_X_Z, TR_0_0_0),
+        (ROT_Y_mX_Z, TR_0_0_0),
+        (ROT_mX_Y_mZ, TR_0_0_0),
+        (ROT_X_mY_mZ, TR_0_0_0),
+        (ROT_Y_X_mZ, TR_0_0_0),
+        (ROT_mY_mX_mZ, TR_0_0_0),
+        (ROT_mX_mY_mZ, TR_12_12_12),
+        (ROT_X_Y_mZ, TR_12_12_12),
+        (ROT_Y_mX_mZ, TR_12_12_12),
+        (ROT_mY_X_mZ, TR_12_12_12),
+        (ROT_X_mY_Z, TR_12_12_12),
+        (ROT_mX_Y_Z, TR_12_12_12),
+        (ROT_mY_mX_Z, TR_12_12_12),
+        (ROT_Y_X_Z, TR_12_12_12)])
 
 sg127 = SpaceGroup(
     number=127,
@@ -2561,23 +2559,23 @@ sg127 = SpaceGroup(
     point_group_name="PG4/mmm",
     crystal_system=TETRAGONAL,
     pdb_name="P 4/m 21/b 2/m",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mY_X_Z, TR_0_0_0),
-        SymOp(ROT_Y_mX_Z, TR_0_0_0),
-        SymOp(ROT_mX_Y_mZ, TR_12_12_0),
-        SymOp(ROT_X_mY_mZ, TR_12_12_0),
-        SymOp(ROT_Y_X_mZ, TR_12_12_0),
-        SymOp(ROT_mY_mX_mZ, TR_12_12_0),
-        SymOp(ROT_mX_mY_mZ, TR_0_0_0),
-        SymOp(ROT_X_Y_mZ, TR_0_0_0),
-        SymOp(ROT_Y_mX_mZ, TR_0_0_0),
-        SymOp(ROT_mY_X_mZ, TR_0_0_0),
-        SymOp(ROT_X_mY_Z, TR_12_12_0),
-        SymOp(ROT_mX_Y_Z, TR_12_12_0),
-        SymOp(ROT_mY_mX_Z, TR_12_12_0),
-        SymOp(ROT_Y_X_Z, TR_12_12_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mY_X_Z, TR_0_0_0),
+        (ROT_Y_mX_Z, TR_0_0_0),
+        (ROT_mX_Y_mZ, TR_12_12_0),
+        (ROT_X_mY_mZ, TR_12_12_0),
+        (ROT_Y_X_mZ, TR_12_12_0),
+        (ROT_mY_mX_mZ, TR_12_12_0),
+        (ROT_mX_mY_mZ, TR_0_0_0),
+        (ROT_X_Y_mZ, TR_0_0_0),
+        (ROT_Y_mX_mZ, TR_0_0_0),
+        (ROT_mY_X_mZ, TR_0_0_0),
+        (ROT_X_mY_Z, TR_12_12_0),
+        (ROT_mX_Y_Z, TR_12_12_0),
+        (ROT_mY_mX_Z, TR_12_12_0),
+        (ROT_Y_X_Z, TR_12_12_0)])
 
 sg128 = SpaceGroup(
     number=128,
@@ -2587,23 +2585,23 @@ sg128 = SpaceGroup(
     point_group_name="PG4/mmm",
     crystal_system=TETRAGONAL,
     pdb_name="P 4/m 21/n 2/c",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mY_X_Z, TR_0_0_0),
-        SymOp(ROT_Y_mX_Z, TR_0_0_0),
-        SymOp(ROT_mX_Y_mZ, TR_12_12_12),
-        SymOp(ROT_X_mY_mZ, TR_12_12_12),
-        SymOp(ROT_Y_X_mZ, TR_12_12_12),
-        SymOp(ROT_mY_mX_mZ, TR_12_12_12),
-        SymOp(ROT_mX_mY_mZ, TR_0_0_0),
-        SymOp(ROT_X_Y_mZ, TR_0_0_0),
-        SymOp(ROT_Y_mX_mZ, TR_0_0_0),
-        SymOp(ROT_mY_X_mZ, TR_0_0_0),
-        SymOp(ROT_X_mY_Z, TR_12_12_12),
-        SymOp(ROT_mX_Y_Z, TR_12_12_12),
-        SymOp(ROT_mY_mX_Z, TR_12_12_12),
-        SymOp(ROT_Y_X_Z, TR_12_12_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mY_X_Z, TR_0_0_0),
+        (ROT_Y_mX_Z, TR_0_0_0),
+        (ROT_mX_Y_mZ, TR_12_12_12),
+        (ROT_X_mY_mZ, TR_12_12_12),
+        (ROT_Y_X_mZ, TR_12_12_12),
+        (ROT_mY_mX_mZ, TR_12_12_12),
+        (ROT_mX_mY_mZ, TR_0_0_0),
+        (ROT_X_Y_mZ, TR_0_0_0),
+        (ROT_Y_mX_mZ, TR_0_0_0),
+        (ROT_mY_X_mZ, TR_0_0_0),
+        (ROT_X_mY_Z, TR_12_12_12),
+        (ROT_mX_Y_Z, TR_12_12_12),
+        (ROT_mY_mX_Z, TR_12_12_12),
+        (ROT_Y_X_Z, TR_12_12_12)])
 
 sg129 = SpaceGroup(
     number=129,
@@ -2613,23 +2611,23 @@ sg129 = SpaceGroup(
     point_group_name="PG4/mmm",
     crystal_system=TETRAGONAL,
     pdb_name="P 4/n 21/m 2/m",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mY_X_Z, TR_12_12_0),
-        SymOp(ROT_Y_mX_Z, TR_12_12_0),
-        SymOp(ROT_mX_Y_mZ, TR_12_12_0),
-        SymOp(ROT_X_mY_mZ, TR_12_12_0),
-        SymOp(ROT_Y_X_mZ, TR_0_0_0),
-        SymOp(ROT_mY_mX_mZ, TR_0_0_0),
-        SymOp(ROT_mX_mY_mZ, TR_12_12_0),
-        SymOp(ROT_X_Y_mZ, TR_12_12_0),
-        SymOp(ROT_Y_mX_mZ, TR_0_0_0),
-        SymOp(ROT_mY_X_mZ, TR_0_0_0),
-        SymOp(ROT_X_mY_Z, TR_0_0_0),
-        SymOp(ROT_mX_Y_Z, TR_0_0_0),
-        SymOp(ROT_mY_mX_Z, TR_12_12_0),
-        SymOp(ROT_Y_X_Z, TR_12_12_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mY_X_Z, TR_12_12_0),
+        (ROT_Y_mX_Z, TR_12_12_0),
+        (ROT_mX_Y_mZ, TR_12_12_0),
+        (ROT_X_mY_mZ, TR_12_12_0),
+        (ROT_Y_X_mZ, TR_0_0_0),
+        (ROT_mY_mX_mZ, TR_0_0_0),
+        (ROT_mX_mY_mZ, TR_12_12_0),
+        (ROT_X_Y_mZ, TR_12_12_0),
+        (ROT_Y_mX_mZ, TR_0_0_0),
+        (ROT_mY_X_mZ, TR_0_0_0),
+        (ROT_X_mY_Z, TR_0_0_0),
+        (ROT_mX_Y_Z, TR_0_0_0),
+        (ROT_mY_mX_Z, TR_12_12_0),
+        (ROT_Y_X_Z, TR_12_12_0)])
 
 sg130 = SpaceGroup(
     number=130,
@@ -2639,23 +2637,23 @@ sg130 = SpaceGroup(
     point_group_name="PG4/mmm",
     crystal_system=TETRAGONAL,
     pdb_name="P 4/n 2/c 2/c",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mY_X_Z, TR_12_12_0),
-        SymOp(ROT_Y_mX_Z, TR_12_12_0),
-        SymOp(ROT_mX_Y_mZ, TR_12_12_12),
-        SymOp(ROT_X_mY_mZ, TR_12_12_12),
-        SymOp(ROT_Y_X_mZ, TR_0_0_12),
-        SymOp(ROT_mY_mX_mZ, TR_0_0_12),
-        SymOp(ROT_mX_mY_mZ, TR_12_12_0),
-        SymOp(ROT_X_Y_mZ, TR_12_12_0),
-        SymOp(ROT_Y_mX_mZ, TR_0_0_0),
-        SymOp(ROT_mY_X_mZ, TR_0_0_0),
-        SymOp(ROT_X_mY_Z, TR_0_0_12),
-        SymOp(ROT_mX_Y_Z, TR_0_0_12),
-        SymOp(ROT_mY_mX_Z, TR_12_12_12),
-        SymOp(ROT_Y_X_Z, TR_12_12_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mY_X_Z, TR_12_12_0),
+        (ROT_Y_mX_Z, TR_12_12_0),
+        (ROT_mX_Y_mZ, TR_12_12_12),
+        (ROT_X_mY_mZ, TR_12_12_12),
+        (ROT_Y_X_mZ, TR_0_0_12),
+        (ROT_mY_mX_mZ, TR_0_0_12),
+        (ROT_mX_mY_mZ, TR_12_12_0),
+        (ROT_X_Y_mZ, TR_12_12_0),
+        (ROT_Y_mX_mZ, TR_0_0_0),
+        (ROT_mY_X_mZ, TR_0_0_0),
+        (ROT_X_mY_Z, TR_0_0_12),
+        (ROT_mX_Y_Z, TR_0_0_12),
+        (ROT_mY_mX_Z, TR_12_12_12),
+        (ROT_Y_X_Z, TR_12_12_12)])
 
 sg131 = SpaceGroup(
     number=131,
@@ -2665,23 +2663,23 @@ sg131 = SpaceGroup(
     point_group_name="PG4/mmm",
     crystal_system=TETRAGONAL,
     pdb_name="P 42/m 2/m 2/c",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mY_X_Z, TR_0_0_12),
-        SymOp(ROT_Y_mX_Z, TR_0_0_12),
-        SymOp(ROT_mX_Y_mZ, TR_0_0_0),
-        SymOp(ROT_X_mY_mZ, TR_0_0_0),
-        SymOp(ROT_Y_X_mZ, TR_0_0_12),
-        SymOp(ROT_mY_mX_mZ, TR_0_0_12),
-        SymOp(ROT_mX_mY_mZ, TR_0_0_0),
-        SymOp(ROT_X_Y_mZ, TR_0_0_0),
-        SymOp(ROT_Y_mX_mZ, TR_0_0_12),
-        SymOp(ROT_mY_X_mZ, TR_0_0_12),
-        SymOp(ROT_X_mY_Z, TR_0_0_0),
-        SymOp(ROT_mX_Y_Z, TR_0_0_0),
-        SymOp(ROT_mY_mX_Z, TR_0_0_12),
-        SymOp(ROT_Y_X_Z, TR_0_0_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mY_X_Z, TR_0_0_12),
+        (ROT_Y_mX_Z, TR_0_0_12),
+        (ROT_mX_Y_mZ, TR_0_0_0),
+        (ROT_X_mY_mZ, TR_0_0_0),
+        (ROT_Y_X_mZ, TR_0_0_12),
+        (ROT_mY_mX_mZ, TR_0_0_12),
+        (ROT_mX_mY_mZ, TR_0_0_0),
+        (ROT_X_Y_mZ, TR_0_0_0),
+        (ROT_Y_mX_mZ, TR_0_0_12),
+        (ROT_mY_X_mZ, TR_0_0_12),
+        (ROT_X_mY_Z, TR_0_0_0),
+        (ROT_mX_Y_Z, TR_0_0_0),
+        (ROT_mY_mX_Z, TR_0_0_12),
+        (ROT_Y_X_Z, TR_0_0_12)])
 
 sg132 = SpaceGroup(
     number=132,
@@ -2691,23 +2689,23 @@ sg132 = SpaceGroup(
     point_group_name="PG4/mmm",
     crystal_system=TETRAGONAL,
     pdb_name="P 42/m 2/c 2/m",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mY_X_Z, TR_0_0_12),
-        SymOp(ROT_Y_mX_Z, TR_0_0_12),
-        SymOp(ROT_mX_Y_mZ, TR_0_0_12),
-        SymOp(ROT_X_mY_mZ, TR_0_0_12),
-        SymOp(ROT_Y_X_mZ, TR_0_0_0),
-        SymOp(ROT_mY_mX_mZ, TR_0_0_0),
-        SymOp(ROT_mX_mY_mZ, TR_0_0_0),
-        SymOp(ROT_X_Y_mZ, TR_0_0_0),
-        SymOp(ROT_Y_mX_mZ, TR_0_0_12),
-        SymOp(ROT_mY_X_mZ, TR_0_0_12),
-        SymOp(ROT_X_mY_Z, TR_0_0_12),
-        SymOp(ROT_mX_Y_Z, TR_0_0_12),
-        SymOp(ROT_mY_mX_Z, TR_0_0_0),
-        SymOp(ROT_Y_X_Z, TR_0_0_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mY_X_Z, TR_0_0_12),
+        (ROT_Y_mX_Z, TR_0_0_12),
+        (ROT_mX_Y_mZ, TR_0_0_12),
+        (ROT_X_mY_mZ, TR_0_0_12),
+        (ROT_Y_X_mZ, TR_0_0_0),
+        (ROT_mY_mX_mZ, TR_0_0_0),
+        (ROT_mX_mY_mZ, TR_0_0_0),
+        (ROT_X_Y_mZ, TR_0_0_0),
+        (ROT_Y_mX_mZ, TR_0_0_12),
+        (ROT_mY_X_mZ, TR_0_0_12),
+        (ROT_X_mY_Z, TR_0_0_12),
+        (ROT_mX_Y_Z, TR_0_0_12),
+        (ROT_mY_mX_Z, TR_0_0_0),
+        (ROT_Y_X_Z, TR_0_0_0)])
 
 sg133 = SpaceGroup(
     number=133,
@@ -2717,23 +2715,23 @@ sg133 = SpaceGroup(
     point_group_name="PG4/mmm",
     crystal_system=TETRAGONAL,
     pdb_name="P 42/n 2/b 2/c",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mY_X_Z, TR_12_12_12),
-        SymOp(ROT_Y_mX_Z, TR_12_12_12),
-        SymOp(ROT_mX_Y_mZ, TR_0_0_12),
-        SymOp(ROT_X_mY_mZ, TR_0_0_12),
-        SymOp(ROT_Y_X_mZ, TR_12_12_0),
-        SymOp(ROT_mY_mX_mZ, TR_12_12_0),
-        SymOp(ROT_mX_mY_mZ, TR_12_12_12),
-        SymOp(ROT_X_Y_mZ, TR_12_12_12),
-        SymOp(ROT_Y_mX_mZ, TR_0_0_0),
-        SymOp(ROT_mY_X_mZ, TR_0_0_0),
-        SymOp(ROT_X_mY_Z, TR_12_12_0),
-        SymOp(ROT_mX_Y_Z, TR_12_12_0),
-        SymOp(ROT_mY_mX_Z, TR_0_0_12),
-        SymOp(ROT_Y_X_Z, TR_0_0_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mY_X_Z, TR_12_12_12),
+        (ROT_Y_mX_Z, TR_12_12_12),
+        (ROT_mX_Y_mZ, TR_0_0_12),
+        (ROT_X_mY_mZ, TR_0_0_12),
+        (ROT_Y_X_mZ, TR_12_12_0),
+        (ROT_mY_mX_mZ, TR_12_12_0),
+        (ROT_mX_mY_mZ, TR_12_12_12),
+        (ROT_X_Y_mZ, TR_12_12_12),
+        (ROT_Y_mX_mZ, TR_0_0_0),
+        (ROT_mY_X_mZ, TR_0_0_0),
+        (ROT_X_mY_Z, TR_12_12_0),
+        (ROT_mX_Y_Z, TR_12_12_0),
+        (ROT_mY_mX_Z, TR_0_0_12),
+        (ROT_Y_X_Z, TR_0_0_12)])
 
 sg134 = SpaceGroup(
     number=134,
@@ -2743,23 +2741,23 @@ sg134 = SpaceGroup(
     point_group_name="PG4/mmm",
     crystal_system=TETRAGONAL,
     pdb_name="P 42/n 2/n 2/m",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mY_X_Z, TR_12_12_12),
-        SymOp(ROT_Y_mX_Z, TR_12_12_12),
-        SymOp(ROT_mX_Y_mZ, TR_0_0_0),
-        SymOp(ROT_X_mY_mZ, TR_0_0_0),
-        SymOp(ROT_Y_X_mZ, TR_12_12_12),
-        SymOp(ROT_mY_mX_mZ, TR_12_12_12),
-        SymOp(ROT_mX_mY_mZ, TR_12_12_12),
-        SymOp(ROT_X_Y_mZ, TR_12_12_12),
-        SymOp(ROT_Y_mX_mZ, TR_0_0_0),
-        SymOp(ROT_mY_X_mZ, TR_0_0_0),
-        SymOp(ROT_X_mY_Z, TR_12_12_12),
-        SymOp(ROT_mX_Y_Z, TR_12_12_12),
-        SymOp(ROT_mY_mX_Z, TR_0_0_0),
-        SymOp(ROT_Y_X_Z, TR_0_0_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mY_X_Z, TR_12_12_12),
+        (ROT_Y_mX_Z, TR_12_12_12),
+        (ROT_mX_Y_mZ, TR_0_0_0),
+        (ROT_X_mY_mZ, TR_0_0_0),
+        (ROT_Y_X_mZ, TR_12_12_12),
+        (ROT_mY_mX_mZ, TR_12_12_12),
+        (ROT_mX_mY_mZ, TR_12_12_12),
+        (ROT_X_Y_mZ, TR_12_12_12),
+        (ROT_Y_mX_mZ, TR_0_0_0),
+        (ROT_mY_X_mZ, TR_0_0_0),
+        (ROT_X_mY_Z, TR_12_12_12),
+        (ROT_mX_Y_Z, TR_12_12_12),
+        (ROT_mY_mX_Z, TR_0_0_0),
+        (ROT_Y_X_Z, TR_0_0_0)])
 
 sg135 = SpaceGroup(
     number=135,
@@ -2769,23 +2767,23 @@ sg135 = SpaceGroup(
     point_group_name="PG4/mmm",
     crystal_system=TETRAGONAL,
     pdb_name="P 42/m 21/b 2/c",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mY_X_Z, TR_0_0_12),
-        SymOp(ROT_Y_mX_Z, TR_0_0_12),
-        SymOp(ROT_mX_Y_mZ, TR_12_12_0),
-        SymOp(ROT_X_mY_mZ, TR_12_12_0),
-        SymOp(ROT_Y_X_mZ, TR_12_12_12),
-        SymOp(ROT_mY_mX_mZ, TR_12_12_12),
-        SymOp(ROT_mX_mY_mZ, TR_0_0_0),
-        SymOp(ROT_X_Y_mZ, TR_0_0_0),
-        SymOp(ROT_Y_mX_mZ, TR_0_0_12),
-        SymOp(ROT_mY_X_mZ, TR_0_0_12),
-        SymOp(ROT_X_mY_Z, TR_12_12_0),
-        SymOp(ROT_mX_Y_Z, TR_12_12_0),
-        SymOp(ROT_mY_mX_Z, TR_12_12_12),
-        SymOp(ROT_Y_X_Z, TR_12_12_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mY_X_Z, TR_0_0_12),
+        (ROT_Y_mX_Z, TR_0_0_12),
+        (ROT_mX_Y_mZ, TR_12_12_0),
+        (ROT_X_mY_mZ, TR_12_12_0),
+        (ROT_Y_X_mZ, TR_12_12_12),
+        (ROT_mY_mX_mZ, TR_12_12_12),
+        (ROT_mX_mY_mZ, TR_0_0_0),
+        (ROT_X_Y_mZ, TR_0_0_0),
+        (ROT_Y_mX_mZ, TR_0_0_12),
+        (ROT_mY_X_mZ, TR_0_0_12),
+        (ROT_X_mY_Z, TR_12_12_0),
+        (ROT_mX_Y_Z, TR_12_12_0),
+        (ROT_mY_mX_Z, TR_12_12_12),
+        (ROT_Y_X_Z, TR_12_12_12)])
 
 sg136 = SpaceGroup(
     number=136,
@@ -2795,23 +2793,23 @@ sg136 = SpaceGroup(
     point_group_name="PG4/mmm",
     crystal_system=TETRAGONAL,
     pdb_name="P 42/m 21/n 2/m",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mY_X_Z, TR_12_12_12),
-        SymOp(ROT_Y_mX_Z, TR_12_12_12),
-        SymOp(ROT_mX_Y_mZ, TR_12_12_12),
-        SymOp(ROT_X_mY_mZ, TR_12_12_12),
-        SymOp(ROT_Y_X_mZ, TR_0_0_0),
-        SymOp(ROT_mY_mX_mZ, TR_0_0_0),
-        SymOp(ROT_mX_mY_mZ, TR_0_0_0),
-        SymOp(ROT_X_Y_mZ, TR_0_0_0),
-        SymOp(ROT_Y_mX_mZ, TR_12_12_12),
-        SymOp(ROT_mY_X_mZ, TR_12_12_12),
-        SymOp(ROT_X_mY_Z, TR_12_12_12),
-        SymOp(ROT_mX_Y_Z, TR_12_12_12),
-        SymOp(ROT_mY_mX_Z, TR_0_0_0),
-        SymOp(ROT_Y_X_Z, TR_0_0_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mY_X_Z, TR_12_12_12),
+        (ROT_Y_mX_Z, TR_12_12_12),
+        (ROT_mX_Y_mZ, TR_12_12_12),
+        (ROT_X_mY_mZ, TR_12_12_12),
+        (ROT_Y_X_mZ, TR_0_0_0),
+        (ROT_mY_mX_mZ, TR_0_0_0),
+        (ROT_mX_mY_mZ, TR_0_0_0),
+        (ROT_X_Y_mZ, TR_0_0_0),
+        (ROT_Y_mX_mZ, TR_12_12_12),
+        (ROT_mY_X_mZ, TR_12_12_12),
+        (ROT_X_mY_Z, TR_12_12_12),
+        (ROT_mX_Y_Z, TR_12_12_12),
+        (ROT_mY_mX_Z, TR_0_0_0),
+        (ROT_Y_X_Z, TR_0_0_0)])
 
 sg137 = SpaceGroup(
     number=137,
@@ -2821,23 +2819,23 @@ sg137 = SpaceGroup(
     point_group_name="PG4/mmm",
     crystal_system=TETRAGONAL,
     pdb_name="P 42/n 21/m 2/c",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mY_X_Z, TR_12_12_12),
-        SymOp(ROT_Y_mX_Z, TR_12_12_12),
-        SymOp(ROT_mX_Y_mZ, TR_12_12_12),
-        SymOp(ROT_X_mY_mZ, TR_12_12_12),
-        SymOp(ROT_Y_X_mZ, TR_0_0_0),
-        SymOp(ROT_mY_mX_mZ, TR_0_0_0),
-        SymOp(ROT_mX_mY_mZ, TR_12_12_12),
-        SymOp(ROT_X_Y_mZ, TR_12_12_12),
-        SymOp(ROT_Y_mX_mZ, TR_0_0_0),
-        SymOp(ROT_mY_X_mZ, TR_0_0_0),
-        SymOp(ROT_X_mY_Z, TR_0_0_0),
-        SymOp(ROT_mX_Y_Z, TR_0_0_0),
-        SymOp(ROT_mY_mX_Z, TR_12_12_12),
-        SymOp(ROT_Y_X_Z, TR_12_12_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mY_X_Z, TR_12_12_12),
+        (ROT_Y_mX_Z, TR_12_12_12),
+        (ROT_mX_Y_mZ, TR_12_12_12),
+        (ROT_X_mY_mZ, TR_12_12_12),
+        (ROT_Y_X_mZ, TR_0_0_0),
+        (ROT_mY_mX_mZ, TR_0_0_0),
+        (ROT_mX_mY_mZ, TR_12_12_12),
+        (ROT_X_Y_mZ, TR_12_12_12),
+        (ROT_Y_mX_mZ, TR_0_0_0),
+        (ROT_mY_X_mZ, TR_0_0_0),
+        (ROT_X_mY_Z, TR_0_0_0),
+        (ROT_mX_Y_Z, TR_0_0_0),
+        (ROT_mY_mX_Z, TR_12_12_12),
+        (ROT_Y_X_Z, TR_12_12_12)])
 
 sg138 = SpaceGroup(
     number=138,
@@ -2847,23 +2845,23 @@ sg138 = SpaceGroup(
     point_group_name="PG4/mmm",
     crystal_system=TETRAGONAL,
     pdb_name="P 42/n 21/c 2/m",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mY_X_Z, TR_12_12_12),
-        SymOp(ROT_Y_mX_Z, TR_12_12_12),
-        SymOp(ROT_mX_Y_mZ, TR_12_12_0),
-        SymOp(ROT_X_mY_mZ, TR_12_12_0),
-        SymOp(ROT_Y_X_mZ, TR_0_0_12),
-        SymOp(ROT_mY_mX_mZ, TR_0_0_12),
-        SymOp(ROT_mX_mY_mZ, TR_12_12_12),
-        SymOp(ROT_X_Y_mZ, TR_12_12_12),
-        SymOp(ROT_Y_mX_mZ, TR_0_0_0),
-        SymOp(ROT_mY_X_mZ, TR_0_0_0),
-        SymOp(ROT_X_mY_Z, TR_0_0_12),
-        SymOp(ROT_mX_Y_Z, TR_0_0_12),
-        SymOp(ROT_mY_mX_Z, TR_12_12_0),
-        SymOp(ROT_Y_X_Z, TR_12_12_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mY_X_Z, TR_12_12_12),
+        (ROT_Y_mX_Z, TR_12_12_12),
+        (ROT_mX_Y_mZ, TR_12_12_0),
+        (ROT_X_mY_mZ, TR_12_12_0),
+        (ROT_Y_X_mZ, TR_0_0_12),
+        (ROT_mY_mX_mZ, TR_0_0_12),
+        (ROT_mX_mY_mZ, TR_12_12_12),
+        (ROT_X_Y_mZ, TR_12_12_12),
+        (ROT_Y_mX_mZ, TR_0_0_0),
+        (ROT_mY_X_mZ, TR_0_0_0),
+        (ROT_X_mY_Z, TR_0_0_12),
+        (ROT_mX_Y_Z, TR_0_0_12),
+        (ROT_mY_mX_Z, TR_12_12_0),
+        (ROT_Y_X_Z, TR_12_12_0)])
 
 sg139 = SpaceGroup(
     number=139,
@@ -2873,39 +2871,39 @@ sg139 = SpaceGroup(
     point_group_name="PG4/mmm",
     crystal_system=TETRAGONAL,
     pdb_name="I 4/m 2/m 2/m",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mY_X_Z, TR_0_0_0),
-        SymOp(ROT_Y_mX_Z, TR_0_0_0),
-        SymOp(ROT_mX_Y_mZ, TR_0_0_0),
-        SymOp(ROT_X_mY_mZ, TR_0_0_0),
-        SymOp(ROT_Y_X_mZ, TR_0_0_0),
-        SymOp(ROT_mY_mX_mZ, TR_0_0_0),
-        SymOp(ROT_mX_mY_mZ, TR_0_0_0),
-        SymOp(ROT_X_Y_mZ, TR_0_0_0),
-        SymOp(ROT_Y_mX_mZ, TR_0_0_0),
-        SymOp(ROT_mY_X_mZ, TR_0_0_0),
-        SymOp(ROT_X_mY_Z, TR_0_0_0),
-        SymOp(ROT_mX_Y_Z, TR_0_0_0),
-        SymOp(ROT_mY_mX_Z, TR_0_0_0),
-        SymOp(ROT_Y_X_Z, TR_0_0_0),
-        SymOp(ROT_X_Y_Z, TR_12_12_12),
-        SymOp(ROT_mX_mY_Z, TR_12_12_12),
-        SymOp(ROT_mY_X_Z, TR_12_12_12),
-        SymOp(ROT_Y_mX_Z, TR_12_12_12),
-        SymOp(ROT_mX_Y_mZ, TR_12_12_12),
-        SymOp(ROT_X_mY_mZ, TR_12_12_12),
-        SymOp(ROT_Y_X_mZ, TR_12_12_12),
-        SymOp(ROT_mY_mX_mZ, TR_12_12_12),
-        SymOp(ROT_mX_mY_mZ, TR_12_12_12),
-        SymOp(ROT_X_Y_mZ, TR_12_12_12),
-        SymOp(ROT_Y_mX_mZ, TR_12_12_12),
-        SymOp(ROT_mY_X_mZ, TR_12_12_12),
-        SymOp(ROT_X_mY_Z, TR_12_12_12),
-        SymOp(ROT_mX_Y_Z, TR_12_12_12),
-        SymOp(ROT_mY_mX_Z, TR_12_12_12),
-        SymOp(ROT_Y_X_Z, TR_12_12_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mY_X_Z, TR_0_0_0),
+        (ROT_Y_mX_Z, TR_0_0_0),
+        (ROT_mX_Y_mZ, TR_0_0_0),
+        (ROT_X_mY_mZ, TR_0_0_0),
+        (ROT_Y_X_mZ, TR_0_0_0),
+        (ROT_mY_mX_mZ, TR_0_0_0),
+        (ROT_mX_mY_mZ, TR_0_0_0),
+        (ROT_X_Y_mZ, TR_0_0_0),
+        (ROT_Y_mX_mZ, TR_0_0_0),
+        (ROT_mY_X_mZ, TR_0_0_0),
+        (ROT_X_mY_Z, TR_0_0_0),
+        (ROT_mX_Y_Z, TR_0_0_0),
+        (ROT_mY_mX_Z, TR_0_0_0),
+        (ROT_Y_X_Z, TR_0_0_0),
+        (ROT_X_Y_Z, TR_12_12_12),
+        (ROT_mX_mY_Z, TR_12_12_12),
+        (ROT_mY_X_Z, TR_12_12_12),
+        (ROT_Y_mX_Z, TR_12_12_12),
+        (ROT_mX_Y_mZ, TR_12_12_12),
+        (ROT_X_mY_mZ, TR_12_12_12),
+        (ROT_Y_X_mZ, TR_12_12_12),
+        (ROT_mY_mX_mZ, TR_12_12_12),
+        (ROT_mX_mY_mZ, TR_12_12_12),
+        (ROT_X_Y_mZ, TR_12_12_12),
+        (ROT_Y_mX_mZ, TR_12_12_12),
+        (ROT_mY_X_mZ, TR_12_12_12),
+        (ROT_X_mY_Z, TR_12_12_12),
+        (ROT_mX_Y_Z, TR_12_12_12),
+        (ROT_mY_mX_Z, TR_12_12_12),
+        (ROT_Y_X_Z, TR_12_12_12)])
 
 sg140 = SpaceGroup(
     number=140,
@@ -2915,39 +2913,39 @@ sg140 = SpaceGroup(
     point_group_name="PG4/mmm",
     crystal_system=TETRAGONAL,
     pdb_name="I 4/m 2/c 2/m",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mY_X_Z, TR_0_0_0),
-        SymOp(ROT_Y_mX_Z, TR_0_0_0),
-        SymOp(ROT_mX_Y_mZ, TR_0_0_12),
-        SymOp(ROT_X_mY_mZ, TR_0_0_12),
-        SymOp(ROT_Y_X_mZ, TR_0_0_12),
-        SymOp(ROT_mY_mX_mZ, TR_0_0_12),
-        SymOp(ROT_mX_mY_mZ, TR_0_0_0),
-        SymOp(ROT_X_Y_mZ, TR_0_0_0),
-        SymOp(ROT_Y_mX_mZ, TR_0_0_0),
-        SymOp(ROT_mY_X_mZ, TR_0_0_0),
-        SymOp(ROT_X_mY_Z, TR_0_0_12),
-        SymOp(ROT_mX_Y_Z, TR_0_0_12),
-        SymOp(ROT_mY_mX_Z, TR_0_0_12),
-        SymOp(ROT_Y_X_Z, TR_0_0_12),
-        SymOp(ROT_X_Y_Z, TR_12_12_12),
-        SymOp(ROT_mX_mY_Z, TR_12_12_12),
-        SymOp(ROT_mY_X_Z, TR_12_12_12),
-        SymOp(ROT_Y_mX_Z, TR_12_12_12),
-        SymOp(ROT_mX_Y_mZ, TR_12_12_0),
-        SymOp(ROT_X_mY_mZ, TR_12_12_0),
-        SymOp(ROT_Y_X_mZ, TR_12_12_0),
-        SymOp(ROT_mY_mX_mZ, TR_12_12_0),
-        SymOp(ROT_mX_mY_mZ, TR_12_12_12),
-        SymOp(ROT_X_Y_mZ, TR_12_12_12),
-        SymOp(ROT_Y_mX_mZ, TR_12_12_12),
-        SymOp(ROT_mY_X_mZ, TR_12_12_12),
-        SymOp(ROT_X_mY_Z, TR_12_12_0),
-        SymOp(ROT_mX_Y_Z, TR_12_12_0),
-        SymOp(ROT_mY_mX_Z, TR_12_12_0),
-        SymOp(ROT_Y_X_Z, TR_12_12_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mY_X_Z, TR_0_0_0),
+        (ROT_Y_mX_Z, TR_0_0_0),
+        (ROT_mX_Y_mZ, TR_0_0_12),
+        (ROT_X_mY_mZ, TR_0_0_12),
+        (ROT_Y_X_mZ, TR_0_0_12),
+        (ROT_mY_mX_mZ, TR_0_0_12),
+        (ROT_mX_mY_mZ, TR_0_0_0),
+        (ROT_X_Y_mZ, TR_0_0_0),
+        (ROT_Y_mX_mZ, TR_0_0_0),
+        (ROT_mY_X_mZ, TR_0_0_0),
+        (ROT_X_mY_Z, TR_0_0_12),
+        (ROT_mX_Y_Z, TR_0_0_12),
+        (ROT_mY_mX_Z, TR_0_0_12),
+        (ROT_Y_X_Z, TR_0_0_12),
+        (ROT_X_Y_Z, TR_12_12_12),
+        (ROT_mX_mY_Z, TR_12_12_12),
+        (ROT_mY_X_Z, TR_12_12_12),
+        (ROT_Y_mX_Z, TR_12_12_12),
+        (ROT_mX_Y_mZ, TR_12_12_0),
+        (ROT_X_mY_mZ, TR_12_12_0),
+        (ROT_Y_X_mZ, TR_12_12_0),
+        (ROT_mY_mX_mZ, TR_12_12_0),
+        (ROT_mX_mY_mZ, TR_12_12_12),
+        (ROT_X_Y_mZ, TR_12_12_12),
+        (ROT_Y_mX_mZ, TR_12_12_12),
+        (ROT_mY_X_mZ, TR_12_12_12),
+        (ROT_X_mY_Z, TR_12_12_0),
+        (ROT_mX_Y_Z, TR_12_12_0),
+        (ROT_mY_mX_Z, TR_12_12_0),
+        (ROT_Y_X_Z, TR_12_12_0)])
 
 sg141 = SpaceGroup(
     number=141,
@@ -2957,39 +2955,39 @@ sg141 = SpaceGroup(
     point_group_name="PG4/mmm",
     crystal_system=TETRAGONAL,
     pdb_name="I 41/a 2/m 2/d",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_12_12_12),
-        SymOp(ROT_mY_X_Z, TR_0_12_14),
-        SymOp(ROT_Y_mX_Z, TR_12_0_34),
-        SymOp(ROT_mX_Y_mZ, TR_12_0_34),
-        SymOp(ROT_X_mY_mZ, TR_0_12_14),
-        SymOp(ROT_Y_X_mZ, TR_12_12_12),
-        SymOp(ROT_mY_mX_mZ, TR_0_0_0),
-        SymOp(ROT_mX_mY_mZ, TR_0_12_14),
-        SymOp(ROT_X_Y_mZ, TR_12_0_34),
-        SymOp(ROT_Y_mX_mZ, TR_0_0_0),
-        SymOp(ROT_mY_X_mZ, TR_12_12_12),
-        SymOp(ROT_X_mY_Z, TR_12_12_12),
-        SymOp(ROT_mX_Y_Z, TR_0_0_0),
-        SymOp(ROT_mY_mX_Z, TR_12_0_34),
-        SymOp(ROT_Y_X_Z, TR_0_12_14),
-        SymOp(ROT_X_Y_Z, TR_12_12_12),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mY_X_Z, TR_12_0_34),
-        SymOp(ROT_Y_mX_Z, TR_0_12_14),
-        SymOp(ROT_mX_Y_mZ, TR_0_12_14),
-        SymOp(ROT_X_mY_mZ, TR_12_0_34),
-        SymOp(ROT_Y_X_mZ, TR_0_0_0),
-        SymOp(ROT_mY_mX_mZ, TR_12_12_12),
-        SymOp(ROT_mX_mY_mZ, TR_12_0_34),
-        SymOp(ROT_X_Y_mZ, TR_0_12_14),
-        SymOp(ROT_Y_mX_mZ, TR_12_12_12),
-        SymOp(ROT_mY_X_mZ, TR_0_0_0),
-        SymOp(ROT_X_mY_Z, TR_0_0_0),
-        SymOp(ROT_mX_Y_Z, TR_12_12_12),
-        SymOp(ROT_mY_mX_Z, TR_0_12_14),
-        SymOp(ROT_Y_X_Z, TR_12_0_34)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_12_12_12),
+        (ROT_mY_X_Z, TR_0_12_14),
+        (ROT_Y_mX_Z, TR_12_0_34),
+        (ROT_mX_Y_mZ, TR_12_0_34),
+        (ROT_X_mY_mZ, TR_0_12_14),
+        (ROT_Y_X_mZ, TR_12_12_12),
+        (ROT_mY_mX_mZ, TR_0_0_0),
+        (ROT_mX_mY_mZ, TR_0_12_14),
+        (ROT_X_Y_mZ, TR_12_0_34),
+        (ROT_Y_mX_mZ, TR_0_0_0),
+        (ROT_mY_X_mZ, TR_12_12_12),
+        (ROT_X_mY_Z, TR_12_12_12),
+        (ROT_mX_Y_Z, TR_0_0_0),
+        (ROT_mY_mX_Z, TR_12_0_34),
+        (ROT_Y_X_Z, TR_0_12_14),
+        (ROT_X_Y_Z, TR_12_12_12),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mY_X_Z, TR_12_0_34),
+        (ROT_Y_mX_Z, TR_0_12_14),
+        (ROT_mX_Y_mZ, TR_0_12_14),
+        (ROT_X_mY_mZ, TR_12_0_34),
+        (ROT_Y_X_mZ, TR_0_0_0),
+        (ROT_mY_mX_mZ, TR_12_12_12),
+        (ROT_mX_mY_mZ, TR_12_0_34),
+        (ROT_X_Y_mZ, TR_0_12_14),
+        (ROT_Y_mX_mZ, TR_12_12_12),
+        (ROT_mY_X_mZ, TR_0_0_0),
+        (ROT_X_mY_Z, TR_0_0_0),
+        (ROT_mX_Y_Z, TR_12_12_12),
+        (ROT_mY_mX_Z, TR_0_12_14),
+        (ROT_Y_X_Z, TR_12_0_34)])
 
 sg142 = SpaceGroup(
     number=142,
@@ -2999,39 +2997,39 @@ sg142 = SpaceGroup(
     point_group_name="PG4/mmm",
     crystal_system=TETRAGONAL,
     pdb_name="I 41/a 2/c 2/d",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_12_12_12),
-        SymOp(ROT_mY_X_Z, TR_0_12_14),
-        SymOp(ROT_Y_mX_Z, TR_12_0_34),
-        SymOp(ROT_mX_Y_mZ, TR_12_0_14),
-        SymOp(ROT_X_mY_mZ, TR_0_12_34),
-        SymOp(ROT_Y_X_mZ, TR_12_12_0),
-        SymOp(ROT_mY_mX_mZ, TR_0_0_12),
-        SymOp(ROT_mX_mY_mZ, TR_0_12_14),
-        SymOp(ROT_X_Y_mZ, TR_12_0_34),
-        SymOp(ROT_Y_mX_mZ, TR_0_0_0),
-        SymOp(ROT_mY_X_mZ, TR_12_12_12),
-        SymOp(ROT_X_mY_Z, TR_12_12_0),
-        SymOp(ROT_mX_Y_Z, TR_0_0_12),
-        SymOp(ROT_mY_mX_Z, TR_12_0_14),
-        SymOp(ROT_Y_X_Z, TR_0_12_34),
-        SymOp(ROT_X_Y_Z, TR_12_12_12),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mY_X_Z, TR_12_0_34),
-        SymOp(ROT_Y_mX_Z, TR_0_12_14),
-        SymOp(ROT_mX_Y_mZ, TR_0_12_34),
-        SymOp(ROT_X_mY_mZ, TR_12_0_14),
-        SymOp(ROT_Y_X_mZ, TR_0_0_12),
-        SymOp(ROT_mY_mX_mZ, TR_12_12_0),
-        SymOp(ROT_mX_mY_mZ, TR_12_0_34),
-        SymOp(ROT_X_Y_mZ, TR_0_12_14),
-        SymOp(ROT_Y_mX_mZ, TR_12_12_12),
-        SymOp(ROT_mY_X_mZ, TR_0_0_0),
-        SymOp(ROT_X_mY_Z, TR_0_0_12),
-        SymOp(ROT_mX_Y_Z, TR_12_12_0),
-        SymOp(ROT_mY_mX_Z, TR_0_12_34),
-        SymOp(ROT_Y_X_Z, TR_12_0_14)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_12_12_12),
+        (ROT_mY_X_Z, TR_0_12_14),
+        (ROT_Y_mX_Z, TR_12_0_34),
+        (ROT_mX_Y_mZ, TR_12_0_14),
+        (ROT_X_mY_mZ, TR_0_12_34),
+        (ROT_Y_X_mZ, TR_12_12_0),
+        (ROT_mY_mX_mZ, TR_0_0_12),
+        (ROT_mX_mY_mZ, TR_0_12_14),
+        (ROT_X_Y_mZ, TR_12_0_34),
+        (ROT_Y_mX_mZ, TR_0_0_0),
+        (ROT_mY_X_mZ, TR_12_12_12),
+        (ROT_X_mY_Z, TR_12_12_0),
+        (ROT_mX_Y_Z, TR_0_0_12),
+        (ROT_mY_mX_Z, TR_12_0_14),
+        (ROT_Y_X_Z, TR_0_12_34),
+        (ROT_X_Y_Z, TR_12_12_12),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mY_X_Z, TR_12_0_34),
+        (ROT_Y_mX_Z, TR_0_12_14),
+        (ROT_mX_Y_mZ, TR_0_12_34),
+        (ROT_X_mY_mZ, TR_12_0_14),
+        (ROT_Y_X_mZ, TR_0_0_12),
+        (ROT_mY_mX_mZ, TR_12_12_0),
+        (ROT_mX_mY_mZ, TR_12_0_34),
+        (ROT_X_Y_mZ, TR_0_12_14),
+        (ROT_Y_mX_mZ, TR_12_12_12),
+        (ROT_mY_X_mZ, TR_0_0_0),
+        (ROT_X_mY_Z, TR_0_0_12),
+        (ROT_mX_Y_Z, TR_12_12_0),
+        (ROT_mY_mX_Z, TR_0_12_34),
+        (ROT_Y_X_Z, TR_12_0_14)])
 
 sg143 = SpaceGroup(
     number=143,
@@ -3041,10 +3039,10 @@ sg143 = SpaceGroup(
     point_group_name="PG3",
     crystal_system=TRIGONAL,
     pdb_name="P 3",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mY_XmY_Z, TR_0_0_0),
-        SymOp(ROT_mXY_mX_Z, TR_0_0_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mY_XmY_Z, TR_0_0_0),
+        (ROT_mXY_mX_Z, TR_0_0_0)])
 
 sg144 = SpaceGroup(
     number=144,
@@ -3054,10 +3052,10 @@ sg144 = SpaceGroup(
     point_group_name="PG3",
     crystal_system=TRIGONAL,
     pdb_name="P 31",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mY_XmY_Z, TR_0_0_13),
-        SymOp(ROT_mXY_mX_Z, TR_0_0_23)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mY_XmY_Z, TR_0_0_13),
+        (ROT_mXY_mX_Z, TR_0_0_23)])
 
 sg145 = SpaceGroup(
     number=145,
@@ -3067,10 +3065,10 @@ sg145 = SpaceGroup(
     point_group_name="PG3",
     crystal_system=TRIGONAL,
     pdb_name="P 32",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mY_XmY_Z, TR_0_0_23),
-        SymOp(ROT_mXY_mX_Z, TR_0_0_13)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mY_XmY_Z, TR_0_0_23),
+        (ROT_mXY_mX_Z, TR_0_0_13)])
 
 sg146 = SpaceGroup(
     number=146,
@@ -3080,16 +3078,16 @@ sg146 = SpaceGroup(
     point_group_name="PG3",
     crystal_system=TRIGONAL,
     pdb_name="H 3",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mY_XmY_Z, TR_0_0_0),
-        SymOp(ROT_mXY_mX_Z, TR_0_0_0),
-        SymOp(ROT_X_Y_Z, TR_23_13_13),
-        SymOp(ROT_mY_XmY_Z, TR_23_13_13),
-        SymOp(ROT_mXY_mX_Z, TR_23_13_13),
-        SymOp(ROT_X_Y_Z, TR_13_23_23),
-        SymOp(ROT_mY_XmY_Z, TR_13_23_23),
-        SymOp(ROT_mXY_mX_Z, TR_13_23_23)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mY_XmY_Z, TR_0_0_0),
+        (ROT_mXY_mX_Z, TR_0_0_0),
+        (ROT_X_Y_Z, TR_23_13_13),
+        (ROT_mY_XmY_Z, TR_23_13_13),
+        (ROT_mXY_mX_Z, TR_23_13_13),
+        (ROT_X_Y_Z, TR_13_23_23),
+        (ROT_mY_XmY_Z, TR_13_23_23),
+        (ROT_mXY_mX_Z, TR_13_23_23)])
 
 sg1146 = SpaceGroup(
     number=1146,
@@ -3099,10 +3097,10 @@ sg1146 = SpaceGroup(
     point_group_name="PG3",
     crystal_system=TRIGONAL,
     pdb_name="R 3",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_Z_X_Y, TR_0_0_0),
-        SymOp(ROT_Y_Z_X, TR_0_0_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_Z_X_Y, TR_0_0_0),
+        (ROT_Y_Z_X, TR_0_0_0)])
 
 sg147 = SpaceGroup(
     number=147,
@@ -3112,13 +3110,13 @@ sg147 = SpaceGroup(
     point_group_name="PG3bar",
     crystal_system=TRIGONAL,
     pdb_name="P -3",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mY_XmY_Z, TR_0_0_0),
-        SymOp(ROT_mXY_mX_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_mZ, TR_0_0_0),
-        SymOp(ROT_Y_mXY_mZ, TR_0_0_0),
-        SymOp(ROT_XmY_X_mZ, TR_0_0_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mY_XmY_Z, TR_0_0_0),
+        (ROT_mXY_mX_Z, TR_0_0_0),
+        (ROT_mX_mY_mZ, TR_0_0_0),
+        (ROT_Y_mXY_mZ, TR_0_0_0),
+        (ROT_XmY_X_mZ, TR_0_0_0)])
 
 sg148 = SpaceGroup(
     number=148,
@@ -3128,25 +3126,25 @@ sg148 = SpaceGroup(
     point_group_name="PG3bar",
     crystal_system=TRIGONAL,
     pdb_name="H -3",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mY_XmY_Z, TR_0_0_0),
-        SymOp(ROT_mXY_mX_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_mZ, TR_0_0_0),
-        SymOp(ROT_Y_mXY_mZ, TR_0_0_0),
-        SymOp(ROT_XmY_X_mZ, TR_0_0_0),
-        SymOp(ROT_X_Y_Z, TR_23_13_13),
-        SymOp(ROT_mY_XmY_Z, TR_23_13_13),
-        SymOp(ROT_mXY_mX_Z, TR_23_13_13),
-        SymOp(ROT_mX_mY_mZ, TR_23_13_13),
-        SymOp(ROT_Y_mXY_mZ, TR_23_13_13),
-        SymOp(ROT_XmY_X_mZ, TR_23_13_13),
-        SymOp(ROT_X_Y_Z, TR_13_23_23),
-        SymOp(ROT_mY_XmY_Z, TR_13_23_23),
-        SymOp(ROT_mXY_mX_Z, TR_13_23_23),
-        SymOp(ROT_mX_mY_mZ, TR_13_23_23),
-        SymOp(ROT_Y_mXY_mZ, TR_13_23_23),
-        SymOp(ROT_XmY_X_mZ, TR_13_23_23)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mY_XmY_Z, TR_0_0_0),
+        (ROT_mXY_mX_Z, TR_0_0_0),
+        (ROT_mX_mY_mZ, TR_0_0_0),
+        (ROT_Y_mXY_mZ, TR_0_0_0),
+        (ROT_XmY_X_mZ, TR_0_0_0),
+        (ROT_X_Y_Z, TR_23_13_13),
+        (ROT_mY_XmY_Z, TR_23_13_13),
+        (ROT_mXY_mX_Z, TR_23_13_13),
+        (ROT_mX_mY_mZ, TR_23_13_13),
+        (ROT_Y_mXY_mZ, TR_23_13_13),
+        (ROT_XmY_X_mZ, TR_23_13_13),
+        (ROT_X_Y_Z, TR_13_23_23),
+        (ROT_mY_XmY_Z, TR_13_23_23),
+        (ROT_mXY_mX_Z, TR_13_23_23),
+        (ROT_mX_mY_mZ, TR_13_23_23),
+        (ROT_Y_mXY_mZ, TR_13_23_23),
+        (ROT_XmY_X_mZ, TR_13_23_23)])
 
 sg1148 = SpaceGroup(
     number=1148,
@@ -3156,13 +3154,13 @@ sg1148 = SpaceGroup(
     point_group_name="PG3bar",
     crystal_system=TRIGONAL,
     pdb_name="R -3",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_Z_X_Y, TR_0_0_0),
-        SymOp(ROT_Y_Z_X, TR_0_0_0),
-        SymOp(ROT_mX_mY_mZ, TR_0_0_0),
-        SymOp(ROT_mZ_mX_mY, TR_0_0_0),
-        SymOp(ROT_mY_mZ_mX, TR_0_0_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_Z_X_Y, TR_0_0_0),
+        (ROT_Y_Z_X, TR_0_0_0),
+        (ROT_mX_mY_mZ, TR_0_0_0),
+        (ROT_mZ_mX_mY, TR_0_0_0),
+        (ROT_mY_mZ_mX, TR_0_0_0)])
 
 sg149 = SpaceGroup(
     number=149,
@@ -3172,13 +3170,13 @@ sg149 = SpaceGroup(
     point_group_name="PG312",
     crystal_system=TRIGONAL,
     pdb_name="P 3 1 2",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mY_XmY_Z, TR_0_0_0),
-        SymOp(ROT_mXY_mX_Z, TR_0_0_0),
-        SymOp(ROT_mY_mX_mZ, TR_0_0_0),
-        SymOp(ROT_mXY_Y_mZ, TR_0_0_0),
-        SymOp(ROT_X_XmY_mZ, TR_0_0_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mY_XmY_Z, TR_0_0_0),
+        (ROT_mXY_mX_Z, TR_0_0_0),
+        (ROT_mY_mX_mZ, TR_0_0_0),
+        (ROT_mXY_Y_mZ, TR_0_0_0),
+        (ROT_X_XmY_mZ, TR_0_0_0)])
 
 sg150 = SpaceGroup(
     number=150,
@@ -3188,13 +3186,13 @@ sg150 = SpaceGroup(
     point_group_name="PG321",
     crystal_system=TRIGONAL,
     pdb_name="P 3 2 1",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mY_XmY_Z, TR_0_0_0),
-        SymOp(ROT_mXY_mX_Z, TR_0_0_0),
-        SymOp(ROT_Y_X_mZ, TR_0_0_0),
-        SymOp(ROT_XmY_mY_mZ, TR_0_0_0),
-        SymOp(ROT_mX_mXY_mZ, TR_0_0_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mY_XmY_Z, TR_0_0_0),
+        (ROT_mXY_mX_Z, TR_0_0_0),
+        (ROT_Y_X_mZ, TR_0_0_0),
+        (ROT_XmY_mY_mZ, TR_0_0_0),
+        (ROT_mX_mXY_mZ, TR_0_0_0)])
 
 sg151 = SpaceGroup(
     number=151,
@@ -3204,13 +3202,13 @@ sg151 = SpaceGroup(
     point_group_name="PG312",
     crystal_system=TRIGONAL,
     pdb_name="P 31 1 2",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mY_XmY_Z, TR_0_0_13),
-        SymOp(ROT_mXY_mX_Z, TR_0_0_23),
-        SymOp(ROT_mY_mX_mZ, TR_0_0_23),
-        SymOp(ROT_mXY_Y_mZ, TR_0_0_13),
-        SymOp(ROT_X_XmY_mZ, TR_0_0_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mY_XmY_Z, TR_0_0_13),
+        (ROT_mXY_mX_Z, TR_0_0_23),
+        (ROT_mY_mX_mZ, TR_0_0_23),
+        (ROT_mXY_Y_mZ, TR_0_0_13),
+        (ROT_X_XmY_mZ, TR_0_0_0)])
 
 sg152 = SpaceGroup(
     number=152,
@@ -3220,13 +3218,13 @@ sg152 = SpaceGroup(
     point_group_name="PG321",
     crystal_system=TRIGONAL,
     pdb_name="P 31 2 1",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mY_XmY_Z, TR_0_0_13),
-        SymOp(ROT_mXY_mX_Z, TR_0_0_23),
-        SymOp(ROT_Y_X_mZ, TR_0_0_0),
-        SymOp(ROT_XmY_mY_mZ, TR_0_0_23),
-        SymOp(ROT_mX_mXY_mZ, TR_0_0_13)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mY_XmY_Z, TR_0_0_13),
+        (ROT_mXY_mX_Z, TR_0_0_23),
+        (ROT_Y_X_mZ, TR_0_0_0),
+        (ROT_XmY_mY_mZ, TR_0_0_23),
+        (ROT_mX_mXY_mZ, TR_0_0_13)])
 
 sg153 = SpaceGroup(
     number=153,
@@ -3236,13 +3234,13 @@ sg153 = SpaceGroup(
     point_group_name="PG312",
     crystal_system=TRIGONAL,
     pdb_name="P 32 1 2",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mY_XmY_Z, TR_0_0_23),
-        SymOp(ROT_mXY_mX_Z, TR_0_0_13),
-        SymOp(ROT_mY_mX_mZ, TR_0_0_13),
-        SymOp(ROT_mXY_Y_mZ, TR_0_0_23),
-        SymOp(ROT_X_XmY_mZ, TR_0_0_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mY_XmY_Z, TR_0_0_23),
+        (ROT_mXY_mX_Z, TR_0_0_13),
+        (ROT_mY_mX_mZ, TR_0_0_13),
+        (ROT_mXY_Y_mZ, TR_0_0_23),
+        (ROT_X_XmY_mZ, TR_0_0_0)])
 
 sg154 = SpaceGroup(
     number=154,
@@ -3252,13 +3250,13 @@ sg154 = SpaceGroup(
     point_group_name="PG321",
     crystal_system=TRIGONAL,
     pdb_name="P 32 2 1",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mY_XmY_Z, TR_0_0_23),
-        SymOp(ROT_mXY_mX_Z, TR_0_0_13),
-        SymOp(ROT_Y_X_mZ, TR_0_0_0),
-        SymOp(ROT_XmY_mY_mZ, TR_0_0_13),
-        SymOp(ROT_mX_mXY_mZ, TR_0_0_23)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mY_XmY_Z, TR_0_0_23),
+        (ROT_mXY_mX_Z, TR_0_0_13),
+        (ROT_Y_X_mZ, TR_0_0_0),
+        (ROT_XmY_mY_mZ, TR_0_0_13),
+        (ROT_mX_mXY_mZ, TR_0_0_23)])
 
 sg155 = SpaceGroup(
     number=155,
@@ -3268,25 +3266,25 @@ sg155 = SpaceGroup(
     point_group_name="PG321",
     crystal_system=TRIGONAL,
     pdb_name="H 3 2",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mY_XmY_Z, TR_0_0_0),
-        SymOp(ROT_mXY_mX_Z, TR_0_0_0),
-        SymOp(ROT_Y_X_mZ, TR_0_0_0),
-        SymOp(ROT_XmY_mY_mZ, TR_0_0_0),
-        SymOp(ROT_mX_mXY_mZ, TR_0_0_0),
-        SymOp(ROT_X_Y_Z, TR_23_13_13),
-        SymOp(ROT_mY_XmY_Z, TR_23_13_13),
-        SymOp(ROT_mXY_mX_Z, TR_23_13_13),
-        SymOp(ROT_Y_X_mZ, TR_23_13_13),
-        SymOp(ROT_XmY_mY_mZ, TR_23_13_13),
-        SymOp(ROT_mX_mXY_mZ, TR_23_13_13),
-        SymOp(ROT_X_Y_Z, TR_13_23_23),
-        SymOp(ROT_mY_XmY_Z, TR_13_23_23),
-        SymOp(ROT_mXY_mX_Z, TR_13_23_23),
-        SymOp(ROT_Y_X_mZ, TR_13_23_23),
-        SymOp(ROT_XmY_mY_mZ, TR_13_23_23),
-        SymOp(ROT_mX_mXY_mZ, TR_13_23_23)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mY_XmY_Z, TR_0_0_0),
+        (ROT_mXY_mX_Z, TR_0_0_0),
+        (ROT_Y_X_mZ, TR_0_0_0),
+        (ROT_XmY_mY_mZ, TR_0_0_0),
+        (ROT_mX_mXY_mZ, TR_0_0_0),
+        (ROT_X_Y_Z, TR_23_13_13),
+        (ROT_mY_XmY_Z, TR_23_13_13),
+        (ROT_mXY_mX_Z, TR_23_13_13),
+        (ROT_Y_X_mZ, TR_23_13_13),
+        (ROT_XmY_mY_mZ, TR_23_13_13),
+        (ROT_mX_mXY_mZ, TR_23_13_13),
+        (ROT_X_Y_Z, TR_13_23_23),
+        (ROT_mY_XmY_Z, TR_13_23_23),
+        (ROT_mXY_mX_Z, TR_13_23_23),
+        (ROT_Y_X_mZ, TR_13_23_23),
+        (ROT_XmY_mY_mZ, TR_13_23_23),
+        (ROT_mX_mXY_mZ, TR_13_23_23)])
 
 sg1155 = SpaceGroup(
     number=1155,
@@ -3296,13 +3294,13 @@ sg1155 = SpaceGroup(
     point_group_name="PG32",
     crystal_system=TRIGONAL,
     pdb_name="R 3 2",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_Z_X_Y, TR_0_0_0),
-        SymOp(ROT_Y_Z_X, TR_0_0_0),
-        SymOp(ROT_mY_mX_mZ, TR_0_0_0),
-        SymOp(ROT_mX_mZ_mY, TR_0_0_0),
-        SymOp(ROT_mZ_mY_mX, TR_0_0_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_Z_X_Y, TR_0_0_0),
+        (ROT_Y_Z_X, TR_0_0_0),
+        (ROT_mY_mX_mZ, TR_0_0_0),
+        (ROT_mX_mZ_mY, TR_0_0_0),
+        (ROT_mZ_mY_mX, TR_0_0_0)])
 
 sg156 = SpaceGroup(
     number=156,
@@ -3312,13 +3310,13 @@ sg156 = SpaceGroup(
     point_group_name="PG3m1",
     crystal_system=TRIGONAL,
     pdb_name="P 3 m 1",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mY_XmY_Z, TR_0_0_0),
-        SymOp(ROT_mXY_mX_Z, TR_0_0_0),
-        SymOp(ROT_mY_mX_Z, TR_0_0_0),
-        SymOp(ROT_mXY_Y_Z, TR_0_0_0),
-        SymOp(ROT_X_XmY_Z, TR_0_0_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mY_XmY_Z, TR_0_0_0),
+        (ROT_mXY_mX_Z, TR_0_0_0),
+        (ROT_mY_mX_Z, TR_0_0_0),
+        (ROT_mXY_Y_Z, TR_0_0_0),
+        (ROT_X_XmY_Z, TR_0_0_0)])
 
 sg157 = SpaceGroup(
     number=157,
@@ -3328,13 +3326,13 @@ sg157 = SpaceGroup(
     point_group_name="PG31m",
     crystal_system=TRIGONAL,
     pdb_name="P 3 1 m",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mY_XmY_Z, TR_0_0_0),
-        SymOp(ROT_mXY_mX_Z, TR_0_0_0),
-        SymOp(ROT_Y_X_Z, TR_0_0_0),
-        SymOp(ROT_XmY_mY_Z, TR_0_0_0),
-        SymOp(ROT_mX_mXY_Z, TR_0_0_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mY_XmY_Z, TR_0_0_0),
+        (ROT_mXY_mX_Z, TR_0_0_0),
+        (ROT_Y_X_Z, TR_0_0_0),
+        (ROT_XmY_mY_Z, TR_0_0_0),
+        (ROT_mX_mXY_Z, TR_0_0_0)])
 
 sg158 = SpaceGroup(
     number=158,
@@ -3344,13 +3342,13 @@ sg158 = SpaceGroup(
     point_group_name="PG3m1",
     crystal_system=TRIGONAL,
     pdb_name="P 3 c 1",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mY_XmY_Z, TR_0_0_0),
-        SymOp(ROT_mXY_mX_Z, TR_0_0_0),
-        SymOp(ROT_mY_mX_Z, TR_0_0_12),
-        SymOp(ROT_mXY_Y_Z, TR_0_0_12),
-        SymOp(ROT_X_XmY_Z, TR_0_0_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mY_XmY_Z, TR_0_0_0),
+        (ROT_mXY_mX_Z, TR_0_0_0),
+        (ROT_mY_mX_Z, TR_0_0_12),
+        (ROT_mXY_Y_Z, TR_0_0_12),
+        (ROT_X_XmY_Z, TR_0_0_12)])
 
 sg159 = SpaceGroup(
     number=159,
@@ -3360,13 +3358,13 @@ sg159 = SpaceGroup(
     point_group_name="PG31m",
     crystal_system=TRIGONAL,
     pdb_name="P 3 1 c",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mY_XmY_Z, TR_0_0_0),
-        SymOp(ROT_mXY_mX_Z, TR_0_0_0),
-        SymOp(ROT_Y_X_Z, TR_0_0_12),
-        SymOp(ROT_XmY_mY_Z, TR_0_0_12),
-        SymOp(ROT_mX_mXY_Z, TR_0_0_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mY_XmY_Z, TR_0_0_0),
+        (ROT_mXY_mX_Z, TR_0_0_0),
+        (ROT_Y_X_Z, TR_0_0_12),
+        (ROT_XmY_mY_Z, TR_0_0_12),
+        (ROT_mX_mXY_Z, TR_0_0_12)])
 
 sg160 = SpaceGroup(
     number=160,
@@ -3376,25 +3374,25 @@ sg160 = SpaceGroup(
     point_group_name="PG3m",
     crystal_system=TRIGONAL,
     pdb_name="H 3 m",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mY_XmY_Z, TR_0_0_0),
-        SymOp(ROT_mXY_mX_Z, TR_0_0_0),
-        SymOp(ROT_mY_mX_Z, TR_0_0_0),
-        SymOp(ROT_mXY_Y_Z, TR_0_0_0),
-        SymOp(ROT_X_XmY_Z, TR_0_0_0),
-        SymOp(ROT_X_Y_Z, TR_23_13_13),
-        SymOp(ROT_mY_XmY_Z, TR_23_13_13),
-        SymOp(ROT_mXY_mX_Z, TR_23_13_13),
-        SymOp(ROT_mY_mX_Z, TR_23_13_13),
-        SymOp(ROT_mXY_Y_Z, TR_23_13_13),
-        SymOp(ROT_X_XmY_Z, TR_23_13_13),
-        SymOp(ROT_X_Y_Z, TR_13_23_23),
-        SymOp(ROT_mY_XmY_Z, TR_13_23_23),
-        SymOp(ROT_mXY_mX_Z, TR_13_23_23),
-        SymOp(ROT_mY_mX_Z, TR_13_23_23),
-        SymOp(ROT_mXY_Y_Z, TR_13_23_23),
-        SymOp(ROT_X_XmY_Z, TR_13_23_23)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mY_XmY_Z, TR_0_0_0),
+        (ROT_mXY_mX_Z, TR_0_0_0),
+        (ROT_mY_mX_Z, TR_0_0_0),
+        (ROT_mXY_Y_Z, TR_0_0_0),
+        (ROT_X_XmY_Z, TR_0_0_0),
+        (ROT_X_Y_Z, TR_23_13_13),
+        (ROT_mY_XmY_Z, TR_23_13_13),
+        (ROT_mXY_mX_Z, TR_23_13_13),
+        (ROT_mY_mX_Z, TR_23_13_13),
+        (ROT_mXY_Y_Z, TR_23_13_13),
+        (ROT_X_XmY_Z, TR_23_13_13),
+        (ROT_X_Y_Z, TR_13_23_23),
+        (ROT_mY_XmY_Z, TR_13_23_23),
+        (ROT_mXY_mX_Z, TR_13_23_23),
+        (ROT_mY_mX_Z, TR_13_23_23),
+        (ROT_mXY_Y_Z, TR_13_23_23),
+        (ROT_X_XmY_Z, TR_13_23_23)])
 
 sg1160 = SpaceGroup(
     number=1160,
@@ -3404,13 +3402,13 @@ sg1160 = SpaceGroup(
     point_group_name="PG3m",
     crystal_system=TRIGONAL,
     pdb_name="R 3 m",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_Z_X_Y, TR_0_0_0),
-        SymOp(ROT_Y_Z_X, TR_0_0_0),
-        SymOp(ROT_Y_X_Z, TR_0_0_0),
-        SymOp(ROT_X_Z_Y, TR_0_0_0),
-        SymOp(ROT_Z_Y_X, TR_0_0_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_Z_X_Y, TR_0_0_0),
+        (ROT_Y_Z_X, TR_0_0_0),
+        (ROT_Y_X_Z, TR_0_0_0),
+        (ROT_X_Z_Y, TR_0_0_0),
+        (ROT_Z_Y_X, TR_0_0_0)])
 
 sg161 = SpaceGroup(
     number=161,
@@ -3420,25 +3418,25 @@ sg161 = SpaceGroup(
     point_group_name="PG3m",
     crystal_system=TRIGONAL,
     pdb_name="H 3 c",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mY_XmY_Z, TR_0_0_0),
-        SymOp(ROT_mXY_mX_Z, TR_0_0_0),
-        SymOp(ROT_mY_mX_Z, TR_0_0_12),
-        SymOp(ROT_mXY_Y_Z, TR_0_0_12),
-        SymOp(ROT_X_XmY_Z, TR_0_0_12),
-        SymOp(ROT_X_Y_Z, TR_23_13_13),
-        SymOp(ROT_mY_XmY_Z, TR_23_13_13),
-        SymOp(ROT_mXY_mX_Z, TR_23_13_13),
-        SymOp(ROT_mY_mX_Z, TR_23_13_56),
-        SymOp(ROT_mXY_Y_Z, TR_23_13_56),
-        SymOp(ROT_X_XmY_Z, TR_23_13_56),
-        SymOp(ROT_X_Y_Z, TR_13_23_23),
-        SymOp(ROT_mY_XmY_Z, TR_13_23_23),
-        SymOp(ROT_mXY_mX_Z, TR_13_23_23),
-        SymOp(ROT_mY_mX_Z, TR_13_23_16),
-        SymOp(ROT_mXY_Y_Z, TR_13_23_16),
-        SymOp(ROT_X_XmY_Z, TR_13_23_16)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mY_XmY_Z, TR_0_0_0),
+        (ROT_mXY_mX_Z, TR_0_0_0),
+        (ROT_mY_mX_Z, TR_0_0_12),
+        (ROT_mXY_Y_Z, TR_0_0_12),
+        (ROT_X_XmY_Z, TR_0_0_12),
+        (ROT_X_Y_Z, TR_23_13_13),
+        (ROT_mY_XmY_Z, TR_23_13_13),
+        (ROT_mXY_mX_Z, TR_23_13_13),
+        (ROT_mY_mX_Z, TR_23_13_56),
+        (ROT_mXY_Y_Z, TR_23_13_56),
+        (ROT_X_XmY_Z, TR_23_13_56),
+        (ROT_X_Y_Z, TR_13_23_23),
+        (ROT_mY_XmY_Z, TR_13_23_23),
+        (ROT_mXY_mX_Z, TR_13_23_23),
+        (ROT_mY_mX_Z, TR_13_23_16),
+        (ROT_mXY_Y_Z, TR_13_23_16),
+        (ROT_X_XmY_Z, TR_13_23_16)])
 
 sg1161 = SpaceGroup(
     number=1161,
@@ -3448,13 +3446,13 @@ sg1161 = SpaceGroup(
     point_group_name="PG3m",
     crystal_system=TRIGONAL,
     pdb_name="R 3 c",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_Z_X_Y, TR_0_0_0),
-        SymOp(ROT_Y_Z_X, TR_0_0_0),
-        SymOp(ROT_Y_X_Z, TR_12_12_12),
-        SymOp(ROT_X_Z_Y, TR_12_12_12),
-        SymOp(ROT_Z_Y_X, TR_12_12_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_Z_X_Y, TR_0_0_0),
+        (ROT_Y_Z_X, TR_0_0_0),
+        (ROT_Y_X_Z, TR_12_12_12),
+        (ROT_X_Z_Y, TR_12_12_12),
+        (ROT_Z_Y_X, TR_12_12_12)])
 
 sg162 = SpaceGroup(
     number=162,
@@ -3464,19 +3462,19 @@ sg162 = SpaceGroup(
     point_group_name="PG3bar1m",
     crystal_system=TRIGONAL,
     pdb_name="P -3 1 2/m",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mY_XmY_Z, TR_0_0_0),
-        SymOp(ROT_mXY_mX_Z, TR_0_0_0),
-        SymOp(ROT_mY_mX_mZ, TR_0_0_0),
-        SymOp(ROT_mXY_Y_mZ, TR_0_0_0),
-        SymOp(ROT_X_XmY_mZ, TR_0_0_0),
-        SymOp(ROT_mX_mY_mZ, TR_0_0_0),
-        SymOp(ROT_Y_mXY_mZ, TR_0_0_0),
-        SymOp(ROT_XmY_X_mZ, TR_0_0_0),
-        SymOp(ROT_Y_X_Z, TR_0_0_0),
-        SymOp(ROT_XmY_mY_Z, TR_0_0_0),
-        SymOp(ROT_mX_mXY_Z, TR_0_0_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mY_XmY_Z, TR_0_0_0),
+        (ROT_mXY_mX_Z, TR_0_0_0),
+        (ROT_mY_mX_mZ, TR_0_0_0),
+        (ROT_mXY_Y_mZ, TR_0_0_0),
+        (ROT_X_XmY_mZ, TR_0_0_0),
+        (ROT_mX_mY_mZ, TR_0_0_0),
+        (ROT_Y_mXY_mZ, TR_0_0_0),
+        (ROT_XmY_X_mZ, TR_0_0_0),
+        (ROT_Y_X_Z, TR_0_0_0),
+        (ROT_XmY_mY_Z, TR_0_0_0),
+        (ROT_mX_mXY_Z, TR_0_0_0)])
 
 sg163 = SpaceGroup(
     number=163,
@@ -3486,19 +3484,19 @@ sg163 = SpaceGroup(
     point_group_name="PG3bar1m",
     crystal_system=TRIGONAL,
     pdb_name="P -3 1 2/c",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mY_XmY_Z, TR_0_0_0),
-        SymOp(ROT_mXY_mX_Z, TR_0_0_0),
-        SymOp(ROT_mY_mX_mZ, TR_0_0_12),
-        SymOp(ROT_mXY_Y_mZ, TR_0_0_12),
-        SymOp(ROT_X_XmY_mZ, TR_0_0_12),
-        SymOp(ROT_mX_mY_mZ, TR_0_0_0),
-        SymOp(ROT_Y_mXY_mZ, TR_0_0_0),
-        SymOp(ROT_XmY_X_mZ, TR_0_0_0),
-        SymOp(ROT_Y_X_Z, TR_0_0_12),
-        SymOp(ROT_XmY_mY_Z, TR_0_0_12),
-        SymOp(ROT_mX_mXY_Z, TR_0_0_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mY_XmY_Z, TR_0_0_0),
+        (ROT_mXY_mX_Z, TR_0_0_0),
+        (ROT_mY_mX_mZ, TR_0_0_12),
+        (ROT_mXY_Y_mZ, TR_0_0_12),
+        (ROT_X_XmY_mZ, TR_0_0_12),
+        (ROT_mX_mY_mZ, TR_0_0_0),
+        (ROT_Y_mXY_mZ, TR_0_0_0),
+        (ROT_XmY_X_mZ, TR_0_0_0),
+        (ROT_Y_X_Z, TR_0_0_12),
+        (ROT_XmY_mY_Z, TR_0_0_12),
+        (ROT_mX_mXY_Z, TR_0_0_12)])
 
 sg164 = SpaceGroup(
     number=164,
@@ -3508,19 +3506,19 @@ sg164 = SpaceGroup(
     point_group_name="PG3barm1",
     crystal_system=TRIGONAL,
     pdb_name="P -3 2/m 1",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mY_XmY_Z, TR_0_0_0),
-        SymOp(ROT_mXY_mX_Z, TR_0_0_0),
-        SymOp(ROT_Y_X_mZ, TR_0_0_0),
-        SymOp(ROT_XmY_mY_mZ, TR_0_0_0),
-        SymOp(ROT_mX_mXY_mZ, TR_0_0_0),
-        SymOp(ROT_mX_mY_mZ, TR_0_0_0),
-        SymOp(ROT_Y_mXY_mZ, TR_0_0_0),
-        SymOp(ROT_XmY_X_mZ, TR_0_0_0),
-        SymOp(ROT_mY_mX_Z, TR_0_0_0),
-        SymOp(ROT_mXY_Y_Z, TR_0_0_0),
-        SymOp(ROT_X_XmY_Z, TR_0_0_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mY_XmY_Z, TR_0_0_0),
+        (ROT_mXY_mX_Z, TR_0_0_0),
+        (ROT_Y_X_mZ, TR_0_0_0),
+        (ROT_XmY_mY_mZ, TR_0_0_0),
+        (ROT_mX_mXY_mZ, TR_0_0_0),
+        (ROT_mX_mY_mZ, TR_0_0_0),
+        (ROT_Y_mXY_mZ, TR_0_0_0),
+        (ROT_XmY_X_mZ, TR_0_0_0),
+        (ROT_mY_mX_Z, TR_0_0_0),
+        (ROT_mXY_Y_Z, TR_0_0_0),
+        (ROT_X_XmY_Z, TR_0_0_0)])
 
 sg165 = SpaceGroup(
     number=165,
@@ -3530,19 +3528,19 @@ sg165 = SpaceGroup(
     point_group_name="PG3barm1",
     crystal_system=TRIGONAL,
     pdb_name="P -3 2/c 1",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mY_XmY_Z, TR_0_0_0),
-        SymOp(ROT_mXY_mX_Z, TR_0_0_0),
-        SymOp(ROT_Y_X_mZ, TR_0_0_12),
-        SymOp(ROT_XmY_mY_mZ, TR_0_0_12),
-        SymOp(ROT_mX_mXY_mZ, TR_0_0_12),
-        SymOp(ROT_mX_mY_mZ, TR_0_0_0),
-        SymOp(ROT_Y_mXY_mZ, TR_0_0_0),
-        SymOp(ROT_XmY_X_mZ, TR_0_0_0),
-        SymOp(ROT_mY_mX_Z, TR_0_0_12),
-        SymOp(ROT_mXY_Y_Z, TR_0_0_12),
-        SymOp(ROT_X_XmY_Z, TR_0_0_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mY_XmY_Z, TR_0_0_0),
+        (ROT_mXY_mX_Z, TR_0_0_0),
+        (ROT_Y_X_mZ, TR_0_0_12),
+        (ROT_XmY_mY_mZ, TR_0_0_12),
+        (ROT_mX_mXY_mZ, TR_0_0_12),
+        (ROT_mX_mY_mZ, TR_0_0_0),
+        (ROT_Y_mXY_mZ, TR_0_0_0),
+        (ROT_XmY_X_mZ, TR_0_0_0),
+        (ROT_mY_mX_Z, TR_0_0_12),
+        (ROT_mXY_Y_Z, TR_0_0_12),
+        (ROT_X_XmY_Z, TR_0_0_12)])
 
 sg166 = SpaceGroup(
     number=166,
@@ -3552,43 +3550,43 @@ sg166 = SpaceGroup(
     point_group_name="PG3barm",
     crystal_system=TRIGONAL,
     pdb_name="H -3 2/m",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mY_XmY_Z, TR_0_0_0),
-        SymOp(ROT_mXY_mX_Z, TR_0_0_0),
-        SymOp(ROT_Y_X_mZ, TR_0_0_0),
-        SymOp(ROT_XmY_mY_mZ, TR_0_0_0),
-        SymOp(ROT_mX_mXY_mZ, TR_0_0_0),
-        SymOp(ROT_mX_mY_mZ, TR_0_0_0),
-        SymOp(ROT_Y_mXY_mZ, TR_0_0_0),
-        SymOp(ROT_XmY_X_mZ, TR_0_0_0),
-        SymOp(ROT_mY_mX_Z, TR_0_0_0),
-        SymOp(ROT_mXY_Y_Z, TR_0_0_0),
-        SymOp(ROT_X_XmY_Z, TR_0_0_0),
-        SymOp(ROT_X_Y_Z, TR_23_13_13),
-        SymOp(ROT_mY_XmY_Z, TR_23_13_13),
-        SymOp(ROT_mXY_mX_Z, TR_23_13_13),
-        SymOp(ROT_Y_X_mZ, TR_23_13_13),
-        SymOp(ROT_XmY_mY_mZ, TR_23_13_13),
-        SymOp(ROT_mX_mXY_mZ, TR_23_13_13),
-        SymOp(ROT_mX_mY_mZ, TR_23_13_13),
-        SymOp(ROT_Y_mXY_mZ, TR_23_13_13),
-        SymOp(ROT_XmY_X_mZ, TR_23_13_13),
-        SymOp(ROT_mY_mX_Z, TR_23_13_13),
-        SymOp(ROT_mXY_Y_Z, TR_23_13_13),
-        SymOp(ROT_X_XmY_Z, TR_23_13_13),
-        SymOp(ROT_X_Y_Z, TR_13_23_23),
-        SymOp(ROT_mY_XmY_Z, TR_13_23_23),
-        SymOp(ROT_mXY_mX_Z, TR_13_23_23),
-        SymOp(ROT_Y_X_mZ, TR_13_23_23),
-        SymOp(ROT_XmY_mY_mZ, TR_13_23_23),
-        SymOp(ROT_mX_mXY_mZ, TR_13_23_23),
-        SymOp(ROT_mX_mY_mZ, TR_13_23_23),
-        SymOp(ROT_Y_mXY_mZ, TR_13_23_23),
-        SymOp(ROT_XmY_X_mZ, TR_13_23_23),
-        SymOp(ROT_mY_mX_Z, TR_13_23_23),
-        SymOp(ROT_mXY_Y_Z, TR_13_23_23),
-        SymOp(ROT_X_XmY_Z, TR_13_23_23)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mY_XmY_Z, TR_0_0_0),
+        (ROT_mXY_mX_Z, TR_0_0_0),
+        (ROT_Y_X_mZ, TR_0_0_0),
+        (ROT_XmY_mY_mZ, TR_0_0_0),
+        (ROT_mX_mXY_mZ, TR_0_0_0),
+        (ROT_mX_mY_mZ, TR_0_0_0),
+        (ROT_Y_mXY_mZ, TR_0_0_0),
+        (ROT_XmY_X_mZ, TR_0_0_0),
+        (ROT_mY_mX_Z, TR_0_0_0),
+        (ROT_mXY_Y_Z, TR_0_0_0),
+        (ROT_X_XmY_Z, TR_0_0_0),
+        (ROT_X_Y_Z, TR_23_13_13),
+        (ROT_mY_XmY_Z, TR_23_13_13),
+        (ROT_mXY_mX_Z, TR_23_13_13),
+        (ROT_Y_X_mZ, TR_23_13_13),
+        (ROT_XmY_mY_mZ, TR_23_13_13),
+        (ROT_mX_mXY_mZ, TR_23_13_13),
+        (ROT_mX_mY_mZ, TR_23_13_13),
+        (ROT_Y_mXY_mZ, TR_23_13_13),
+        (ROT_XmY_X_mZ, TR_23_13_13),
+        (ROT_mY_mX_Z, TR_23_13_13),
+        (ROT_mXY_Y_Z, TR_23_13_13),
+        (ROT_X_XmY_Z, TR_23_13_13),
+        (ROT_X_Y_Z, TR_13_23_23),
+        (ROT_mY_XmY_Z, TR_13_23_23),
+        (ROT_mXY_mX_Z, TR_13_23_23),
+        (ROT_Y_X_mZ, TR_13_23_23),
+        (ROT_XmY_mY_mZ, TR_13_23_23),
+        (ROT_mX_mXY_mZ, TR_13_23_23),
+        (ROT_mX_mY_mZ, TR_13_23_23),
+        (ROT_Y_mXY_mZ, TR_13_23_23),
+        (ROT_XmY_X_mZ, TR_13_23_23),
+        (ROT_mY_mX_Z, TR_13_23_23),
+        (ROT_mXY_Y_Z, TR_13_23_23),
+        (ROT_X_XmY_Z, TR_13_23_23)])
 
 sg1166 = SpaceGroup(
     number=1166,
@@ -3598,19 +3596,19 @@ sg1166 = SpaceGroup(
     point_group_name="PG3barm",
     crystal_system=TRIGONAL,
     pdb_name="R -3 2/m",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_Z_X_Y, TR_0_0_0),
-        SymOp(ROT_Y_Z_X, TR_0_0_0),
-        SymOp(ROT_mY_mX_mZ, TR_0_0_0),
-        SymOp(ROT_mX_mZ_mY, TR_0_0_0),
-        SymOp(ROT_mZ_mY_mX, TR_0_0_0),
-        SymOp(ROT_mX_mY_mZ, TR_0_0_0),
-        SymOp(ROT_mZ_mX_mY, TR_0_0_0),
-        SymOp(ROT_mY_mZ_mX, TR_0_0_0),
-        SymOp(ROT_Y_X_Z, TR_0_0_0),
-        SymOp(ROT_X_Z_Y, TR_0_0_0),
-        SymOp(ROT_Z_Y_X, TR_0_0_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_Z_X_Y, TR_0_0_0),
+        (ROT_Y_Z_X, TR_0_0_0),
+        (ROT_mY_mX_mZ, TR_0_0_0),
+        (ROT_mX_mZ_mY, TR_0_0_0),
+        (ROT_mZ_mY_mX, TR_0_0_0),
+        (ROT_mX_mY_mZ, TR_0_0_0),
+        (ROT_mZ_mX_mY, TR_0_0_0),
+        (ROT_mY_mZ_mX, TR_0_0_0),
+        (ROT_Y_X_Z, TR_0_0_0),
+        (ROT_X_Z_Y, TR_0_0_0),
+        (ROT_Z_Y_X, TR_0_0_0)])
 
 sg167 = SpaceGroup(
     number=167,
@@ -3620,43 +3618,43 @@ sg167 = SpaceGroup(
     point_group_name="PG3barm",
     crystal_system=TRIGONAL,
     pdb_name="H -3 2/c",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mY_XmY_Z, TR_0_0_0),
-        SymOp(ROT_mXY_mX_Z, TR_0_0_0),
-        SymOp(ROT_Y_X_mZ, TR_0_0_12),
-        SymOp(ROT_XmY_mY_mZ, TR_0_0_12),
-        SymOp(ROT_mX_mXY_mZ, TR_0_0_12),
-        SymOp(ROT_mX_mY_mZ, TR_0_0_0),
-        SymOp(ROT_Y_mXY_mZ, TR_0_0_0),
-        SymOp(ROT_XmY_X_mZ, TR_0_0_0),
-        SymOp(ROT_mY_mX_Z, TR_0_0_12),
-        SymOp(ROT_mXY_Y_Z, TR_0_0_12),
-        SymOp(ROT_X_XmY_Z, TR_0_0_12),
-        SymOp(ROT_X_Y_Z, TR_23_13_13),
-        SymOp(ROT_mY_XmY_Z, TR_23_13_13),
-        SymOp(ROT_mXY_mX_Z, TR_23_13_13),
-        SymOp(ROT_Y_X_mZ, TR_23_13_56),
-        SymOp(ROT_XmY_mY_mZ, TR_23_13_56),
-        SymOp(ROT_mX_mXY_mZ, TR_23_13_56),
-        SymOp(ROT_mX_mY_mZ, TR_23_13_13),
-        SymOp(ROT_Y_mXY_mZ, TR_23_13_13),
-        SymOp(ROT_XmY_X_mZ, TR_23_13_13),
-        SymOp(ROT_mY_mX_Z, TR_23_13_56),
-        SymOp(ROT_mXY_Y_Z, TR_23_13_56),
-        SymOp(ROT_X_XmY_Z, TR_23_13_56),
-        SymOp(ROT_X_Y_Z, TR_13_23_23),
-        SymOp(ROT_mY_XmY_Z, TR_13_23_23),
-        SymOp(ROT_mXY_mX_Z, TR_13_23_23),
-        SymOp(ROT_Y_X_mZ, TR_13_23_16),
-        SymOp(ROT_XmY_mY_mZ, TR_13_23_16),
-        SymOp(ROT_mX_mXY_mZ, TR_13_23_16),
-        SymOp(ROT_mX_mY_mZ, TR_13_23_23),
-        SymOp(ROT_Y_mXY_mZ, TR_13_23_23),
-        SymOp(ROT_XmY_X_mZ, TR_13_23_23),
-        SymOp(ROT_mY_mX_Z, TR_13_23_16),
-        SymOp(ROT_mXY_Y_Z, TR_13_23_16),
-        SymOp(ROT_X_XmY_Z, TR_13_23_16)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mY_XmY_Z, TR_0_0_0),
+        (ROT_mXY_mX_Z, TR_0_0_0),
+        (ROT_Y_X_mZ, TR_0_0_12),
+        (ROT_XmY_mY_mZ, TR_0_0_12),
+        (ROT_mX_mXY_mZ, TR_0_0_12),
+        (ROT_mX_mY_mZ, TR_0_0_0),
+        (ROT_Y_mXY_mZ, TR_0_0_0),
+        (ROT_XmY_X_mZ, TR_0_0_0),
+        (ROT_mY_mX_Z, TR_0_0_12),
+        (ROT_mXY_Y_Z, TR_0_0_12),
+        (ROT_X_XmY_Z, TR_0_0_12),
+        (ROT_X_Y_Z, TR_23_13_13),
+        (ROT_mY_XmY_Z, TR_23_13_13),
+        (ROT_mXY_mX_Z, TR_23_13_13),
+        (ROT_Y_X_mZ, TR_23_13_56),
+        (ROT_XmY_mY_mZ, TR_23_13_56),
+        (ROT_mX_mXY_mZ, TR_23_13_56),
+        (ROT_mX_mY_mZ, TR_23_13_13),
+        (ROT_Y_mXY_mZ, TR_23_13_13),
+        (ROT_XmY_X_mZ, TR_23_13_13),
+        (ROT_mY_mX_Z, TR_23_13_56),
+        (ROT_mXY_Y_Z, TR_23_13_56),
+        (ROT_X_XmY_Z, TR_23_13_56),
+        (ROT_X_Y_Z, TR_13_23_23),
+        (ROT_mY_XmY_Z, TR_13_23_23),
+        (ROT_mXY_mX_Z, TR_13_23_23),
+        (ROT_Y_X_mZ, TR_13_23_16),
+        (ROT_XmY_mY_mZ, TR_13_23_16),
+        (ROT_mX_mXY_mZ, TR_13_23_16),
+        (ROT_mX_mY_mZ, TR_13_23_23),
+        (ROT_Y_mXY_mZ, TR_13_23_23),
+        (ROT_XmY_X_mZ, TR_13_23_23),
+        (ROT_mY_mX_Z, TR_13_23_16),
+        (ROT_mXY_Y_Z, TR_13_23_16),
+        (ROT_X_XmY_Z, TR_13_23_16)])
 
 sg1167 = SpaceGroup(
     number=1167,
@@ -3666,19 +3664,19 @@ sg1167 = SpaceGroup(
     point_group_name="PG3barm",
     crystal_system=TRIGONAL,
     pdb_name="R -3 2/c",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_Z_X_Y, TR_0_0_0),
-        SymOp(ROT_Y_Z_X, TR_0_0_0),
-        SymOp(ROT_mY_mX_mZ, TR_12_12_12),
-        SymOp(ROT_mX_mZ_mY, TR_12_12_12),
-        SymOp(ROT_mZ_mY_mX, TR_12_12_12),
-        SymOp(ROT_mX_mY_mZ, TR_0_0_0),
-        SymOp(ROT_mZ_mX_mY, TR_0_0_0),
-        SymOp(ROT_mY_mZ_mX, TR_0_0_0),
-        SymOp(ROT_Y_X_Z, TR_12_12_12),
-        SymOp(ROT_X_Z_Y, TR_12_12_12),
-        SymOp(ROT_Z_Y_X, TR_12_12_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_Z_X_Y, TR_0_0_0),
+        (ROT_Y_Z_X, TR_0_0_0),
+        (ROT_mY_mX_mZ, TR_12_12_12),
+        (ROT_mX_mZ_mY, TR_12_12_12),
+        (ROT_mZ_mY_mX, TR_12_12_12),
+        (ROT_mX_mY_mZ, TR_0_0_0),
+        (ROT_mZ_mX_mY, TR_0_0_0),
+        (ROT_mY_mZ_mX, TR_0_0_0),
+        (ROT_Y_X_Z, TR_12_12_12),
+        (ROT_X_Z_Y, TR_12_12_12),
+        (ROT_Z_Y_X, TR_12_12_12)])
 
 sg168 = SpaceGroup(
     number=168,
@@ -3688,13 +3686,13 @@ sg168 = SpaceGroup(
     point_group_name="PG6",
     crystal_system=HEXAGONAL,
     pdb_name="P 6",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mY_XmY_Z, TR_0_0_0),
-        SymOp(ROT_mXY_mX_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_Y_mXY_Z, TR_0_0_0),
-        SymOp(ROT_XmY_X_Z, TR_0_0_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mY_XmY_Z, TR_0_0_0),
+        (ROT_mXY_mX_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_Y_mXY_Z, TR_0_0_0),
+        (ROT_XmY_X_Z, TR_0_0_0)])
 
 sg169 = SpaceGroup(
     number=169,
@@ -3704,13 +3702,13 @@ sg169 = SpaceGroup(
     point_group_name="PG6",
     crystal_system=HEXAGONAL,
     pdb_name="P 61",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mY_XmY_Z, TR_0_0_13),
-        SymOp(ROT_mXY_mX_Z, TR_0_0_23),
-        SymOp(ROT_mX_mY_Z, TR_0_0_12),
-        SymOp(ROT_Y_mXY_Z, TR_0_0_56),
-        SymOp(ROT_XmY_X_Z, TR_0_0_16)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mY_XmY_Z, TR_0_0_13),
+        (ROT_mXY_mX_Z, TR_0_0_23),
+        (ROT_mX_mY_Z, TR_0_0_12),
+        (ROT_Y_mXY_Z, TR_0_0_56),
+        (ROT_XmY_X_Z, TR_0_0_16)])
 
 sg170 = SpaceGroup(
     number=170,
@@ -3720,13 +3718,13 @@ sg170 = SpaceGroup(
     point_group_name="PG6",
     crystal_system=HEXAGONAL,
     pdb_name="P 65",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mY_XmY_Z, TR_0_0_23),
-        SymOp(ROT_mXY_mX_Z, TR_0_0_13),
-        SymOp(ROT_mX_mY_Z, TR_0_0_12),
-        SymOp(ROT_Y_mXY_Z, TR_0_0_16),
-        SymOp(ROT_XmY_X_Z, TR_0_0_56)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mY_XmY_Z, TR_0_0_23),
+        (ROT_mXY_mX_Z, TR_0_0_13),
+        (ROT_mX_mY_Z, TR_0_0_12),
+        (ROT_Y_mXY_Z, TR_0_0_16),
+        (ROT_XmY_X_Z, TR_0_0_56)])
 
 sg171 = SpaceGroup(
     number=171,
@@ -3736,13 +3734,13 @@ sg171 = SpaceGroup(
     point_group_name="PG6",
     crystal_system=HEXAGONAL,
     pdb_name="P 62",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mY_XmY_Z, TR_0_0_23),
-        SymOp(ROT_mXY_mX_Z, TR_0_0_13),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_Y_mXY_Z, TR_0_0_23),
-        SymOp(ROT_XmY_X_Z, TR_0_0_13)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mY_XmY_Z, TR_0_0_23),
+        (ROT_mXY_mX_Z, TR_0_0_13),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_Y_mXY_Z, TR_0_0_23),
+        (ROT_XmY_X_Z, TR_0_0_13)])
 
 sg172 = SpaceGroup(
     number=172,
@@ -3752,13 +3750,13 @@ sg172 = SpaceGroup(
     point_group_name="PG6",
     crystal_system=HEXAGONAL,
     pdb_name="P 64",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mY_XmY_Z, TR_0_0_13),
-        SymOp(ROT_mXY_mX_Z, TR_0_0_23),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_Y_mXY_Z, TR_0_0_13),
-        SymOp(ROT_XmY_X_Z, TR_0_0_23)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mY_XmY_Z, TR_0_0_13),
+        (ROT_mXY_mX_Z, TR_0_0_23),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_Y_mXY_Z, TR_0_0_13),
+        (ROT_XmY_X_Z, TR_0_0_23)])
 
 sg173 = SpaceGroup(
     number=173,
@@ -3768,13 +3766,13 @@ sg173 = SpaceGroup(
     point_group_name="PG6",
     crystal_system=HEXAGONAL,
     pdb_name="P 63",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mY_XmY_Z, TR_0_0_0),
-        SymOp(ROT_mXY_mX_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_12),
-        SymOp(ROT_Y_mXY_Z, TR_0_0_12),
-        SymOp(ROT_XmY_X_Z, TR_0_0_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mY_XmY_Z, TR_0_0_0),
+        (ROT_mXY_mX_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_12),
+        (ROT_Y_mXY_Z, TR_0_0_12),
+        (ROT_XmY_X_Z, TR_0_0_12)])
 
 sg174 = SpaceGroup(
     number=174,
@@ -3784,13 +3782,13 @@ sg174 = SpaceGroup(
     point_group_name="PG6bar",
     crystal_system=HEXAGONAL,
     pdb_name="P -6",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mY_XmY_Z, TR_0_0_0),
-        SymOp(ROT_mXY_mX_Z, TR_0_0_0),
-        SymOp(ROT_X_Y_mZ, TR_0_0_0),
-        SymOp(ROT_mY_XmY_mZ, TR_0_0_0),
-        SymOp(ROT_mXY_mX_mZ, TR_0_0_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mY_XmY_Z, TR_0_0_0),
+        (ROT_mXY_mX_Z, TR_0_0_0),
+        (ROT_X_Y_mZ, TR_0_0_0),
+        (ROT_mY_XmY_mZ, TR_0_0_0),
+        (ROT_mXY_mX_mZ, TR_0_0_0)])
 
 sg175 = SpaceGroup(
     number=175,
@@ -3800,19 +3798,19 @@ sg175 = SpaceGroup(
     point_group_name="PG6/m",
     crystal_system=HEXAGONAL,
     pdb_name="P 6/m",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mY_XmY_Z, TR_0_0_0),
-        SymOp(ROT_mXY_mX_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_Y_mXY_Z, TR_0_0_0),
-        SymOp(ROT_XmY_X_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_mZ, TR_0_0_0),
-        SymOp(ROT_Y_mXY_mZ, TR_0_0_0),
-        SymOp(ROT_XmY_X_mZ, TR_0_0_0),
-        SymOp(ROT_X_Y_mZ, TR_0_0_0),
-        SymOp(ROT_mY_XmY_mZ, TR_0_0_0),
-        SymOp(ROT_mXY_mX_mZ, TR_0_0_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mY_XmY_Z, TR_0_0_0),
+        (ROT_mXY_mX_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_Y_mXY_Z, TR_0_0_0),
+        (ROT_XmY_X_Z, TR_0_0_0),
+        (ROT_mX_mY_mZ, TR_0_0_0),
+        (ROT_Y_mXY_mZ, TR_0_0_0),
+        (ROT_XmY_X_mZ, TR_0_0_0),
+        (ROT_X_Y_mZ, TR_0_0_0),
+        (ROT_mY_XmY_mZ, TR_0_0_0),
+        (ROT_mXY_mX_mZ, TR_0_0_0)])
 
 sg176 = SpaceGroup(
     number=176,
@@ -3822,19 +3820,19 @@ sg176 = SpaceGroup(
     point_group_name="PG6/m",
     crystal_system=HEXAGONAL,
     pdb_name="P 63/m",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mY_XmY_Z, TR_0_0_0),
-        SymOp(ROT_mXY_mX_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_12),
-        SymOp(ROT_Y_mXY_Z, TR_0_0_12),
-        SymOp(ROT_XmY_X_Z, TR_0_0_12),
-        SymOp(ROT_mX_mY_mZ, TR_0_0_0),
-        SymOp(ROT_Y_mXY_mZ, TR_0_0_0),
-        SymOp(ROT_XmY_X_mZ, TR_0_0_0),
-        SymOp(ROT_X_Y_mZ, TR_0_0_12),
-        SymOp(ROT_mY_XmY_mZ, TR_0_0_12),
-        SymOp(ROT_mXY_mX_mZ, TR_0_0_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mY_XmY_Z, TR_0_0_0),
+        (ROT_mXY_mX_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_12),
+        (ROT_Y_mXY_Z, TR_0_0_12),
+        (ROT_XmY_X_Z, TR_0_0_12),
+        (ROT_mX_mY_mZ, TR_0_0_0),
+        (ROT_Y_mXY_mZ, TR_0_0_0),
+        (ROT_XmY_X_mZ, TR_0_0_0),
+        (ROT_X_Y_mZ, TR_0_0_12),
+        (ROT_mY_XmY_mZ, TR_0_0_12),
+        (ROT_mXY_mX_mZ, TR_0_0_12)])
 
 sg177 = SpaceGroup(
     number=177,
@@ -3844,19 +3842,19 @@ sg177 = SpaceGroup(
     point_group_name="PG622",
     crystal_system=HEXAGONAL,
     pdb_name="P 6 2 2",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mY_XmY_Z, TR_0_0_0),
-        SymOp(ROT_mXY_mX_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_Y_mXY_Z, TR_0_0_0),
-        SymOp(ROT_XmY_X_Z, TR_0_0_0),
-        SymOp(ROT_Y_X_mZ, TR_0_0_0),
-        SymOp(ROT_XmY_mY_mZ, TR_0_0_0),
-        SymOp(ROT_mX_mXY_mZ, TR_0_0_0),
-        SymOp(ROT_mY_mX_mZ, TR_0_0_0),
-        SymOp(ROT_mXY_Y_mZ, TR_0_0_0),
-        SymOp(ROT_X_XmY_mZ, TR_0_0_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mY_XmY_Z, TR_0_0_0),
+        (ROT_mXY_mX_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_Y_mXY_Z, TR_0_0_0),
+        (ROT_XmY_X_Z, TR_0_0_0),
+        (ROT_Y_X_mZ, TR_0_0_0),
+        (ROT_XmY_mY_mZ, TR_0_0_0),
+        (ROT_mX_mXY_mZ, TR_0_0_0),
+        (ROT_mY_mX_mZ, TR_0_0_0),
+        (ROT_mXY_Y_mZ, TR_0_0_0),
+        (ROT_X_XmY_mZ, TR_0_0_0)])
 
 sg178 = SpaceGroup(
     number=178,
@@ -3866,19 +3864,19 @@ sg178 = SpaceGroup(
     point_group_name="PG622",
     crystal_system=HEXAGONAL,
     pdb_name="P 61 2 2",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mY_XmY_Z, TR_0_0_13),
-        SymOp(ROT_mXY_mX_Z, TR_0_0_23),
-        SymOp(ROT_mX_mY_Z, TR_0_0_12),
-        SymOp(ROT_Y_mXY_Z, TR_0_0_56),
-        SymOp(ROT_XmY_X_Z, TR_0_0_16),
-        SymOp(ROT_Y_X_mZ, TR_0_0_13),
-        SymOp(ROT_XmY_mY_mZ, TR_0_0_0),
-        SymOp(ROT_mX_mXY_mZ, TR_0_0_23),
-        SymOp(ROT_mY_mX_mZ, TR_0_0_56),
-        SymOp(ROT_mXY_Y_mZ, TR_0_0_12),
-        SymOp(ROT_X_XmY_mZ, TR_0_0_16)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mY_XmY_Z, TR_0_0_13),
+        (ROT_mXY_mX_Z, TR_0_0_23),
+        (ROT_mX_mY_Z, TR_0_0_12),
+        (ROT_Y_mXY_Z, TR_0_0_56),
+        (ROT_XmY_X_Z, TR_0_0_16),
+        (ROT_Y_X_mZ, TR_0_0_13),
+        (ROT_XmY_mY_mZ, TR_0_0_0),
+        (ROT_mX_mXY_mZ, TR_0_0_23),
+        (ROT_mY_mX_mZ, TR_0_0_56),
+        (ROT_mXY_Y_mZ, TR_0_0_12),
+        (ROT_X_XmY_mZ, TR_0_0_16)])
 
 sg179 = SpaceGroup(
     number=179,
@@ -3888,19 +3886,19 @@ sg179 = SpaceGroup(
     point_group_name="PG622",
     crystal_system=HEXAGONAL,
     pdb_name="P 65 2 2",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mY_XmY_Z, TR_0_0_23),
-        SymOp(ROT_mXY_mX_Z, TR_0_0_13),
-        SymOp(ROT_mX_mY_Z, TR_0_0_12),
-        SymOp(ROT_Y_mXY_Z, TR_0_0_16),
-        SymOp(ROT_XmY_X_Z, TR_0_0_56),
-        SymOp(ROT_Y_X_mZ, TR_0_0_23),
-        SymOp(ROT_XmY_mY_mZ, TR_0_0_0),
-        SymOp(ROT_mX_mXY_mZ, TR_0_0_13),
-        SymOp(ROT_mY_mX_mZ, TR_0_0_16),
-        SymOp(ROT_mXY_Y_mZ, TR_0_0_12),
-        SymOp(ROT_X_XmY_mZ, TR_0_0_56)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mY_XmY_Z, TR_0_0_23),
+        (ROT_mXY_mX_Z, TR_0_0_13),
+        (ROT_mX_mY_Z, TR_0_0_12),
+        (ROT_Y_mXY_Z, TR_0_0_16),
+        (ROT_XmY_X_Z, TR_0_0_56),
+        (ROT_Y_X_mZ, TR_0_0_23),
+        (ROT_XmY_mY_mZ, TR_0_0_0),
+        (ROT_mX_mXY_mZ, TR_0_0_13),
+        (ROT_mY_mX_mZ, TR_0_0_16),
+        (ROT_mXY_Y_mZ, TR_0_0_12),
+        (ROT_X_XmY_mZ, TR_0_0_56)])
 
 sg180 = SpaceGroup(
     number=180,
@@ -3910,19 +3908,19 @@ sg180 = SpaceGroup(
     point_group_name="PG622",
     crystal_system=HEXAGONAL,
     pdb_name="P 62 2 2",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mY_XmY_Z, TR_0_0_23),
-        SymOp(ROT_mXY_mX_Z, TR_0_0_13),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_Y_mXY_Z, TR_0_0_23),
-        SymOp(ROT_XmY_X_Z, TR_0_0_13),
-        SymOp(ROT_Y_X_mZ, TR_0_0_23),
-        SymOp(ROT_XmY_mY_mZ, TR_0_0_0),
-        SymOp(ROT_mX_mXY_mZ, TR_0_0_13),
-        SymOp(ROT_mY_mX_mZ, TR_0_0_23),
-        SymOp(ROT_mXY_Y_mZ, TR_0_0_0),
-        SymOp(ROT_X_XmY_mZ, TR_0_0_13)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mY_XmY_Z, TR_0_0_23),
+        (ROT_mXY_mX_Z, TR_0_0_13),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_Y_mXY_Z, TR_0_0_23),
+        (ROT_XmY_X_Z, TR_0_0_13),
+        (ROT_Y_X_mZ, TR_0_0_23),
+        (ROT_XmY_mY_mZ, TR_0_0_0),
+        (ROT_mX_mXY_mZ, TR_0_0_13),
+        (ROT_mY_mX_mZ, TR_0_0_23),
+        (ROT_mXY_Y_mZ, TR_0_0_0),
+        (ROT_X_XmY_mZ, TR_0_0_13)])
 
 sg181 = SpaceGroup(
     number=181,
@@ -3932,19 +3930,19 @@ sg181 = SpaceGroup(
     point_group_name="PG622",
     crystal_system=HEXAGONAL,
     pdb_name="P 64 2 2",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mY_XmY_Z, TR_0_0_13),
-        SymOp(ROT_mXY_mX_Z, TR_0_0_23),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_Y_mXY_Z, TR_0_0_13),
-        SymOp(ROT_XmY_X_Z, TR_0_0_23),
-        SymOp(ROT_Y_X_mZ, TR_0_0_13),
-        SymOp(ROT_XmY_mY_mZ, TR_0_0_0),
-        SymOp(ROT_mX_mXY_mZ, TR_0_0_23),
-        SymOp(ROT_mY_mX_mZ, TR_0_0_13),
-        SymOp(ROT_mXY_Y_mZ, TR_0_0_0),
-        SymOp(ROT_X_XmY_mZ, TR_0_0_23)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mY_XmY_Z, TR_0_0_13),
+        (ROT_mXY_mX_Z, TR_0_0_23),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_Y_mXY_Z, TR_0_0_13),
+        (ROT_XmY_X_Z, TR_0_0_23),
+        (ROT_Y_X_mZ, TR_0_0_13),
+        (ROT_XmY_mY_mZ, TR_0_0_0),
+        (ROT_mX_mXY_mZ, TR_0_0_23),
+        (ROT_mY_mX_mZ, TR_0_0_13),
+        (ROT_mXY_Y_mZ, TR_0_0_0),
+        (ROT_X_XmY_mZ, TR_0_0_23)])
 
 sg182 = SpaceGroup(
     number=182,
@@ -3954,19 +3952,19 @@ sg182 = SpaceGroup(
     point_group_name="PG622",
     crystal_system=HEXAGONAL,
     pdb_name="P 63 2 2",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mY_XmY_Z, TR_0_0_0),
-        SymOp(ROT_mXY_mX_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_12),
-        SymOp(ROT_Y_mXY_Z, TR_0_0_12),
-        SymOp(ROT_XmY_X_Z, TR_0_0_12),
-        SymOp(ROT_Y_X_mZ, TR_0_0_0),
-        SymOp(ROT_XmY_mY_mZ, TR_0_0_0),
-        SymOp(ROT_mX_mXY_mZ, TR_0_0_0),
-        SymOp(ROT_mY_mX_mZ, TR_0_0_12),
-        SymOp(ROT_mXY_Y_mZ, TR_0_0_12),
-        SymOp(ROT_X_XmY_mZ, TR_0_0_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mY_XmY_Z, TR_0_0_0),
+        (ROT_mXY_mX_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_12),
+        (ROT_Y_mXY_Z, TR_0_0_12),
+        (ROT_XmY_X_Z, TR_0_0_12),
+        (ROT_Y_X_mZ, TR_0_0_0),
+        (ROT_XmY_mY_mZ, TR_0_0_0),
+        (ROT_mX_mXY_mZ, TR_0_0_0),
+        (ROT_mY_mX_mZ, TR_0_0_12),
+        (ROT_mXY_Y_mZ, TR_0_0_12),
+        (ROT_X_XmY_mZ, TR_0_0_12)])
 
 sg183 = SpaceGroup(
     number=183,
@@ -3976,19 +3974,19 @@ sg183 = SpaceGroup(
     point_group_name="PG6mm",
     crystal_system=HEXAGONAL,
     pdb_name="P 6 m m",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mY_XmY_Z, TR_0_0_0),
-        SymOp(ROT_mXY_mX_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_Y_mXY_Z, TR_0_0_0),
-        SymOp(ROT_XmY_X_Z, TR_0_0_0),
-        SymOp(ROT_mY_mX_Z, TR_0_0_0),
-        SymOp(ROT_mXY_Y_Z, TR_0_0_0),
-        SymOp(ROT_X_XmY_Z, TR_0_0_0),
-        SymOp(ROT_Y_X_Z, TR_0_0_0),
-        SymOp(ROT_XmY_mY_Z, TR_0_0_0),
-        SymOp(ROT_mX_mXY_Z, TR_0_0_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mY_XmY_Z, TR_0_0_0),
+        (ROT_mXY_mX_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_Y_mXY_Z, TR_0_0_0),
+        (ROT_XmY_X_Z, TR_0_0_0),
+        (ROT_mY_mX_Z, TR_0_0_0),
+        (ROT_mXY_Y_Z, TR_0_0_0),
+        (ROT_X_XmY_Z, TR_0_0_0),
+        (ROT_Y_X_Z, TR_0_0_0),
+        (ROT_XmY_mY_Z, TR_0_0_0),
+        (ROT_mX_mXY_Z, TR_0_0_0)])
 
 sg184 = SpaceGroup(
     number=184,
@@ -3998,19 +3996,19 @@ sg184 = SpaceGroup(
     point_group_name="PG6mm",
     crystal_system=HEXAGONAL,
     pdb_name="P 6 c c",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mY_XmY_Z, TR_0_0_0),
-        SymOp(ROT_mXY_mX_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_Y_mXY_Z, TR_0_0_0),
-        SymOp(ROT_XmY_X_Z, TR_0_0_0),
-        SymOp(ROT_mY_mX_Z, TR_0_0_12),
-        SymOp(ROT_mXY_Y_Z, TR_0_0_12),
-        SymOp(ROT_X_XmY_Z, TR_0_0_12),
-        SymOp(ROT_Y_X_Z, TR_0_0_12),
-        SymOp(ROT_XmY_mY_Z, TR_0_0_12),
-        SymOp(ROT_mX_mXY_Z, TR_0_0_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mY_XmY_Z, TR_0_0_0),
+        (ROT_mXY_mX_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_Y_mXY_Z, TR_0_0_0),
+        (ROT_XmY_X_Z, TR_0_0_0),
+        (ROT_mY_mX_Z, TR_0_0_12),
+        (ROT_mXY_Y_Z, TR_0_0_12),
+        (ROT_X_XmY_Z, TR_0_0_12),
+        (ROT_Y_X_Z, TR_0_0_12),
+        (ROT_XmY_mY_Z, TR_0_0_12),
+        (ROT_mX_mXY_Z, TR_0_0_12)])
 
 sg185 = SpaceGroup(
     number=185,
@@ -4020,19 +4018,19 @@ sg185 = SpaceGroup(
     point_group_name="PG6mm",
     crystal_system=HEXAGONAL,
     pdb_name="P 63 c m",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mY_XmY_Z, TR_0_0_0),
-        SymOp(ROT_mXY_mX_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_12),
-        SymOp(ROT_Y_mXY_Z, TR_0_0_12),
-        SymOp(ROT_XmY_X_Z, TR_0_0_12),
-        SymOp(ROT_mY_mX_Z, TR_0_0_12),
-        SymOp(ROT_mXY_Y_Z, TR_0_0_12),
-        SymOp(ROT_X_XmY_Z, TR_0_0_12),
-        SymOp(ROT_Y_X_Z, TR_0_0_0),
-        SymOp(ROT_XmY_mY_Z, TR_0_0_0),
-        SymOp(ROT_mX_mXY_Z, TR_0_0_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mY_XmY_Z, TR_0_0_0),
+        (ROT_mXY_mX_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_12),
+        (ROT_Y_mXY_Z, TR_0_0_12),
+        (ROT_XmY_X_Z, TR_0_0_12),
+        (ROT_mY_mX_Z, TR_0_0_12),
+        (ROT_mXY_Y_Z, TR_0_0_12),
+        (ROT_X_XmY_Z, TR_0_0_12),
+        (ROT_Y_X_Z, TR_0_0_0),
+        (ROT_XmY_mY_Z, TR_0_0_0),
+        (ROT_mX_mXY_Z, TR_0_0_0)])
 
 sg186 = SpaceGroup(
     number=186,
@@ -4042,19 +4040,19 @@ sg186 = SpaceGroup(
     point_group_name="PG6mm",
     crystal_system=HEXAGONAL,
     pdb_name="P 63 m c",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mY_XmY_Z, TR_0_0_0),
-        SymOp(ROT_mXY_mX_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_12),
-        SymOp(ROT_Y_mXY_Z, TR_0_0_12),
-        SymOp(ROT_XmY_X_Z, TR_0_0_12),
-        SymOp(ROT_mY_mX_Z, TR_0_0_0),
-        SymOp(ROT_mXY_Y_Z, TR_0_0_0),
-        SymOp(ROT_X_XmY_Z, TR_0_0_0),
-        SymOp(ROT_Y_X_Z, TR_0_0_12),
-        SymOp(ROT_XmY_mY_Z, TR_0_0_12),
-        SymOp(ROT_mX_mXY_Z, TR_0_0_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mY_XmY_Z, TR_0_0_0),
+        (ROT_mXY_mX_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_12),
+        (ROT_Y_mXY_Z, TR_0_0_12),
+        (ROT_XmY_X_Z, TR_0_0_12),
+        (ROT_mY_mX_Z, TR_0_0_0),
+        (ROT_mXY_Y_Z, TR_0_0_0),
+        (ROT_X_XmY_Z, TR_0_0_0),
+        (ROT_Y_X_Z, TR_0_0_12),
+        (ROT_XmY_mY_Z, TR_0_0_12),
+        (ROT_mX_mXY_Z, TR_0_0_12)])
 
 sg187 = SpaceGroup(
     number=187,
@@ -4064,19 +4062,19 @@ sg187 = SpaceGroup(
     point_group_name="PG6barm2",
     crystal_system=HEXAGONAL,
     pdb_name="P -6 m 2",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mY_XmY_Z, TR_0_0_0),
-        SymOp(ROT_mXY_mX_Z, TR_0_0_0),
-        SymOp(ROT_X_Y_mZ, TR_0_0_0),
-        SymOp(ROT_mY_XmY_mZ, TR_0_0_0),
-        SymOp(ROT_mXY_mX_mZ, TR_0_0_0),
-        SymOp(ROT_mY_mX_Z, TR_0_0_0),
-        SymOp(ROT_mXY_Y_Z, TR_0_0_0),
-        SymOp(ROT_X_XmY_Z, TR_0_0_0),
-        SymOp(ROT_mY_mX_mZ, TR_0_0_0),
-        SymOp(ROT_mXY_Y_mZ, TR_0_0_0),
-        SymOp(ROT_X_XmY_mZ, TR_0_0_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mY_XmY_Z, TR_0_0_0),
+        (ROT_mXY_mX_Z, TR_0_0_0),
+        (ROT_X_Y_mZ, TR_0_0_0),
+        (ROT_mY_XmY_mZ, TR_0_0_0),
+        (ROT_mXY_mX_mZ, TR_0_0_0),
+        (ROT_mY_mX_Z, TR_0_0_0),
+        (ROT_mXY_Y_Z, TR_0_0_0),
+        (ROT_X_XmY_Z, TR_0_0_0),
+        (ROT_mY_mX_mZ, TR_0_0_0),
+        (ROT_mXY_Y_mZ, TR_0_0_0),
+        (ROT_X_XmY_mZ, TR_0_0_0)])
 
 sg188 = SpaceGroup(
     number=188,
@@ -4086,19 +4084,19 @@ sg188 = SpaceGroup(
     point_group_name="PG6barm2",
     crystal_system=HEXAGONAL,
     pdb_name="P -6 c 2",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mY_XmY_Z, TR_0_0_0),
-        SymOp(ROT_mXY_mX_Z, TR_0_0_0),
-        SymOp(ROT_X_Y_mZ, TR_0_0_12),
-        SymOp(ROT_mY_XmY_mZ, TR_0_0_12),
-        SymOp(ROT_mXY_mX_mZ, TR_0_0_12),
-        SymOp(ROT_mY_mX_Z, TR_0_0_12),
-        SymOp(ROT_mXY_Y_Z, TR_0_0_12),
-        SymOp(ROT_X_XmY_Z, TR_0_0_12),
-        SymOp(ROT_mY_mX_mZ, TR_0_0_0),
-        SymOp(ROT_mXY_Y_mZ, TR_0_0_0),
-        SymOp(ROT_X_XmY_mZ, TR_0_0_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mY_XmY_Z, TR_0_0_0),
+        (ROT_mXY_mX_Z, TR_0_0_0),
+        (ROT_X_Y_mZ, TR_0_0_12),
+        (ROT_mY_XmY_mZ, TR_0_0_12),
+        (ROT_mXY_mX_mZ, TR_0_0_12),
+        (ROT_mY_mX_Z, TR_0_0_12),
+        (ROT_mXY_Y_Z, TR_0_0_12),
+        (ROT_X_XmY_Z, TR_0_0_12),
+        (ROT_mY_mX_mZ, TR_0_0_0),
+        (ROT_mXY_Y_mZ, TR_0_0_0),
+        (ROT_X_XmY_mZ, TR_0_0_0)])
 
 sg189 = SpaceGroup(
     number=189,
@@ -4108,19 +4106,19 @@ sg189 = SpaceGroup(
     point_group_name="PG6bar2m",
     crystal_system=HEXAGONAL,
     pdb_name="P -6 2 m",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mY_XmY_Z, TR_0_0_0),
-        SymOp(ROT_mXY_mX_Z, TR_0_0_0),
-        SymOp(ROT_X_Y_mZ, TR_0_0_0),
-        SymOp(ROT_mY_XmY_mZ, TR_0_0_0),
-        SymOp(ROT_mXY_mX_mZ, TR_0_0_0),
-        SymOp(ROT_Y_X_mZ, TR_0_0_0),
-        SymOp(ROT_XmY_mY_mZ, TR_0_0_0),
-        SymOp(ROT_mX_mXY_mZ, TR_0_0_0),
-        SymOp(ROT_Y_X_Z, TR_0_0_0),
-        SymOp(ROT_XmY_mY_Z, TR_0_0_0),
-        SymOp(ROT_mX_mXY_Z, TR_0_0_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mY_XmY_Z, TR_0_0_0),
+        (ROT_mXY_mX_Z, TR_0_0_0),
+        (ROT_X_Y_mZ, TR_0_0_0),
+        (ROT_mY_XmY_mZ, TR_0_0_0),
+        (ROT_mXY_mX_mZ, TR_0_0_0),
+        (ROT_Y_X_mZ, TR_0_0_0),
+        (ROT_XmY_mY_mZ, TR_0_0_0),
+        (ROT_mX_mXY_mZ, TR_0_0_0),
+        (ROT_Y_X_Z, TR_0_0_0),
+        (ROT_XmY_mY_Z, TR_0_0_0),
+        (ROT_mX_mXY_Z, TR_0_0_0)])
 
 sg190 = SpaceGroup(
     number=190,
@@ -4130,19 +4128,19 @@ sg190 = SpaceGroup(
     point_group_name="PG6bar2m",
     crystal_system=HEXAGONAL,
     pdb_name="P -6 2 c",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mY_XmY_Z, TR_0_0_0),
-        SymOp(ROT_mXY_mX_Z, TR_0_0_0),
-        SymOp(ROT_X_Y_mZ, TR_0_0_12),
-        SymOp(ROT_mY_XmY_mZ, TR_0_0_12),
-        SymOp(ROT_mXY_mX_mZ, TR_0_0_12),
-        SymOp(ROT_Y_X_mZ, TR_0_0_0),
-        SymOp(ROT_XmY_mY_mZ, TR_0_0_0),
-        SymOp(ROT_mX_mXY_mZ, TR_0_0_0),
-        SymOp(ROT_Y_X_Z, TR_0_0_12),
-        SymOp(ROT_XmY_mY_Z, TR_0_0_12),
-        SymOp(ROT_mX_mXY_Z, TR_0_0_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mY_XmY_Z, TR_0_0_0),
+        (ROT_mXY_mX_Z, TR_0_0_0),
+        (ROT_X_Y_mZ, TR_0_0_12),
+        (ROT_mY_XmY_mZ, TR_0_0_12),
+        (ROT_mXY_mX_mZ, TR_0_0_12),
+        (ROT_Y_X_mZ, TR_0_0_0),
+        (ROT_XmY_mY_mZ, TR_0_0_0),
+        (ROT_mX_mXY_mZ, TR_0_0_0),
+        (ROT_Y_X_Z, TR_0_0_12),
+        (ROT_XmY_mY_Z, TR_0_0_12),
+        (ROT_mX_mXY_Z, TR_0_0_12)])
 
 sg191 = SpaceGroup(
     number=191,
@@ -4152,31 +4150,31 @@ sg191 = SpaceGroup(
     point_group_name="PG6/mmm",
     crystal_system=HEXAGONAL,
     pdb_name="P 6/m 2/m 2/m",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mY_XmY_Z, TR_0_0_0),
-        SymOp(ROT_mXY_mX_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_Y_mXY_Z, TR_0_0_0),
-        SymOp(ROT_XmY_X_Z, TR_0_0_0),
-        SymOp(ROT_Y_X_mZ, TR_0_0_0),
-        SymOp(ROT_XmY_mY_mZ, TR_0_0_0),
-        SymOp(ROT_mX_mXY_mZ, TR_0_0_0),
-        SymOp(ROT_mY_mX_mZ, TR_0_0_0),
-        SymOp(ROT_mXY_Y_mZ, TR_0_0_0),
-        SymOp(ROT_X_XmY_mZ, TR_0_0_0),
-        SymOp(ROT_mX_mY_mZ, TR_0_0_0),
-        SymOp(ROT_Y_mXY_mZ, TR_0_0_0),
-        SymOp(ROT_XmY_X_mZ, TR_0_0_0),
-        SymOp(ROT_X_Y_mZ, TR_0_0_0),
-        SymOp(ROT_mXY_mX_mZ, TR_0_0_0),
-        SymOp(ROT_mY_XmY_mZ, TR_0_0_0),
-        SymOp(ROT_mY_mX_Z, TR_0_0_0),
-        SymOp(ROT_mXY_Y_Z, TR_0_0_0),
-        SymOp(ROT_X_XmY_Z, TR_0_0_0),
-        SymOp(ROT_Y_X_Z, TR_0_0_0),
-        SymOp(ROT_XmY_mY_Z, TR_0_0_0),
-        SymOp(ROT_mX_mXY_Z, TR_0_0_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mY_XmY_Z, TR_0_0_0),
+        (ROT_mXY_mX_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_Y_mXY_Z, TR_0_0_0),
+        (ROT_XmY_X_Z, TR_0_0_0),
+        (ROT_Y_X_mZ, TR_0_0_0),
+        (ROT_XmY_mY_mZ, TR_0_0_0),
+        (ROT_mX_mXY_mZ, TR_0_0_0),
+        (ROT_mY_mX_mZ, TR_0_0_0),
+        (ROT_mXY_Y_mZ, TR_0_0_0),
+        (ROT_X_XmY_mZ, TR_0_0_0),
+        (ROT_mX_mY_mZ, TR_0_0_0),
+        (ROT_Y_mXY_mZ, TR_0_0_0),
+        (ROT_XmY_X_mZ, TR_0_0_0),
+        (ROT_X_Y_mZ, TR_0_0_0),
+        (ROT_mXY_mX_mZ, TR_0_0_0),
+        (ROT_mY_XmY_mZ, TR_0_0_0),
+        (ROT_mY_mX_Z, TR_0_0_0),
+        (ROT_mXY_Y_Z, TR_0_0_0),
+        (ROT_X_XmY_Z, TR_0_0_0),
+        (ROT_Y_X_Z, TR_0_0_0),
+        (ROT_XmY_mY_Z, TR_0_0_0),
+        (ROT_mX_mXY_Z, TR_0_0_0)])
 
 sg192 = SpaceGroup(
     number=192,
@@ -4186,31 +4184,31 @@ sg192 = SpaceGroup(
     point_group_name="PG6/mmm",
     crystal_system=HEXAGONAL,
     pdb_name="P 6/m 2/c 2/c",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mY_XmY_Z, TR_0_0_0),
-        SymOp(ROT_mXY_mX_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_Y_mXY_Z, TR_0_0_0),
-        SymOp(ROT_XmY_X_Z, TR_0_0_0),
-        SymOp(ROT_Y_X_mZ, TR_0_0_12),
-        SymOp(ROT_XmY_mY_mZ, TR_0_0_12),
-        SymOp(ROT_mX_mXY_mZ, TR_0_0_12),
-        SymOp(ROT_mY_mX_mZ, TR_0_0_12),
-        SymOp(ROT_mXY_Y_mZ, TR_0_0_12),
-        SymOp(ROT_X_XmY_mZ, TR_0_0_12),
-        SymOp(ROT_mX_mY_mZ, TR_0_0_0),
-        SymOp(ROT_Y_mXY_mZ, TR_0_0_0),
-        SymOp(ROT_XmY_X_mZ, TR_0_0_0),
-        SymOp(ROT_X_Y_mZ, TR_0_0_0),
-        SymOp(ROT_mXY_mX_mZ, TR_0_0_0),
-        SymOp(ROT_mY_XmY_mZ, TR_0_0_0),
-        SymOp(ROT_mY_mX_Z, TR_0_0_12),
-        SymOp(ROT_mXY_Y_Z, TR_0_0_12),
-        SymOp(ROT_X_XmY_Z, TR_0_0_12),
-        SymOp(ROT_Y_X_Z, TR_0_0_12),
-        SymOp(ROT_XmY_mY_Z, TR_0_0_12),
-        SymOp(ROT_mX_mXY_Z, TR_0_0_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mY_XmY_Z, TR_0_0_0),
+        (ROT_mXY_mX_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_Y_mXY_Z, TR_0_0_0),
+        (ROT_XmY_X_Z, TR_0_0_0),
+        (ROT_Y_X_mZ, TR_0_0_12),
+        (ROT_XmY_mY_mZ, TR_0_0_12),
+        (ROT_mX_mXY_mZ, TR_0_0_12),
+        (ROT_mY_mX_mZ, TR_0_0_12),
+        (ROT_mXY_Y_mZ, TR_0_0_12),
+        (ROT_X_XmY_mZ, TR_0_0_12),
+        (ROT_mX_mY_mZ, TR_0_0_0),
+        (ROT_Y_mXY_mZ, TR_0_0_0),
+        (ROT_XmY_X_mZ, TR_0_0_0),
+        (ROT_X_Y_mZ, TR_0_0_0),
+        (ROT_mXY_mX_mZ, TR_0_0_0),
+        (ROT_mY_XmY_mZ, TR_0_0_0),
+        (ROT_mY_mX_Z, TR_0_0_12),
+        (ROT_mXY_Y_Z, TR_0_0_12),
+        (ROT_X_XmY_Z, TR_0_0_12),
+        (ROT_Y_X_Z, TR_0_0_12),
+        (ROT_XmY_mY_Z, TR_0_0_12),
+        (ROT_mX_mXY_Z, TR_0_0_12)])
 
 sg193 = SpaceGroup(
     number=193,
@@ -4220,31 +4218,31 @@ sg193 = SpaceGroup(
     point_group_name="PG6/mmm",
     crystal_system=HEXAGONAL,
     pdb_name="P 63/m 2/c 2/m",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mY_XmY_Z, TR_0_0_0),
-        SymOp(ROT_mXY_mX_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_12),
-        SymOp(ROT_Y_mXY_Z, TR_0_0_12),
-        SymOp(ROT_XmY_X_Z, TR_0_0_12),
-        SymOp(ROT_Y_X_mZ, TR_0_0_12),
-        SymOp(ROT_XmY_mY_mZ, TR_0_0_12),
-        SymOp(ROT_mX_mXY_mZ, TR_0_0_12),
-        SymOp(ROT_mY_mX_mZ, TR_0_0_0),
-        SymOp(ROT_mXY_Y_mZ, TR_0_0_0),
-        SymOp(ROT_X_XmY_mZ, TR_0_0_0),
-        SymOp(ROT_mX_mY_mZ, TR_0_0_0),
-        SymOp(ROT_Y_mXY_mZ, TR_0_0_0),
-        SymOp(ROT_XmY_X_mZ, TR_0_0_0),
-        SymOp(ROT_X_Y_mZ, TR_0_0_12),
-        SymOp(ROT_mXY_mX_mZ, TR_0_0_12),
-        SymOp(ROT_mY_XmY_mZ, TR_0_0_12),
-        SymOp(ROT_mY_mX_Z, TR_0_0_12),
-        SymOp(ROT_mXY_Y_Z, TR_0_0_12),
-        SymOp(ROT_X_XmY_Z, TR_0_0_12),
-        SymOp(ROT_Y_X_Z, TR_0_0_0),
-        SymOp(ROT_XmY_mY_Z, TR_0_0_0),
-        SymOp(ROT_mX_mXY_Z, TR_0_0_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mY_XmY_Z, TR_0_0_0),
+        (ROT_mXY_mX_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_12),
+        (ROT_Y_mXY_Z, TR_0_0_12),
+        (ROT_XmY_X_Z, TR_0_0_12),
+        (ROT_Y_X_mZ, TR_0_0_12),
+        (ROT_XmY_mY_mZ, TR_0_0_12),
+        (ROT_mX_mXY_mZ, TR_0_0_12),
+        (ROT_mY_mX_mZ, TR_0_0_0),
+        (ROT_mXY_Y_mZ, TR_0_0_0),
+        (ROT_X_XmY_mZ, TR_0_0_0),
+        (ROT_mX_mY_mZ, TR_0_0_0),
+        (ROT_Y_mXY_mZ, TR_0_0_0),
+        (ROT_XmY_X_mZ, TR_0_0_0),
+        (ROT_X_Y_mZ, TR_0_0_12),
+        (ROT_mXY_mX_mZ, TR_0_0_12),
+        (ROT_mY_XmY_mZ, TR_0_0_12),
+        (ROT_mY_mX_Z, TR_0_0_12),
+        (ROT_mXY_Y_Z, TR_0_0_12),
+        (ROT_X_XmY_Z, TR_0_0_12),
+        (ROT_Y_X_Z, TR_0_0_0),
+        (ROT_XmY_mY_Z, TR_0_0_0),
+        (ROT_mX_mXY_Z, TR_0_0_0)])
 
 sg194 = SpaceGroup(
     number=194,
@@ -4254,31 +4252,31 @@ sg194 = SpaceGroup(
     point_group_name="PG6/mmm",
     crystal_system=HEXAGONAL,
     pdb_name="P 63/m 2/m 2/c",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mY_XmY_Z, TR_0_0_0),
-        SymOp(ROT_mXY_mX_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_12),
-        SymOp(ROT_Y_mXY_Z, TR_0_0_12),
-        SymOp(ROT_XmY_X_Z, TR_0_0_12),
-        SymOp(ROT_Y_X_mZ, TR_0_0_0),
-        SymOp(ROT_XmY_mY_mZ, TR_0_0_0),
-        SymOp(ROT_mX_mXY_mZ, TR_0_0_0),
-        SymOp(ROT_mY_mX_mZ, TR_0_0_12),
-        SymOp(ROT_mXY_Y_mZ, TR_0_0_12),
-        SymOp(ROT_X_XmY_mZ, TR_0_0_12),
-        SymOp(ROT_mX_mY_mZ, TR_0_0_0),
-        SymOp(ROT_Y_mXY_mZ, TR_0_0_0),
-        SymOp(ROT_XmY_X_mZ, TR_0_0_0),
-        SymOp(ROT_X_Y_mZ, TR_0_0_12),
-        SymOp(ROT_mXY_mX_mZ, TR_0_0_12),
-        SymOp(ROT_mY_XmY_mZ, TR_0_0_12),
-        SymOp(ROT_mY_mX_Z, TR_0_0_0),
-        SymOp(ROT_mXY_Y_Z, TR_0_0_0),
-        SymOp(ROT_X_XmY_Z, TR_0_0_0),
-        SymOp(ROT_Y_X_Z, TR_0_0_12),
-        SymOp(ROT_XmY_mY_Z, TR_0_0_12),
-        SymOp(ROT_mX_mXY_Z, TR_0_0_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mY_XmY_Z, TR_0_0_0),
+        (ROT_mXY_mX_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_12),
+        (ROT_Y_mXY_Z, TR_0_0_12),
+        (ROT_XmY_X_Z, TR_0_0_12),
+        (ROT_Y_X_mZ, TR_0_0_0),
+        (ROT_XmY_mY_mZ, TR_0_0_0),
+        (ROT_mX_mXY_mZ, TR_0_0_0),
+        (ROT_mY_mX_mZ, TR_0_0_12),
+        (ROT_mXY_Y_mZ, TR_0_0_12),
+        (ROT_X_XmY_mZ, TR_0_0_12),
+        (ROT_mX_mY_mZ, TR_0_0_0),
+        (ROT_Y_mXY_mZ, TR_0_0_0),
+        (ROT_XmY_X_mZ, TR_0_0_0),
+        (ROT_X_Y_mZ, TR_0_0_12),
+        (ROT_mXY_mX_mZ, TR_0_0_12),
+        (ROT_mY_XmY_mZ, TR_0_0_12),
+        (ROT_mY_mX_Z, TR_0_0_0),
+        (ROT_mXY_Y_Z, TR_0_0_0),
+        (ROT_X_XmY_Z, TR_0_0_0),
+        (ROT_Y_X_Z, TR_0_0_12),
+        (ROT_XmY_mY_Z, TR_0_0_12),
+        (ROT_mX_mXY_Z, TR_0_0_12)])
 
 sg195 = SpaceGroup(
     number=195,
@@ -4288,19 +4286,19 @@ sg195 = SpaceGroup(
     point_group_name="PG23",
     crystal_system=CUBIC,
     pdb_name="P 2 3",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mX_Y_mZ, TR_0_0_0),
-        SymOp(ROT_X_mY_mZ, TR_0_0_0),
-        SymOp(ROT_Z_X_Y, TR_0_0_0),
-        SymOp(ROT_Z_mX_mY, TR_0_0_0),
-        SymOp(ROT_mZ_mX_Y, TR_0_0_0),
-        SymOp(ROT_mZ_X_mY, TR_0_0_0),
-        SymOp(ROT_Y_Z_X, TR_0_0_0),
-        SymOp(ROT_mY_Z_mX, TR_0_0_0),
-        SymOp(ROT_Y_mZ_mX, TR_0_0_0),
-        SymOp(ROT_mY_mZ_X, TR_0_0_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mX_Y_mZ, TR_0_0_0),
+        (ROT_X_mY_mZ, TR_0_0_0),
+        (ROT_Z_X_Y, TR_0_0_0),
+        (ROT_Z_mX_mY, TR_0_0_0),
+        (ROT_mZ_mX_Y, TR_0_0_0),
+        (ROT_mZ_X_mY, TR_0_0_0),
+        (ROT_Y_Z_X, TR_0_0_0),
+        (ROT_mY_Z_mX, TR_0_0_0),
+        (ROT_Y_mZ_mX, TR_0_0_0),
+        (ROT_mY_mZ_X, TR_0_0_0)])
 
 sg196 = SpaceGroup(
     number=196,
@@ -4310,55 +4308,55 @@ sg196 = SpaceGroup(
     point_group_name="PG23",
     crystal_system=CUBIC,
     pdb_name="F 2 3",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mX_Y_mZ, TR_0_0_0),
-        SymOp(ROT_X_mY_mZ, TR_0_0_0),
-        SymOp(ROT_Z_X_Y, TR_0_0_0),
-        SymOp(ROT_Z_mX_mY, TR_0_0_0),
-        SymOp(ROT_mZ_mX_Y, TR_0_0_0),
-        SymOp(ROT_mZ_X_mY, TR_0_0_0),
-        SymOp(ROT_Y_Z_X, TR_0_0_0),
-        SymOp(ROT_mY_Z_mX, TR_0_0_0),
-        SymOp(ROT_Y_mZ_mX, TR_0_0_0),
-        SymOp(ROT_mY_mZ_X, TR_0_0_0),
-        SymOp(ROT_X_Y_Z, TR_0_12_12),
-        SymOp(ROT_mX_mY_Z, TR_0_12_12),
-        SymOp(ROT_mX_Y_mZ, TR_0_12_12),
-        SymOp(ROT_X_mY_mZ, TR_0_12_12),
-        SymOp(ROT_Z_X_Y, TR_0_12_12),
-        SymOp(ROT_Z_mX_mY, TR_0_12_12),
-        SymOp(ROT_mZ_mX_Y, TR_0_12_12),
-        SymOp(ROT_mZ_X_mY, TR_0_12_12),
-        SymOp(ROT_Y_Z_X, TR_0_12_12),
-        SymOp(ROT_mY_Z_mX, TR_0_12_12),
-        SymOp(ROT_Y_mZ_mX, TR_0_12_12),
-        SymOp(ROT_mY_mZ_X, TR_0_12_12),
-        SymOp(ROT_X_Y_Z, TR_12_0_12),
-        SymOp(ROT_mX_mY_Z, TR_12_0_12),
-        SymOp(ROT_mX_Y_mZ, TR_12_0_12),
-        SymOp(ROT_X_mY_mZ, TR_12_0_12),
-        SymOp(ROT_Z_X_Y, TR_12_0_12),
-        SymOp(ROT_Z_mX_mY, TR_12_0_12),
-        SymOp(ROT_mZ_mX_Y, TR_12_0_12),
-        SymOp(ROT_mZ_X_mY, TR_12_0_12),
-        SymOp(ROT_Y_Z_X, TR_12_0_12),
-        SymOp(ROT_mY_Z_mX, TR_12_0_12),
-        SymOp(ROT_Y_mZ_mX, TR_12_0_12),
-        SymOp(ROT_mY_mZ_X, TR_12_0_12),
-        SymOp(ROT_X_Y_Z, TR_12_12_0),
-        SymOp(ROT_mX_mY_Z, TR_12_12_0),
-        SymOp(ROT_mX_Y_mZ, TR_12_12_0),
-        SymOp(ROT_X_mY_mZ, TR_12_12_0),
-        SymOp(ROT_Z_X_Y, TR_12_12_0),
-        SymOp(ROT_Z_mX_mY, TR_12_12_0),
-        SymOp(ROT_mZ_mX_Y, TR_12_12_0),
-        SymOp(ROT_mZ_X_mY, TR_12_12_0),
-        SymOp(ROT_Y_Z_X, TR_12_12_0),
-        SymOp(ROT_mY_Z_mX, TR_12_12_0),
-        SymOp(ROT_Y_mZ_mX, TR_12_12_0),
-        SymOp(ROT_mY_mZ_X, TR_12_12_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mX_Y_mZ, TR_0_0_0),
+        (ROT_X_mY_mZ, TR_0_0_0),
+        (ROT_Z_X_Y, TR_0_0_0),
+        (ROT_Z_mX_mY, TR_0_0_0),
+        (ROT_mZ_mX_Y, TR_0_0_0),
+        (ROT_mZ_X_mY, TR_0_0_0),
+        (ROT_Y_Z_X, TR_0_0_0),
+        (ROT_mY_Z_mX, TR_0_0_0),
+        (ROT_Y_mZ_mX, TR_0_0_0),
+        (ROT_mY_mZ_X, TR_0_0_0),
+        (ROT_X_Y_Z, TR_0_12_12),
+        (ROT_mX_mY_Z, TR_0_12_12),
+        (ROT_mX_Y_mZ, TR_0_12_12),
+        (ROT_X_mY_mZ, TR_0_12_12),
+        (ROT_Z_X_Y, TR_0_12_12),
+        (ROT_Z_mX_mY, TR_0_12_12),
+        (ROT_mZ_mX_Y, TR_0_12_12),
+        (ROT_mZ_X_mY, TR_0_12_12),
+        (ROT_Y_Z_X, TR_0_12_12),
+        (ROT_mY_Z_mX, TR_0_12_12),
+        (ROT_Y_mZ_mX, TR_0_12_12),
+        (ROT_mY_mZ_X, TR_0_12_12),
+        (ROT_X_Y_Z, TR_12_0_12),
+        (ROT_mX_mY_Z, TR_12_0_12),
+        (ROT_mX_Y_mZ, TR_12_0_12),
+        (ROT_X_mY_mZ, TR_12_0_12),
+        (ROT_Z_X_Y, TR_12_0_12),
+        (ROT_Z_mX_mY, TR_12_0_12),
+        (ROT_mZ_mX_Y, TR_12_0_12),
+        (ROT_mZ_X_mY, TR_12_0_12),
+        (ROT_Y_Z_X, TR_12_0_12),
+        (ROT_mY_Z_mX, TR_12_0_12),
+        (ROT_Y_mZ_mX, TR_12_0_12),
+        (ROT_mY_mZ_X, TR_12_0_12),
+        (ROT_X_Y_Z, TR_12_12_0),
+        (ROT_mX_mY_Z, TR_12_12_0),
+        (ROT_mX_Y_mZ, TR_12_12_0),
+        (ROT_X_mY_mZ, TR_12_12_0),
+        (ROT_Z_X_Y, TR_12_12_0),
+        (ROT_Z_mX_mY, TR_12_12_0),
+        (ROT_mZ_mX_Y, TR_12_12_0),
+        (ROT_mZ_X_mY, TR_12_12_0),
+        (ROT_Y_Z_X, TR_12_12_0),
+        (ROT_mY_Z_mX, TR_12_12_0),
+        (ROT_Y_mZ_mX, TR_12_12_0),
+        (ROT_mY_mZ_X, TR_12_12_0)])
 
 sg197 = SpaceGroup(
     number=197,
@@ -4368,31 +4366,31 @@ sg197 = SpaceGroup(
     point_group_name="PG23",
     crystal_system=CUBIC,
     pdb_name="I 2 3",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mX_Y_mZ, TR_0_0_0),
-        SymOp(ROT_X_mY_mZ, TR_0_0_0),
-        SymOp(ROT_Z_X_Y, TR_0_0_0),
-        SymOp(ROT_Z_mX_mY, TR_0_0_0),
-        SymOp(ROT_mZ_mX_Y, TR_0_0_0),
-        SymOp(ROT_mZ_X_mY, TR_0_0_0),
-        SymOp(ROT_Y_Z_X, TR_0_0_0),
-        SymOp(ROT_mY_Z_mX, TR_0_0_0),
-        SymOp(ROT_Y_mZ_mX, TR_0_0_0),
-        SymOp(ROT_mY_mZ_X, TR_0_0_0),
-        SymOp(ROT_X_Y_Z, TR_12_12_12),
-        SymOp(ROT_mX_mY_Z, TR_12_12_12),
-        SymOp(ROT_mX_Y_mZ, TR_12_12_12),
-        SymOp(ROT_X_mY_mZ, TR_12_12_12),
-        SymOp(ROT_Z_X_Y, TR_12_12_12),
-        SymOp(ROT_Z_mX_mY, TR_12_12_12),
-        SymOp(ROT_mZ_mX_Y, TR_12_12_12),
-        SymOp(ROT_mZ_X_mY, TR_12_12_12),
-        SymOp(ROT_Y_Z_X, TR_12_12_12),
-        SymOp(ROT_mY_Z_mX, TR_12_12_12),
-        SymOp(ROT_Y_mZ_mX, TR_12_12_12),
-        SymOp(ROT_mY_mZ_X, TR_12_12_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mX_Y_mZ, TR_0_0_0),
+        (ROT_X_mY_mZ, TR_0_0_0),
+        (ROT_Z_X_Y, TR_0_0_0),
+        (ROT_Z_mX_mY, TR_0_0_0),
+        (ROT_mZ_mX_Y, TR_0_0_0),
+        (ROT_mZ_X_mY, TR_0_0_0),
+        (ROT_Y_Z_X, TR_0_0_0),
+        (ROT_mY_Z_mX, TR_0_0_0),
+        (ROT_Y_mZ_mX, TR_0_0_0),
+        (ROT_mY_mZ_X, TR_0_0_0),
+        (ROT_X_Y_Z, TR_12_12_12),
+        (ROT_mX_mY_Z, TR_12_12_12),
+        (ROT_mX_Y_mZ, TR_12_12_12),
+        (ROT_X_mY_mZ, TR_12_12_12),
+        (ROT_Z_X_Y, TR_12_12_12),
+        (ROT_Z_mX_mY, TR_12_12_12),
+        (ROT_mZ_mX_Y, TR_12_12_12),
+        (ROT_mZ_X_mY, TR_12_12_12),
+        (ROT_Y_Z_X, TR_12_12_12),
+        (ROT_mY_Z_mX, TR_12_12_12),
+        (ROT_Y_mZ_mX, TR_12_12_12),
+        (ROT_mY_mZ_X, TR_12_12_12)])
 
 sg198 = SpaceGroup(
     number=198,
@@ -4402,19 +4400,19 @@ sg198 = SpaceGroup(
     point_group_name="PG23",
     crystal_system=CUBIC,
     pdb_name="P 21 3",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_12_0_12),
-        SymOp(ROT_mX_Y_mZ, TR_0_12_12),
-        SymOp(ROT_X_mY_mZ, TR_12_12_0),
-        SymOp(ROT_Z_X_Y, TR_0_0_0),
-        SymOp(ROT_Z_mX_mY, TR_12_12_0),
-        SymOp(ROT_mZ_mX_Y, TR_12_0_12),
-        SymOp(ROT_mZ_X_mY, TR_0_12_12),
-        SymOp(ROT_Y_Z_X, TR_0_0_0),
-        SymOp(ROT_mY_Z_mX, TR_0_12_12),
-        SymOp(ROT_Y_mZ_mX, TR_12_12_0),
-        SymOp(ROT_mY_mZ_X, TR_12_0_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_12_0_12),
+        (ROT_mX_Y_mZ, TR_0_12_12),
+        (ROT_X_mY_mZ, TR_12_12_0),
+        (ROT_Z_X_Y, TR_0_0_0),
+        (ROT_Z_mX_mY, TR_12_12_0),
+        (ROT_mZ_mX_Y, TR_12_0_12),
+        (ROT_mZ_X_mY, TR_0_12_12),
+        (ROT_Y_Z_X, TR_0_0_0),
+        (ROT_mY_Z_mX, TR_0_12_12),
+        (ROT_Y_mZ_mX, TR_12_12_0),
+        (ROT_mY_mZ_X, TR_12_0_12)])
 
 sg199 = SpaceGroup(
     number=199,
@@ -4424,31 +4422,31 @@ sg199 = SpaceGroup(
     point_group_name="PG23",
     crystal_system=CUBIC,
     pdb_name="I 21 3",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_12_0_12),
-        SymOp(ROT_mX_Y_mZ, TR_0_12_12),
-        SymOp(ROT_X_mY_mZ, TR_12_12_0),
-        SymOp(ROT_Z_X_Y, TR_0_0_0),
-        SymOp(ROT_Z_mX_mY, TR_12_12_0),
-        SymOp(ROT_mZ_mX_Y, TR_12_0_12),
-        SymOp(ROT_mZ_X_mY, TR_0_12_12),
-        SymOp(ROT_Y_Z_X, TR_0_0_0),
-        SymOp(ROT_mY_Z_mX, TR_0_12_12),
-        SymOp(ROT_Y_mZ_mX, TR_12_12_0),
-        SymOp(ROT_mY_mZ_X, TR_12_0_12),
-        SymOp(ROT_X_Y_Z, TR_12_12_12),
-        SymOp(ROT_mX_mY_Z, TR_0_12_0),
-        SymOp(ROT_mX_Y_mZ, TR_12_0_0),
-        SymOp(ROT_X_mY_mZ, TR_0_0_12),
-        SymOp(ROT_Z_X_Y, TR_12_12_12),
-        SymOp(ROT_Z_mX_mY, TR_0_0_12),
-        SymOp(ROT_mZ_mX_Y, TR_0_12_0),
-        SymOp(ROT_mZ_X_mY, TR_12_0_0),
-        SymOp(ROT_Y_Z_X, TR_12_12_12),
-        SymOp(ROT_mY_Z_mX, TR_12_0_0),
-        SymOp(ROT_Y_mZ_mX, TR_0_0_12),
-        SymOp(ROT_mY_mZ_X, TR_0_12_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_12_0_12),
+        (ROT_mX_Y_mZ, TR_0_12_12),
+        (ROT_X_mY_mZ, TR_12_12_0),
+        (ROT_Z_X_Y, TR_0_0_0),
+        (ROT_Z_mX_mY, TR_12_12_0),
+        (ROT_mZ_mX_Y, TR_12_0_12),
+        (ROT_mZ_X_mY, TR_0_12_12),
+        (ROT_Y_Z_X, TR_0_0_0),
+        (ROT_mY_Z_mX, TR_0_12_12),
+        (ROT_Y_mZ_mX, TR_12_12_0),
+        (ROT_mY_mZ_X, TR_12_0_12),
+        (ROT_X_Y_Z, TR_12_12_12),
+        (ROT_mX_mY_Z, TR_0_12_0),
+        (ROT_mX_Y_mZ, TR_12_0_0),
+        (ROT_X_mY_mZ, TR_0_0_12),
+        (ROT_Z_X_Y, TR_12_12_12),
+        (ROT_Z_mX_mY, TR_0_0_12),
+        (ROT_mZ_mX_Y, TR_0_12_0),
+        (ROT_mZ_X_mY, TR_12_0_0),
+        (ROT_Y_Z_X, TR_12_12_12),
+        (ROT_mY_Z_mX, TR_12_0_0),
+        (ROT_Y_mZ_mX, TR_0_0_12),
+        (ROT_mY_mZ_X, TR_0_12_0)])
 
 sg200 = SpaceGroup(
     number=200,
@@ -4458,31 +4456,31 @@ sg200 = SpaceGroup(
     point_group_name="PGm3bar",
     crystal_system=CUBIC,
     pdb_name="P 2/m -3",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mX_Y_mZ, TR_0_0_0),
-        SymOp(ROT_X_mY_mZ, TR_0_0_0),
-        SymOp(ROT_Z_X_Y, TR_0_0_0),
-        SymOp(ROT_Z_mX_mY, TR_0_0_0),
-        SymOp(ROT_mZ_mX_Y, TR_0_0_0),
-        SymOp(ROT_mZ_X_mY, TR_0_0_0),
-        SymOp(ROT_Y_Z_X, TR_0_0_0),
-        SymOp(ROT_mY_Z_mX, TR_0_0_0),
-        SymOp(ROT_Y_mZ_mX, TR_0_0_0),
-        SymOp(ROT_mY_mZ_X, TR_0_0_0),
-        SymOp(ROT_mX_mY_mZ, TR_0_0_0),
-        SymOp(ROT_X_Y_mZ, TR_0_0_0),
-        SymOp(ROT_X_mY_Z, TR_0_0_0),
-        SymOp(ROT_mX_Y_Z, TR_0_0_0),
-        SymOp(ROT_mZ_mX_mY, TR_0_0_0),
-        SymOp(ROT_mZ_X_Y, TR_0_0_0),
-        SymOp(ROT_Z_X_mY, TR_0_0_0),
-        SymOp(ROT_Z_mX_Y, TR_0_0_0),
-        SymOp(ROT_mY_mZ_mX, TR_0_0_0),
-        SymOp(ROT_Y_mZ_X, TR_0_0_0),
-        SymOp(ROT_mY_Z_X, TR_0_0_0),
-        SymOp(ROT_Y_Z_mX, TR_0_0_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mX_Y_mZ, TR_0_0_0),
+        (ROT_X_mY_mZ, TR_0_0_0),
+        (ROT_Z_X_Y, TR_0_0_0),
+        (ROT_Z_mX_mY, TR_0_0_0),
+        (ROT_mZ_mX_Y, TR_0_0_0),
+        (ROT_mZ_X_mY, TR_0_0_0),
+        (ROT_Y_Z_X, TR_0_0_0),
+        (ROT_mY_Z_mX, TR_0_0_0),
+        (ROT_Y_mZ_mX, TR_0_0_0),
+        (ROT_mY_mZ_X, TR_0_0_0),
+        (ROT_mX_mY_mZ, TR_0_0_0),
+        (ROT_X_Y_mZ, TR_0_0_0),
+        (ROT_X_mY_Z, TR_0_0_0),
+        (ROT_mX_Y_Z, TR_0_0_0),
+        (ROT_mZ_mX_mY, TR_0_0_0),
+        (ROT_mZ_X_Y, TR_0_0_0),
+        (ROT_Z_X_mY, TR_0_0_0),
+        (ROT_Z_mX_Y, TR_0_0_0),
+        (ROT_mY_mZ_mX, TR_0_0_0),
+        (ROT_Y_mZ_X, TR_0_0_0),
+        (ROT_mY_Z_X, TR_0_0_0),
+        (ROT_Y_Z_mX, TR_0_0_0)])
 
 sg201 = SpaceGroup(
     number=201,
@@ -4492,31 +4490,31 @@ sg201 = SpaceGroup(
     point_group_name="PGm3bar",
     crystal_system=CUBIC,
     pdb_name="P 2/n -3",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mX_Y_mZ, TR_0_0_0),
-        SymOp(ROT_X_mY_mZ, TR_0_0_0),
-        SymOp(ROT_Z_X_Y, TR_0_0_0),
-        SymOp(ROT_Z_mX_mY, TR_0_0_0),
-        SymOp(ROT_mZ_mX_Y, TR_0_0_0),
-        SymOp(ROT_mZ_X_mY, TR_0_0_0),
-        SymOp(ROT_Y_Z_X, TR_0_0_0),
-        SymOp(ROT_mY_Z_mX, TR_0_0_0),
-        SymOp(ROT_Y_mZ_mX, TR_0_0_0),
-        SymOp(ROT_mY_mZ_X, TR_0_0_0),
-        SymOp(ROT_mX_mY_mZ, TR_12_12_12),
-        SymOp(ROT_X_Y_mZ, TR_12_12_12),
-        SymOp(ROT_X_mY_Z, TR_12_12_12),
-        SymOp(ROT_mX_Y_Z, TR_12_12_12),
-        SymOp(ROT_mZ_mX_mY, TR_12_12_12),
-        SymOp(ROT_mZ_X_Y, TR_12_12_12),
-        SymOp(ROT_Z_X_mY, TR_12_12_12),
-        SymOp(ROT_Z_mX_Y, TR_12_12_12),
-        SymOp(ROT_mY_mZ_mX, TR_12_12_12),
-        SymOp(ROT_Y_mZ_X, TR_12_12_12),
-        SymOp(ROT_mY_Z_X, TR_12_12_12),
-        SymOp(ROT_Y_Z_mX, TR_12_12_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mX_Y_mZ, TR_0_0_0),
+        (ROT_X_mY_mZ, TR_0_0_0),
+        (ROT_Z_X_Y, TR_0_0_0),
+        (ROT_Z_mX_mY, TR_0_0_0),
+        (ROT_mZ_mX_Y, TR_0_0_0),
+        (ROT_mZ_X_mY, TR_0_0_0),
+        (ROT_Y_Z_X, TR_0_0_0),
+        (ROT_mY_Z_mX, TR_0_0_0),
+        (ROT_Y_mZ_mX, TR_0_0_0),
+        (ROT_mY_mZ_X, TR_0_0_0),
+        (ROT_mX_mY_mZ, TR_12_12_12),
+        (ROT_X_Y_mZ, TR_12_12_12),
+        (ROT_X_mY_Z, TR_12_12_12),
+        (ROT_mX_Y_Z, TR_12_12_12),
+        (ROT_mZ_mX_mY, TR_12_12_12),
+        (ROT_mZ_X_Y, TR_12_12_12),
+        (ROT_Z_X_mY, TR_12_12_12),
+        (ROT_Z_mX_Y, TR_12_12_12),
+        (ROT_mY_mZ_mX, TR_12_12_12),
+        (ROT_Y_mZ_X, TR_12_12_12),
+        (ROT_mY_Z_X, TR_12_12_12),
+        (ROT_Y_Z_mX, TR_12_12_12)])
 
 sg202 = SpaceGroup(
     number=202,
@@ -4526,103 +4524,103 @@ sg202 = SpaceGroup(
     point_group_name="PGm3bar",
     crystal_system=CUBIC,
     pdb_name="F 2/m -3",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mX_Y_mZ, TR_0_0_0),
-        SymOp(ROT_X_mY_mZ, TR_0_0_0),
-        SymOp(ROT_Z_X_Y, TR_0_0_0),
-        SymOp(ROT_Z_mX_mY, TR_0_0_0),
-        SymOp(ROT_mZ_mX_Y, TR_0_0_0),
-        SymOp(ROT_mZ_X_mY, TR_0_0_0),
-        SymOp(ROT_Y_Z_X, TR_0_0_0),
-        SymOp(ROT_mY_Z_mX, TR_0_0_0),
-        SymOp(ROT_Y_mZ_mX, TR_0_0_0),
-        SymOp(ROT_mY_mZ_X, TR_0_0_0),
-        SymOp(ROT_mX_mY_mZ, TR_0_0_0),
-        SymOp(ROT_X_Y_mZ, TR_0_0_0),
-        SymOp(ROT_X_mY_Z, TR_0_0_0),
-        SymOp(ROT_mX_Y_Z, TR_0_0_0),
-        SymOp(ROT_mZ_mX_mY, TR_0_0_0),
-        SymOp(ROT_mZ_X_Y, TR_0_0_0),
-        SymOp(ROT_Z_X_mY, TR_0_0_0),
-        SymOp(ROT_Z_mX_Y, TR_0_0_0),
-        SymOp(ROT_mY_mZ_mX, TR_0_0_0),
-        SymOp(ROT_Y_mZ_X, TR_0_0_0),
-        SymOp(ROT_mY_Z_X, TR_0_0_0),
-        SymOp(ROT_Y_Z_mX, TR_0_0_0),
-        SymOp(ROT_X_Y_Z, TR_0_12_12),
-        SymOp(ROT_mX_mY_Z, TR_0_12_12),
-        SymOp(ROT_mX_Y_mZ, TR_0_12_12),
-        SymOp(ROT_X_mY_mZ, TR_0_12_12),
-        SymOp(ROT_Z_X_Y, TR_0_12_12),
-        SymOp(ROT_Z_mX_mY, TR_0_12_12),
-        SymOp(ROT_mZ_mX_Y, TR_0_12_12),
-        SymOp(ROT_mZ_X_mY, TR_0_12_12),
-        SymOp(ROT_Y_Z_X, TR_0_12_12),
-        SymOp(ROT_mY_Z_mX, TR_0_12_12),
-        SymOp(ROT_Y_mZ_mX, TR_0_12_12),
-        SymOp(ROT_mY_mZ_X, TR_0_12_12),
-        SymOp(ROT_mX_mY_mZ, TR_0_12_12),
-        SymOp(ROT_X_Y_mZ, TR_0_12_12),
-        SymOp(ROT_X_mY_Z, TR_0_12_12),
-        SymOp(ROT_mX_Y_Z, TR_0_12_12),
-        SymOp(ROT_mZ_mX_mY, TR_0_12_12),
-        SymOp(ROT_mZ_X_Y, TR_0_12_12),
-        SymOp(ROT_Z_X_mY, TR_0_12_12),
-        SymOp(ROT_Z_mX_Y, TR_0_12_12),
-        SymOp(ROT_mY_mZ_mX, TR_0_12_12),
-        SymOp(ROT_Y_mZ_X, TR_0_12_12),
-        SymOp(ROT_mY_Z_X, TR_0_12_12),
-        SymOp(ROT_Y_Z_mX, TR_0_12_12),
-        SymOp(ROT_X_Y_Z, TR_12_0_12),
-        SymOp(ROT_mX_mY_Z, TR_12_0_12),
-        SymOp(ROT_mX_Y_mZ, TR_12_0_12),
-        SymOp(ROT_X_mY_mZ, TR_12_0_12),
-        SymOp(ROT_Z_X_Y, TR_12_0_12),
-        SymOp(ROT_Z_mX_mY, TR_12_0_12),
-        SymOp(ROT_mZ_mX_Y, TR_12_0_12),
-        SymOp(ROT_mZ_X_mY, TR_12_0_12),
-        SymOp(ROT_Y_Z_X, TR_12_0_12),
-        SymOp(ROT_mY_Z_mX, TR_12_0_12),
-        SymOp(ROT_Y_mZ_mX, TR_12_0_12),
-        SymOp(ROT_mY_mZ_X, TR_12_0_12),
-        SymOp(ROT_mX_mY_mZ, TR_12_0_12),
-        SymOp(ROT_X_Y_mZ, TR_12_0_12),
-        SymOp(ROT_X_mY_Z, TR_12_0_12),
-        SymOp(ROT_mX_Y_Z, TR_12_0_12),
-        SymOp(ROT_mZ_mX_mY, TR_12_0_12),
-        SymOp(ROT_mZ_X_Y, TR_12_0_12),
-        SymOp(ROT_Z_X_mY, TR_12_0_12),
-        SymOp(ROT_Z_mX_Y, TR_12_0_12),
-        SymOp(ROT_mY_mZ_mX, TR_12_0_12),
-        SymOp(ROT_Y_mZ_X, TR_12_0_12),
-        SymOp(ROT_mY_Z_X, TR_12_0_12),
-        SymOp(ROT_Y_Z_mX, TR_12_0_12),
-        SymOp(ROT_X_Y_Z, TR_12_12_0),
-        SymOp(ROT_mX_mY_Z, TR_12_12_0),
-        SymOp(ROT_mX_Y_mZ, TR_12_12_0),
-        SymOp(ROT_X_mY_mZ, TR_12_12_0),
-        SymOp(ROT_Z_X_Y, TR_12_12_0),
-        SymOp(ROT_Z_mX_mY, TR_12_12_0),
-        SymOp(ROT_mZ_mX_Y, TR_12_12_0),
-        SymOp(ROT_mZ_X_mY, TR_12_12_0),
-        SymOp(ROT_Y_Z_X, TR_12_12_0),
-        SymOp(ROT_mY_Z_mX, TR_12_12_0),
-        SymOp(ROT_Y_mZ_mX, TR_12_12_0),
-        SymOp(ROT_mY_mZ_X, TR_12_12_0),
-        SymOp(ROT_mX_mY_mZ, TR_12_12_0),
-        SymOp(ROT_X_Y_mZ, TR_12_12_0),
-        SymOp(ROT_X_mY_Z, TR_12_12_0),
-        SymOp(ROT_mX_Y_Z, TR_12_12_0),
-        SymOp(ROT_mZ_mX_mY, TR_12_12_0),
-        SymOp(ROT_mZ_X_Y, TR_12_12_0),
-        SymOp(ROT_Z_X_mY, TR_12_12_0),
-        SymOp(ROT_Z_mX_Y, TR_12_12_0),
-        SymOp(ROT_mY_mZ_mX, TR_12_12_0),
-        SymOp(ROT_Y_mZ_X, TR_12_12_0),
-        SymOp(ROT_mY_Z_X, TR_12_12_0),
-        SymOp(ROT_Y_Z_mX, TR_12_12_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mX_Y_mZ, TR_0_0_0),
+        (ROT_X_mY_mZ, TR_0_0_0),
+        (ROT_Z_X_Y, TR_0_0_0),
+        (ROT_Z_mX_mY, TR_0_0_0),
+        (ROT_mZ_mX_Y, TR_0_0_0),
+        (ROT_mZ_X_mY, TR_0_0_0),
+        (ROT_Y_Z_X, TR_0_0_0),
+        (ROT_mY_Z_mX, TR_0_0_0),
+        (ROT_Y_mZ_mX, TR_0_0_0),
+        (ROT_mY_mZ_X, TR_0_0_0),
+        (ROT_mX_mY_mZ, TR_0_0_0),
+        (ROT_X_Y_mZ, TR_0_0_0),
+        (ROT_X_mY_Z, TR_0_0_0),
+        (ROT_mX_Y_Z, TR_0_0_0),
+        (ROT_mZ_mX_mY, TR_0_0_0),
+        (ROT_mZ_X_Y, TR_0_0_0),
+        (ROT_Z_X_mY, TR_0_0_0),
+        (ROT_Z_mX_Y, TR_0_0_0),
+        (ROT_mY_mZ_mX, TR_0_0_0),
+        (ROT_Y_mZ_X, TR_0_0_0),
+        (ROT_mY_Z_X, TR_0_0_0),
+        (ROT_Y_Z_mX, TR_0_0_0),
+        (ROT_X_Y_Z, TR_0_12_12),
+        (ROT_mX_mY_Z, TR_0_12_12),
+        (ROT_mX_Y_mZ, TR_0_12_12),
+        (ROT_X_mY_mZ, TR_0_12_12),
+        (ROT_Z_X_Y, TR_0_12_12),
+        (ROT_Z_mX_mY, TR_0_12_12),
+        (ROT_mZ_mX_Y, TR_0_12_12),
+        (ROT_mZ_X_mY, TR_0_12_12),
+        (ROT_Y_Z_X, TR_0_12_12),
+        (ROT_mY_Z_mX, TR_0_12_12),
+        (ROT_Y_mZ_mX, TR_0_12_12),
+        (ROT_mY_mZ_X, TR_0_12_12),
+        (ROT_mX_mY_mZ, TR_0_12_12),
+        (ROT_X_Y_mZ, TR_0_12_12),
+        (ROT_X_mY_Z, TR_0_12_12),
+        (ROT_mX_Y_Z, TR_0_12_12),
+        (ROT_mZ_mX_mY, TR_0_12_12),
+        (ROT_mZ_X_Y, TR_0_12_12),
+        (ROT_Z_X_mY, TR_0_12_12),
+        (ROT_Z_mX_Y, TR_0_12_12),
+        (ROT_mY_mZ_mX, TR_0_12_12),
+        (ROT_Y_mZ_X, TR_0_12_12),
+        (ROT_mY_Z_X, TR_0_12_12),
+        (ROT_Y_Z_mX, TR_0_12_12),
+        (ROT_X_Y_Z, TR_12_0_12),
+        (ROT_mX_mY_Z, TR_12_0_12),
+        (ROT_mX_Y_mZ, TR_12_0_12),
+        (ROT_X_mY_mZ, TR_12_0_12),
+        (ROT_Z_X_Y, TR_12_0_12),
+        (ROT_Z_mX_mY, TR_12_0_12),
+        (ROT_mZ_mX_Y, TR_12_0_12),
+        (ROT_mZ_X_mY, TR_12_0_12),
+        (ROT_Y_Z_X, TR_12_0_12),
+        (ROT_mY_Z_mX, TR_12_0_12),
+        (ROT_Y_mZ_mX, TR_12_0_12),
+        (ROT_mY_mZ_X, TR_12_0_12),
+        (ROT_mX_mY_mZ, TR_12_0_12),
+        (ROT_X_Y_mZ, TR_12_0_12),
+        (ROT_X_mY_Z, TR_12_0_12),
+        (ROT_mX_Y_Z, TR_12_0_12),
+        (ROT_mZ_mX_mY, TR_12_0_12),
+        (ROT_mZ_X_Y, TR_12_0_12),
+        (ROT_Z_X_mY, TR_12_0_12),
+        (ROT_Z_mX_Y, TR_12_0_12),
+        (ROT_mY_mZ_mX, TR_12_0_12),
+        (ROT_Y_mZ_X, TR_12_0_12),
+        (ROT_mY_Z_X, TR_12_0_12),
+        (ROT_Y_Z_mX, TR_12_0_12),
+        (ROT_X_Y_Z, TR_12_12_0),
+        (ROT_mX_mY_Z, TR_12_12_0),
+        (ROT_mX_Y_mZ, TR_12_12_0),
+        (ROT_X_mY_mZ, TR_12_12_0),
+        (ROT_Z_X_Y, TR_12_12_0),
+        (ROT_Z_mX_mY, TR_12_12_0),
+        (ROT_mZ_mX_Y, TR_12_12_0),
+        (ROT_mZ_X_mY, TR_12_12_0),
+        (ROT_Y_Z_X, TR_12_12_0),
+        (ROT_mY_Z_mX, TR_12_12_0),
+        (ROT_Y_mZ_mX, TR_12_12_0),
+        (ROT_mY_mZ_X, TR_12_12_0),
+        (ROT_mX_mY_mZ, TR_12_12_0),
+        (ROT_X_Y_mZ, TR_12_12_0),
+        (ROT_X_mY_Z, TR_12_12_0),
+        (ROT_mX_Y_Z, TR_12_12_0),
+        (ROT_mZ_mX_mY, TR_12_12_0),
+        (ROT_mZ_X_Y, TR_12_12_0),
+        (ROT_Z_X_mY, TR_12_12_0),
+        (ROT_Z_mX_Y, TR_12_12_0),
+        (ROT_mY_mZ_mX, TR_12_12_0),
+        (ROT_Y_mZ_X, TR_12_12_0),
+        (ROT_mY_Z_X, TR_12_12_0),
+        (ROT_Y_Z_mX, TR_12_12_0)])
 
 sg203 = SpaceGroup(
     number=203,
@@ -4632,103 +4630,103 @@ sg203 = SpaceGroup(
     point_group_name="PGm3bar",
     crystal_system=CUBIC,
     pdb_name="F 2/d -3",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mX_Y_mZ, TR_0_0_0),
-        SymOp(ROT_X_mY_mZ, TR_0_0_0),
-        SymOp(ROT_Z_X_Y, TR_0_0_0),
-        SymOp(ROT_Z_mX_mY, TR_0_0_0),
-        SymOp(ROT_mZ_mX_Y, TR_0_0_0),
-        SymOp(ROT_mZ_X_mY, TR_0_0_0),
-        SymOp(ROT_Y_Z_X, TR_0_0_0),
-        SymOp(ROT_mY_Z_mX, TR_0_0_0),
-        SymOp(ROT_Y_mZ_mX, TR_0_0_0),
-        SymOp(ROT_mY_mZ_X, TR_0_0_0),
-        SymOp(ROT_mX_mY_mZ, TR_14_14_14),
-        SymOp(ROT_X_Y_mZ, TR_14_14_14),
-        SymOp(ROT_X_mY_Z, TR_14_14_14),
-        SymOp(ROT_mX_Y_Z, TR_14_14_14),
-        SymOp(ROT_mZ_mX_mY, TR_14_14_14),
-        SymOp(ROT_mZ_X_Y, TR_14_14_14),
-        SymOp(ROT_Z_X_mY, TR_14_14_14),
-        SymOp(ROT_Z_mX_Y, TR_14_14_14),
-        SymOp(ROT_mY_mZ_mX, TR_14_14_14),
-        SymOp(ROT_Y_mZ_X, TR_14_14_14),
-        SymOp(ROT_mY_Z_X, TR_14_14_14),
-        SymOp(ROT_Y_Z_mX, TR_14_14_14),
-        SymOp(ROT_X_Y_Z, TR_0_12_12),
-        SymOp(ROT_mX_mY_Z, TR_0_12_12),
-        SymOp(ROT_mX_Y_mZ, TR_0_12_12),
-        SymOp(ROT_X_mY_mZ, TR_0_12_12),
-        SymOp(ROT_Z_X_Y, TR_0_12_12),
-        SymOp(ROT_Z_mX_mY, TR_0_12_12),
-        SymOp(ROT_mZ_mX_Y, TR_0_12_12),
-        SymOp(ROT_mZ_X_mY, TR_0_12_12),
-        SymOp(ROT_Y_Z_X, TR_0_12_12),
-        SymOp(ROT_mY_Z_mX, TR_0_12_12),
-        SymOp(ROT_Y_mZ_mX, TR_0_12_12),
-        SymOp(ROT_mY_mZ_X, TR_0_12_12),
-        SymOp(ROT_mX_mY_mZ, TR_14_34_34),
-        SymOp(ROT_X_Y_mZ, TR_14_34_34),
-        SymOp(ROT_X_mY_Z, TR_14_34_34),
-        SymOp(ROT_mX_Y_Z, TR_14_34_34),
-        SymOp(ROT_mZ_mX_mY, TR_14_34_34),
-        SymOp(ROT_mZ_X_Y, TR_14_34_34),
-        SymOp(ROT_Z_X_mY, TR_14_34_34),
-        SymOp(ROT_Z_mX_Y, TR_14_34_34),
-        SymOp(ROT_mY_mZ_mX, TR_14_34_34),
-        SymOp(ROT_Y_mZ_X, TR_14_34_34),
-        SymOp(ROT_mY_Z_X, TR_14_34_34),
-        SymOp(ROT_Y_Z_mX, TR_14_34_34),
-        SymOp(ROT_X_Y_Z, TR_12_0_12),
-        SymOp(ROT_mX_mY_Z, TR_12_0_12),
-        SymOp(ROT_mX_Y_mZ, TR_12_0_12),
-        SymOp(ROT_X_mY_mZ, TR_12_0_12),
-        SymOp(ROT_Z_X_Y, TR_12_0_12),
-        SymOp(ROT_Z_mX_mY, TR_12_0_12),
-        SymOp(ROT_mZ_mX_Y, TR_12_0_12),
-        SymOp(ROT_mZ_X_mY, TR_12_0_12),
-        SymOp(ROT_Y_Z_X, TR_12_0_12),
-        SymOp(ROT_mY_Z_mX, TR_12_0_12),
-        SymOp(ROT_Y_mZ_mX, TR_12_0_12),
-        SymOp(ROT_mY_mZ_X, TR_12_0_12),
-        SymOp(ROT_mX_mY_mZ, TR_34_14_34),
-        SymOp(ROT_X_Y_mZ, TR_34_14_34),
-        SymOp(ROT_X_mY_Z, TR_34_14_34),
-        SymOp(ROT_mX_Y_Z, TR_34_14_34),
-        SymOp(ROT_mZ_mX_mY, TR_34_14_34),
-        SymOp(ROT_mZ_X_Y, TR_34_14_34),
-        SymOp(ROT_Z_X_mY, TR_34_14_34),
-        SymOp(ROT_Z_mX_Y, TR_34_14_34),
-        SymOp(ROT_mY_mZ_mX, TR_34_14_34),
-        SymOp(ROT_Y_mZ_X, TR_34_14_34),
-        SymOp(ROT_mY_Z_X, TR_34_14_34),
-        SymOp(ROT_Y_Z_mX, TR_34_14_34),
-        SymOp(ROT_X_Y_Z, TR_12_12_0),
-        SymOp(ROT_mX_mY_Z, TR_12_12_0),
-        SymOp(ROT_mX_Y_mZ, TR_12_12_0),
-        SymOp(ROT_X_mY_mZ, TR_12_12_0),
-        SymOp(ROT_Z_X_Y, TR_12_12_0),
-        SymOp(ROT_Z_mX_mY, TR_12_12_0),
-        SymOp(ROT_mZ_mX_Y, TR_12_12_0),
-        SymOp(ROT_mZ_X_mY, TR_12_12_0),
-        SymOp(ROT_Y_Z_X, TR_12_12_0),
-        SymOp(ROT_mY_Z_mX, TR_12_12_0),
-        SymOp(ROT_Y_mZ_mX, TR_12_12_0),
-        SymOp(ROT_mY_mZ_X, TR_12_12_0),
-        SymOp(ROT_mX_mY_mZ, TR_34_34_14),
-        SymOp(ROT_X_Y_mZ, TR_34_34_14),
-        SymOp(ROT_X_mY_Z, TR_34_34_14),
-        SymOp(ROT_mX_Y_Z, TR_34_34_14),
-        SymOp(ROT_mZ_mX_mY, TR_34_34_14),
-        SymOp(ROT_mZ_X_Y, TR_34_34_14),
-        SymOp(ROT_Z_X_mY, TR_34_34_14),
-        SymOp(ROT_Z_mX_Y, TR_34_34_14),
-        SymOp(ROT_mY_mZ_mX, TR_34_34_14),
-        SymOp(ROT_Y_mZ_X, TR_34_34_14),
-        SymOp(ROT_mY_Z_X, TR_34_34_14),
-        SymOp(ROT_Y_Z_mX, TR_34_34_14)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mX_Y_mZ, TR_0_0_0),
+        (ROT_X_mY_mZ, TR_0_0_0),
+        (ROT_Z_X_Y, TR_0_0_0),
+        (ROT_Z_mX_mY, TR_0_0_0),
+        (ROT_mZ_mX_Y, TR_0_0_0),
+        (ROT_mZ_X_mY, TR_0_0_0),
+        (ROT_Y_Z_X, TR_0_0_0),
+        (ROT_mY_Z_mX, TR_0_0_0),
+        (ROT_Y_mZ_mX, TR_0_0_0),
+        (ROT_mY_mZ_X, TR_0_0_0),
+        (ROT_mX_mY_mZ, TR_14_14_14),
+        (ROT_X_Y_mZ, TR_14_14_14),
+        (ROT_X_mY_Z, TR_14_14_14),
+        (ROT_mX_Y_Z, TR_14_14_14),
+        (ROT_mZ_mX_mY, TR_14_14_14),
+        (ROT_mZ_X_Y, TR_14_14_14),
+        (ROT_Z_X_mY, TR_14_14_14),
+        (ROT_Z_mX_Y, TR_14_14_14),
+        (ROT_mY_mZ_mX, TR_14_14_14),
+        (ROT_Y_mZ_X, TR_14_14_14),
+        (ROT_mY_Z_X, TR_14_14_14),
+        (ROT_Y_Z_mX, TR_14_14_14),
+        (ROT_X_Y_Z, TR_0_12_12),
+        (ROT_mX_mY_Z, TR_0_12_12),
+        (ROT_mX_Y_mZ, TR_0_12_12),
+        (ROT_X_mY_mZ, TR_0_12_12),
+        (ROT_Z_X_Y, TR_0_12_12),
+        (ROT_Z_mX_mY, TR_0_12_12),
+        (ROT_mZ_mX_Y, TR_0_12_12),
+        (ROT_mZ_X_mY, TR_0_12_12),
+        (ROT_Y_Z_X, TR_0_12_12),
+        (ROT_mY_Z_mX, TR_0_12_12),
+        (ROT_Y_mZ_mX, TR_0_12_12),
+        (ROT_mY_mZ_X, TR_0_12_12),
+        (ROT_mX_mY_mZ, TR_14_34_34),
+        (ROT_X_Y_mZ, TR_14_34_34),
+        (ROT_X_mY_Z, TR_14_34_34),
+        (ROT_mX_Y_Z, TR_14_34_34),
+        (ROT_mZ_mX_mY, TR_14_34_34),
+        (ROT_mZ_X_Y, TR_14_34_34),
+        (ROT_Z_X_mY, TR_14_34_34),
+        (ROT_Z_mX_Y, TR_14_34_34),
+        (ROT_mY_mZ_mX, TR_14_34_34),
+        (ROT_Y_mZ_X, TR_14_34_34),
+        (ROT_mY_Z_X, TR_14_34_34),
+        (ROT_Y_Z_mX, TR_14_34_34),
+        (ROT_X_Y_Z, TR_12_0_12),
+        (ROT_mX_mY_Z, TR_12_0_12),
+        (ROT_mX_Y_mZ, TR_12_0_12),
+        (ROT_X_mY_mZ, TR_12_0_12),
+        (ROT_Z_X_Y, TR_12_0_12),
+        (ROT_Z_mX_mY, TR_12_0_12),
+        (ROT_mZ_mX_Y, TR_12_0_12),
+        (ROT_mZ_X_mY, TR_12_0_12),
+        (ROT_Y_Z_X, TR_12_0_12),
+        (ROT_mY_Z_mX, TR_12_0_12),
+        (ROT_Y_mZ_mX, TR_12_0_12),
+        (ROT_mY_mZ_X, TR_12_0_12),
+        (ROT_mX_mY_mZ, TR_34_14_34),
+        (ROT_X_Y_mZ, TR_34_14_34),
+        (ROT_X_mY_Z, TR_34_14_34),
+        (ROT_mX_Y_Z, TR_34_14_34),
+        (ROT_mZ_mX_mY, TR_34_14_34),
+        (ROT_mZ_X_Y, TR_34_14_34),
+        (ROT_Z_X_mY, TR_34_14_34),
+        (ROT_Z_mX_Y, TR_34_14_34),
+        (ROT_mY_mZ_mX, TR_34_14_34),
+        (ROT_Y_mZ_X, TR_34_14_34),
+        (ROT_mY_Z_X, TR_34_14_34),
+        (ROT_Y_Z_mX, TR_34_14_34),
+        (ROT_X_Y_Z, TR_12_12_0),
+        (ROT_mX_mY_Z, TR_12_12_0),
+        (ROT_mX_Y_mZ, TR_12_12_0),
+        (ROT_X_mY_mZ, TR_12_12_0),
+        (ROT_Z_X_Y, TR_12_12_0),
+        (ROT_Z_mX_mY, TR_12_12_0),
+        (ROT_mZ_mX_Y, TR_12_12_0),
+        (ROT_mZ_X_mY, TR_12_12_0),
+        (ROT_Y_Z_X, TR_12_12_0),
+        (ROT_mY_Z_mX, TR_12_12_0),
+        (ROT_Y_mZ_mX, TR_12_12_0),
+        (ROT_mY_mZ_X, TR_12_12_0),
+        (ROT_mX_mY_mZ, TR_34_34_14),
+        (ROT_X_Y_mZ, TR_34_34_14),
+        (ROT_X_mY_Z, TR_34_34_14),
+        (ROT_mX_Y_Z, TR_34_34_14),
+        (ROT_mZ_mX_mY, TR_34_34_14),
+        (ROT_mZ_X_Y, TR_34_34_14),
+        (ROT_Z_X_mY, TR_34_34_14),
+        (ROT_Z_mX_Y, TR_34_34_14),
+        (ROT_mY_mZ_mX, TR_34_34_14),
+        (ROT_Y_mZ_X, TR_34_34_14),
+        (ROT_mY_Z_X, TR_34_34_14),
+        (ROT_Y_Z_mX, TR_34_34_14)])
 
 sg204 = SpaceGroup(
     number=204,
@@ -4738,55 +4736,55 @@ sg204 = SpaceGroup(
     point_group_name="PGm3bar",
     crystal_system=CUBIC,
     pdb_name="I 2/m -3",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mX_Y_mZ, TR_0_0_0),
-        SymOp(ROT_X_mY_mZ, TR_0_0_0),
-        SymOp(ROT_Z_X_Y, TR_0_0_0),
-        SymOp(ROT_Z_mX_mY, TR_0_0_0),
-        SymOp(ROT_mZ_mX_Y, TR_0_0_0),
-        SymOp(ROT_mZ_X_mY, TR_0_0_0),
-        SymOp(ROT_Y_Z_X, TR_0_0_0),
-        SymOp(ROT_mY_Z_mX, TR_0_0_0),
-        SymOp(ROT_Y_mZ_mX, TR_0_0_0),
-        SymOp(ROT_mY_mZ_X, TR_0_0_0),
-        SymOp(ROT_mX_mY_mZ, TR_0_0_0),
-        SymOp(ROT_X_Y_mZ, TR_0_0_0),
-        SymOp(ROT_X_mY_Z, TR_0_0_0),
-        SymOp(ROT_mX_Y_Z, TR_0_0_0),
-        SymOp(ROT_mZ_mX_mY, TR_0_0_0),
-        SymOp(ROT_mZ_X_Y, TR_0_0_0),
-        SymOp(ROT_Z_X_mY, TR_0_0_0),
-        SymOp(ROT_Z_mX_Y, TR_0_0_0),
-        SymOp(ROT_mY_mZ_mX, TR_0_0_0),
-        SymOp(ROT_Y_mZ_X, TR_0_0_0),
-        SymOp(ROT_mY_Z_X, TR_0_0_0),
-        SymOp(ROT_Y_Z_mX, TR_0_0_0),
-        SymOp(ROT_X_Y_Z, TR_12_12_12),
-        SymOp(ROT_mX_mY_Z, TR_12_12_12),
-        SymOp(ROT_mX_Y_mZ, TR_12_12_12),
-        SymOp(ROT_X_mY_mZ, TR_12_12_12),
-        SymOp(ROT_Z_X_Y, TR_12_12_12),
-        SymOp(ROT_Z_mX_mY, TR_12_12_12),
-        SymOp(ROT_mZ_mX_Y, TR_12_12_12),
-        SymOp(ROT_mZ_X_mY, TR_12_12_12),
-        SymOp(ROT_Y_Z_X, TR_12_12_12),
-        SymOp(ROT_mY_Z_mX, TR_12_12_12),
-        SymOp(ROT_Y_mZ_mX, TR_12_12_12),
-        SymOp(ROT_mY_mZ_X, TR_12_12_12),
-        SymOp(ROT_mX_mY_mZ, TR_12_12_12),
-        SymOp(ROT_X_Y_mZ, TR_12_12_12),
-        SymOp(ROT_X_mY_Z, TR_12_12_12),
-        SymOp(ROT_mX_Y_Z, TR_12_12_12),
-        SymOp(ROT_mZ_mX_mY, TR_12_12_12),
-        SymOp(ROT_mZ_X_Y, TR_12_12_12),
-        SymOp(ROT_Z_X_mY, TR_12_12_12),
-        SymOp(ROT_Z_mX_Y, TR_12_12_12),
-        SymOp(ROT_mY_mZ_mX, TR_12_12_12),
-        SymOp(ROT_Y_mZ_X, TR_12_12_12),
-        SymOp(ROT_mY_Z_X, TR_12_12_12),
-        SymOp(ROT_Y_Z_mX, TR_12_12_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mX_Y_mZ, TR_0_0_0),
+        (ROT_X_mY_mZ, TR_0_0_0),
+        (ROT_Z_X_Y, TR_0_0_0),
+        (ROT_Z_mX_mY, TR_0_0_0),
+        (ROT_mZ_mX_Y, TR_0_0_0),
+        (ROT_mZ_X_mY, TR_0_0_0),
+        (ROT_Y_Z_X, TR_0_0_0),
+        (ROT_mY_Z_mX, TR_0_0_0),
+        (ROT_Y_mZ_mX, TR_0_0_0),
+        (ROT_mY_mZ_X, TR_0_0_0),
+        (ROT_mX_mY_mZ, TR_0_0_0),
+        (ROT_X_Y_mZ, TR_0_0_0),
+        (ROT_X_mY_Z, TR_0_0_0),
+        (ROT_mX_Y_Z, TR_0_0_0),
+        (ROT_mZ_mX_mY, TR_0_0_0),
+        (ROT_mZ_X_Y, TR_0_0_0),
+        (ROT_Z_X_mY, TR_0_0_0),
+        (ROT_Z_mX_Y, TR_0_0_0),
+        (ROT_mY_mZ_mX, TR_0_0_0),
+        (ROT_Y_mZ_X, TR_0_0_0),
+        (ROT_mY_Z_X, TR_0_0_0),
+        (ROT_Y_Z_mX, TR_0_0_0),
+        (ROT_X_Y_Z, TR_12_12_12),
+        (ROT_mX_mY_Z, TR_12_12_12),
+        (ROT_mX_Y_mZ, TR_12_12_12),
+        (ROT_X_mY_mZ, TR_12_12_12),
+        (ROT_Z_X_Y, TR_12_12_12),
+        (ROT_Z_mX_mY, TR_12_12_12),
+        (ROT_mZ_mX_Y, TR_12_12_12),
+        (ROT_mZ_X_mY, TR_12_12_12),
+        (ROT_Y_Z_X, TR_12_12_12),
+        (ROT_mY_Z_mX, TR_12_12_12),
+        (ROT_Y_mZ_mX, TR_12_12_12),
+        (ROT_mY_mZ_X, TR_12_12_12),
+        (ROT_mX_mY_mZ, TR_12_12_12),
+        (ROT_X_Y_mZ, TR_12_12_12),
+        (ROT_X_mY_Z, TR_12_12_12),
+        (ROT_mX_Y_Z, TR_12_12_12),
+        (ROT_mZ_mX_mY, TR_12_12_12),
+        (ROT_mZ_X_Y, TR_12_12_12),
+        (ROT_Z_X_mY, TR_12_12_12),
+        (ROT_Z_mX_Y, TR_12_12_12),
+        (ROT_mY_mZ_mX, TR_12_12_12),
+        (ROT_Y_mZ_X, TR_12_12_12),
+        (ROT_mY_Z_X, TR_12_12_12),
+        (ROT_Y_Z_mX, TR_12_12_12)])
 
 sg205 = SpaceGroup(
     number=205,
@@ -4796,31 +4794,31 @@ sg205 = SpaceGroup(
     point_group_name="PGm3bar",
     crystal_system=CUBIC,
     pdb_name="P 21/a -3",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_12_0_12),
-        SymOp(ROT_mX_Y_mZ, TR_0_12_12),
-        SymOp(ROT_X_mY_mZ, TR_12_12_0),
-        SymOp(ROT_Z_X_Y, TR_0_0_0),
-        SymOp(ROT_Z_mX_mY, TR_12_12_0),
-        SymOp(ROT_mZ_mX_Y, TR_12_0_12),
-        SymOp(ROT_mZ_X_mY, TR_0_12_12),
-        SymOp(ROT_Y_Z_X, TR_0_0_0),
-        SymOp(ROT_mY_Z_mX, TR_0_12_12),
-        SymOp(ROT_Y_mZ_mX, TR_12_12_0),
-        SymOp(ROT_mY_mZ_X, TR_12_0_12),
-        SymOp(ROT_mX_mY_mZ, TR_0_0_0),
-        SymOp(ROT_X_Y_mZ, TR_12_0_12),
-        SymOp(ROT_X_mY_Z, TR_0_12_12),
-        SymOp(ROT_mX_Y_Z, TR_12_12_0),
-        SymOp(ROT_mZ_mX_mY, TR_0_0_0),
-        SymOp(ROT_mZ_X_Y, TR_12_12_0),
-        SymOp(ROT_Z_X_mY, TR_12_0_12),
-        SymOp(ROT_Z_mX_Y, TR_0_12_12),
-        SymOp(ROT_mY_mZ_mX, TR_0_0_0),
-        SymOp(ROT_Y_mZ_X, TR_0_12_12),
-        SymOp(ROT_mY_Z_X, TR_12_12_0),
-        SymOp(ROT_Y_Z_mX, TR_12_0_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_12_0_12),
+        (ROT_mX_Y_mZ, TR_0_12_12),
+        (ROT_X_mY_mZ, TR_12_12_0),
+        (ROT_Z_X_Y, TR_0_0_0),
+        (ROT_Z_mX_mY, TR_12_12_0),
+        (ROT_mZ_mX_Y, TR_12_0_12),
+        (ROT_mZ_X_mY, TR_0_12_12),
+        (ROT_Y_Z_X, TR_0_0_0),
+        (ROT_mY_Z_mX, TR_0_12_12),
+        (ROT_Y_mZ_mX, TR_12_12_0),
+        (ROT_mY_mZ_X, TR_12_0_12),
+        (ROT_mX_mY_mZ, TR_0_0_0),
+        (ROT_X_Y_mZ, TR_12_0_12),
+        (ROT_X_mY_Z, TR_0_12_12),
+        (ROT_mX_Y_Z, TR_12_12_0),
+        (ROT_mZ_mX_mY, TR_0_0_0),
+        (ROT_mZ_X_Y, TR_12_12_0),
+        (ROT_Z_X_mY, TR_12_0_12),
+        (ROT_Z_mX_Y, TR_0_12_12),
+        (ROT_mY_mZ_mX, TR_0_0_0),
+        (ROT_Y_mZ_X, TR_0_12_12),
+        (ROT_mY_Z_X, TR_12_12_0),
+        (ROT_Y_Z_mX, TR_12_0_12)])
 
 sg206 = SpaceGroup(
     number=206,
@@ -4830,55 +4828,55 @@ sg206 = SpaceGroup(
     point_group_name="PGm3bar",
     crystal_system=CUBIC,
     pdb_name="I 21/a -3",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_12_0_12),
-        SymOp(ROT_mX_Y_mZ, TR_0_12_12),
-        SymOp(ROT_X_mY_mZ, TR_12_12_0),
-        SymOp(ROT_Z_X_Y, TR_0_0_0),
-        SymOp(ROT_Z_mX_mY, TR_12_12_0),
-        SymOp(ROT_mZ_mX_Y, TR_12_0_12),
-        SymOp(ROT_mZ_X_mY, TR_0_12_12),
-        SymOp(ROT_Y_Z_X, TR_0_0_0),
-        SymOp(ROT_mY_Z_mX, TR_0_12_12),
-        SymOp(ROT_Y_mZ_mX, TR_12_12_0),
-        SymOp(ROT_mY_mZ_X, TR_12_0_12),
-        SymOp(ROT_mX_mY_mZ, TR_0_0_0),
-        SymOp(ROT_X_Y_mZ, TR_12_0_12),
-        SymOp(ROT_X_mY_Z, TR_0_12_12),
-        SymOp(ROT_mX_Y_Z, TR_12_12_0),
-        SymOp(ROT_mZ_mX_mY, TR_0_0_0),
-        SymOp(ROT_mZ_X_Y, TR_12_12_0),
-        SymOp(ROT_Z_X_mY, TR_12_0_12),
-        SymOp(ROT_Z_mX_Y, TR_0_12_12),
-        SymOp(ROT_mY_mZ_mX, TR_0_0_0),
-        SymOp(ROT_Y_mZ_X, TR_0_12_12),
-        SymOp(ROT_mY_Z_X, TR_12_12_0),
-        SymOp(ROT_Y_Z_mX, TR_12_0_12),
-        SymOp(ROT_X_Y_Z, TR_12_12_12),
-        SymOp(ROT_mX_mY_Z, TR_0_12_0),
-        SymOp(ROT_mX_Y_mZ, TR_12_0_0),
-        SymOp(ROT_X_mY_mZ, TR_0_0_12),
-        SymOp(ROT_Z_X_Y, TR_12_12_12),
-        SymOp(ROT_Z_mX_mY, TR_0_0_12),
-        SymOp(ROT_mZ_mX_Y, TR_0_12_0),
-        SymOp(ROT_mZ_X_mY, TR_12_0_0),
-        SymOp(ROT_Y_Z_X, TR_12_12_12),
-        SymOp(ROT_mY_Z_mX, TR_12_0_0),
-        SymOp(ROT_Y_mZ_mX, TR_0_0_12),
-        SymOp(ROT_mY_mZ_X, TR_0_12_0),
-        SymOp(ROT_mX_mY_mZ, TR_12_12_12),
-        SymOp(ROT_X_Y_mZ, TR_0_12_0),
-        SymOp(ROT_X_mY_Z, TR_12_0_0),
-        SymOp(ROT_mX_Y_Z, TR_0_0_12),
-        SymOp(ROT_mZ_mX_mY, TR_12_12_12),
-        SymOp(ROT_mZ_X_Y, TR_0_0_12),
-        SymOp(ROT_Z_X_mY, TR_0_12_0),
-        SymOp(ROT_Z_mX_Y, TR_12_0_0),
-        SymOp(ROT_mY_mZ_mX, TR_12_12_12),
-        SymOp(ROT_Y_mZ_X, TR_12_0_0),
-        SymOp(ROT_mY_Z_X, TR_0_0_12),
-        SymOp(ROT_Y_Z_mX, TR_0_12_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_12_0_12),
+        (ROT_mX_Y_mZ, TR_0_12_12),
+        (ROT_X_mY_mZ, TR_12_12_0),
+        (ROT_Z_X_Y, TR_0_0_0),
+        (ROT_Z_mX_mY, TR_12_12_0),
+        (ROT_mZ_mX_Y, TR_12_0_12),
+        (ROT_mZ_X_mY, TR_0_12_12),
+        (ROT_Y_Z_X, TR_0_0_0),
+        (ROT_mY_Z_mX, TR_0_12_12),
+        (ROT_Y_mZ_mX, TR_12_12_0),
+        (ROT_mY_mZ_X, TR_12_0_12),
+        (ROT_mX_mY_mZ, TR_0_0_0),
+        (ROT_X_Y_mZ, TR_12_0_12),
+        (ROT_X_mY_Z, TR_0_12_12),
+        (ROT_mX_Y_Z, TR_12_12_0),
+        (ROT_mZ_mX_mY, TR_0_0_0),
+        (ROT_mZ_X_Y, TR_12_12_0),
+        (ROT_Z_X_mY, TR_12_0_12),
+        (ROT_Z_mX_Y, TR_0_12_12),
+        (ROT_mY_mZ_mX, TR_0_0_0),
+        (ROT_Y_mZ_X, TR_0_12_12),
+        (ROT_mY_Z_X, TR_12_12_0),
+        (ROT_Y_Z_mX, TR_12_0_12),
+        (ROT_X_Y_Z, TR_12_12_12),
+        (ROT_mX_mY_Z, TR_0_12_0),
+        (ROT_mX_Y_mZ, TR_12_0_0),
+        (ROT_X_mY_mZ, TR_0_0_12),
+        (ROT_Z_X_Y, TR_12_12_12),
+        (ROT_Z_mX_mY, TR_0_0_12),
+        (ROT_mZ_mX_Y, TR_0_12_0),
+        (ROT_mZ_X_mY, TR_12_0_0),
+        (ROT_Y_Z_X, TR_12_12_12),
+        (ROT_mY_Z_mX, TR_12_0_0),
+        (ROT_Y_mZ_mX, TR_0_0_12),
+        (ROT_mY_mZ_X, TR_0_12_0),
+        (ROT_mX_mY_mZ, TR_12_12_12),
+        (ROT_X_Y_mZ, TR_0_12_0),
+        (ROT_X_mY_Z, TR_12_0_0),
+        (ROT_mX_Y_Z, TR_0_0_12),
+        (ROT_mZ_mX_mY, TR_12_12_12),
+        (ROT_mZ_X_Y, TR_0_0_12),
+        (ROT_Z_X_mY, TR_0_12_0),
+        (ROT_Z_mX_Y, TR_12_0_0),
+        (ROT_mY_mZ_mX, TR_12_12_12),
+        (ROT_Y_mZ_X, TR_12_0_0),
+        (ROT_mY_Z_X, TR_0_0_12),
+        (ROT_Y_Z_mX, TR_0_12_0)])
 
 sg207 = SpaceGroup(
     number=207,
@@ -4888,31 +4886,31 @@ sg207 = SpaceGroup(
     point_group_name="PG432",
     crystal_system=CUBIC,
     pdb_name="P 4 3 2",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mX_Y_mZ, TR_0_0_0),
-        SymOp(ROT_X_mY_mZ, TR_0_0_0),
-        SymOp(ROT_Z_X_Y, TR_0_0_0),
-        SymOp(ROT_Z_mX_mY, TR_0_0_0),
-        SymOp(ROT_mZ_mX_Y, TR_0_0_0),
-        SymOp(ROT_mZ_X_mY, TR_0_0_0),
-        SymOp(ROT_Y_Z_X, TR_0_0_0),
-        SymOp(ROT_mY_Z_mX, TR_0_0_0),
-        SymOp(ROT_Y_mZ_mX, TR_0_0_0),
-        SymOp(ROT_mY_mZ_X, TR_0_0_0),
-        SymOp(ROT_Y_X_mZ, TR_0_0_0),
-        SymOp(ROT_mY_mX_mZ, TR_0_0_0),
-        SymOp(ROT_Y_mX_Z, TR_0_0_0),
-        SymOp(ROT_mY_X_Z, TR_0_0_0),
-        SymOp(ROT_X_Z_mY, TR_0_0_0),
-        SymOp(ROT_mX_Z_Y, TR_0_0_0),
-        SymOp(ROT_mX_mZ_mY, TR_0_0_0),
-        SymOp(ROT_X_mZ_Y, TR_0_0_0),
-        SymOp(ROT_Z_Y_mX, TR_0_0_0),
-        SymOp(ROT_Z_mY_X, TR_0_0_0),
-        SymOp(ROT_mZ_Y_X, TR_0_0_0),
-        SymOp(ROT_mZ_mY_mX, TR_0_0_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mX_Y_mZ, TR_0_0_0),
+        (ROT_X_mY_mZ, TR_0_0_0),
+        (ROT_Z_X_Y, TR_0_0_0),
+        (ROT_Z_mX_mY, TR_0_0_0),
+        (ROT_mZ_mX_Y, TR_0_0_0),
+        (ROT_mZ_X_mY, TR_0_0_0),
+        (ROT_Y_Z_X, TR_0_0_0),
+        (ROT_mY_Z_mX, TR_0_0_0),
+        (ROT_Y_mZ_mX, TR_0_0_0),
+        (ROT_mY_mZ_X, TR_0_0_0),
+        (ROT_Y_X_mZ, TR_0_0_0),
+        (ROT_mY_mX_mZ, TR_0_0_0),
+        (ROT_Y_mX_Z, TR_0_0_0),
+        (ROT_mY_X_Z, TR_0_0_0),
+        (ROT_X_Z_mY, TR_0_0_0),
+        (ROT_mX_Z_Y, TR_0_0_0),
+        (ROT_mX_mZ_mY, TR_0_0_0),
+        (ROT_X_mZ_Y, TR_0_0_0),
+        (ROT_Z_Y_mX, TR_0_0_0),
+        (ROT_Z_mY_X, TR_0_0_0),
+        (ROT_mZ_Y_X, TR_0_0_0),
+        (ROT_mZ_mY_mX, TR_0_0_0)])
 
 sg208 = SpaceGroup(
     number=208,
@@ -4922,31 +4920,31 @@ sg208 = SpaceGroup(
     point_group_name="PG432",
     crystal_system=CUBIC,
     pdb_name="P 42 3 2",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mX_Y_mZ, TR_0_0_0),
-        SymOp(ROT_X_mY_mZ, TR_0_0_0),
-        SymOp(ROT_Z_X_Y, TR_0_0_0),
-        SymOp(ROT_Z_mX_mY, TR_0_0_0),
-        SymOp(ROT_mZ_mX_Y, TR_0_0_0),
-        SymOp(ROT_mZ_X_mY, TR_0_0_0),
-        SymOp(ROT_Y_Z_X, TR_0_0_0),
-        SymOp(ROT_mY_Z_mX, TR_0_0_0),
-        SymOp(ROT_Y_mZ_mX, TR_0_0_0),
-        SymOp(ROT_mY_mZ_X, TR_0_0_0),
-        SymOp(ROT_Y_X_mZ, TR_12_12_12),
-        SymOp(ROT_mY_mX_mZ, TR_12_12_12),
-        SymOp(ROT_Y_mX_Z, TR_12_12_12),
-        SymOp(ROT_mY_X_Z, TR_12_12_12),
-        SymOp(ROT_X_Z_mY, TR_12_12_12),
-        SymOp(ROT_mX_Z_Y, TR_12_12_12),
-        SymOp(ROT_mX_mZ_mY, TR_12_12_12),
-        SymOp(ROT_X_mZ_Y, TR_12_12_12),
-        SymOp(ROT_Z_Y_mX, TR_12_12_12),
-        SymOp(ROT_Z_mY_X, TR_12_12_12),
-        SymOp(ROT_mZ_Y_X, TR_12_12_12),
-        SymOp(ROT_mZ_mY_mX, TR_12_12_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mX_Y_mZ, TR_0_0_0),
+        (ROT_X_mY_mZ, TR_0_0_0),
+        (ROT_Z_X_Y, TR_0_0_0),
+        (ROT_Z_mX_mY, TR_0_0_0),
+        (ROT_mZ_mX_Y, TR_0_0_0),
+        (ROT_mZ_X_mY, TR_0_0_0),
+        (ROT_Y_Z_X, TR_0_0_0),
+        (ROT_mY_Z_mX, TR_0_0_0),
+        (ROT_Y_mZ_mX, TR_0_0_0),
+        (ROT_mY_mZ_X, TR_0_0_0),
+        (ROT_Y_X_mZ, TR_12_12_12),
+        (ROT_mY_mX_mZ, TR_12_12_12),
+        (ROT_Y_mX_Z, TR_12_12_12),
+        (ROT_mY_X_Z, TR_12_12_12),
+        (ROT_X_Z_mY, TR_12_12_12),
+        (ROT_mX_Z_Y, TR_12_12_12),
+        (ROT_mX_mZ_mY, TR_12_12_12),
+        (ROT_X_mZ_Y, TR_12_12_12),
+        (ROT_Z_Y_mX, TR_12_12_12),
+        (ROT_Z_mY_X, TR_12_12_12),
+        (ROT_mZ_Y_X, TR_12_12_12),
+        (ROT_mZ_mY_mX, TR_12_12_12)])
 
 sg209 = SpaceGroup(
     number=209,
@@ -4956,103 +4954,103 @@ sg209 = SpaceGroup(
     point_group_name="PG432",
     crystal_system=CUBIC,
     pdb_name="F 4 3 2",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mX_Y_mZ, TR_0_0_0),
-        SymOp(ROT_X_mY_mZ, TR_0_0_0),
-        SymOp(ROT_Z_X_Y, TR_0_0_0),
-        SymOp(ROT_Z_mX_mY, TR_0_0_0),
-        SymOp(ROT_mZ_mX_Y, TR_0_0_0),
-        SymOp(ROT_mZ_X_mY, TR_0_0_0),
-        SymOp(ROT_Y_Z_X, TR_0_0_0),
-        SymOp(ROT_mY_Z_mX, TR_0_0_0),
-        SymOp(ROT_Y_mZ_mX, TR_0_0_0),
-        SymOp(ROT_mY_mZ_X, TR_0_0_0),
-        SymOp(ROT_Y_X_mZ, TR_0_0_0),
-        SymOp(ROT_mY_mX_mZ, TR_0_0_0),
-        SymOp(ROT_Y_mX_Z, TR_0_0_0),
-        SymOp(ROT_mY_X_Z, TR_0_0_0),
-        SymOp(ROT_X_Z_mY, TR_0_0_0),
-        SymOp(ROT_mX_Z_Y, TR_0_0_0),
-        SymOp(ROT_mX_mZ_mY, TR_0_0_0),
-        SymOp(ROT_X_mZ_Y, TR_0_0_0),
-        SymOp(ROT_Z_Y_mX, TR_0_0_0),
-        SymOp(ROT_Z_mY_X, TR_0_0_0),
-        SymOp(ROT_mZ_Y_X, TR_0_0_0),
-        SymOp(ROT_mZ_mY_mX, TR_0_0_0),
-        SymOp(ROT_X_Y_Z, TR_0_12_12),
-        SymOp(ROT_mX_mY_Z, TR_0_12_12),
-        SymOp(ROT_mX_Y_mZ, TR_0_12_12),
-        SymOp(ROT_X_mY_mZ, TR_0_12_12),
-        SymOp(ROT_Z_X_Y, TR_0_12_12),
-        SymOp(ROT_Z_mX_mY, TR_0_12_12),
-        SymOp(ROT_mZ_mX_Y, TR_0_12_12),
-        SymOp(ROT_mZ_X_mY, TR_0_12_12),
-        SymOp(ROT_Y_Z_X, TR_0_12_12),
-        SymOp(ROT_mY_Z_mX, TR_0_12_12),
-        SymOp(ROT_Y_mZ_mX, TR_0_12_12),
-        SymOp(ROT_mY_mZ_X, TR_0_12_12),
-        SymOp(ROT_Y_X_mZ, TR_0_12_12),
-        SymOp(ROT_mY_mX_mZ, TR_0_12_12),
-        SymOp(ROT_Y_mX_Z, TR_0_12_12),
-        SymOp(ROT_mY_X_Z, TR_0_12_12),
-        SymOp(ROT_X_Z_mY, TR_0_12_12),
-        SymOp(ROT_mX_Z_Y, TR_0_12_12),
-        SymOp(ROT_mX_mZ_mY, TR_0_12_12),
-        SymOp(ROT_X_mZ_Y, TR_0_12_12),
-        SymOp(ROT_Z_Y_mX, TR_0_12_12),
-        SymOp(ROT_Z_mY_X, TR_0_12_12),
-        SymOp(ROT_mZ_Y_X, TR_0_12_12),
-        SymOp(ROT_mZ_mY_mX, TR_0_12_12),
-        SymOp(ROT_X_Y_Z, TR_12_0_12),
-        SymOp(ROT_mX_mY_Z, TR_12_0_12),
-        SymOp(ROT_mX_Y_mZ, TR_12_0_12),
-        SymOp(ROT_X_mY_mZ, TR_12_0_12),
-        SymOp(ROT_Z_X_Y, TR_12_0_12),
-        SymOp(ROT_Z_mX_mY, TR_12_0_12),
-        SymOp(ROT_mZ_mX_Y, TR_12_0_12),
-        SymOp(ROT_mZ_X_mY, TR_12_0_12),
-        SymOp(ROT_Y_Z_X, TR_12_0_12),
-        SymOp(ROT_mY_Z_mX, TR_12_0_12),
-        SymOp(ROT_Y_mZ_mX, TR_12_0_12),
-        SymOp(ROT_mY_mZ_X, TR_12_0_12),
-        SymOp(ROT_Y_X_mZ, TR_12_0_12),
-        SymOp(ROT_mY_mX_mZ, TR_12_0_12),
-        SymOp(ROT_Y_mX_Z, TR_12_0_12),
-        SymOp(ROT_mY_X_Z, TR_12_0_12),
-        SymOp(ROT_X_Z_mY, TR_12_0_12),
-        SymOp(ROT_mX_Z_Y, TR_12_0_12),
-        SymOp(ROT_mX_mZ_mY, TR_12_0_12),
-        SymOp(ROT_X_mZ_Y, TR_12_0_12),
-        SymOp(ROT_Z_Y_mX, TR_12_0_12),
-        SymOp(ROT_Z_mY_X, TR_12_0_12),
-        SymOp(ROT_mZ_Y_X, TR_12_0_12),
-        SymOp(ROT_mZ_mY_mX, TR_12_0_12),
-        SymOp(ROT_X_Y_Z, TR_12_12_0),
-        SymOp(ROT_mX_mY_Z, TR_12_12_0),
-        SymOp(ROT_mX_Y_mZ, TR_12_12_0),
-        SymOp(ROT_X_mY_mZ, TR_12_12_0),
-        SymOp(ROT_Z_X_Y, TR_12_12_0),
-        SymOp(ROT_Z_mX_mY, TR_12_12_0),
-        SymOp(ROT_mZ_mX_Y, TR_12_12_0),
-        SymOp(ROT_mZ_X_mY, TR_12_12_0),
-        SymOp(ROT_Y_Z_X, TR_12_12_0),
-        SymOp(ROT_mY_Z_mX, TR_12_12_0),
-        SymOp(ROT_Y_mZ_mX, TR_12_12_0),
-        SymOp(ROT_mY_mZ_X, TR_12_12_0),
-        SymOp(ROT_Y_X_mZ, TR_12_12_0),
-        SymOp(ROT_mY_mX_mZ, TR_12_12_0),
-        SymOp(ROT_Y_mX_Z, TR_12_12_0),
-        SymOp(ROT_mY_X_Z, TR_12_12_0),
-        SymOp(ROT_X_Z_mY, TR_12_12_0),
-        SymOp(ROT_mX_Z_Y, TR_12_12_0),
-        SymOp(ROT_mX_mZ_mY, TR_12_12_0),
-        SymOp(ROT_X_mZ_Y, TR_12_12_0),
-        SymOp(ROT_Z_Y_mX, TR_12_12_0),
-        SymOp(ROT_Z_mY_X, TR_12_12_0),
-        SymOp(ROT_mZ_Y_X, TR_12_12_0),
-        SymOp(ROT_mZ_mY_mX, TR_12_12_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mX_Y_mZ, TR_0_0_0),
+        (ROT_X_mY_mZ, TR_0_0_0),
+        (ROT_Z_X_Y, TR_0_0_0),
+        (ROT_Z_mX_mY, TR_0_0_0),
+        (ROT_mZ_mX_Y, TR_0_0_0),
+        (ROT_mZ_X_mY, TR_0_0_0),
+        (ROT_Y_Z_X, TR_0_0_0),
+        (ROT_mY_Z_mX, TR_0_0_0),
+        (ROT_Y_mZ_mX, TR_0_0_0),
+        (ROT_mY_mZ_X, TR_0_0_0),
+        (ROT_Y_X_mZ, TR_0_0_0),
+        (ROT_mY_mX_mZ, TR_0_0_0),
+        (ROT_Y_mX_Z, TR_0_0_0),
+        (ROT_mY_X_Z, TR_0_0_0),
+        (ROT_X_Z_mY, TR_0_0_0),
+        (ROT_mX_Z_Y, TR_0_0_0),
+        (ROT_mX_mZ_mY, TR_0_0_0),
+        (ROT_X_mZ_Y, TR_0_0_0),
+        (ROT_Z_Y_mX, TR_0_0_0),
+        (ROT_Z_mY_X, TR_0_0_0),
+        (ROT_mZ_Y_X, TR_0_0_0),
+        (ROT_mZ_mY_mX, TR_0_0_0),
+        (ROT_X_Y_Z, TR_0_12_12),
+        (ROT_mX_mY_Z, TR_0_12_12),
+        (ROT_mX_Y_mZ, TR_0_12_12),
+        (ROT_X_mY_mZ, TR_0_12_12),
+        (ROT_Z_X_Y, TR_0_12_12),
+        (ROT_Z_mX_mY, TR_0_12_12),
+        (ROT_mZ_mX_Y, TR_0_12_12),
+        (ROT_mZ_X_mY, TR_0_12_12),
+        (ROT_Y_Z_X, TR_0_12_12),
+        (ROT_mY_Z_mX, TR_0_12_12),
+        (ROT_Y_mZ_mX, TR_0_12_12),
+        (ROT_mY_mZ_X, TR_0_12_12),
+        (ROT_Y_X_mZ, TR_0_12_12),
+        (ROT_mY_mX_mZ, TR_0_12_12),
+        (ROT_Y_mX_Z, TR_0_12_12),
+        (ROT_mY_X_Z, TR_0_12_12),
+        (ROT_X_Z_mY, TR_0_12_12),
+        (ROT_mX_Z_Y, TR_0_12_12),
+        (ROT_mX_mZ_mY, TR_0_12_12),
+        (ROT_X_mZ_Y, TR_0_12_12),
+        (ROT_Z_Y_mX, TR_0_12_12),
+        (ROT_Z_mY_X, TR_0_12_12),
+        (ROT_mZ_Y_X, TR_0_12_12),
+        (ROT_mZ_mY_mX, TR_0_12_12),
+        (ROT_X_Y_Z, TR_12_0_12),
+        (ROT_mX_mY_Z, TR_12_0_12),
+        (ROT_mX_Y_mZ, TR_12_0_12),
+        (ROT_X_mY_mZ, TR_12_0_12),
+        (ROT_Z_X_Y, TR_12_0_12),
+        (ROT_Z_mX_mY, TR_12_0_12),
+        (ROT_mZ_mX_Y, TR_12_0_12),
+        (ROT_mZ_X_mY, TR_12_0_12),
+        (ROT_Y_Z_X, TR_12_0_12),
+        (ROT_mY_Z_mX, TR_12_0_12),
+        (ROT_Y_mZ_mX, TR_12_0_12),
+        (ROT_mY_mZ_X, TR_12_0_12),
+        (ROT_Y_X_mZ, TR_12_0_12),
+        (ROT_mY_mX_mZ, TR_12_0_12),
+        (ROT_Y_mX_Z, TR_12_0_12),
+        (ROT_mY_X_Z, TR_12_0_12),
+        (ROT_X_Z_mY, TR_12_0_12),
+        (ROT_mX_Z_Y, TR_12_0_12),
+        (ROT_mX_mZ_mY, TR_12_0_12),
+        (ROT_X_mZ_Y, TR_12_0_12),
+        (ROT_Z_Y_mX, TR_12_0_12),
+        (ROT_Z_mY_X, TR_12_0_12),
+        (ROT_mZ_Y_X, TR_12_0_12),
+        (ROT_mZ_mY_mX, TR_12_0_12),
+        (ROT_X_Y_Z, TR_12_12_0),
+        (ROT_mX_mY_Z, TR_12_12_0),
+        (ROT_mX_Y_mZ, TR_12_12_0),
+        (ROT_X_mY_mZ, TR_12_12_0),
+        (ROT_Z_X_Y, TR_12_12_0),
+        (ROT_Z_mX_mY, TR_12_12_0),
+        (ROT_mZ_mX_Y, TR_12_12_0),
+        (ROT_mZ_X_mY, TR_12_12_0),
+        (ROT_Y_Z_X, TR_12_12_0),
+        (ROT_mY_Z_mX, TR_12_12_0),
+        (ROT_Y_mZ_mX, TR_12_12_0),
+        (ROT_mY_mZ_X, TR_12_12_0),
+        (ROT_Y_X_mZ, TR_12_12_0),
+        (ROT_mY_mX_mZ, TR_12_12_0),
+        (ROT_Y_mX_Z, TR_12_12_0),
+        (ROT_mY_X_Z, TR_12_12_0),
+        (ROT_X_Z_mY, TR_12_12_0),
+        (ROT_mX_Z_Y, TR_12_12_0),
+        (ROT_mX_mZ_mY, TR_12_12_0),
+        (ROT_X_mZ_Y, TR_12_12_0),
+        (ROT_Z_Y_mX, TR_12_12_0),
+        (ROT_Z_mY_X, TR_12_12_0),
+        (ROT_mZ_Y_X, TR_12_12_0),
+        (ROT_mZ_mY_mX, TR_12_12_0)])
 
 sg210 = SpaceGroup(
     number=210,
@@ -5062,103 +5060,103 @@ sg210 = SpaceGroup(
     point_group_name="PG432",
     crystal_system=CUBIC,
     pdb_name="F 41 3 2",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_12_12),
-        SymOp(ROT_mX_Y_mZ, TR_12_12_0),
-        SymOp(ROT_X_mY_mZ, TR_12_0_12),
-        SymOp(ROT_Z_X_Y, TR_0_0_0),
-        SymOp(ROT_Z_mX_mY, TR_12_0_12),
-        SymOp(ROT_mZ_mX_Y, TR_0_12_12),
-        SymOp(ROT_mZ_X_mY, TR_12_12_0),
-        SymOp(ROT_Y_Z_X, TR_0_0_0),
-        SymOp(ROT_mY_Z_mX, TR_12_12_0),
-        SymOp(ROT_Y_mZ_mX, TR_12_0_12),
-        SymOp(ROT_mY_mZ_X, TR_0_12_12),
-        SymOp(ROT_Y_X_mZ, TR_34_14_34),
-        SymOp(ROT_mY_mX_mZ, TR_14_14_14),
-        SymOp(ROT_Y_mX_Z, TR_14_34_34),
-        SymOp(ROT_mY_X_Z, TR_34_34_14),
-        SymOp(ROT_X_Z_mY, TR_34_14_34),
-        SymOp(ROT_mX_Z_Y, TR_34_34_14),
-        SymOp(ROT_mX_mZ_mY, TR_14_14_14),
-        SymOp(ROT_X_mZ_Y, TR_14_34_34),
-        SymOp(ROT_Z_Y_mX, TR_34_14_34),
-        SymOp(ROT_Z_mY_X, TR_14_34_34),
-        SymOp(ROT_mZ_Y_X, TR_34_34_14),
-        SymOp(ROT_mZ_mY_mX, TR_14_14_14),
-        SymOp(ROT_X_Y_Z, TR_0_12_12),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mX_Y_mZ, TR_12_0_12),
-        SymOp(ROT_X_mY_mZ, TR_12_12_0),
-        SymOp(ROT_Z_X_Y, TR_0_12_12),
-        SymOp(ROT_Z_mX_mY, TR_12_12_0),
-        SymOp(ROT_mZ_mX_Y, TR_0_0_0),
-        SymOp(ROT_mZ_X_mY, TR_12_0_12),
-        SymOp(ROT_Y_Z_X, TR_0_12_12),
-        SymOp(ROT_mY_Z_mX, TR_12_0_12),
-        SymOp(ROT_Y_mZ_mX, TR_12_12_0),
-        SymOp(ROT_mY_mZ_X, TR_0_0_0),
-        SymOp(ROT_Y_X_mZ, TR_34_34_14),
-        SymOp(ROT_mY_mX_mZ, TR_14_34_34),
-        SymOp(ROT_Y_mX_Z, TR_14_14_14),
-        SymOp(ROT_mY_X_Z, TR_34_14_34),
-        SymOp(ROT_X_Z_mY, TR_34_34_14),
-        SymOp(ROT_mX_Z_Y, TR_34_14_34),
-        SymOp(ROT_mX_mZ_mY, TR_14_34_34),
-        SymOp(ROT_X_mZ_Y, TR_14_14_14),
-        SymOp(ROT_Z_Y_mX, TR_34_34_14),
-        SymOp(ROT_Z_mY_X, TR_14_14_14),
-        SymOp(ROT_mZ_Y_X, TR_34_14_34),
-        SymOp(ROT_mZ_mY_mX, TR_14_34_34),
-        SymOp(ROT_X_Y_Z, TR_12_0_12),
-        SymOp(ROT_mX_mY_Z, TR_12_12_0),
-        SymOp(ROT_mX_Y_mZ, TR_0_12_12),
-        SymOp(ROT_X_mY_mZ, TR_0_0_0),
-        SymOp(ROT_Z_X_Y, TR_12_0_12),
-        SymOp(ROT_Z_mX_mY, TR_0_0_0),
-        SymOp(ROT_mZ_mX_Y, TR_12_12_0),
-        SymOp(ROT_mZ_X_mY, TR_0_12_12),
-        SymOp(ROT_Y_Z_X, TR_12_0_12),
-        SymOp(ROT_mY_Z_mX, TR_0_12_12),
-        SymOp(ROT_Y_mZ_mX, TR_0_0_0),
-        SymOp(ROT_mY_mZ_X, TR_12_12_0),
-        SymOp(ROT_Y_X_mZ, TR_14_14_14),
-        SymOp(ROT_mY_mX_mZ, TR_34_14_34),
-        SymOp(ROT_Y_mX_Z, TR_34_34_14),
-        SymOp(ROT_mY_X_Z, TR_14_34_34),
-        SymOp(ROT_X_Z_mY, TR_14_14_14),
-        SymOp(ROT_mX_Z_Y, TR_14_34_34),
-        SymOp(ROT_mX_mZ_mY, TR_34_14_34),
-        SymOp(ROT_X_mZ_Y, TR_34_34_14),
-        SymOp(ROT_Z_Y_mX, TR_14_14_14),
-        SymOp(ROT_Z_mY_X, TR_34_34_14),
-        SymOp(ROT_mZ_Y_X, TR_14_34_34),
-        SymOp(ROT_mZ_mY_mX, TR_34_14_34),
-        SymOp(ROT_X_Y_Z, TR_12_12_0),
-        SymOp(ROT_mX_mY_Z, TR_12_0_12),
-        SymOp(ROT_mX_Y_mZ, TR_0_0_0),
-        SymOp(ROT_X_mY_mZ, TR_0_12_12),
-        SymOp(ROT_Z_X_Y, TR_12_12_0),
-        SymOp(ROT_Z_mX_mY, TR_0_12_12),
-        SymOp(ROT_mZ_mX_Y, TR_12_0_12),
-        SymOp(ROT_mZ_X_mY, TR_0_0_0),
-        SymOp(ROT_Y_Z_X, TR_12_12_0),
-        SymOp(ROT_mY_Z_mX, TR_0_0_0),
-        SymOp(ROT_Y_mZ_mX, TR_0_12_12),
-        SymOp(ROT_mY_mZ_X, TR_12_0_12),
-        SymOp(ROT_Y_X_mZ, TR_14_34_34),
-        SymOp(ROT_mY_mX_mZ, TR_34_34_14),
-        SymOp(ROT_Y_mX_Z, TR_34_14_34),
-        SymOp(ROT_mY_X_Z, TR_14_14_14),
-        SymOp(ROT_X_Z_mY, TR_14_34_34),
-        SymOp(ROT_mX_Z_Y, TR_14_14_14),
-        SymOp(ROT_mX_mZ_mY, TR_34_34_14),
-        SymOp(ROT_X_mZ_Y, TR_34_14_34),
-        SymOp(ROT_Z_Y_mX, TR_14_34_34),
-        SymOp(ROT_Z_mY_X, TR_34_14_34),
-        SymOp(ROT_mZ_Y_X, TR_14_14_14),
-        SymOp(ROT_mZ_mY_mX, TR_34_34_14)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_12_12),
+        (ROT_mX_Y_mZ, TR_12_12_0),
+        (ROT_X_mY_mZ, TR_12_0_12),
+        (ROT_Z_X_Y, TR_0_0_0),
+        (ROT_Z_mX_mY, TR_12_0_12),
+        (ROT_mZ_mX_Y, TR_0_12_12),
+        (ROT_mZ_X_mY, TR_12_12_0),
+        (ROT_Y_Z_X, TR_0_0_0),
+        (ROT_mY_Z_mX, TR_12_12_0),
+        (ROT_Y_mZ_mX, TR_12_0_12),
+        (ROT_mY_mZ_X, TR_0_12_12),
+        (ROT_Y_X_mZ, TR_34_14_34),
+        (ROT_mY_mX_mZ, TR_14_14_14),
+        (ROT_Y_mX_Z, TR_14_34_34),
+        (ROT_mY_X_Z, TR_34_34_14),
+        (ROT_X_Z_mY, TR_34_14_34),
+        (ROT_mX_Z_Y, TR_34_34_14),
+        (ROT_mX_mZ_mY, TR_14_14_14),
+        (ROT_X_mZ_Y, TR_14_34_34),
+        (ROT_Z_Y_mX, TR_34_14_34),
+        (ROT_Z_mY_X, TR_14_34_34),
+        (ROT_mZ_Y_X, TR_34_34_14),
+        (ROT_mZ_mY_mX, TR_14_14_14),
+        (ROT_X_Y_Z, TR_0_12_12),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mX_Y_mZ, TR_12_0_12),
+        (ROT_X_mY_mZ, TR_12_12_0),
+        (ROT_Z_X_Y, TR_0_12_12),
+        (ROT_Z_mX_mY, TR_12_12_0),
+        (ROT_mZ_mX_Y, TR_0_0_0),
+        (ROT_mZ_X_mY, TR_12_0_12),
+        (ROT_Y_Z_X, TR_0_12_12),
+        (ROT_mY_Z_mX, TR_12_0_12),
+        (ROT_Y_mZ_mX, TR_12_12_0),
+        (ROT_mY_mZ_X, TR_0_0_0),
+        (ROT_Y_X_mZ, TR_34_34_14),
+        (ROT_mY_mX_mZ, TR_14_34_34),
+        (ROT_Y_mX_Z, TR_14_14_14),
+        (ROT_mY_X_Z, TR_34_14_34),
+        (ROT_X_Z_mY, TR_34_34_14),
+        (ROT_mX_Z_Y, TR_34_14_34),
+        (ROT_mX_mZ_mY, TR_14_34_34),
+        (ROT_X_mZ_Y, TR_14_14_14),
+        (ROT_Z_Y_mX, TR_34_34_14),
+        (ROT_Z_mY_X, TR_14_14_14),
+        (ROT_mZ_Y_X, TR_34_14_34),
+        (ROT_mZ_mY_mX, TR_14_34_34),
+        (ROT_X_Y_Z, TR_12_0_12),
+        (ROT_mX_mY_Z, TR_12_12_0),
+        (ROT_mX_Y_mZ, TR_0_12_12),
+        (ROT_X_mY_mZ, TR_0_0_0),
+        (ROT_Z_X_Y, TR_12_0_12),
+        (ROT_Z_mX_mY, TR_0_0_0),
+        (ROT_mZ_mX_Y, TR_12_12_0),
+        (ROT_mZ_X_mY, TR_0_12_12),
+        (ROT_Y_Z_X, TR_12_0_12),
+        (ROT_mY_Z_mX, TR_0_12_12),
+        (ROT_Y_mZ_mX, TR_0_0_0),
+        (ROT_mY_mZ_X, TR_12_12_0),
+        (ROT_Y_X_mZ, TR_14_14_14),
+        (ROT_mY_mX_mZ, TR_34_14_34),
+        (ROT_Y_mX_Z, TR_34_34_14),
+        (ROT_mY_X_Z, TR_14_34_34),
+        (ROT_X_Z_mY, TR_14_14_14),
+        (ROT_mX_Z_Y, TR_14_34_34),
+        (ROT_mX_mZ_mY, TR_34_14_34),
+        (ROT_X_mZ_Y, TR_34_34_14),
+        (ROT_Z_Y_mX, TR_14_14_14),
+        (ROT_Z_mY_X, TR_34_34_14),
+        (ROT_mZ_Y_X, TR_14_34_34),
+        (ROT_mZ_mY_mX, TR_34_14_34),
+        (ROT_X_Y_Z, TR_12_12_0),
+        (ROT_mX_mY_Z, TR_12_0_12),
+        (ROT_mX_Y_mZ, TR_0_0_0),
+        (ROT_X_mY_mZ, TR_0_12_12),
+        (ROT_Z_X_Y, TR_12_12_0),
+        (ROT_Z_mX_mY, TR_0_12_12),
+        (ROT_mZ_mX_Y, TR_12_0_12),
+        (ROT_mZ_X_mY, TR_0_0_0),
+        (ROT_Y_Z_X, TR_12_12_0),
+        (ROT_mY_Z_mX, TR_0_0_0),
+        (ROT_Y_mZ_mX, TR_0_12_12),
+        (ROT_mY_mZ_X, TR_12_0_12),
+        (ROT_Y_X_mZ, TR_14_34_34),
+        (ROT_mY_mX_mZ, TR_34_34_14),
+        (ROT_Y_mX_Z, TR_34_14_34),
+        (ROT_mY_X_Z, TR_14_14_14),
+        (ROT_X_Z_mY, TR_14_34_34),
+        (ROT_mX_Z_Y, TR_14_14_14),
+        (ROT_mX_mZ_mY, TR_34_34_14),
+        (ROT_X_mZ_Y, TR_34_14_34),
+        (ROT_Z_Y_mX, TR_14_34_34),
+        (ROT_Z_mY_X, TR_34_14_34),
+        (ROT_mZ_Y_X, TR_14_14_14),
+        (ROT_mZ_mY_mX, TR_34_34_14)])
 
 sg211 = SpaceGroup(
     number=211,
@@ -5168,55 +5166,55 @@ sg211 = SpaceGroup(
     point_group_name="PG432",
     crystal_system=CUBIC,
     pdb_name="I 4 3 2",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mX_Y_mZ, TR_0_0_0),
-        SymOp(ROT_X_mY_mZ, TR_0_0_0),
-        SymOp(ROT_Z_X_Y, TR_0_0_0),
-        SymOp(ROT_Z_mX_mY, TR_0_0_0),
-        SymOp(ROT_mZ_mX_Y, TR_0_0_0),
-        SymOp(ROT_mZ_X_mY, TR_0_0_0),
-        SymOp(ROT_Y_Z_X, TR_0_0_0),
-        SymOp(ROT_mY_Z_mX, TR_0_0_0),
-        SymOp(ROT_Y_mZ_mX, TR_0_0_0),
-        SymOp(ROT_mY_mZ_X, TR_0_0_0),
-        SymOp(ROT_Y_X_mZ, TR_0_0_0),
-        SymOp(ROT_mY_mX_mZ, TR_0_0_0),
-        SymOp(ROT_Y_mX_Z, TR_0_0_0),
-        SymOp(ROT_mY_X_Z, TR_0_0_0),
-        SymOp(ROT_X_Z_mY, TR_0_0_0),
-        SymOp(ROT_mX_Z_Y, TR_0_0_0),
-        SymOp(ROT_mX_mZ_mY, TR_0_0_0),
-        SymOp(ROT_X_mZ_Y, TR_0_0_0),
-        SymOp(ROT_Z_Y_mX, TR_0_0_0),
-        SymOp(ROT_Z_mY_X, TR_0_0_0),
-        SymOp(ROT_mZ_Y_X, TR_0_0_0),
-        SymOp(ROT_mZ_mY_mX, TR_0_0_0),
-        SymOp(ROT_X_Y_Z, TR_12_12_12),
-        SymOp(ROT_mX_mY_Z, TR_12_12_12),
-        SymOp(ROT_mX_Y_mZ, TR_12_12_12),
-        SymOp(ROT_X_mY_mZ, TR_12_12_12),
-        SymOp(ROT_Z_X_Y, TR_12_12_12),
-        SymOp(ROT_Z_mX_mY, TR_12_12_12),
-        SymOp(ROT_mZ_mX_Y, TR_12_12_12),
-        SymOp(ROT_mZ_X_mY, TR_12_12_12),
-        SymOp(ROT_Y_Z_X, TR_12_12_12),
-        SymOp(ROT_mY_Z_mX, TR_12_12_12),
-        SymOp(ROT_Y_mZ_mX, TR_12_12_12),
-        SymOp(ROT_mY_mZ_X, TR_12_12_12),
-        SymOp(ROT_Y_X_mZ, TR_12_12_12),
-        SymOp(ROT_mY_mX_mZ, TR_12_12_12),
-        SymOp(ROT_Y_mX_Z, TR_12_12_12),
-        SymOp(ROT_mY_X_Z, TR_12_12_12),
-        SymOp(ROT_X_Z_mY, TR_12_12_12),
-        SymOp(ROT_mX_Z_Y, TR_12_12_12),
-        SymOp(ROT_mX_mZ_mY, TR_12_12_12),
-        SymOp(ROT_X_mZ_Y, TR_12_12_12),
-        SymOp(ROT_Z_Y_mX, TR_12_12_12),
-        SymOp(ROT_Z_mY_X, TR_12_12_12),
-        SymOp(ROT_mZ_Y_X, TR_12_12_12),
-        SymOp(ROT_mZ_mY_mX, TR_12_12_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mX_Y_mZ, TR_0_0_0),
+        (ROT_X_mY_mZ, TR_0_0_0),
+        (ROT_Z_X_Y, TR_0_0_0),
+        (ROT_Z_mX_mY, TR_0_0_0),
+        (ROT_mZ_mX_Y, TR_0_0_0),
+        (ROT_mZ_X_mY, TR_0_0_0),
+        (ROT_Y_Z_X, TR_0_0_0),
+        (ROT_mY_Z_mX, TR_0_0_0),
+        (ROT_Y_mZ_mX, TR_0_0_0),
+        (ROT_mY_mZ_X, TR_0_0_0),
+        (ROT_Y_X_mZ, TR_0_0_0),
+        (ROT_mY_mX_mZ, TR_0_0_0),
+        (ROT_Y_mX_Z, TR_0_0_0),
+        (ROT_mY_X_Z, TR_0_0_0),
+        (ROT_X_Z_mY, TR_0_0_0),
+        (ROT_mX_Z_Y, TR_0_0_0),
+        (ROT_mX_mZ_mY, TR_0_0_0),
+        (ROT_X_mZ_Y, TR_0_0_0),
+        (ROT_Z_Y_mX, TR_0_0_0),
+        (ROT_Z_mY_X, TR_0_0_0),
+        (ROT_mZ_Y_X, TR_0_0_0),
+        (ROT_mZ_mY_mX, TR_0_0_0),
+        (ROT_X_Y_Z, TR_12_12_12),
+        (ROT_mX_mY_Z, TR_12_12_12),
+        (ROT_mX_Y_mZ, TR_12_12_12),
+        (ROT_X_mY_mZ, TR_12_12_12),
+        (ROT_Z_X_Y, TR_12_12_12),
+        (ROT_Z_mX_mY, TR_12_12_12),
+        (ROT_mZ_mX_Y, TR_12_12_12),
+        (ROT_mZ_X_mY, TR_12_12_12),
+        (ROT_Y_Z_X, TR_12_12_12),
+        (ROT_mY_Z_mX, TR_12_12_12),
+        (ROT_Y_mZ_mX, TR_12_12_12),
+        (ROT_mY_mZ_X, TR_12_12_12),
+        (ROT_Y_X_mZ, TR_12_12_12),
+        (ROT_mY_mX_mZ, TR_12_12_12),
+        (ROT_Y_mX_Z, TR_12_12_12),
+        (ROT_mY_X_Z, TR_12_12_12),
+        (ROT_X_Z_mY, TR_12_12_12),
+        (ROT_mX_Z_Y, TR_12_12_12),
+        (ROT_mX_mZ_mY, TR_12_12_12),
+        (ROT_X_mZ_Y, TR_12_12_12),
+        (ROT_Z_Y_mX, TR_12_12_12),
+        (ROT_Z_mY_X, TR_12_12_12),
+        (ROT_mZ_Y_X, TR_12_12_12),
+        (ROT_mZ_mY_mX, TR_12_12_12)])
 
 sg212 = SpaceGroup(
     number=212,
@@ -5226,31 +5224,31 @@ sg212 = SpaceGroup(
     point_group_name="PG432",
     crystal_system=CUBIC,
     pdb_name="P 43 3 2",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_12_0_12),
-        SymOp(ROT_mX_Y_mZ, TR_0_12_12),
-        SymOp(ROT_X_mY_mZ, TR_12_12_0),
-        SymOp(ROT_Z_X_Y, TR_0_0_0),
-        SymOp(ROT_Z_mX_mY, TR_12_12_0),
-        SymOp(ROT_mZ_mX_Y, TR_12_0_12),
-        SymOp(ROT_mZ_X_mY, TR_0_12_12),
-        SymOp(ROT_Y_Z_X, TR_0_0_0),
-        SymOp(ROT_mY_Z_mX, TR_0_12_12),
-        SymOp(ROT_Y_mZ_mX, TR_12_12_0),
-        SymOp(ROT_mY_mZ_X, TR_12_0_12),
-        SymOp(ROT_Y_X_mZ, TR_14_34_34),
-        SymOp(ROT_mY_mX_mZ, TR_14_14_14),
-        SymOp(ROT_Y_mX_Z, TR_34_34_14),
-        SymOp(ROT_mY_X_Z, TR_34_14_34),
-        SymOp(ROT_X_Z_mY, TR_14_34_34),
-        SymOp(ROT_mX_Z_Y, TR_34_14_34),
-        SymOp(ROT_mX_mZ_mY, TR_14_14_14),
-        SymOp(ROT_X_mZ_Y, TR_34_34_14),
-        SymOp(ROT_Z_Y_mX, TR_14_34_34),
-        SymOp(ROT_Z_mY_X, TR_34_34_14),
-        SymOp(ROT_mZ_Y_X, TR_34_14_34),
-        SymOp(ROT_mZ_mY_mX, TR_14_14_14)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_12_0_12),
+        (ROT_mX_Y_mZ, TR_0_12_12),
+        (ROT_X_mY_mZ, TR_12_12_0),
+        (ROT_Z_X_Y, TR_0_0_0),
+        (ROT_Z_mX_mY, TR_12_12_0),
+        (ROT_mZ_mX_Y, TR_12_0_12),
+        (ROT_mZ_X_mY, TR_0_12_12),
+        (ROT_Y_Z_X, TR_0_0_0),
+        (ROT_mY_Z_mX, TR_0_12_12),
+        (ROT_Y_mZ_mX, TR_12_12_0),
+        (ROT_mY_mZ_X, TR_12_0_12),
+        (ROT_Y_X_mZ, TR_14_34_34),
+        (ROT_mY_mX_mZ, TR_14_14_14),
+        (ROT_Y_mX_Z, TR_34_34_14),
+        (ROT_mY_X_Z, TR_34_14_34),
+        (ROT_X_Z_mY, TR_14_34_34),
+        (ROT_mX_Z_Y, TR_34_14_34),
+        (ROT_mX_mZ_mY, TR_14_14_14),
+        (ROT_X_mZ_Y, TR_34_34_14),
+        (ROT_Z_Y_mX, TR_14_34_34),
+        (ROT_Z_mY_X, TR_34_34_14),
+        (ROT_mZ_Y_X, TR_34_14_34),
+        (ROT_mZ_mY_mX, TR_14_14_14)])
 
 sg213 = SpaceGroup(
     number=213,
@@ -5260,31 +5258,31 @@ sg213 = SpaceGroup(
     point_group_name="PG432",
     crystal_system=CUBIC,
     pdb_name="P 41 3 2",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_12_0_12),
-        SymOp(ROT_mX_Y_mZ, TR_0_12_12),
-        SymOp(ROT_X_mY_mZ, TR_12_12_0),
-        SymOp(ROT_Z_X_Y, TR_0_0_0),
-        SymOp(ROT_Z_mX_mY, TR_12_12_0),
-        SymOp(ROT_mZ_mX_Y, TR_12_0_12),
-        SymOp(ROT_mZ_X_mY, TR_0_12_12),
-        SymOp(ROT_Y_Z_X, TR_0_0_0),
-        SymOp(ROT_mY_Z_mX, TR_0_12_12),
-        SymOp(ROT_Y_mZ_mX, TR_12_12_0),
-        SymOp(ROT_mY_mZ_X, TR_12_0_12),
-        SymOp(ROT_Y_X_mZ, TR_34_14_14),
-        SymOp(ROT_mY_mX_mZ, TR_34_34_34),
-        SymOp(ROT_Y_mX_Z, TR_14_14_34),
-        SymOp(ROT_mY_X_Z, TR_14_34_14),
-        SymOp(ROT_X_Z_mY, TR_34_14_14),
-        SymOp(ROT_mX_Z_Y, TR_14_34_14),
-        SymOp(ROT_mX_mZ_mY, TR_34_34_34),
-        SymOp(ROT_X_mZ_Y, TR_14_14_34),
-        SymOp(ROT_Z_Y_mX, TR_34_14_14),
-        SymOp(ROT_Z_mY_X, TR_14_14_34),
-        SymOp(ROT_mZ_Y_X, TR_14_34_14),
-        SymOp(ROT_mZ_mY_mX, TR_34_34_34)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_12_0_12),
+        (ROT_mX_Y_mZ, TR_0_12_12),
+        (ROT_X_mY_mZ, TR_12_12_0),
+        (ROT_Z_X_Y, TR_0_0_0),
+        (ROT_Z_mX_mY, TR_12_12_0),
+        (ROT_mZ_mX_Y, TR_12_0_12),
+        (ROT_mZ_X_mY, TR_0_12_12),
+        (ROT_Y_Z_X, TR_0_0_0),
+        (ROT_mY_Z_mX, TR_0_12_12),
+        (ROT_Y_mZ_mX, TR_12_12_0),
+        (ROT_mY_mZ_X, TR_12_0_12),
+        (ROT_Y_X_mZ, TR_34_14_14),
+        (ROT_mY_mX_mZ, TR_34_34_34),
+        (ROT_Y_mX_Z, TR_14_14_34),
+        (ROT_mY_X_Z, TR_14_34_14),
+        (ROT_X_Z_mY, TR_34_14_14),
+        (ROT_mX_Z_Y, TR_14_34_14),
+        (ROT_mX_mZ_mY, TR_34_34_34),
+        (ROT_X_mZ_Y, TR_14_14_34),
+        (ROT_Z_Y_mX, TR_34_14_14),
+        (ROT_Z_mY_X, TR_14_14_34),
+        (ROT_mZ_Y_X, TR_14_34_14),
+        (ROT_mZ_mY_mX, TR_34_34_34)])
 
 sg214 = SpaceGroup(
     number=214,
@@ -5294,55 +5292,55 @@ sg214 = SpaceGroup(
     point_group_name="PG432",
     crystal_system=CUBIC,
     pdb_name="I 41 3 2",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_12_0_12),
-        SymOp(ROT_mX_Y_mZ, TR_0_12_12),
-        SymOp(ROT_X_mY_mZ, TR_12_12_0),
-        SymOp(ROT_Z_X_Y, TR_0_0_0),
-        SymOp(ROT_Z_mX_mY, TR_12_12_0),
-        SymOp(ROT_mZ_mX_Y, TR_12_0_12),
-        SymOp(ROT_mZ_X_mY, TR_0_12_12),
-        SymOp(ROT_Y_Z_X, TR_0_0_0),
-        SymOp(ROT_mY_Z_mX, TR_0_12_12),
-        SymOp(ROT_Y_mZ_mX, TR_12_12_0),
-        SymOp(ROT_mY_mZ_X, TR_12_0_12),
-        SymOp(ROT_Y_X_mZ, TR_34_14_14),
-        SymOp(ROT_mY_mX_mZ, TR_34_34_34),
-        SymOp(ROT_Y_mX_Z, TR_14_14_34),
-        SymOp(ROT_mY_X_Z, TR_14_34_14),
-        SymOp(ROT_X_Z_mY, TR_34_14_14),
-        SymOp(ROT_mX_Z_Y, TR_14_34_14),
-        SymOp(ROT_mX_mZ_mY, TR_34_34_34),
-        SymOp(ROT_X_mZ_Y, TR_14_14_34),
-        SymOp(ROT_Z_Y_mX, TR_34_14_14),
-        SymOp(ROT_Z_mY_X, TR_14_14_34),
-        SymOp(ROT_mZ_Y_X, TR_14_34_14),
-        SymOp(ROT_mZ_mY_mX, TR_34_34_34),
-        SymOp(ROT_X_Y_Z, TR_12_12_12),
-        SymOp(ROT_mX_mY_Z, TR_0_12_0),
-        SymOp(ROT_mX_Y_mZ, TR_12_0_0),
-        SymOp(ROT_X_mY_mZ, TR_0_0_12),
-        SymOp(ROT_Z_X_Y, TR_12_12_12),
-        SymOp(ROT_Z_mX_mY, TR_0_0_12),
-        SymOp(ROT_mZ_mX_Y, TR_0_12_0),
-        SymOp(ROT_mZ_X_mY, TR_12_0_0),
-        SymOp(ROT_Y_Z_X, TR_12_12_12),
-        SymOp(ROT_mY_Z_mX, TR_12_0_0),
-        SymOp(ROT_Y_mZ_mX, TR_0_0_12),
-        SymOp(ROT_mY_mZ_X, TR_0_12_0),
-        SymOp(ROT_Y_X_mZ, TR_14_34_34),
-        SymOp(ROT_mY_mX_mZ, TR_14_14_14),
-        SymOp(ROT_Y_mX_Z, TR_34_34_14),
-        SymOp(ROT_mY_X_Z, TR_34_14_34),
-        SymOp(ROT_X_Z_mY, TR_14_34_34),
-        SymOp(ROT_mX_Z_Y, TR_34_14_34),
-        SymOp(ROT_mX_mZ_mY, TR_14_14_14),
-        SymOp(ROT_X_mZ_Y, TR_34_34_14),
-        SymOp(ROT_Z_Y_mX, TR_14_34_34),
-        SymOp(ROT_Z_mY_X, TR_34_34_14),
-        SymOp(ROT_mZ_Y_X, TR_34_14_34),
-        SymOp(ROT_mZ_mY_mX, TR_14_14_14)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_12_0_12),
+        (ROT_mX_Y_mZ, TR_0_12_12),
+        (ROT_X_mY_mZ, TR_12_12_0),
+        (ROT_Z_X_Y, TR_0_0_0),
+        (ROT_Z_mX_mY, TR_12_12_0),
+        (ROT_mZ_mX_Y, TR_12_0_12),
+        (ROT_mZ_X_mY, TR_0_12_12),
+        (ROT_Y_Z_X, TR_0_0_0),
+        (ROT_mY_Z_mX, TR_0_12_12),
+        (ROT_Y_mZ_mX, TR_12_12_0),
+        (ROT_mY_mZ_X, TR_12_0_12),
+        (ROT_Y_X_mZ, TR_34_14_14),
+        (ROT_mY_mX_mZ, TR_34_34_34),
+        (ROT_Y_mX_Z, TR_14_14_34),
+        (ROT_mY_X_Z, TR_14_34_14),
+        (ROT_X_Z_mY, TR_34_14_14),
+        (ROT_mX_Z_Y, TR_14_34_14),
+        (ROT_mX_mZ_mY, TR_34_34_34),
+        (ROT_X_mZ_Y, TR_14_14_34),
+        (ROT_Z_Y_mX, TR_34_14_14),
+        (ROT_Z_mY_X, TR_14_14_34),
+        (ROT_mZ_Y_X, TR_14_34_14),
+        (ROT_mZ_mY_mX, TR_34_34_34),
+        (ROT_X_Y_Z, TR_12_12_12),
+        (ROT_mX_mY_Z, TR_0_12_0),
+        (ROT_mX_Y_mZ, TR_12_0_0),
+        (ROT_X_mY_mZ, TR_0_0_12),
+        (ROT_Z_X_Y, TR_12_12_12),
+        (ROT_Z_mX_mY, TR_0_0_12),
+        (ROT_mZ_mX_Y, TR_0_12_0),
+        (ROT_mZ_X_mY, TR_12_0_0),
+        (ROT_Y_Z_X, TR_12_12_12),
+        (ROT_mY_Z_mX, TR_12_0_0),
+        (ROT_Y_mZ_mX, TR_0_0_12),
+        (ROT_mY_mZ_X, TR_0_12_0),
+        (ROT_Y_X_mZ, TR_14_34_34),
+        (ROT_mY_mX_mZ, TR_14_14_14),
+        (ROT_Y_mX_Z, TR_34_34_14),
+        (ROT_mY_X_Z, TR_34_14_34),
+        (ROT_X_Z_mY, TR_14_34_34),
+        (ROT_mX_Z_Y, TR_34_14_34),
+        (ROT_mX_mZ_mY, TR_14_14_14),
+        (ROT_X_mZ_Y, TR_34_34_14),
+        (ROT_Z_Y_mX, TR_14_34_34),
+        (ROT_Z_mY_X, TR_34_34_14),
+        (ROT_mZ_Y_X, TR_34_14_34),
+        (ROT_mZ_mY_mX, TR_14_14_14)])
 
 sg215 = SpaceGroup(
     number=215,
@@ -5352,31 +5350,31 @@ sg215 = SpaceGroup(
     point_group_name="PG4bar3m",
     crystal_system=CUBIC,
     pdb_name="P -4 3 m",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mX_Y_mZ, TR_0_0_0),
-        SymOp(ROT_X_mY_mZ, TR_0_0_0),
-        SymOp(ROT_Z_X_Y, TR_0_0_0),
-        SymOp(ROT_Z_mX_mY, TR_0_0_0),
-        SymOp(ROT_mZ_mX_Y, TR_0_0_0),
-        SymOp(ROT_mZ_X_mY, TR_0_0_0),
-        SymOp(ROT_Y_Z_X, TR_0_0_0),
-        SymOp(ROT_mY_Z_mX, TR_0_0_0),
-        SymOp(ROT_Y_mZ_mX, TR_0_0_0),
-        SymOp(ROT_mY_mZ_X, TR_0_0_0),
-        SymOp(ROT_Y_X_Z, TR_0_0_0),
-        SymOp(ROT_mY_mX_Z, TR_0_0_0),
-        SymOp(ROT_Y_mX_mZ, TR_0_0_0),
-        SymOp(ROT_mY_X_mZ, TR_0_0_0),
-        SymOp(ROT_X_Z_Y, TR_0_0_0),
-        SymOp(ROT_mX_Z_mY, TR_0_0_0),
-        SymOp(ROT_mX_mZ_Y, TR_0_0_0),
-        SymOp(ROT_X_mZ_mY, TR_0_0_0),
-        SymOp(ROT_Z_Y_X, TR_0_0_0),
-        SymOp(ROT_Z_mY_mX, TR_0_0_0),
-        SymOp(ROT_mZ_Y_mX, TR_0_0_0),
-        SymOp(ROT_mZ_mY_X, TR_0_0_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mX_Y_mZ, TR_0_0_0),
+        (ROT_X_mY_mZ, TR_0_0_0),
+        (ROT_Z_X_Y, TR_0_0_0),
+        (ROT_Z_mX_mY, TR_0_0_0),
+        (ROT_mZ_mX_Y, TR_0_0_0),
+        (ROT_mZ_X_mY, TR_0_0_0),
+        (ROT_Y_Z_X, TR_0_0_0),
+        (ROT_mY_Z_mX, TR_0_0_0),
+        (ROT_Y_mZ_mX, TR_0_0_0),
+        (ROT_mY_mZ_X, TR_0_0_0),
+        (ROT_Y_X_Z, TR_0_0_0),
+        (ROT_mY_mX_Z, TR_0_0_0),
+        (ROT_Y_mX_mZ, TR_0_0_0),
+        (ROT_mY_X_mZ, TR_0_0_0),
+        (ROT_X_Z_Y, TR_0_0_0),
+        (ROT_mX_Z_mY, TR_0_0_0),
+        (ROT_mX_mZ_Y, TR_0_0_0),
+        (ROT_X_mZ_mY, TR_0_0_0),
+        (ROT_Z_Y_X, TR_0_0_0),
+        (ROT_Z_mY_mX, TR_0_0_0),
+        (ROT_mZ_Y_mX, TR_0_0_0),
+        (ROT_mZ_mY_X, TR_0_0_0)])
 
 sg216 = SpaceGroup(
     number=216,
@@ -5386,103 +5384,103 @@ sg216 = SpaceGroup(
     point_group_name="PG4bar3m",
     crystal_system=CUBIC,
     pdb_name="F -4 3 m",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mX_Y_mZ, TR_0_0_0),
-        SymOp(ROT_X_mY_mZ, TR_0_0_0),
-        SymOp(ROT_Z_X_Y, TR_0_0_0),
-        SymOp(ROT_Z_mX_mY, TR_0_0_0),
-        SymOp(ROT_mZ_mX_Y, TR_0_0_0),
-        SymOp(ROT_mZ_X_mY, TR_0_0_0),
-        SymOp(ROT_Y_Z_X, TR_0_0_0),
-        SymOp(ROT_mY_Z_mX, TR_0_0_0),
-        SymOp(ROT_Y_mZ_mX, TR_0_0_0),
-        SymOp(ROT_mY_mZ_X, TR_0_0_0),
-        SymOp(ROT_Y_X_Z, TR_0_0_0),
-        SymOp(ROT_mY_mX_Z, TR_0_0_0),
-        SymOp(ROT_Y_mX_mZ, TR_0_0_0),
-        SymOp(ROT_mY_X_mZ, TR_0_0_0),
-        SymOp(ROT_X_Z_Y, TR_0_0_0),
-        SymOp(ROT_mX_Z_mY, TR_0_0_0),
-        SymOp(ROT_mX_mZ_Y, TR_0_0_0),
-        SymOp(ROT_X_mZ_mY, TR_0_0_0),
-        SymOp(ROT_Z_Y_X, TR_0_0_0),
-        SymOp(ROT_Z_mY_mX, TR_0_0_0),
-        SymOp(ROT_mZ_Y_mX, TR_0_0_0),
-        SymOp(ROT_mZ_mY_X, TR_0_0_0),
-        SymOp(ROT_X_Y_Z, TR_0_12_12),
-        SymOp(ROT_mX_mY_Z, TR_0_12_12),
-        SymOp(ROT_mX_Y_mZ, TR_0_12_12),
-        SymOp(ROT_X_mY_mZ, TR_0_12_12),
-        SymOp(ROT_Z_X_Y, TR_0_12_12),
-        SymOp(ROT_Z_mX_mY, TR_0_12_12),
-        SymOp(ROT_mZ_mX_Y, TR_0_12_12),
-        SymOp(ROT_mZ_X_mY, TR_0_12_12),
-        SymOp(ROT_Y_Z_X, TR_0_12_12),
-        SymOp(ROT_mY_Z_mX, TR_0_12_12),
-        SymOp(ROT_Y_mZ_mX, TR_0_12_12),
-        SymOp(ROT_mY_mZ_X, TR_0_12_12),
-        SymOp(ROT_Y_X_Z, TR_0_12_12),
-        SymOp(ROT_mY_mX_Z, TR_0_12_12),
-        SymOp(ROT_Y_mX_mZ, TR_0_12_12),
-        SymOp(ROT_mY_X_mZ, TR_0_12_12),
-        SymOp(ROT_X_Z_Y, TR_0_12_12),
-        SymOp(ROT_mX_Z_mY, TR_0_12_12),
-        SymOp(ROT_mX_mZ_Y, TR_0_12_12),
-        SymOp(ROT_X_mZ_mY, TR_0_12_12),
-        SymOp(ROT_Z_Y_X, TR_0_12_12),
-        SymOp(ROT_Z_mY_mX, TR_0_12_12),
-        SymOp(ROT_mZ_Y_mX, TR_0_12_12),
-        SymOp(ROT_mZ_mY_X, TR_0_12_12),
-        SymOp(ROT_X_Y_Z, TR_12_0_12),
-        SymOp(ROT_mX_mY_Z, TR_12_0_12),
-        SymOp(ROT_mX_Y_mZ, TR_12_0_12),
-        SymOp(ROT_X_mY_mZ, TR_12_0_12),
-        SymOp(ROT_Z_X_Y, TR_12_0_12),
-        SymOp(ROT_Z_mX_mY, TR_12_0_12),
-        SymOp(ROT_mZ_mX_Y, TR_12_0_12),
-        SymOp(ROT_mZ_X_mY, TR_12_0_12),
-        SymOp(ROT_Y_Z_X, TR_12_0_12),
-        SymOp(ROT_mY_Z_mX, TR_12_0_12),
-        SymOp(ROT_Y_mZ_mX, TR_12_0_12),
-        SymOp(ROT_mY_mZ_X, TR_12_0_12),
-        SymOp(ROT_Y_X_Z, TR_12_0_12),
-        SymOp(ROT_mY_mX_Z, TR_12_0_12),
-        SymOp(ROT_Y_mX_mZ, TR_12_0_12),
-        SymOp(ROT_mY_X_mZ, TR_12_0_12),
-        SymOp(ROT_X_Z_Y, TR_12_0_12),
-        SymOp(ROT_mX_Z_mY, TR_12_0_12),
-        SymOp(ROT_mX_mZ_Y, TR_12_0_12),
-        SymOp(ROT_X_mZ_mY, TR_12_0_12),
-        SymOp(ROT_Z_Y_X, TR_12_0_12),
-        SymOp(ROT_Z_mY_mX, TR_12_0_12),
-        SymOp(ROT_mZ_Y_mX, TR_12_0_12),
-        SymOp(ROT_mZ_mY_X, TR_12_0_12),
-        SymOp(ROT_X_Y_Z, TR_12_12_0),
-        SymOp(ROT_mX_mY_Z, TR_12_12_0),
-        SymOp(ROT_mX_Y_mZ, TR_12_12_0),
-        SymOp(ROT_X_mY_mZ, TR_12_12_0),
-        SymOp(ROT_Z_X_Y, TR_12_12_0),
-        SymOp(ROT_Z_mX_mY, TR_12_12_0),
-        SymOp(ROT_mZ_mX_Y, TR_12_12_0),
-        SymOp(ROT_mZ_X_mY, TR_12_12_0),
-        SymOp(ROT_Y_Z_X, TR_12_12_0),
-        SymOp(ROT_mY_Z_mX, TR_12_12_0),
-        SymOp(ROT_Y_mZ_mX, TR_12_12_0),
-        SymOp(ROT_mY_mZ_X, TR_12_12_0),
-        SymOp(ROT_Y_X_Z, TR_12_12_0),
-        SymOp(ROT_mY_mX_Z, TR_12_12_0),
-        SymOp(ROT_Y_mX_mZ, TR_12_12_0),
-        SymOp(ROT_mY_X_mZ, TR_12_12_0),
-        SymOp(ROT_X_Z_Y, TR_12_12_0),
-        SymOp(ROT_mX_Z_mY, TR_12_12_0),
-        SymOp(ROT_mX_mZ_Y, TR_12_12_0),
-        SymOp(ROT_X_mZ_mY, TR_12_12_0),
-        SymOp(ROT_Z_Y_X, TR_12_12_0),
-        SymOp(ROT_Z_mY_mX, TR_12_12_0),
-        SymOp(ROT_mZ_Y_mX, TR_12_12_0),
-        SymOp(ROT_mZ_mY_X, TR_12_12_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mX_Y_mZ, TR_0_0_0),
+        (ROT_X_mY_mZ, TR_0_0_0),
+        (ROT_Z_X_Y, TR_0_0_0),
+        (ROT_Z_mX_mY, TR_0_0_0),
+        (ROT_mZ_mX_Y, TR_0_0_0),
+        (ROT_mZ_X_mY, TR_0_0_0),
+        (ROT_Y_Z_X, TR_0_0_0),
+        (ROT_mY_Z_mX, TR_0_0_0),
+        (ROT_Y_mZ_mX, TR_0_0_0),
+        (ROT_mY_mZ_X, TR_0_0_0),
+        (ROT_Y_X_Z, TR_0_0_0),
+        (ROT_mY_mX_Z, TR_0_0_0),
+        (ROT_Y_mX_mZ, TR_0_0_0),
+        (ROT_mY_X_mZ, TR_0_0_0),
+        (ROT_X_Z_Y, TR_0_0_0),
+        (ROT_mX_Z_mY, TR_0_0_0),
+        (ROT_mX_mZ_Y, TR_0_0_0),
+        (ROT_X_mZ_mY, TR_0_0_0),
+        (ROT_Z_Y_X, TR_0_0_0),
+        (ROT_Z_mY_mX, TR_0_0_0),
+        (ROT_mZ_Y_mX, TR_0_0_0),
+        (ROT_mZ_mY_X, TR_0_0_0),
+        (ROT_X_Y_Z, TR_0_12_12),
+        (ROT_mX_mY_Z, TR_0_12_12),
+        (ROT_mX_Y_mZ, TR_0_12_12),
+        (ROT_X_mY_mZ, TR_0_12_12),
+        (ROT_Z_X_Y, TR_0_12_12),
+        (ROT_Z_mX_mY, TR_0_12_12),
+        (ROT_mZ_mX_Y, TR_0_12_12),
+        (ROT_mZ_X_mY, TR_0_12_12),
+        (ROT_Y_Z_X, TR_0_12_12),
+        (ROT_mY_Z_mX, TR_0_12_12),
+        (ROT_Y_mZ_mX, TR_0_12_12),
+        (ROT_mY_mZ_X, TR_0_12_12),
+        (ROT_Y_X_Z, TR_0_12_12),
+        (ROT_mY_mX_Z, TR_0_12_12),
+        (ROT_Y_mX_mZ, TR_0_12_12),
+        (ROT_mY_X_mZ, TR_0_12_12),
+        (ROT_X_Z_Y, TR_0_12_12),
+        (ROT_mX_Z_mY, TR_0_12_12),
+        (ROT_mX_mZ_Y, TR_0_12_12),
+        (ROT_X_mZ_mY, TR_0_12_12),
+        (ROT_Z_Y_X, TR_0_12_12),
+        (ROT_Z_mY_mX, TR_0_12_12),
+        (ROT_mZ_Y_mX, TR_0_12_12),
+        (ROT_mZ_mY_X, TR_0_12_12),
+        (ROT_X_Y_Z, TR_12_0_12),
+        (ROT_mX_mY_Z, TR_12_0_12),
+        (ROT_mX_Y_mZ, TR_12_0_12),
+        (ROT_X_mY_mZ, TR_12_0_12),
+        (ROT_Z_X_Y, TR_12_0_12),
+        (ROT_Z_mX_mY, TR_12_0_12),
+        (ROT_mZ_mX_Y, TR_12_0_12),
+        (ROT_mZ_X_mY, TR_12_0_12),
+        (ROT_Y_Z_X, TR_12_0_12),
+        (ROT_mY_Z_mX, TR_12_0_12),
+        (ROT_Y_mZ_mX, TR_12_0_12),
+        (ROT_mY_mZ_X, TR_12_0_12),
+        (ROT_Y_X_Z, TR_12_0_12),
+        (ROT_mY_mX_Z, TR_12_0_12),
+        (ROT_Y_mX_mZ, TR_12_0_12),
+        (ROT_mY_X_mZ, TR_12_0_12),
+        (ROT_X_Z_Y, TR_12_0_12),
+        (ROT_mX_Z_mY, TR_12_0_12),
+        (ROT_mX_mZ_Y, TR_12_0_12),
+        (ROT_X_mZ_mY, TR_12_0_12),
+        (ROT_Z_Y_X, TR_12_0_12),
+        (ROT_Z_mY_mX, TR_12_0_12),
+        (ROT_mZ_Y_mX, TR_12_0_12),
+        (ROT_mZ_mY_X, TR_12_0_12),
+        (ROT_X_Y_Z, TR_12_12_0),
+        (ROT_mX_mY_Z, TR_12_12_0),
+        (ROT_mX_Y_mZ, TR_12_12_0),
+        (ROT_X_mY_mZ, TR_12_12_0),
+        (ROT_Z_X_Y, TR_12_12_0),
+        (ROT_Z_mX_mY, TR_12_12_0),
+        (ROT_mZ_mX_Y, TR_12_12_0),
+        (ROT_mZ_X_mY, TR_12_12_0),
+        (ROT_Y_Z_X, TR_12_12_0),
+        (ROT_mY_Z_mX, TR_12_12_0),
+        (ROT_Y_mZ_mX, TR_12_12_0),
+        (ROT_mY_mZ_X, TR_12_12_0),
+        (ROT_Y_X_Z, TR_12_12_0),
+        (ROT_mY_mX_Z, TR_12_12_0),
+        (ROT_Y_mX_mZ, TR_12_12_0),
+        (ROT_mY_X_mZ, TR_12_12_0),
+        (ROT_X_Z_Y, TR_12_12_0),
+        (ROT_mX_Z_mY, TR_12_12_0),
+        (ROT_mX_mZ_Y, TR_12_12_0),
+        (ROT_X_mZ_mY, TR_12_12_0),
+        (ROT_Z_Y_X, TR_12_12_0),
+        (ROT_Z_mY_mX, TR_12_12_0),
+        (ROT_mZ_Y_mX, TR_12_12_0),
+        (ROT_mZ_mY_X, TR_12_12_0)])
 
 sg217 = SpaceGroup(
     number=217,
@@ -5492,55 +5490,55 @@ sg217 = SpaceGroup(
     point_group_name="PG4bar3m",
     crystal_system=CUBIC,
     pdb_name="I -4 3 m",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mX_Y_mZ, TR_0_0_0),
-        SymOp(ROT_X_mY_mZ, TR_0_0_0),
-        SymOp(ROT_Z_X_Y, TR_0_0_0),
-        SymOp(ROT_Z_mX_mY, TR_0_0_0),
-        SymOp(ROT_mZ_mX_Y, TR_0_0_0),
-        SymOp(ROT_mZ_X_mY, TR_0_0_0),
-        SymOp(ROT_Y_Z_X, TR_0_0_0),
-        SymOp(ROT_mY_Z_mX, TR_0_0_0),
-        SymOp(ROT_Y_mZ_mX, TR_0_0_0),
-        SymOp(ROT_mY_mZ_X, TR_0_0_0),
-        SymOp(ROT_Y_X_Z, TR_0_0_0),
-        SymOp(ROT_mY_mX_Z, TR_0_0_0),
-        SymOp(ROT_Y_mX_mZ, TR_0_0_0),
-        SymOp(ROT_mY_X_mZ, TR_0_0_0),
-        SymOp(ROT_X_Z_Y, TR_0_0_0),
-        SymOp(ROT_mX_Z_mY, TR_0_0_0),
-        SymOp(ROT_mX_mZ_Y, TR_0_0_0),
-        SymOp(ROT_X_mZ_mY, TR_0_0_0),
-        SymOp(ROT_Z_Y_X, TR_0_0_0),
-        SymOp(ROT_Z_mY_mX, TR_0_0_0),
-        SymOp(ROT_mZ_Y_mX, TR_0_0_0),
-        SymOp(ROT_mZ_mY_X, TR_0_0_0),
-        SymOp(ROT_X_Y_Z, TR_12_12_12),
-        SymOp(ROT_mX_mY_Z, TR_12_12_12),
-        SymOp(ROT_mX_Y_mZ, TR_12_12_12),
-        SymOp(ROT_X_mY_mZ, TR_12_12_12),
-        SymOp(ROT_Z_X_Y, TR_12_12_12),
-        SymOp(ROT_Z_mX_mY, TR_12_12_12),
-        SymOp(ROT_mZ_mX_Y, TR_12_12_12),
-        SymOp(ROT_mZ_X_mY, TR_12_12_12),
-        SymOp(ROT_Y_Z_X, TR_12_12_12),
-        SymOp(ROT_mY_Z_mX, TR_12_12_12),
-        SymOp(ROT_Y_mZ_mX, TR_12_12_12),
-        SymOp(ROT_mY_mZ_X, TR_12_12_12),
-        SymOp(ROT_Y_X_Z, TR_12_12_12),
-        SymOp(ROT_mY_mX_Z, TR_12_12_12),
-        SymOp(ROT_Y_mX_mZ, TR_12_12_12),
-        SymOp(ROT_mY_X_mZ, TR_12_12_12),
-        SymOp(ROT_X_Z_Y, TR_12_12_12),
-        SymOp(ROT_mX_Z_mY, TR_12_12_12),
-        SymOp(ROT_mX_mZ_Y, TR_12_12_12),
-        SymOp(ROT_X_mZ_mY, TR_12_12_12),
-        SymOp(ROT_Z_Y_X, TR_12_12_12),
-        SymOp(ROT_Z_mY_mX, TR_12_12_12),
-        SymOp(ROT_mZ_Y_mX, TR_12_12_12),
-        SymOp(ROT_mZ_mY_X, TR_12_12_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mX_Y_mZ, TR_0_0_0),
+        (ROT_X_mY_mZ, TR_0_0_0),
+        (ROT_Z_X_Y, TR_0_0_0),
+        (ROT_Z_mX_mY, TR_0_0_0),
+        (ROT_mZ_mX_Y, TR_0_0_0),
+        (ROT_mZ_X_mY, TR_0_0_0),
+        (ROT_Y_Z_X, TR_0_0_0),
+        (ROT_mY_Z_mX, TR_0_0_0),
+        (ROT_Y_mZ_mX, TR_0_0_0),
+        (ROT_mY_mZ_X, TR_0_0_0),
+        (ROT_Y_X_Z, TR_0_0_0),
+        (ROT_mY_mX_Z, TR_0_0_0),
+        (ROT_Y_mX_mZ, TR_0_0_0),
+        (ROT_mY_X_mZ, TR_0_0_0),
+        (ROT_X_Z_Y, TR_0_0_0),
+        (ROT_mX_Z_mY, TR_0_0_0),
+        (ROT_mX_mZ_Y, TR_0_0_0),
+        (ROT_X_mZ_mY, TR_0_0_0),
+        (ROT_Z_Y_X, TR_0_0_0),
+        (ROT_Z_mY_mX, TR_0_0_0),
+        (ROT_mZ_Y_mX, TR_0_0_0),
+        (ROT_mZ_mY_X, TR_0_0_0),
+        (ROT_X_Y_Z, TR_12_12_12),
+        (ROT_mX_mY_Z, TR_12_12_12),
+        (ROT_mX_Y_mZ, TR_12_12_12),
+        (ROT_X_mY_mZ, TR_12_12_12),
+        (ROT_Z_X_Y, TR_12_12_12),
+        (ROT_Z_mX_mY, TR_12_12_12),
+        (ROT_mZ_mX_Y, TR_12_12_12),
+        (ROT_mZ_X_mY, TR_12_12_12),
+        (ROT_Y_Z_X, TR_12_12_12),
+        (ROT_mY_Z_mX, TR_12_12_12),
+        (ROT_Y_mZ_mX, TR_12_12_12),
+        (ROT_mY_mZ_X, TR_12_12_12),
+        (ROT_Y_X_Z, TR_12_12_12),
+        (ROT_mY_mX_Z, TR_12_12_12),
+        (ROT_Y_mX_mZ, TR_12_12_12),
+        (ROT_mY_X_mZ, TR_12_12_12),
+        (ROT_X_Z_Y, TR_12_12_12),
+        (ROT_mX_Z_mY, TR_12_12_12),
+        (ROT_mX_mZ_Y, TR_12_12_12),
+        (ROT_X_mZ_mY, TR_12_12_12),
+        (ROT_Z_Y_X, TR_12_12_12),
+        (ROT_Z_mY_mX, TR_12_12_12),
+        (ROT_mZ_Y_mX, TR_12_12_12),
+        (ROT_mZ_mY_X, TR_12_12_12)])
 
 sg218 = SpaceGroup(
     number=218,
@@ -5550,31 +5548,31 @@ sg218 = SpaceGroup(
     point_group_name="PG4bar3m",
     crystal_system=CUBIC,
     pdb_name="P -4 3 n",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mX_Y_mZ, TR_0_0_0),
-        SymOp(ROT_X_mY_mZ, TR_0_0_0),
-        SymOp(ROT_Z_X_Y, TR_0_0_0),
-        SymOp(ROT_Z_mX_mY, TR_0_0_0),
-        SymOp(ROT_mZ_mX_Y, TR_0_0_0),
-        SymOp(ROT_mZ_X_mY, TR_0_0_0),
-        SymOp(ROT_Y_Z_X, TR_0_0_0),
-        SymOp(ROT_mY_Z_mX, TR_0_0_0),
-        SymOp(ROT_Y_mZ_mX, TR_0_0_0),
-        SymOp(ROT_mY_mZ_X, TR_0_0_0),
-        SymOp(ROT_Y_X_Z, TR_12_12_12),
-        SymOp(ROT_mY_mX_Z, TR_12_12_12),
-        SymOp(ROT_Y_mX_mZ, TR_12_12_12),
-        SymOp(ROT_mY_X_mZ, TR_12_12_12),
-        SymOp(ROT_X_Z_Y, TR_12_12_12),
-        SymOp(ROT_mX_Z_mY, TR_12_12_12),
-        SymOp(ROT_mX_mZ_Y, TR_12_12_12),
-        SymOp(ROT_X_mZ_mY, TR_12_12_12),
-        SymOp(ROT_Z_Y_X, TR_12_12_12),
-        SymOp(ROT_Z_mY_mX, TR_12_12_12),
-        SymOp(ROT_mZ_Y_mX, TR_12_12_12),
-        SymOp(ROT_mZ_mY_X, TR_12_12_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mX_Y_mZ, TR_0_0_0),
+        (ROT_X_mY_mZ, TR_0_0_0),
+        (ROT_Z_X_Y, TR_0_0_0),
+        (ROT_Z_mX_mY, TR_0_0_0),
+        (ROT_mZ_mX_Y, TR_0_0_0),
+        (ROT_mZ_X_mY, TR_0_0_0),
+        (ROT_Y_Z_X, TR_0_0_0),
+        (ROT_mY_Z_mX, TR_0_0_0),
+        (ROT_Y_mZ_mX, TR_0_0_0),
+        (ROT_mY_mZ_X, TR_0_0_0),
+        (ROT_Y_X_Z, TR_12_12_12),
+        (ROT_mY_mX_Z, TR_12_12_12),
+        (ROT_Y_mX_mZ, TR_12_12_12),
+        (ROT_mY_X_mZ, TR_12_12_12),
+        (ROT_X_Z_Y, TR_12_12_12),
+        (ROT_mX_Z_mY, TR_12_12_12),
+        (ROT_mX_mZ_Y, TR_12_12_12),
+        (ROT_X_mZ_mY, TR_12_12_12),
+        (ROT_Z_Y_X, TR_12_12_12),
+        (ROT_Z_mY_mX, TR_12_12_12),
+        (ROT_mZ_Y_mX, TR_12_12_12),
+        (ROT_mZ_mY_X, TR_12_12_12)])
 
 sg219 = SpaceGroup(
     number=219,
@@ -5584,103 +5582,103 @@ sg219 = SpaceGroup(
     point_group_name="PG4bar3m",
     crystal_system=CUBIC,
     pdb_name="F -4 3 c",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mX_Y_mZ, TR_0_0_0),
-        SymOp(ROT_X_mY_mZ, TR_0_0_0),
-        SymOp(ROT_Z_X_Y, TR_0_0_0),
-        SymOp(ROT_Z_mX_mY, TR_0_0_0),
-        SymOp(ROT_mZ_mX_Y, TR_0_0_0),
-        SymOp(ROT_mZ_X_mY, TR_0_0_0),
-        SymOp(ROT_Y_Z_X, TR_0_0_0),
-        SymOp(ROT_mY_Z_mX, TR_0_0_0),
-        SymOp(ROT_Y_mZ_mX, TR_0_0_0),
-        SymOp(ROT_mY_mZ_X, TR_0_0_0),
-        SymOp(ROT_Y_X_Z, TR_12_12_12),
-        SymOp(ROT_mY_mX_Z, TR_12_12_12),
-        SymOp(ROT_Y_mX_mZ, TR_12_12_12),
-        SymOp(ROT_mY_X_mZ, TR_12_12_12),
-        SymOp(ROT_X_Z_Y, TR_12_12_12),
-        SymOp(ROT_mX_Z_mY, TR_12_12_12),
-        SymOp(ROT_mX_mZ_Y, TR_12_12_12),
-        SymOp(ROT_X_mZ_mY, TR_12_12_12),
-        SymOp(ROT_Z_Y_X, TR_12_12_12),
-        SymOp(ROT_Z_mY_mX, TR_12_12_12),
-        SymOp(ROT_mZ_Y_mX, TR_12_12_12),
-        SymOp(ROT_mZ_mY_X, TR_12_12_12),
-        SymOp(ROT_X_Y_Z, TR_0_12_12),
-        SymOp(ROT_mX_mY_Z, TR_0_12_12),
-        SymOp(ROT_mX_Y_mZ, TR_0_12_12),
-        SymOp(ROT_X_mY_mZ, TR_0_12_12),
-        SymOp(ROT_Z_X_Y, TR_0_12_12),
-        SymOp(ROT_Z_mX_mY, TR_0_12_12),
-        SymOp(ROT_mZ_mX_Y, TR_0_12_12),
-        SymOp(ROT_mZ_X_mY, TR_0_12_12),
-        SymOp(ROT_Y_Z_X, TR_0_12_12),
-        SymOp(ROT_mY_Z_mX, TR_0_12_12),
-        SymOp(ROT_Y_mZ_mX, TR_0_12_12),
-        SymOp(ROT_mY_mZ_X, TR_0_12_12),
-        SymOp(ROT_Y_X_Z, TR_12_0_0),
-        SymOp(ROT_mY_mX_Z, TR_12_0_0),
-        SymOp(ROT_Y_mX_mZ, TR_12_0_0),
-        SymOp(ROT_mY_X_mZ, TR_12_0_0),
-        SymOp(ROT_X_Z_Y, TR_12_0_0),
-        SymOp(ROT_mX_Z_mY, TR_12_0_0),
-        SymOp(ROT_mX_mZ_Y, TR_12_0_0),
-        SymOp(ROT_X_mZ_mY, TR_12_0_0),
-        SymOp(ROT_Z_Y_X, TR_12_0_0),
-        SymOp(ROT_Z_mY_mX, TR_12_0_0),
-        SymOp(ROT_mZ_Y_mX, TR_12_0_0),
-        SymOp(ROT_mZ_mY_X, TR_12_0_0),
-        SymOp(ROT_X_Y_Z, TR_12_0_12),
-        SymOp(ROT_mX_mY_Z, TR_12_0_12),
-        SymOp(ROT_mX_Y_mZ, TR_12_0_12),
-        SymOp(ROT_X_mY_mZ, TR_12_0_12),
-        SymOp(ROT_Z_X_Y, TR_12_0_12),
-        SymOp(ROT_Z_mX_mY, TR_12_0_12),
-        SymOp(ROT_mZ_mX_Y, TR_12_0_12),
-        SymOp(ROT_mZ_X_mY, TR_12_0_12),
-        SymOp(ROT_Y_Z_X, TR_12_0_12),
-        SymOp(ROT_mY_Z_mX, TR_12_0_12),
-        SymOp(ROT_Y_mZ_mX, TR_12_0_12),
-        SymOp(ROT_mY_mZ_X, TR_12_0_12),
-        SymOp(ROT_Y_X_Z, TR_0_12_0),
-        SymOp(ROT_mY_mX_Z, TR_0_12_0),
-        SymOp(ROT_Y_mX_mZ, TR_0_12_0),
-        SymOp(ROT_mY_X_mZ, TR_0_12_0),
-        SymOp(ROT_X_Z_Y, TR_0_12_0),
-        SymOp(ROT_mX_Z_mY, TR_0_12_0),
-        SymOp(ROT_mX_mZ_Y, TR_0_12_0),
-        SymOp(ROT_X_mZ_mY, TR_0_12_0),
-        SymOp(ROT_Z_Y_X, TR_0_12_0),
-        SymOp(ROT_Z_mY_mX, TR_0_12_0),
-        SymOp(ROT_mZ_Y_mX, TR_0_12_0),
-        SymOp(ROT_mZ_mY_X, TR_0_12_0),
-        SymOp(ROT_X_Y_Z, TR_12_12_0),
-        SymOp(ROT_mX_mY_Z, TR_12_12_0),
-        SymOp(ROT_mX_Y_mZ, TR_12_12_0),
-        SymOp(ROT_X_mY_mZ, TR_12_12_0),
-        SymOp(ROT_Z_X_Y, TR_12_12_0),
-        SymOp(ROT_Z_mX_mY, TR_12_12_0),
-        SymOp(ROT_mZ_mX_Y, TR_12_12_0),
-        SymOp(ROT_mZ_X_mY, TR_12_12_0),
-        SymOp(ROT_Y_Z_X, TR_12_12_0),
-        SymOp(ROT_mY_Z_mX, TR_12_12_0),
-        SymOp(ROT_Y_mZ_mX, TR_12_12_0),
-        SymOp(ROT_mY_mZ_X, TR_12_12_0),
-        SymOp(ROT_Y_X_Z, TR_0_0_12),
-        SymOp(ROT_mY_mX_Z, TR_0_0_12),
-        SymOp(ROT_Y_mX_mZ, TR_0_0_12),
-        SymOp(ROT_mY_X_mZ, TR_0_0_12),
-        SymOp(ROT_X_Z_Y, TR_0_0_12),
-        SymOp(ROT_mX_Z_mY, TR_0_0_12),
-        SymOp(ROT_mX_mZ_Y, TR_0_0_12),
-        SymOp(ROT_X_mZ_mY, TR_0_0_12),
-        SymOp(ROT_Z_Y_X, TR_0_0_12),
-        SymOp(ROT_Z_mY_mX, TR_0_0_12),
-        SymOp(ROT_mZ_Y_mX, TR_0_0_12),
-        SymOp(ROT_mZ_mY_X, TR_0_0_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mX_Y_mZ, TR_0_0_0),
+        (ROT_X_mY_mZ, TR_0_0_0),
+        (ROT_Z_X_Y, TR_0_0_0),
+        (ROT_Z_mX_mY, TR_0_0_0),
+        (ROT_mZ_mX_Y, TR_0_0_0),
+        (ROT_mZ_X_mY, TR_0_0_0),
+        (ROT_Y_Z_X, TR_0_0_0),
+        (ROT_mY_Z_mX, TR_0_0_0),
+        (ROT_Y_mZ_mX, TR_0_0_0),
+        (ROT_mY_mZ_X, TR_0_0_0),
+        (ROT_Y_X_Z, TR_12_12_12),
+        (ROT_mY_mX_Z, TR_12_12_12),
+        (ROT_Y_mX_mZ, TR_12_12_12),
+        (ROT_mY_X_mZ, TR_12_12_12),
+        (ROT_X_Z_Y, TR_12_12_12),
+        (ROT_mX_Z_mY, TR_12_12_12),
+        (ROT_mX_mZ_Y, TR_12_12_12),
+        (ROT_X_mZ_mY, TR_12_12_12),
+        (ROT_Z_Y_X, TR_12_12_12),
+        (ROT_Z_mY_mX, TR_12_12_12),
+        (ROT_mZ_Y_mX, TR_12_12_12),
+        (ROT_mZ_mY_X, TR_12_12_12),
+        (ROT_X_Y_Z, TR_0_12_12),
+        (ROT_mX_mY_Z, TR_0_12_12),
+        (ROT_mX_Y_mZ, TR_0_12_12),
+        (ROT_X_mY_mZ, TR_0_12_12),
+        (ROT_Z_X_Y, TR_0_12_12),
+        (ROT_Z_mX_mY, TR_0_12_12),
+        (ROT_mZ_mX_Y, TR_0_12_12),
+        (ROT_mZ_X_mY, TR_0_12_12),
+        (ROT_Y_Z_X, TR_0_12_12),
+        (ROT_mY_Z_mX, TR_0_12_12),
+        (ROT_Y_mZ_mX, TR_0_12_12),
+        (ROT_mY_mZ_X, TR_0_12_12),
+        (ROT_Y_X_Z, TR_12_0_0),
+        (ROT_mY_mX_Z, TR_12_0_0),
+        (ROT_Y_mX_mZ, TR_12_0_0),
+        (ROT_mY_X_mZ, TR_12_0_0),
+        (ROT_X_Z_Y, TR_12_0_0),
+        (ROT_mX_Z_mY, TR_12_0_0),
+        (ROT_mX_mZ_Y, TR_12_0_0),
+        (ROT_X_mZ_mY, TR_12_0_0),
+        (ROT_Z_Y_X, TR_12_0_0),
+        (ROT_Z_mY_mX, TR_12_0_0),
+        (ROT_mZ_Y_mX, TR_12_0_0),
+        (ROT_mZ_mY_X, TR_12_0_0),
+        (ROT_X_Y_Z, TR_12_0_12),
+        (ROT_mX_mY_Z, TR_12_0_12),
+        (ROT_mX_Y_mZ, TR_12_0_12),
+        (ROT_X_mY_mZ, TR_12_0_12),
+        (ROT_Z_X_Y, TR_12_0_12),
+        (ROT_Z_mX_mY, TR_12_0_12),
+        (ROT_mZ_mX_Y, TR_12_0_12),
+        (ROT_mZ_X_mY, TR_12_0_12),
+        (ROT_Y_Z_X, TR_12_0_12),
+        (ROT_mY_Z_mX, TR_12_0_12),
+        (ROT_Y_mZ_mX, TR_12_0_12),
+        (ROT_mY_mZ_X, TR_12_0_12),
+        (ROT_Y_X_Z, TR_0_12_0),
+        (ROT_mY_mX_Z, TR_0_12_0),
+        (ROT_Y_mX_mZ, TR_0_12_0),
+        (ROT_mY_X_mZ, TR_0_12_0),
+        (ROT_X_Z_Y, TR_0_12_0),
+        (ROT_mX_Z_mY, TR_0_12_0),
+        (ROT_mX_mZ_Y, TR_0_12_0),
+        (ROT_X_mZ_mY, TR_0_12_0),
+        (ROT_Z_Y_X, TR_0_12_0),
+        (ROT_Z_mY_mX, TR_0_12_0),
+        (ROT_mZ_Y_mX, TR_0_12_0),
+        (ROT_mZ_mY_X, TR_0_12_0),
+        (ROT_X_Y_Z, TR_12_12_0),
+        (ROT_mX_mY_Z, TR_12_12_0),
+        (ROT_mX_Y_mZ, TR_12_12_0),
+        (ROT_X_mY_mZ, TR_12_12_0),
+        (ROT_Z_X_Y, TR_12_12_0),
+        (ROT_Z_mX_mY, TR_12_12_0),
+        (ROT_mZ_mX_Y, TR_12_12_0),
+        (ROT_mZ_X_mY, TR_12_12_0),
+        (ROT_Y_Z_X, TR_12_12_0),
+        (ROT_mY_Z_mX, TR_12_12_0),
+        (ROT_Y_mZ_mX, TR_12_12_0),
+        (ROT_mY_mZ_X, TR_12_12_0),
+        (ROT_Y_X_Z, TR_0_0_12),
+        (ROT_mY_mX_Z, TR_0_0_12),
+        (ROT_Y_mX_mZ, TR_0_0_12),
+        (ROT_mY_X_mZ, TR_0_0_12),
+        (ROT_X_Z_Y, TR_0_0_12),
+        (ROT_mX_Z_mY, TR_0_0_12),
+        (ROT_mX_mZ_Y, TR_0_0_12),
+        (ROT_X_mZ_mY, TR_0_0_12),
+        (ROT_Z_Y_X, TR_0_0_12),
+        (ROT_Z_mY_mX, TR_0_0_12),
+        (ROT_mZ_Y_mX, TR_0_0_12),
+        (ROT_mZ_mY_X, TR_0_0_12)])
 
 sg220 = SpaceGroup(
     number=220,
@@ -5690,55 +5688,55 @@ sg220 = SpaceGroup(
     point_group_name="PG4bar3m",
     crystal_system=CUBIC,
     pdb_name="I -4 3 d",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_12_0_12),
-        SymOp(ROT_mX_Y_mZ, TR_0_12_12),
-        SymOp(ROT_X_mY_mZ, TR_12_12_0),
-        SymOp(ROT_Z_X_Y, TR_0_0_0),
-        SymOp(ROT_Z_mX_mY, TR_12_12_0),
-        SymOp(ROT_mZ_mX_Y, TR_12_0_12),
-        SymOp(ROT_mZ_X_mY, TR_0_12_12),
-        SymOp(ROT_Y_Z_X, TR_0_0_0),
-        SymOp(ROT_mY_Z_mX, TR_0_12_12),
-        SymOp(ROT_Y_mZ_mX, TR_12_12_0),
-        SymOp(ROT_mY_mZ_X, TR_12_0_12),
-        SymOp(ROT_Y_X_Z, TR_14_14_14),
-        SymOp(ROT_mY_mX_Z, TR_14_34_34),
-        SymOp(ROT_Y_mX_mZ, TR_34_14_34),
-        SymOp(ROT_mY_X_mZ, TR_34_34_14),
-        SymOp(ROT_X_Z_Y, TR_14_14_14),
-        SymOp(ROT_mX_Z_mY, TR_34_34_14),
-        SymOp(ROT_mX_mZ_Y, TR_14_34_34),
-        SymOp(ROT_X_mZ_mY, TR_34_14_34),
-        SymOp(ROT_Z_Y_X, TR_14_14_14),
-        SymOp(ROT_Z_mY_mX, TR_34_14_34),
-        SymOp(ROT_mZ_Y_mX, TR_34_34_14),
-        SymOp(ROT_mZ_mY_X, TR_14_34_34),
-        SymOp(ROT_X_Y_Z, TR_12_12_12),
-        SymOp(ROT_mX_mY_Z, TR_0_12_0),
-        SymOp(ROT_mX_Y_mZ, TR_12_0_0),
-        SymOp(ROT_X_mY_mZ, TR_0_0_12),
-        SymOp(ROT_Z_X_Y, TR_12_12_12),
-        SymOp(ROT_Z_mX_mY, TR_0_0_12),
-        SymOp(ROT_mZ_mX_Y, TR_0_12_0),
-        SymOp(ROT_mZ_X_mY, TR_12_0_0),
-        SymOp(ROT_Y_Z_X, TR_12_12_12),
-        SymOp(ROT_mY_Z_mX, TR_12_0_0),
-        SymOp(ROT_Y_mZ_mX, TR_0_0_12),
-        SymOp(ROT_mY_mZ_X, TR_0_12_0),
-        SymOp(ROT_Y_X_Z, TR_34_34_34),
-        SymOp(ROT_mY_mX_Z, TR_34_14_14),
-        SymOp(ROT_Y_mX_mZ, TR_14_34_14),
-        SymOp(ROT_mY_X_mZ, TR_14_14_34),
-        SymOp(ROT_X_Z_Y, TR_34_34_34),
-        SymOp(ROT_mX_Z_mY, TR_14_14_34),
-        SymOp(ROT_mX_mZ_Y, TR_34_14_14),
-        SymOp(ROT_X_mZ_mY, TR_14_34_14),
-        SymOp(ROT_Z_Y_X, TR_34_34_34),
-        SymOp(ROT_Z_mY_mX, TR_14_34_14),
-        SymOp(ROT_mZ_Y_mX, TR_14_14_34),
-        SymOp(ROT_mZ_mY_X, TR_34_14_14)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_12_0_12),
+        (ROT_mX_Y_mZ, TR_0_12_12),
+        (ROT_X_mY_mZ, TR_12_12_0),
+        (ROT_Z_X_Y, TR_0_0_0),
+        (ROT_Z_mX_mY, TR_12_12_0),
+        (ROT_mZ_mX_Y, TR_12_0_12),
+        (ROT_mZ_X_mY, TR_0_12_12),
+        (ROT_Y_Z_X, TR_0_0_0),
+        (ROT_mY_Z_mX, TR_0_12_12),
+        (ROT_Y_mZ_mX, TR_12_12_0),
+        (ROT_mY_mZ_X, TR_12_0_12),
+        (ROT_Y_X_Z, TR_14_14_14),
+        (ROT_mY_mX_Z, TR_14_34_34),
+        (ROT_Y_mX_mZ, TR_34_14_34),
+        (ROT_mY_X_mZ, TR_34_34_14),
+        (ROT_X_Z_Y, TR_14_14_14),
+        (ROT_mX_Z_mY, TR_34_34_14),
+        (ROT_mX_mZ_Y, TR_14_34_34),
+        (ROT_X_mZ_mY, TR_34_14_34),
+        (ROT_Z_Y_X, TR_14_14_14),
+        (ROT_Z_mY_mX, TR_34_14_34),
+        (ROT_mZ_Y_mX, TR_34_34_14),
+        (ROT_mZ_mY_X, TR_14_34_34),
+        (ROT_X_Y_Z, TR_12_12_12),
+        (ROT_mX_mY_Z, TR_0_12_0),
+        (ROT_mX_Y_mZ, TR_12_0_0),
+        (ROT_X_mY_mZ, TR_0_0_12),
+        (ROT_Z_X_Y, TR_12_12_12),
+        (ROT_Z_mX_mY, TR_0_0_12),
+        (ROT_mZ_mX_Y, TR_0_12_0),
+        (ROT_mZ_X_mY, TR_12_0_0),
+        (ROT_Y_Z_X, TR_12_12_12),
+        (ROT_mY_Z_mX, TR_12_0_0),
+        (ROT_Y_mZ_mX, TR_0_0_12),
+        (ROT_mY_mZ_X, TR_0_12_0),
+        (ROT_Y_X_Z, TR_34_34_34),
+        (ROT_mY_mX_Z, TR_34_14_14),
+        (ROT_Y_mX_mZ, TR_14_34_14),
+        (ROT_mY_X_mZ, TR_14_14_34),
+        (ROT_X_Z_Y, TR_34_34_34),
+        (ROT_mX_Z_mY, TR_14_14_34),
+        (ROT_mX_mZ_Y, TR_34_14_14),
+        (ROT_X_mZ_mY, TR_14_34_14),
+        (ROT_Z_Y_X, TR_34_34_34),
+        (ROT_Z_mY_mX, TR_14_34_14),
+        (ROT_mZ_Y_mX, TR_14_14_34),
+        (ROT_mZ_mY_X, TR_34_14_14)])
 
 sg221 = SpaceGroup(
     number=221,
@@ -5748,55 +5746,55 @@ sg221 = SpaceGroup(
     point_group_name="PGm3barm",
     crystal_system=CUBIC,
     pdb_name="P 4/m -3 2/m",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mX_Y_mZ, TR_0_0_0),
-        SymOp(ROT_X_mY_mZ, TR_0_0_0),
-        SymOp(ROT_Z_X_Y, TR_0_0_0),
-        SymOp(ROT_Z_mX_mY, TR_0_0_0),
-        SymOp(ROT_mZ_mX_Y, TR_0_0_0),
-        SymOp(ROT_mZ_X_mY, TR_0_0_0),
-        SymOp(ROT_Y_Z_X, TR_0_0_0),
-        SymOp(ROT_mY_Z_mX, TR_0_0_0),
-        SymOp(ROT_Y_mZ_mX, TR_0_0_0),
-        SymOp(ROT_mY_mZ_X, TR_0_0_0),
-        SymOp(ROT_Y_X_mZ, TR_0_0_0),
-        SymOp(ROT_mY_mX_mZ, TR_0_0_0),
-        SymOp(ROT_Y_mX_Z, TR_0_0_0),
-        SymOp(ROT_mY_X_Z, TR_0_0_0),
-        SymOp(ROT_X_Z_mY, TR_0_0_0),
-        SymOp(ROT_mX_Z_Y, TR_0_0_0),
-        SymOp(ROT_mX_mZ_mY, TR_0_0_0),
-        SymOp(ROT_X_mZ_Y, TR_0_0_0),
-        SymOp(ROT_Z_Y_mX, TR_0_0_0),
-        SymOp(ROT_Z_mY_X, TR_0_0_0),
-        SymOp(ROT_mZ_Y_X, TR_0_0_0),
-        SymOp(ROT_mZ_mY_mX, TR_0_0_0),
-        SymOp(ROT_mX_mY_mZ, TR_0_0_0),
-        SymOp(ROT_X_Y_mZ, TR_0_0_0),
-        SymOp(ROT_X_mY_Z, TR_0_0_0),
-        SymOp(ROT_mX_Y_Z, TR_0_0_0),
-        SymOp(ROT_mZ_mX_mY, TR_0_0_0),
-        SymOp(ROT_mZ_X_Y, TR_0_0_0),
-        SymOp(ROT_Z_X_mY, TR_0_0_0),
-        SymOp(ROT_Z_mX_Y, TR_0_0_0),
-        SymOp(ROT_mY_mZ_mX, TR_0_0_0),
-        SymOp(ROT_Y_mZ_X, TR_0_0_0),
-        SymOp(ROT_mY_Z_X, TR_0_0_0),
-        SymOp(ROT_Y_Z_mX, TR_0_0_0),
-        SymOp(ROT_mY_mX_Z, TR_0_0_0),
-        SymOp(ROT_Y_X_Z, TR_0_0_0),
-        SymOp(ROT_mY_X_mZ, TR_0_0_0),
-        SymOp(ROT_Y_mX_mZ, TR_0_0_0),
-        SymOp(ROT_mX_mZ_Y, TR_0_0_0),
-        SymOp(ROT_X_mZ_mY, TR_0_0_0),
-        SymOp(ROT_X_Z_Y, TR_0_0_0),
-        SymOp(ROT_mX_Z_mY, TR_0_0_0),
-        SymOp(ROT_mZ_mY_X, TR_0_0_0),
-        SymOp(ROT_mZ_Y_mX, TR_0_0_0),
-        SymOp(ROT_Z_mY_mX, TR_0_0_0),
-        SymOp(ROT_Z_Y_X, TR_0_0_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mX_Y_mZ, TR_0_0_0),
+        (ROT_X_mY_mZ, TR_0_0_0),
+        (ROT_Z_X_Y, TR_0_0_0),
+        (ROT_Z_mX_mY, TR_0_0_0),
+        (ROT_mZ_mX_Y, TR_0_0_0),
+        (ROT_mZ_X_mY, TR_0_0_0),
+        (ROT_Y_Z_X, TR_0_0_0),
+        (ROT_mY_Z_mX, TR_0_0_0),
+        (ROT_Y_mZ_mX, TR_0_0_0),
+        (ROT_mY_mZ_X, TR_0_0_0),
+        (ROT_Y_X_mZ, TR_0_0_0),
+        (ROT_mY_mX_mZ, TR_0_0_0),
+        (ROT_Y_mX_Z, TR_0_0_0),
+        (ROT_mY_X_Z, TR_0_0_0),
+        (ROT_X_Z_mY, TR_0_0_0),
+        (ROT_mX_Z_Y, TR_0_0_0),
+        (ROT_mX_mZ_mY, TR_0_0_0),
+        (ROT_X_mZ_Y, TR_0_0_0),
+        (ROT_Z_Y_mX, TR_0_0_0),
+        (ROT_Z_mY_X, TR_0_0_0),
+        (ROT_mZ_Y_X, TR_0_0_0),
+        (ROT_mZ_mY_mX, TR_0_0_0),
+        (ROT_mX_mY_mZ, TR_0_0_0),
+        (ROT_X_Y_mZ, TR_0_0_0),
+        (ROT_X_mY_Z, TR_0_0_0),
+        (ROT_mX_Y_Z, TR_0_0_0),
+        (ROT_mZ_mX_mY, TR_0_0_0),
+        (ROT_mZ_X_Y, TR_0_0_0),
+        (ROT_Z_X_mY, TR_0_0_0),
+        (ROT_Z_mX_Y, TR_0_0_0),
+        (ROT_mY_mZ_mX, TR_0_0_0),
+        (ROT_Y_mZ_X, TR_0_0_0),
+        (ROT_mY_Z_X, TR_0_0_0),
+        (ROT_Y_Z_mX, TR_0_0_0),
+        (ROT_mY_mX_Z, TR_0_0_0),
+        (ROT_Y_X_Z, TR_0_0_0),
+        (ROT_mY_X_mZ, TR_0_0_0),
+        (ROT_Y_mX_mZ, TR_0_0_0),
+        (ROT_mX_mZ_Y, TR_0_0_0),
+        (ROT_X_mZ_mY, TR_0_0_0),
+        (ROT_X_Z_Y, TR_0_0_0),
+        (ROT_mX_Z_mY, TR_0_0_0),
+        (ROT_mZ_mY_X, TR_0_0_0),
+        (ROT_mZ_Y_mX, TR_0_0_0),
+        (ROT_Z_mY_mX, TR_0_0_0),
+        (ROT_Z_Y_X, TR_0_0_0)])
 
 sg222 = SpaceGroup(
     number=222,
@@ -5806,55 +5804,55 @@ sg222 = SpaceGroup(
     point_group_name="PGm3barm",
     crystal_system=CUBIC,
     pdb_name="P 4/n -3 2/n",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mX_Y_mZ, TR_0_0_0),
-        SymOp(ROT_X_mY_mZ, TR_0_0_0),
-        SymOp(ROT_Z_X_Y, TR_0_0_0),
-        SymOp(ROT_Z_mX_mY, TR_0_0_0),
-        SymOp(ROT_mZ_mX_Y, TR_0_0_0),
-        SymOp(ROT_mZ_X_mY, TR_0_0_0),
-        SymOp(ROT_Y_Z_X, TR_0_0_0),
-        SymOp(ROT_mY_Z_mX, TR_0_0_0),
-        SymOp(ROT_Y_mZ_mX, TR_0_0_0),
-        SymOp(ROT_mY_mZ_X, TR_0_0_0),
-        SymOp(ROT_Y_X_mZ, TR_0_0_0),
-        SymOp(ROT_mY_mX_mZ, TR_0_0_0),
-        SymOp(ROT_Y_mX_Z, TR_0_0_0),
-        SymOp(ROT_mY_X_Z, TR_0_0_0),
-        SymOp(ROT_X_Z_mY, TR_0_0_0),
-        SymOp(ROT_mX_Z_Y, TR_0_0_0),
-        SymOp(ROT_mX_mZ_mY, TR_0_0_0),
-        SymOp(ROT_X_mZ_Y, TR_0_0_0),
-        SymOp(ROT_Z_Y_mX, TR_0_0_0),
-        SymOp(ROT_Z_mY_X, TR_0_0_0),
-        SymOp(ROT_mZ_Y_X, TR_0_0_0),
-        SymOp(ROT_mZ_mY_mX, TR_0_0_0),
-        SymOp(ROT_mX_mY_mZ, TR_12_12_12),
-        SymOp(ROT_X_Y_mZ, TR_12_12_12),
-        SymOp(ROT_X_mY_Z, TR_12_12_12),
-        SymOp(ROT_mX_Y_Z, TR_12_12_12),
-        SymOp(ROT_mZ_mX_mY, TR_12_12_12),
-        SymOp(ROT_mZ_X_Y, TR_12_12_12),
-        SymOp(ROT_Z_X_mY, TR_12_12_12),
-        SymOp(ROT_Z_mX_Y, TR_12_12_12),
-        SymOp(ROT_mY_mZ_mX, TR_12_12_12),
-        SymOp(ROT_Y_mZ_X, TR_12_12_12),
-        SymOp(ROT_mY_Z_X, TR_12_12_12),
-        SymOp(ROT_Y_Z_mX, TR_12_12_12),
-        SymOp(ROT_mY_mX_Z, TR_12_12_12),
-        SymOp(ROT_Y_X_Z, TR_12_12_12),
-        SymOp(ROT_mY_X_mZ, TR_12_12_12),
-        SymOp(ROT_Y_mX_mZ, TR_12_12_12),
-        SymOp(ROT_mX_mZ_Y, TR_12_12_12),
-        SymOp(ROT_X_mZ_mY, TR_12_12_12),
-        SymOp(ROT_X_Z_Y, TR_12_12_12),
-        SymOp(ROT_mX_Z_mY, TR_12_12_12),
-        SymOp(ROT_mZ_mY_X, TR_12_12_12),
-        SymOp(ROT_mZ_Y_mX, TR_12_12_12),
-        SymOp(ROT_Z_mY_mX, TR_12_12_12),
-        SymOp(ROT_Z_Y_X, TR_12_12_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mX_Y_mZ, TR_0_0_0),
+        (ROT_X_mY_mZ, TR_0_0_0),
+        (ROT_Z_X_Y, TR_0_0_0),
+        (ROT_Z_mX_mY, TR_0_0_0),
+        (ROT_mZ_mX_Y, TR_0_0_0),
+        (ROT_mZ_X_mY, TR_0_0_0),
+        (ROT_Y_Z_X, TR_0_0_0),
+        (ROT_mY_Z_mX, TR_0_0_0),
+        (ROT_Y_mZ_mX, TR_0_0_0),
+        (ROT_mY_mZ_X, TR_0_0_0),
+        (ROT_Y_X_mZ, TR_0_0_0),
+        (ROT_mY_mX_mZ, TR_0_0_0),
+        (ROT_Y_mX_Z, TR_0_0_0),
+        (ROT_mY_X_Z, TR_0_0_0),
+        (ROT_X_Z_mY, TR_0_0_0),
+        (ROT_mX_Z_Y, TR_0_0_0),
+        (ROT_mX_mZ_mY, TR_0_0_0),
+        (ROT_X_mZ_Y, TR_0_0_0),
+        (ROT_Z_Y_mX, TR_0_0_0),
+        (ROT_Z_mY_X, TR_0_0_0),
+        (ROT_mZ_Y_X, TR_0_0_0),
+        (ROT_mZ_mY_mX, TR_0_0_0),
+        (ROT_mX_mY_mZ, TR_12_12_12),
+        (ROT_X_Y_mZ, TR_12_12_12),
+        (ROT_X_mY_Z, TR_12_12_12),
+        (ROT_mX_Y_Z, TR_12_12_12),
+        (ROT_mZ_mX_mY, TR_12_12_12),
+        (ROT_mZ_X_Y, TR_12_12_12),
+        (ROT_Z_X_mY, TR_12_12_12),
+        (ROT_Z_mX_Y, TR_12_12_12),
+        (ROT_mY_mZ_mX, TR_12_12_12),
+        (ROT_Y_mZ_X, TR_12_12_12),
+        (ROT_mY_Z_X, TR_12_12_12),
+        (ROT_Y_Z_mX, TR_12_12_12),
+        (ROT_mY_mX_Z, TR_12_12_12),
+        (ROT_Y_X_Z, TR_12_12_12),
+        (ROT_mY_X_mZ, TR_12_12_12),
+        (ROT_Y_mX_mZ, TR_12_12_12),
+        (ROT_mX_mZ_Y, TR_12_12_12),
+        (ROT_X_mZ_mY, TR_12_12_12),
+        (ROT_X_Z_Y, TR_12_12_12),
+        (ROT_mX_Z_mY, TR_12_12_12),
+        (ROT_mZ_mY_X, TR_12_12_12),
+        (ROT_mZ_Y_mX, TR_12_12_12),
+        (ROT_Z_mY_mX, TR_12_12_12),
+        (ROT_Z_Y_X, TR_12_12_12)])
 
 sg223 = SpaceGroup(
     number=223,
@@ -5864,55 +5862,55 @@ sg223 = SpaceGroup(
     point_group_name="PGm3barm",
     crystal_system=CUBIC,
     pdb_name="P 42/m -3 2/n",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mX_Y_mZ, TR_0_0_0),
-        SymOp(ROT_X_mY_mZ, TR_0_0_0),
-        SymOp(ROT_Z_X_Y, TR_0_0_0),
-        SymOp(ROT_Z_mX_mY, TR_0_0_0),
-        SymOp(ROT_mZ_mX_Y, TR_0_0_0),
-        SymOp(ROT_mZ_X_mY, TR_0_0_0),
-        SymOp(ROT_Y_Z_X, TR_0_0_0),
-        SymOp(ROT_mY_Z_mX, TR_0_0_0),
-        SymOp(ROT_Y_mZ_mX, TR_0_0_0),
-        SymOp(ROT_mY_mZ_X, TR_0_0_0),
-        SymOp(ROT_Y_X_mZ, TR_12_12_12),
-        SymOp(ROT_mY_mX_mZ, TR_12_12_12),
-        SymOp(ROT_Y_mX_Z, TR_12_12_12),
-        SymOp(ROT_mY_X_Z, TR_12_12_12),
-        SymOp(ROT_X_Z_mY, TR_12_12_12),
-        SymOp(ROT_mX_Z_Y, TR_12_12_12),
-        SymOp(ROT_mX_mZ_mY, TR_12_12_12),
-        SymOp(ROT_X_mZ_Y, TR_12_12_12),
-        SymOp(ROT_Z_Y_mX, TR_12_12_12),
-        SymOp(ROT_Z_mY_X, TR_12_12_12),
-        SymOp(ROT_mZ_Y_X, TR_12_12_12),
-        SymOp(ROT_mZ_mY_mX, TR_12_12_12),
-        SymOp(ROT_mX_mY_mZ, TR_0_0_0),
-        SymOp(ROT_X_Y_mZ, TR_0_0_0),
-        SymOp(ROT_X_mY_Z, TR_0_0_0),
-        SymOp(ROT_mX_Y_Z, TR_0_0_0),
-        SymOp(ROT_mZ_mX_mY, TR_0_0_0),
-        SymOp(ROT_mZ_X_Y, TR_0_0_0),
-        SymOp(ROT_Z_X_mY, TR_0_0_0),
-        SymOp(ROT_Z_mX_Y, TR_0_0_0),
-        SymOp(ROT_mY_mZ_mX, TR_0_0_0),
-        SymOp(ROT_Y_mZ_X, TR_0_0_0),
-        SymOp(ROT_mY_Z_X, TR_0_0_0),
-        SymOp(ROT_Y_Z_mX, TR_0_0_0),
-        SymOp(ROT_mY_mX_Z, TR_12_12_12),
-        SymOp(ROT_Y_X_Z, TR_12_12_12),
-        SymOp(ROT_mY_X_mZ, TR_12_12_12),
-        SymOp(ROT_Y_mX_mZ, TR_12_12_12),
-        SymOp(ROT_mX_mZ_Y, TR_12_12_12),
-        SymOp(ROT_X_mZ_mY, TR_12_12_12),
-        SymOp(ROT_X_Z_Y, TR_12_12_12),
-        SymOp(ROT_mX_Z_mY, TR_12_12_12),
-        SymOp(ROT_mZ_mY_X, TR_12_12_12),
-        SymOp(ROT_mZ_Y_mX, TR_12_12_12),
-        SymOp(ROT_Z_mY_mX, TR_12_12_12),
-        SymOp(ROT_Z_Y_X, TR_12_12_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mX_Y_mZ, TR_0_0_0),
+        (ROT_X_mY_mZ, TR_0_0_0),
+        (ROT_Z_X_Y, TR_0_0_0),
+        (ROT_Z_mX_mY, TR_0_0_0),
+        (ROT_mZ_mX_Y, TR_0_0_0),
+        (ROT_mZ_X_mY, TR_0_0_0),
+        (ROT_Y_Z_X, TR_0_0_0),
+        (ROT_mY_Z_mX, TR_0_0_0),
+        (ROT_Y_mZ_mX, TR_0_0_0),
+        (ROT_mY_mZ_X, TR_0_0_0),
+        (ROT_Y_X_mZ, TR_12_12_12),
+        (ROT_mY_mX_mZ, TR_12_12_12),
+        (ROT_Y_mX_Z, TR_12_12_12),
+        (ROT_mY_X_Z, TR_12_12_12),
+        (ROT_X_Z_mY, TR_12_12_12),
+        (ROT_mX_Z_Y, TR_12_12_12),
+        (ROT_mX_mZ_mY, TR_12_12_12),
+        (ROT_X_mZ_Y, TR_12_12_12),
+        (ROT_Z_Y_mX, TR_12_12_12),
+        (ROT_Z_mY_X, TR_12_12_12),
+        (ROT_mZ_Y_X, TR_12_12_12),
+        (ROT_mZ_mY_mX, TR_12_12_12),
+        (ROT_mX_mY_mZ, TR_0_0_0),
+        (ROT_X_Y_mZ, TR_0_0_0),
+        (ROT_X_mY_Z, TR_0_0_0),
+        (ROT_mX_Y_Z, TR_0_0_0),
+        (ROT_mZ_mX_mY, TR_0_0_0),
+        (ROT_mZ_X_Y, TR_0_0_0),
+        (ROT_Z_X_mY, TR_0_0_0),
+        (ROT_Z_mX_Y, TR_0_0_0),
+        (ROT_mY_mZ_mX, TR_0_0_0),
+        (ROT_Y_mZ_X, TR_0_0_0),
+        (ROT_mY_Z_X, TR_0_0_0),
+        (ROT_Y_Z_mX, TR_0_0_0),
+        (ROT_mY_mX_Z, TR_12_12_12),
+        (ROT_Y_X_Z, TR_12_12_12),
+        (ROT_mY_X_mZ, TR_12_12_12),
+        (ROT_Y_mX_mZ, TR_12_12_12),
+        (ROT_mX_mZ_Y, TR_12_12_12),
+        (ROT_X_mZ_mY, TR_12_12_12),
+        (ROT_X_Z_Y, TR_12_12_12),
+        (ROT_mX_Z_mY, TR_12_12_12),
+        (ROT_mZ_mY_X, TR_12_12_12),
+        (ROT_mZ_Y_mX, TR_12_12_12),
+        (ROT_Z_mY_mX, TR_12_12_12),
+        (ROT_Z_Y_X, TR_12_12_12)])
 
 sg224 = SpaceGroup(
     number=224,
@@ -5922,55 +5920,55 @@ sg224 = SpaceGroup(
     point_group_name="PGm3barm",
     crystal_system=CUBIC,
     pdb_name="P 42/n -3 2/m",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mX_Y_mZ, TR_0_0_0),
-        SymOp(ROT_X_mY_mZ, TR_0_0_0),
-        SymOp(ROT_Z_X_Y, TR_0_0_0),
-        SymOp(ROT_Z_mX_mY, TR_0_0_0),
-        SymOp(ROT_mZ_mX_Y, TR_0_0_0),
-        SymOp(ROT_mZ_X_mY, TR_0_0_0),
-        SymOp(ROT_Y_Z_X, TR_0_0_0),
-        SymOp(ROT_mY_Z_mX, TR_0_0_0),
-        SymOp(ROT_Y_mZ_mX, TR_0_0_0),
-        SymOp(ROT_mY_mZ_X, TR_0_0_0),
-        SymOp(ROT_Y_X_mZ, TR_12_12_12),
-        SymOp(ROT_mY_mX_mZ, TR_12_12_12),
-        SymOp(ROT_Y_mX_Z, TR_12_12_12),
-        SymOp(ROT_mY_X_Z, TR_12_12_12),
-        SymOp(ROT_X_Z_mY, TR_12_12_12),
-        SymOp(ROT_mX_Z_Y, TR_12_12_12),
-        SymOp(ROT_mX_mZ_mY, TR_12_12_12),
-        SymOp(ROT_X_mZ_Y, TR_12_12_12),
-        SymOp(ROT_Z_Y_mX, TR_12_12_12),
-        SymOp(ROT_Z_mY_X, TR_12_12_12),
-        SymOp(ROT_mZ_Y_X, TR_12_12_12),
-        SymOp(ROT_mZ_mY_mX, TR_12_12_12),
-        SymOp(ROT_mX_mY_mZ, TR_12_12_12),
-        SymOp(ROT_X_Y_mZ, TR_12_12_12),
-        SymOp(ROT_X_mY_Z, TR_12_12_12),
-        SymOp(ROT_mX_Y_Z, TR_12_12_12),
-        SymOp(ROT_mZ_mX_mY, TR_12_12_12),
-        SymOp(ROT_mZ_X_Y, TR_12_12_12),
-        SymOp(ROT_Z_X_mY, TR_12_12_12),
-        SymOp(ROT_Z_mX_Y, TR_12_12_12),
-        SymOp(ROT_mY_mZ_mX, TR_12_12_12),
-        SymOp(ROT_Y_mZ_X, TR_12_12_12),
-        SymOp(ROT_mY_Z_X, TR_12_12_12),
-        SymOp(ROT_Y_Z_mX, TR_12_12_12),
-        SymOp(ROT_mY_mX_Z, TR_0_0_0),
-        SymOp(ROT_Y_X_Z, TR_0_0_0),
-        SymOp(ROT_mY_X_mZ, TR_0_0_0),
-        SymOp(ROT_Y_mX_mZ, TR_0_0_0),
-        SymOp(ROT_mX_mZ_Y, TR_0_0_0),
-        SymOp(ROT_X_mZ_mY, TR_0_0_0),
-        SymOp(ROT_X_Z_Y, TR_0_0_0),
-        SymOp(ROT_mX_Z_mY, TR_0_0_0),
-        SymOp(ROT_mZ_mY_X, TR_0_0_0),
-        SymOp(ROT_mZ_Y_mX, TR_0_0_0),
-        SymOp(ROT_Z_mY_mX, TR_0_0_0),
-        SymOp(ROT_Z_Y_X, TR_0_0_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mX_Y_mZ, TR_0_0_0),
+        (ROT_X_mY_mZ, TR_0_0_0),
+        (ROT_Z_X_Y, TR_0_0_0),
+        (ROT_Z_mX_mY, TR_0_0_0),
+        (ROT_mZ_mX_Y, TR_0_0_0),
+        (ROT_mZ_X_mY, TR_0_0_0),
+        (ROT_Y_Z_X, TR_0_0_0),
+        (ROT_mY_Z_mX, TR_0_0_0),
+        (ROT_Y_mZ_mX, TR_0_0_0),
+        (ROT_mY_mZ_X, TR_0_0_0),
+        (ROT_Y_X_mZ, TR_12_12_12),
+        (ROT_mY_mX_mZ, TR_12_12_12),
+        (ROT_Y_mX_Z, TR_12_12_12),
+        (ROT_mY_X_Z, TR_12_12_12),
+        (ROT_X_Z_mY, TR_12_12_12),
+        (ROT_mX_Z_Y, TR_12_12_12),
+        (ROT_mX_mZ_mY, TR_12_12_12),
+        (ROT_X_mZ_Y, TR_12_12_12),
+        (ROT_Z_Y_mX, TR_12_12_12),
+        (ROT_Z_mY_X, TR_12_12_12),
+        (ROT_mZ_Y_X, TR_12_12_12),
+        (ROT_mZ_mY_mX, TR_12_12_12),
+        (ROT_mX_mY_mZ, TR_12_12_12),
+        (ROT_X_Y_mZ, TR_12_12_12),
+        (ROT_X_mY_Z, TR_12_12_12),
+        (ROT_mX_Y_Z, TR_12_12_12),
+        (ROT_mZ_mX_mY, TR_12_12_12),
+        (ROT_mZ_X_Y, TR_12_12_12),
+        (ROT_Z_X_mY, TR_12_12_12),
+        (ROT_Z_mX_Y, TR_12_12_12),
+        (ROT_mY_mZ_mX, TR_12_12_12),
+        (ROT_Y_mZ_X, TR_12_12_12),
+        (ROT_mY_Z_X, TR_12_12_12),
+        (ROT_Y_Z_mX, TR_12_12_12),
+        (ROT_mY_mX_Z, TR_0_0_0),
+        (ROT_Y_X_Z, TR_0_0_0),
+        (ROT_mY_X_mZ, TR_0_0_0),
+        (ROT_Y_mX_mZ, TR_0_0_0),
+        (ROT_mX_mZ_Y, TR_0_0_0),
+        (ROT_X_mZ_mY, TR_0_0_0),
+        (ROT_X_Z_Y, TR_0_0_0),
+        (ROT_mX_Z_mY, TR_0_0_0),
+        (ROT_mZ_mY_X, TR_0_0_0),
+        (ROT_mZ_Y_mX, TR_0_0_0),
+        (ROT_Z_mY_mX, TR_0_0_0),
+        (ROT_Z_Y_X, TR_0_0_0)])
 
 sg225 = SpaceGroup(
     number=225,
@@ -5980,199 +5978,199 @@ sg225 = SpaceGroup(
     point_group_name="PGm3barm",
     crystal_system=CUBIC,
     pdb_name="F 4/m -3 2/m",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mX_Y_mZ, TR_0_0_0),
-        SymOp(ROT_X_mY_mZ, TR_0_0_0),
-        SymOp(ROT_Z_X_Y, TR_0_0_0),
-        SymOp(ROT_Z_mX_mY, TR_0_0_0),
-        SymOp(ROT_mZ_mX_Y, TR_0_0_0),
-        SymOp(ROT_mZ_X_mY, TR_0_0_0),
-        SymOp(ROT_Y_Z_X, TR_0_0_0),
-        SymOp(ROT_mY_Z_mX, TR_0_0_0),
-        SymOp(ROT_Y_mZ_mX, TR_0_0_0),
-        SymOp(ROT_mY_mZ_X, TR_0_0_0),
-        SymOp(ROT_Y_X_mZ, TR_0_0_0),
-        SymOp(ROT_mY_mX_mZ, TR_0_0_0),
-        SymOp(ROT_Y_mX_Z, TR_0_0_0),
-        SymOp(ROT_mY_X_Z, TR_0_0_0),
-        SymOp(ROT_X_Z_mY, TR_0_0_0),
-        SymOp(ROT_mX_Z_Y, TR_0_0_0),
-        SymOp(ROT_mX_mZ_mY, TR_0_0_0),
-        SymOp(ROT_X_mZ_Y, TR_0_0_0),
-        SymOp(ROT_Z_Y_mX, TR_0_0_0),
-        SymOp(ROT_Z_mY_X, TR_0_0_0),
-        SymOp(ROT_mZ_Y_X, TR_0_0_0),
-        SymOp(ROT_mZ_mY_mX, TR_0_0_0),
-        SymOp(ROT_mX_mY_mZ, TR_0_0_0),
-        SymOp(ROT_X_Y_mZ, TR_0_0_0),
-        SymOp(ROT_X_mY_Z, TR_0_0_0),
-        SymOp(ROT_mX_Y_Z, TR_0_0_0),
-        SymOp(ROT_mZ_mX_mY, TR_0_0_0),
-        SymOp(ROT_mZ_X_Y, TR_0_0_0),
-        SymOp(ROT_Z_X_mY, TR_0_0_0),
-        SymOp(ROT_Z_mX_Y, TR_0_0_0),
-        SymOp(ROT_mY_mZ_mX, TR_0_0_0),
-        SymOp(ROT_Y_mZ_X, TR_0_0_0),
-        SymOp(ROT_mY_Z_X, TR_0_0_0),
-        SymOp(ROT_Y_Z_mX, TR_0_0_0),
-        SymOp(ROT_mY_mX_Z, TR_0_0_0),
-        SymOp(ROT_Y_X_Z, TR_0_0_0),
-        SymOp(ROT_mY_X_mZ, TR_0_0_0),
-        SymOp(ROT_Y_mX_mZ, TR_0_0_0),
-        SymOp(ROT_mX_mZ_Y, TR_0_0_0),
-        SymOp(ROT_X_mZ_mY, TR_0_0_0),
-        SymOp(ROT_X_Z_Y, TR_0_0_0),
-        SymOp(ROT_mX_Z_mY, TR_0_0_0),
-        SymOp(ROT_mZ_mY_X, TR_0_0_0),
-        SymOp(ROT_mZ_Y_mX, TR_0_0_0),
-        SymOp(ROT_Z_mY_mX, TR_0_0_0),
-        SymOp(ROT_Z_Y_X, TR_0_0_0),
-        SymOp(ROT_X_Y_Z, TR_0_12_12),
-        SymOp(ROT_mX_mY_Z, TR_0_12_12),
-        SymOp(ROT_mX_Y_mZ, TR_0_12_12),
-        SymOp(ROT_X_mY_mZ, TR_0_12_12),
-        SymOp(ROT_Z_X_Y, TR_0_12_12),
-        SymOp(ROT_Z_mX_mY, TR_0_12_12),
-        SymOp(ROT_mZ_mX_Y, TR_0_12_12),
-        SymOp(ROT_mZ_X_mY, TR_0_12_12),
-        SymOp(ROT_Y_Z_X, TR_0_12_12),
-        SymOp(ROT_mY_Z_mX, TR_0_12_12),
-        SymOp(ROT_Y_mZ_mX, TR_0_12_12),
-        SymOp(ROT_mY_mZ_X, TR_0_12_12),
-        SymOp(ROT_Y_X_mZ, TR_0_12_12),
-        SymOp(ROT_mY_mX_mZ, TR_0_12_12),
-        SymOp(ROT_Y_mX_Z, TR_0_12_12),
-        SymOp(ROT_mY_X_Z, TR_0_12_12),
-        SymOp(ROT_X_Z_mY, TR_0_12_12),
-        SymOp(ROT_mX_Z_Y, TR_0_12_12),
-        SymOp(ROT_mX_mZ_mY, TR_0_12_12),
-        SymOp(ROT_X_mZ_Y, TR_0_12_12),
-        SymOp(ROT_Z_Y_mX, TR_0_12_12),
-        SymOp(ROT_Z_mY_X, TR_0_12_12),
-        SymOp(ROT_mZ_Y_X, TR_0_12_12),
-        SymOp(ROT_mZ_mY_mX, TR_0_12_12),
-        SymOp(ROT_mX_mY_mZ, TR_0_12_12),
-        SymOp(ROT_X_Y_mZ, TR_0_12_12),
-        SymOp(ROT_X_mY_Z, TR_0_12_12),
-        SymOp(ROT_mX_Y_Z, TR_0_12_12),
-        SymOp(ROT_mZ_mX_mY, TR_0_12_12),
-        SymOp(ROT_mZ_X_Y, TR_0_12_12),
-        SymOp(ROT_Z_X_mY, TR_0_12_12),
-        SymOp(ROT_Z_mX_Y, TR_0_12_12),
-        SymOp(ROT_mY_mZ_mX, TR_0_12_12),
-        SymOp(ROT_Y_mZ_X, TR_0_12_12),
-        SymOp(ROT_mY_Z_X, TR_0_12_12),
-        SymOp(ROT_Y_Z_mX, TR_0_12_12),
-        SymOp(ROT_mY_mX_Z, TR_0_12_12),
-        SymOp(ROT_Y_X_Z, TR_0_12_12),
-        SymOp(ROT_mY_X_mZ, TR_0_12_12),
-        SymOp(ROT_Y_mX_mZ, TR_0_12_12),
-        SymOp(ROT_mX_mZ_Y, TR_0_12_12),
-        SymOp(ROT_X_mZ_mY, TR_0_12_12),
-        SymOp(ROT_X_Z_Y, TR_0_12_12),
-        SymOp(ROT_mX_Z_mY, TR_0_12_12),
-        SymOp(ROT_mZ_mY_X, TR_0_12_12),
-        SymOp(ROT_mZ_Y_mX, TR_0_12_12),
-        SymOp(ROT_Z_mY_mX, TR_0_12_12),
-        SymOp(ROT_Z_Y_X, TR_0_12_12),
-        SymOp(ROT_X_Y_Z, TR_12_0_12),
-        SymOp(ROT_mX_mY_Z, TR_12_0_12),
-        SymOp(ROT_mX_Y_mZ, TR_12_0_12),
-        SymOp(ROT_X_mY_mZ, TR_12_0_12),
-        SymOp(ROT_Z_X_Y, TR_12_0_12),
-        SymOp(ROT_Z_mX_mY, TR_12_0_12),
-        SymOp(ROT_mZ_mX_Y, TR_12_0_12),
-        SymOp(ROT_mZ_X_mY, TR_12_0_12),
-        SymOp(ROT_Y_Z_X, TR_12_0_12),
-        SymOp(ROT_mY_Z_mX, TR_12_0_12),
-        SymOp(ROT_Y_mZ_mX, TR_12_0_12),
-        SymOp(ROT_mY_mZ_X, TR_12_0_12),
-        SymOp(ROT_Y_X_mZ, TR_12_0_12),
-        SymOp(ROT_mY_mX_mZ, TR_12_0_12),
-        SymOp(ROT_Y_mX_Z, TR_12_0_12),
-        SymOp(ROT_mY_X_Z, TR_12_0_12),
-        SymOp(ROT_X_Z_mY, TR_12_0_12),
-        SymOp(ROT_mX_Z_Y, TR_12_0_12),
-        SymOp(ROT_mX_mZ_mY, TR_12_0_12),
-        SymOp(ROT_X_mZ_Y, TR_12_0_12),
-        SymOp(ROT_Z_Y_mX, TR_12_0_12),
-        SymOp(ROT_Z_mY_X, TR_12_0_12),
-        SymOp(ROT_mZ_Y_X, TR_12_0_12),
-        SymOp(ROT_mZ_mY_mX, TR_12_0_12),
-        SymOp(ROT_mX_mY_mZ, TR_12_0_12),
-        SymOp(ROT_X_Y_mZ, TR_12_0_12),
-        SymOp(ROT_X_mY_Z, TR_12_0_12),
-        SymOp(ROT_mX_Y_Z, TR_12_0_12),
-        SymOp(ROT_mZ_mX_mY, TR_12_0_12),
-        SymOp(ROT_mZ_X_Y, TR_12_0_12),
-        SymOp(ROT_Z_X_mY, TR_12_0_12),
-        SymOp(ROT_Z_mX_Y, TR_12_0_12),
-        SymOp(ROT_mY_mZ_mX, TR_12_0_12),
-        SymOp(ROT_Y_mZ_X, TR_12_0_12),
-        SymOp(ROT_mY_Z_X, TR_12_0_12),
-        SymOp(ROT_Y_Z_mX, TR_12_0_12),
-        SymOp(ROT_mY_mX_Z, TR_12_0_12),
-        SymOp(ROT_Y_X_Z, TR_12_0_12),
-        SymOp(ROT_mY_X_mZ, TR_12_0_12),
-        SymOp(ROT_Y_mX_mZ, TR_12_0_12),
-        SymOp(ROT_mX_mZ_Y, TR_12_0_12),
-        SymOp(ROT_X_mZ_mY, TR_12_0_12),
-        SymOp(ROT_X_Z_Y, TR_12_0_12),
-        SymOp(ROT_mX_Z_mY, TR_12_0_12),
-        SymOp(ROT_mZ_mY_X, TR_12_0_12),
-        SymOp(ROT_mZ_Y_mX, TR_12_0_12),
-        SymOp(ROT_Z_mY_mX, TR_12_0_12),
-        SymOp(ROT_Z_Y_X, TR_12_0_12),
-        SymOp(ROT_X_Y_Z, TR_12_12_0),
-        SymOp(ROT_mX_mY_Z, TR_12_12_0),
-        SymOp(ROT_mX_Y_mZ, TR_12_12_0),
-        SymOp(ROT_X_mY_mZ, TR_12_12_0),
-        SymOp(ROT_Z_X_Y, TR_12_12_0),
-        SymOp(ROT_Z_mX_mY, TR_12_12_0),
-        SymOp(ROT_mZ_mX_Y, TR_12_12_0),
-        SymOp(ROT_mZ_X_mY, TR_12_12_0),
-        SymOp(ROT_Y_Z_X, TR_12_12_0),
-        SymOp(ROT_mY_Z_mX, TR_12_12_0),
-        SymOp(ROT_Y_mZ_mX, TR_12_12_0),
-        SymOp(ROT_mY_mZ_X, TR_12_12_0),
-        SymOp(ROT_Y_X_mZ, TR_12_12_0),
-        SymOp(ROT_mY_mX_mZ, TR_12_12_0),
-        SymOp(ROT_Y_mX_Z, TR_12_12_0),
-        SymOp(ROT_mY_X_Z, TR_12_12_0),
-        SymOp(ROT_X_Z_mY, TR_12_12_0),
-        SymOp(ROT_mX_Z_Y, TR_12_12_0),
-        SymOp(ROT_mX_mZ_mY, TR_12_12_0),
-        SymOp(ROT_X_mZ_Y, TR_12_12_0),
-        SymOp(ROT_Z_Y_mX, TR_12_12_0),
-        SymOp(ROT_Z_mY_X, TR_12_12_0),
-        SymOp(ROT_mZ_Y_X, TR_12_12_0),
-        SymOp(ROT_mZ_mY_mX, TR_12_12_0),
-        SymOp(ROT_mX_mY_mZ, TR_12_12_0),
-        SymOp(ROT_X_Y_mZ, TR_12_12_0),
-        SymOp(ROT_X_mY_Z, TR_12_12_0),
-        SymOp(ROT_mX_Y_Z, TR_12_12_0),
-        SymOp(ROT_mZ_mX_mY, TR_12_12_0),
-        SymOp(ROT_mZ_X_Y, TR_12_12_0),
-        SymOp(ROT_Z_X_mY, TR_12_12_0),
-        SymOp(ROT_Z_mX_Y, TR_12_12_0),
-        SymOp(ROT_mY_mZ_mX, TR_12_12_0),
-        SymOp(ROT_Y_mZ_X, TR_12_12_0),
-        SymOp(ROT_mY_Z_X, TR_12_12_0),
-        SymOp(ROT_Y_Z_mX, TR_12_12_0),
-        SymOp(ROT_mY_mX_Z, TR_12_12_0),
-        SymOp(ROT_Y_X_Z, TR_12_12_0),
-        SymOp(ROT_mY_X_mZ, TR_12_12_0),
-        SymOp(ROT_Y_mX_mZ, TR_12_12_0),
-        SymOp(ROT_mX_mZ_Y, TR_12_12_0),
-        SymOp(ROT_X_mZ_mY, TR_12_12_0),
-        SymOp(ROT_X_Z_Y, TR_12_12_0),
-        SymOp(ROT_mX_Z_mY, TR_12_12_0),
-        SymOp(ROT_mZ_mY_X, TR_12_12_0),
-        SymOp(ROT_mZ_Y_mX, TR_12_12_0),
-        SymOp(ROT_Z_mY_mX, TR_12_12_0),
-        SymOp(ROT_Z_Y_X, TR_12_12_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mX_Y_mZ, TR_0_0_0),
+        (ROT_X_mY_mZ, TR_0_0_0),
+        (ROT_Z_X_Y, TR_0_0_0),
+        (ROT_Z_mX_mY, TR_0_0_0),
+        (ROT_mZ_mX_Y, TR_0_0_0),
+        (ROT_mZ_X_mY, TR_0_0_0),
+        (ROT_Y_Z_X, TR_0_0_0),
+        (ROT_mY_Z_mX, TR_0_0_0),
+        (ROT_Y_mZ_mX, TR_0_0_0),
+        (ROT_mY_mZ_X, TR_0_0_0),
+        (ROT_Y_X_mZ, TR_0_0_0),
+        (ROT_mY_mX_mZ, TR_0_0_0),
+        (ROT_Y_mX_Z, TR_0_0_0),
+        (ROT_mY_X_Z, TR_0_0_0),
+        (ROT_X_Z_mY, TR_0_0_0),
+        (ROT_mX_Z_Y, TR_0_0_0),
+        (ROT_mX_mZ_mY, TR_0_0_0),
+        (ROT_X_mZ_Y, TR_0_0_0),
+        (ROT_Z_Y_mX, TR_0_0_0),
+        (ROT_Z_mY_X, TR_0_0_0),
+        (ROT_mZ_Y_X, TR_0_0_0),
+        (ROT_mZ_mY_mX, TR_0_0_0),
+        (ROT_mX_mY_mZ, TR_0_0_0),
+        (ROT_X_Y_mZ, TR_0_0_0),
+        (ROT_X_mY_Z, TR_0_0_0),
+        (ROT_mX_Y_Z, TR_0_0_0),
+        (ROT_mZ_mX_mY, TR_0_0_0),
+        (ROT_mZ_X_Y, TR_0_0_0),
+        (ROT_Z_X_mY, TR_0_0_0),
+        (ROT_Z_mX_Y, TR_0_0_0),
+        (ROT_mY_mZ_mX, TR_0_0_0),
+        (ROT_Y_mZ_X, TR_0_0_0),
+        (ROT_mY_Z_X, TR_0_0_0),
+        (ROT_Y_Z_mX, TR_0_0_0),
+        (ROT_mY_mX_Z, TR_0_0_0),
+        (ROT_Y_X_Z, TR_0_0_0),
+        (ROT_mY_X_mZ, TR_0_0_0),
+        (ROT_Y_mX_mZ, TR_0_0_0),
+        (ROT_mX_mZ_Y, TR_0_0_0),
+        (ROT_X_mZ_mY, TR_0_0_0),
+        (ROT_X_Z_Y, TR_0_0_0),
+        (ROT_mX_Z_mY, TR_0_0_0),
+        (ROT_mZ_mY_X, TR_0_0_0),
+        (ROT_mZ_Y_mX, TR_0_0_0),
+        (ROT_Z_mY_mX, TR_0_0_0),
+        (ROT_Z_Y_X, TR_0_0_0),
+        (ROT_X_Y_Z, TR_0_12_12),
+        (ROT_mX_mY_Z, TR_0_12_12),
+        (ROT_mX_Y_mZ, TR_0_12_12),
+        (ROT_X_mY_mZ, TR_0_12_12),
+        (ROT_Z_X_Y, TR_0_12_12),
+        (ROT_Z_mX_mY, TR_0_12_12),
+        (ROT_mZ_mX_Y, TR_0_12_12),
+        (ROT_mZ_X_mY, TR_0_12_12),
+        (ROT_Y_Z_X, TR_0_12_12),
+        (ROT_mY_Z_mX, TR_0_12_12),
+        (ROT_Y_mZ_mX, TR_0_12_12),
+        (ROT_mY_mZ_X, TR_0_12_12),
+        (ROT_Y_X_mZ, TR_0_12_12),
+        (ROT_mY_mX_mZ, TR_0_12_12),
+        (ROT_Y_mX_Z, TR_0_12_12),
+        (ROT_mY_X_Z, TR_0_12_12),
+        (ROT_X_Z_mY, TR_0_12_12),
+        (ROT_mX_Z_Y, TR_0_12_12),
+        (ROT_mX_mZ_mY, TR_0_12_12),
+        (ROT_X_mZ_Y, TR_0_12_12),
+        (ROT_Z_Y_mX, TR_0_12_12),
+        (ROT_Z_mY_X, TR_0_12_12),
+        (ROT_mZ_Y_X, TR_0_12_12),
+        (ROT_mZ_mY_mX, TR_0_12_12),
+        (ROT_mX_mY_mZ, TR_0_12_12),
+        (ROT_X_Y_mZ, TR_0_12_12),
+        (ROT_X_mY_Z, TR_0_12_12),
+        (ROT_mX_Y_Z, TR_0_12_12),
+        (ROT_mZ_mX_mY, TR_0_12_12),
+        (ROT_mZ_X_Y, TR_0_12_12),
+        (ROT_Z_X_mY, TR_0_12_12),
+        (ROT_Z_mX_Y, TR_0_12_12),
+        (ROT_mY_mZ_mX, TR_0_12_12),
+        (ROT_Y_mZ_X, TR_0_12_12),
+        (ROT_mY_Z_X, TR_0_12_12),
+        (ROT_Y_Z_mX, TR_0_12_12),
+        (ROT_mY_mX_Z, TR_0_12_12),
+        (ROT_Y_X_Z, TR_0_12_12),
+        (ROT_mY_X_mZ, TR_0_12_12),
+        (ROT_Y_mX_mZ, TR_0_12_12),
+        (ROT_mX_mZ_Y, TR_0_12_12),
+        (ROT_X_mZ_mY, TR_0_12_12),
+        (ROT_X_Z_Y, TR_0_12_12),
+        (ROT_mX_Z_mY, TR_0_12_12),
+        (ROT_mZ_mY_X, TR_0_12_12),
+        (ROT_mZ_Y_mX, TR_0_12_12),
+        (ROT_Z_mY_mX, TR_0_12_12),
+        (ROT_Z_Y_X, TR_0_12_12),
+        (ROT_X_Y_Z, TR_12_0_12),
+        (ROT_mX_mY_Z, TR_12_0_12),
+        (ROT_mX_Y_mZ, TR_12_0_12),
+        (ROT_X_mY_mZ, TR_12_0_12),
+        (ROT_Z_X_Y, TR_12_0_12),
+        (ROT_Z_mX_mY, TR_12_0_12),
+        (ROT_mZ_mX_Y, TR_12_0_12),
+        (ROT_mZ_X_mY, TR_12_0_12),
+        (ROT_Y_Z_X, TR_12_0_12),
+        (ROT_mY_Z_mX, TR_12_0_12),
+        (ROT_Y_mZ_mX, TR_12_0_12),
+        (ROT_mY_mZ_X, TR_12_0_12),
+        (ROT_Y_X_mZ, TR_12_0_12),
+        (ROT_mY_mX_mZ, TR_12_0_12),
+        (ROT_Y_mX_Z, TR_12_0_12),
+        (ROT_mY_X_Z, TR_12_0_12),
+        (ROT_X_Z_mY, TR_12_0_12),
+        (ROT_mX_Z_Y, TR_12_0_12),
+        (ROT_mX_mZ_mY, TR_12_0_12),
+        (ROT_X_mZ_Y, TR_12_0_12),
+        (ROT_Z_Y_mX, TR_12_0_12),
+        (ROT_Z_mY_X, TR_12_0_12),
+        (ROT_mZ_Y_X, TR_12_0_12),
+        (ROT_mZ_mY_mX, TR_12_0_12),
+        (ROT_mX_mY_mZ, TR_12_0_12),
+        (ROT_X_Y_mZ, TR_12_0_12),
+        (ROT_X_mY_Z, TR_12_0_12),
+        (ROT_mX_Y_Z, TR_12_0_12),
+        (ROT_mZ_mX_mY, TR_12_0_12),
+        (ROT_mZ_X_Y, TR_12_0_12),
+        (ROT_Z_X_mY, TR_12_0_12),
+        (ROT_Z_mX_Y, TR_12_0_12),
+        (ROT_mY_mZ_mX, TR_12_0_12),
+        (ROT_Y_mZ_X, TR_12_0_12),
+        (ROT_mY_Z_X, TR_12_0_12),
+        (ROT_Y_Z_mX, TR_12_0_12),
+        (ROT_mY_mX_Z, TR_12_0_12),
+        (ROT_Y_X_Z, TR_12_0_12),
+        (ROT_mY_X_mZ, TR_12_0_12),
+        (ROT_Y_mX_mZ, TR_12_0_12),
+        (ROT_mX_mZ_Y, TR_12_0_12),
+        (ROT_X_mZ_mY, TR_12_0_12),
+        (ROT_X_Z_Y, TR_12_0_12),
+        (ROT_mX_Z_mY, TR_12_0_12),
+        (ROT_mZ_mY_X, TR_12_0_12),
+        (ROT_mZ_Y_mX, TR_12_0_12),
+        (ROT_Z_mY_mX, TR_12_0_12),
+        (ROT_Z_Y_X, TR_12_0_12),
+        (ROT_X_Y_Z, TR_12_12_0),
+        (ROT_mX_mY_Z, TR_12_12_0),
+        (ROT_mX_Y_mZ, TR_12_12_0),
+        (ROT_X_mY_mZ, TR_12_12_0),
+        (ROT_Z_X_Y, TR_12_12_0),
+        (ROT_Z_mX_mY, TR_12_12_0),
+        (ROT_mZ_mX_Y, TR_12_12_0),
+        (ROT_mZ_X_mY, TR_12_12_0),
+        (ROT_Y_Z_X, TR_12_12_0),
+        (ROT_mY_Z_mX, TR_12_12_0),
+        (ROT_Y_mZ_mX, TR_12_12_0),
+        (ROT_mY_mZ_X, TR_12_12_0),
+        (ROT_Y_X_mZ, TR_12_12_0),
+        (ROT_mY_mX_mZ, TR_12_12_0),
+        (ROT_Y_mX_Z, TR_12_12_0),
+        (ROT_mY_X_Z, TR_12_12_0),
+        (ROT_X_Z_mY, TR_12_12_0),
+        (ROT_mX_Z_Y, TR_12_12_0),
+        (ROT_mX_mZ_mY, TR_12_12_0),
+        (ROT_X_mZ_Y, TR_12_12_0),
+        (ROT_Z_Y_mX, TR_12_12_0),
+        (ROT_Z_mY_X, TR_12_12_0),
+        (ROT_mZ_Y_X, TR_12_12_0),
+        (ROT_mZ_mY_mX, TR_12_12_0),
+        (ROT_mX_mY_mZ, TR_12_12_0),
+        (ROT_X_Y_mZ, TR_12_12_0),
+        (ROT_X_mY_Z, TR_12_12_0),
+        (ROT_mX_Y_Z, TR_12_12_0),
+        (ROT_mZ_mX_mY, TR_12_12_0),
+        (ROT_mZ_X_Y, TR_12_12_0),
+        (ROT_Z_X_mY, TR_12_12_0),
+        (ROT_Z_mX_Y, TR_12_12_0),
+        (ROT_mY_mZ_mX, TR_12_12_0),
+        (ROT_Y_mZ_X, TR_12_12_0),
+        (ROT_mY_Z_X, TR_12_12_0),
+        (ROT_Y_Z_mX, TR_12_12_0),
+        (ROT_mY_mX_Z, TR_12_12_0),
+        (ROT_Y_X_Z, TR_12_12_0),
+        (ROT_mY_X_mZ, TR_12_12_0),
+        (ROT_Y_mX_mZ, TR_12_12_0),
+        (ROT_mX_mZ_Y, TR_12_12_0),
+        (ROT_X_mZ_mY, TR_12_12_0),
+        (ROT_X_Z_Y, TR_12_12_0),
+        (ROT_mX_Z_mY, TR_12_12_0),
+        (ROT_mZ_mY_X, TR_12_12_0),
+        (ROT_mZ_Y_mX, TR_12_12_0),
+        (ROT_Z_mY_mX, TR_12_12_0),
+        (ROT_Z_Y_X, TR_12_12_0)])
 
 sg226 = SpaceGroup(
     number=226,
@@ -6182,199 +6180,199 @@ sg226 = SpaceGroup(
     point_group_name="PGm3barm",
     crystal_system=CUBIC,
     pdb_name="F 4/m -3 2/c",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mX_Y_mZ, TR_0_0_0),
-        SymOp(ROT_X_mY_mZ, TR_0_0_0),
-        SymOp(ROT_Z_X_Y, TR_0_0_0),
-        SymOp(ROT_Z_mX_mY, TR_0_0_0),
-        SymOp(ROT_mZ_mX_Y, TR_0_0_0),
-        SymOp(ROT_mZ_X_mY, TR_0_0_0),
-        SymOp(ROT_Y_Z_X, TR_0_0_0),
-        SymOp(ROT_mY_Z_mX, TR_0_0_0),
-        SymOp(ROT_Y_mZ_mX, TR_0_0_0),
-        SymOp(ROT_mY_mZ_X, TR_0_0_0),
-        SymOp(ROT_Y_X_mZ, TR_12_12_12),
-        SymOp(ROT_mY_mX_mZ, TR_12_12_12),
-        SymOp(ROT_Y_mX_Z, TR_12_12_12),
-        SymOp(ROT_mY_X_Z, TR_12_12_12),
-        SymOp(ROT_X_Z_mY, TR_12_12_12),
-        SymOp(ROT_mX_Z_Y, TR_12_12_12),
-        SymOp(ROT_mX_mZ_mY, TR_12_12_12),
-        SymOp(ROT_X_mZ_Y, TR_12_12_12),
-        SymOp(ROT_Z_Y_mX, TR_12_12_12),
-        SymOp(ROT_Z_mY_X, TR_12_12_12),
-        SymOp(ROT_mZ_Y_X, TR_12_12_12),
-        SymOp(ROT_mZ_mY_mX, TR_12_12_12),
-        SymOp(ROT_mX_mY_mZ, TR_0_0_0),
-        SymOp(ROT_X_Y_mZ, TR_0_0_0),
-        SymOp(ROT_X_mY_Z, TR_0_0_0),
-        SymOp(ROT_mX_Y_Z, TR_0_0_0),
-        SymOp(ROT_mZ_mX_mY, TR_0_0_0),
-        SymOp(ROT_mZ_X_Y, TR_0_0_0),
-        SymOp(ROT_Z_X_mY, TR_0_0_0),
-        SymOp(ROT_Z_mX_Y, TR_0_0_0),
-        SymOp(ROT_mY_mZ_mX, TR_0_0_0),
-        SymOp(ROT_Y_mZ_X, TR_0_0_0),
-        SymOp(ROT_mY_Z_X, TR_0_0_0),
-        SymOp(ROT_Y_Z_mX, TR_0_0_0),
-        SymOp(ROT_mY_mX_Z, TR_12_12_12),
-        SymOp(ROT_Y_X_Z, TR_12_12_12),
-        SymOp(ROT_mY_X_mZ, TR_12_12_12),
-        SymOp(ROT_Y_mX_mZ, TR_12_12_12),
-        SymOp(ROT_mX_mZ_Y, TR_12_12_12),
-        SymOp(ROT_X_mZ_mY, TR_12_12_12),
-        SymOp(ROT_X_Z_Y, TR_12_12_12),
-        SymOp(ROT_mX_Z_mY, TR_12_12_12),
-        SymOp(ROT_mZ_mY_X, TR_12_12_12),
-        SymOp(ROT_mZ_Y_mX, TR_12_12_12),
-        SymOp(ROT_Z_mY_mX, TR_12_12_12),
-        SymOp(ROT_Z_Y_X, TR_12_12_12),
-        SymOp(ROT_X_Y_Z, TR_0_12_12),
-        SymOp(ROT_mX_mY_Z, TR_0_12_12),
-        SymOp(ROT_mX_Y_mZ, TR_0_12_12),
-        SymOp(ROT_X_mY_mZ, TR_0_12_12),
-        SymOp(ROT_Z_X_Y, TR_0_12_12),
-        SymOp(ROT_Z_mX_mY, TR_0_12_12),
-        SymOp(ROT_mZ_mX_Y, TR_0_12_12),
-        SymOp(ROT_mZ_X_mY, TR_0_12_12),
-        SymOp(ROT_Y_Z_X, TR_0_12_12),
-        SymOp(ROT_mY_Z_mX, TR_0_12_12),
-        SymOp(ROT_Y_mZ_mX, TR_0_12_12),
-        SymOp(ROT_mY_mZ_X, TR_0_12_12),
-        SymOp(ROT_Y_X_mZ, TR_12_0_0),
-        SymOp(ROT_mY_mX_mZ, TR_12_0_0),
-        SymOp(ROT_Y_mX_Z, TR_12_0_0),
-        SymOp(ROT_mY_X_Z, TR_12_0_0),
-        SymOp(ROT_X_Z_mY, TR_12_0_0),
-        SymOp(ROT_mX_Z_Y, TR_12_0_0),
-        SymOp(ROT_mX_mZ_mY, TR_12_0_0),
-        SymOp(ROT_X_mZ_Y, TR_12_0_0),
-        SymOp(ROT_Z_Y_mX, TR_12_0_0),
-        SymOp(ROT_Z_mY_X, TR_12_0_0),
-        SymOp(ROT_mZ_Y_X, TR_12_0_0),
-        SymOp(ROT_mZ_mY_mX, TR_12_0_0),
-        SymOp(ROT_mX_mY_mZ, TR_0_12_12),
-        SymOp(ROT_X_Y_mZ, TR_0_12_12),
-        SymOp(ROT_X_mY_Z, TR_0_12_12),
-        SymOp(ROT_mX_Y_Z, TR_0_12_12),
-        SymOp(ROT_mZ_mX_mY, TR_0_12_12),
-        SymOp(ROT_mZ_X_Y, TR_0_12_12),
-        SymOp(ROT_Z_X_mY, TR_0_12_12),
-        SymOp(ROT_Z_mX_Y, TR_0_12_12),
-        SymOp(ROT_mY_mZ_mX, TR_0_12_12),
-        SymOp(ROT_Y_mZ_X, TR_0_12_12),
-        SymOp(ROT_mY_Z_X, TR_0_12_12),
-        SymOp(ROT_Y_Z_mX, TR_0_12_12),
-        SymOp(ROT_mY_mX_Z, TR_12_0_0),
-        SymOp(ROT_Y_X_Z, TR_12_0_0),
-        SymOp(ROT_mY_X_mZ, TR_12_0_0),
-        SymOp(ROT_Y_mX_mZ, TR_12_0_0),
-        SymOp(ROT_mX_mZ_Y, TR_12_0_0),
-        SymOp(ROT_X_mZ_mY, TR_12_0_0),
-        SymOp(ROT_X_Z_Y, TR_12_0_0),
-        SymOp(ROT_mX_Z_mY, TR_12_0_0),
-        SymOp(ROT_mZ_mY_X, TR_12_0_0),
-        SymOp(ROT_mZ_Y_mX, TR_12_0_0),
-        SymOp(ROT_Z_mY_mX, TR_12_0_0),
-        SymOp(ROT_Z_Y_X, TR_12_0_0),
-        SymOp(ROT_X_Y_Z, TR_12_0_12),
-        SymOp(ROT_mX_mY_Z, TR_12_0_12),
-        SymOp(ROT_mX_Y_mZ, TR_12_0_12),
-        SymOp(ROT_X_mY_mZ, TR_12_0_12),
-        SymOp(ROT_Z_X_Y, TR_12_0_12),
-        SymOp(ROT_Z_mX_mY, TR_12_0_12),
-        SymOp(ROT_mZ_mX_Y, TR_12_0_12),
-        SymOp(ROT_mZ_X_mY, TR_12_0_12),
-        SymOp(ROT_Y_Z_X, TR_12_0_12),
-        SymOp(ROT_mY_Z_mX, TR_12_0_12),
-        SymOp(ROT_Y_mZ_mX, TR_12_0_12),
-        SymOp(ROT_mY_mZ_X, TR_12_0_12),
-        SymOp(ROT_Y_X_mZ, TR_0_12_0),
-        SymOp(ROT_mY_mX_mZ, TR_0_12_0),
-        SymOp(ROT_Y_mX_Z, TR_0_12_0),
-        SymOp(ROT_mY_X_Z, TR_0_12_0),
-        SymOp(ROT_X_Z_mY, TR_0_12_0),
-        SymOp(ROT_mX_Z_Y, TR_0_12_0),
-        SymOp(ROT_mX_mZ_mY, TR_0_12_0),
-        SymOp(ROT_X_mZ_Y, TR_0_12_0),
-        SymOp(ROT_Z_Y_mX, TR_0_12_0),
-        SymOp(ROT_Z_mY_X, TR_0_12_0),
-        SymOp(ROT_mZ_Y_X, TR_0_12_0),
-        SymOp(ROT_mZ_mY_mX, TR_0_12_0),
-        SymOp(ROT_mX_mY_mZ, TR_12_0_12),
-        SymOp(ROT_X_Y_mZ, TR_12_0_12),
-        SymOp(ROT_X_mY_Z, TR_12_0_12),
-        SymOp(ROT_mX_Y_Z, TR_12_0_12),
-        SymOp(ROT_mZ_mX_mY, TR_12_0_12),
-        SymOp(ROT_mZ_X_Y, TR_12_0_12),
-        SymOp(ROT_Z_X_mY, TR_12_0_12),
-        SymOp(ROT_Z_mX_Y, TR_12_0_12),
-        SymOp(ROT_mY_mZ_mX, TR_12_0_12),
-        SymOp(ROT_Y_mZ_X, TR_12_0_12),
-        SymOp(ROT_mY_Z_X, TR_12_0_12),
-        SymOp(ROT_Y_Z_mX, TR_12_0_12),
-        SymOp(ROT_mY_mX_Z, TR_0_12_0),
-        SymOp(ROT_Y_X_Z, TR_0_12_0),
-        SymOp(ROT_mY_X_mZ, TR_0_12_0),
-        SymOp(ROT_Y_mX_mZ, TR_0_12_0),
-        SymOp(ROT_mX_mZ_Y, TR_0_12_0),
-        SymOp(ROT_X_mZ_mY, TR_0_12_0),
-        SymOp(ROT_X_Z_Y, TR_0_12_0),
-        SymOp(ROT_mX_Z_mY, TR_0_12_0),
-        SymOp(ROT_mZ_mY_X, TR_0_12_0),
-        SymOp(ROT_mZ_Y_mX, TR_0_12_0),
-        SymOp(ROT_Z_mY_mX, TR_0_12_0),
-        SymOp(ROT_Z_Y_X, TR_0_12_0),
-        SymOp(ROT_X_Y_Z, TR_12_12_0),
-        SymOp(ROT_mX_mY_Z, TR_12_12_0),
-        SymOp(ROT_mX_Y_mZ, TR_12_12_0),
-        SymOp(ROT_X_mY_mZ, TR_12_12_0),
-        SymOp(ROT_Z_X_Y, TR_12_12_0),
-        SymOp(ROT_Z_mX_mY, TR_12_12_0),
-        SymOp(ROT_mZ_mX_Y, TR_12_12_0),
-        SymOp(ROT_mZ_X_mY, TR_12_12_0),
-        SymOp(ROT_Y_Z_X, TR_12_12_0),
-        SymOp(ROT_mY_Z_mX, TR_12_12_0),
-        SymOp(ROT_Y_mZ_mX, TR_12_12_0),
-        SymOp(ROT_mY_mZ_X, TR_12_12_0),
-        SymOp(ROT_Y_X_mZ, TR_0_0_12),
-        SymOp(ROT_mY_mX_mZ, TR_0_0_12),
-        SymOp(ROT_Y_mX_Z, TR_0_0_12),
-        SymOp(ROT_mY_X_Z, TR_0_0_12),
-        SymOp(ROT_X_Z_mY, TR_0_0_12),
-        SymOp(ROT_mX_Z_Y, TR_0_0_12),
-        SymOp(ROT_mX_mZ_mY, TR_0_0_12),
-        SymOp(ROT_X_mZ_Y, TR_0_0_12),
-        SymOp(ROT_Z_Y_mX, TR_0_0_12),
-        SymOp(ROT_Z_mY_X, TR_0_0_12),
-        SymOp(ROT_mZ_Y_X, TR_0_0_12),
-        SymOp(ROT_mZ_mY_mX, TR_0_0_12),
-        SymOp(ROT_mX_mY_mZ, TR_12_12_0),
-        SymOp(ROT_X_Y_mZ, TR_12_12_0),
-        SymOp(ROT_X_mY_Z, TR_12_12_0),
-        SymOp(ROT_mX_Y_Z, TR_12_12_0),
-        SymOp(ROT_mZ_mX_mY, TR_12_12_0),
-        SymOp(ROT_mZ_X_Y, TR_12_12_0),
-        SymOp(ROT_Z_X_mY, TR_12_12_0),
-        SymOp(ROT_Z_mX_Y, TR_12_12_0),
-        SymOp(ROT_mY_mZ_mX, TR_12_12_0),
-        SymOp(ROT_Y_mZ_X, TR_12_12_0),
-        SymOp(ROT_mY_Z_X, TR_12_12_0),
-        SymOp(ROT_Y_Z_mX, TR_12_12_0),
-        SymOp(ROT_mY_mX_Z, TR_0_0_12),
-        SymOp(ROT_Y_X_Z, TR_0_0_12),
-        SymOp(ROT_mY_X_mZ, TR_0_0_12),
-        SymOp(ROT_Y_mX_mZ, TR_0_0_12),
-        SymOp(ROT_mX_mZ_Y, TR_0_0_12),
-        SymOp(ROT_X_mZ_mY, TR_0_0_12),
-        SymOp(ROT_X_Z_Y, TR_0_0_12),
-        SymOp(ROT_mX_Z_mY, TR_0_0_12),
-        SymOp(ROT_mZ_mY_X, TR_0_0_12),
-        SymOp(ROT_mZ_Y_mX, TR_0_0_12),
-        SymOp(ROT_Z_mY_mX, TR_0_0_12),
-        SymOp(ROT_Z_Y_X, TR_0_0_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mX_Y_mZ, TR_0_0_0),
+        (ROT_X_mY_mZ, TR_0_0_0),
+        (ROT_Z_X_Y, TR_0_0_0),
+        (ROT_Z_mX_mY, TR_0_0_0),
+        (ROT_mZ_mX_Y, TR_0_0_0),
+        (ROT_mZ_X_mY, TR_0_0_0),
+        (ROT_Y_Z_X, TR_0_0_0),
+        (ROT_mY_Z_mX, TR_0_0_0),
+        (ROT_Y_mZ_mX, TR_0_0_0),
+        (ROT_mY_mZ_X, TR_0_0_0),
+        (ROT_Y_X_mZ, TR_12_12_12),
+        (ROT_mY_mX_mZ, TR_12_12_12),
+        (ROT_Y_mX_Z, TR_12_12_12),
+        (ROT_mY_X_Z, TR_12_12_12),
+        (ROT_X_Z_mY, TR_12_12_12),
+        (ROT_mX_Z_Y, TR_12_12_12),
+        (ROT_mX_mZ_mY, TR_12_12_12),
+        (ROT_X_mZ_Y, TR_12_12_12),
+        (ROT_Z_Y_mX, TR_12_12_12),
+        (ROT_Z_mY_X, TR_12_12_12),
+        (ROT_mZ_Y_X, TR_12_12_12),
+        (ROT_mZ_mY_mX, TR_12_12_12),
+        (ROT_mX_mY_mZ, TR_0_0_0),
+        (ROT_X_Y_mZ, TR_0_0_0),
+        (ROT_X_mY_Z, TR_0_0_0),
+        (ROT_mX_Y_Z, TR_0_0_0),
+        (ROT_mZ_mX_mY, TR_0_0_0),
+        (ROT_mZ_X_Y, TR_0_0_0),
+        (ROT_Z_X_mY, TR_0_0_0),
+        (ROT_Z_mX_Y, TR_0_0_0),
+        (ROT_mY_mZ_mX, TR_0_0_0),
+        (ROT_Y_mZ_X, TR_0_0_0),
+        (ROT_mY_Z_X, TR_0_0_0),
+        (ROT_Y_Z_mX, TR_0_0_0),
+        (ROT_mY_mX_Z, TR_12_12_12),
+        (ROT_Y_X_Z, TR_12_12_12),
+        (ROT_mY_X_mZ, TR_12_12_12),
+        (ROT_Y_mX_mZ, TR_12_12_12),
+        (ROT_mX_mZ_Y, TR_12_12_12),
+        (ROT_X_mZ_mY, TR_12_12_12),
+        (ROT_X_Z_Y, TR_12_12_12),
+        (ROT_mX_Z_mY, TR_12_12_12),
+        (ROT_mZ_mY_X, TR_12_12_12),
+        (ROT_mZ_Y_mX, TR_12_12_12),
+        (ROT_Z_mY_mX, TR_12_12_12),
+        (ROT_Z_Y_X, TR_12_12_12),
+        (ROT_X_Y_Z, TR_0_12_12),
+        (ROT_mX_mY_Z, TR_0_12_12),
+        (ROT_mX_Y_mZ, TR_0_12_12),
+        (ROT_X_mY_mZ, TR_0_12_12),
+        (ROT_Z_X_Y, TR_0_12_12),
+        (ROT_Z_mX_mY, TR_0_12_12),
+        (ROT_mZ_mX_Y, TR_0_12_12),
+        (ROT_mZ_X_mY, TR_0_12_12),
+        (ROT_Y_Z_X, TR_0_12_12),
+        (ROT_mY_Z_mX, TR_0_12_12),
+        (ROT_Y_mZ_mX, TR_0_12_12),
+        (ROT_mY_mZ_X, TR_0_12_12),
+        (ROT_Y_X_mZ, TR_12_0_0),
+        (ROT_mY_mX_mZ, TR_12_0_0),
+        (ROT_Y_mX_Z, TR_12_0_0),
+        (ROT_mY_X_Z, TR_12_0_0),
+        (ROT_X_Z_mY, TR_12_0_0),
+        (ROT_mX_Z_Y, TR_12_0_0),
+        (ROT_mX_mZ_mY, TR_12_0_0),
+        (ROT_X_mZ_Y, TR_12_0_0),
+        (ROT_Z_Y_mX, TR_12_0_0),
+        (ROT_Z_mY_X, TR_12_0_0),
+        (ROT_mZ_Y_X, TR_12_0_0),
+        (ROT_mZ_mY_mX, TR_12_0_0),
+        (ROT_mX_mY_mZ, TR_0_12_12),
+        (ROT_X_Y_mZ, TR_0_12_12),
+        (ROT_X_mY_Z, TR_0_12_12),
+        (ROT_mX_Y_Z, TR_0_12_12),
+        (ROT_mZ_mX_mY, TR_0_12_12),
+        (ROT_mZ_X_Y, TR_0_12_12),
+        (ROT_Z_X_mY, TR_0_12_12),
+        (ROT_Z_mX_Y, TR_0_12_12),
+        (ROT_mY_mZ_mX, TR_0_12_12),
+        (ROT_Y_mZ_X, TR_0_12_12),
+        (ROT_mY_Z_X, TR_0_12_12),
+        (ROT_Y_Z_mX, TR_0_12_12),
+        (ROT_mY_mX_Z, TR_12_0_0),
+        (ROT_Y_X_Z, TR_12_0_0),
+        (ROT_mY_X_mZ, TR_12_0_0),
+        (ROT_Y_mX_mZ, TR_12_0_0),
+        (ROT_mX_mZ_Y, TR_12_0_0),
+        (ROT_X_mZ_mY, TR_12_0_0),
+        (ROT_X_Z_Y, TR_12_0_0),
+        (ROT_mX_Z_mY, TR_12_0_0),
+        (ROT_mZ_mY_X, TR_12_0_0),
+        (ROT_mZ_Y_mX, TR_12_0_0),
+        (ROT_Z_mY_mX, TR_12_0_0),
+        (ROT_Z_Y_X, TR_12_0_0),
+        (ROT_X_Y_Z, TR_12_0_12),
+        (ROT_mX_mY_Z, TR_12_0_12),
+        (ROT_mX_Y_mZ, TR_12_0_12),
+        (ROT_X_mY_mZ, TR_12_0_12),
+        (ROT_Z_X_Y, TR_12_0_12),
+        (ROT_Z_mX_mY, TR_12_0_12),
+        (ROT_mZ_mX_Y, TR_12_0_12),
+        (ROT_mZ_X_mY, TR_12_0_12),
+        (ROT_Y_Z_X, TR_12_0_12),
+        (ROT_mY_Z_mX, TR_12_0_12),
+        (ROT_Y_mZ_mX, TR_12_0_12),
+        (ROT_mY_mZ_X, TR_12_0_12),
+        (ROT_Y_X_mZ, TR_0_12_0),
+        (ROT_mY_mX_mZ, TR_0_12_0),
+        (ROT_Y_mX_Z, TR_0_12_0),
+        (ROT_mY_X_Z, TR_0_12_0),
+        (ROT_X_Z_mY, TR_0_12_0),
+        (ROT_mX_Z_Y, TR_0_12_0),
+        (ROT_mX_mZ_mY, TR_0_12_0),
+        (ROT_X_mZ_Y, TR_0_12_0),
+        (ROT_Z_Y_mX, TR_0_12_0),
+        (ROT_Z_mY_X, TR_0_12_0),
+        (ROT_mZ_Y_X, TR_0_12_0),
+        (ROT_mZ_mY_mX, TR_0_12_0),
+        (ROT_mX_mY_mZ, TR_12_0_12),
+        (ROT_X_Y_mZ, TR_12_0_12),
+        (ROT_X_mY_Z, TR_12_0_12),
+        (ROT_mX_Y_Z, TR_12_0_12),
+        (ROT_mZ_mX_mY, TR_12_0_12),
+        (ROT_mZ_X_Y, TR_12_0_12),
+        (ROT_Z_X_mY, TR_12_0_12),
+        (ROT_Z_mX_Y, TR_12_0_12),
+        (ROT_mY_mZ_mX, TR_12_0_12),
+        (ROT_Y_mZ_X, TR_12_0_12),
+        (ROT_mY_Z_X, TR_12_0_12),
+        (ROT_Y_Z_mX, TR_12_0_12),
+        (ROT_mY_mX_Z, TR_0_12_0),
+        (ROT_Y_X_Z, TR_0_12_0),
+        (ROT_mY_X_mZ, TR_0_12_0),
+        (ROT_Y_mX_mZ, TR_0_12_0),
+        (ROT_mX_mZ_Y, TR_0_12_0),
+        (ROT_X_mZ_mY, TR_0_12_0),
+        (ROT_X_Z_Y, TR_0_12_0),
+        (ROT_mX_Z_mY, TR_0_12_0),
+        (ROT_mZ_mY_X, TR_0_12_0),
+        (ROT_mZ_Y_mX, TR_0_12_0),
+        (ROT_Z_mY_mX, TR_0_12_0),
+        (ROT_Z_Y_X, TR_0_12_0),
+        (ROT_X_Y_Z, TR_12_12_0),
+        (ROT_mX_mY_Z, TR_12_12_0),
+        (ROT_mX_Y_mZ, TR_12_12_0),
+        (ROT_X_mY_mZ, TR_12_12_0),
+        (ROT_Z_X_Y, TR_12_12_0),
+        (ROT_Z_mX_mY, TR_12_12_0),
+        (ROT_mZ_mX_Y, TR_12_12_0),
+        (ROT_mZ_X_mY, TR_12_12_0),
+        (ROT_Y_Z_X, TR_12_12_0),
+        (ROT_mY_Z_mX, TR_12_12_0),
+        (ROT_Y_mZ_mX, TR_12_12_0),
+        (ROT_mY_mZ_X, TR_12_12_0),
+        (ROT_Y_X_mZ, TR_0_0_12),
+        (ROT_mY_mX_mZ, TR_0_0_12),
+        (ROT_Y_mX_Z, TR_0_0_12),
+        (ROT_mY_X_Z, TR_0_0_12),
+        (ROT_X_Z_mY, TR_0_0_12),
+        (ROT_mX_Z_Y, TR_0_0_12),
+        (ROT_mX_mZ_mY, TR_0_0_12),
+        (ROT_X_mZ_Y, TR_0_0_12),
+        (ROT_Z_Y_mX, TR_0_0_12),
+        (ROT_Z_mY_X, TR_0_0_12),
+        (ROT_mZ_Y_X, TR_0_0_12),
+        (ROT_mZ_mY_mX, TR_0_0_12),
+        (ROT_mX_mY_mZ, TR_12_12_0),
+        (ROT_X_Y_mZ, TR_12_12_0),
+        (ROT_X_mY_Z, TR_12_12_0),
+        (ROT_mX_Y_Z, TR_12_12_0),
+        (ROT_mZ_mX_mY, TR_12_12_0),
+        (ROT_mZ_X_Y, TR_12_12_0),
+        (ROT_Z_X_mY, TR_12_12_0),
+        (ROT_Z_mX_Y, TR_12_12_0),
+        (ROT_mY_mZ_mX, TR_12_12_0),
+        (ROT_Y_mZ_X, TR_12_12_0),
+        (ROT_mY_Z_X, TR_12_12_0),
+        (ROT_Y_Z_mX, TR_12_12_0),
+        (ROT_mY_mX_Z, TR_0_0_12),
+        (ROT_Y_X_Z, TR_0_0_12),
+        (ROT_mY_X_mZ, TR_0_0_12),
+        (ROT_Y_mX_mZ, TR_0_0_12),
+        (ROT_mX_mZ_Y, TR_0_0_12),
+        (ROT_X_mZ_mY, TR_0_0_12),
+        (ROT_X_Z_Y, TR_0_0_12),
+        (ROT_mX_Z_mY, TR_0_0_12),
+        (ROT_mZ_mY_X, TR_0_0_12),
+        (ROT_mZ_Y_mX, TR_0_0_12),
+        (ROT_Z_mY_mX, TR_0_0_12),
+        (ROT_Z_Y_X, TR_0_0_12)])
 
 sg227 = SpaceGroup(
     number=227,
@@ -6384,199 +6382,199 @@ sg227 = SpaceGroup(
     point_group_name="PGm3barm",
     crystal_system=CUBIC,
     pdb_name="F 41/d -3 2/m",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_12_12),
-        SymOp(ROT_mX_Y_mZ, TR_12_12_0),
-        SymOp(ROT_X_mY_mZ, TR_12_0_12),
-        SymOp(ROT_Z_X_Y, TR_0_0_0),
-        SymOp(ROT_Z_mX_mY, TR_12_0_12),
-        SymOp(ROT_mZ_mX_Y, TR_0_12_12),
-        SymOp(ROT_mZ_X_mY, TR_12_12_0),
-        SymOp(ROT_Y_Z_X, TR_0_0_0),
-        SymOp(ROT_mY_Z_mX, TR_12_12_0),
-        SymOp(ROT_Y_mZ_mX, TR_12_0_12),
-        SymOp(ROT_mY_mZ_X, TR_0_12_12),
-        SymOp(ROT_Y_X_mZ, TR_34_14_34),
-        SymOp(ROT_mY_mX_mZ, TR_14_14_14),
-        SymOp(ROT_Y_mX_Z, TR_14_34_34),
-        SymOp(ROT_mY_X_Z, TR_34_34_14),
-        SymOp(ROT_X_Z_mY, TR_34_14_34),
-        SymOp(ROT_mX_Z_Y, TR_34_34_14),
-        SymOp(ROT_mX_mZ_mY, TR_14_14_14),
-        SymOp(ROT_X_mZ_Y, TR_14_34_34),
-        SymOp(ROT_Z_Y_mX, TR_34_14_34),
-        SymOp(ROT_Z_mY_X, TR_14_34_34),
-        SymOp(ROT_mZ_Y_X, TR_34_34_14),
-        SymOp(ROT_mZ_mY_mX, TR_14_14_14),
-        SymOp(ROT_mX_mY_mZ, TR_14_14_14),
-        SymOp(ROT_X_Y_mZ, TR_14_34_34),
-        SymOp(ROT_X_mY_Z, TR_34_34_14),
-        SymOp(ROT_mX_Y_Z, TR_34_14_34),
-        SymOp(ROT_mZ_mX_mY, TR_14_14_14),
-        SymOp(ROT_mZ_X_Y, TR_34_14_34),
-        SymOp(ROT_Z_X_mY, TR_14_34_34),
-        SymOp(ROT_Z_mX_Y, TR_34_34_14),
-        SymOp(ROT_mY_mZ_mX, TR_14_14_14),
-        SymOp(ROT_Y_mZ_X, TR_34_34_14),
-        SymOp(ROT_mY_Z_X, TR_34_14_34),
-        SymOp(ROT_Y_Z_mX, TR_14_34_34),
-        SymOp(ROT_mY_mX_Z, TR_12_0_12),
-        SymOp(ROT_Y_X_Z, TR_0_0_0),
-        SymOp(ROT_mY_X_mZ, TR_0_12_12),
-        SymOp(ROT_Y_mX_mZ, TR_12_12_0),
-        SymOp(ROT_mX_mZ_Y, TR_12_0_12),
-        SymOp(ROT_X_mZ_mY, TR_12_12_0),
-        SymOp(ROT_X_Z_Y, TR_0_0_0),
-        SymOp(ROT_mX_Z_mY, TR_0_12_12),
-        SymOp(ROT_mZ_mY_X, TR_12_0_12),
-        SymOp(ROT_mZ_Y_mX, TR_0_12_12),
-        SymOp(ROT_Z_mY_mX, TR_12_12_0),
-        SymOp(ROT_Z_Y_X, TR_0_0_0),
-        SymOp(ROT_X_Y_Z, TR_0_12_12),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mX_Y_mZ, TR_12_0_12),
-        SymOp(ROT_X_mY_mZ, TR_12_12_0),
-        SymOp(ROT_Z_X_Y, TR_0_12_12),
-        SymOp(ROT_Z_mX_mY, TR_12_12_0),
-        SymOp(ROT_mZ_mX_Y, TR_0_0_0),
-        SymOp(ROT_mZ_X_mY, TR_12_0_12),
-        SymOp(ROT_Y_Z_X, TR_0_12_12),
-        SymOp(ROT_mY_Z_mX, TR_12_0_12),
-        SymOp(ROT_Y_mZ_mX, TR_12_12_0),
-        SymOp(ROT_mY_mZ_X, TR_0_0_0),
-        SymOp(ROT_Y_X_mZ, TR_34_34_14),
-        SymOp(ROT_mY_mX_mZ, TR_14_34_34),
-        SymOp(ROT_Y_mX_Z, TR_14_14_14),
-        SymOp(ROT_mY_X_Z, TR_34_14_34),
-        SymOp(ROT_X_Z_mY, TR_34_34_14),
-        SymOp(ROT_mX_Z_Y, TR_34_14_34),
-        SymOp(ROT_mX_mZ_mY, TR_14_34_34),
-        SymOp(ROT_X_mZ_Y, TR_14_14_14),
-        SymOp(ROT_Z_Y_mX, TR_34_34_14),
-        SymOp(ROT_Z_mY_X, TR_14_14_14),
-        SymOp(ROT_mZ_Y_X, TR_34_14_34),
-        SymOp(ROT_mZ_mY_mX, TR_14_34_34),
-        SymOp(ROT_mX_mY_mZ, TR_14_34_34),
-        SymOp(ROT_X_Y_mZ, TR_14_14_14),
-        SymOp(ROT_X_mY_Z, TR_34_14_34),
-        SymOp(ROT_mX_Y_Z, TR_34_34_14),
-        SymOp(ROT_mZ_mX_mY, TR_14_34_34),
-        SymOp(ROT_mZ_X_Y, TR_34_34_14),
-        SymOp(ROT_Z_X_mY, TR_14_14_14),
-        SymOp(ROT_Z_mX_Y, TR_34_14_34),
-        SymOp(ROT_mY_mZ_mX, TR_14_34_34),
-        SymOp(ROT_Y_mZ_X, TR_34_14_34),
-        SymOp(ROT_mY_Z_X, TR_34_34_14),
-        SymOp(ROT_Y_Z_mX, TR_14_14_14),
-        SymOp(ROT_mY_mX_Z, TR_12_12_0),
-        SymOp(ROT_Y_X_Z, TR_0_12_12),
-        SymOp(ROT_mY_X_mZ, TR_0_0_0),
-        SymOp(ROT_Y_mX_mZ, TR_12_0_12),
-        SymOp(ROT_mX_mZ_Y, TR_12_12_0),
-        SymOp(ROT_X_mZ_mY, TR_12_0_12),
-        SymOp(ROT_X_Z_Y, TR_0_12_12),
-        SymOp(ROT_mX_Z_mY, TR_0_0_0),
-        SymOp(ROT_mZ_mY_X, TR_12_12_0),
-        SymOp(ROT_mZ_Y_mX, TR_0_0_0),
-        SymOp(ROT_Z_mY_mX, TR_12_0_12),
-        SymOp(ROT_Z_Y_X, TR_0_12_12),
-        SymOp(ROT_X_Y_Z, TR_12_0_12),
-        SymOp(ROT_mX_mY_Z, TR_12_12_0),
-        SymOp(ROT_mX_Y_mZ, TR_0_12_12),
-        SymOp(ROT_X_mY_mZ, TR_0_0_0),
-        SymOp(ROT_Z_X_Y, TR_12_0_12),
-        SymOp(ROT_Z_mX_mY, TR_0_0_0),
-        SymOp(ROT_mZ_mX_Y, TR_12_12_0),
-        SymOp(ROT_mZ_X_mY, TR_0_12_12),
-        SymOp(ROT_Y_Z_X, TR_12_0_12),
-        SymOp(ROT_mY_Z_mX, TR_0_12_12),
-        SymOp(ROT_Y_mZ_mX, TR_0_0_0),
-        SymOp(ROT_mY_mZ_X, TR_12_12_0),
-        SymOp(ROT_Y_X_mZ, TR_14_14_14),
-        SymOp(ROT_mY_mX_mZ, TR_34_14_34),
-        SymOp(ROT_Y_mX_Z, TR_34_34_14),
-        SymOp(ROT_mY_X_Z, TR_14_34_34),
-        SymOp(ROT_X_Z_mY, TR_14_14_14),
-        SymOp(ROT_mX_Z_Y, TR_14_34_34),
-        SymOp(ROT_mX_mZ_mY, TR_34_14_34),
-        SymOp(ROT_X_mZ_Y, TR_34_34_14),
-        SymOp(ROT_Z_Y_mX, TR_14_14_14),
-        SymOp(ROT_Z_mY_X, TR_34_34_14),
-        SymOp(ROT_mZ_Y_X, TR_14_34_34),
-        SymOp(ROT_mZ_mY_mX, TR_34_14_34),
-        SymOp(ROT_mX_mY_mZ, TR_34_14_34),
-        SymOp(ROT_X_Y_mZ, TR_34_34_14),
-        SymOp(ROT_X_mY_Z, TR_14_34_34),
-        SymOp(ROT_mX_Y_Z, TR_14_14_14),
-        SymOp(ROT_mZ_mX_mY, TR_34_14_34),
-        SymOp(ROT_mZ_X_Y, TR_14_14_14),
-        SymOp(ROT_Z_X_mY, TR_34_34_14),
-        SymOp(ROT_Z_mX_Y, TR_14_34_34),
-        SymOp(ROT_mY_mZ_mX, TR_34_14_34),
-        SymOp(ROT_Y_mZ_X, TR_14_34_34),
-        SymOp(ROT_mY_Z_X, TR_14_14_14),
-        SymOp(ROT_Y_Z_mX, TR_34_34_14),
-        SymOp(ROT_mY_mX_Z, TR_0_0_0),
-        SymOp(ROT_Y_X_Z, TR_12_0_12),
-        SymOp(ROT_mY_X_mZ, TR_12_12_0),
-        SymOp(ROT_Y_mX_mZ, TR_0_12_12),
-        SymOp(ROT_mX_mZ_Y, TR_0_0_0),
-        SymOp(ROT_X_mZ_mY, TR_0_12_12),
-        SymOp(ROT_X_Z_Y, TR_12_0_12),
-        SymOp(ROT_mX_Z_mY, TR_12_12_0),
-        SymOp(ROT_mZ_mY_X, TR_0_0_0),
-        SymOp(ROT_mZ_Y_mX, TR_12_12_0),
-        SymOp(ROT_Z_mY_mX, TR_0_12_12),
-        SymOp(ROT_Z_Y_X, TR_12_0_12),
-        SymOp(ROT_X_Y_Z, TR_12_12_0),
-        SymOp(ROT_mX_mY_Z, TR_12_0_12),
-        SymOp(ROT_mX_Y_mZ, TR_0_0_0),
-        SymOp(ROT_X_mY_mZ, TR_0_12_12),
-        SymOp(ROT_Z_X_Y, TR_12_12_0),
-        SymOp(ROT_Z_mX_mY, TR_0_12_12),
-        SymOp(ROT_mZ_mX_Y, TR_12_0_12),
-        SymOp(ROT_mZ_X_mY, TR_0_0_0),
-        SymOp(ROT_Y_Z_X, TR_12_12_0),
-        SymOp(ROT_mY_Z_mX, TR_0_0_0),
-        SymOp(ROT_Y_mZ_mX, TR_0_12_12),
-        SymOp(ROT_mY_mZ_X, TR_12_0_12),
-        SymOp(ROT_Y_X_mZ, TR_14_34_34),
-        SymOp(ROT_mY_mX_mZ, TR_34_34_14),
-        SymOp(ROT_Y_mX_Z, TR_34_14_34),
-        SymOp(ROT_mY_X_Z, TR_14_14_14),
-        SymOp(ROT_X_Z_mY, TR_14_34_34),
-        SymOp(ROT_mX_Z_Y, TR_14_14_14),
-        SymOp(ROT_mX_mZ_mY, TR_34_34_14),
-        SymOp(ROT_X_mZ_Y, TR_34_14_34),
-        SymOp(ROT_Z_Y_mX, TR_14_34_34),
-        SymOp(ROT_Z_mY_X, TR_34_14_34),
-        SymOp(ROT_mZ_Y_X, TR_14_14_14),
-        SymOp(ROT_mZ_mY_mX, TR_34_34_14),
-        SymOp(ROT_mX_mY_mZ, TR_34_34_14),
-        SymOp(ROT_X_Y_mZ, TR_34_14_34),
-        SymOp(ROT_X_mY_Z, TR_14_14_14),
-        SymOp(ROT_mX_Y_Z, TR_14_34_34),
-        SymOp(ROT_mZ_mX_mY, TR_34_34_14),
-        SymOp(ROT_mZ_X_Y, TR_14_34_34),
-        SymOp(ROT_Z_X_mY, TR_34_14_34),
-        SymOp(ROT_Z_mX_Y, TR_14_14_14),
-        SymOp(ROT_mY_mZ_mX, TR_34_34_14),
-        SymOp(ROT_Y_mZ_X, TR_14_14_14),
-        SymOp(ROT_mY_Z_X, TR_14_34_34),
-        SymOp(ROT_Y_Z_mX, TR_34_14_34),
-        SymOp(ROT_mY_mX_Z, TR_0_12_12),
-        SymOp(ROT_Y_X_Z, TR_12_12_0),
-        SymOp(ROT_mY_X_mZ, TR_12_0_12),
-        SymOp(ROT_Y_mX_mZ, TR_0_0_0),
-        SymOp(ROT_mX_mZ_Y, TR_0_12_12),
-        SymOp(ROT_X_mZ_mY, TR_0_0_0),
-        SymOp(ROT_X_Z_Y, TR_12_12_0),
-        SymOp(ROT_mX_Z_mY, TR_12_0_12),
-        SymOp(ROT_mZ_mY_X, TR_0_12_12),
-        SymOp(ROT_mZ_Y_mX, TR_12_0_12),
-        SymOp(ROT_Z_mY_mX, TR_0_0_0),
-        SymOp(ROT_Z_Y_X, TR_12_12_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_12_12),
+        (ROT_mX_Y_mZ, TR_12_12_0),
+        (ROT_X_mY_mZ, TR_12_0_12),
+        (ROT_Z_X_Y, TR_0_0_0),
+        (ROT_Z_mX_mY, TR_12_0_12),
+        (ROT_mZ_mX_Y, TR_0_12_12),
+        (ROT_mZ_X_mY, TR_12_12_0),
+        (ROT_Y_Z_X, TR_0_0_0),
+        (ROT_mY_Z_mX, TR_12_12_0),
+        (ROT_Y_mZ_mX, TR_12_0_12),
+        (ROT_mY_mZ_X, TR_0_12_12),
+        (ROT_Y_X_mZ, TR_34_14_34),
+        (ROT_mY_mX_mZ, TR_14_14_14),
+        (ROT_Y_mX_Z, TR_14_34_34),
+        (ROT_mY_X_Z, TR_34_34_14),
+        (ROT_X_Z_mY, TR_34_14_34),
+        (ROT_mX_Z_Y, TR_34_34_14),
+        (ROT_mX_mZ_mY, TR_14_14_14),
+        (ROT_X_mZ_Y, TR_14_34_34),
+        (ROT_Z_Y_mX, TR_34_14_34),
+        (ROT_Z_mY_X, TR_14_34_34),
+        (ROT_mZ_Y_X, TR_34_34_14),
+        (ROT_mZ_mY_mX, TR_14_14_14),
+        (ROT_mX_mY_mZ, TR_14_14_14),
+        (ROT_X_Y_mZ, TR_14_34_34),
+        (ROT_X_mY_Z, TR_34_34_14),
+        (ROT_mX_Y_Z, TR_34_14_34),
+        (ROT_mZ_mX_mY, TR_14_14_14),
+        (ROT_mZ_X_Y, TR_34_14_34),
+        (ROT_Z_X_mY, TR_14_34_34),
+        (ROT_Z_mX_Y, TR_34_34_14),
+        (ROT_mY_mZ_mX, TR_14_14_14),
+        (ROT_Y_mZ_X, TR_34_34_14),
+        (ROT_mY_Z_X, TR_34_14_34),
+        (ROT_Y_Z_mX, TR_14_34_34),
+        (ROT_mY_mX_Z, TR_12_0_12),
+        (ROT_Y_X_Z, TR_0_0_0),
+        (ROT_mY_X_mZ, TR_0_12_12),
+        (ROT_Y_mX_mZ, TR_12_12_0),
+        (ROT_mX_mZ_Y, TR_12_0_12),
+        (ROT_X_mZ_mY, TR_12_12_0),
+        (ROT_X_Z_Y, TR_0_0_0),
+        (ROT_mX_Z_mY, TR_0_12_12),
+        (ROT_mZ_mY_X, TR_12_0_12),
+        (ROT_mZ_Y_mX, TR_0_12_12),
+        (ROT_Z_mY_mX, TR_12_12_0),
+        (ROT_Z_Y_X, TR_0_0_0),
+        (ROT_X_Y_Z, TR_0_12_12),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mX_Y_mZ, TR_12_0_12),
+        (ROT_X_mY_mZ, TR_12_12_0),
+        (ROT_Z_X_Y, TR_0_12_12),
+        (ROT_Z_mX_mY, TR_12_12_0),
+        (ROT_mZ_mX_Y, TR_0_0_0),
+        (ROT_mZ_X_mY, TR_12_0_12),
+        (ROT_Y_Z_X, TR_0_12_12),
+        (ROT_mY_Z_mX, TR_12_0_12),
+        (ROT_Y_mZ_mX, TR_12_12_0),
+        (ROT_mY_mZ_X, TR_0_0_0),
+        (ROT_Y_X_mZ, TR_34_34_14),
+        (ROT_mY_mX_mZ, TR_14_34_34),
+        (ROT_Y_mX_Z, TR_14_14_14),
+        (ROT_mY_X_Z, TR_34_14_34),
+        (ROT_X_Z_mY, TR_34_34_14),
+        (ROT_mX_Z_Y, TR_34_14_34),
+        (ROT_mX_mZ_mY, TR_14_34_34),
+        (ROT_X_mZ_Y, TR_14_14_14),
+        (ROT_Z_Y_mX, TR_34_34_14),
+        (ROT_Z_mY_X, TR_14_14_14),
+        (ROT_mZ_Y_X, TR_34_14_34),
+        (ROT_mZ_mY_mX, TR_14_34_34),
+        (ROT_mX_mY_mZ, TR_14_34_34),
+        (ROT_X_Y_mZ, TR_14_14_14),
+        (ROT_X_mY_Z, TR_34_14_34),
+        (ROT_mX_Y_Z, TR_34_34_14),
+        (ROT_mZ_mX_mY, TR_14_34_34),
+        (ROT_mZ_X_Y, TR_34_34_14),
+        (ROT_Z_X_mY, TR_14_14_14),
+        (ROT_Z_mX_Y, TR_34_14_34),
+        (ROT_mY_mZ_mX, TR_14_34_34),
+        (ROT_Y_mZ_X, TR_34_14_34),
+        (ROT_mY_Z_X, TR_34_34_14),
+        (ROT_Y_Z_mX, TR_14_14_14),
+        (ROT_mY_mX_Z, TR_12_12_0),
+        (ROT_Y_X_Z, TR_0_12_12),
+        (ROT_mY_X_mZ, TR_0_0_0),
+        (ROT_Y_mX_mZ, TR_12_0_12),
+        (ROT_mX_mZ_Y, TR_12_12_0),
+        (ROT_X_mZ_mY, TR_12_0_12),
+        (ROT_X_Z_Y, TR_0_12_12),
+        (ROT_mX_Z_mY, TR_0_0_0),
+        (ROT_mZ_mY_X, TR_12_12_0),
+        (ROT_mZ_Y_mX, TR_0_0_0),
+        (ROT_Z_mY_mX, TR_12_0_12),
+        (ROT_Z_Y_X, TR_0_12_12),
+        (ROT_X_Y_Z, TR_12_0_12),
+        (ROT_mX_mY_Z, TR_12_12_0),
+        (ROT_mX_Y_mZ, TR_0_12_12),
+        (ROT_X_mY_mZ, TR_0_0_0),
+        (ROT_Z_X_Y, TR_12_0_12),
+        (ROT_Z_mX_mY, TR_0_0_0),
+        (ROT_mZ_mX_Y, TR_12_12_0),
+        (ROT_mZ_X_mY, TR_0_12_12),
+        (ROT_Y_Z_X, TR_12_0_12),
+        (ROT_mY_Z_mX, TR_0_12_12),
+        (ROT_Y_mZ_mX, TR_0_0_0),
+        (ROT_mY_mZ_X, TR_12_12_0),
+        (ROT_Y_X_mZ, TR_14_14_14),
+        (ROT_mY_mX_mZ, TR_34_14_34),
+        (ROT_Y_mX_Z, TR_34_34_14),
+        (ROT_mY_X_Z, TR_14_34_34),
+        (ROT_X_Z_mY, TR_14_14_14),
+        (ROT_mX_Z_Y, TR_14_34_34),
+        (ROT_mX_mZ_mY, TR_34_14_34),
+        (ROT_X_mZ_Y, TR_34_34_14),
+        (ROT_Z_Y_mX, TR_14_14_14),
+        (ROT_Z_mY_X, TR_34_34_14),
+        (ROT_mZ_Y_X, TR_14_34_34),
+        (ROT_mZ_mY_mX, TR_34_14_34),
+        (ROT_mX_mY_mZ, TR_34_14_34),
+        (ROT_X_Y_mZ, TR_34_34_14),
+        (ROT_X_mY_Z, TR_14_34_34),
+        (ROT_mX_Y_Z, TR_14_14_14),
+        (ROT_mZ_mX_mY, TR_34_14_34),
+        (ROT_mZ_X_Y, TR_14_14_14),
+        (ROT_Z_X_mY, TR_34_34_14),
+        (ROT_Z_mX_Y, TR_14_34_34),
+        (ROT_mY_mZ_mX, TR_34_14_34),
+        (ROT_Y_mZ_X, TR_14_34_34),
+        (ROT_mY_Z_X, TR_14_14_14),
+        (ROT_Y_Z_mX, TR_34_34_14),
+        (ROT_mY_mX_Z, TR_0_0_0),
+        (ROT_Y_X_Z, TR_12_0_12),
+        (ROT_mY_X_mZ, TR_12_12_0),
+        (ROT_Y_mX_mZ, TR_0_12_12),
+        (ROT_mX_mZ_Y, TR_0_0_0),
+        (ROT_X_mZ_mY, TR_0_12_12),
+        (ROT_X_Z_Y, TR_12_0_12),
+        (ROT_mX_Z_mY, TR_12_12_0),
+        (ROT_mZ_mY_X, TR_0_0_0),
+        (ROT_mZ_Y_mX, TR_12_12_0),
+        (ROT_Z_mY_mX, TR_0_12_12),
+        (ROT_Z_Y_X, TR_12_0_12),
+        (ROT_X_Y_Z, TR_12_12_0),
+        (ROT_mX_mY_Z, TR_12_0_12),
+        (ROT_mX_Y_mZ, TR_0_0_0),
+        (ROT_X_mY_mZ, TR_0_12_12),
+        (ROT_Z_X_Y, TR_12_12_0),
+        (ROT_Z_mX_mY, TR_0_12_12),
+        (ROT_mZ_mX_Y, TR_12_0_12),
+        (ROT_mZ_X_mY, TR_0_0_0),
+        (ROT_Y_Z_X, TR_12_12_0),
+        (ROT_mY_Z_mX, TR_0_0_0),
+        (ROT_Y_mZ_mX, TR_0_12_12),
+        (ROT_mY_mZ_X, TR_12_0_12),
+        (ROT_Y_X_mZ, TR_14_34_34),
+        (ROT_mY_mX_mZ, TR_34_34_14),
+        (ROT_Y_mX_Z, TR_34_14_34),
+        (ROT_mY_X_Z, TR_14_14_14),
+        (ROT_X_Z_mY, TR_14_34_34),
+        (ROT_mX_Z_Y, TR_14_14_14),
+        (ROT_mX_mZ_mY, TR_34_34_14),
+        (ROT_X_mZ_Y, TR_34_14_34),
+        (ROT_Z_Y_mX, TR_14_34_34),
+        (ROT_Z_mY_X, TR_34_14_34),
+        (ROT_mZ_Y_X, TR_14_14_14),
+        (ROT_mZ_mY_mX, TR_34_34_14),
+        (ROT_mX_mY_mZ, TR_34_34_14),
+        (ROT_X_Y_mZ, TR_34_14_34),
+        (ROT_X_mY_Z, TR_14_14_14),
+        (ROT_mX_Y_Z, TR_14_34_34),
+        (ROT_mZ_mX_mY, TR_34_34_14),
+        (ROT_mZ_X_Y, TR_14_34_34),
+        (ROT_Z_X_mY, TR_34_14_34),
+        (ROT_Z_mX_Y, TR_14_14_14),
+        (ROT_mY_mZ_mX, TR_34_34_14),
+        (ROT_Y_mZ_X, TR_14_14_14),
+        (ROT_mY_Z_X, TR_14_34_34),
+        (ROT_Y_Z_mX, TR_34_14_34),
+        (ROT_mY_mX_Z, TR_0_12_12),
+        (ROT_Y_X_Z, TR_12_12_0),
+        (ROT_mY_X_mZ, TR_12_0_12),
+        (ROT_Y_mX_mZ, TR_0_0_0),
+        (ROT_mX_mZ_Y, TR_0_12_12),
+        (ROT_X_mZ_mY, TR_0_0_0),
+        (ROT_X_Z_Y, TR_12_12_0),
+        (ROT_mX_Z_mY, TR_12_0_12),
+        (ROT_mZ_mY_X, TR_0_12_12),
+        (ROT_mZ_Y_mX, TR_12_0_12),
+        (ROT_Z_mY_mX, TR_0_0_0),
+        (ROT_Z_Y_X, TR_12_12_0)])
 
 sg228 = SpaceGroup(
     number=228,
@@ -6586,199 +6584,199 @@ sg228 = SpaceGroup(
     point_group_name="PGm3barm",
     crystal_system=CUBIC,
     pdb_name="F 41/d -3 2/c",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_12_12),
-        SymOp(ROT_mX_Y_mZ, TR_12_12_0),
-        SymOp(ROT_X_mY_mZ, TR_12_0_12),
-        SymOp(ROT_Z_X_Y, TR_0_0_0),
-        SymOp(ROT_Z_mX_mY, TR_12_0_12),
-        SymOp(ROT_mZ_mX_Y, TR_0_12_12),
-        SymOp(ROT_mZ_X_mY, TR_12_12_0),
-        SymOp(ROT_Y_Z_X, TR_0_0_0),
-        SymOp(ROT_mY_Z_mX, TR_12_12_0),
-        SymOp(ROT_Y_mZ_mX, TR_12_0_12),
-        SymOp(ROT_mY_mZ_X, TR_0_12_12),
-        SymOp(ROT_Y_X_mZ, TR_34_14_34),
-        SymOp(ROT_mY_mX_mZ, TR_14_14_14),
-        SymOp(ROT_Y_mX_Z, TR_14_34_34),
-        SymOp(ROT_mY_X_Z, TR_34_34_14),
-        SymOp(ROT_X_Z_mY, TR_34_14_34),
-        SymOp(ROT_mX_Z_Y, TR_34_34_14),
-        SymOp(ROT_mX_mZ_mY, TR_14_14_14),
-        SymOp(ROT_X_mZ_Y, TR_14_34_34),
-        SymOp(ROT_Z_Y_mX, TR_34_14_34),
-        SymOp(ROT_Z_mY_X, TR_14_34_34),
-        SymOp(ROT_mZ_Y_X, TR_34_34_14),
-        SymOp(ROT_mZ_mY_mX, TR_14_14_14),
-        SymOp(ROT_mX_mY_mZ, TR_34_34_34),
-        SymOp(ROT_X_Y_mZ, TR_34_14_14),
-        SymOp(ROT_X_mY_Z, TR_14_14_34),
-        SymOp(ROT_mX_Y_Z, TR_14_34_14),
-        SymOp(ROT_mZ_mX_mY, TR_34_34_34),
-        SymOp(ROT_mZ_X_Y, TR_14_34_14),
-        SymOp(ROT_Z_X_mY, TR_34_14_14),
-        SymOp(ROT_Z_mX_Y, TR_14_14_34),
-        SymOp(ROT_mY_mZ_mX, TR_34_34_34),
-        SymOp(ROT_Y_mZ_X, TR_14_14_34),
-        SymOp(ROT_mY_Z_X, TR_14_34_14),
-        SymOp(ROT_Y_Z_mX, TR_34_14_14),
-        SymOp(ROT_mY_mX_Z, TR_0_12_0),
-        SymOp(ROT_Y_X_Z, TR_12_12_12),
-        SymOp(ROT_mY_X_mZ, TR_12_0_0),
-        SymOp(ROT_Y_mX_mZ, TR_0_0_12),
-        SymOp(ROT_mX_mZ_Y, TR_0_12_0),
-        SymOp(ROT_X_mZ_mY, TR_0_0_12),
-        SymOp(ROT_X_Z_Y, TR_12_12_12),
-        SymOp(ROT_mX_Z_mY, TR_12_0_0),
-        SymOp(ROT_mZ_mY_X, TR_0_12_0),
-        SymOp(ROT_mZ_Y_mX, TR_12_0_0),
-        SymOp(ROT_Z_mY_mX, TR_0_0_12),
-        SymOp(ROT_Z_Y_X, TR_12_12_12),
-        SymOp(ROT_X_Y_Z, TR_0_12_12),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mX_Y_mZ, TR_12_0_12),
-        SymOp(ROT_X_mY_mZ, TR_12_12_0),
-        SymOp(ROT_Z_X_Y, TR_0_12_12),
-        SymOp(ROT_Z_mX_mY, TR_12_12_0),
-        SymOp(ROT_mZ_mX_Y, TR_0_0_0),
-        SymOp(ROT_mZ_X_mY, TR_12_0_12),
-        SymOp(ROT_Y_Z_X, TR_0_12_12),
-        SymOp(ROT_mY_Z_mX, TR_12_0_12),
-        SymOp(ROT_Y_mZ_mX, TR_12_12_0),
-        SymOp(ROT_mY_mZ_X, TR_0_0_0),
-        SymOp(ROT_Y_X_mZ, TR_34_34_14),
-        SymOp(ROT_mY_mX_mZ, TR_14_34_34),
-        SymOp(ROT_Y_mX_Z, TR_14_14_14),
-        SymOp(ROT_mY_X_Z, TR_34_14_34),
-        SymOp(ROT_X_Z_mY, TR_34_34_14),
-        SymOp(ROT_mX_Z_Y, TR_34_14_34),
-        SymOp(ROT_mX_mZ_mY, TR_14_34_34),
-        SymOp(ROT_X_mZ_Y, TR_14_14_14),
-        SymOp(ROT_Z_Y_mX, TR_34_34_14),
-        SymOp(ROT_Z_mY_X, TR_14_14_14),
-        SymOp(ROT_mZ_Y_X, TR_34_14_34),
-        SymOp(ROT_mZ_mY_mX, TR_14_34_34),
-        SymOp(ROT_mX_mY_mZ, TR_34_14_14),
-        SymOp(ROT_X_Y_mZ, TR_34_34_34),
-        SymOp(ROT_X_mY_Z, TR_14_34_14),
-        SymOp(ROT_mX_Y_Z, TR_14_14_34),
-        SymOp(ROT_mZ_mX_mY, TR_34_14_14),
-        SymOp(ROT_mZ_X_Y, TR_14_14_34),
-        SymOp(ROT_Z_X_mY, TR_34_34_34),
-        SymOp(ROT_Z_mX_Y, TR_14_34_14),
-        SymOp(ROT_mY_mZ_mX, TR_34_14_14),
-        SymOp(ROT_Y_mZ_X, TR_14_34_14),
-        SymOp(ROT_mY_Z_X, TR_14_14_34),
-        SymOp(ROT_Y_Z_mX, TR_34_34_34),
-        SymOp(ROT_mY_mX_Z, TR_0_0_12),
-        SymOp(ROT_Y_X_Z, TR_12_0_0),
-        SymOp(ROT_mY_X_mZ, TR_12_12_12),
-        SymOp(ROT_Y_mX_mZ, TR_0_12_0),
-        SymOp(ROT_mX_mZ_Y, TR_0_0_12),
-        SymOp(ROT_X_mZ_mY, TR_0_12_0),
-        SymOp(ROT_X_Z_Y, TR_12_0_0),
-        SymOp(ROT_mX_Z_mY, TR_12_12_12),
-        SymOp(ROT_mZ_mY_X, TR_0_0_12),
-        SymOp(ROT_mZ_Y_mX, TR_12_12_12),
-        SymOp(ROT_Z_mY_mX, TR_0_12_0),
-        SymOp(ROT_Z_Y_X, TR_12_0_0),
-        SymOp(ROT_X_Y_Z, TR_12_0_12),
-        SymOp(ROT_mX_mY_Z, TR_12_12_0),
-        SymOp(ROT_mX_Y_mZ, TR_0_12_12),
-        SymOp(ROT_X_mY_mZ, TR_0_0_0),
-        SymOp(ROT_Z_X_Y, TR_12_0_12),
-        SymOp(ROT_Z_mX_mY, TR_0_0_0),
-        SymOp(ROT_mZ_mX_Y, TR_12_12_0),
-        SymOp(ROT_mZ_X_mY, TR_0_12_12),
-        SymOp(ROT_Y_Z_X, TR_12_0_12),
-        SymOp(ROT_mY_Z_mX, TR_0_12_12),
-        SymOp(ROT_Y_mZ_mX, TR_0_0_0),
-        SymOp(ROT_mY_mZ_X, TR_12_12_0),
-        SymOp(ROT_Y_X_mZ, TR_14_14_14),
-        SymOp(ROT_mY_mX_mZ, TR_34_14_34),
-        SymOp(ROT_Y_mX_Z, TR_34_34_14),
-        SymOp(ROT_mY_X_Z, TR_14_34_34),
-        SymOp(ROT_X_Z_mY, TR_14_14_14),
-        SymOp(ROT_mX_Z_Y, TR_14_34_34),
-        SymOp(ROT_mX_mZ_mY, TR_34_14_34),
-        SymOp(ROT_X_mZ_Y, TR_34_34_14),
-        SymOp(ROT_Z_Y_mX, TR_14_14_14),
-        SymOp(ROT_Z_mY_X, TR_34_34_14),
-        SymOp(ROT_mZ_Y_X, TR_14_34_34),
-        SymOp(ROT_mZ_mY_mX, TR_34_14_34),
-        SymOp(ROT_mX_mY_mZ, TR_14_34_14),
-        SymOp(ROT_X_Y_mZ, TR_14_14_34),
-        SymOp(ROT_X_mY_Z, TR_34_14_14),
-        SymOp(ROT_mX_Y_Z, TR_34_34_34),
-        SymOp(ROT_mZ_mX_mY, TR_14_34_14),
-        SymOp(ROT_mZ_X_Y, TR_34_34_34),
-        SymOp(ROT_Z_X_mY, TR_14_14_34),
-        SymOp(ROT_Z_mX_Y, TR_34_14_14),
-        SymOp(ROT_mY_mZ_mX, TR_14_34_14),
-        SymOp(ROT_Y_mZ_X, TR_34_14_14),
-        SymOp(ROT_mY_Z_X, TR_34_34_34),
-        SymOp(ROT_Y_Z_mX, TR_14_14_34),
-        SymOp(ROT_mY_mX_Z, TR_12_12_12),
-        SymOp(ROT_Y_X_Z, TR_0_12_0),
-        SymOp(ROT_mY_X_mZ, TR_0_0_12),
-        SymOp(ROT_Y_mX_mZ, TR_12_0_0),
-        SymOp(ROT_mX_mZ_Y, TR_12_12_12),
-        SymOp(ROT_X_mZ_mY, TR_12_0_0),
-        SymOp(ROT_X_Z_Y, TR_0_12_0),
-        SymOp(ROT_mX_Z_mY, TR_0_0_12),
-        SymOp(ROT_mZ_mY_X, TR_12_12_12),
-        SymOp(ROT_mZ_Y_mX, TR_0_0_12),
-        SymOp(ROT_Z_mY_mX, TR_12_0_0),
-        SymOp(ROT_Z_Y_X, TR_0_12_0),
-        SymOp(ROT_X_Y_Z, TR_12_12_0),
-        SymOp(ROT_mX_mY_Z, TR_12_0_12),
-        SymOp(ROT_mX_Y_mZ, TR_0_0_0),
-        SymOp(ROT_X_mY_mZ, TR_0_12_12),
-        SymOp(ROT_Z_X_Y, TR_12_12_0),
-        SymOp(ROT_Z_mX_mY, TR_0_12_12),
-        SymOp(ROT_mZ_mX_Y, TR_12_0_12),
-        SymOp(ROT_mZ_X_mY, TR_0_0_0),
-        SymOp(ROT_Y_Z_X, TR_12_12_0),
-        SymOp(ROT_mY_Z_mX, TR_0_0_0),
-        SymOp(ROT_Y_mZ_mX, TR_0_12_12),
-        SymOp(ROT_mY_mZ_X, TR_12_0_12),
-        SymOp(ROT_Y_X_mZ, TR_14_34_34),
-        SymOp(ROT_mY_mX_mZ, TR_34_34_14),
-        SymOp(ROT_Y_mX_Z, TR_34_14_34),
-        SymOp(ROT_mY_X_Z, TR_14_14_14),
-        SymOp(ROT_X_Z_mY, TR_14_34_34),
-        SymOp(ROT_mX_Z_Y, TR_14_14_14),
-        SymOp(ROT_mX_mZ_mY, TR_34_34_14),
-        SymOp(ROT_X_mZ_Y, TR_34_14_34),
-        SymOp(ROT_Z_Y_mX, TR_14_34_34),
-        SymOp(ROT_Z_mY_X, TR_34_14_34),
-        SymOp(ROT_mZ_Y_X, TR_14_14_14),
-        SymOp(ROT_mZ_mY_mX, TR_34_34_14),
-        SymOp(ROT_mX_mY_mZ, TR_14_14_34),
-        SymOp(ROT_X_Y_mZ, TR_14_34_14),
-        SymOp(ROT_X_mY_Z, TR_34_34_34),
-        SymOp(ROT_mX_Y_Z, TR_34_14_14),
-        SymOp(ROT_mZ_mX_mY, TR_14_14_34),
-        SymOp(ROT_mZ_X_Y, TR_34_14_14),
-        SymOp(ROT_Z_X_mY, TR_14_34_14),
-        SymOp(ROT_Z_mX_Y, TR_34_34_34),
-        SymOp(ROT_mY_mZ_mX, TR_14_14_34),
-        SymOp(ROT_Y_mZ_X, TR_34_34_34),
-        SymOp(ROT_mY_Z_X, TR_34_14_14),
-        SymOp(ROT_Y_Z_mX, TR_14_34_14),
-        SymOp(ROT_mY_mX_Z, TR_12_0_0),
-        SymOp(ROT_Y_X_Z, TR_0_0_12),
-        SymOp(ROT_mY_X_mZ, TR_0_12_0),
-        SymOp(ROT_Y_mX_mZ, TR_12_12_12),
-        SymOp(ROT_mX_mZ_Y, TR_12_0_0),
-        SymOp(ROT_X_mZ_mY, TR_12_12_12),
-        SymOp(ROT_X_Z_Y, TR_0_0_12),
-        SymOp(ROT_mX_Z_mY, TR_0_12_0),
-        SymOp(ROT_mZ_mY_X, TR_12_0_0),
-        SymOp(ROT_mZ_Y_mX, TR_0_12_0),
-        SymOp(ROT_Z_mY_mX, TR_12_12_12),
-        SymOp(ROT_Z_Y_X, TR_0_0_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_12_12),
+        (ROT_mX_Y_mZ, TR_12_12_0),
+        (ROT_X_mY_mZ, TR_12_0_12),
+        (ROT_Z_X_Y, TR_0_0_0),
+        (ROT_Z_mX_mY, TR_12_0_12),
+        (ROT_mZ_mX_Y, TR_0_12_12),
+        (ROT_mZ_X_mY, TR_12_12_0),
+        (ROT_Y_Z_X, TR_0_0_0),
+        (ROT_mY_Z_mX, TR_12_12_0),
+        (ROT_Y_mZ_mX, TR_12_0_12),
+        (ROT_mY_mZ_X, TR_0_12_12),
+        (ROT_Y_X_mZ, TR_34_14_34),
+        (ROT_mY_mX_mZ, TR_14_14_14),
+        (ROT_Y_mX_Z, TR_14_34_34),
+        (ROT_mY_X_Z, TR_34_34_14),
+        (ROT_X_Z_mY, TR_34_14_34),
+        (ROT_mX_Z_Y, TR_34_34_14),
+        (ROT_mX_mZ_mY, TR_14_14_14),
+        (ROT_X_mZ_Y, TR_14_34_34),
+        (ROT_Z_Y_mX, TR_34_14_34),
+        (ROT_Z_mY_X, TR_14_34_34),
+        (ROT_mZ_Y_X, TR_34_34_14),
+        (ROT_mZ_mY_mX, TR_14_14_14),
+        (ROT_mX_mY_mZ, TR_34_34_34),
+        (ROT_X_Y_mZ, TR_34_14_14),
+        (ROT_X_mY_Z, TR_14_14_34),
+        (ROT_mX_Y_Z, TR_14_34_14),
+        (ROT_mZ_mX_mY, TR_34_34_34),
+        (ROT_mZ_X_Y, TR_14_34_14),
+        (ROT_Z_X_mY, TR_34_14_14),
+        (ROT_Z_mX_Y, TR_14_14_34),
+        (ROT_mY_mZ_mX, TR_34_34_34),
+        (ROT_Y_mZ_X, TR_14_14_34),
+        (ROT_mY_Z_X, TR_14_34_14),
+        (ROT_Y_Z_mX, TR_34_14_14),
+        (ROT_mY_mX_Z, TR_0_12_0),
+        (ROT_Y_X_Z, TR_12_12_12),
+        (ROT_mY_X_mZ, TR_12_0_0),
+        (ROT_Y_mX_mZ, TR_0_0_12),
+        (ROT_mX_mZ_Y, TR_0_12_0),
+        (ROT_X_mZ_mY, TR_0_0_12),
+        (ROT_X_Z_Y, TR_12_12_12),
+        (ROT_mX_Z_mY, TR_12_0_0),
+        (ROT_mZ_mY_X, TR_0_12_0),
+        (ROT_mZ_Y_mX, TR_12_0_0),
+        (ROT_Z_mY_mX, TR_0_0_12),
+        (ROT_Z_Y_X, TR_12_12_12),
+        (ROT_X_Y_Z, TR_0_12_12),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mX_Y_mZ, TR_12_0_12),
+        (ROT_X_mY_mZ, TR_12_12_0),
+        (ROT_Z_X_Y, TR_0_12_12),
+        (ROT_Z_mX_mY, TR_12_12_0),
+        (ROT_mZ_mX_Y, TR_0_0_0),
+        (ROT_mZ_X_mY, TR_12_0_12),
+        (ROT_Y_Z_X, TR_0_12_12),
+        (ROT_mY_Z_mX, TR_12_0_12),
+        (ROT_Y_mZ_mX, TR_12_12_0),
+        (ROT_mY_mZ_X, TR_0_0_0),
+        (ROT_Y_X_mZ, TR_34_34_14),
+        (ROT_mY_mX_mZ, TR_14_34_34),
+        (ROT_Y_mX_Z, TR_14_14_14),
+        (ROT_mY_X_Z, TR_34_14_34),
+        (ROT_X_Z_mY, TR_34_34_14),
+        (ROT_mX_Z_Y, TR_34_14_34),
+        (ROT_mX_mZ_mY, TR_14_34_34),
+        (ROT_X_mZ_Y, TR_14_14_14),
+        (ROT_Z_Y_mX, TR_34_34_14),
+        (ROT_Z_mY_X, TR_14_14_14),
+        (ROT_mZ_Y_X, TR_34_14_34),
+        (ROT_mZ_mY_mX, TR_14_34_34),
+        (ROT_mX_mY_mZ, TR_34_14_14),
+        (ROT_X_Y_mZ, TR_34_34_34),
+        (ROT_X_mY_Z, TR_14_34_14),
+        (ROT_mX_Y_Z, TR_14_14_34),
+        (ROT_mZ_mX_mY, TR_34_14_14),
+        (ROT_mZ_X_Y, TR_14_14_34),
+        (ROT_Z_X_mY, TR_34_34_34),
+        (ROT_Z_mX_Y, TR_14_34_14),
+        (ROT_mY_mZ_mX, TR_34_14_14),
+        (ROT_Y_mZ_X, TR_14_34_14),
+        (ROT_mY_Z_X, TR_14_14_34),
+        (ROT_Y_Z_mX, TR_34_34_34),
+        (ROT_mY_mX_Z, TR_0_0_12),
+        (ROT_Y_X_Z, TR_12_0_0),
+        (ROT_mY_X_mZ, TR_12_12_12),
+        (ROT_Y_mX_mZ, TR_0_12_0),
+        (ROT_mX_mZ_Y, TR_0_0_12),
+        (ROT_X_mZ_mY, TR_0_12_0),
+        (ROT_X_Z_Y, TR_12_0_0),
+        (ROT_mX_Z_mY, TR_12_12_12),
+        (ROT_mZ_mY_X, TR_0_0_12),
+        (ROT_mZ_Y_mX, TR_12_12_12),
+        (ROT_Z_mY_mX, TR_0_12_0),
+        (ROT_Z_Y_X, TR_12_0_0),
+        (ROT_X_Y_Z, TR_12_0_12),
+        (ROT_mX_mY_Z, TR_12_12_0),
+        (ROT_mX_Y_mZ, TR_0_12_12),
+        (ROT_X_mY_mZ, TR_0_0_0),
+        (ROT_Z_X_Y, TR_12_0_12),
+        (ROT_Z_mX_mY, TR_0_0_0),
+        (ROT_mZ_mX_Y, TR_12_12_0),
+        (ROT_mZ_X_mY, TR_0_12_12),
+        (ROT_Y_Z_X, TR_12_0_12),
+        (ROT_mY_Z_mX, TR_0_12_12),
+        (ROT_Y_mZ_mX, TR_0_0_0),
+        (ROT_mY_mZ_X, TR_12_12_0),
+        (ROT_Y_X_mZ, TR_14_14_14),
+        (ROT_mY_mX_mZ, TR_34_14_34),
+        (ROT_Y_mX_Z, TR_34_34_14),
+        (ROT_mY_X_Z, TR_14_34_34),
+        (ROT_X_Z_mY, TR_14_14_14),
+        (ROT_mX_Z_Y, TR_14_34_34),
+        (ROT_mX_mZ_mY, TR_34_14_34),
+        (ROT_X_mZ_Y, TR_34_34_14),
+        (ROT_Z_Y_mX, TR_14_14_14),
+        (ROT_Z_mY_X, TR_34_34_14),
+        (ROT_mZ_Y_X, TR_14_34_34),
+        (ROT_mZ_mY_mX, TR_34_14_34),
+        (ROT_mX_mY_mZ, TR_14_34_14),
+        (ROT_X_Y_mZ, TR_14_14_34),
+        (ROT_X_mY_Z, TR_34_14_14),
+        (ROT_mX_Y_Z, TR_34_34_34),
+        (ROT_mZ_mX_mY, TR_14_34_14),
+        (ROT_mZ_X_Y, TR_34_34_34),
+        (ROT_Z_X_mY, TR_14_14_34),
+        (ROT_Z_mX_Y, TR_34_14_14),
+        (ROT_mY_mZ_mX, TR_14_34_14),
+        (ROT_Y_mZ_X, TR_34_14_14),
+        (ROT_mY_Z_X, TR_34_34_34),
+        (ROT_Y_Z_mX, TR_14_14_34),
+        (ROT_mY_mX_Z, TR_12_12_12),
+        (ROT_Y_X_Z, TR_0_12_0),
+        (ROT_mY_X_mZ, TR_0_0_12),
+        (ROT_Y_mX_mZ, TR_12_0_0),
+        (ROT_mX_mZ_Y, TR_12_12_12),
+        (ROT_X_mZ_mY, TR_12_0_0),
+        (ROT_X_Z_Y, TR_0_12_0),
+        (ROT_mX_Z_mY, TR_0_0_12),
+        (ROT_mZ_mY_X, TR_12_12_12),
+        (ROT_mZ_Y_mX, TR_0_0_12),
+        (ROT_Z_mY_mX, TR_12_0_0),
+        (ROT_Z_Y_X, TR_0_12_0),
+        (ROT_X_Y_Z, TR_12_12_0),
+        (ROT_mX_mY_Z, TR_12_0_12),
+        (ROT_mX_Y_mZ, TR_0_0_0),
+        (ROT_X_mY_mZ, TR_0_12_12),
+        (ROT_Z_X_Y, TR_12_12_0),
+        (ROT_Z_mX_mY, TR_0_12_12),
+        (ROT_mZ_mX_Y, TR_12_0_12),
+        (ROT_mZ_X_mY, TR_0_0_0),
+        (ROT_Y_Z_X, TR_12_12_0),
+        (ROT_mY_Z_mX, TR_0_0_0),
+        (ROT_Y_mZ_mX, TR_0_12_12),
+        (ROT_mY_mZ_X, TR_12_0_12),
+        (ROT_Y_X_mZ, TR_14_34_34),
+        (ROT_mY_mX_mZ, TR_34_34_14),
+        (ROT_Y_mX_Z, TR_34_14_34),
+        (ROT_mY_X_Z, TR_14_14_14),
+        (ROT_X_Z_mY, TR_14_34_34),
+        (ROT_mX_Z_Y, TR_14_14_14),
+        (ROT_mX_mZ_mY, TR_34_34_14),
+        (ROT_X_mZ_Y, TR_34_14_34),
+        (ROT_Z_Y_mX, TR_14_34_34),
+        (ROT_Z_mY_X, TR_34_14_34),
+        (ROT_mZ_Y_X, TR_14_14_14),
+        (ROT_mZ_mY_mX, TR_34_34_14),
+        (ROT_mX_mY_mZ, TR_14_14_34),
+        (ROT_X_Y_mZ, TR_14_34_14),
+        (ROT_X_mY_Z, TR_34_34_34),
+        (ROT_mX_Y_Z, TR_34_14_14),
+        (ROT_mZ_mX_mY, TR_14_14_34),
+        (ROT_mZ_X_Y, TR_34_14_14),
+        (ROT_Z_X_mY, TR_14_34_14),
+        (ROT_Z_mX_Y, TR_34_34_34),
+        (ROT_mY_mZ_mX, TR_14_14_34),
+        (ROT_Y_mZ_X, TR_34_34_34),
+        (ROT_mY_Z_X, TR_34_14_14),
+        (ROT_Y_Z_mX, TR_14_34_14),
+        (ROT_mY_mX_Z, TR_12_0_0),
+        (ROT_Y_X_Z, TR_0_0_12),
+        (ROT_mY_X_mZ, TR_0_12_0),
+        (ROT_Y_mX_mZ, TR_12_12_12),
+        (ROT_mX_mZ_Y, TR_12_0_0),
+        (ROT_X_mZ_mY, TR_12_12_12),
+        (ROT_X_Z_Y, TR_0_0_12),
+        (ROT_mX_Z_mY, TR_0_12_0),
+        (ROT_mZ_mY_X, TR_12_0_0),
+        (ROT_mZ_Y_mX, TR_0_12_0),
+        (ROT_Z_mY_mX, TR_12_12_12),
+        (ROT_Z_Y_X, TR_0_0_12)])
 
 sg229 = SpaceGroup(
     number=229,
@@ -6788,103 +6786,103 @@ sg229 = SpaceGroup(
     point_group_name="PGm3barm",
     crystal_system=CUBIC,
     pdb_name="I 4/m -3 2/m",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mX_Y_mZ, TR_0_0_0),
-        SymOp(ROT_X_mY_mZ, TR_0_0_0),
-        SymOp(ROT_Z_X_Y, TR_0_0_0),
-        SymOp(ROT_Z_mX_mY, TR_0_0_0),
-        SymOp(ROT_mZ_mX_Y, TR_0_0_0),
-        SymOp(ROT_mZ_X_mY, TR_0_0_0),
-        SymOp(ROT_Y_Z_X, TR_0_0_0),
-        SymOp(ROT_mY_Z_mX, TR_0_0_0),
-        SymOp(ROT_Y_mZ_mX, TR_0_0_0),
-        SymOp(ROT_mY_mZ_X, TR_0_0_0),
-        SymOp(ROT_Y_X_mZ, TR_0_0_0),
-        SymOp(ROT_mY_mX_mZ, TR_0_0_0),
-        SymOp(ROT_Y_mX_Z, TR_0_0_0),
-        SymOp(ROT_mY_X_Z, TR_0_0_0),
-        SymOp(ROT_X_Z_mY, TR_0_0_0),
-        SymOp(ROT_mX_Z_Y, TR_0_0_0),
-        SymOp(ROT_mX_mZ_mY, TR_0_0_0),
-        SymOp(ROT_X_mZ_Y, TR_0_0_0),
-        SymOp(ROT_Z_Y_mX, TR_0_0_0),
-        SymOp(ROT_Z_mY_X, TR_0_0_0),
-        SymOp(ROT_mZ_Y_X, TR_0_0_0),
-        SymOp(ROT_mZ_mY_mX, TR_0_0_0),
-        SymOp(ROT_mX_mY_mZ, TR_0_0_0),
-        SymOp(ROT_X_Y_mZ, TR_0_0_0),
-        SymOp(ROT_X_mY_Z, TR_0_0_0),
-        SymOp(ROT_mX_Y_Z, TR_0_0_0),
-        SymOp(ROT_mZ_mX_mY, TR_0_0_0),
-        SymOp(ROT_mZ_X_Y, TR_0_0_0),
-        SymOp(ROT_Z_X_mY, TR_0_0_0),
-        SymOp(ROT_Z_mX_Y, TR_0_0_0),
-        SymOp(ROT_mY_mZ_mX, TR_0_0_0),
-        SymOp(ROT_Y_mZ_X, TR_0_0_0),
-        SymOp(ROT_mY_Z_X, TR_0_0_0),
-        SymOp(ROT_Y_Z_mX, TR_0_0_0),
-        SymOp(ROT_mY_mX_Z, TR_0_0_0),
-        SymOp(ROT_Y_X_Z, TR_0_0_0),
-        SymOp(ROT_mY_X_mZ, TR_0_0_0),
-        SymOp(ROT_Y_mX_mZ, TR_0_0_0),
-        SymOp(ROT_mX_mZ_Y, TR_0_0_0),
-        SymOp(ROT_X_mZ_mY, TR_0_0_0),
-        SymOp(ROT_X_Z_Y, TR_0_0_0),
-        SymOp(ROT_mX_Z_mY, TR_0_0_0),
-        SymOp(ROT_mZ_mY_X, TR_0_0_0),
-        SymOp(ROT_mZ_Y_mX, TR_0_0_0),
-        SymOp(ROT_Z_mY_mX, TR_0_0_0),
-        SymOp(ROT_Z_Y_X, TR_0_0_0),
-        SymOp(ROT_X_Y_Z, TR_12_12_12),
-        SymOp(ROT_mX_mY_Z, TR_12_12_12),
-        SymOp(ROT_mX_Y_mZ, TR_12_12_12),
-        SymOp(ROT_X_mY_mZ, TR_12_12_12),
-        SymOp(ROT_Z_X_Y, TR_12_12_12),
-        SymOp(ROT_Z_mX_mY, TR_12_12_12),
-        SymOp(ROT_mZ_mX_Y, TR_12_12_12),
-        SymOp(ROT_mZ_X_mY, TR_12_12_12),
-        SymOp(ROT_Y_Z_X, TR_12_12_12),
-        SymOp(ROT_mY_Z_mX, TR_12_12_12),
-        SymOp(ROT_Y_mZ_mX, TR_12_12_12),
-        SymOp(ROT_mY_mZ_X, TR_12_12_12),
-        SymOp(ROT_Y_X_mZ, TR_12_12_12),
-        SymOp(ROT_mY_mX_mZ, TR_12_12_12),
-        SymOp(ROT_Y_mX_Z, TR_12_12_12),
-        SymOp(ROT_mY_X_Z, TR_12_12_12),
-        SymOp(ROT_X_Z_mY, TR_12_12_12),
-        SymOp(ROT_mX_Z_Y, TR_12_12_12),
-        SymOp(ROT_mX_mZ_mY, TR_12_12_12),
-        SymOp(ROT_X_mZ_Y, TR_12_12_12),
-        SymOp(ROT_Z_Y_mX, TR_12_12_12),
-        SymOp(ROT_Z_mY_X, TR_12_12_12),
-        SymOp(ROT_mZ_Y_X, TR_12_12_12),
-        SymOp(ROT_mZ_mY_mX, TR_12_12_12),
-        SymOp(ROT_mX_mY_mZ, TR_12_12_12),
-        SymOp(ROT_X_Y_mZ, TR_12_12_12),
-        SymOp(ROT_X_mY_Z, TR_12_12_12),
-        SymOp(ROT_mX_Y_Z, TR_12_12_12),
-        SymOp(ROT_mZ_mX_mY, TR_12_12_12),
-        SymOp(ROT_mZ_X_Y, TR_12_12_12),
-        SymOp(ROT_Z_X_mY, TR_12_12_12),
-        SymOp(ROT_Z_mX_Y, TR_12_12_12),
-        SymOp(ROT_mY_mZ_mX, TR_12_12_12),
-        SymOp(ROT_Y_mZ_X, TR_12_12_12),
-        SymOp(ROT_mY_Z_X, TR_12_12_12),
-        SymOp(ROT_Y_Z_mX, TR_12_12_12),
-        SymOp(ROT_mY_mX_Z, TR_12_12_12),
-        SymOp(ROT_Y_X_Z, TR_12_12_12),
-        SymOp(ROT_mY_X_mZ, TR_12_12_12),
-        SymOp(ROT_Y_mX_mZ, TR_12_12_12),
-        SymOp(ROT_mX_mZ_Y, TR_12_12_12),
-        SymOp(ROT_X_mZ_mY, TR_12_12_12),
-        SymOp(ROT_X_Z_Y, TR_12_12_12),
-        SymOp(ROT_mX_Z_mY, TR_12_12_12),
-        SymOp(ROT_mZ_mY_X, TR_12_12_12),
-        SymOp(ROT_mZ_Y_mX, TR_12_12_12),
-        SymOp(ROT_Z_mY_mX, TR_12_12_12),
-        SymOp(ROT_Z_Y_X, TR_12_12_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mX_Y_mZ, TR_0_0_0),
+        (ROT_X_mY_mZ, TR_0_0_0),
+        (ROT_Z_X_Y, TR_0_0_0),
+        (ROT_Z_mX_mY, TR_0_0_0),
+        (ROT_mZ_mX_Y, TR_0_0_0),
+        (ROT_mZ_X_mY, TR_0_0_0),
+        (ROT_Y_Z_X, TR_0_0_0),
+        (ROT_mY_Z_mX, TR_0_0_0),
+        (ROT_Y_mZ_mX, TR_0_0_0),
+        (ROT_mY_mZ_X, TR_0_0_0),
+        (ROT_Y_X_mZ, TR_0_0_0),
+        (ROT_mY_mX_mZ, TR_0_0_0),
+        (ROT_Y_mX_Z, TR_0_0_0),
+        (ROT_mY_X_Z, TR_0_0_0),
+        (ROT_X_Z_mY, TR_0_0_0),
+        (ROT_mX_Z_Y, TR_0_0_0),
+        (ROT_mX_mZ_mY, TR_0_0_0),
+        (ROT_X_mZ_Y, TR_0_0_0),
+        (ROT_Z_Y_mX, TR_0_0_0),
+        (ROT_Z_mY_X, TR_0_0_0),
+        (ROT_mZ_Y_X, TR_0_0_0),
+        (ROT_mZ_mY_mX, TR_0_0_0),
+        (ROT_mX_mY_mZ, TR_0_0_0),
+        (ROT_X_Y_mZ, TR_0_0_0),
+        (ROT_X_mY_Z, TR_0_0_0),
+        (ROT_mX_Y_Z, TR_0_0_0),
+        (ROT_mZ_mX_mY, TR_0_0_0),
+        (ROT_mZ_X_Y, TR_0_0_0),
+        (ROT_Z_X_mY, TR_0_0_0),
+        (ROT_Z_mX_Y, TR_0_0_0),
+        (ROT_mY_mZ_mX, TR_0_0_0),
+        (ROT_Y_mZ_X, TR_0_0_0),
+        (ROT_mY_Z_X, TR_0_0_0),
+        (ROT_Y_Z_mX, TR_0_0_0),
+        (ROT_mY_mX_Z, TR_0_0_0),
+        (ROT_Y_X_Z, TR_0_0_0),
+        (ROT_mY_X_mZ, TR_0_0_0),
+        (ROT_Y_mX_mZ, TR_0_0_0),
+        (ROT_mX_mZ_Y, TR_0_0_0),
+        (ROT_X_mZ_mY, TR_0_0_0),
+        (ROT_X_Z_Y, TR_0_0_0),
+        (ROT_mX_Z_mY, TR_0_0_0),
+        (ROT_mZ_mY_X, TR_0_0_0),
+        (ROT_mZ_Y_mX, TR_0_0_0),
+        (ROT_Z_mY_mX, TR_0_0_0),
+        (ROT_Z_Y_X, TR_0_0_0),
+        (ROT_X_Y_Z, TR_12_12_12),
+        (ROT_mX_mY_Z, TR_12_12_12),
+        (ROT_mX_Y_mZ, TR_12_12_12),
+        (ROT_X_mY_mZ, TR_12_12_12),
+        (ROT_Z_X_Y, TR_12_12_12),
+        (ROT_Z_mX_mY, TR_12_12_12),
+        (ROT_mZ_mX_Y, TR_12_12_12),
+        (ROT_mZ_X_mY, TR_12_12_12),
+        (ROT_Y_Z_X, TR_12_12_12),
+        (ROT_mY_Z_mX, TR_12_12_12),
+        (ROT_Y_mZ_mX, TR_12_12_12),
+        (ROT_mY_mZ_X, TR_12_12_12),
+        (ROT_Y_X_mZ, TR_12_12_12),
+        (ROT_mY_mX_mZ, TR_12_12_12),
+        (ROT_Y_mX_Z, TR_12_12_12),
+        (ROT_mY_X_Z, TR_12_12_12),
+        (ROT_X_Z_mY, TR_12_12_12),
+        (ROT_mX_Z_Y, TR_12_12_12),
+        (ROT_mX_mZ_mY, TR_12_12_12),
+        (ROT_X_mZ_Y, TR_12_12_12),
+        (ROT_Z_Y_mX, TR_12_12_12),
+        (ROT_Z_mY_X, TR_12_12_12),
+        (ROT_mZ_Y_X, TR_12_12_12),
+        (ROT_mZ_mY_mX, TR_12_12_12),
+        (ROT_mX_mY_mZ, TR_12_12_12),
+        (ROT_X_Y_mZ, TR_12_12_12),
+        (ROT_X_mY_Z, TR_12_12_12),
+        (ROT_mX_Y_Z, TR_12_12_12),
+        (ROT_mZ_mX_mY, TR_12_12_12),
+        (ROT_mZ_X_Y, TR_12_12_12),
+        (ROT_Z_X_mY, TR_12_12_12),
+        (ROT_Z_mX_Y, TR_12_12_12),
+        (ROT_mY_mZ_mX, TR_12_12_12),
+        (ROT_Y_mZ_X, TR_12_12_12),
+        (ROT_mY_Z_X, TR_12_12_12),
+        (ROT_Y_Z_mX, TR_12_12_12),
+        (ROT_mY_mX_Z, TR_12_12_12),
+        (ROT_Y_X_Z, TR_12_12_12),
+        (ROT_mY_X_mZ, TR_12_12_12),
+        (ROT_Y_mX_mZ, TR_12_12_12),
+        (ROT_mX_mZ_Y, TR_12_12_12),
+        (ROT_X_mZ_mY, TR_12_12_12),
+        (ROT_X_Z_Y, TR_12_12_12),
+        (ROT_mX_Z_mY, TR_12_12_12),
+        (ROT_mZ_mY_X, TR_12_12_12),
+        (ROT_mZ_Y_mX, TR_12_12_12),
+        (ROT_Z_mY_mX, TR_12_12_12),
+        (ROT_Z_Y_X, TR_12_12_12)])
 
 sg230 = SpaceGroup(
     number=230,
@@ -6894,103 +6892,103 @@ sg230 = SpaceGroup(
     point_group_name="PGm3barm",
     crystal_system=CUBIC,
     pdb_name="I 41/a -3 2/d",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_12_0_12),
-        SymOp(ROT_mX_Y_mZ, TR_0_12_12),
-        SymOp(ROT_X_mY_mZ, TR_12_12_0),
-        SymOp(ROT_Z_X_Y, TR_0_0_0),
-        SymOp(ROT_Z_mX_mY, TR_12_12_0),
-        SymOp(ROT_mZ_mX_Y, TR_12_0_12),
-        SymOp(ROT_mZ_X_mY, TR_0_12_12),
-        SymOp(ROT_Y_Z_X, TR_0_0_0),
-        SymOp(ROT_mY_Z_mX, TR_0_12_12),
-        SymOp(ROT_Y_mZ_mX, TR_12_12_0),
-        SymOp(ROT_mY_mZ_X, TR_12_0_12),
-        SymOp(ROT_Y_X_mZ, TR_34_14_14),
-        SymOp(ROT_mY_mX_mZ, TR_34_34_34),
-        SymOp(ROT_Y_mX_Z, TR_14_14_34),
-        SymOp(ROT_mY_X_Z, TR_14_34_14),
-        SymOp(ROT_X_Z_mY, TR_34_14_14),
-        SymOp(ROT_mX_Z_Y, TR_14_34_14),
-        SymOp(ROT_mX_mZ_mY, TR_34_34_34),
-        SymOp(ROT_X_mZ_Y, TR_14_14_34),
-        SymOp(ROT_Z_Y_mX, TR_34_14_14),
-        SymOp(ROT_Z_mY_X, TR_14_14_34),
-        SymOp(ROT_mZ_Y_X, TR_14_34_14),
-        SymOp(ROT_mZ_mY_mX, TR_34_34_34),
-        SymOp(ROT_mX_mY_mZ, TR_0_0_0),
-        SymOp(ROT_X_Y_mZ, TR_12_0_12),
-        SymOp(ROT_X_mY_Z, TR_0_12_12),
-        SymOp(ROT_mX_Y_Z, TR_12_12_0),
-        SymOp(ROT_mZ_mX_mY, TR_0_0_0),
-        SymOp(ROT_mZ_X_Y, TR_12_12_0),
-        SymOp(ROT_Z_X_mY, TR_12_0_12),
-        SymOp(ROT_Z_mX_Y, TR_0_12_12),
-        SymOp(ROT_mY_mZ_mX, TR_0_0_0),
-        SymOp(ROT_Y_mZ_X, TR_0_12_12),
-        SymOp(ROT_mY_Z_X, TR_12_12_0),
-        SymOp(ROT_Y_Z_mX, TR_12_0_12),
-        SymOp(ROT_mY_mX_Z, TR_14_34_34),
-        SymOp(ROT_Y_X_Z, TR_14_14_14),
-        SymOp(ROT_mY_X_mZ, TR_34_34_14),
-        SymOp(ROT_Y_mX_mZ, TR_34_14_34),
-        SymOp(ROT_mX_mZ_Y, TR_14_34_34),
-        SymOp(ROT_X_mZ_mY, TR_34_14_34),
-        SymOp(ROT_X_Z_Y, TR_14_14_14),
-        SymOp(ROT_mX_Z_mY, TR_34_34_14),
-        SymOp(ROT_mZ_mY_X, TR_14_34_34),
-        SymOp(ROT_mZ_Y_mX, TR_34_34_14),
-        SymOp(ROT_Z_mY_mX, TR_34_14_34),
-        SymOp(ROT_Z_Y_X, TR_14_14_14),
-        SymOp(ROT_X_Y_Z, TR_12_12_12),
-        SymOp(ROT_mX_mY_Z, TR_0_12_0),
-        SymOp(ROT_mX_Y_mZ, TR_12_0_0),
-        SymOp(ROT_X_mY_mZ, TR_0_0_12),
-        SymOp(ROT_Z_X_Y, TR_12_12_12),
-        SymOp(ROT_Z_mX_mY, TR_0_0_12),
-        SymOp(ROT_mZ_mX_Y, TR_0_12_0),
-        SymOp(ROT_mZ_X_mY, TR_12_0_0),
-        SymOp(ROT_Y_Z_X, TR_12_12_12),
-        SymOp(ROT_mY_Z_mX, TR_12_0_0),
-        SymOp(ROT_Y_mZ_mX, TR_0_0_12),
-        SymOp(ROT_mY_mZ_X, TR_0_12_0),
-        SymOp(ROT_Y_X_mZ, TR_14_34_34),
-        SymOp(ROT_mY_mX_mZ, TR_14_14_14),
-        SymOp(ROT_Y_mX_Z, TR_34_34_14),
-        SymOp(ROT_mY_X_Z, TR_34_14_34),
-        SymOp(ROT_X_Z_mY, TR_14_34_34),
-        SymOp(ROT_mX_Z_Y, TR_34_14_34),
-        SymOp(ROT_mX_mZ_mY, TR_14_14_14),
-        SymOp(ROT_X_mZ_Y, TR_34_34_14),
-        SymOp(ROT_Z_Y_mX, TR_14_34_34),
-        SymOp(ROT_Z_mY_X, TR_34_34_14),
-        SymOp(ROT_mZ_Y_X, TR_34_14_34),
-        SymOp(ROT_mZ_mY_mX, TR_14_14_14),
-        SymOp(ROT_mX_mY_mZ, TR_12_12_12),
-        SymOp(ROT_X_Y_mZ, TR_0_12_0),
-        SymOp(ROT_X_mY_Z, TR_12_0_0),
-        SymOp(ROT_mX_Y_Z, TR_0_0_12),
-        SymOp(ROT_mZ_mX_mY, TR_12_12_12),
-        SymOp(ROT_mZ_X_Y, TR_0_0_12),
-        SymOp(ROT_Z_X_mY, TR_0_12_0),
-        SymOp(ROT_Z_mX_Y, TR_12_0_0),
-        SymOp(ROT_mY_mZ_mX, TR_12_12_12),
-        SymOp(ROT_Y_mZ_X, TR_12_0_0),
-        SymOp(ROT_mY_Z_X, TR_0_0_12),
-        SymOp(ROT_Y_Z_mX, TR_0_12_0),
-        SymOp(ROT_mY_mX_Z, TR_34_14_14),
-        SymOp(ROT_Y_X_Z, TR_34_34_34),
-        SymOp(ROT_mY_X_mZ, TR_14_14_34),
-        SymOp(ROT_Y_mX_mZ, TR_14_34_14),
-        SymOp(ROT_mX_mZ_Y, TR_34_14_14),
-        SymOp(ROT_X_mZ_mY, TR_14_34_14),
-        SymOp(ROT_X_Z_Y, TR_34_34_34),
-        SymOp(ROT_mX_Z_mY, TR_14_14_34),
-        SymOp(ROT_mZ_mY_X, TR_34_14_14),
-        SymOp(ROT_mZ_Y_mX, TR_14_14_34),
-        SymOp(ROT_Z_mY_mX, TR_14_34_14),
-        SymOp(ROT_Z_Y_X, TR_34_34_34)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_12_0_12),
+        (ROT_mX_Y_mZ, TR_0_12_12),
+        (ROT_X_mY_mZ, TR_12_12_0),
+        (ROT_Z_X_Y, TR_0_0_0),
+        (ROT_Z_mX_mY, TR_12_12_0),
+        (ROT_mZ_mX_Y, TR_12_0_12),
+        (ROT_mZ_X_mY, TR_0_12_12),
+        (ROT_Y_Z_X, TR_0_0_0),
+        (ROT_mY_Z_mX, TR_0_12_12),
+        (ROT_Y_mZ_mX, TR_12_12_0),
+        (ROT_mY_mZ_X, TR_12_0_12),
+        (ROT_Y_X_mZ, TR_34_14_14),
+        (ROT_mY_mX_mZ, TR_34_34_34),
+        (ROT_Y_mX_Z, TR_14_14_34),
+        (ROT_mY_X_Z, TR_14_34_14),
+        (ROT_X_Z_mY, TR_34_14_14),
+        (ROT_mX_Z_Y, TR_14_34_14),
+        (ROT_mX_mZ_mY, TR_34_34_34),
+        (ROT_X_mZ_Y, TR_14_14_34),
+        (ROT_Z_Y_mX, TR_34_14_14),
+        (ROT_Z_mY_X, TR_14_14_34),
+        (ROT_mZ_Y_X, TR_14_34_14),
+        (ROT_mZ_mY_mX, TR_34_34_34),
+        (ROT_mX_mY_mZ, TR_0_0_0),
+        (ROT_X_Y_mZ, TR_12_0_12),
+        (ROT_X_mY_Z, TR_0_12_12),
+        (ROT_mX_Y_Z, TR_12_12_0),
+        (ROT_mZ_mX_mY, TR_0_0_0),
+        (ROT_mZ_X_Y, TR_12_12_0),
+        (ROT_Z_X_mY, TR_12_0_12),
+        (ROT_Z_mX_Y, TR_0_12_12),
+        (ROT_mY_mZ_mX, TR_0_0_0),
+        (ROT_Y_mZ_X, TR_0_12_12),
+        (ROT_mY_Z_X, TR_12_12_0),
+        (ROT_Y_Z_mX, TR_12_0_12),
+        (ROT_mY_mX_Z, TR_14_34_34),
+        (ROT_Y_X_Z, TR_14_14_14),
+        (ROT_mY_X_mZ, TR_34_34_14),
+        (ROT_Y_mX_mZ, TR_34_14_34),
+        (ROT_mX_mZ_Y, TR_14_34_34),
+        (ROT_X_mZ_mY, TR_34_14_34),
+        (ROT_X_Z_Y, TR_14_14_14),
+        (ROT_mX_Z_mY, TR_34_34_14),
+        (ROT_mZ_mY_X, TR_14_34_34),
+        (ROT_mZ_Y_mX, TR_34_34_14),
+        (ROT_Z_mY_mX, TR_34_14_34),
+        (ROT_Z_Y_X, TR_14_14_14),
+        (ROT_X_Y_Z, TR_12_12_12),
+        (ROT_mX_mY_Z, TR_0_12_0),
+        (ROT_mX_Y_mZ, TR_12_0_0),
+        (ROT_X_mY_mZ, TR_0_0_12),
+        (ROT_Z_X_Y, TR_12_12_12),
+        (ROT_Z_mX_mY, TR_0_0_12),
+        (ROT_mZ_mX_Y, TR_0_12_0),
+        (ROT_mZ_X_mY, TR_12_0_0),
+        (ROT_Y_Z_X, TR_12_12_12),
+        (ROT_mY_Z_mX, TR_12_0_0),
+        (ROT_Y_mZ_mX, TR_0_0_12),
+        (ROT_mY_mZ_X, TR_0_12_0),
+        (ROT_Y_X_mZ, TR_14_34_34),
+        (ROT_mY_mX_mZ, TR_14_14_14),
+        (ROT_Y_mX_Z, TR_34_34_14),
+        (ROT_mY_X_Z, TR_34_14_34),
+        (ROT_X_Z_mY, TR_14_34_34),
+        (ROT_mX_Z_Y, TR_34_14_34),
+        (ROT_mX_mZ_mY, TR_14_14_14),
+        (ROT_X_mZ_Y, TR_34_34_14),
+        (ROT_Z_Y_mX, TR_14_34_34),
+        (ROT_Z_mY_X, TR_34_34_14),
+        (ROT_mZ_Y_X, TR_34_14_34),
+        (ROT_mZ_mY_mX, TR_14_14_14),
+        (ROT_mX_mY_mZ, TR_12_12_12),
+        (ROT_X_Y_mZ, TR_0_12_0),
+        (ROT_X_mY_Z, TR_12_0_0),
+        (ROT_mX_Y_Z, TR_0_0_12),
+        (ROT_mZ_mX_mY, TR_12_12_12),
+        (ROT_mZ_X_Y, TR_0_0_12),
+        (ROT_Z_X_mY, TR_0_12_0),
+        (ROT_Z_mX_Y, TR_12_0_0),
+        (ROT_mY_mZ_mX, TR_12_12_12),
+        (ROT_Y_mZ_X, TR_12_0_0),
+        (ROT_mY_Z_X, TR_0_0_12),
+        (ROT_Y_Z_mX, TR_0_12_0),
+        (ROT_mY_mX_Z, TR_34_14_14),
+        (ROT_Y_X_Z, TR_34_34_34),
+        (ROT_mY_X_mZ, TR_14_14_34),
+        (ROT_Y_mX_mZ, TR_14_34_14),
+        (ROT_mX_mZ_Y, TR_34_14_14),
+        (ROT_X_mZ_mY, TR_14_34_14),
+        (ROT_X_Z_Y, TR_34_34_34),
+        (ROT_mX_Z_mY, TR_14_14_34),
+        (ROT_mZ_mY_X, TR_34_14_14),
+        (ROT_mZ_Y_mX, TR_14_14_34),
+        (ROT_Z_mY_mX, TR_14_34_14),
+        (ROT_Z_Y_X, TR_34_34_34)])
 
 sg1003 = SpaceGroup(
     number=1003,
@@ -7000,9 +6998,9 @@ sg1003 = SpaceGroup(
     point_group_name="PG2C",
     crystal_system=MONOCLINIC,
     pdb_name="P 1 1 2",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0)])
 
 sg1004 = SpaceGroup(
     number=1004,
@@ -7012,9 +7010,9 @@ sg1004 = SpaceGroup(
     point_group_name="PG2C",
     crystal_system=MONOCLINIC,
     pdb_name="P 1 1 21",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_12)])
 
 sg3004 = SpaceGroup(
     number=3004,
@@ -7024,11 +7022,11 @@ sg3004 = SpaceGroup(
     point_group_name="PG2",
     crystal_system=MONOCLINIC,
     pdb_name="I 1 21 1",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_Y_mZ, TR_0_12_0),
-        SymOp(ROT_X_Y_Z, TR_12_12_12),
-        SymOp(ROT_mX_Y_mZ, TR_12_0_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_Y_mZ, TR_0_12_0),
+        (ROT_X_Y_Z, TR_12_12_12),
+        (ROT_mX_Y_mZ, TR_12_0_12)])
 
 sg1005 = SpaceGroup(
     number=1005,
@@ -7038,11 +7036,11 @@ sg1005 = SpaceGroup(
     point_group_name="PG2C",
     crystal_system=MONOCLINIC,
     pdb_name="B 1 1 2",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_X_Y_Z, TR_12_0_12),
-        SymOp(ROT_mX_mY_Z, TR_12_0_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_X_Y_Z, TR_12_0_12),
+        (ROT_mX_mY_Z, TR_12_0_12)])
 
 sg2005 = SpaceGroup(
     number=2005,
@@ -7052,11 +7050,11 @@ sg2005 = SpaceGroup(
     point_group_name="PG2C",
     crystal_system=MONOCLINIC,
     pdb_name="A 2 1 1",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_X_mY_mZ, TR_0_0_0),
-        SymOp(ROT_X_Y_Z, TR_0_12_12),
-        SymOp(ROT_X_mY_mZ, TR_0_12_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_X_mY_mZ, TR_0_0_0),
+        (ROT_X_Y_Z, TR_0_12_12),
+        (ROT_X_mY_mZ, TR_0_12_12)])
 
 sg3005 = SpaceGroup(
     number=3005,
@@ -7066,11 +7064,11 @@ sg3005 = SpaceGroup(
     point_group_name="PG2",
     crystal_system=MONOCLINIC,
     pdb_name="C 1 21 1",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_Y_mZ, TR_0_12_0),
-        SymOp(ROT_X_Y_Z, TR_12_12_0),
-        SymOp(ROT_mX_Y_mZ, TR_12_0_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_Y_mZ, TR_0_12_0),
+        (ROT_X_Y_Z, TR_12_12_0),
+        (ROT_mX_Y_mZ, TR_12_0_0)])
 
 sg1006 = SpaceGroup(
     number=1006,
@@ -7080,9 +7078,9 @@ sg1006 = SpaceGroup(
     point_group_name="PG2C",
     crystal_system=MONOCLINIC,
     pdb_name="P 1 1 m",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_X_Y_mZ, TR_0_0_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_X_Y_mZ, TR_0_0_0)])
 
 sg1007 = SpaceGroup(
     number=1007,
@@ -7092,9 +7090,9 @@ sg1007 = SpaceGroup(
     point_group_name="PG2C",
     crystal_system=MONOCLINIC,
     pdb_name="P 1 1 b",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_X_Y_mZ, TR_0_12_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_X_Y_mZ, TR_0_12_0)])
 
 sg1008 = SpaceGroup(
     number=1008,
@@ -7104,11 +7102,11 @@ sg1008 = SpaceGroup(
     point_group_name="PG2",
     crystal_system=MONOCLINIC,
     pdb_name="B 1 1 m",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_X_mY_Z, TR_0_0_0),
-        SymOp(ROT_X_Y_Z, TR_12_12_0),
-        SymOp(ROT_X_mY_Z, TR_12_12_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_X_mY_Z, TR_0_0_0),
+        (ROT_X_Y_Z, TR_12_12_0),
+        (ROT_X_mY_Z, TR_12_12_0)])
 
 sg1009 = SpaceGroup(
     number=1009,
@@ -7118,11 +7116,11 @@ sg1009 = SpaceGroup(
     point_group_name="PG2C",
     crystal_system=MONOCLINIC,
     pdb_name="B 1 1 b",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_X_Y_mZ, TR_0_12_0),
-        SymOp(ROT_X_Y_Z, TR_12_0_12),
-        SymOp(ROT_X_Y_mZ, TR_12_12_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_X_Y_mZ, TR_0_12_0),
+        (ROT_X_Y_Z, TR_12_0_12),
+        (ROT_X_Y_mZ, TR_12_12_12)])
 
 sg1010 = SpaceGroup(
     number=1010,
@@ -7132,11 +7130,11 @@ sg1010 = SpaceGroup(
     point_group_name="PG2C",
     crystal_system=MONOCLINIC,
     pdb_name="P 1 1 2/m",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_X_Y_mZ, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_mZ, TR_0_0_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_X_Y_mZ, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mX_mY_mZ, TR_0_0_0)])
 
 sg1011 = SpaceGroup(
     number=1011,
@@ -7146,11 +7144,11 @@ sg1011 = SpaceGroup(
     point_group_name="PG2C",
     crystal_system=MONOCLINIC,
     pdb_name="P 1 1 21/m",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_12),
-        SymOp(ROT_mX_mY_mZ, TR_0_0_0),
-        SymOp(ROT_X_Y_mZ, TR_0_0_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_12),
+        (ROT_mX_mY_mZ, TR_0_0_0),
+        (ROT_X_Y_mZ, TR_0_0_12)])
 
 sg1012 = SpaceGroup(
     number=1012,
@@ -7160,15 +7158,15 @@ sg1012 = SpaceGroup(
     point_group_name="PG2C",
     crystal_system=MONOCLINIC,
     pdb_name="B 1 1 2/m",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_X_Y_mZ, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_mZ, TR_0_0_0),
-        SymOp(ROT_X_Y_Z, TR_12_0_12),
-        SymOp(ROT_X_Y_mZ, TR_12_0_12),
-        SymOp(ROT_mX_mY_Z, TR_12_0_12),
-        SymOp(ROT_mX_mY_mZ, TR_12_0_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_X_Y_mZ, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_mX_mY_mZ, TR_0_0_0),
+        (ROT_X_Y_Z, TR_12_0_12),
+        (ROT_X_Y_mZ, TR_12_0_12),
+        (ROT_mX_mY_Z, TR_12_0_12),
+        (ROT_mX_mY_mZ, TR_12_0_12)])
 
 sg1013 = SpaceGroup(
     number=1013,
@@ -7178,11 +7176,11 @@ sg1013 = SpaceGroup(
     point_group_name="PG2C",
     crystal_system=MONOCLINIC,
     pdb_name="P 1 1 2/b",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_12_0),
-        SymOp(ROT_mX_mY_mZ, TR_0_0_0),
-        SymOp(ROT_X_Y_mZ, TR_0_12_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_12_0),
+        (ROT_mX_mY_mZ, TR_0_0_0),
+        (ROT_X_Y_mZ, TR_0_12_0)])
 
 sg1014 = SpaceGroup(
     number=1014,
@@ -7192,11 +7190,11 @@ sg1014 = SpaceGroup(
     point_group_name="PG2C",
     crystal_system=MONOCLINIC,
     pdb_name="P 1 1 21/b",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_mZ, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_12_12),
-        SymOp(ROT_X_Y_mZ, TR_0_12_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_mZ, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_12_12),
+        (ROT_X_Y_mZ, TR_0_12_12)])
 
 sg1015 = SpaceGroup(
     number=1015,
@@ -7206,15 +7204,15 @@ sg1015 = SpaceGroup(
     point_group_name="PG2C",
     crystal_system=MONOCLINIC,
     pdb_name="B 1 1 2/b",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_0_12_0),
-        SymOp(ROT_mX_mY_mZ, TR_0_0_0),
-        SymOp(ROT_X_Y_mZ, TR_0_12_0),
-        SymOp(ROT_X_Y_Z, TR_12_0_12),
-        SymOp(ROT_mX_mY_Z, TR_12_12_12),
-        SymOp(ROT_mX_mY_mZ, TR_12_0_12),
-        SymOp(ROT_X_Y_mZ, TR_12_12_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_0_12_0),
+        (ROT_mX_mY_mZ, TR_0_0_0),
+        (ROT_X_Y_mZ, TR_0_12_0),
+        (ROT_X_Y_Z, TR_12_0_12),
+        (ROT_mX_mY_Z, TR_12_12_12),
+        (ROT_mX_mY_mZ, TR_12_0_12),
+        (ROT_X_Y_mZ, TR_12_12_12)])
 
 sg1017 = SpaceGroup(
     number=1017,
@@ -7224,11 +7222,11 @@ sg1017 = SpaceGroup(
     point_group_name="PG222",
     crystal_system=ORTHORHOMBIC,
     pdb_name="P 21 2 2",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_Y_mZ, TR_0_0_0),
-        SymOp(ROT_X_mY_mZ, TR_12_0_0),
-        SymOp(ROT_mX_mY_Z, TR_12_0_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_Y_mZ, TR_0_0_0),
+        (ROT_X_mY_mZ, TR_12_0_0),
+        (ROT_mX_mY_Z, TR_12_0_0)])
 
 sg2017 = SpaceGroup(
     number=2017,
@@ -7238,11 +7236,11 @@ sg2017 = SpaceGroup(
     point_group_name="PG222",
     crystal_system=ORTHORHOMBIC,
     pdb_name="P 2 21 2",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_X_mY_mZ, TR_0_12_0),
-        SymOp(ROT_mX_Y_mZ, TR_0_12_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_X_mY_mZ, TR_0_12_0),
+        (ROT_mX_Y_mZ, TR_0_12_0),
+        (ROT_mX_mY_Z, TR_0_0_0)])
 
 sg1018 = SpaceGroup(
     number=1018,
@@ -7252,11 +7250,11 @@ sg1018 = SpaceGroup(
     point_group_name="PG222",
     crystal_system=ORTHORHOMBIC,
     pdb_name="P 21 21 2 (a)",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_12_12_0),
-        SymOp(ROT_X_mY_mZ, TR_12_0_0),
-        SymOp(ROT_mX_Y_mZ, TR_0_12_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_12_12_0),
+        (ROT_X_mY_mZ, TR_12_0_0),
+        (ROT_mX_Y_mZ, TR_0_12_0)])
 
 sg2018 = SpaceGroup(
     number=2018,
@@ -7266,11 +7264,11 @@ sg2018 = SpaceGroup(
     point_group_name="PG222",
     crystal_system=ORTHORHOMBIC,
     pdb_name="P 21 2 21",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_Y_mZ, TR_0_0_0),
-        SymOp(ROT_X_mY_mZ, TR_12_0_12),
-        SymOp(ROT_mX_mY_Z, TR_12_0_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_Y_mZ, TR_0_0_0),
+        (ROT_X_mY_mZ, TR_12_0_12),
+        (ROT_mX_mY_Z, TR_12_0_12)])
 
 sg3018 = SpaceGroup(
     number=3018,
@@ -7280,11 +7278,11 @@ sg3018 = SpaceGroup(
     point_group_name="PG222",
     crystal_system=ORTHORHOMBIC,
     pdb_name="P 2 21 21",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_X_mY_mZ, TR_0_0_0),
-        SymOp(ROT_mX_Y_mZ, TR_0_12_12),
-        SymOp(ROT_mX_mY_Z, TR_0_12_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_X_mY_mZ, TR_0_0_0),
+        (ROT_mX_Y_mZ, TR_0_12_12),
+        (ROT_mX_mY_Z, TR_0_12_12)])
 
 sg1020 = SpaceGroup(
     number=1020,
@@ -7294,15 +7292,15 @@ sg1020 = SpaceGroup(
     point_group_name="PG222",
     crystal_system=ORTHORHOMBIC,
     pdb_name="C 2 2 21a)",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_12_0_12),
-        SymOp(ROT_X_mY_mZ, TR_12_12_0),
-        SymOp(ROT_mX_Y_mZ, TR_0_12_12),
-        SymOp(ROT_X_Y_Z, TR_12_12_0),
-        SymOp(ROT_mX_mY_Z, TR_0_12_12),
-        SymOp(ROT_X_mY_mZ, TR_0_0_0),
-        SymOp(ROT_mX_Y_mZ, TR_12_0_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_12_0_12),
+        (ROT_X_mY_mZ, TR_12_12_0),
+        (ROT_mX_Y_mZ, TR_0_12_12),
+        (ROT_X_Y_Z, TR_12_12_0),
+        (ROT_mX_mY_Z, TR_0_12_12),
+        (ROT_X_mY_mZ, TR_0_0_0),
+        (ROT_mX_Y_mZ, TR_12_0_12)])
 
 sg1021 = SpaceGroup(
     number=1021,
@@ -7312,15 +7310,15 @@ sg1021 = SpaceGroup(
     point_group_name="PG222",
     crystal_system=ORTHORHOMBIC,
     pdb_name="C 2 2 2a",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_12_12_0),
-        SymOp(ROT_X_mY_mZ, TR_12_0_0),
-        SymOp(ROT_mX_Y_mZ, TR_0_12_0),
-        SymOp(ROT_X_Y_Z, TR_12_12_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_X_mY_mZ, TR_0_12_0),
-        SymOp(ROT_mX_Y_mZ, TR_12_0_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_12_12_0),
+        (ROT_X_mY_mZ, TR_12_0_0),
+        (ROT_mX_Y_mZ, TR_0_12_0),
+        (ROT_X_Y_Z, TR_12_12_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_X_mY_mZ, TR_0_12_0),
+        (ROT_mX_Y_mZ, TR_12_0_0)])
 
 sg1022 = SpaceGroup(
     number=1022,
@@ -7330,23 +7328,23 @@ sg1022 = SpaceGroup(
     point_group_name="PG222",
     crystal_system=ORTHORHOMBIC,
     pdb_name="F 2 2 2a",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_12_12_0),
-        SymOp(ROT_X_mY_mZ, TR_12_0_0),
-        SymOp(ROT_mX_Y_mZ, TR_0_12_0),
-        SymOp(ROT_X_Y_Z, TR_0_12_12),
-        SymOp(ROT_mX_mY_Z, TR_12_0_12),
-        SymOp(ROT_X_mY_mZ, TR_12_12_12),
-        SymOp(ROT_mX_Y_mZ, TR_0_0_12),
-        SymOp(ROT_X_Y_Z, TR_12_0_12),
-        SymOp(ROT_mX_mY_Z, TR_0_12_12),
-        SymOp(ROT_X_mY_mZ, TR_0_0_12),
-        SymOp(ROT_mX_Y_mZ, TR_12_12_12),
-        SymOp(ROT_X_Y_Z, TR_12_12_0),
-        SymOp(ROT_mX_mY_Z, TR_0_0_0),
-        SymOp(ROT_X_mY_mZ, TR_0_12_0),
-        SymOp(ROT_mX_Y_mZ, TR_12_0_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_12_12_0),
+        (ROT_X_mY_mZ, TR_12_0_0),
+        (ROT_mX_Y_mZ, TR_0_12_0),
+        (ROT_X_Y_Z, TR_0_12_12),
+        (ROT_mX_mY_Z, TR_12_0_12),
+        (ROT_X_mY_mZ, TR_12_12_12),
+        (ROT_mX_Y_mZ, TR_0_0_12),
+        (ROT_X_Y_Z, TR_12_0_12),
+        (ROT_mX_mY_Z, TR_0_12_12),
+        (ROT_X_mY_mZ, TR_0_0_12),
+        (ROT_mX_Y_mZ, TR_12_12_12),
+        (ROT_X_Y_Z, TR_12_12_0),
+        (ROT_mX_mY_Z, TR_0_0_0),
+        (ROT_X_mY_mZ, TR_0_12_0),
+        (ROT_mX_Y_mZ, TR_12_0_0)])
 
 sg1023 = SpaceGroup(
     number=1023,
@@ -7356,15 +7354,15 @@ sg1023 = SpaceGroup(
     point_group_name="PG222",
     crystal_system=ORTHORHOMBIC,
     pdb_name="I 2 2 2a",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_12_12_0),
-        SymOp(ROT_X_mY_mZ, TR_12_0_0),
-        SymOp(ROT_mX_Y_mZ, TR_0_12_0),
-        SymOp(ROT_X_Y_Z, TR_12_12_12),
-        SymOp(ROT_mX_mY_Z, TR_0_0_12),
-        SymOp(ROT_mX_Y_mZ, TR_12_0_12),
-        SymOp(ROT_X_mY_mZ, TR_0_12_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_12_12_0),
+        (ROT_X_mY_mZ, TR_12_0_0),
+        (ROT_mX_Y_mZ, TR_0_12_0),
+        (ROT_X_Y_Z, TR_12_12_12),
+        (ROT_mX_mY_Z, TR_0_0_12),
+        (ROT_mX_Y_mZ, TR_12_0_12),
+        (ROT_X_mY_mZ, TR_0_12_12)])
 
 sg1059 = SpaceGroup(
     number=1059,
@@ -7374,15 +7372,15 @@ sg1059 = SpaceGroup(
     point_group_name="PGmmm",
     crystal_system=ORTHORHOMBIC,
     pdb_name="P 21/m 21/m 2/n",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_12_12_0),
-        SymOp(ROT_mX_Y_mZ, TR_0_12_0),
-        SymOp(ROT_X_mY_mZ, TR_12_0_0),
-        SymOp(ROT_mX_mY_mZ, TR_0_0_0),
-        SymOp(ROT_X_Y_mZ, TR_12_12_0),
-        SymOp(ROT_X_mY_Z, TR_0_12_0),
-        SymOp(ROT_mX_Y_Z, TR_12_0_0)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_12_12_0),
+        (ROT_mX_Y_mZ, TR_0_12_0),
+        (ROT_X_mY_mZ, TR_12_0_0),
+        (ROT_mX_mY_mZ, TR_0_0_0),
+        (ROT_X_Y_mZ, TR_12_12_0),
+        (ROT_X_mY_Z, TR_0_12_0),
+        (ROT_mX_Y_Z, TR_12_0_0)])
 
 sg1094 = SpaceGroup(
     number=1094,
@@ -7392,15 +7390,15 @@ sg1094 = SpaceGroup(
     point_group_name="PG422",
     crystal_system=TETRAGONAL,
     pdb_name="P 42 21 2a",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_12_12_0),
-        SymOp(ROT_mY_X_Z, TR_0_12_12),
-        SymOp(ROT_Y_mX_Z, TR_12_0_12),
-        SymOp(ROT_mX_Y_mZ, TR_0_12_0),
-        SymOp(ROT_X_mY_mZ, TR_12_0_0),
-        SymOp(ROT_Y_X_mZ, TR_0_0_12),
-        SymOp(ROT_mY_mX_mZ, TR_12_12_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_12_12_0),
+        (ROT_mY_X_Z, TR_0_12_12),
+        (ROT_Y_mX_Z, TR_12_0_12),
+        (ROT_mX_Y_mZ, TR_0_12_0),
+        (ROT_X_mY_mZ, TR_12_0_0),
+        (ROT_Y_X_mZ, TR_0_0_12),
+        (ROT_mY_mX_mZ, TR_12_12_12)])
 
 sg1197 = SpaceGroup(
     number=1197,
@@ -7410,31 +7408,31 @@ sg1197 = SpaceGroup(
     point_group_name="PG23",
     crystal_system=CUBIC,
     pdb_name="I 2 3a",
-    symop_list=[
-        SymOp(ROT_X_Y_Z, TR_0_0_0),
-        SymOp(ROT_mX_mY_Z, TR_12_12_0),
-        SymOp(ROT_X_mY_mZ, TR_12_0_0),
-        SymOp(ROT_mX_Y_mZ, TR_0_12_0),
-        SymOp(ROT_Y_Z_X, TR_0_0_0),
-        SymOp(ROT_mY_mZ_X, TR_12_12_0),
-        SymOp(ROT_Y_mZ_mX, TR_12_0_0),
-        SymOp(ROT_mY_Z_mX, TR_0_12_0),
-        SymOp(ROT_Z_X_Y, TR_0_0_0),
-        SymOp(ROT_mZ_mX_Y, TR_12_12_0),
-        SymOp(ROT_Z_mX_mY, TR_12_0_0),
-        SymOp(ROT_mZ_X_mY, TR_0_12_0),
-        SymOp(ROT_X_Y_Z, TR_12_12_12),
-        SymOp(ROT_mX_mY_Z, TR_0_0_12),
-        SymOp(ROT_X_mY_mZ, TR_0_12_12),
-        SymOp(ROT_mX_Y_mZ, TR_12_0_12),
-        SymOp(ROT_Y_Z_X, TR_12_12_12),
-        SymOp(ROT_mY_mZ_X, TR_0_0_12),
-        SymOp(ROT_Y_mZ_mX, TR_0_12_12),
-        SymOp(ROT_mY_Z_mX, TR_12_0_12),
-        SymOp(ROT_Z_X_Y, TR_12_12_12),
-        SymOp(ROT_mZ_mX_Y, TR_0_0_12),
-        SymOp(ROT_Z_mX_mY, TR_0_12_12),
-        SymOp(ROT_mZ_X_mY, TR_12_0_12)])
+    symop_specs=[
+        (ROT_X_Y_Z, TR_0_0_0),
+        (ROT_mX_mY_Z, TR_12_12_0),
+        (ROT_X_mY_mZ, TR_12_0_0),
+        (ROT_mX_Y_mZ, TR_0_12_0),
+        (ROT_Y_Z_X, TR_0_0_0),
+        (ROT_mY_mZ_X, TR_12_12_0),
+        (ROT_Y_mZ_mX, TR_12_0_0),
+        (ROT_mY_Z_mX, TR_0_12_0),
+        (ROT_Z_X_Y, TR_0_0_0),
+        (ROT_mZ_mX_Y, TR_12_12_0),
+        (ROT_Z_mX_mY, TR_12_0_0),
+        (ROT_mZ_X_mY, TR_0_12_0),
+        (ROT_X_Y_Z, TR_12_12_12),
+        (ROT_mX_mY_Z, TR_0_0_12),
+        (ROT_X_mY_mZ, TR_0_12_12),
+        (ROT_mX_Y_mZ, TR_12_0_12),
+        (ROT_Y_Z_X, TR_12_12_12),
+        (ROT_mY_mZ_X, TR_0_0_12),
+        (ROT_Y_mZ_mX, TR_0_12_12),
+        (ROT_mY_Z_mX, TR_12_0_12),
+        (ROT_Z_X_Y, TR_12_12_12),
+        (ROT_mZ_mX_Y, TR_0_0_12),
+        (ROT_Z_mX_mY, TR_0_12_12),
+        (ROT_mZ_X_mY, TR_12_0_12)])
 
 ## list of the space groups
 spacegrouplist = [
@@ -7467,16 +7465,93 @@ spacegrouplist = [
   , sg2017, sg1018, sg2018, sg3018, sg1020, sg1021, sg1022, sg1023
   , sg1059, sg1094, sg1197]
 
+def normalize_name(name):
+    """
+    Returns the space group *name* without spaces and in lower case, so that
+    ``"P 43 3 2"``, ``"p4332"`` and ``"P4332"`` refer to the same group.
+    Integers are returned unchanged.
+
+    """
+    if isinstance(name, basestring):
+        name = ''.join(name.split()).lower()
+        if name.isdigit():
+            name = int(name)
+    return name
+
+_index = {}
+_symop_index = {}
+
+def _get_symop_key(rotations, translations):
+    """
+    Returns a key identifying a set of symmetry operations, independent of
+    their order. The translations are wrapped in [0, 1) and compared in
+    multiples of 1/24.
+    
+    """
+    rotations = np.rint(rotations).astype(int).reshape(-1, 9)
+    translations = np.rint(np.mod(translations, 1.0) * 24).astype(int) % 24
+    translations = translations.reshape(-1, 3)
+
+    return frozenset(tuple(row) for row in
+                     np.concatenate((rotations, translations), axis=1))
+
+def _build_index():
+    """
+    Fills the lookup table of :func:`getspacegroup`.
+    The exact names are stored before the normalized ones and the first
+    space group of :data:`spacegrouplist` wins for a duplicate key, so that
+    the result is the same as a scan of the list.
+
+    """
+    index = {}
+
+    for sg in spacegrouplist:
+        for key in (sg.short_name, sg.pdb_name, sg.number):
+            index.setdefault(key, sg)
+
+    for sg in spacegrouplist:
+        for key in (sg.short_name, sg.pdb_name):
+            index.setdefault(normalize_name(key), sg)
+
+    _index.update(index)
+
 def getspacegroup(name):
     """
     Returns the :class:`SpaceGroup` instance for the given name.
+    The name is either the short name, the PDB name or the number of the
+    space group. Spaces and case are ignored when the exact name is not
+    found.
     If the space group is not found, return ``None``.
 
     .. seealso:: :meth:`spacegroup.SpaceGroup.check_group_name`
 
     """
-    for sg in spacegrouplist:
-        if sg.check_group_name(name):
-            return sg
+    if not _index:
+        _build_index()
+
+    try:
+        sg = _index.get(name)
+    except TypeError: # unhashable
+        return None
+
+    if sg is None:
+        sg = _index.get(normalize_name(name))
+
+    return sg
+
+def findspacegroup(rotations, translations):
+    """
+    Returns the :class:`SpaceGroup` instance with the given symmetry
+    operations, in any order, or ``None`` if no space group has exactly
+    these operations (e.g. another setting).
+    
+    :arg rotations: rotation matrices of shape (S, 3, 3)
+    :arg translations: translation vectors of shape (S, 3)
+    
+    """
+    if not _symop_index:
+        for sg in spacegrouplist:
+            key = _get_symop_key(*sg.get_symop_arrays())
+            _symop_index.setdefault(key, sg)
 
-    return None
+    return _symop_index.get(_get_symop_key(rotations, translations))
@@ -22,54 +22,251 @@ __svnDate__ = ""
 __svnId__ = ""
 
 # Standard library modules.
-from math import sqrt
+from math import pi
 
 # Third party modules.
+import numpy as np
 
 # Local modules.
 import mathtools.rotation.quaternions as quaternions
+import mathtools.rotation.quaternionarrays as quaternionarrays
 
 # Globals and constants variables.
+X = (1.0, 0.0, 0.0)
+Y = (0.0, 1.0, 0.0)
+Z = (0.0, 0.0, 1.0)
+XYZ = (1.0, 1.0, 1.0)
+
+## Laue groups, with the last space group number of each group and the
+## generators (angle, axis) of its rotations
+LAUE_GROUPS = (('-1', 2, []),
+               ('2/m', 15, [(pi, Y)]),
+               ('mmm', 74, [(pi, Z), (pi, X)]),
+               ('4/m', 88, [(pi / 2.0, Z)]),
+               ('4/mmm', 142, [(pi / 2.0, Z), (pi, X)]),
+               ('-3', 148, [(2.0 * pi / 3.0, Z)]),
+               ('-3m', 167, [(2.0 * pi / 3.0, Z), (pi, X)]),
+               ('6/m', 176, [(pi / 3.0, Z)]),
+               ('6/mmm', 194, [(pi / 3.0, Z), (pi, X)]),
+               ('m-3', 206, [(pi, Z), (pi, X), (2.0 * pi / 3.0, XYZ)]),
+               ('m-3m', 230, [(pi / 2.0, Z), (2.0 * pi / 3.0, XYZ)]))
+
+CHUNK_SIZE = 65536 # Number of pairs of orientations evaluated at once
+
+def _generate(generators):
+    """
+    Return the rotations of the group generated by the *generators* as an
+    array of quaternions of shape (S, 4).
+    The identity is the first rotation.
+
+    :arg generators: list of (angle, axis)
+    """
+    if not generators:
+        return np.array([[1.0, 0.0, 0.0, 0.0]])
+
+    angles, axes = zip(*generators)
+    generators = quaternionarrays.axisangles_to_quaternionarray(angles, axes)
+
+    group = quaternionarrays.QuaternionArray([1.0, 0.0, 0.0, 0.0])
+    size = 0
+    while len(group) != size:
+        size = len(group)
+
+        for generator in generators.array:
+            products = (group * generator).array
+            for q in products:
+                if np.all(np.abs(np.dot(group.array, q)) < 1.0 - 1e-6):
+                    group = quaternionarrays.QuaternionArray(np.vstack([group.array, q]))
+
+    return group.array
+
+def _createTables():
+    tables = {}
+
+    for name, _number, generators in LAUE_GROUPS:
+        table = _generate(generators)
+        table.setflags(write=False)
+        tables[name] = table
+
+    return tables
+
+_SYMMETRIES = _createTables()
+
+def getLaueGroup(spacegroupNo):
+    """
+    Return the name of the Laue group of a space group (e.g. the space group
+    no. of a phase in a ctf).
+
+    :arg spacegroupNo: number of the space group
+    :type spacegroupNo: int between [1, 230]
+
+    :rtype: str
+    """
+    if not 1 <= spacegroupNo <= 230:
+        raise ValueError, "Invalid space group number: %s" % spacegroupNo
+
+    for name, number, _generators in LAUE_GROUPS:
+        if spacegroupNo <= number:
+            return name
+
+def getSymmetries(laueGroup):
+    """
+    Return the rotations of a Laue group.
+    The operators are precomputed for the 11 Laue groups (see
+    :const:`LAUE_GROUPS`).
+    The 2-fold axis of the monoclinic groups is along y; the 2-fold axes
+    of the trigonal, tetragonal and hexagonal groups start along x.
+
+    :arg laueGroup: name of the Laue group (see :func:`getLaueGroup`)
+    :type laueGroup: str
+
+    :rtype: :class:`quaternionarrays.QuaternionArray`
+    """
+    return quaternionarrays.QuaternionArray(_SYMMETRIES[laueGroup])
 
 def cubicSymmetries():
-    sr2 = sqrt(2) / 2.0
-    qSymmetries = []
-
-    qSymmetries.append(quaternions.quaternion(1, 0, 0, 0))
-
-    #Three-fold
-    qSymmetries.append(quaternions.quaternion(0.5, 0.5, 0.5, 0.5))
-    qSymmetries.append(quaternions.quaternion(0.5, -0.5, -0.5, 0.5))
-    qSymmetries.append(quaternions.quaternion(0.5, 0.5, -0.5, -0.5))
-    qSymmetries.append(quaternions.quaternion(0.5, -0.5, 0.5, -0.5))
-
-    qSymmetries.append(quaternions.quaternion(0.5, -0.5, -0.5, -0.5))
-    qSymmetries.append(quaternions.quaternion(0.5, -0.5, 0.5, 0.5))
-    qSymmetries.append(quaternions.quaternion(0.5, 0.5, -0.5, 0.5))
-    qSymmetries.append(quaternions.quaternion(0.5, 0.5, 0.5, -0.5))
-
-    #Two-fold
-    qSymmetries.append(quaternions.quaternion(0.0, 0.0, 1.0, 0.0))
-    qSymmetries.append(quaternions.quaternion(0.0, 0.0, 0.0, 1.0))
-    qSymmetries.append(quaternions.quaternion(0.0, 1.0, 0.0, 0.0))
-
-    #Four-fold
-    qSymmetries.append(quaternions.quaternion(0.0, -sr2, 0.0, sr2))
-    qSymmetries.append(quaternions.quaternion(0.0, sr2, 0.0, sr2))
-    qSymmetries.append(quaternions.quaternion(sr2, 0.0, sr2, 0.0))
-    qSymmetries.append(quaternions.quaternion(sr2, 0.0, -sr2, 0.0))
-
-    qSymmetries.append(quaternions.quaternion(0.0, 0.0, -sr2, sr2))
-    qSymmetries.append(quaternions.quaternion(sr2, sr2, 0.0, 0.0))
-    qSymmetries.append(quaternions.quaternion(sr2, -sr2, 0.0, 0.0))
-    qSymmetries.append(quaternions.quaternion(0.0, 0.0, sr2, sr2))
-
-    qSymmetries.append(quaternions.quaternion(0.0, -sr2, sr2, 0.0))
-    qSymmetries.append(quaternions.quaternion(sr2, 0.0, 0.0, -sr2))
-    qSymmetries.append(quaternions.quaternion(0.0, sr2, sr2, 0.0))
-    qSymmetries.append(quaternions.quaternion(sr2, 0.0, 0.0, sr2))
-
-    return qSymmetries
+    """
+    Return the 24 rotations of the cubic Laue group.
+
+    :rtype: :class:`list` of :class:`quaternions.Quaternion`
+    """
+    return getSymmetries('m-3m').to_quaternions()
+
+def _getChunk(q, start, stop):
+    if len(q) == 1:
+        return q
+    return q[start:stop]
+
+def _disorientation(q1, q2, laueGroup, axes=None, indexes=None):
+    """
+    Compute the disorientation angles and, if an array *axes* is given,
+    the disorientation axes.
+    If an array *indexes* is given, it is filled with the index of the
+    rotation of the Laue group giving the disorientation.
+
+    .. seealso:: :func:`disorientation`
+    """
+    # Copies, as the quaternions are made positive in place
+    q1 = quaternionarrays.QuaternionArray(q1).array
+    q2 = quaternionarrays.QuaternionArray(q2).array
+    table = _SYMMETRIES[laueGroup]
+    conjugates = (table * [1.0, -1.0, -1.0, -1.0]).T.copy()
+
+    size = max(len(q1), len(q2))
+    angles = np.empty(size)
+
+    for start in range(0, size, CHUNK_SIZE):
+        stop = min(start + CHUNK_SIZE, size)
+        chunk1 = _getChunk(q1, start, stop)
+        inverse2 = _getChunk(q2, start, stop) * [1.0, -1.0, -1.0, -1.0]
+
+        # Scalar part of q1 s_i q2^-1 for every operator
+        differences = quaternionarrays.multiply(inverse2, chunk1)
+        dotproducts = np.dot(differences, conjugates)
+        np.abs(dotproducts, dotproducts)
+
+        if axes is None and indexes is None:
+            cosines = dotproducts.max(axis=1)
+        else:
+            chunkIndexes = np.argmax(dotproducts, axis=1)
+            cosines = dotproducts[np.arange(stop - start), chunkIndexes]
+
+            if indexes is not None:
+                indexes[start:stop] = chunkIndexes
+
+        np.minimum(cosines, 1.0, cosines)
+        angles[start:stop] = np.arccos(cosines)
+
+        if axes is not None:
+            qs = quaternionarrays.multiply(quaternionarrays.multiply(chunk1, table[chunkIndexes]),
+                                           inverse2)
+            sines = np.sqrt(1.0 - cosines ** 2)
+            sines[sines < quaternionarrays.ZERO] = np.inf # No rotation
+            sines *= np.where(qs[:, 0] < 0.0, -1.0, 1.0)
+            axes[start:stop] = qs[:, 1:] / sines[:, np.newaxis]
+
+    angles *= 2.0
+
+    return angles
+
+def disorientation(q1, q2, laueGroup):
+    """
+    Return the disorientations between pairs of orientations of the same
+    Laue group: the smallest rotation :math:`q_1 s_i q_2^{-1}` over all the
+    rotations :math:`s_i` of the Laue group.
+
+    The angles are found from the scalar part of
+    :math:`q_1 s_i q_2^{-1}`, which is also the dot product of
+    :math:`q_2^{-1} q_1` and :math:`s_i^{-1}`, i.e. one matrix product for
+    all the operators.
+    The pairs are evaluated by blocks of :const:`CHUNK_SIZE`, so that the
+    temporary arrays stay small.
+
+    **Examples:**::
+
+      qs = ctf.getQuaternions()
+      laueGroup = getLaueGroup(ctf.getPhaseSpaceGroupNo(1))
+      angles, axes = disorientation(qs[:-1], qs[1:], laueGroup)
+
+    :arg q1, q2: normalized quaternions of the orientations, of same length
+        or of length 1
+    :type q1, q2: :class:`quaternionarrays.QuaternionArray`
+
+    :arg laueGroup: name of the Laue group (see :func:`getLaueGroup`)
+    :type laueGroup: str
+
+    :return: angles (in rad) of shape (N,) and axes of shape (N, 3) of the
+        disorientations (in the sample reference frame)
+    """
+    size = max(len(q1), len(q2))
+    axes = np.empty((size, 3))
+
+    angles = _disorientation(q1, q2, laueGroup, axes)
+
+    return angles, axes
+
+def disorientationAngle(q1, q2, laueGroup):
+    """
+    Return only the disorientation angles (in rad) between pairs of
+    orientations, which is about twice faster than :func:`disorientation`.
+
+    .. seealso:: :func:`disorientation`
+
+    :rtype: :class:`numpy.ndarray` of shape (N,)
+    """
+    return _disorientation(q1, q2, laueGroup)
+
+def getNearestEquivalents(qs, references, laueGroup):
+    """
+    Return the symmetrically equivalent orientations :math:`q s_i` closest
+    to the *references*.
+    The sign of the returned quaternions is chosen so that their dot product
+    with the references is positive, which allows averaging them.
+
+    :arg qs: normalized quaternions of the orientations
+    :type qs: :class:`quaternionarrays.QuaternionArray`
+
+    :arg references: normalized quaternions of the reference orientations, of
+        same length as *qs* or of length 1
+    :type references: :class:`quaternionarrays.QuaternionArray`
+
+    :arg laueGroup: name of the Laue group (see :func:`getLaueGroup`)
+    :type laueGroup: str
+
+    :rtype: :class:`numpy.ndarray` of shape (N, 4)
+    """
+    # Copies, as the quaternions are made positive in place
+    qs = quaternionarrays.QuaternionArray(qs).array
+    references = quaternionarrays.QuaternionArray(references).array
+
+    indexes = np.empty(len(qs), dtype=int)
+    _disorientation(qs, references, laueGroup, indexes=indexes)
+
+    equivalents = quaternionarrays.multiply(qs, _SYMMETRIES[laueGroup][indexes])
+    signs = np.where(np.sum(equivalents * references, axis=1) < 0.0, -1.0, 1.0)
+    equivalents *= signs[:, np.newaxis]
+
+    return equivalents
 
 if __name__ == '__main__': #pragma: no cover
     import DrixUtilities.Runner as Runner
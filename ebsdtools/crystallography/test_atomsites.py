@@ -21,10 +21,12 @@ import unittest
 import logging
 
 # Third party modules.
+import numpy as np
 
 # Local modules.
 import ebsdtools.crystallography.atomsites as atomsites
 import ebsdtools.crystallography.atomsite as atomsite
+import ebsdtools.crystallography.spacegroups as spacegroups
 
 # Globals and constants variables.
 
@@ -61,6 +63,52 @@ class TestAtomSites(unittest.TestCase):
         self.assertEqual(len(self.atoms), 0)
         self.assertNotIn(self.atom1, self.atoms)
 
+    def testextend(self):
+        self.atoms.extend([self.atom1, self.atom2, self.atom3, self.atom4])
+        self.assertEqual(3, len(self.atoms))
+        self.assertIn(self.atom3, self.atoms)
+
+    def testprecision(self):
+        self.atoms.add(self.atom1)
+        self.atoms.add(atomsite.AtomSite(13, 0.99999, 0.00002, 0.0))
+        self.atoms.add(atomsite.AtomSite(14, 0.0, 0.0, 0.0))
+        self.assertEqual(2, len(self.atoms))
+
+        atoms = atomsites.AtomSites([self.atom1], precision=2.5e-6)
+        self.assertIn(self.atom1, atoms)
+        self.assertNotIn(atomsite.AtomSite(13, 0.0, 0.0, 1e-5), atoms)
+
+        self.assertRaises(ValueError, atomsites.AtomSites, precision=1e-6)
+        self.assertRaises(ValueError, atomsites.AtomSites, precision=0.0)
+        self.assertRaises(ValueError, atomsites.AtomSites.from_arrays, [119], [[0, 0, 0]])
+
+    def testarrays(self):
+        self.atoms.extend([self.atom1, self.atom2, self.atom3])
+
+        self.assertEqual((3,), self.atoms.atomicnumbers.shape)
+        self.assertEqual((3, 3), self.atoms.positions.shape)
+        self.assertTrue(np.allclose([0.5, 0.0, 0.5], self.atoms.positions[2]))
+
+    def testfrom_arrays(self):
+        atoms = atomsites.AtomSites.from_arrays([13, 13, 13],
+                                                [[0, 0, 0], [1, 1, 1], [-0.5, 0, 0]])
+        self.assertEqual(2, len(atoms))
+        self.assertIn(atomsite.AtomSite(13, 0.5, 0, 0), atoms)
+
+    def testexpand(self):
+        atoms = atomsites.create_single_atomsites(13).expand(spacegroups.sg225)
+        self.assertEqual(4, len(atoms))
+        for atom in atomsites.create_fcc_atomsites(13):
+            self.assertIn(atom, atoms)
+
+        atoms = atomsites.AtomSites([atomsite.AtomSite(13, 0.11, 0.23, 0.37)])
+        self.assertEqual(192, len(atoms.expand(spacegroups.sg225)))
+
+        atoms = atomsites.AtomSites([atomsite.AtomSite(13, 1 / 3.0, 2 / 3.0, 0.25)])
+        atoms = atoms.expand(spacegroups.sg194)
+        self.assertEqual(2, len(atoms))
+        self.assertIn(atomsite.AtomSite(13, 2 / 3.0, 1 / 3.0, 0.75), atoms)
+
 if __name__ == '__main__': #pragma: no cover
     logging.getLogger().setLevel(logging.DEBUG)
     unittest.main()
@@ -24,6 +24,7 @@ import copy
 import os.path
 
 # Third party modules.
+import numpy as np
 
 # Local modules.
 import DrixUtilities.Files as Files
@@ -150,6 +151,21 @@ class TestCalculations(unittest.TestCase):
         hkl = plane.Plane(3, 1, 2)
         self.assertAlmostEqual(calculations.planespacing(hkl, self.L2), 1.964, 3)
 
+    def testplanespacings(self):
+        # Example 2.3
+        spacings = calculations.planespacings([plane.Plane(3, 1, 2)], self.L2)
+        self.assertAlmostEqual(spacings[0], 1.964, 3)
+
+        spacings = calculations.planespacings(self.planes, self.cubic)
+        self.assertEqual(spacings.shape, (len(self.planes),))
+        for plane_, spacing in zip(self.planes, spacings):
+            h, k, l = plane_
+            self.assertAlmostEqual(spacing, 2.0 / sqrt(h ** 2 + k ** 2 + l ** 2))
+
+        # Array of indices
+        indices = np.array([tuple(plane_) for plane_ in self.planes], dtype=int)
+        self.assertTrue(np.allclose(calculations.planespacings(indices, self.cubic), spacings))
+
     def testplanespacing_cubic(self):
         equation = lambda lat, h, k, l: (h ** 2 + k ** 2 + l ** 2) / lat.a ** 2
 
@@ -479,6 +495,24 @@ class TestCalculations(unittest.TestCase):
         self.assertAlmostEqual(formfactor.real, expected_formfactor.real)
         self.assertAlmostEqual(formfactor.imag, expected_formfactor.imag)
 
+    def testformfactors(self):
+        planes = [plane.Plane(1, 1, 1), plane.Plane(1, 0, 1)]
+
+        # FCC
+        formfactors = calculations.formfactors(planes, self.cubic,
+                                               self.atomsfcc, self.scatter)
+        self.assertEqual(formfactors.shape, (2,))
+        self.assertAlmostEqual(abs(formfactors[0]), 27.527840181773566)
+        self.assertAlmostEqual(abs(formfactors[1]), 0)
+
+        # HCP
+        formfactors = calculations.formfactors([[1, 1, 1], [1, 0, 1]],
+                                               self.hexagonal, self.atomshcp,
+                                               self.scatter)
+        self.assertAlmostEqual(abs(formfactors[0]), 0)
+        self.assertAlmostEqual(formfactors[1].real, 11.800945464186695)
+        self.assertAlmostEqual(formfactors[1].imag, -6.8132790404402881)
+
     def testmaximum_formfactor(self):
         #FCC
         maximum = \
@@ -535,6 +569,21 @@ class TestCalculations(unittest.TestCase):
         expected_intensity = 176.02025411386322
         self.assertAlmostEqual(intensity, expected_intensity)
 
+    def testdiffraction_intensities(self):
+        planes = [plane.Plane(1, 1, 1), plane.Plane(1, 0, 1)]
+
+        intensities = calculations.diffraction_intensities(planes, self.cubic,
+                                                           self.atomsfcc,
+                                                           self.scatter)
+        self.assertAlmostEqual(intensities[0], 757.78198507326738)
+        self.assertAlmostEqual(intensities[1], 0)
+
+        intensities = calculations.diffraction_intensities(planes, self.cubic,
+                                                           self.atomsbcc,
+                                                           self.scatter)
+        self.assertAlmostEqual(intensities[0], 0)
+        self.assertAlmostEqual(intensities[1], 234.69367215181771)
+
     def testdiffraction_maxintensity(self):
         #FCC
         maximum = \
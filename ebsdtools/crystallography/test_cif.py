@@ -20,6 +20,8 @@ __license__ = "GPL v3"
 import unittest
 import logging
 import os.path
+import shutil
+import tempfile
 from math import pi
 import warnings
 warnings.filterwarnings(action='ignore', category=RuntimeWarning)
@@ -231,11 +233,160 @@ class TestReader(unittest.TestCase):
         self.assertEqual(len(atomsites), 2)
 
         atomsites = self.cifZr.get_atomsites()
-        self.assertEqual(len(atomsites), 8)
+        self.assertEqual(len(atomsites), 4)
         #
         atomsites = self.cifRuDimer.get_atomsites()
         self.assertEqual(len(atomsites), 172)
 
+    def testget_symop_arrays(self):
+        rotations, translations = self.cifZr.get_symop_arrays()
+        self.assertEqual(rotations.shape, (24, 3, 3))
+        self.assertEqual(translations.shape, (24, 3))
+
+        # -x+y,y,1/2-z
+        self.assertEqual(rotations[10].tolist(), [[-1, 1, 0], [0, 1, 0], [0, 0, -1]])
+        self.assertEqual(translations[10].tolist(), [0.0, 0.0, 0.5])
+
+CIF_MULTIBLOCK = """\
+# Two structures
+data_first
+_chemical_name 'Phase one' # comment
+_publ_section_title
+;
+ Line one
+
+ Line two
+;
+_cell_length_a 3.0(1)
+_cell_length_b 3.0
+_cell_length_c 3.0
+_cell_angle_alpha 90
+_cell_angle_beta 90
+_cell_angle_gamma 90
+loop_
+_symmetry_equiv_pos_as_xyz
+'x, y, z'
+'1/2+x, 1/2+y, 1/2+z'
+loop_
+_atom_site_label
+_atom_site_fract_x
+_atom_site_fract_y
+_atom_site_fract_z
+Fe1 0 0 0
+data_second
+_chemical_name "It's second"
+_cell_length_a 4.0
+_cell_length_b 4.0
+_cell_length_c 4.0
+_cell_angle_alpha 90
+_cell_angle_beta 90
+_cell_angle_gamma 90
+loop_
+_space_group_symop_operation_xyz
+x,y,z
+-x,-y,-z
+loop_
+_atom_site_label
+_atom_site_fract_x
+_atom_site_fract_y
+_atom_site_fract_z
+Al1 0.1 0.2 0.3
+Al2 0.5 0.5 0.5
+"""
+
+class TestMultiBlock(unittest.TestCase):
+    def setUp(self):
+        unittest.TestCase.setUp(self)
+
+        self.tmpdir = tempfile.mkdtemp()
+        self.filepath = os.path.join(self.tmpdir, 'multiblock.cif')
+        with open(self.filepath, 'w') as f:
+            f.write(CIF_MULTIBLOCK)
+
+    def tearDown(self):
+        unittest.TestCase.tearDown(self)
+        shutil.rmtree(self.tmpdir)
+
+    def testparse(self):
+        blocks = cif.parse(CIF_MULTIBLOCK)
+        self.assertEqual([name for name, _dataitems in blocks], ['first', 'second'])
+
+        dataitems = blocks[0][1]
+        self.assertEqual(dataitems[cif.CHEMICAL_NAME], 'Phase one')
+        self.assertEqual(dataitems[cif.PUBL_SECTION_TITLE], 'Line one\nLine two\n')
+        self.assertEqual(dataitems[cif.CELL_LENGTH_A], (3.0, 0.1))
+        self.assertEqual(dataitems[cif.SYMMETRY_EQUIV_POS_AS_XYZ],
+                         [('x', 'y', 'z'), ('1/2+x', '1/2+y', '1/2+z')])
+        self.assertEqual(dataitems[cif.ATOM_SITE_LABEL], ['Fe1'])
+
+        dataitems = blocks[1][1]
+        self.assertEqual(dataitems[cif.CHEMICAL_NAME], "It's second")
+        self.assertEqual(dataitems[cif.ATOM_SITE_FRACT_Z], [(0.3, 0.0), (0.5, 0.0)])
+
+    def testReader(self):
+        reader = cif.Reader(self.filepath, 'second')
+        self.assertEqual(reader.name, 'second')
+        self.assertAlmostEqual(reader.get_unitcell().a, 4.0)
+        self.assertEqual(len(reader.get_atomsites()), 3)
+
+        self.assertRaises(ValueError, cif.Reader, self.filepath, 'third')
+
+        reader = cif.Reader(self.filepath)
+        self.assertEqual(reader.get(cif.CHEMICAL_NAME), 'Phase one')
+        self.assertEqual(len(reader.get(cif.ATOM_SITE_LABEL)), 3)
+
+    def testread_blocks(self):
+        readers = cif.read_blocks(self.filepath)
+        self.assertEqual(len(readers), 2)
+        self.assertEqual(readers[0].name, 'first')
+        self.assertEqual(len(readers[0].get_atomsites()), 2)
+        self.assertEqual(len(readers[1].get_atomsites()), 3)
+
+    def testread_structures(self):
+        structures = cif.read_structures(self.filepath)
+        self.assertEqual(len(structures), 2)
+
+        name, unitcell, atoms = structures[1]
+        self.assertEqual(name, 'second')
+        self.assertAlmostEqual(unitcell.c, 4.0)
+        self.assertEqual(len(atoms), 3)
+
+    def testStructureCache(self):
+        cachedir = os.path.join(self.tmpdir, 'cache')
+        cache = cif.StructureCache(cachedir)
+
+        structures = cif.read_structures(self.filepath, cache)
+        self.assertEqual(len(os.listdir(cachedir)), 1)
+        atoms = cif.read_structures(self.filepath, cache)[0][2]
+        self.assertEqual(atoms.positions.tolist(), structures[0][2].positions.tolist())
+
+        # The cached atom sites are not modified by the caller
+        atoms.discard(list(atoms)[0])
+        self.assertEqual(len(cif.read_structures(self.filepath, cache)[0][2]),
+                         len(structures[0][2]))
+
+        # New session
+        cache = cif.StructureCache(cachedir)
+        with open(self.filepath) as f:
+            key = cache.get_key(f.read())
+        cached = cache.load(key)
+        self.assertEqual(len(cached), 2)
+
+        name, unitcell, atoms = cached[0]
+        self.assertEqual(name, 'first')
+        self.assertAlmostEqual(unitcell.a, 3.0)
+        self.assertEqual(atoms.positions.tolist(), structures[0][2].positions.tolist())
+
+        # Modified file
+        with open(self.filepath, 'a') as f:
+            f.write('_journal_year 2010\n')
+        cif.read_structures(self.filepath, cache)
+        self.assertEqual(len(os.listdir(cachedir)), 2)
+
+        cache.clear()
+        self.assertEqual(len(os.listdir(cachedir)), 0)
+        self.assertEqual(cache.load(key), None)
+
 if __name__ == '__main__': #pragma: no cover
     logging.getLogger().setLevel(logging.INFO)
     unittest.main()
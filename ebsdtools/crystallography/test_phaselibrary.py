@@ -0,0 +1,166 @@
+#!/usr/bin/env python
+"""
+================================================================================
+:mod:`test_phaselibrary` -- Unit tests for the module :mod:`phaselibrary`.
+================================================================================
+
+.. module:: test_phaselibrary
+   :synopsis: Unit tests for the module :mod:`phaselibrary`.
+
+"""
+
+# Script information for the file.
+__author__ = "Philippe T. Pinard"
+__email__ = "philippe.pinard@gmail.com"
+__version__ = "0.1"
+__copyright__ = "Copyright (c) 2009 Philippe T. Pinard"
+__license__ = "GPL v3"
+
+# Standard library modules.
+import unittest
+import logging
+import os.path
+import shutil
+import tempfile
+import warnings
+warnings.filterwarnings(action='ignore', category=RuntimeWarning)
+
+# Third party modules.
+import numpy as np
+
+# Local modules.
+import DrixUtilities.Files as Files
+
+import ebsdtools.crystallography.phaselibrary as phaselibrary
+import ebsdtools.crystallography.scatteringfactors as scatteringfactors
+import ebsdtools.crystallography.reflectors as reflectors
+import ebsdtools.crystallography.spacegroups as spacegroups
+
+# Globals and constants variables.
+
+warnings.filterwarnings('ignore'
+                        , category=scatteringfactors.ScatteringFactorWarning)
+
+class TestPhaseLibrary(unittest.TestCase):
+
+    def setUp(self):
+        unittest.TestCase.setUp(self)
+
+        self.tmpdir = tempfile.mkdtemp()
+        self.cifdir = os.path.join(self.tmpdir, 'cifs')
+        os.makedirs(os.path.join(self.cifdir, 'hcp'))
+
+        testdata = Files.getCurrentModulePath(__file__, os.path.join('..', 'testdata'))
+        shutil.copy(os.path.join(testdata, 'aluminum.cif'), self.cifdir)
+        shutil.copy(os.path.join(testdata, 'iron.cif'), self.cifdir)
+        shutil.copy(os.path.join(testdata, 'zirconium.cif'),
+                    os.path.join(self.cifdir, 'hcp'))
+
+        with open(os.path.join(self.cifdir, 'bad.cif'), 'w') as f:
+            f.write('data_bad\n_cell_length_a abc\n')
+        with open(os.path.join(self.cifdir, 'empty.cif'), 'w') as f:
+            f.write('data_empty\n_chemical_name empty\n')
+
+        relativepath = os.path.join('..', 'testdata', 'goodconfiguration.cfg')
+        configurationfilepath = Files.getCurrentModulePath(__file__, relativepath)
+        self.scatter = scatteringfactors.ElasticAtomicScatteringFactors(configurationfilepath)
+
+        self.filepath = os.path.join(self.tmpdir, 'phases.lib')
+
+    def tearDown(self):
+        unittest.TestCase.tearDown(self)
+        shutil.rmtree(self.tmpdir)
+
+    def testimport_directory(self):
+        progress = []
+        library = phaselibrary.import_directory(self.cifdir, self.filepath,
+                                                self.scatter, maxindice=2,
+                                                processes=1,
+                                                progress=lambda *args: progress.append(args))
+
+        self.assertEqual(library.names, ['aluminum', 'hcp/zirconium', 'iron'])
+        self.assertEqual(progress[-1], (5, 5))
+
+        errors = library.errors
+        self.assertEqual([error['filepath'] for error in errors], ['bad.cif', 'empty.cif'])
+        self.assertTrue('ValueError' in errors[0]['error'])
+        self.assertEqual(errors[1]['error'], 'No structure found')
+
+        record = library.get_record('iron')
+        self.assertEqual(record['filepath'], 'iron.cif')
+        self.assertEqual(record['formula'], 'Fe')
+        self.assertTrue(isinstance(record['formula'], str))
+        self.assertTrue(isinstance(record['lattice'], tuple))
+        self.assertEqual(record['spacegroup'], 229)
+        self.assertEqual(library.get_spacegroup('iron'), spacegroups.sg229)
+        self.assertAlmostEqual(library.get_unitcell('iron').a, 2.866)
+        self.assertEqual(len(library.get_atomsites('iron')), 2)
+        self.assertEqual(len(library.get_atomsites('hcp/zirconium')), 4)
+
+        table = library.get_reflectors_table('iron')
+        self.assertEqual(table.dtype, reflectors.TABLE_DTYPE)
+        self.assertTrue(len(table) > 0)
+        self.assertTrue(np.all((table['h'] + table['k'] + table['l']) % 2 == 0))
+
+    def testnonstandard_setting(self):
+        # P 21/n (no. 14), which is not the tabulated setting (P 21/c)
+        cifdir = os.path.join(self.tmpdir, 'nonstandard')
+        os.makedirs(cifdir)
+        with open(os.path.join(cifdir, 'p21n.cif'), 'w') as f:
+            f.write("data_p21n\n"
+                    "_cell_length_a 5.0\n_cell_length_b 6.0\n_cell_length_c 7.0\n"
+                    "_cell_angle_alpha 90\n_cell_angle_beta 95\n_cell_angle_gamma 90\n"
+                    "_symmetry_space_group_name_H-M 'P 21/n'\n"
+                    "_symmetry_Int_Tables_number 14\n"
+                    "loop_\n_symmetry_equiv_pos_as_xyz\n"
+                    "  'x,y,z'\n  '-x+1/2,y+1/2,-z+1/2'\n"
+                    "  '-x,-y,-z'\n  'x+1/2,-y+1/2,z+1/2'\n"
+                    "loop_\n_atom_site_label\n_atom_site_type_symbol\n"
+                    "_atom_site_fract_x\n_atom_site_fract_y\n_atom_site_fract_z\n"
+                    "Fe1 Fe 0.1 0.2 0.3\n")
+
+        library = phaselibrary.import_directory(cifdir, self.filepath,
+                                                self.scatter, maxindice=3,
+                                                processes=1)
+        self.assertEqual(library.errors, [])
+        self.assertEqual(library.get_record('p21n')['spacegroup'], None)
+        self.assertEqual(len(library.get_atomsites('p21n')), 4)
+
+        # Same planes as without space group
+        table = library.get_reflectors_table('p21n')
+        planes = set(zip(table['h'], table['k'], table['l']))
+
+        expected = reflectors.compute_table(library.get_unitcell('p21n'),
+                                            library.get_atomsites('p21n'),
+                                            self.scatter, maxindice=3)
+        self.assertEqual(planes, set(zip(expected['h'], expected['k'], expected['l'])))
+
+        # h0l: h + l even
+        self.assertTrue((1, 0, 1) in planes)
+        self.assertTrue((1, 0, -3) in planes)
+        self.assertFalse((1, 0, 2) in planes)
+
+    def testparallel(self):
+        serial = phaselibrary.import_directory(self.cifdir, self.filepath,
+                                               self.scatter, maxindice=2,
+                                               processes=1)
+        tables = [np.array(serial.get_reflectors_table(name)) for name in serial]
+
+        filepath = os.path.join(self.tmpdir, 'parallel.lib')
+        library = phaselibrary.import_directory(self.cifdir, filepath,
+                                                self.scatter, maxindice=2,
+                                                processes=2)
+
+        self.assertEqual(library.names, serial.names)
+        self.assertEqual(len(library.errors), 2)
+        for name, table in zip(library, tables):
+            self.assertEqual(library.get_reflectors_table(name).tolist(), table.tolist())
+
+        # Reopen
+        library = phaselibrary.PhaseLibrary(filepath)
+        self.assertEqual(len(library), 3)
+        self.assertTrue('aluminum' in library)
+
+if __name__ == '__main__': #pragma: no cover
+    logging.getLogger().setLevel(logging.DEBUG)
+    unittest.main()
@@ -64,6 +64,17 @@ class TestPlane(unittest.TestCase):
         bravais = self.plane3.indices_bravais
         self.assertEqual(bravais, [-1.0, -2.0, 3.0, 0.0])
 
+    def testequal(self):
+        self.assertEqual(plane.Plane(3, 3, 3), self.plane1)
+        self.assertNotEqual(self.plane2, self.plane3)
+        self.assertTrue(plane.Plane(1, -2, 0) in [self.plane3, self.plane2])
+
+        self.assertFalse(self.plane1 == None)
+        self.assertTrue(self.plane1 != None)
+        self.assertFalse(self.plane1 == 3)
+        self.assertFalse(self.plane1 in [None, 3])
+        self.assertTrue(self.plane1 == (3, 3, 3))
+
     def testhash(self):
         self.assertEqual(5050908322398645920, hash(self.plane1))
 
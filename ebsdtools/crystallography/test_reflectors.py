@@ -22,8 +22,11 @@ import unittest
 import logging
 import os.path
 import warnings
+import shutil
+import tempfile
 
 # Third party modules.
+import numpy as np
 
 # Local modules.
 import DrixUtilities.Files as Files
@@ -33,6 +36,8 @@ import ebsdtools.crystallography.unitcell as unitcell
 from ebsdtools.crystallography.plane import Plane
 import ebsdtools.crystallography.scatteringfactors as scatteringfactors
 import ebsdtools.crystallography.atomsites as atomsites
+from ebsdtools.crystallography.atomsite import AtomSite
+from ebsdtools.crystallography.spacegroup import SpaceGroup, SymOp
 
 # Globals and constants variables.
 
@@ -225,6 +230,157 @@ class TestReflectors(unittest.TestCase):
         refl = self.refls_hcp.get(Plane(2, -1, 0))
         self.assertAlmostEqual(refl.normalizedintensity, 0.21837478278035422)
 
+class TestReflectorsFunctions(unittest.TestCase):
+
+    def test_positive_indices(self):
+        indices = reflectors._positive_indices(2)
+        self.assertEqual(indices.shape, (62, 3))
+
+        planes = set(map(tuple, indices.tolist()))
+        self.assertEqual(len(planes), 62)
+        self.assertTrue((1, -1, 0) in planes)
+        self.assertFalse((-1, 1, 0) in planes)
+        self.assertFalse((0, 0, 0) in planes)
+
+    def _create_spacegroup(self):
+        # I4: body centering and 4-fold axis along z
+        identity = [[1, 0, 0], [0, 1, 0], [0, 0, 1]]
+        rotation = [[0, -1, 0], [1, 0, 0], [0, 0, 1]]
+        symops = []
+        for translation in ([0, 0, 0], [0.5, 0.5, 0.5]):
+            r = identity
+            for i in range(4):
+                symops.append(SymOp(r, translation))
+                r = np.dot(r, rotation).tolist()
+
+        return SpaceGroup(number=79, short_name='I4', symop_list=symops)
+
+    def test_symmetry_operations(self):
+        rotations, translations = \
+            reflectors._symmetry_operations(self._create_spacegroup())
+        self.assertEqual(rotations.shape, (8, 3, 3))
+        self.assertEqual(translations.shape, (8, 3))
+
+        # 4/m
+        laue = reflectors._laue_rotations(rotations)
+        self.assertEqual(laue.shape, (8, 3, 3))
+
+    def test_asymmetric_indices(self):
+        rotations, translations = \
+            reflectors._symmetry_operations(self._create_spacegroup())
+        laue = reflectors._laue_rotations(rotations)
+
+        indices = reflectors._asymmetric_indices(2, laue)
+        planes = set(map(tuple, indices.tolist()))
+        self.assertTrue((1, 0, 0) in planes)
+        self.assertFalse((0, 1, 0) in planes)
+        self.assertEqual(len(planes), 20)
+
+        # Every plane of the cube is equivalent to one plane of the 
+        # asymmetric unit
+        equivalents = reflectors._equivalent_indices(indices, laue)
+        self.assertEqual(len(set(map(tuple, equivalents.reshape(-1, 3).tolist()))),
+                         124)
+
+    def test_systematic_absences(self):
+        rotations, translations = \
+            reflectors._symmetry_operations(self._create_spacegroup())
+        indices = reflectors._positive_indices(2)
+
+        absent = reflectors._systematic_absences(indices, rotations, translations)
+        self.assertTrue(np.all(absent == (indices.sum(axis=1) % 2 == 1)))
+
+    def test_expand_families(self):
+        rotations, translations = \
+            reflectors._symmetry_operations(self._create_spacegroup())
+        laue = reflectors._laue_rotations(rotations)
+
+        table = np.zeros(2, dtype=reflectors.TABLE_DTYPE)
+        table['h'], table['k'], table['l'] = [[1, 2], [0, 1], [1, 0]]
+        table['intensity'] = [1.0, 2.0]
+
+        expanded = reflectors._expand_families(table, laue, 2)
+        planes = sorted(zip(expanded['h'], expanded['k'], expanded['l']))
+        self.assertEqual(planes, [(0, 1, -1), (0, 1, 1), (1, -2, 0), (1, 0, -1),
+                                  (1, 0, 1), (2, 1, 0)])
+        self.assertEqual(expanded['intensity'].sum(), 8.0)
+
+class TestReflectorsCache(unittest.TestCase):
+
+    class _ScatteringFactors(object):
+        def get_identity(self):
+            return ('ScatteringFactors',)
+
+    def setUp(self):
+        unittest.TestCase.setUp(self)
+
+        self.dirpath = tempfile.mkdtemp()
+        self.cache = reflectors.ReflectorsCache(self.dirpath, maxsize=300)
+
+        self.table = np.zeros(4, dtype=reflectors.TABLE_DTYPE)
+        self.table['h'] = [1, 2, 0, 1]
+        self.table['planespacing'] = [1.0, 0.5, 0.25, 0.125]
+
+    def tearDown(self):
+        unittest.TestCase.tearDown(self)
+
+        shutil.rmtree(self.dirpath)
+
+    def testget_key(self):
+        scatter = self._ScatteringFactors()
+        atoms = [AtomSite(14, 0.5, 0.5, 0.0), AtomSite(14, 0.0, 0.0, 0.0)]
+        key1 = self.cache.get_key(unitcell.create_cubic_unitcell(5.43),
+                                  atoms, scatter, 2)
+        key2 = self.cache.get_key(unitcell.create_cubic_unitcell(5.43),
+                                  atoms[::-1], scatter, 2)
+        key3 = self.cache.get_key(unitcell.create_cubic_unitcell(5.43),
+                                  atoms, scatter, 3)
+
+        self.assertEqual(key1, key2)
+        self.assertNotEqual(key1, key3)
+
+        # Space groups without number (e.g. non-standard settings)
+        p21c = SpaceGroup(symop_specs=[(((1, 0, 0), (0, 1, 0), (0, 0, 1)), (0, 0, 0)),
+                                       (((-1, 0, 0), (0, 1, 0), (0, 0, -1)), (0, 0.5, 0.5)),
+                                       (((-1, 0, 0), (0, -1, 0), (0, 0, -1)), (0, 0, 0)),
+                                       (((1, 0, 0), (0, -1, 0), (0, 0, 1)), (0, 0.5, 0.5))])
+        specs = [(((1, 0, 0), (0, 1, 0), (0, 0, 1)), (0, 0, 0)),
+                 (((-1, 0, 0), (0, 1, 0), (0, 0, -1)), (0.5, 0.5, 0.5)),
+                 (((-1, 0, 0), (0, -1, 0), (0, 0, -1)), (0, 0, 0)),
+                 (((1, 0, 0), (0, -1, 0), (0, 0, 1)), (-0.5, 0.5, 0.5))]
+        p21n = SpaceGroup(symop_specs=specs)
+        p21n2 = SpaceGroup(symop_specs=specs[::-1])
+
+        cell = unitcell.create_cubic_unitcell(5.43)
+        key4 = self.cache.get_key(cell, atoms, scatter, 2, p21c)
+        key5 = self.cache.get_key(cell, atoms, scatter, 2, p21n)
+        key6 = self.cache.get_key(cell, atoms, scatter, 2, p21n2)
+
+        self.assertNotEqual(key4, key5)
+        self.assertEqual(key5, key6)
+        self.assertNotEqual(key1, key4)
+
+    def testsaveload(self):
+        self.assertEqual(self.cache.load('a'), None)
+
+        self.cache.save('a', self.table)
+        table = self.cache.load('a')
+        self.assertEqual(table.dtype, reflectors.TABLE_DTYPE)
+        self.assertTrue(np.all(table == self.table))
+
+    def testevict(self):
+        self.cache.save('a', self.table)
+        os.utime(os.path.join(self.dirpath, 'a.npy'), (0, 0))
+        self.cache.save('b', self.table)
+
+        self.assertEqual(self.cache.load('a'), None)
+        self.assertTrue(self.cache.load('b') is not None)
+
+    def testclear(self):
+        self.cache.save('a', self.table)
+        self.cache.clear()
+        self.assertEqual(os.listdir(self.dirpath), [])
+
 if __name__ == '__main__': #pragma: no cover
     logging.getLogger().setLevel(logging.DEBUG)
     unittest.main()
@@ -25,6 +25,7 @@ from math import pi
 import warnings
 
 # Third party modules.
+import numpy as np
 
 # Local modules.
 import DrixUtilities.Files as Files
@@ -131,6 +132,29 @@ class TestElasticAtomicScatteringFactors(unittest.TestCase):
         expected_factor = 0.0332559532
         self.assertAlmostEqual(factor, expected_factor)
 
+    def testget_many(self):
+        atomicnumbers = [14, 29, 79]
+        planespacings = [4 * pi, 2.0 / 3.0 * pi, 2.0 / 6.1 * pi]
+
+        factors = self.scatter.get_many(atomicnumbers, np.array(planespacings)[:, np.newaxis])
+        self.assertEqual(factors.shape, (3, 3))
+
+        for i, planespacing in enumerate(planespacings):
+            for j, atomicnumber in enumerate(atomicnumbers):
+                self.assertAlmostEqual(factors[i, j],
+                                       self.scatter.get(atomicnumber, planespacing))
+
+        self.assertRaises(KeyError, self.scatter.get_many, [14, 200], [1.0, 1.0])
+
+    def testget_many_warning(self):
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            self.scatter.get_many(14, [0.1, 0.2, 0.3, 2.0])
+
+        self.assertEqual(len(caught), 1)
+        self.assertTrue(issubclass(caught[0].category,
+                                   scatteringfactors.ScatteringFactorWarning))
+
 class TestXrayScatteringFactors(unittest.TestCase):
 
     def setUp(self):
@@ -225,6 +249,21 @@ class TestXrayScatteringFactors(unittest.TestCase):
         expected_factor = 4.2485964205405162
         self.assertAlmostEqual(factor, expected_factor)
 
+    def testget_many(self):
+        atomicnumbers = [14, 29, 79]
+        planespacings = [1.0, 1.0 / 6.0, 1.0 / (2 * 6.1)]
+
+        factors = self.scatter.get_many(atomicnumbers, np.array(planespacings)[:, np.newaxis])
+        self.assertEqual(factors.shape, (3, 3))
+
+        for i, planespacing in enumerate(planespacings):
+            for j, atomicnumber in enumerate(atomicnumbers):
+                self.assertAlmostEqual(factors[i, j],
+                                       self.scatter.get(atomicnumber, planespacing))
+
+        factors = self.scatter.get_many([1, 1], [1.0, 1.0], charge=-1)
+        self.assertAlmostEqual(factors[0], self.scatter.get(1, 1.0, charge=-1))
+
 if __name__ == '__main__': #pragma: no cover
     logging.getLogger().setLevel(logging.DEBUG)
     unittest.main()
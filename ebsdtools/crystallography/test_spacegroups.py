@@ -47,6 +47,30 @@ class TestSpaceGroups(unittest.TestCase):
 
         self.assertEqual(spacegroups.getspacegroup("P4332"), spacegroups.sg212)
 
+    def testgetspacegroup_normalized(self):
+        self.assertEqual(spacegroups.getspacegroup("P 43 3 2"), spacegroups.sg212)
+        self.assertEqual(spacegroups.getspacegroup("p4332"), spacegroups.sg212)
+        self.assertEqual(spacegroups.getspacegroup("F m -3 m"), spacegroups.sg225)
+        self.assertEqual(spacegroups.getspacegroup("225"), spacegroups.sg225)
+        self.assertEqual(spacegroups.getspacegroup("r 3"), spacegroups.sg1146)
+        self.assertEqual(spacegroups.getspacegroup("Xyz"), None)
+
+    def testgetspacegroup_all(self):
+        for sg in spacegroups.spacegrouplist:
+            self.assertTrue(spacegroups.getspacegroup(sg.number) is sg)
+
+    def testfindspacegroup(self):
+        rotations, translations = spacegroups.sg194.get_symop_arrays()
+        sg = spacegroups.findspacegroup(rotations[::-1], translations[::-1] + 1.0)
+        self.assertEqual(sg, spacegroups.sg194)
+
+        self.assertEqual(spacegroups.findspacegroup(rotations[:1], translations[:1] + 0.125), None)
+
+    def testnormalize_name(self):
+        self.assertEqual(spacegroups.normalize_name(" P 63/m m c "), "p63/mmc")
+        self.assertEqual(spacegroups.normalize_name(194), 194)
+        self.assertEqual(spacegroups.normalize_name("194"), 194)
+
     def testconsistency(self):
         for sg in spacegroups.spacegrouplist:
             num_sym = len(sg.symop_list)
@@ -19,12 +19,15 @@ __license__ = "GPL v3"
 # Standard library modules.
 import unittest
 import logging
+from math import pi, sqrt
 
 # Third party modules.
+import numpy as np
 
 # Local modules.
-#import ebsdtools.crystallography.symmetry as symmetry
-#import mathtools.rotation.quaternions as quaternions
+import ebsdtools.crystallography.symmetry as symmetry
+import mathtools.rotation.quaternions as quaternions
+import mathtools.rotation.quaternionarrays as quaternionarrays
 
 # Globals and constants variables.
 
@@ -36,6 +39,115 @@ class TestSymmetry(unittest.TestCase):
     def tearDown(self):
         unittest.TestCase.tearDown(self)
 
+    def testGetLaueGroup(self):
+        self.assertEqual(symmetry.getLaueGroup(1), '-1')
+        self.assertEqual(symmetry.getLaueGroup(14), '2/m')
+        self.assertEqual(symmetry.getLaueGroup(62), 'mmm')
+        self.assertEqual(symmetry.getLaueGroup(139), '4/mmm')
+        self.assertEqual(symmetry.getLaueGroup(166), '-3m')
+        self.assertEqual(symmetry.getLaueGroup(194), '6/mmm')
+        self.assertEqual(symmetry.getLaueGroup(205), 'm-3')
+        self.assertEqual(symmetry.getLaueGroup(225), 'm-3m')
+        self.assertEqual(symmetry.getLaueGroup(230), 'm-3m')
+
+        self.assertRaises(ValueError, symmetry.getLaueGroup, 0)
+        self.assertRaises(ValueError, symmetry.getLaueGroup, 231)
+
+    def testGetSymmetries(self):
+        sizes = {'-1': 1, '2/m': 2, 'mmm': 4, '4/m': 4, '4/mmm': 8, '-3': 3,
+                 '-3m': 6, '6/m': 6, '6/mmm': 12, 'm-3': 12, 'm-3m': 24}
+
+        for name, _number, _generators in symmetry.LAUE_GROUPS:
+            qs = symmetry.getSymmetries(name)
+            self.assertEqual(len(qs), sizes[name])
+            self.assertTrue(np.allclose(qs.array[0], [1, 0, 0, 0]))
+            self.assertTrue(np.all(qs.isnormalized()))
+
+            # Closed under multiplication
+            for i in range(len(qs)):
+                products = (qs * qs.array[i]).array
+                dotproducts = np.abs(np.dot(products, qs.array.T))
+                self.assertTrue(np.allclose(dotproducts.max(axis=1), 1.0))
+
+    def testCubicSymmetries(self):
+        qs = symmetry.cubicSymmetries()
+
+        self.assertEqual(len(qs), 24)
+        self.assertEqual(qs[0], quaternions.Quaternion(1, 0, 0, 0))
+
+    def testDisorientation(self):
+        # Sigma 3 twin: 60 deg around <111>
+        q1 = quaternionarrays.eulerangles_to_quaternionarray(np.random.random((100, 3)) * [2 * pi, pi, 2 * pi])
+        twin = quaternionarrays.axisangles_to_quaternionarray([pi / 3.0], [1, 1, 1])
+        q2 = q1 * twin
+
+        angles, axes = symmetry.disorientation(q1, q2, 'm-3m')
+        self.assertTrue(np.allclose(angles, pi / 3.0))
+        self.assertTrue(np.allclose(np.sum(axes ** 2, axis=1), 1.0))
+        self.assertTrue(np.allclose(symmetry.disorientationAngle(q1, q2, 'm-3m'), angles))
+
+        # Equivalent orientations
+        for name, _number, _generators in symmetry.LAUE_GROUPS:
+            qs = symmetry.getSymmetries(name)
+            q2 = q1[:1] * qs
+            angles, axes = symmetry.disorientation(q1[:1], q2, name)
+            self.assertTrue(np.allclose(angles, 0.0, atol=1e-6))
+            self.assertTrue(np.allclose(axes, 0.0))
+
+        # 90 deg around z: equivalent in 4/mmm, not in 6/mmm
+        rotation = quaternionarrays.axisangles_to_quaternionarray([pi / 2.0], [0, 0, 1])
+        self.assertAlmostEqual(symmetry.disorientationAngle(q1, q1 * rotation, '4/mmm')[0], 0.0, 6)
+        self.assertAlmostEqual(symmetry.disorientationAngle(q1, q1 * rotation, '6/mmm')[0], pi / 6.0)
+
+    def testDisorientationInputs(self):
+        # Negative quaternions are not made positive in place
+        q1 = np.array([[-0.5, 0.5, 0.5, 0.5], [-1.0, 0.0, 0.0, 0.0]])
+        q2 = np.array([[0.0, -1.0, 0.0, 0.0], [-1.0, 0.0, 0.0, 0.0]])
+        expected1 = q1.copy()
+        expected2 = q2.copy()
+
+        angles = symmetry.disorientationAngle(q1, q2, 'm-3m')
+        self.assertAlmostEqual(angles[1], 0.0)
+        symmetry.disorientation(q1, q2, 'm-3m')
+        symmetry.getNearestEquivalents(q1, q2, 'm-3m')
+
+        self.assertTrue(np.all(q1 == expected1))
+        self.assertTrue(np.all(q2 == expected2))
+
+    def testGetNearestEquivalents(self):
+        references = quaternionarrays.eulerangles_to_quaternionarray(np.random.random((100, 3)) * [2 * pi, pi, 2 * pi])
+        rotations = quaternionarrays.axisangles_to_quaternionarray(np.random.random(100) * 0.1,
+                                                                   np.random.random((100, 3)) - 0.5)
+        qs = references * rotations
+
+        # Equivalent orientations of slightly rotated references
+        symmetries = symmetry.getSymmetries('m-3m')
+        equivalents = symmetry.getNearestEquivalents(qs * symmetries.array[5], references, 'm-3m')
+
+        self.assertTrue(np.all(np.sum(equivalents * references.array, axis=1) > 0.0))
+        self.assertTrue(np.allclose(np.abs(np.sum(equivalents * qs.array, axis=1)), 1.0))
+
+    def testDisorientationBruteForce(self):
+        q1 = quaternionarrays.eulerangles_to_quaternionarray(np.random.random((1000, 3)) * [2 * pi, pi, 2 * pi])
+        q2 = quaternionarrays.eulerangles_to_quaternionarray(np.random.random((1000, 3)) * [2 * pi, pi, 2 * pi])
+
+        for name, _number, _generators in symmetry.LAUE_GROUPS:
+            qs = symmetry.getSymmetries(name)
+
+            expected = np.empty((len(qs), 1000))
+            for i in range(len(qs)):
+                expected[i] = (q1 * qs.array[i] * ~q2).misorientation([1, 0, 0, 0])
+            expected = expected.min(axis=0)
+
+            angles, axes = symmetry.disorientation(q1, q2, name)
+            self.assertTrue(np.allclose(angles, expected))
+
+            misorientations = quaternionarrays.axisangles_to_quaternionarray(angles, axes)
+            self.assertTrue(np.allclose(np.abs(misorientations.array[:, 0]), np.cos(expected / 2.0)))
+
+        # Maximum disorientation in cubic (Mackenzie)
+        self.assertTrue(angles.max() <= 62.8 / 180.0 * pi)
+
 #    def testCubicSymmetries(self):
 #      m = []
 #
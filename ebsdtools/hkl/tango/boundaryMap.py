@@ -0,0 +1,181 @@
+#!/usr/bin/env python
+"""
+================================================================================
+:mod:`boundaryMap` -- Neighbour disorientations and boundaries of a CTF map
+================================================================================
+
+.. module:: boundaryMap
+   :synopsis: Neighbour disorientations and boundaries of a CTF map
+
+"""
+
+# Script information for the file.
+__author__ = "Philippe T. Pinard"
+__email__ = "philippe.pinard@gmail.com"
+__version__ = "0.1"
+__copyright__ = "Copyright (c) 2010 Philippe T. Pinard"
+__license__ = "GPL v3"
+
+# Standard library modules.
+
+# Third party modules.
+import numpy as np
+
+# Local modules.
+import ebsdtools.crystallography.symmetry as symmetry
+
+# Globals and constants variables.
+MISSING_ERRORCODE = 5 # Error code of the pixels missing in a ctf (job cancelled)
+
+def getLaueGroups(ctf):
+    """
+    Return the Laue group of every phase of a ctf, found from the space group
+    no. of the phase.
+    
+    :arg ctf: a ctf class containing the data
+    :type ctf: :class:`ctf <ebsdtools.hkl.tango.ctfFile.ctf>`
+    
+    :return: dictionary of the Laue group name for every phase id
+    :rtype: dict
+    """
+    laueGroups = {}
+
+    for id in ctf.getPhases():
+        laueGroups[id] = symmetry.getLaueGroup(ctf.getPhaseSpaceGroupNo(id))
+
+    return laueGroups
+
+def getQuaternionMap(ctf, acquisition=False):
+    """
+    Return the quaternions of the pixels as an array of shape
+    (YCells, XCells, 4).
+    The missing pixels (e.g. job cancelled) are the identity and the extra
+    pixels (more lines than XCells * YCells) are dropped.
+    
+    :arg ctf: a ctf class containing the data
+    :type ctf: :class:`ctf <ebsdtools.hkl.tango.ctfFile.ctf>`
+    
+    :arg acquisition: whether to compose the acquisition rotation
+      with the orientation of every pixel (``default=False``)
+    :type acquisition: bool
+    
+    :rtype: :class:`numpy.ndarray`
+    """
+    size = ctf.getSize()
+    array = ctf.getQuaternions(acquisition).array[:size]
+
+    if len(array) != size:
+        newArray = np.zeros((size, 4))
+        newArray[:, 0] = 1.0
+        newArray[:len(array)] = array
+        array = newArray
+
+    return array.reshape(ctf.getYCells(), ctf.getXCells(), 4)
+
+def getIndexedMask(ctf):
+    """
+    Return a boolean map where the indexed pixels (``phase != 0`` and
+    ``errorcode == 0``) are ``True``.
+    
+    :arg ctf: a ctf class containing the data
+    :type ctf: :class:`ctf <ebsdtools.hkl.tango.ctfFile.ctf>`
+    
+    :rtype: :class:`numpy.ndarray` of shape (YCells, XCells)
+    """
+    phase = ctf.getPixelArray('phase', 0)
+    errorcode = ctf.getPixelArray('errorcode', MISSING_ERRORCODE)
+
+    return (phase != 0) & (errorcode == 0)
+
+def _getEdges(q1, q2, phase1, phase2, valid1, valid2, laueGroups):
+    """
+    Return the disorientations (in degrees) between the pixels of two
+    shifted maps.
+    The pairs of pixels of different phases or where one of the pixels is
+    not valid are masked.
+    
+    :rtype: :class:`numpy.ma.MaskedArray`
+    """
+    edges = np.ma.masked_array(np.zeros(phase1.shape, np.float32), mask=True)
+    pairs = valid1 & valid2 & (phase1 == phase2)
+
+    for id, laueGroup in laueGroups.iteritems():
+        selection = pairs & (phase1 == id)
+        if not selection.any():
+            continue
+
+        angles = symmetry.disorientationAngle(q1[selection], q2[selection], laueGroup)
+        edges[selection] = np.degrees(angles)
+
+    return edges
+
+def getNeighbourDisorientations(ctf, acquisition=False):
+    """
+    Return the disorientation (in degrees) between every pixel of a ctf map
+    and its right neighbour, and between every pixel and its lower neighbour.
+    The disorientations are computed on the whole map at once, by comparing
+    the map with itself shifted by one pixel, and take into account the
+    Laue group of each phase (see :func:`getLaueGroups`).
+    
+    The pairs of pixels of different phases or where one of the pixels is
+    not indexed (``phase == 0`` or ``errorcode != 0``) are masked.
+    
+    **Examples:**::
+    
+      right, lower = getNeighbourDisorientations(ctf)
+    
+      # Mean disorientation between neighbours
+      mean = (right.sum() + lower.sum()) / (right.count() + lower.count())
+    
+    :arg ctf: a ctf class containing the data
+    :type ctf: :class:`ctf <ebsdtools.hkl.tango.ctfFile.ctf>`
+    
+    :arg acquisition: whether to compose the acquisition rotation
+      with the orientation of every pixel (``default=False``)
+    :type acquisition: bool
+    
+    :return: disorientations with the right neighbours, of shape
+      (YCells, XCells - 1), and with the lower neighbours, of shape
+      (YCells - 1, XCells)
+    :rtype: tuple of :class:`numpy.ma.MaskedArray`
+    """
+    qs = getQuaternionMap(ctf, acquisition)
+    phase = ctf.getPixelArray('phase', 0)
+    valid = getIndexedMask(ctf)
+
+    laueGroups = getLaueGroups(ctf)
+
+    right = _getEdges(qs[:, :-1], qs[:, 1:], phase[:, :-1], phase[:, 1:],
+                      valid[:, :-1], valid[:, 1:], laueGroups)
+    lower = _getEdges(qs[:-1], qs[1:], phase[:-1], phase[1:],
+                      valid[:-1], valid[1:], laueGroups)
+
+    return right, lower
+
+def getBoundaryMask(right, lower, threshold):
+    """
+    Return a boolean map where the pixels with a disorientation to their right
+    or lower neighbour greater or equal to the *threshold* are ``True``.
+    The masked disorientations (e.g. between two phases) are not boundaries.
+    
+    **Examples:**::
+    
+      right, lower = getNeighbourDisorientations(ctf)
+    
+      lowAngle = getBoundaryMask(right, lower, 2.0) & ~getBoundaryMask(right, lower, 15.0)
+      highAngle = getBoundaryMask(right, lower, 15.0)
+    
+    :arg right, lower: disorientations (in degrees) as given by
+      :func:`getNeighbourDisorientations`
+    
+    :arg threshold: minimum disorientation of a boundary [units=deg]
+    :type threshold: float
+    
+    :rtype: :class:`numpy.ndarray` of shape (YCells, XCells)
+    """
+    mask = np.zeros((lower.shape[0] + 1, right.shape[1] + 1), dtype=bool)
+
+    mask[:, :-1] |= np.ma.filled(right >= threshold, False)
+    mask[:-1, :] |= np.ma.filled(lower >= threshold, False)
+
+    return mask
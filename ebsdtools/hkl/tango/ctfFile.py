@@ -21,29 +21,587 @@ __license__ = "GPL v3"
 # Standard library modules.
 import os
 import csv
+import struct
+import logging
+import json
 
 # Third party modules.
+import numpy as np
 
 # Local modules.
+import mathtools.rotation.quaternionarrays as quaternionarrays
+
+# Globals and constants variables.
+COLUMNS = ('phase', 'x', 'y', 'bands', 'errorcode',
+           'euler1', 'euler2', 'euler3', 'mad', 'bc', 'bs')
+
+DTYPES = {'phase': np.uint8,
+          'x': np.float32,
+          'y': np.float32,
+          'bands': np.uint8,
+          'errorcode': np.uint8,
+          'euler1': np.float32,
+          'euler2': np.float32,
+          'euler3': np.float32,
+          'mad': np.float32,
+          'bc': np.uint8,
+          'bs': np.uint8}
+
+DECIMALS = 4 # Maximum number of decimals written in a ctf
+
+READ_SIZE = 8388608 # Number of bytes of data lines parsed at once
+
+CHUNK_SIZE = 1000000 # Number of pixels in a chunk
+
+CACHE_EXTENSION = '.ctfcache' # Extension of the binary sidecar of a ctf
+
+CACHE_MAGIC = 'CTFCACHE\x02'
+
+CACHE_ALIGNMENT = 64 # Alignment in bytes of the columns in the sidecar
+
+ERROR_CODES = {0: 'Success',
+               1: 'Low band contrast',
+               2: 'Low band slope',
+               3: 'No solution',
+               4: 'High MAD',
+               5: 'Not yet analysed (job cancelled before point!)',
+               6: 'Unexpected error (excepts etc.)'}
+
+def _readHeaderLines(file):
+    """
+    Read the header lines up to (and including) the line with the
+    columns header.
+    The *file* is left at the beginning of the data lines.
+    
+    :rtype: list
+    """
+    lines = []
+
+    for line in iter(file.readline, ''):
+        lines.append(line)
+        if line.split('\t', 1)[0] == 'Phase':
+            break
+
+    return list(csv.reader(lines, dialect='excel-tab'))
+
+def _parseLines(lines):
+    """
+    Parse data lines into one typed array per column.
+    
+    :rtype: dict
+    """
+    values = np.fromstring(''.join(lines), sep=' ')
+    if len(values) % len(COLUMNS) != 0:
+        raise IOError("Invalid data lines")
+    values = values.reshape(-1, len(COLUMNS))
+
+    columns = {}
+    for i, key in enumerate(COLUMNS):
+        columns[key] = values[:, i].astype(DTYPES[key])
+
+    return columns
+
+def _iterColumns(file, chunkSize=CHUNK_SIZE):
+    """
+    Iterate over the data lines of *file* by blocks of *chunkSize* pixels.
+    The text is read by blocks of :const:`READ_SIZE` bytes, so that only
+    one chunk and one block of text are held in memory.
+    
+    :rtype: iterator of dict
+    """
+    buffer = []
+    buffered = 0
+    eof = False
+
+    while not eof:
+        lines = file.readlines(READ_SIZE)
+        if lines:
+            block = _parseLines(lines)
+            buffer.append(block)
+            buffered += len(block['phase'])
+        else:
+            eof = True
+
+        if buffered < chunkSize and not (eof and buffered > 0):
+            continue
+
+        #Concatenate the buffered blocks once and slice the chunks by offset
+        if len(buffer) == 1:
+            columns = buffer[0]
+        else:
+            columns = dict((key, np.concatenate([block[key] for block in buffer]))
+                           for key in COLUMNS)
+
+        start = 0
+        while buffered - start >= chunkSize or (eof and buffered > start):
+            stop = min(start + chunkSize, buffered)
+            yield dict((key, columns[key][start:stop]) for key in COLUMNS)
+            start = stop
+
+        #Only the tail (less than chunkSize pixels) is carried to the next block
+        if start < buffered:
+            buffer = [dict((key, columns[key][start:]) for key in COLUMNS)]
+        else:
+            buffer = []
+        buffered -= start
+
+def _getColumn(columns, key):
+    """
+    Return the array of a given column header *key*.
+    The key ``error`` returns the explanation of the *errorcode* of every pixel.
+    
+    :rtype: :class:`numpy.ndarray`
+    """
+    if key == 'error':
+        errors = np.array([ERROR_CODES[code] for code in sorted(ERROR_CODES)])
+        return errors[columns['errorcode']]
+
+    return columns[key]
+
+def _evaluateCondition(columns, key, condition):
+    """
+    Return the boolean mask of the pixels respecting a *condition* on the
+    column *key*.
+    The values are converted to the type of the column, so that a value of
+    a float column is compared as written in the ctf.
+    
+    :rtype: :class:`numpy.ndarray`
+    """
+    operator, value = condition
+    column = _getColumn(columns, key)
+
+    if column.dtype.kind == 'f':
+        value = np.asarray(value, dtype=column.dtype)
+
+    if operator == '=':
+        return column == value
+    elif operator == '>':
+        return column > value
+    elif operator == '>=':
+        return column >= value
+    elif operator == '<':
+        return column < value
+    elif operator == '<=':
+        return column <= value
+    elif operator == '!=':
+        return column != value
+    elif operator == 'in':
+        return np.in1d(column, value)
+    elif operator == 'between':
+        return (column >= value[0]) & (column <= value[1])
+    else:
+        raise ValueError("Unknown operator: %s" % operator)
+
+def _evaluateExpression(columns, expression):
+    """
+    Return the boolean mask of the pixels respecting an *expression*.
+    
+    .. seealso:: :func:`getMask`
+    
+    :rtype: :class:`numpy.ndarray`
+    """
+    size = len(columns['phase'])
+
+    if isinstance(expression, dict):
+        mask = np.ones(size, dtype=bool)
+        for key, condition in expression.iteritems():
+            mask &= _evaluateCondition(columns, key, condition)
+        return mask
+
+    operator = expression[0]
+    masks = [_evaluateExpression(columns, item) for item in expression[1:]]
+
+    if operator == 'and':
+        mask = np.ones(size, dtype=bool)
+        for item in masks:
+            mask &= item
+    elif operator == 'or':
+        mask = np.zeros(size, dtype=bool)
+        for item in masks:
+            mask |= item
+    else:
+        raise ValueError("Unknown expression operator: %s" % operator)
+
+    return mask
+
+def getMask(columns, *expressions, **conditions):
+    """
+    Return a boolean array where the pixels of *columns* (a chunk or all the
+    data of a ctf) respecting the conditions are ``True``.
+    
+    .. seealso:: :func:`ctf.getPixelMask <ctf.getPixelMask>`
+    
+    :arg columns: dictionary of column arrays as given by :func:`iterChunks`
+    :type columns: dict
+    
+    :rtype: :class:`numpy.ndarray`
+    """
+    return _evaluateExpression(columns, ('and', conditions) + expressions)
+
+def iterChunks(filepath, chunkSize=CHUNK_SIZE):
+    """
+    Iterate over the data of a ctf file by blocks of *chunkSize* pixels without
+    loading the whole map in memory.
+    Each chunk is a dictionary of one typed array per column (see :const:`COLUMNS`
+    and :const:`DTYPES`).
+    The chunks follow the order of the pixels in the file and all have
+    *chunkSize* pixels, except the last one.
+    
+    **Examples:**::
+    
+      # Number of pixels for every error code
+      counts = np.zeros(len(ERROR_CODES), int)
+      for chunk in iterChunks('map.ctf'):
+          counts += np.bincount(chunk['errorcode'], minlength=len(ERROR_CODES))
+    
+    :arg filepath: location of the ctf file
+    :type filepath: str
+    
+    :arg chunkSize: number of pixels in a chunk (``default=CHUNK_SIZE``)
+    :type chunkSize: int
+    
+    :rtype: iterator of dict
+    """
+    file = open(filepath, 'r')
+
+    try:
+        _readHeaderLines(file)
+
+        for columns in _iterColumns(file, chunkSize):
+            yield columns
+    finally:
+        file.close()
+
+def reduceChunks(function, filepath, initial, chunkSize=CHUNK_SIZE):
+    """
+    Fold a *function* over the chunks of a ctf file.
+    The *function* takes the accumulated value and a chunk and returns the
+    new accumulated value.
+    
+    **Examples:**::
+    
+      # Mean band contrast of the pixels of the second phase
+      def function(total, chunk):
+          bc = chunk['bc'][getMask(chunk, phase=('=', 2))]
+          return (total[0] + bc.sum(), total[1] + len(bc))
+    
+      sum, count = reduceChunks(function, 'map.ctf', (0, 0))
+    
+    :arg function: function(accumulated value, chunk)
+    
+    :arg filepath: location of the ctf file
+    :type filepath: str
+    
+    :arg initial: initial accumulated value
+    
+    :arg chunkSize: number of pixels in a chunk (``default=CHUNK_SIZE``)
+    :type chunkSize: int
+    """
+    return reduce(function, iterChunks(filepath, chunkSize), initial)
+
+def eulersToQuaternions(euler1, euler2, euler3, acquisitionEulers=None, chunkSize=CHUNK_SIZE):
+    """
+    Convert the euler angles of the pixels (in degrees, Bunge convention) to
+    quaternions in one pass.
+    The conversion is done by blocks of *chunkSize* pixels to limit the size
+    of the temporary arrays.
+    
+    If *acquisitionEulers* are given, the acquisition rotation is composed with
+    the orientation of every pixel: the acquisition rotation is applied
+    first, i.e. :math:`g = g_{\\text{pixel}} g_{\\text{acquisition}}`.
+    
+    **Examples:**::
+    
+      # Orientations of the pixels of a chunk
+      for chunk in iterChunks('map.ctf'):
+          qs = eulersToQuaternions(chunk['euler1'], chunk['euler2'], chunk['euler3'])
+    
+    :arg euler1, euler2, euler3: arrays of the euler angles [units=deg]
+    :type euler1, euler2, euler3: :class:`numpy.ndarray`
+    
+    :arg acquisitionEulers: acquisition euler angles
+      :math:`(\\theta_1, \\theta_2, \\theta_3)` [units=deg] (``default=None``)
+    :type acquisitionEulers: tuple
+    
+    :arg chunkSize: number of pixels converted at once (``default=CHUNK_SIZE``)
+    :type chunkSize: int
+    
+    :rtype: :class:`quaternionarrays.QuaternionArray`
+    """
+    size = len(euler1)
+    array = np.empty((size, 4))
+
+    if acquisitionEulers is not None:
+        acquisition = quaternionarrays.eulerangles_to_quaternionarray(np.radians(acquisitionEulers))
+
+    for start in range(0, size, chunkSize):
+        stop = min(start + chunkSize, size)
+
+        angles = np.empty((stop - start, 3))
+        angles[:, 0] = euler1[start:stop]
+        angles[:, 1] = euler2[start:stop]
+        angles[:, 2] = euler3[start:stop]
+        np.radians(angles, angles)
+
+        qs = quaternionarrays.eulerangles_to_quaternionarray(angles)
+        if acquisitionEulers is not None:
+            qs = acquisition * qs
+
+        array[start:stop] = qs.array
+
+    return quaternionarrays.QuaternionArray(array, copy=False)
+
+def getCachePath(filepath):
+    """
+    Return the location of the binary sidecar of a ctf file.
+    
+    :rtype: str
+    """
+    return filepath + CACHE_EXTENSION
+
+def _getSourceStat(filepath):
+    """
+    Return the key identifying the content of a ctf file: its absolute path,
+    size and modification time.
+    
+    :rtype: tuple
+    """
+    stat = os.stat(filepath)
+    return (os.path.abspath(filepath), stat.st_size, stat.st_mtime)
+
+def _align(offset):
+    return -(-offset // CACHE_ALIGNMENT) * CACHE_ALIGNMENT
+
+def _decodeJson(value):
+    """
+    Convert back the unicode strings of a decoded JSON value to byte strings,
+    as they are parsed from a ctf.
+    """
+    if isinstance(value, unicode):
+        return value.encode('latin-1')
+    elif isinstance(value, list):
+        return [_decodeJson(item) for item in value]
+    elif isinstance(value, dict):
+        return dict((_decodeJson(key), _decodeJson(item)) for key, item in value.iteritems())
+    else:
+        return value
+
+def _writeCache(cachepath, source, header, columns):
+    """
+    Write the binary sidecar of a ctf.
+    The sidecar contains the magic string, the length of the JSON
+    header, the JSON header and the raw columns (in the order of
+    :const:`COLUMNS`), each aligned on :const:`CACHE_ALIGNMENT` bytes.
+    The file is first written under a temporary name and then renamed, so
+    that a reader never sees a partial sidecar.
+    
+    :arg source: key of the ctf file (see :func:`_getSourceStat`)
+    :arg header: attributes parsed from the header
+    :arg columns: dictionary of column arrays
+    """
+    header = dict(header)
+    header['_phases'] = header.get('_phases', {}).values() # JSON keys are strings
+
+    info = {'source': source,
+            'header': header,
+            'count': len(columns['phase'])}
+    data = json.dumps(info, encoding='latin-1')
+
+    temppath = '%s.%i.tmp' % (cachepath, os.getpid())
+    file = open(temppath, 'wb')
+    try:
+        file.write(CACHE_MAGIC)
+        file.write(struct.pack('>Q', len(data)))
+        file.write(data)
+
+        for key in COLUMNS:
+            file.write('\0' * (_align(file.tell()) - file.tell()))
+            file.write(np.ascontiguousarray(columns[key], DTYPES[key]).tostring())
+    finally:
+        file.close()
+
+    try:
+        if os.path.exists(cachepath): # os.rename does not overwrite on Windows
+            os.remove(cachepath)
+        os.rename(temppath, cachepath)
+    except OSError:
+        os.remove(temppath)
+        raise
+
+def _readCache(cachepath, source):
+    """
+    Read the binary sidecar of a ctf.
+    The columns are memory-mapped, i.e. they are only read from the disk when
+    they are accessed.
+    Return ``None`` if the sidecar does not exist, is invalid or if it
+    was not created from the same ctf file (*source*).
+    
+    :arg source: key of the ctf file (see :func:`_getSourceStat`)
+    
+    :return: attributes parsed from the header and dictionary of column arrays
+    :rtype: tuple
+    """
+    try:
+        file = open(cachepath, 'rb')
+    except IOError:
+        return None
+
+    try:
+        if file.read(len(CACHE_MAGIC)) != CACHE_MAGIC:
+            return None
+
+        length, = struct.unpack('>Q', file.read(8))
+        info = _decodeJson(json.loads(file.read(length)))
+        offset = file.tell()
+
+        if tuple(info['source']) != source:
+            return None
+
+        header = info['header']
+        header['_phases'] = dict((phase['id'], phase) for phase in header['_phases'])
+        count = int(info['count'])
+    except Exception:
+        return None
+    finally:
+        file.close()
+
+    columns = {}
+    for key in COLUMNS:
+        offset = _align(offset)
+
+        if count > 0:
+            columns[key] = np.memmap(cachepath, DTYPES[key], 'r', offset, (count,))
+        else:
+            columns[key] = np.empty(0, DTYPES[key])
+
+        offset += count * np.dtype(DTYPES[key]).itemsize
+
+    if os.path.getsize(cachepath) < offset:
+        return None
+
+    return header, columns
 
 class ctf:
-    def __init__(self, filepath):
+    def __init__(self, filepath, lazy=False, cache=False):
         """
         Class is used to extract data from a HKL Channel 5 ctf file
         
+        With *lazy*, only the header is read when the file is opened.
+        The data lines are parsed on the first access to the pixels' data.
+        
+        With *cache*, the parsed header and columns are saved in a binary
+        sidecar next to the ctf (see :func:`getCachePath`).
+        The following loads of the same ctf read the sidecar instead of
+        parsing the text, as long as the path, size and modification time of
+        the ctf did not change.
+        
         :arg filepath: location of the ctf file
         :type filepath: str
+        
+        :arg lazy: whether to delay the parsing of the data (``default=False``)
+        :type lazy: bool
+        
+        :arg cache: whether to use a binary sidecar (``default=False``)
+        :type cache: bool
         """
 
         self.filepath = filepath
+        self._cache = cache
+
+        if cache:
+            self._source = _getSourceStat(filepath)
+            cached = _readCache(getCachePath(filepath), self._source)
+
+            if cached is not None:
+                header, self._columns = cached
+                self.__dict__.update(header)
+                return
+
+        #Parse the header and store every data column in a numpy array
+        file = open(filepath, 'r')
+        try:
+            self._parseHeader(_readHeaderLines(file))
+            self._dataOffset = file.tell()
+
+            if lazy:
+                self._columns = None
+            else:
+                self._columns = self._readColumns(file)
+                self._saveCache()
+        finally:
+            file.close()
+
+    def isDataLoaded(self):
+        """
+        Return whether the data lines were parsed.
+        
+        :rtype: bool
+        """
+        return self._columns is not None
+
+    def _getColumns(self):
+        """
+        Return the columns' arrays, parsing the data lines if they were not
+        already read.
+        
+        :rtype: dict
+        """
+        if self._columns is None:
+            file = open(self.filepath, 'r')
+            try:
+                file.seek(self._dataOffset)
+                self._columns = self._readColumns(file)
+            finally:
+                file.close()
+
+            self._saveCache()
+
+        return self._columns
+
+    def _saveCache(self):
+        """
+        Write the binary sidecar, if the cache is enabled.
+        A sidecar which cannot be written (e.g. read-only folder) is skipped.
+        """
+        if not self._cache:
+            return
+
+        header = dict((name, value) for name, value in self.__dict__.iteritems()
+                      if name not in ('filepath', '_cache', '_source', '_columns'))
+
+        try:
+            _writeCache(getCachePath(self.filepath), self._source, header, self._columns)
+        except (IOError, OSError), error:
+            logging.warning("Cannot write the cache of %s: %s" % (self.filepath, error))
+
+    def _readColumns(self, file):
+        """
+        Parse the data lines of *file* into one typed array per column.
+        
+        :rtype: dict
+        """
+        size = self._xcells * self._ycells
+        columns = dict((key, np.empty(size, DTYPES[key])) for key in COLUMNS)
+        count = 0
 
-        #Store the CTF file in self.lines
-        readerCTF = csv.reader(open(filepath, 'r'), dialect='excel-tab')
-        lines = list(readerCTF)
+        for chunk in _iterColumns(file):
+            length = len(chunk['phase'])
 
-        self._parseHeader(lines)
-        self._data = lines[self._firstDataLine:]
-        del lines
+            #More lines than XCells * YCells
+            if count + length > len(columns['phase']):
+                for key in COLUMNS:
+                    columns[key] = np.resize(columns[key], count + length)
+
+            for key in COLUMNS:
+                columns[key][count:count + length] = chunk[key]
+
+            count += length
+
+        #Less lines than XCells * YCells (e.g. job cancelled)
+        for key in COLUMNS:
+            columns[key] = columns[key][:count]
+
+        return columns
 
     def _parseHeader(self, lines):
         """
@@ -450,7 +1008,7 @@ class ctf:
         
         :rtype: int
         """
-        return len(self._data)
+        return len(self._getColumns()['phase'])
 
     def getPixelIndex(self, coord):
         """
@@ -576,8 +1134,8 @@ class ctf:
         :rtype: dict
         """
         lineNo = coord[0] + coord[1] * self.getXCells()
-        if lineNo < len(self._data):
-            return self._resultsLinetoDict(self._data[lineNo])
+        if lineNo < self.getNumberPixels():
+            return self._resultsLinetoDict(lineNo)
         else:
             return {}
 
@@ -592,54 +1150,92 @@ class ctf:
         
         :rtype: dict
         """
-        if index - 1 < len(self._data):
-            return self._resultsLinetoDict(self._data[index - 1])
+        if index - 1 < self.getNumberPixels():
+            return self._resultsLinetoDict(index - 1)
         else:
             return {}
 
-    def _resultsLinetoDict(self, line):
+    def _resultsLinetoDict(self, lineNo):
         """
         Build a dictionary from the information of a given line.
         All the keys are in lowercase.
         The value are converted to the right type.
+        The float values are rounded to the :const:`DECIMALS` written in the ctf.
         
-        :arg line: list of values
+        :arg lineNo: line number in the data (the first line is 0)
         
         :rtype: dict
         """
 
         errorCodes = self._getErrorCodesDict()
+        columns = self._getColumns()
 
         results = {}
 
-        results.setdefault('phase', int(line[0]))
-        results.setdefault('x', float(line[1]))
-        results.setdefault('y', float(line[2]))
-        results.setdefault('bands', int(line[3]))
-        results.setdefault('errorcode', int(line[4]))
-        results.setdefault('error', errorCodes[int(line[4])])
-        results.setdefault('euler1', float(line[5]))
-        results.setdefault('euler2', float(line[6]))
-        results.setdefault('euler3', float(line[7]))
-        results.setdefault('mad', float(line[8]))
-        results.setdefault('bc', int(line[9]))
-        results.setdefault('bs', int(line[10]))
+        for key in COLUMNS:
+            value = columns[key][lineNo]
+            if DTYPES[key] == np.float32:
+                results.setdefault(key, round(float(value), DECIMALS))
+            else:
+                results.setdefault(key, int(value))
+
+        results.setdefault('error', errorCodes[results['errorcode']])
 
         return results
 
-    def getPixelArray(self, key='euler1', noneValue=None, **conditions):
+    def getColumn(self, key='euler1'):
+        """
+        Return the array of a given column header *key*.
+        The array is not a copy and is typed according to :const:`DTYPES`.
+        The key ``error`` returns the explanation of the *errorcode* of every pixel.
+        
+        :arg key: name of the column. Refer to :func:`getPixelResults_coordinate <ctf.getPixelResults_coordinate>` for list of keys.
+        :type key: str
+        
+        :rtype: :class:`numpy.ndarray`
+        """
+        return _getColumn(self._getColumns(), key)
+
+    def getQuaternions(self, acquisition=False):
+        """
+        Return the orientation of every pixel as quaternions, in the order of
+        the pixels in the file.
+        The euler angles are converted in one pass (see :func:`eulersToQuaternions`).
+        
+        :arg acquisition: whether to compose the acquisition rotation
+          (see :func:`getAcquisitionEulers <ctf.getAcquisitionEulers>`) with the
+          orientation of every pixel (``default=False``)
+        :type acquisition: bool
+        
+        :rtype: :class:`quaternionarrays.QuaternionArray`
+        """
+        columns = self._getColumns()
+
+        if acquisition:
+            acquisitionEulers = self.getAcquisitionEulers()
+        else:
+            acquisitionEulers = None
+
+        return eulersToQuaternions(columns['euler1'], columns['euler2'], columns['euler3'],
+                                   acquisitionEulers)
+
+    def getPixelArray(self, key='euler1', noneValue=None, *expressions, **conditions):
         """
-        Return the filtered list for a given column header *key* and a set of conditions.
+        Return the filtered map for a given column header *key* and a set of conditions.
         The pixels that don't respect the condition(s) have a value of *noneValue*.
+        If *noneValue* is ``None``, these pixels are masked.
         
         **Parameters:**
-          *key*: name of the columns. Refer to :func:`getPixelResults() <HKLChannel5Tools.Tango.ctfFile.ctf.getPixelResults>` for list of keys.
+          *key*: name of the columns. Refer to :func:`getPixelResults_coordinate <ctf.getPixelResults_coordinate>` for list of keys.
         
           The conditions are given as a *tuple* where
-            * the first element is the operator (``'=', '>', '>=', '<', '<=', '!='``)
-            * the second element is the value
+            * the first element is the operator (``'=', '>', '>=', '<', '<=', '!=', 'in', 'between'``)
+            * the second element is the value, a sequence of values for ``'in'``
+              or the inclusive bounds ``(low, high)`` for ``'between'``
         
-        .. note:: The greater than and less than only works with float and decimal.
+          All the conditions must be respected.
+          Other combinations can be given as *expressions*.
+          Refer to :func:`getPixelMask <ctf.getPixelMask>`.
         
         **Examples:**::
         
@@ -647,59 +1243,76 @@ class ctf:
           # and that have a band contrast higher than 50
           pixArray = ctf.getPixelArray(key='bc', phase=('=', 2), bc=('>', 50)))
         
-        :rtype: list
+          # Return a array of band contrast for pixels of the first or second
+          # phase or that have a band contrast between 50 and 100
+          pixArray = ctf.getPixelArray('bc', 0, ('or', {'phase': ('in', (1, 2))},
+                                                      {'bc': ('between', (50, 100))}))
+        
+        :rtype: :class:`numpy.ndarray` or :class:`numpy.ma.MaskedArray` of shape (YCells, XCells)
+        """
+        mask = getMask(self._getColumns(), *expressions, **conditions)
+        column = self.getColumn(key)
+
+        if noneValue is None:
+            array = np.ma.masked_array(column, mask=~mask)
+        else:
+            array = np.where(mask, column, noneValue)
+
+        return self._reshapeToMap(array, noneValue)
+
+    def getPixelMask(self, *expressions, **conditions):
         """
-        pixArray = []
-
-        for line in self._data:
-            lineDict = self._resultsLinetoDict(line)
-            valid = True
-
-            for condition in conditions:
-                value = conditions[condition][1]
-                operator = conditions[condition][0]
-
-                if operator == '=':
-                    statement = lineDict[condition] == value
-                elif operator == '>':
-                    statement = lineDict[condition] > value
-                elif operator == '>=':
-                    statement = lineDict[condition] >= value
-                elif operator == '<':
-                    statement = lineDict[condition] < value
-                elif operator == '<=':
-                    statement = lineDict[condition] <= value
-                elif operator == '!=':
-                    statement = lineDict[condition] != value
-
-                if statement:
-                    valid = True
-                else:
-                    valid = False
-                    break
-
-            if valid:
-                pixArray.append(lineDict[key])
+        Return a boolean map where the pixels respecting the conditions are
+        ``True``.
+        The conditions are given as in :func:`getPixelArray <ctf.getPixelArray>`.
+        
+        An expression is either
+          * a *dict* of conditions (all the conditions must be respected)
+          * a *tuple* where the first element is ``'and'`` or ``'or'`` and the
+            next elements are expressions
+        
+        **Examples:**::
+        
+          # Pixels of the second phase with a band contrast higher than 50 or
+          # pixels with a MAD lower than 0.5
+          mask = ctf.getPixelMask(('or', {'phase': ('=', 2), 'bc': ('>', 50)},
+                                         {'mad': ('<', 0.5)}))
+        
+        :rtype: :class:`numpy.ndarray` of shape (YCells, XCells)
+        """
+        mask = getMask(self._getColumns(), *expressions, **conditions)
+
+        return self._reshapeToMap(mask, False)
+
+    def _reshapeToMap(self, array, fillValue):
+        """
+        Reshape a pixel *array* into a map of shape (YCells, XCells).
+        The missing pixels (e.g. job cancelled) are filled with *fillValue* or
+        masked if *fillValue* is ``None``.
+        The extra pixels (more lines than XCells * YCells) are dropped.
+        
+        :rtype: :class:`numpy.ndarray` or :class:`numpy.ma.MaskedArray`
+        """
+        size = self.getSize()
+        array = array[:size]
+
+        if len(array) != size:
+            if fillValue is None:
+                newArray = np.ma.masked_all(size, dtype=array.dtype)
             else:
-                pixArray.append(noneValue)
+                newArray = np.empty(size, dtype=array.dtype)
+                newArray.fill(fillValue)
+            newArray[:len(array)] = array
+            array = newArray
 
-        return pixArray
+        return array.reshape(self.getYCells(), self.getXCells())
 
     getPixArray = getPixelArray
 
     def _getErrorCodesDict(self):
-        errorCodes = {}
-        errorCodes.setdefault(0, 'Success')
-        errorCodes.setdefault(1, 'Low band contrast')
-        errorCodes.setdefault(2, 'Low band slope')
-        errorCodes.setdefault(3, 'No solution')
-        errorCodes.setdefault(4, 'High MAD')
-        errorCodes.setdefault(5, 'Not yet analysed (job cancelled before point!)')
-        errorCodes.setdefault(6, 'Unexpected error (excepts etc.)')
-
-        return errorCodes
+        return dict(ERROR_CODES)
 
 
 if __name__ == '__main__': #pragma: no cover
     ctf = ctf('test_ctfFile.ctf')
-    print len(ctf.getPixelArray(key='bc', phase=('=', 2), bc=('>', 50)))
+    print ctf.getPixelArray(key='bc', phase=('=', 2), bc=('>', 50)).count()
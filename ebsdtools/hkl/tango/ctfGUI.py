@@ -153,7 +153,7 @@ class App:
                                , labelpos=Tkinter.W
                                , label_text='Map Type:'
                                , menubutton_textvariable=self.mapTypeValue
-                               , items=('All Euler', 'Band Contrast', 'Phase')
+                               , items=('All Euler', 'Band Contrast', 'Phase', 'Boundaries')
                                , initialitem='All Euler')
         comboType.pack(side='left', fill='x', expand='yes', anchor='w')
 
@@ -208,7 +208,7 @@ class App:
         if file != None:
             self.filepath.set(os.path.split(file)[1])
             self.currentLoadDirectory = os.path.split(file)[0]
-            self.ctf = ctfFile.ctf(file)
+            self.ctf = ctfFile.ctf(file, cache=True)
             self.varPatternRoot.set(self.ctf.getProjectImagesFolderPath())
 
             self.pattImage = Image.new('RGB', self.pattSize)
@@ -257,6 +257,8 @@ class App:
                 rgb = self.mapType.bandContrast()
             elif self.mapTypeValue.get() == 'Phase':
                 rgb = self.mapType.phase()
+            elif self.mapTypeValue.get() == 'Boundaries':
+                rgb = self.mapType.boundaries()
 
             self.map.drawMap(rgb, (self.ctf.getWidth(), self.ctf.getHeight()))
 
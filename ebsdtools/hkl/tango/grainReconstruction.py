@@ -0,0 +1,259 @@
+#!/usr/bin/env python
+"""
+================================================================================
+:mod:`grainReconstruction` -- Reconstruction of the grains of a CTF map
+================================================================================
+
+.. module:: grainReconstruction
+   :synopsis: Reconstruction of the grains of a CTF map
+
+.. inheritance-diagram:: ebsdtools.hkl.tango.grainReconstruction
+
+"""
+
+# Script information for the file.
+__author__ = "Philippe T. Pinard"
+__email__ = "philippe.pinard@gmail.com"
+__version__ = "0.1"
+__copyright__ = "Copyright (c) 2010 Philippe T. Pinard"
+__license__ = "GPL v3"
+
+# Standard library modules.
+
+# Third party modules.
+import numpy as np
+
+# Local modules.
+import mathtools.rotation.quaternionarrays as quaternionarrays
+import ebsdtools.crystallography.symmetry as symmetry
+import ebsdtools.hkl.tango.boundaryMap as boundaryMap
+from ebsdtools.hkl.tango.grainDetectionFile import grainDetectionResults
+
+# Globals and constants variables.
+THRESHOLD = 10.0 # Default minimum disorientation between two grains [units=deg]
+
+def _compress(parents):
+    """
+    Make every element of *parents* point directly to its root
+    (pointer jumping).
+    """
+    while True:
+        grandparents = parents[parents]
+        if np.all(grandparents == parents):
+            return parents
+        parents = grandparents
+
+def _findRoots(size, nodes1, nodes2):
+    """
+    Return the root of the connected component of every node of a graph of
+    *size* nodes and of edges (*nodes1*, *nodes2*).
+    The root of a component is its smallest node.
+    
+    The union-find is done on all the edges at once: at every pass, the
+    larger root of each edge is hooked to its smaller root, then the paths
+    are compressed.
+    Since a node always points to a smaller node, no cycle can be formed.
+    Only the edges joining two different components are kept for the next
+    pass, so the work decreases quickly after the first pass.
+    
+    :rtype: :class:`numpy.ndarray` of shape (size,)
+    """
+    parents = np.arange(size)
+
+    while len(nodes1) > 0:
+        roots1 = parents[nodes1]
+        roots2 = parents[nodes2]
+
+        different = roots1 != roots2
+        roots1 = roots1[different]
+        roots2 = roots2[different]
+        nodes1 = nodes1[different]
+        nodes2 = nodes2[different]
+
+        # A root hooked to several smaller roots keeps only one of them; the
+        # other edges are joined at the next pass
+        parents[np.maximum(roots1, roots2)] = np.minimum(roots1, roots2)
+
+        parents = _compress(parents)
+
+    return parents
+
+def labelGrains(right, lower, valid, threshold=THRESHOLD):
+    """
+    Return the label image of the grains: the neighbour pixels with a
+    disorientation smaller than the *threshold* belong to the same grain.
+    The grains are numbered from 1 in the order of their first pixel
+    (rows first); the pixels which are not *valid* have a label of 0.
+    
+    :arg right, lower: disorientations (in degrees) as given by
+      :func:`boundaryMap.getNeighbourDisorientations <ebsdtools.hkl.tango.boundaryMap.getNeighbourDisorientations>`
+    
+    :arg valid: boolean map of the indexed pixels
+    :type valid: :class:`numpy.ndarray` of shape (YCells, XCells)
+    
+    :arg threshold: minimum disorientation between two grains [units=deg] (``default=THRESHOLD``)
+    :type threshold: float
+    
+    :rtype: :class:`numpy.ndarray` of shape (YCells, XCells)
+    """
+    height, width = valid.shape
+    indexes = np.arange(height * width).reshape(height, width)
+
+    rightEdges = np.ma.filled(right < threshold, False)
+    lowerEdges = np.ma.filled(lower < threshold, False)
+
+    nodes1 = np.concatenate([indexes[:, :-1][rightEdges], indexes[:-1][lowerEdges]])
+    nodes2 = np.concatenate([indexes[:, 1:][rightEdges], indexes[1:][lowerEdges]])
+
+    roots = _findRoots(height * width, nodes1, nodes2)
+
+    # Number the grains
+    isRoot = (roots == np.arange(height * width)) & valid.ravel()
+    numbers = np.zeros(height * width, dtype=np.int32)
+    numbers[isRoot] = np.arange(1, isRoot.sum() + 1)
+
+    labels = numbers[roots]
+    labels[~valid.ravel()] = 0
+
+    return labels.reshape(height, width)
+
+class grainReconstructionResults(grainDetectionResults):
+    def __init__(self, ctf, threshold=THRESHOLD, acquisition=False):
+        """
+        Reconstruct the grains of a ctf map.
+        The neighbour pixels of the same phase with a disorientation smaller
+        than the *threshold* are merged in the same grain.
+        The results are the same as the ones of the grain detection of HKL
+        Tango (see :meth:`getResults <grainDetectionResults.getResults>`):
+        
+          * *area* is the number of pixels times the step size
+          * *diameter* is the diameter of the circle of the same area
+          * *centroid*, *aspect ratio* and *slope* are found from the
+            ellipse with the same second moments as the grain. The *slope*
+            is the angle (in degrees) of the major axis with the x axis,
+            ``None`` for grains of one pixel
+          * *mean misorientation angle* is the average disorientation
+            (in degrees) between the pixels and the mean orientation of the
+            grain
+          * *mean misorientation euler1*, *euler2* and *euler3* are the
+            euler angles (in degrees) of the mean orientation of the grain
+        
+        :arg ctf: a ctf class containing the data
+        :type ctf: :class:`ctf <ebsdtools.hkl.tango.ctfFile.ctf>`
+        
+        :arg threshold: minimum disorientation between two grains [units=deg] (``default=THRESHOLD``)
+        :type threshold: float
+        
+        :arg acquisition: whether to compose the acquisition rotation
+          with the orientation of every pixel (``default=False``)
+        :type acquisition: bool
+        """
+        right, lower = boundaryMap.getNeighbourDisorientations(ctf, acquisition)
+
+        phase = ctf.getPixelArray('phase', 0)
+        valid = boundaryMap.getIndexedMask(ctf)
+
+        self._labels = labelGrains(right, lower, valid, threshold)
+
+        labels = self._labels.ravel()
+        selection = labels > 0
+        labels = labels[selection] - 1
+        count = labels.max() + 1 if len(labels) > 0 else 0
+
+        # Phase of the grains, from their first pixel
+        firsts = np.zeros(count, dtype=int)
+        firsts[labels[::-1]] = np.arange(len(labels))[::-1]
+        grainPhases = phase.ravel()[selection][firsts]
+
+        # Shape
+        areas = np.bincount(labels, minlength=count).astype(float)
+        pixelArea = ctf.getXStep() * ctf.getYStep()
+
+        x = ctf.getPixelArray('x', 0).ravel()[selection].astype(float)
+        y = ctf.getPixelArray('y', 0).ravel()[selection].astype(float)
+        centroidsX = np.bincount(labels, x, count) / areas
+        centroidsY = np.bincount(labels, y, count) / areas
+
+        dx = x - centroidsX[labels]
+        dy = y - centroidsY[labels]
+        varianceX = np.bincount(labels, dx * dx, count) / areas + ctf.getXStep() ** 2 / 12.0
+        varianceY = np.bincount(labels, dy * dy, count) / areas + ctf.getYStep() ** 2 / 12.0
+        covariance = np.bincount(labels, dx * dy, count) / areas
+
+        # Eigenvalues of the covariance matrix
+        halfTrace = (varianceX + varianceY) / 2.0
+        root = np.sqrt(((varianceX - varianceY) / 2.0) ** 2 + covariance ** 2)
+        aspectRatios = np.sqrt((halfTrace + root) / (halfTrace - root))
+        slopes = np.degrees(0.5 * np.arctan2(2.0 * covariance, varianceX - varianceY))
+
+        # Mean orientations
+        qs = boundaryMap.getQuaternionMap(ctf, acquisition).reshape(-1, 4)[selection]
+        laueGroups = boundaryMap.getLaueGroups(ctf)
+        pixelPhases = grainPhases[labels]
+
+        meanOrientations = np.zeros((count, 4))
+        for id, laueGroup in laueGroups.iteritems():
+            pixels = pixelPhases == id
+            if not pixels.any():
+                continue
+
+            references = qs[firsts][labels[pixels]]
+            equivalents = symmetry.getNearestEquivalents(qs[pixels], references, laueGroup)
+
+            for i in range(4):
+                meanOrientations[:, i] += np.bincount(labels[pixels], equivalents[:, i], count)
+
+        meanOrientations = quaternionarrays.QuaternionArray(meanOrientations).normalize()
+        eulers = np.degrees(meanOrientations.to_eulerangles())
+
+        misorientations = np.zeros(len(labels))
+        for id, laueGroup in laueGroups.iteritems():
+            pixels = pixelPhases == id
+            if not pixels.any():
+                continue
+
+            angles = symmetry.disorientationAngle(qs[pixels],
+                                                  meanOrientations.array[labels[pixels]],
+                                                  laueGroup)
+            misorientations[pixels] = np.degrees(angles)
+
+        meanMisorientations = np.bincount(labels, misorientations, count) / areas
+
+        # Results
+        phaseNames = dict((id, ctf.getPhaseName(id)) for id in laueGroups)
+
+        self._results = []
+        self._phases = []
+
+        for i in range(count):
+            phaseName = phaseNames[grainPhases[i]]
+            if not phaseName in self._phases:
+                self._phases.append(phaseName)
+
+            if areas[i] > 1:
+                slope = float(slopes[i])
+            else:
+                slope = None
+
+            lineDict = {'id': i + 1,
+                        'phase': phaseName,
+                        'area': float(areas[i] * pixelArea),
+                        'diameter': float(2.0 * np.sqrt(areas[i] * pixelArea / np.pi)),
+                        'centroid': (float(centroidsX[i]), float(centroidsY[i])),
+                        'aspect ratio': float(aspectRatios[i]),
+                        'slope': slope,
+                        'mean misorientation angle': float(meanMisorientations[i]),
+                        'mean misorientation euler1': float(eulers[i, 0]),
+                        'mean misorientation euler2': float(eulers[i, 1]),
+                        'mean misorientation euler3': float(eulers[i, 2])}
+
+            self._results.append(lineDict)
+
+    def getLabels(self):
+        """
+        Return the label image of the grains: the pixels of a grain have the
+        *id* of the grain; the pixels which are not indexed have a label of 0.
+        
+        :rtype: :class:`numpy.ndarray` of shape (YCells, XCells)
+        """
+        return self._labels
@@ -24,9 +24,11 @@ import Tkinter
 
 # Third party modules.
 from PIL import Image, ImageTk
+import numpy as np
 
 # Local modules.
 import ebsdtools.hkl.tango.colors as colors
+import ebsdtools.hkl.tango.boundaryMap as boundaryMap
 
 # Globals and constants variables.
 
@@ -50,23 +52,17 @@ class mapTypes:
         Normalize the value in an array to fit between 0 and the *normalized*
         
         :arg array: array to be normalized
-        :type array: list
+        :type array: :class:`numpy.ndarray`
         
         :arg normalize: maximum value of the normalize array (``default=255``)
         :type normalize: int
         """
-        maxValue = float(max(array))
+        maxValue = float(array.max())
 
-        newArray = []
-        for value in array:
-            try:
-                newValue = int(float(value) / maxValue * normalizer)
-            except:
-                newValue = 0
+        if maxValue <= 0:
+            return np.zeros(array.shape, dtype=np.uint8)
 
-            newArray.append(newValue)
-
-        return newArray
+        return (array / maxValue * normalizer).astype(np.uint8)
 
     def allEuler(self):
         """
@@ -100,14 +96,39 @@ class mapTypes:
         colorList = colors.colorsList(self.colorListPath)
         for iPhase in range(len(self.ctf.getPhasesList())):
             phaseColors.append(colorList.getColorRGB(iPhase))
+        phaseColors = np.array(phaseColors, dtype=np.uint8)
 
         data = self.ctf.getPixelArray(key='phase', noneValue=0)
-        r = []; g = []; b = []
+        rgb = phaseColors[data]
+
+        return (rgb[..., 0], rgb[..., 1], rgb[..., 2])
+
+    def boundaries(self, lowAngle=2.0, highAngle=15.0):
+        """
+        Return a band contrast map with the low angle boundaries (between
+        *lowAngle* and *highAngle*) in red and the high angle boundaries
+        (above *highAngle*) in black.
+        
+        :arg lowAngle: minimum disorientation of a low angle boundary [units=deg] (``default=2.0``)
+        :type lowAngle: float
+        
+        :arg highAngle: minimum disorientation of a high angle boundary [units=deg] (``default=15.0``)
+        :type highAngle: float
+        
+        :rtype: tuple
+        """
+        r, g, b = [channel.copy() for channel in self.bandContrast()]
 
-        for item in data:
-            r.append(phaseColors[item][0])
-            g.append(phaseColors[item][1])
-            b.append(phaseColors[item][2])
+        right, lower = boundaryMap.getNeighbourDisorientations(self.ctf)
+        lowAngleMask = boundaryMap.getBoundaryMask(right, lower, lowAngle)
+        highAngleMask = boundaryMap.getBoundaryMask(right, lower, highAngle)
+
+        r[lowAngleMask] = 255
+        g[lowAngleMask] = 0
+        b[lowAngleMask] = 0
+
+        for channel in (r, g, b):
+            channel[highAngleMask] = 0
 
         return (r, g, b)
 
@@ -168,26 +189,19 @@ class map(Tkinter.Frame):
         Draw a map based on the rgb tuple given to form a new image
         
         :arg rgb: rgb = ([r], [g], [b])
-        :type rgb: type
+        :type rgb: tuple of :class:`numpy.ndarray`
         
         :arg size: size of the image (width, height)
         :type size: tuple
         """
         self.imageSize = size
 
-        # Assert the rgb data is conformed
-        assert len(rgb[0]) == len(rgb[1])
-        assert len(rgb[1]) == len(rgb[2])
-
         # Build pixel array
-        data = []
-        for i in range(len(rgb[0])):
-            item = (rgb[0][i], rgb[1][i], rgb[2][i])
-            data.append(item)
+        shape = (self.imageSize[1], self.imageSize[0])
+        data = [np.asarray(channel, dtype=np.uint8).reshape(shape) for channel in rgb]
 
         # Create new map
-        newMap = Image.new('RGB', self.imageSize)
-        newMap.putdata(data)
+        newMap = Image.fromarray(np.dstack(data), 'RGB')
 
         self.updateImage(newMap)
 
@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+""" """
+
+# Script information for the file.
+__author__ = "Philippe T. Pinard"
+__email__ = "philippe.pinard@gmail.com"
+__version__ = "0.1"
+__copyright__ = "Copyright (c) 2010 Philippe T. Pinard"
+__license__ = "GPL v3"
+
+# Standard library modules.
+import os
+import shutil
+import tempfile
+import unittest
+import logging
+
+# Third party modules.
+import numpy as np
+
+# Local modules.
+import DrixUtilities.Files as Files
+
+import ebsdtools.hkl.tango.ctfFile as ctfFile
+import ebsdtools.hkl.tango.boundaryMap as boundaryMap
+import ebsdtools.crystallography.symmetry as symmetry
+
+class TestBoundaryMap(unittest.TestCase):
+
+    def setUp(self):
+        unittest.TestCase.setUp(self)
+
+        relativePath = os.path.join('testdata', 'test_ctfFile.ctf')
+        filepath = Files.getCurrentModulePath(__file__, relativePath)
+
+        self.ctf = ctfFile.ctf(filepath)
+        self.right, self.lower = boundaryMap.getNeighbourDisorientations(self.ctf)
+
+    def tearDown(self):
+        del self.ctf #Require in jython not to overload the memory
+        unittest.TestCase.tearDown(self)
+
+    def testSkeleton(self):
+        #self.fail("Test if the testcase is working.")
+        self.assert_(True)
+
+    def testGetLaueGroups(self):
+        laueGroups = boundaryMap.getLaueGroups(self.ctf)
+        self.assertEquals(laueGroups, {1: 'm-3m', 2: 'm-3m', 3: 'm-3m', 4: '4/mmm', 5: 'm-3m'})
+
+    def testGetNeighbourDisorientations(self):
+        self.assertEquals(self.right.shape, (84, 102))
+        self.assertEquals(self.lower.shape, (83, 103))
+        self.assertEquals(self.right.dtype, np.float32)
+
+        # Masked pairs
+        phase = self.ctf.getPixelArray('phase', 0)
+        errorcode = self.ctf.getPixelArray('errorcode', 0)
+        valid = (phase != 0) & (errorcode == 0)
+
+        expected = valid[:, :-1] & valid[:, 1:] & (phase[:, :-1] == phase[:, 1:])
+        self.assertTrue(np.all(~self.right.mask == expected))
+
+        expected = valid[:-1] & valid[1:] & (phase[:-1] == phase[1:])
+        self.assertTrue(np.all(~self.lower.mask == expected))
+
+        self.assertTrue(self.right.min() >= 0.0)
+        self.assertTrue(self.right.max() <= 62.8)
+
+    def testGetNeighbourDisorientationsValues(self):
+        qs = self.ctf.getQuaternions().array.reshape(84, 103, 4)
+
+        y, x = np.nonzero(~self.right.mask)
+        angles, _axes = symmetry.disorientation(qs[y, x], qs[y, x + 1], 'm-3m')
+        self.assertTrue(np.allclose(self.right[y, x], np.degrees(angles), atol=1e-4))
+
+        y, x = np.nonzero(~self.lower.mask)
+        angles, _axes = symmetry.disorientation(qs[y, x], qs[y + 1, x], 'm-3m')
+        self.assertTrue(np.allclose(self.lower[y, x], np.degrees(angles), atol=1e-4))
+
+    def testExtraLines(self):
+        tmpdir = tempfile.mkdtemp()
+        try:
+            filepath = os.path.join(tmpdir, 'test.ctf')
+            shutil.copy(self.ctf.filepath, filepath)
+            file = open(filepath, 'ab')
+            file.write('1\t0.000\t0.000\t7\t0\t10.0000\t20.0000\t30.0000\t0.5000\t100\t120\r\n')
+            file.close()
+
+            ctf = ctfFile.ctf(filepath)
+            qs = boundaryMap.getQuaternionMap(ctf)
+            self.assertEquals(qs.shape, (84, 103, 4))
+            self.assertTrue(np.all(qs == boundaryMap.getQuaternionMap(self.ctf)))
+
+            right, lower = boundaryMap.getNeighbourDisorientations(ctf)
+            self.assertTrue(np.all(right == self.right))
+            self.assertTrue(np.all(lower == self.lower))
+        finally:
+            shutil.rmtree(tmpdir)
+
+    def testGetBoundaryMask(self):
+        lowAngle = boundaryMap.getBoundaryMask(self.right, self.lower, 2.0)
+        highAngle = boundaryMap.getBoundaryMask(self.right, self.lower, 15.0)
+
+        self.assertEquals(lowAngle.shape, (84, 103))
+        self.assertEquals(lowAngle.sum(), 460)
+        self.assertEquals(highAngle.sum(), 195)
+        self.assertFalse(np.any(highAngle & ~lowAngle))
+
+        right = self.right.filled(0.0) >= 15.0
+        lower = self.lower.filled(0.0) >= 15.0
+        self.assertTrue(np.all(highAngle[:, :-1][right]))
+        self.assertTrue(np.all(highAngle[:-1, :][lower]))
+
+if __name__ == '__main__': #pragma: no cover
+    logging.getLogger().setLevel(logging.DEBUG)
+    unittest.main()
@@ -10,13 +10,17 @@ __license__ = "GPL v3"
 
 # Standard library modules.
 import os
+import shutil
+import tempfile
 import unittest
 import logging
 
 # Third party modules.
+import numpy as np
 
 # Local modules.
 import DrixUtilities.Files as Files
+import mathtools.rotation.quaternionarrays as quaternionarrays
 
 import ebsdtools.hkl.tango.ctfFile as ctfFile
 
@@ -39,7 +43,9 @@ class TestCtfFile(unittest.TestCase):
         self.assert_(True)
 
     def test__init__(self):
-        self.assertEquals(len(self.ctf._data), 8652)
+        for key in ctfFile.COLUMNS:
+            self.assertEquals(len(self.ctf._columns[key]), 8652)
+            self.assertEquals(self.ctf._columns[key].dtype, ctfFile.DTYPES[key])
 
     def test_parseHeader(self):
         self.assertEquals(self.ctf._firstPhaseLine, 13)
@@ -222,14 +228,199 @@ class TestCtfFile(unittest.TestCase):
         index = 1
         self.assertEquals(self.ctf.getPixelResults_index(index), {'euler3': 26.411999999999999, 'euler2': 6.2182000000000004, 'euler1': 15.380000000000001, 'bc': 59, 'bands': 6, 'bs': 62, 'y': 0.0, 'mad': 0.82709999999999995, 'errorcode': 0, 'error': 'Success', 'phase': 2, 'x': 0.0})
 
-        index = len(self.ctf._data) + 1
+        index = self.ctf.getNumberPixels() + 1
         self.assertEquals(self.ctf.getPixelResults_index(index), {})
 
     def testResultsLinetoDict(self):
-        pass
+        self.assertEquals(self.ctf._resultsLinetoDict(1)['x'], 0.2)
+        self.assertEquals(self.ctf._resultsLinetoDict(1)['error'], 'Low band contrast')
+
+    def testGetColumn(self):
+        bc = self.ctf.getColumn('bc')
+        self.assertEquals(len(bc), 8652)
+        self.assertEquals(bc[0], 59)
+        self.assertAlmostEquals(self.ctf.getColumn('euler3')[0], 26.412, 4)
 
     def testGetPixelArray(self):
-        self.assertEquals(self.ctf.getPixelArray(key='euler3')[0], 26.412)
+        pixArray = self.ctf.getPixelArray(key='euler3')
+        self.assertEquals(pixArray.shape, (84, 103))
+        self.assertAlmostEquals(pixArray[0, 0], 26.412, 4)
+
+        pixArray = self.ctf.getPixelArray(key='bc', phase=('=', 2), bc=('>', 50))
+        self.assertEquals(pixArray[0, 0], 59)
+        self.assert_(pixArray.mask[0, 1])
+
+        pixArray = self.ctf.getPixelArray('bc', 0, phase=('=', 2), bc=('>', 50))
+        self.assertEquals(pixArray[0, 0], 59)
+        self.assertEquals(pixArray[0, 1], 0)
+
+    def testGetQuaternions(self):
+        qs = self.ctf.getQuaternions()
+        self.assertEquals(len(qs), 8652)
+
+        t1, t2, t3 = np.radians([self.ctf.getColumn(key)[0] for key in ('euler1', 'euler2', 'euler3')])
+        expected = [np.cos(t2 / 2.0) * np.cos((t1 + t3) / 2.0),
+                    np.sin(t2 / 2.0) * np.cos((t1 - t3) / 2.0),
+                    np.sin(t2 / 2.0) * np.sin((t1 - t3) / 2.0),
+                    np.cos(t2 / 2.0) * np.sin((t1 + t3) / 2.0)]
+        self.assertTrue(np.allclose(qs.array[0], expected))
+
+        # Acquisition eulers of the test file are (0, 0, 0)
+        self.assertTrue(np.allclose(self.ctf.getQuaternions(True).array, qs.array))
+
+    def testEulersToQuaternions(self):
+        euler1 = self.ctf.getColumn('euler1')
+        euler2 = self.ctf.getColumn('euler2')
+        euler3 = self.ctf.getColumn('euler3')
+        angles = np.radians(np.column_stack([euler1, euler2, euler3]).astype(float))
+
+        qs = ctfFile.eulersToQuaternions(euler1, euler2, euler3, chunkSize=1000)
+        expected = quaternionarrays.eulerangles_to_quaternionarray(angles)
+        self.assertTrue(np.allclose(qs.array, expected.array))
+
+        # Acquisition rotation
+        acquisitionEulers = (10, 20, 30)
+        qs = ctfFile.eulersToQuaternions(euler1, euler2, euler3, acquisitionEulers, 1000)
+
+        acquisition = quaternionarrays.eulerangles_to_quaternionarray(np.radians(acquisitionEulers))
+        ms = qs.to_so3matrices()
+        expected = np.dot(expected.to_so3matrices()[0], acquisition.to_so3matrices()[0])
+        self.assertTrue(np.allclose(ms[0], expected))
+
+    def testGetPixelArrayConditions(self):
+        pixArray = self.ctf.getPixelArray(key='x', x=('=', 0.2))
+        self.assertEquals(pixArray.count(), 84)
+
+        pixArray = self.ctf.getPixelArray(key='phase', phase=('in', (1, 2)))
+        self.assertEquals(pixArray.count(), (self.ctf.getColumn('phase') == 1).sum() + (self.ctf.getColumn('phase') == 2).sum())
+
+        pixArray = self.ctf.getPixelArray(key='bc', bc=('between', (59, 66)))
+        self.assertEquals(pixArray[0, 0], 59)
+        self.assertEquals(pixArray[0, 1], 66)
+        self.assert_(pixArray.mask[0, 2])
+
+        self.assertRaises(ValueError, self.ctf.getPixelArray, key='bc', bc=('~', 50))
+
+    def testGetPixelMask(self):
+        mask = self.ctf.getPixelMask(('or', {'phase': ('=', 2), 'bc': ('>', 60)}, {'errorcode': ('=', 1)}))
+        self.assertEquals(mask.shape, (84, 103))
+        self.assertFalse(mask[0, 0])
+        self.assert_(mask[0, 1])
+        self.assert_(mask[0, 2])
+
+        mask = self.ctf.getPixelMask(('and', {'phase': ('=', 2)}, {'errorcode': ('=', 0)}))
+        self.assertEquals(mask.sum(), (self.ctf.getColumn('phase') == 2).sum())
+
+    def testExtraLines(self):
+        tmpdir = tempfile.mkdtemp()
+        try:
+            filepath = os.path.join(tmpdir, 'test.ctf')
+            shutil.copy(self.ctf.filepath, filepath)
+            file = open(filepath, 'ab')
+            file.write('1\t0.000\t0.000\t7\t0\t10.0000\t20.0000\t30.0000\t0.5000\t100\t120\r\n')
+            file.close()
+
+            ctf = ctfFile.ctf(filepath)
+            self.assertEqual(ctf.getNumberPixels(), 8653)
+            self.assertEqual(ctf.getColumn('bc')[-1], 100)
+
+            pixArray = ctf.getPixelArray('bc', 0)
+            self.assertEquals(pixArray.shape, (84, 103))
+            self.assertTrue(np.all(pixArray == self.ctf.getPixelArray('bc', 0)))
+
+            mask = ctf.getPixelMask(phase=('=', 2))
+            self.assertEquals(mask.shape, (84, 103))
+        finally:
+            shutil.rmtree(tmpdir)
+
+    def testLazy(self):
+        ctf = ctfFile.ctf(self.ctf.filepath, lazy=True)
+        self.assertFalse(ctf.isDataLoaded())
+
+        self.assertEqual(ctf.getXCells(), 103)
+        self.assertEqual(ctf.getPhaseSpaceGroupNo(2), 229)
+        self.assertFalse(ctf.isDataLoaded())
+
+        self.assertEqual(ctf.getNumberPixels(), 8652)
+        self.assertTrue(ctf.isDataLoaded())
+        self.assertEquals(ctf.getPixelResults_index(1), self.ctf.getPixelResults_index(1))
+
+    def testCache(self):
+        tmpdir = tempfile.mkdtemp()
+        try:
+            filepath = os.path.join(tmpdir, 'test.ctf')
+            shutil.copy(self.ctf.filepath, filepath)
+            cachepath = ctfFile.getCachePath(filepath)
+
+            ctf = ctfFile.ctf(filepath, cache=True)
+            self.assertTrue(os.path.exists(cachepath))
+            del ctf
+
+            ctf = ctfFile.ctf(filepath, cache=True)
+            self.assertTrue(isinstance(ctf.getColumn('phase'), np.memmap))
+            self.assertEqual(ctf.getXCells(), 103)
+            self.assertEqual(ctf.getPhases(), self.ctf.getPhases())
+            self.assertTrue(isinstance(ctf.getPhaseName(1), str))
+            self.assertEquals(ctf.getPixelResults_index(1), self.ctf.getPixelResults_index(1))
+            for key in ctfFile.COLUMNS:
+                self.assertTrue(np.all(ctf.getColumn(key) == self.ctf.getColumn(key)))
+            del ctf
+
+            #Modified source
+            stat = os.stat(filepath)
+            os.utime(filepath, (stat.st_atime, stat.st_mtime + 10))
+
+            ctf = ctfFile.ctf(filepath, cache=True)
+            self.assertFalse(isinstance(ctf.getColumn('phase'), np.memmap))
+            self.assertEqual(ctf.getNumberPixels(), 8652)
+            del ctf
+
+            ctf = ctfFile.ctf(filepath, cache=True)
+            self.assertTrue(isinstance(ctf.getColumn('phase'), np.memmap))
+            del ctf
+
+            #Invalid header
+            data = open(cachepath, 'rb').read()
+            length = len(ctfFile.CACHE_MAGIC) + 8
+            open(cachepath, 'wb').write(data[:length] + 'x' + data[length + 1:])
+
+            ctf = ctfFile.ctf(filepath, cache=True)
+            self.assertFalse(isinstance(ctf.getColumn('phase'), np.memmap))
+            self.assertEqual(ctf.getXCells(), 103)
+            del ctf
+        finally:
+            shutil.rmtree(tmpdir)
+
+    def testIterChunks(self):
+        chunks = list(ctfFile.iterChunks(self.ctf.filepath, 1000))
+        self.assertEquals(len(chunks), 9)
+        self.assertEquals(len(chunks[0]['phase']), 1000)
+        self.assertEquals(len(chunks[-1]['phase']), 652)
+
+        for key in ctfFile.COLUMNS:
+            column = np.concatenate([chunk[key] for chunk in chunks])
+            self.assertTrue(np.all(column == self.ctf.getColumn(key)))
+            self.assertEquals(column.dtype, ctfFile.DTYPES[key])
+
+    def testGetMask(self):
+        chunk = ctfFile.iterChunks(self.ctf.filepath, 1000).next()
+        mask = ctfFile.getMask(chunk, phase=('=', 2))
+        self.assertEquals(mask.shape, (1000,))
+        self.assertTrue(np.all(mask == (chunk['phase'] == 2)))
+
+    def testReduceChunks(self):
+        def function(count, chunk):
+            return count + ctfFile.getMask(chunk, phase=('=', 2), bc=('>', 50)).sum()
+
+        count = ctfFile.reduceChunks(function, self.ctf.filepath, 0, 1000)
+        expected = self.ctf.getPixelMask(phase=('=', 2), bc=('>', 50)).sum()
+        self.assertEquals(count, expected)
+
+        def function(counts, chunk):
+            return counts + np.bincount(chunk['errorcode'], minlength=len(ctfFile.ERROR_CODES))
+
+        counts = ctfFile.reduceChunks(function, self.ctf.filepath, 0, 1000)
+        self.assertEquals(counts.sum(), 8652)
 
 if __name__ == '__main__': #pragma: no cover
     logging.getLogger().setLevel(logging.DEBUG)
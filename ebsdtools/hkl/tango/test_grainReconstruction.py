@@ -0,0 +1,166 @@
+#!/usr/bin/env python
+""" """
+
+# Script information for the file.
+__author__ = "Philippe T. Pinard"
+__email__ = "philippe.pinard@gmail.com"
+__version__ = "0.1"
+__copyright__ = "Copyright (c) 2010 Philippe T. Pinard"
+__license__ = "GPL v3"
+
+# Standard library modules.
+import os
+import unittest
+import logging
+
+# Third party modules.
+import numpy as np
+
+# Local modules.
+import DrixUtilities.Files as Files
+
+import ebsdtools.hkl.tango.ctfFile as ctfFile
+import ebsdtools.hkl.tango.boundaryMap as boundaryMap
+import ebsdtools.hkl.tango.grainReconstruction as grainReconstruction
+
+def findRootsReference(size, nodes1, nodes2):
+    neighbours = [[] for _i in range(size)]
+    for node1, node2 in zip(nodes1, nodes2):
+        neighbours[node1].append(node2)
+        neighbours[node2].append(node1)
+
+    roots = [None] * size
+    for node in range(size):
+        if roots[node] is not None:
+            continue
+
+        roots[node] = node
+        stack = [node]
+        while stack:
+            for neighbour in neighbours[stack.pop()]:
+                if roots[neighbour] is None:
+                    roots[neighbour] = node
+                    stack.append(neighbour)
+
+    return roots
+
+class TestGrainReconstruction(unittest.TestCase):
+
+    def setUp(self):
+        unittest.TestCase.setUp(self)
+
+        relativePath = os.path.join('testdata', 'test_ctfFile.ctf')
+        filepath = Files.getCurrentModulePath(__file__, relativePath)
+
+        self.ctf = ctfFile.ctf(filepath)
+        self.results = grainReconstruction.grainReconstructionResults(self.ctf)
+
+    def tearDown(self):
+        del self.ctf #Require in jython not to overload the memory
+        unittest.TestCase.tearDown(self)
+
+    def testSkeleton(self):
+        #self.fail("Test if the testcase is working.")
+        self.assert_(True)
+
+    def test_findRoots(self):
+        for size in [1, 10, 100, 1000]:
+            nodes1 = np.random.randint(0, size, size)
+            nodes2 = np.random.randint(0, size, size)
+
+            roots = grainReconstruction._findRoots(size, nodes1, nodes2)
+            expected = findRootsReference(size, nodes1, nodes2)
+            self.assertEquals(list(roots), expected)
+
+    def testLabelGrains(self):
+        right = np.ma.masked_array([[1.0, 20.0, 1.0],
+                                    [1.0, 1.0, 20.0],
+                                    [1.0, 1.0, 1.0]],
+                                   mask=[[False, False, False],
+                                         [False, False, False],
+                                         [True, False, False]])
+        lower = np.ma.masked_array([[20.0, 20.0, 20.0, 20.0],
+                                    [1.0, 1.0, 20.0, 1.0]],
+                                   mask=[[False, False, False, False],
+                                         [True, False, False, False]])
+        valid = np.ones((3, 4), dtype=bool)
+        valid[2, 0] = False
+
+        labels = grainReconstruction.labelGrains(right, lower, valid, 10.0)
+        expected = [[1, 1, 2, 2],
+                    [3, 3, 3, 3],
+                    [0, 3, 3, 3]]
+        self.assertTrue(np.all(labels == expected))
+
+        labels = grainReconstruction.labelGrains(right, lower, valid, 30.0)
+        expected = [[1, 1, 1, 1],
+                    [1, 1, 1, 1],
+                    [0, 1, 1, 1]]
+        self.assertTrue(np.all(labels == expected))
+
+    def testGetLabels(self):
+        labels = self.results.getLabels()
+        self.assertEquals(labels.shape, (84, 103))
+        self.assertEquals(labels.max(), 550)
+
+        valid = boundaryMap.getIndexedMask(self.ctf)
+        self.assertTrue(np.all((labels > 0) == valid))
+
+        # No disorientation below the threshold between two grains
+        right, lower = boundaryMap.getNeighbourDisorientations(self.ctf)
+        joined = np.ma.filled(right < grainReconstruction.THRESHOLD, False)
+        self.assertTrue(np.all(labels[:, :-1][joined] == labels[:, 1:][joined]))
+        joined = np.ma.filled(lower < grainReconstruction.THRESHOLD, False)
+        self.assertTrue(np.all(labels[:-1][joined] == labels[1:][joined]))
+
+    def testGetResults(self):
+        results = self.results.getResults()
+        self.assertEquals(len(results), 550)
+
+        keys = ['id', 'phase', 'area', 'diameter', 'centroid', 'aspect ratio',
+                'slope', 'mean misorientation angle', 'mean misorientation euler1',
+                'mean misorientation euler2', 'mean misorientation euler3']
+        self.assertEquals(sorted(results[0].keys()), sorted(keys))
+
+        self.assertEquals(self.results.getPhasesList(), ['Iron Alpha PH', 'iron Gamma Cr_Fe_Ni_'])
+
+        pixelArea = self.ctf.getXStep() * self.ctf.getYStep()
+        labels = self.results.getLabels()
+        for result in results[:50]:
+            pixels = labels == result['id']
+            self.assertAlmostEquals(result['area'], pixels.sum() * pixelArea)
+            self.assertAlmostEquals(result['diameter'], 2.0 * np.sqrt(result['area'] / np.pi))
+            self.assertAlmostEquals(result['centroid'][0], self.ctf.getPixelArray('x')[pixels].mean(), 4)
+            self.assertAlmostEquals(result['centroid'][1], self.ctf.getPixelArray('y')[pixels].mean(), 4)
+            self.assertTrue(result['aspect ratio'] >= 1.0)
+            self.assertTrue(0.0 <= result['mean misorientation angle'] < 62.8)
+
+            if pixels.sum() == 1:
+                self.assertEquals(result['slope'], None)
+                self.assertAlmostEquals(result['aspect ratio'], 1.0)
+                self.assertAlmostEquals(result['mean misorientation angle'], 0.0, 4)
+
+        results = self.results.getResults(phase=('=', 'Iron Alpha PH'), area=('>', 1.0))
+        self.assertTrue(len(results) > 0)
+        for result in results:
+            self.assertEquals(result['phase'], 'Iron Alpha PH')
+            self.assertTrue(result['area'] > 1.0)
+
+    def testMeanOrientation(self):
+        # The mean orientation of a grain of one pixel is its orientation
+        labels = self.results.getLabels()
+        counts = np.bincount(labels.ravel())
+        id = np.nonzero(counts[1:] == 1)[0][0] + 1
+        y, x = np.nonzero(labels == id)
+
+        result = self.results.getResults(id=('=', id))[0]
+        qs = self.ctf.getQuaternions().array.reshape(84, 103, 4)
+        expected = qs[y[0], x[0]]
+
+        eulers = [result['mean misorientation euler%i' % i] for i in range(1, 4)]
+        actual = ctfFile.eulersToQuaternions(*[np.array([angle]) for angle in eulers]).array[0]
+        self.assertAlmostEquals(abs(np.dot(actual, expected)), 1.0, 6)
+
+if __name__ == '__main__': #pragma: no cover
+    logging.getLogger().setLevel(logging.DEBUG)
+    unittest.main()
@@ -1,11 +1,11 @@
 #!/usr/bin/env python
 """
 ================================================================================
-:mod:`smp` -- Reader of stream maps file format (SMP)
+:mod:`smp` -- Reader and writer of stream maps file format (SMP)
 ================================================================================
 
 .. module:: smp
-   :synopsis: Reader of stream maps file format (SMP)
+   :synopsis: Reader and writer of stream maps file format (SMP)
 
 .. inheritance-diagram:: ebsdtools.smp
 
@@ -33,10 +33,15 @@ __copyright__ = "Copyright (c) 2010 Philippe T. Pinard"
 __license__ = "GPL v3"
 
 # Standard library modules.
+import os
 import logging
 import struct
+import itertools
+import multiprocessing
+from collections import OrderedDict
 
 # Third party modules.
+import numpy as np
 from PIL import Image
 
 # Local modules.
@@ -44,6 +49,30 @@ from PIL import Image
 # Globals and constants variables.
 from os import SEEK_END
 
+# Element type of the maps: suffix of the map type, big-endian dtype of the
+# values in the file and mode of the PIL images
+MAPTYPES = {'ByteMap': (np.dtype('u1'), 'L'),
+            'ShortMap': (np.dtype('>i2'), 'I'),
+            'IntMap': (np.dtype('>i4'), 'I'),
+            'FloatMap': (np.dtype('>f4'), 'F')}
+
+EXPORT_BLOCK_SIZE = 500 # Number of maps exported by a worker at once
+
+BUFFER_SIZE = 8388608 # Size in bytes of the write buffer
+
+MAX_OPEN_FILES = 4 # Number of files kept open by a multi-file reader
+
+def _get_element_type(maptype):
+    """
+    Returns the dtype and the PIL mode of a map type.
+    """
+    for suffix, (dtype, mode) in MAPTYPES.iteritems():
+        if maptype.endswith(suffix):
+            return dtype, mode
+
+    raise IOError("Invalid map type (%s). Only %s are supported." % \
+            (maptype, ', '.join(sorted(MAPTYPES))))
+
 class Reader:
     def __init__(self, f):
         """
@@ -67,10 +96,7 @@ class Reader:
         self._maptype = f.read(maptype_length)
         logging.debug("Map type: %s" % self._maptype)
 
-        # For now
-        if not self._maptype.endswith('ByteMap'):
-            raise IOError("Invalid map type (%s). Only ByteMap is supported." % \
-                    self._maptype)
+        self._dtype, self._mode = _get_element_type(self._maptype)
 
         # Read the dimensions of the Maps
         self._width = struct.unpack('>i', f.read(4))[0]
@@ -97,11 +123,23 @@ class Reader:
         # Number of maps
         f.seek(0, SEEK_END)
         file_length = f.tell()
-        self._maps_count = int((file_length - self._header_length) / self.size)
-        assert (file_length - self._header_length) % self.size == 0, \
-            "Too many bytes (%i)" % (file_length - self._header_length) % self.size
+        map_length = self.size * self.dtype.itemsize
+        self._maps_count = int((file_length - self._header_length) / map_length)
+        assert (file_length - self._header_length) % map_length == 0, \
+            "Too many bytes (%i)" % ((file_length - self._header_length) % map_length)
         logging.debug("Maps count: %i" % len(self))
 
+        # Memory map of the maps (created on the first access)
+        self._array = None
+
+        # File-objects without a file descriptor (e.g. StringIO) cannot be
+        # memory-mapped
+        try:
+            f.fileno()
+            self._mappable = True
+        except (AttributeError, IOError):
+            self._mappable = False
+
         # Iterator
         self._current_index = self._start_index - 1
 
@@ -138,6 +176,21 @@ class Reader:
         """
         return self._size
 
+    @property
+    def maptype(self):
+        """
+        Full class name of the maps.
+        """
+        return self._maptype
+
+    @property
+    def dtype(self):
+        """
+        Type of the values of the maps (:class:`numpy.dtype`).
+        The values are big-endian as in the file.
+        """
+        return self._dtype
+
     @property
     def start_index(self):
         """
@@ -152,32 +205,163 @@ class Reader:
         """
         return self.start_index + len(self) - 1
 
+    @property
+    def filepaths(self):
+        """
+        Location of the file, as a list like for the multi-file reader.
+        The list is empty if the file-object has no name (e.g. StringIO).
+        """
+        filepath = getattr(self._f, 'name', None)
+        if isinstance(filepath, basestring):
+            return [filepath]
+        else:
+            return []
+
     def close(self):
         """
         Closes the reader.
         """
+        self._array = None
         self._f.close()
 
-    def read(self, index):
+    def as_array(self):
         """
-        Reads the map at the specified *index* and returns a PIL Image.
+        Returns all the maps as an array of shape (number of maps, height, width).
+        The array is a memory map of the file: no data is copied and the maps
+        are only read from the disk when they are accessed.
+        Slicing and fancy indexing can be used directly on the array.
+        Note that the first map of the array is the map at :attr:`start_index`.
+        The type of the array is :attr:`dtype`.
+        If the file-object has no file descriptor (e.g. StringIO), the maps 
+        are read in memory instead.
+        
+        :return: a read-only :class:`numpy.memmap`
+        """
+        if self._array is None:
+            shape = (len(self), self.height, self.width)
+
+            if len(self) == 0: # mmap cannot map an empty region
+                self._array = np.empty(shape, self.dtype)
+            elif self._mappable:
+                self._array = np.memmap(self._f, self.dtype, 'r',
+                                        self._header_length, shape)
+            else:
+                self._array = self._read_maps(0, len(self))
+
+        return self._array
+
+    def _read_maps(self, position, count):
+        """
+        Reads *count* maps from the *position* (from the first map) with the
+        file-object and returns an array of shape (count, height, width).
+        """
+        map_length = self.size * self.dtype.itemsize
+        self._f.seek(self._header_length + position * map_length)
+        data = self._f.read(count * map_length)
+
+        return np.frombuffer(data, self.dtype).reshape(count, self.height, self.width)
+
+    def read_array(self, index):
+        """
+        Reads the map at the specified *index* and returns a view of shape
+        (height, width) on the memory map.
         
         :arg index: index of the map
         
-        :return: a PIL image
+        :return: a :class:`numpy.ndarray`
         """
         if index < self.start_index or index > self.end_index:
             raise IndexError("Index (%i) must between %i and %i." % \
                     (index, self.start_index, self.end_index))
 
-        self._f.seek((index - self.start_index) * self.size + self._header_length)
+        if not self._mappable and self._array is None:
+            return self._read_maps(index - self.start_index, 1)[0]
+
+        return self.as_array()[index - self.start_index]
+
+    def read_range(self, start, stop=None, step=1):
+        """
+        Reads the maps from index *start* up to, but not including, index
+        *stop* by increment of *step* and returns a stacked array of shape
+        (number of maps, height, width).
+        The maps are copied from the file in a single pass.
+        
+        :arg start: index of the first map
+        :arg stop: index after the last map (default: after :attr:`end_index`)
+        :arg step: increment between the indexes (default: 1)
+        
+        :return: a :class:`numpy.ndarray`
+        """
+        if stop is None:
+            stop = self.end_index + 1
 
-        if self._maptype == 'rmlimage.core.ByteMap':
-            mode = "L"
+        if start < self.start_index or stop > self.end_index + 1:
+            raise IndexError("Range (%i, %i) must between %i and %i." % \
+                    (start, stop, self.start_index, self.end_index + 1))
+        if step < 1:
+            raise ValueError("Step (%i) must be greater than 0." % step)
 
-        size = (self.width, self.height)
-        data = self._f.read(self.size)
-        return Image.frombuffer(mode, size, data, "raw", mode, 0, 1)
+        start -= self.start_index
+        stop -= self.start_index
+        return np.array(self.as_array()[start:stop:step])
+
+    def read_indices(self, indices):
+        """
+        Reads the maps at the specified *indices* and returns a stacked array
+        of shape (number of indices, height, width), in the order of
+        *indices*.
+        The indices are sorted and merged, so that each run of consecutive
+        maps is copied from the file in a single read.
+        
+        :arg indices: sequence of indexes
+        
+        :return: a :class:`numpy.ndarray`
+        """
+        indices = np.asarray(indices, int).ravel()
+        if len(indices) == 0:
+            return np.empty((0, self.height, self.width), self.as_array().dtype)
+
+        if indices.min() < self.start_index or indices.max() > self.end_index:
+            raise IndexError("Indices must between %i and %i." % \
+                    (self.start_index, self.end_index))
+
+        positions, inverse = \
+            np.unique(indices - self.start_index, return_inverse=True)
+
+        # Split the positions in runs of consecutive maps
+        breaks = np.flatnonzero(np.diff(positions) != 1) + 1
+        starts = np.concatenate(([0], breaks))
+        stops = np.concatenate((breaks, [len(positions)]))
+
+        array = self.as_array()
+        data = np.empty((len(positions), self.height, self.width), array.dtype)
+        for start, stop in zip(starts, stops):
+            position = positions[start]
+            data[start:stop] = array[position:position + stop - start]
+
+        if len(positions) == len(indices) and np.all(np.diff(indices) > 0):
+            return data # Already sorted without duplicates
+        else:
+            return data[inverse]
+
+    def read(self, index):
+        """
+        Reads the map at the specified *index* and returns a PIL Image.
+        The mode of the image is ``L`` for byte maps, ``I`` for short and int 
+        maps and ``F`` for float maps.
+        
+        :arg index: index of the map
+        
+        :return: a PIL image
+        """
+        data = self.read_array(index)
+
+        if self._mode == "I":
+            data = data.astype(np.int32)
+        elif self._mode == "F":
+            data = data.astype(np.float32)
+
+        return Image.fromarray(data, self._mode)
 
     def next(self):
         if self._current_index >= self.end_index:
@@ -188,29 +372,516 @@ class Reader:
 
 reader = Reader
 
-def export_to_hkl(reader, project_name, outputdir):
+class MultiReader:
+    def __init__(self, filepaths, max_open=MAX_OPEN_FILES):
+        """
+        Reads a SMP dataset split in several files as if it was one file.
+        
+        All the files must have the same width, height and map type.
+        The files are ordered by their start index and must follow each
+        other without gap nor overlap.
+        A reader is only opened when one of its maps is read and at most
+        *max_open* readers are kept open at a time.
+        
+        :arg filepaths: locations of the SMP files
+        :arg max_open: maximum number of open files
+        """
+        if not filepaths:
+            raise IOError("No SMP file")
+
+        parts = []
+        for filepath in filepaths:
+            reader = Reader(open(filepath, 'rb'))
+            parts.append((reader.start_index, len(reader), filepath,
+                          (reader.width, reader.height, reader.maptype)))
+            reader.close()
+        parts.sort()
+
+        self._width, self._height, self._maptype = parts[0][3]
+        self._dtype, self._mode = _get_element_type(self._maptype)
+
+        for start_index, count, filepath, info in parts:
+            if info != parts[0][3]:
+                raise IOError("The maps of %s (%i x %i %s) differ from %s" % \
+                        ((filepath,) + info + (parts[0][2],)))
+
+        for previous, part in zip(parts[:-1], parts[1:]):
+            previous_end = previous[0] + previous[1] - 1
+            if part[0] > previous_end + 1:
+                raise IOError("Gap between %s and %s (indexes %i to %i)" % \
+                        (previous[2], part[2], previous_end + 1, part[0] - 1))
+            elif part[0] <= previous_end:
+                raise IOError("Overlap between %s and %s (indexes %i to %i)" % \
+                        (previous[2], part[2], part[0], previous_end))
+
+        self._filepaths = [part[2] for part in parts]
+        self._starts = np.array([part[0] for part in parts])
+        self._start_index = parts[0][0]
+        self._maps_count = sum(part[1] for part in parts)
+
+        # Index-to-file resolution: a division when all the files (except 
+        # the last one) have the same number of maps, a lookup table otherwise
+        counts = [part[1] for part in parts]
+        if len(set(counts[:-1])) <= 1 and counts[0] >= counts[-1] and counts[0] > 0:
+            self._part_length = counts[0]
+            self._part_lookup = None
+        else:
+            self._part_length = None
+            self._part_lookup = np.repeat(np.arange(len(parts)), counts)
+
+        self._max_open = max(max_open, 1)
+        self._readers = OrderedDict()
+
+        # Iterator
+        self._current_index = self._start_index - 1
+
+    def __iter__(self):
+        return self
+
+    def __len__(self):
+        """
+        Number of maps.
+        """
+        return self._maps_count
+
+    def __call__(self, index):
+        return self.read(index)
+
+    @property
+    def width(self):
+        """
+        Width of the maps.
+        """
+        return self._width
+
+    @property
+    def height(self):
+        """
+        Height of the maps.
+        """
+        return self._height
+
+    @property
+    def size(self):
+        """
+        Size of the maps (width times height).
+        """
+        return self.width * self.height
+
+    @property
+    def maptype(self):
+        """
+        Full class name of the maps.
+        """
+        return self._maptype
+
+    @property
+    def dtype(self):
+        """
+        Type of the values of the maps (:class:`numpy.dtype`).
+        """
+        return self._dtype
+
+    @property
+    def start_index(self):
+        """
+        Index of the first map.
+        """
+        return self._start_index
+
+    @property
+    def end_index(self):
+        """
+        Index of the last map.
+        """
+        return self.start_index + len(self) - 1
+
+    @property
+    def filepaths(self):
+        """
+        Locations of the files, ordered by start index.
+        """
+        return list(self._filepaths)
+
+    def close(self):
+        """
+        Closes all the open files.
+        """
+        for reader in self._readers.itervalues():
+            reader.close()
+        self._readers.clear()
+
+    def _check_indices(self, indices):
+        if len(indices) > 0 and \
+                (np.min(indices) < self.start_index or np.max(indices) > self.end_index):
+            raise IndexError("Indices must between %i and %i." % \
+                    (self.start_index, self.end_index))
+
+    def _get_parts(self, indices):
+        """
+        Returns the number of the file of each index.
+        """
+        positions = np.asarray(indices) - self.start_index
+
+        if self._part_lookup is None:
+            return np.minimum(positions // self._part_length,
+                              len(self._filepaths) - 1)
+        else:
+            return self._part_lookup[positions]
+
+    def _get_reader(self, part):
+        """
+        Returns the reader of a file, opening it if needed and closing the
+        least recently used reader if too many files are open.
+        """
+        try:
+            reader = self._readers.pop(part)
+        except KeyError:
+            if len(self._readers) >= self._max_open:
+                self._readers.popitem(last=False)[1].close()
+            reader = Reader(open(self._filepaths[part], 'rb'))
+
+        self._readers[part] = reader
+        return reader
+
+    def read_array(self, index):
+        """
+        Reads the map at the specified *index* and returns a view of shape
+        (height, width) on the memory map of its file.
+        
+        :arg index: index of the map
+        
+        :return: a :class:`numpy.ndarray`
+        """
+        self._check_indices([index])
+        return self._get_reader(int(self._get_parts(index))).read_array(index)
+
+    def read(self, index):
+        """
+        Reads the map at the specified *index* and returns a PIL Image.
+        
+        :arg index: index of the map
+        
+        :return: a PIL image
+        """
+        self._check_indices([index])
+        return self._get_reader(int(self._get_parts(index))).read(index)
+
+    def read_indices(self, indices):
+        """
+        Reads the maps at the specified *indices* and returns a stacked array
+        of shape (number of indices, height, width), in the order of
+        *indices*.
+        The indices are grouped by file and each file is read with
+        :meth:`Reader.read_indices`.
+        
+        :arg indices: sequence of indexes
+        
+        :return: a :class:`numpy.ndarray`
+        """
+        indices = np.asarray(indices, int).ravel()
+        self._check_indices(indices)
+
+        data = np.empty((len(indices), self.height, self.width), self.dtype)
+        parts = self._get_parts(indices)
+
+        for part in np.unique(parts):
+            selection = np.flatnonzero(parts == part)
+            reader = self._get_reader(int(part))
+            data[selection] = reader.read_indices(indices[selection])
+
+        return data
+
+    def read_range(self, start, stop=None, step=1):
+        """
+        Reads the maps from index *start* up to, but not including, index
+        *stop* by increment of *step* and returns a stacked array of shape
+        (number of maps, height, width).
+        
+        :arg start: index of the first map
+        :arg stop: index after the last map (default: after :attr:`end_index`)
+        :arg step: increment between the indexes (default: 1)
+        
+        :return: a :class:`numpy.ndarray`
+        """
+        if stop is None:
+            stop = self.end_index + 1
+
+        if start < self.start_index or stop > self.end_index + 1:
+            raise IndexError("Range (%i, %i) must between %i and %i." % \
+                    (start, stop, self.start_index, self.end_index + 1))
+        if step < 1:
+            raise ValueError("Step (%i) must be greater than 0." % step)
+
+        return self.read_indices(np.arange(start, stop, step))
+
+    def next(self):
+        if self._current_index >= self.end_index:
+            raise StopIteration
+        self._current_index += 1
+        return self.read(self._current_index)
+
+multireader = MultiReader
+
+class Writer:
+    def __init__(self, filepath, width, height,
+                 maptype='rmlimage.core.ByteMap', version=2, start_index=0,
+                 max_size=None, buffer_size=BUFFER_SIZE):
+        """
+        Writes a SMP file.
+        
+        The maps are appended with :meth:`write` and buffered in blocks of
+        *buffer_size* bytes.
+        If a *max_size* is given, the maps are split in several files of at
+        most *max_size* bytes (but at least one map per file). 
+        The first file is *filepath*, the next ones have the number of the 
+        split appended to their name (e.g. ``maps_1.smp``, ``maps_2.smp``).
+        Each file holds the index of its first map in its header.
+        
+        :arg filepath: location of the (first) SMP file
+        :arg width: width of the maps
+        :arg height: height of the maps
+        :arg maptype: full class name of the maps
+        :arg version: version of the SMP format (1 or 2)
+        :arg start_index: index of the first map (version 2 only)
+        :arg max_size: maximum size in bytes of a file (version 2 only)
+        :arg buffer_size: size in bytes of the write buffer
+        """
+        if version not in (1, 2):
+            raise ValueError("Invalid SMP version (%i)" % version)
+        if version == 1 and (start_index != 0 or max_size is not None):
+            raise ValueError("A start index and split files require version 2")
+
+        self._filepath = filepath
+        self._width = width
+        self._height = height
+        self._maptype = maptype
+        self._version = version
+        self._buffer_size = buffer_size
+        self._dtype = _get_element_type(maptype)[0]
+
+        self._header_length = 4 + 1 + len(maptype) + 4 + 4
+        if version == 2:
+            self._header_length += 4
+        map_length = width * height * self._dtype.itemsize
+
+        if max_size is None:
+            self._maps_per_file = None
+        else:
+            self._maps_per_file = \
+                max((max_size - self._header_length) // map_length, 1)
+
+        self._start_index = start_index
+        self._next_index = start_index
+        self._filepaths = []
+        self._f = None
+        self._file_count = 0
+
+    def __len__(self):
+        """
+        Number of maps written.
+        """
+        return self._next_index - self._start_index
+
+    @property
+    def width(self):
+        """
+        Width of the maps.
+        """
+        return self._width
+
+    @property
+    def height(self):
+        """
+        Height of the maps.
+        """
+        return self._height
+
+    @property
+    def start_index(self):
+        """
+        Index of the first map.
+        """
+        return self._start_index
+
+    @property
+    def filepaths(self):
+        """
+        Locations of the files written so far.
+        """
+        return list(self._filepaths)
+
+    def _open(self):
+        """
+        Opens the next file and writes its header.
+        """
+        if not self._filepaths:
+            filepath = self._filepath
+        else:
+            root, ext = os.path.splitext(self._filepath)
+            filepath = "%s_%i%s" % (root, len(self._filepaths), ext)
+
+        self._f = open(filepath, 'wb', self._buffer_size)
+        self._filepaths.append(filepath)
+        self._file_count = 0
+
+        self._f.write('SMP%i' % self._version)
+        self._f.write(struct.pack('b', len(self._maptype)))
+        self._f.write(self._maptype)
+        self._f.write(struct.pack('>ii', self.width, self.height))
+        if self._version == 2:
+            self._f.write(struct.pack('>i', self._next_index))
+
+    def write(self, data):
+        """
+        Appends one map of shape (height, width) or several maps of shape
+        (number of maps, height, width).
+        The values are converted to the type of the maps.
+        
+        :arg data: array of maps
+        """
+        data = np.asarray(data)
+        if data.ndim == 2:
+            data = data[np.newaxis]
+
+        if data.shape[1:] != (self.height, self.width):
+            raise ValueError("Invalid shape of the maps (%s)" % (data.shape[1:],))
+
+        data = np.ascontiguousarray(data, self._dtype)
+
+        while len(data) > 0:
+            if self._f is None:
+                self._open()
+
+            if self._maps_per_file is None:
+                count = len(data)
+            else:
+                count = min(len(data), self._maps_per_file - self._file_count)
+
+            data[:count].tofile(self._f)
+            self._file_count += count
+            self._next_index += count
+            data = data[count:]
+
+            if self._file_count == self._maps_per_file:
+                self._f.close()
+                self._f = None
+
+    def close(self):
+        """
+        Flushes the buffer and closes the writer.
+        If no map was written, a file with only the header is created.
+        """
+        if not self._filepaths:
+            self._open()
+
+        if self._f is not None:
+            self._f.close()
+            self._f = None
+
+writer = Writer
+
+def _export_filename(project_name, index, width):
+    return project_name + str(index).zfill(width) + ".jpg"
+
+def _export_image(reader, index):
+    """
+    Returns the map at the specified *index* as a ``L`` image.
+    The values of short, int and float maps are scaled linearly from their
+    minimum and maximum to 0-255, as JPEG only stores byte images.
+    """
+    if reader.dtype == np.uint8:
+        return reader.read(index)
+
+    data = reader.read_array(index).astype(np.float64)
+    minimum, maximum = data.min(), data.max()
+    if maximum > minimum:
+        data = (data - minimum) * (255.0 / (maximum - minimum))
+    else:
+        data = np.zeros_like(data)
+
+    return Image.fromarray(np.round(data).astype(np.uint8), 'L')
+
+def _export_block(args):
+    """
+    Exports a block of maps with its own reader.
+    Each image is written under a temporary name and renamed once complete,
+    so that an interrupted export never leaves a truncated image behind.
+    
+    :return: number of exported maps
+    """
+    filepaths, indices, project_name, width, outputdir = args
+
+    if len(filepaths) == 1:
+        reader = Reader(open(filepaths[0], 'rb'))
+    else:
+        reader = MultiReader(filepaths)
+    try:
+        for index in indices:
+            path = os.path.join(outputdir,
+                                _export_filename(project_name, index, width))
+            _export_image(reader, index).save(path + ".tmp", "JPEG")
+            os.rename(path + ".tmp", path)
+    finally:
+        reader.close()
+
+    return len(indices)
+
+def export_to_hkl(reader, project_name, outputdir, processes=None,
+                  resume=False, progress=None):
     """
     Exports all the images in a SMP to single files in a folder to be used by
     HKL Channel 5.
+    The images are encoded in parallel by a pool of processes, each one
+    opening its own reader on the SMP file(s).
+    The short, int and float maps are scaled to byte images.
     
-    :arg reader: smp reader
+    :arg reader: smp reader or multi-file reader of SMP files on disk
     :arg project_name: name of the project
     :arg outputdir: output directory
+    :arg processes: number of processes (default: number of CPUs). 
+        With 1, the images are exported in the current process.
+    :arg resume: if ``True``, the images already in the output directory are
+        not exported again
+    :arg progress: function called with the number of exported maps and the 
+        total number of maps after each block of maps
     """
-    import os
+    filepaths = reader.filepaths
+    if not filepaths:
+        raise ValueError("The reader must read SMP files on disk")
 
     outputdir = os.path.join(outputdir, project_name + "Images")
     if not os.path.exists(outputdir):
         os.makedirs(outputdir)
 
     width = len(str(len(reader)))
-    for index, im in enumerate(reader):
-        index += reader.start_index
-        filename = project_name + str(index).zfill(width)
-
-        im.save(os.path.join(outputdir, filename + ".jpg"))
-
-        if index % 1000 == 0:
-            progress = float(index) / len(reader) * 100.0
-            print("Progress: %4.2f" % progress)
-
+    indices = range(reader.start_index, reader.end_index + 1)
+
+    if resume:
+        existing = set(os.listdir(outputdir))
+        indices = [index for index in indices
+                   if _export_filename(project_name, index, width) not in existing]
+
+    total = len(reader)
+    done = total - len(indices)
+
+    tasks = [(filepaths, indices[i:i + EXPORT_BLOCK_SIZE],
+              project_name, width, outputdir)
+             for i in range(0, len(indices), EXPORT_BLOCK_SIZE)]
+
+    if processes == 1:
+        results = itertools.imap(_export_block, tasks)
+        pool = None
+    else:
+        pool = multiprocessing.Pool(processes)
+        results = pool.imap_unordered(_export_block, tasks)
+
+    try:
+        for count in results:
+            done += count
+            if progress is not None:
+                progress(done, total)
+    finally:
+        if pool is not None:
+            pool.terminate()
+            pool.join()
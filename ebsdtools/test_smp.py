@@ -16,8 +16,14 @@ __license__ = "GPL v3"
 import unittest
 import logging
 import os
+import struct
+import shutil
+import tempfile
+from StringIO import StringIO
 
 # Third party modules.
+import numpy as np
+from PIL import Image
 
 # Local modules.
 import smp
@@ -60,11 +66,356 @@ class TestReader(unittest.TestCase):
         self.assertRaises(IndexError, self.reader.read, 999)
         self.assertRaises(IndexError, self.reader.read, 1004)
 
+    def testas_array(self):
+        array = self.reader.as_array()
+        self.assertEqual((4, 256, 256), array.shape)
+        self.assertEqual(np.uint8, array.dtype)
+
+        im = self.reader.read(1002)
+        self.assertEqual(list(im.getdata()), list(array[2].flat))
+        self.assertEqual((2, 256, 256), array[[0, 3]].shape)
+
+    def testread_array(self):
+        array = self.reader.read_array(1001)
+        self.assertEqual((256, 256), array.shape)
+        self.assertTrue(np.all(self.reader.as_array()[1] == array))
+
+        self.assertRaises(IndexError, self.reader.read_array, 999)
+        self.assertRaises(IndexError, self.reader.read_array, 1004)
+
+    def testread_range(self):
+        array = self.reader.as_array()
+
+        data = self.reader.read_range(1001, 1003)
+        self.assertEqual((2, 256, 256), data.shape)
+        self.assertTrue(np.all(array[1:3] == data))
+
+        data = self.reader.read_range(1000, step=2)
+        self.assertEqual((2, 256, 256), data.shape)
+        self.assertTrue(np.all(array[[0, 2]] == data))
+
+        self.assertRaises(IndexError, self.reader.read_range, 999, 1002)
+        self.assertRaises(IndexError, self.reader.read_range, 1000, 1005)
+
+    def testread_indices(self):
+        array = self.reader.as_array()
+
+        data = self.reader.read_indices([1003, 1000, 1001, 1003])
+        self.assertEqual((4, 256, 256), data.shape)
+        self.assertTrue(np.all(array[[3, 0, 1, 3]] == data))
+
+        data = self.reader.read_indices([1000, 1002, 1003])
+        self.assertTrue(np.all(array[[0, 2, 3]] == data))
+
+        self.assertEqual((0, 256, 256), self.reader.read_indices([]).shape)
+        self.assertRaises(IndexError, self.reader.read_indices, [1000, 1004])
+
     def testnext(self):
         for im in self.reader:
             self.assertEqual('L', im.mode)
             self.assertEqual((256, 256), im.size)
 
+    def testStringIO(self):
+        self.reader._f.seek(0)
+        reader = smp.reader(StringIO(self.reader._f.read()))
+        self.assertEqual(4, len(reader))
+
+        im = reader.read(1002)
+        self.assertEqual('L', im.mode)
+        self.assertEqual(list(im.getdata()), list(self.reader.as_array()[2].flat))
+
+        self.assertTrue(np.all(self.reader.read_array(1001) == reader.read_array(1001)))
+        self.assertTrue(np.all(self.reader.as_array() == reader.as_array()))
+        self.assertTrue(np.all(self.reader.read_indices([1003, 1000]) == \
+                               reader.read_indices([1003, 1000])))
+
+        reader.close()
+
+class TestReaderMapTypes(unittest.TestCase):
+
+    def setUp(self):
+        unittest.TestCase.setUp(self)
+
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        unittest.TestCase.tearDown(self)
+
+        shutil.rmtree(self.tmpdir)
+
+    def _create_smp(self, maptype, data):
+        filepath = os.path.join(self.tmpdir, maptype + '.smp')
+
+        f = open(filepath, 'wb')
+        f.write('SMP2')
+        f.write(struct.pack('b', len(maptype)) + maptype)
+        f.write(struct.pack('>iii', data.shape[2], data.shape[1], 5))
+        f.write(data.tostring())
+        f.close()
+
+        return smp.reader(open(filepath, 'rb'))
+
+    def testShortMap(self):
+        data = np.arange(-12, 12, dtype='>i2').reshape(2, 3, 4)
+        reader = self._create_smp('rmlimage.core.ShortMap', data)
+
+        self.assertEqual(2, len(reader))
+        self.assertEqual(np.dtype('>i2'), reader.dtype)
+        self.assertTrue(np.all(data == reader.as_array()))
+
+        im = reader.read(6)
+        self.assertEqual('I', im.mode)
+        self.assertEqual((4, 3), im.size)
+        self.assertEqual(11, im.getpixel((3, 2)))
+
+        reader.close()
+
+    def testIntMap(self):
+        data = (np.arange(-12, 12).reshape(2, 3, 4) * 100000).astype('>i4')
+        reader = self._create_smp('rmlimage.core.IntMap', data)
+
+        self.assertEqual(2, len(reader))
+        self.assertTrue(np.all(data == reader.read_indices([5, 6])))
+        self.assertEqual(-1200000, reader.read(5).getpixel((0, 0)))
+
+        reader.close()
+
+    def testFloatMap(self):
+        data = np.linspace(-1.0, 1.0, 36).astype('>f4').reshape(3, 3, 4)
+        reader = self._create_smp('rmlimage.core.FloatMap', data)
+
+        self.assertEqual(3, len(reader))
+        self.assertTrue(np.all(data[1] == reader.read_array(6)))
+
+        im = reader.read(7)
+        self.assertEqual('F', im.mode)
+        self.assertAlmostEqual(1.0, im.getpixel((3, 2)), 6)
+
+        reader.close()
+
+    def testinvalid(self):
+        self.assertRaises(IOError, self._create_smp, 'rmlimage.core.RGBMap',
+                          np.zeros((1, 2, 2), np.uint8))
+
+class TestWriter(unittest.TestCase):
+
+    def setUp(self):
+        unittest.TestCase.setUp(self)
+
+        dirpath = os.path.dirname(__file__)
+        filepath = os.path.join(dirpath, 'testdata', 'test.smp')
+        self.reader = smp.reader(open(filepath, 'rb'))
+
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        unittest.TestCase.tearDown(self)
+
+        self.reader.close()
+        shutil.rmtree(self.tmpdir)
+
+    def testwrite(self):
+        filepath = os.path.join(self.tmpdir, 'test.smp')
+        writer = smp.writer(filepath, 256, 256, start_index=1000)
+        writer.write(self.reader.read_array(1000))
+        writer.write(self.reader.read_range(1001))
+        writer.close()
+
+        self.assertEqual(4, len(writer))
+        self.assertEqual([filepath], writer.filepaths)
+
+        dirpath = os.path.dirname(__file__)
+        expected = open(os.path.join(dirpath, 'testdata', 'test.smp'), 'rb').read()
+        self.assertEqual(expected, open(filepath, 'rb').read())
+
+    def testwrite_version1(self):
+        filepath = os.path.join(self.tmpdir, 'test.smp')
+        data = np.arange(-12, 12).reshape(2, 3, 4)
+        writer = smp.writer(filepath, 4, 3, 'rmlimage.core.ShortMap', version=1)
+        writer.write(data)
+        writer.close()
+
+        reader = smp.reader(open(filepath, 'rb'))
+        self.assertEqual(0, reader.start_index)
+        self.assertEqual(np.dtype('>i2'), reader.dtype)
+        self.assertTrue(np.all(data == reader.as_array()))
+        reader.close()
+
+        self.assertRaises(ValueError, smp.writer, filepath, 4, 3, version=1,
+                          start_index=5)
+
+    def testwrite_split(self):
+        filepath = os.path.join(self.tmpdir, 'test.smp')
+        writer = smp.writer(filepath, 256, 256, start_index=1000,
+                            max_size=3 * 256 * 256 + 100)
+        for index in range(1000, 1004):
+            writer.write(self.reader.read_array(index))
+        writer.close()
+
+        filepaths = [filepath, os.path.join(self.tmpdir, 'test_1.smp')]
+        self.assertEqual(filepaths, writer.filepaths)
+
+        reader = smp.reader(open(filepaths[0], 'rb'))
+        self.assertEqual(1000, reader.start_index)
+        self.assertEqual(3, len(reader))
+        self.assertTrue(np.all(self.reader.read_range(1000, 1003) == reader.as_array()))
+        reader.close()
+
+        reader = smp.reader(open(filepaths[1], 'rb'))
+        self.assertEqual(1003, reader.start_index)
+        self.assertEqual(1, len(reader))
+        self.assertTrue(np.all(self.reader.read_array(1003) == reader.read_array(1003)))
+        reader.close()
+
+    def testwrite_invalid(self):
+        filepath = os.path.join(self.tmpdir, 'test.smp')
+        writer = smp.writer(filepath, 4, 3)
+        self.assertRaises(ValueError, writer.write, np.zeros((3, 3)))
+        writer.close()
+
+class TestMultiReader(unittest.TestCase):
+
+    def setUp(self):
+        unittest.TestCase.setUp(self)
+
+        dirpath = os.path.dirname(__file__)
+        filepath = os.path.join(dirpath, 'testdata', 'test.smp')
+        self.reader = smp.reader(open(filepath, 'rb'))
+
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        unittest.TestCase.tearDown(self)
+
+        self.reader.close()
+        shutil.rmtree(self.tmpdir)
+
+    def _write(self, filename, start, stop, maptype='rmlimage.core.ByteMap'):
+        filepath = os.path.join(self.tmpdir, filename)
+        writer = smp.writer(filepath, 256, 256, maptype, start_index=start)
+        writer.write(self.reader.read_range(start, stop))
+        writer.close()
+        return filepath
+
+    def testread(self):
+        filepaths = [self._write('c.smp', 1002, 1004),
+                     self._write('a.smp', 1000, 1002)]
+        reader = smp.multireader(filepaths, max_open=1)
+
+        self.assertEqual(1000, reader.start_index)
+        self.assertEqual(1003, reader.end_index)
+        self.assertEqual(4, len(reader))
+        self.assertEqual(filepaths[::-1], reader.filepaths)
+
+        expected = self.reader.as_array()
+        self.assertTrue(np.all(expected[3] == reader.read_array(1003)))
+        self.assertEqual(1, len(reader._readers))
+        self.assertTrue(np.all(expected[[3, 0, 2, 1]] ==
+                               reader.read_indices([1003, 1000, 1002, 1001])))
+        self.assertTrue(np.all(expected[1:] == reader.read_range(1001)))
+        self.assertEqual(4, len(list(reader)))
+        self.assertEqual('L', reader(1002).mode)
+
+        self.assertRaises(IndexError, reader.read, 1004)
+        self.assertRaises(IndexError, reader.read_indices, [999])
+
+        reader.close()
+
+    def testread_unequal(self):
+        filepaths = [self._write('a.smp', 1000, 1001),
+                     self._write('b.smp', 1001, 1004)]
+        reader = smp.multireader(filepaths)
+
+        expected = self.reader.as_array()
+        self.assertTrue(np.all(expected == reader.read_range(1000)))
+        self.assertTrue(np.all(expected[0] == reader.read_array(1000)))
+
+        reader.close()
+
+    def testgap(self):
+        filepaths = [self._write('a.smp', 1000, 1001),
+                     self._write('b.smp', 1002, 1004)]
+        self.assertRaises(IOError, smp.multireader, filepaths)
+
+    def testoverlap(self):
+        filepaths = [self._write('a.smp', 1000, 1002),
+                     self._write('b.smp', 1001, 1004)]
+        self.assertRaises(IOError, smp.multireader, filepaths)
+
+    def testmaptype(self):
+        filepaths = [self._write('a.smp', 1000, 1002),
+                     self._write('b.smp', 1002, 1004, 'rmlimage.core.ShortMap')]
+        self.assertRaises(IOError, smp.multireader, filepaths)
+
+class TestExport(unittest.TestCase):
+
+    def setUp(self):
+        unittest.TestCase.setUp(self)
+
+        dirpath = os.path.dirname(__file__)
+        filepath = os.path.join(dirpath, 'testdata', 'test.smp')
+        self.reader = smp.reader(open(filepath, 'rb'))
+
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        unittest.TestCase.tearDown(self)
+
+        self.reader.close()
+        shutil.rmtree(self.tmpdir)
+
+    def testexport_to_hkl(self):
+        calls = []
+        smp.export_to_hkl(self.reader, 'test', self.tmpdir, processes=2,
+                          progress=lambda done, total: calls.append((done, total)))
+
+        dirpath = os.path.join(self.tmpdir, 'testImages')
+        filenames = ['test1000.jpg', 'test1001.jpg', 'test1002.jpg', 'test1003.jpg']
+        self.assertEqual(filenames, sorted(os.listdir(dirpath)))
+        self.assertEqual((4, 4), calls[-1])
+
+    def testexport_to_hkl_resume(self):
+        smp.export_to_hkl(self.reader, 'test', self.tmpdir, processes=1)
+
+        dirpath = os.path.join(self.tmpdir, 'testImages')
+        os.remove(os.path.join(dirpath, 'test1002.jpg'))
+
+        exported = []
+        smp.export_to_hkl(self.reader, 'test', self.tmpdir, processes=1,
+                          resume=True, progress=lambda done, total: exported.append(done))
+
+        self.assertEqual([4], exported)
+        self.assertEqual(4, len(os.listdir(dirpath)))
+
+    def testexport_to_hkl_multireader(self):
+        data = np.arange(-12, 12, dtype='>i2').reshape(2, 3, 4)
+        filepaths = []
+        for i, start in enumerate([5, 6]):
+            filepath = os.path.join(self.tmpdir, '%i.smp' % i)
+            f = open(filepath, 'wb')
+            f.write('SMP2')
+            f.write(struct.pack('b', 22) + 'rmlimage.core.ShortMap')
+            f.write(struct.pack('>iii', 4, 3, start))
+            f.write(data[i].tostring())
+            f.close()
+            filepaths.append(filepath)
+
+        reader = smp.multireader(filepaths)
+        smp.export_to_hkl(reader, 'short', self.tmpdir, processes=1)
+        reader.close()
+
+        dirpath = os.path.join(self.tmpdir, 'shortImages')
+        self.assertEqual(['short5.jpg', 'short6.jpg'], sorted(os.listdir(dirpath)))
+
+        im = Image.open(os.path.join(dirpath, 'short6.jpg'))
+        self.assertEqual('L', im.mode)
+        self.assertEqual((4, 3), im.size)
+
+    def testexport_to_hkl_invalid(self):
+        self.reader._f.seek(0)
+        reader = smp.reader(StringIO(self.reader._f.read()))
+        self.assertRaises(ValueError, smp.export_to_hkl, reader, 'test', self.tmpdir)
+
 if __name__ == '__main__': #pragma: no cover
     logging.getLogger().setLevel(logging.DEBUG)
     unittest.main()
@@ -0,0 +1,469 @@
+#!/usr/bin/env python
+"""
+================================================================================
+:mod:`quaternionarrays` -- Arrays of quaternions.
+================================================================================
+
+.. module:: quaternionarrays
+   :synopsis: Arrays of quaternions.
+
+.. inheritance-diagram:: mathtools.rotation.quaternionarrays
+
+"""
+
+# Script information for the file.
+__author__ = "Philippe T. Pinard"
+__email__ = "philippe.pinard@gmail.com"
+__version__ = "0.1"
+__copyright__ = "Copyright (c) 2010 Philippe T. Pinard"
+__license__ = "GPL v3"
+
+# Standard library modules.
+from math import pi
+
+# Third party modules.
+import numpy as np
+
+# Local modules.
+import mathtools.rotation.quaternions as quaternions
+
+# Globals and constants variables.
+ZERO = 5e-8 # Same tolerance as round(x, 7) == 0 in quaternions
+
+def _asarray(data):
+    """
+    Return the quaternions of *data* as an array of shape (N, 4).
+
+    :arg data: :class:`QuaternionArray`, :class:`quaternions.Quaternion`,
+        sequence of :class:`quaternions.Quaternion` or array of shape (4,)
+        or (N, 4)
+
+    """
+    if isinstance(data, QuaternionArray):
+        return data._q
+    elif isinstance(data, quaternions.Quaternion):
+        return np.array([data.to_list()], dtype=float)
+    elif len(data) > 0 and isinstance(data[0], quaternions.Quaternion):
+        return np.array([q.to_list() for q in data], dtype=float)
+    else:
+        return np.asarray(data, dtype=float).reshape(-1, 4)
+
+def _positive(q):
+    """
+    Change in place the sign of the quaternions whose first non-zero
+    coefficient is negative.
+
+    .. seealso:: :func:`quaternions.positive`
+    """
+    first_value = q[:, 0].copy()
+
+    # Only the quaternions with a null scalar part are searched further
+    small = np.nonzero(np.abs(first_value) < ZERO)[0]
+    if len(small) > 0:
+        nonzero = np.abs(q[small]) >= ZERO
+        first = np.argmax(nonzero, axis=1)
+        first_value[small] = np.where(nonzero.any(axis=1), q[small, first], 0.0)
+
+    q *= np.where(first_value < 0.0, -1.0, 1.0)[:, np.newaxis]
+
+    return q
+
+def multiply(q1, q2):
+    """
+    Hamilton product of two arrays of quaternions of shape (N, 4) (or
+    (1, 4)).
+    Contrary to :meth:`QuaternionArray.__mul__`, the product is not made
+    positive.
+
+    :rtype: :class:`numpy.ndarray` of shape (N, 4)
+
+    .. seealso:: :meth:`quaternions.Quaternion.__mul__`
+    """
+    # Contiguous coefficients are much faster to operate on than columns
+    a1, x1, y1, z1 = np.ascontiguousarray(q1.T)
+    a2, x2, y2, z2 = np.ascontiguousarray(q2.T)
+
+    q = np.empty((4, max(len(q1), len(q2))))
+    np.multiply(a1, a2, q[0])
+    q[0] -= x1 * x2
+    q[0] -= y1 * y2
+    q[0] -= z1 * z2
+
+    np.multiply(a1, x2, q[1])
+    q[1] += a2 * x1
+    q[1] += y1 * z2
+    q[1] -= z1 * y2
+
+    np.multiply(a1, y2, q[2])
+    q[2] += a2 * y1
+    q[2] += z1 * x2
+    q[2] -= x1 * z2
+
+    np.multiply(a1, z2, q[3])
+    q[3] += a2 * z1
+    q[3] += x1 * y2
+    q[3] -= y1 * x2
+
+    return np.ascontiguousarray(q.T)
+
+def eulerangles_to_quaternionarray(angles):
+    """
+    Convert Euler angles :math:`(\\theta_1, \\theta_2, \\theta_3)` (in rad,
+    Bunge convention) to quaternions.
+
+    :arg angles: array of shape (N, 3)
+
+    :rtype: :class:`QuaternionArray`
+
+    .. seealso:: :func:`quaternions.eulerangles_to_quaternion`
+    """
+    angles = np.asarray(angles, dtype=float).reshape(-1, 3)
+    t1, t2, t3 = angles.T
+
+    cos2 = np.cos(t2 / 2.0)
+    sin2 = np.sin(t2 / 2.0)
+    sum13 = (t1 + t3) / 2.0
+    diff13 = (t1 - t3) / 2.0
+
+    q = np.empty((len(angles), 4))
+    q[:, 0] = cos2 * np.cos(sum13)
+    q[:, 1] = sin2 * np.cos(diff13)
+    q[:, 2] = sin2 * np.sin(diff13)
+    q[:, 3] = cos2 * np.sin(sum13)
+
+    return QuaternionArray._wrap(_positive(q))
+
+def axisangles_to_quaternionarray(angles, axes):
+    """
+    Convert axis angles :math:`(\\phi, \\vec{n})` to quaternions.
+    The axes are normalized.
+
+    :arg angles: array of shape (N,) of the angles (in rad)
+    :arg axes: array of shape (N, 3) or (3,) of the axes
+
+    :rtype: :class:`QuaternionArray`
+
+    .. seealso:: :func:`quaternions.axisangle_to_quaternion`
+    """
+    angles = np.asarray(angles, dtype=float).reshape(-1)
+    axes = np.asarray(axes, dtype=float).reshape(-1, 3)
+
+    norms = np.sqrt(np.sum(axes ** 2, axis=1))
+    norms[norms == 0.0] = 1.0
+
+    q = np.empty((max(len(angles), len(axes)), 4))
+    q[:, 0] = np.cos(0.5 * angles)
+    q[:, 1:] = axes * (np.sin(0.5 * angles) / norms)[:, np.newaxis]
+
+    return QuaternionArray._wrap(_positive(q))
+
+def so3matrices_to_quaternionarray(m):
+    """
+    Convert SO3 matrices to quaternions.
+
+    :arg m: array of shape (N, 3, 3)
+
+    :rtype: :class:`QuaternionArray`
+
+    .. seealso:: :func:`quaternions.so3matrix_to_quaternion`
+    """
+    m = np.asarray(m, dtype=float).reshape(-1, 3, 3)
+
+    trace = m[:, 0, 0] + m[:, 1, 1] + m[:, 2, 2]
+    w = 0.5 * np.sqrt(np.maximum(trace + 1.0, 0.0))
+
+    q = np.empty((len(m), 4))
+    q[:, 0] = w
+
+    # Morawiec & orilib
+    regular = np.abs(w) >= ZERO
+    denominator = 4.0 * np.where(regular, w, 1.0)
+    q[:, 1] = (m[:, 1, 2] - m[:, 2, 1]) / denominator
+    q[:, 2] = (m[:, 2, 0] - m[:, 0, 2]) / denominator
+    q[:, 3] = (m[:, 0, 1] - m[:, 1, 0]) / denominator
+
+    # Rotations of pi
+    singular = ~regular
+    if np.any(singular):
+        ms = m[singular]
+        diagonal = np.diagonal(ms, axis1=1, axis2=2)
+        A = np.sqrt(np.maximum((diagonal + 1.0) / 2.0, 0.0))
+
+        s = np.argmax(A, axis=1)
+        column = ms[np.arange(len(ms))[:, np.newaxis], np.arange(3), s[:, np.newaxis]]
+        flip = (np.arange(3) != s[:, np.newaxis]) & (column < 0)
+        A[flip] *= -1.0
+
+        q[singular, 1:] = A
+
+    return QuaternionArray._wrap(_positive(q))
+
+class QuaternionArray(object):
+    def __init__(self, data=(), copy=True):
+        """
+        Array of quaternions :math:`\\llbracket a, \\vec{A} \\rrbracket`
+        stored as an array of shape (N, 4) of the coefficients
+        :math:`(a, A_x, A_y, A_z)`.
+        All the operations are vectorized over the quaternions.
+
+        :arg data: :class:`QuaternionArray`,
+            :class:`quaternions.Quaternion`, sequence of
+            :class:`quaternions.Quaternion` or array of shape (4,) or (N, 4)
+
+        :arg copy: whether to copy *data*. Without copy, a float64 array
+            *data* is used as is and modified in place by the operations
+            (``default=True``)
+        :type copy: bool
+
+        .. note:: As for :class:`quaternions.Quaternion`, the quaternions are
+                  always converted to positive quaternions
+                  (see :func:`quaternions.positive`) since for rotation
+                  :math:`q = -q`.
+        """
+        q = _asarray(data)
+        if copy:
+            q = q.copy()
+
+        self._q = _positive(q)
+
+    @classmethod
+    def _wrap(cls, q):
+        """
+        Create a :class:`QuaternionArray` from an array of positive
+        quaternions without copying it.
+
+        """
+        qarray = cls.__new__(cls)
+        qarray._q = q
+        return qarray
+
+    def __len__(self):
+        return len(self._q)
+
+    def __getitem__(self, index):
+        """
+        Return a :class:`quaternions.Quaternion` for an integer *index*,
+        otherwise a :class:`QuaternionArray` (slice, mask or array of
+        indices).
+
+        """
+        if isinstance(index, (int, long, np.integer)):
+            return quaternions.Quaternion(*self._q[index].tolist())
+        return QuaternionArray._wrap(self._q[index].reshape(-1, 4))
+
+    def __setitem__(self, index, value):
+        self._q[index] = _positive(_asarray(value).copy())
+
+    def __iter__(self):
+        for i in range(len(self._q)):
+            yield self[i]
+
+    def __repr__(self):
+        return '<%s(%i quaternions)>' % (self.__class__.__name__, len(self))
+
+    def __mul__(self, other):
+        """
+        Multiply the quaternions one by one with the quaternions of another
+        array, the same quaternion or a scalar.
+        Two arrays must have the same length, unless one of them has only
+        one quaternion.
+
+        :rtype: :class:`QuaternionArray`
+
+        .. seealso:: :meth:`quaternions.Quaternion.__mul__`
+        """
+        if isinstance(other, (int, long, float)):
+            return QuaternionArray._wrap(_positive(self._q * other))
+
+        return QuaternionArray._wrap(_positive(multiply(self._q, _asarray(other))))
+
+    def __rmul__(self, other):
+        if isinstance(other, (int, long, float)):
+            return self * other
+
+        return QuaternionArray._wrap(_positive(multiply(_asarray(other), self._q)))
+
+    def __div__(self, other):
+        """
+        Division by a scalar or by quaternions
+        (:math:`\\mathcal{A}\\mathcal{B}^{-1}`).
+
+        .. seealso:: :meth:`quaternions.Quaternion.__div__`
+        """
+        if isinstance(other, (int, long, float)):
+            return self * (1.0 / other)
+
+        return self * ~QuaternionArray(other)
+
+    __truediv__ = __div__
+
+    def __invert__(self):
+        """
+        Return the inverse of the quaternions:
+        :math:`\\mathcal{A}^\\ast \\left\| \\mathcal{A} \\right\|^{-2}`.
+
+        .. seealso:: :meth:`quaternions.Quaternion.__invert__`
+        """
+        q = self.conjugate()._q
+        q /= np.sum(q ** 2, axis=1)[:, np.newaxis]
+        return QuaternionArray._wrap(_positive(q))
+
+    def __abs__(self):
+        return self.norm()
+
+    @property
+    def array(self):
+        """
+        Coefficients of the quaternions (:class:`numpy.ndarray` of shape
+        (N, 4)).
+
+        """
+        return self._q
+
+    def copy(self):
+        return QuaternionArray._wrap(self._q.copy())
+
+    def norm(self):
+        """
+        Return the norm of each quaternion.
+
+        :rtype: :class:`numpy.ndarray` of shape (N,)
+
+        .. seealso:: :meth:`quaternions.Quaternion.__abs__`
+        """
+        return np.sqrt(np.sum(self._q ** 2, axis=1))
+
+    def conjugate(self):
+        """
+        .. seealso:: :func:`quaternions.conjugate`
+        """
+        q = self._q * [1.0, -1.0, -1.0, -1.0]
+        return QuaternionArray._wrap(_positive(q))
+
+    def isnormalized(self):
+        """
+        :rtype: :class:`numpy.ndarray` of :class:`bool`
+
+        .. seealso:: :func:`quaternions.isnormalized`
+        """
+        return np.abs(self.norm() - 1.0) < ZERO
+
+    def normalize(self):
+        """
+        .. seealso:: :func:`quaternions.normalize`
+        """
+        return QuaternionArray._wrap(self._q / self.norm()[:, np.newaxis])
+
+    def positive(self):
+        """
+        Make the quaternions positive, in place.
+
+        .. seealso:: :func:`quaternions.positive`
+        """
+        _positive(self._q)
+
+    def misorientation(self, other):
+        """
+        Return the misorientation angles (in rad) between these quaternions
+        and the quaternions of *other*, without crystal symmetry.
+        Since :math:`q = -q`, the smallest angle is returned.
+
+        :rtype: :class:`numpy.ndarray` of shape (N,)
+
+        .. seealso:: :func:`quaternions.misorientation`
+        """
+        dotproduct = np.abs(np.sum(self._q * _asarray(other), axis=1))
+        return 2.0 * np.arccos(np.minimum(dotproduct, 1.0))
+
+    def to_quaternions(self):
+        """
+        Return the quaternions as a :class:`list` of
+        :class:`quaternions.Quaternion`.
+
+        """
+        return list(self)
+
+    def to_axisangles(self):
+        """
+        Give the axis angle :math:`(\\phi, \\vec{n})` representation of the
+        quaternions.
+
+        :return: angles (in rad) of shape (N,) and axes of shape (N, 3)
+
+        .. seealso:: :meth:`quaternions.Quaternion.to_axisangle`
+        """
+        q = self.normalize()._q
+
+        angles = 2.0 * np.arccos(np.clip(q[:, 0], -1.0, 1.0))
+
+        denominator = np.sqrt(np.maximum(1.0 - q[:, 0] ** 2, 0.0))
+        denominator[denominator < ZERO] = 1.0
+        axes = q[:, 1:] / denominator[:, np.newaxis]
+
+        return angles, axes
+
+    def to_so3matrices(self):
+        """
+        Give the SO3 matrices of the quaternions.
+
+        :rtype: :class:`numpy.ndarray` of shape (N, 3, 3)
+
+        .. seealso:: :meth:`quaternions.Quaternion.to_so3matrix`
+        """
+        q0, q1, q2, q3 = self.normalize()._q.T
+
+        m = np.empty((len(self._q), 3, 3))
+
+        # Orilib
+        m[:, 0, 0] = q0 ** 2 + q1 ** 2 - q2 ** 2 - q3 ** 2
+        m[:, 0, 1] = 2 * (q1 * q2 + q0 * q3)
+        m[:, 0, 2] = 2 * (q1 * q3 - q0 * q2)
+        m[:, 1, 0] = 2 * (q1 * q2 - q0 * q3)
+        m[:, 1, 1] = q0 ** 2 - q1 ** 2 + q2 ** 2 - q3 ** 2
+        m[:, 1, 2] = 2 * (q2 * q3 + q0 * q1)
+        m[:, 2, 0] = 2 * (q1 * q3 + q0 * q2)
+        m[:, 2, 1] = 2 * (q2 * q3 - q0 * q1)
+        m[:, 2, 2] = q0 ** 2 - q1 ** 2 - q2 ** 2 + q3 ** 2
+
+        return m
+
+    def to_eulerangles(self):
+        """
+        Give the Euler angles (in rad, Bunge convention) of the quaternions.
+        The first and third angles are between 0 and :math:`2\\pi`.
+
+        :rtype: :class:`numpy.ndarray` of shape (N, 3)
+
+        .. seealso:: :meth:`quaternions.Quaternion.to_eulerangles`
+        """
+        q0, q1, q2, q3 = self.normalize()._q.T
+
+        angles = np.empty((len(self._q), 3))
+        angles[:, 0] = np.arctan2(q3, q0) + np.arctan2(q2, q1)
+        angles[:, 1] = np.arccos(np.clip(1 - 2 * q1 ** 2 - 2 * q2 ** 2, -1.0, 1.0))
+        angles[:, 2] = np.arctan2(q3, q0) - np.arctan2(q2, q1)
+
+        # Singular cases: theta2 = 0 or theta2 = pi
+        singular = np.abs((q0 ** 2 + q3 ** 2) * (q1 ** 2 + q2 ** 2)) < ZERO ** 2
+        zero = singular & (np.abs(q1) < ZERO) & (np.abs(q2) < ZERO)
+        angles[zero, 0] = np.arctan2(2 * q0[zero] * q3[zero],
+                                     q0[zero] ** 2 - q3[zero] ** 2)
+        angles[zero, 1:] = 0.0
+
+        flipped = singular & ~zero & (np.abs(q0) < ZERO) & (np.abs(q3) < ZERO)
+        angles[flipped, 0] = np.arctan2(2 * q1[flipped] * q2[flipped],
+                                        q1[flipped] ** 2 - q2[flipped] ** 2)
+        angles[flipped, 1] = pi
+        angles[flipped, 2] = 0.0
+
+        # Positive angles (see eulers.positive)
+        angles[:, 0] = np.where(angles[:, 0] < 0, angles[:, 0] + 2 * pi, angles[:, 0])
+        angles[:, 2] = np.where(angles[:, 2] < 0, angles[:, 2] + 2 * pi, angles[:, 2])
+
+        return angles
+
+def misorientation(q1, q2):
+    """
+    .. seealso:: :meth:`QuaternionArray.misorientation`
+    """
+    return QuaternionArray._wrap(_asarray(q1)).misorientation(q2)
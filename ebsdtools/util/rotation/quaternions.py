@@ -293,6 +293,9 @@ class Quaternion(object):
             for i in [0, 1, 2]:
                 qOut[i + 1] = other * self._A[i]
 
+        else: # e.g. quaternionarrays.QuaternionArray
+            return NotImplemented
+
         qOut.positive()
         return qOut
 
@@ -0,0 +1,247 @@
+#!/usr/bin/env python
+"""
+================================================================================
+:mod:`test_quaternionarrays` -- Unit tests for the module :mod:`quaternionarrays`.
+================================================================================
+
+"""
+
+# Script information for the file.
+__author__ = "Philippe T. Pinard"
+__email__ = "philippe.pinard@gmail.com"
+__version__ = "0.1"
+__copyright__ = "Copyright (c) 2010 Philippe T. Pinard"
+__license__ = "GPL v3"
+
+# Standard library modules.
+import unittest
+import logging
+from math import pi, cos, sin, sqrt
+
+# Third party modules.
+import numpy as np
+
+# Local modules.
+import mathtools.rotation.quaternionarrays as quaternionarrays
+import mathtools.rotation.quaternions as quaternions
+
+# Globals and constants variables.
+REPETITIONS = 1000
+
+def random_eulers(size):
+    return np.random.random((size, 3)) * [2 * pi, pi, 2 * pi]
+
+class TestQuaternionArray(unittest.TestCase):
+
+    def setUp(self):
+        unittest.TestCase.setUp(self)
+
+        self.qs = quaternionarrays.QuaternionArray([[1, -2, 3, 4],
+                                                    [0, -1, 1, 1],
+                                                    [sqrt(2) / 2.0, sqrt(2) / 2.0, 0, 0]])
+
+    def tearDown(self):
+        unittest.TestCase.tearDown(self)
+
+    def testSkeleton(self):
+        #self.fail("Test if the TestCase is working.")
+        self.assert_(True)
+
+    def testconstructor(self):
+        self.assertEqual(len(self.qs), 3)
+        self.assertEqual(self.qs.array.shape, (3, 4))
+        self.assertEqual(self.qs.array.dtype, np.float64)
+
+        # Positive
+        self.assertTrue(np.allclose(self.qs.array[1], [0, 1, -1, -1]))
+
+        # Single quaternion
+        qs = quaternionarrays.QuaternionArray([1, 0, 0, 0])
+        self.assertEqual(qs.array.shape, (1, 4))
+
+        # Empty
+        qs = quaternionarrays.QuaternionArray()
+        self.assertEqual(len(qs), 0)
+
+    def testconstructor_quaternions(self):
+        q1 = quaternions.Quaternion(1, -2, 3, 4)
+        q2 = quaternions.Quaternion(0, -1, 1, 1)
+
+        qs = quaternionarrays.QuaternionArray([q1, q2])
+        self.assertTrue(np.allclose(qs.array, self.qs.array[:2]))
+
+        qs = quaternionarrays.QuaternionArray(q1)
+        self.assertTrue(np.allclose(qs.array, self.qs.array[:1]))
+
+    def test__getitem__(self):
+        q = self.qs[0]
+        self.assertTrue(isinstance(q, quaternions.Quaternion))
+        self.assertEqual(q, quaternions.Quaternion(1, -2, 3, 4))
+
+        qs = self.qs[1:]
+        self.assertTrue(isinstance(qs, quaternionarrays.QuaternionArray))
+        self.assertEqual(len(qs), 2)
+
+        qs = self.qs[np.array([True, False, True])]
+        self.assertEqual(len(qs), 2)
+        self.assertTrue(np.allclose(qs.array[1], self.qs.array[2]))
+
+    def test__mul__(self):
+        qs = quaternionarrays.QuaternionArray([[1, 2, 3, 4], [2, -1, 0, 3]])
+        others = quaternionarrays.QuaternionArray([[5, 6, 7, 8], [1, 1, 1, 1]])
+
+        expected = [[60, -12, -30, -24], [0, 2, -6, -4]]
+        self.assertTrue(np.allclose((qs * others).array, expected))
+
+        # Broadcast
+        expected = [[60, -12, -30, -24], [8, 14, -40, -24]]
+        self.assertTrue(np.allclose((qs * others[:1]).array, expected))
+
+        # Scalar
+        self.assertTrue(np.allclose((qs * 2.0).array, 2.0 * qs.array))
+        self.assertTrue(np.allclose((2 * qs).array, 2.0 * qs.array))
+
+        # Positive
+        qs = quaternionarrays.QuaternionArray([0, 1, 0, 0])
+        self.assertTrue(np.allclose((qs * qs).array, [[1, 0, 0, 0]]))
+
+    def test__mul__quaternion(self):
+        qs = quaternionarrays.QuaternionArray([[1, 2, 3, 4], [2, -1, 0, 3]])
+        q = quaternions.Quaternion(5, 6, 7, 8)
+
+        expected = [[60, -12, -30, -24], [8, 14, -40, -24]]
+        self.assertTrue(np.allclose((qs * q).array, expected))
+
+        expected = [[60, -20, -14, -32], [8, -28, 12, -38]]
+        self.assertTrue(np.allclose((q * qs).array, expected))
+
+    def test__div__(self):
+        qs = quaternionarrays.QuaternionArray(np.random.random((REPETITIONS, 4)))
+
+        self.assertTrue(np.allclose((qs / qs).array, [[1, 0, 0, 0]]))
+        self.assertTrue(np.allclose((qs / 2.0).array, qs.array / 2.0))
+
+    def test__invert__(self):
+        qs = ~self.qs
+
+        expected = np.array([[1, 2, -3, -4], [0, 1, -1, -1],
+                             [sqrt(2) / 2.0, -sqrt(2) / 2.0, 0, 0]])
+        expected /= np.sum(expected ** 2, axis=1)[:, np.newaxis]
+        self.assertTrue(np.allclose(qs.array, expected))
+
+        self.assertTrue(np.allclose((self.qs * qs).array, [[1, 0, 0, 0]]))
+
+    def testconjugate(self):
+        qs = self.qs.conjugate()
+
+        expected = [[1, 2, -3, -4], [0, 1, -1, -1], [sqrt(2) / 2.0, -sqrt(2) / 2.0, 0, 0]]
+        self.assertTrue(np.allclose(qs.array, expected))
+
+    def testnorm(self):
+        self.assertTrue(np.allclose(self.qs.norm(), [sqrt(30), sqrt(3), 1.0]))
+
+    def testnormalize(self):
+        qs = self.qs.normalize()
+
+        self.assertTrue(np.allclose(qs.norm(), 1.0))
+        self.assertTrue(np.all(qs.isnormalized()))
+        self.assertEqual(list(self.qs.isnormalized()), [False, False, True])
+
+    def testpositive(self):
+        qs = quaternionarrays.QuaternionArray._wrap(np.array([[-1.0, 2, 3, 4],
+                                                              [0.0, 0, -1, 2],
+                                                              [1e-9, -1, 0, 0],
+                                                              [0.0, 0, 0, 0]]))
+        qs.positive()
+
+        expected = [[1, -2, -3, -4], [0, 0, 1, -2], [-1e-9, 1, 0, 0], [0, 0, 0, 0]]
+        self.assertTrue(np.allclose(qs.array, expected))
+
+    def testmisorientation(self):
+        qs = quaternionarrays.eulerangles_to_quaternionarray(random_eulers(REPETITIONS))
+
+        self.assertTrue(np.allclose(qs.misorientation(qs), 0.0, atol=1e-6))
+
+        angles = np.random.random(REPETITIONS) * pi
+        rotations = quaternionarrays.axisangles_to_quaternionarray(angles, [0, 0, 1])
+        self.assertTrue(np.allclose(qs.misorientation(qs * rotations), angles))
+        self.assertTrue(np.allclose(quaternionarrays.misorientation(qs, rotations * qs),
+                                    angles))
+
+    def testto_quaternions(self):
+        qs = self.qs.to_quaternions()
+
+        self.assertEqual(len(qs), 3)
+        self.assertEqual(qs[1], quaternions.Quaternion(0, -1, 1, 1))
+
+    def testaxisangles(self):
+        angles = np.random.random(REPETITIONS) * pi
+        axes = np.random.random((REPETITIONS, 3)) - 0.5
+        axes /= np.sqrt(np.sum(axes ** 2, axis=1))[:, np.newaxis]
+
+        qs = quaternionarrays.axisangles_to_quaternionarray(angles, axes)
+        self.assertTrue(np.allclose(qs.norm(), 1.0))
+
+        expected = np.hstack([np.cos(angles / 2.0)[:, np.newaxis],
+                              axes * np.sin(angles / 2.0)[:, np.newaxis]])
+        self.assertTrue(np.allclose(qs.array, expected))
+
+        angles2, axes2 = qs.to_axisangles()
+        self.assertTrue(np.allclose(angles2, angles))
+        self.assertTrue(np.allclose(axes2, axes))
+
+        # Identity
+        angles, axes = quaternionarrays.QuaternionArray([1, 0, 0, 0]).to_axisangles()
+        self.assertAlmostEqual(angles[0], 0.0)
+        self.assertTrue(np.allclose(axes, 0.0))
+
+    def testeulerangles(self):
+        angles = random_eulers(REPETITIONS)
+        qs = quaternionarrays.eulerangles_to_quaternionarray(angles)
+
+        for i in range(0, REPETITIONS, 100):
+            t1, t2, t3 = angles[i]
+            expected = np.array([cos(t2 / 2.0) * cos((t1 + t3) / 2.0),
+                                 sin(t2 / 2.0) * cos((t1 - t3) / 2.0),
+                                 sin(t2 / 2.0) * sin((t1 - t3) / 2.0),
+                                 cos(t2 / 2.0) * sin((t1 + t3) / 2.0)])
+            if expected[0] < 0:
+                expected *= -1
+            self.assertTrue(np.allclose(qs.array[i], expected))
+
+        self.assertTrue(np.allclose(qs.to_eulerangles(), angles))
+
+        # Singular cases
+        angles = [[0.5, 0.0, 0.0], [1.5, pi, 0.0]]
+        qs = quaternionarrays.eulerangles_to_quaternionarray(angles)
+        self.assertTrue(np.allclose(qs.to_eulerangles(), angles))
+
+        qs = quaternionarrays.eulerangles_to_quaternionarray([[0.2, 0.0, 0.3]])
+        self.assertTrue(np.allclose(qs.to_eulerangles(), [[0.5, 0.0, 0.0]]))
+
+    def testso3matrices(self):
+        angles = random_eulers(REPETITIONS)
+        qs = quaternionarrays.eulerangles_to_quaternionarray(angles)
+
+        ms = qs.to_so3matrices()
+        self.assertEqual(ms.shape, (REPETITIONS, 3, 3))
+        for m in ms[::100]:
+            self.assertTrue(np.allclose(np.dot(m, m.T), np.identity(3)))
+            self.assertAlmostEqual(np.linalg.det(m), 1.0)
+
+        qs2 = quaternionarrays.so3matrices_to_quaternionarray(ms)
+        self.assertTrue(np.allclose(qs2.array, qs.array))
+
+        # Rotation matrices multiply as the quaternions
+        ms2 = (qs[:-1] * qs[1:]).to_so3matrices()
+        self.assertTrue(np.allclose(ms2[0], np.dot(ms[1], ms[0])))
+
+        # Rotations of pi
+        qs = quaternionarrays.axisangles_to_quaternionarray([pi, pi, pi],
+                                                            [[1, 0, 0], [1, -1, 0], [0, 1, 1]])
+        qs2 = quaternionarrays.so3matrices_to_quaternionarray(qs.to_so3matrices())
+        self.assertTrue(np.allclose(qs2.array, qs.array))
+
+if __name__ == '__main__': #pragma: no cover
+    logging.getLogger().setLevel(logging.DEBUG)
+    unittest.main()